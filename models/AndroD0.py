@@ -63,12 +63,7 @@ print(f"Test accuracy {test_acc * 100:.2f} %")
 
 def save_model(name, weight_transpose=False):
     with open(f'c:/Users/dan/Desktop/Projects/Andro/src/{name}.py', 'w') as file:
-        # Save mnist in file
-        file.write("# Training data\n")
-        file.write("from tensorflow.keras.datasets import mnist\n")
-        file.write("mnist = mnist.load_data()\n\n")
-
-        # Save weights and biases
+        # Save weights and biases (mnist is loaded with src.mnist_io, so importing these never pulls in TensorFlow)
         file.write(f"# Test accuracy {test_acc * 100:.2f} %\n")
         file.write("weights = [\n")
         for i, layer in enumerate(model.layers):
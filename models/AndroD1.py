@@ -8,11 +8,14 @@ os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 import tensorflow as tf
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '1'
 import numpy as np
-from src.weights import weights, biases, mnist
+from src.weights_io import load_weights
+from src.mnist_io import load_mnist
 
 # * STRUCTURE OF WEIGHTS - LAYER : NODE : WEIGHT TO PREVIOUS LAYER
 
-(x_train, y_train), (x_test, y_test) = mnist
+weights, biases = load_weights('weights')
+
+(x_train, y_train), (x_test, y_test) = load_mnist()
 
 
 # Make and load new model
@@ -2,70 +2,76 @@
 # DATE  : 2020-04-06
 # ABOUT : Hand-done multiplication using numpy to remove tensorflow from project
 
-# Supress Tensorflow dll warning
-import os
-os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
-from src.weights import weights, biases, mnist
-os.environ['TF_CPP_MIN_LOG_LEVEL'] = '1'
+from src.weights_io import load_weights
+from src.mnist_io import load_mnist
+from PackedBatch import argmax # Ties go to the last index, like the max loops of the other generations
 import numpy as np
-from tqdm import tqdm
 
 # * STRUCTURE OF WEIGHTS - LAYER : NODE : WEIGHT TO PREVIOUS LAYER
 
-(x_train, y_train), (x_test, y_test) = mnist
+weights, biases = load_weights('weights') # Read as data, the TensorFlow lines older weight files start with are never run
 
-# ! Quantizing makes it shit the bed (So it's definitely wrong)
-def quantize(layer):
-    # mapElement = lambda x: 1 if x >= 0 else -1
-    # vfunc = np.vectorize(mapElement)
-    
-    # return vfunc(layer) # Convert each layer to -1 or 1
-    return layer
+# Same sign convention as D3/D4: 1 when >= split, otherwise -1
+def binarize(layer, split=0):
+    return np.where(layer >= split, 1, -1).astype(np.float32)
 
-def model(image, use_biases=True):
-    layer = quantize(image)
-    for layer_weights, layer_biases in zip(weights, biases):
-        layer_weights = np.array(layer_weights, dtype=np.float32)
-        # Stil 78.72% accuracy without biases? (Same as with)
-        if use_biases: 
-            layer_biases = np.array(layer_biases, dtype=np.float32)
-        else:
-            layer_biases = 0
-        layer = np.matmul(layer, layer_weights) + layer_biases
-        # Quantize all but the last layer
-        if len(layer[0]) != 10:
-            layer = quantize(layer)
+# Converts the weights to arrays once (instead of for every layer of every image)
+# binary=True binarizes the weights, the image (at 127.5) and the hidden layers like D3/D4, without biases
+class Model():
+    def __init__(self, weights=weights, biases=biases, use_biases=True, binary=False):
+        self.binary = binary
+        self.weights = [np.array(layer_weights, dtype=np.float32) for layer_weights in weights]
+        self.biases = [np.array(layer_biases, dtype=np.float32) for layer_biases in biases]
+        if binary:
+            self.weights = [binarize(layer_weights) for layer_weights in self.weights]
+        if binary or not use_biases:
+            self.biases = [0 for _ in self.biases]
+
+    # Logits for a batch of flattened images (one row each), one X @ W per layer
+    def logits(self, X):
+        layer = np.asarray(X, dtype=np.float32).reshape([len(X), -1])
+        if self.binary:
+            layer = binarize(layer, split=127.5)
+        last = len(self.weights) - 1
+        for i, (layer_weights, layer_biases) in enumerate(zip(self.weights, self.biases)):
+            layer = layer @ layer_weights + layer_biases
+            # Quantize all but the last layer
+            if self.binary and i != last:
+                layer = binarize(layer)
+        return layer
+
+    def predict_batch(self, X):
+        return argmax(self.logits(X))
 
-    # Return actual guess instead of encoded logits vector
-    answer = layer[0][0] # Start off guessing it is zero
-    index = 0
-    for i, challenger in enumerate(layer[0]):
-        if challenger >= answer:
-            answer = challenger
-            index = i
+    def predict(self, image):
+        return int(self.predict_batch(np.reshape(image, [1, -1]))[0])
 
-    # return index
-    return index
+_models = {} # use_biases -> Model, built the first time it is needed
+
+def getModel(use_biases=True):
+    if use_biases not in _models:
+        _models[use_biases] = Model(use_biases=use_biases)
+    return _models[use_biases]
+
+def model(image, use_biases=True):
+    return getModel(use_biases).predict(image)
 
 def test_model(images, answers, use_biases=True):
     correct = 0
     incorrect = 0
-    pbar = tqdm(total=len(answers))
-    for image, answer in zip(images, answers):
-        # Flatten image for model
-        img = image.reshape([1, -1])
-        # * Use model to make a prediction
-        guess = model(img, use_biases)
-        pbar.update(n=1)
+    # * Use model to make every prediction at once
+    guesses = getModel(use_biases).predict_batch(images)
+    for guess, answer in zip(guesses, answers):
         # Evaluate
         if guess == answer:
             correct += 1
         else:
             incorrect += 1
-    pbar.close()
     return (correct, incorrect, correct + incorrect)
 
-length = 1000
-print(f"Testing model with {length} image{'s' if length != 1 else ''}")
-correct, incorrect, total = test_model(x_test[:length], y_test[:length])
-print(correct/total * 100, "%")
+if __name__ == "__main__":
+    (x_train, y_train), (x_test, y_test) = load_mnist()
+    length = 1000
+    print(f"Testing model with {length} image{'s' if length != 1 else ''}")
+    correct, incorrect, total = test_model(x_test[:length], y_test[:length])
+    print(correct/total * 100, "%")
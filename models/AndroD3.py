@@ -2,16 +2,13 @@
 # DATE  : 2020-04-07
 # ABOUT : Hand-done multiplication to remove numpy from the project (About 1124x slower than D0, 3 img/s with quantization, 20 img/s w/o)
 
-# Supress Tensorflow dll warning
-import os
-os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
-from src.weights_transpose import weights, biases, mnist
-os.environ['TF_CPP_MIN_LOG_LEVEL'] = '1'
+from src.weights_io import load_weights
+from src.mnist_io import load_mnist
 from tqdm import tqdm
 
 # * STRUCTURE OF WEIGHTS - LAYER : NODE : WEIGHT TO PREVIOUS LAYER
 
-(x_train, y_train), (x_test, y_test) = mnist
+weights, biases = load_weights('weights_transpose') # Never imports TensorFlow (see weights_io)
 
 def quantize(a, split=0):
     if type(a) is list:
@@ -87,13 +84,15 @@ def test_model(images, answers, quanitizing=False, inc_biases=False, bar=True):
         pbar.close()
     return (correct, incorrect, len(images))
 
-length = 1 # max of 10000
-print(f"Testing model with {length} image{'s' if length != 1 else ''}")
-correct, incorrect, total = test_model(
-    x_test[:length], 
-    y_test[:length], 
-    quanitizing=True, 
-    inc_biases=False,
-    bar=True
-)
-print("Accuracy: ", correct/total * 100, "%")
\ No newline at end of file
+if __name__ == "__main__":
+    (x_train, y_train), (x_test, y_test) = load_mnist()
+    length = 1 # max of 10000
+    print(f"Testing model with {length} image{'s' if length != 1 else ''}")
+    correct, incorrect, total = test_model(
+        x_test[:length], 
+        y_test[:length], 
+        quanitizing=True, 
+        inc_biases=False,
+        bar=True
+    )
+    print("Accuracy: ", correct/total * 100, "%")
\ No newline at end of file
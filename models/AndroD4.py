@@ -2,12 +2,17 @@
 # DATE  : 2020-04-012
 # ABOUT : Neural network using packed bits technique and bitwise operators (86% Accurate, fully quantized, 4.1 img/s)
 
-from src.data_packed import x_test, y_test
-from src.model_packed import weights, shape
+from src.packed_io import load_data, shared_model
+from PackedEngine import PackedModel
+from PackedBatch import BatchModel
+from ByteKernel import byteAccum
 from tqdm import tqdm
 
 # * STRUCTURE OF WEIGHTS - LAYER : NODE : WEIGHT TO PREVIOUS LAYER
 
+x_test, y_test = load_data()
+weights, shape = shared_model()
+
 def XNOR(a, b):
 	if a == b:  return 1
 	else:       return 0
@@ -35,7 +40,8 @@ def reverseByte(byte):
 	return byte
 
 # Functional model that takes in an image and guesses the number (mnist)
-def model(image):
+# byte_wise works through a whole EEPROM byte (8 weights) per step with the ByteKernel tables
+def model(image, byte_wise=False, weights=weights, shape=shape):
 	input_layer = image
 	num_layers = len(shape) - 1
 	for l_index in range(num_layers): # One less: not including the input layer
@@ -49,17 +55,20 @@ def model(image):
 
 		for node in range(curr_size):
 			accum = 0
-			for w_index in range(prev_size):
-				EEPROM_addr = w_index >> 3  # 3 LSBs are for bit selection
-				bit_index = w_index & 0b111 # Mask away all but lowest three bits
-
-				# Select bit weight and input data
-				# print(bin(weights[l_index][node][EEPROM_addr]))
-				weight = weights[l_index][node][EEPROM_addr] & ( 1 << bit_index )
-				data = input_layer[EEPROM_addr]              & ( 1 << bit_index )
-				# Multiply and add
-				mult = XNOR(weight, data)
-				accum = UpDown(accum, mult) # * Breakpoint here to match D5
+			if byte_wise:
+				accum = byteAccum(weights[l_index][node], input_layer, prev_size)
+			else:
+				for w_index in range(prev_size):
+					EEPROM_addr = w_index >> 3  # 3 LSBs are for bit selection
+					bit_index = w_index & 0b111 # Mask away all but lowest three bits
+
+					# Select bit weight and input data
+					# print(bin(weights[l_index][node][EEPROM_addr]))
+					weight = weights[l_index][node][EEPROM_addr] & ( 1 << bit_index )
+					data = input_layer[EEPROM_addr]              & ( 1 << bit_index )
+					# Multiply and add
+					mult = XNOR(weight, data)
+					accum = UpDown(accum, mult) # * Breakpoint here to match D5
 			# Save node in some form
 			if not last_layer:
 				# Quantize (Grab MSB)
@@ -99,9 +108,11 @@ def model(image):
 
 	return index
 
-def test_model(images, answers, bar=True):
+def test_model(images, answers, bar=True, fast=False, byte_wise=False):
 	correct = 0
 	incorrect = 0
+	# Word-level engine gives the same answers without looping through every bit
+	predict = PackedModel(weights, shape).predict if fast else lambda image: model(image, byte_wise)
 	# Add progress bar unless specified otherwise
 	if bar:
 		pbar = tqdm(total=len(answers))
@@ -112,7 +123,7 @@ def test_model(images, answers, bar=True):
 		if bar:
 			pbar.update(n=1)
 		# Use model to make a prediction
-		guess = model(image)
+		guess = predict(image)
 		# print(guess)
 		# Evaluate
 		if guess == answer:
@@ -123,7 +134,14 @@ def test_model(images, answers, bar=True):
 		pbar.close()
 	return (correct, incorrect, len(images))
 
-length = 100 # max of 100
-print(f"Testing model with {length} image{'s' if length != 1 else ''}")
-correct, incorrect, total = test_model(x_test[:length], y_test[:length], bar=True)
-print("Accuracy: ", correct/total * 100, "%")
\ No newline at end of file
+# Scores every image at once with numpy instead of looping image by image (same answers as model)
+def test_model_batch(images, answers):
+	guesses = BatchModel(weights, shape).predict(images)
+	correct = sum(1 for guess, answer in zip(guesses, answers) if guess == answer)
+	return (correct, len(images) - correct, len(images))
+
+if __name__ == "__main__":
+	length = 100 # max of 100
+	print(f"Testing model with {length} image{'s' if length != 1 else ''}")
+	correct, incorrect, total = test_model(x_test[:length], y_test[:length], bar=True)
+	print("Accuracy: ", correct/total * 100, "%")
\ No newline at end of file
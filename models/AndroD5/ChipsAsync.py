@@ -2,19 +2,143 @@
 # DATE  : 2020-04-013
 # ABOUT : Async pieces that all generations can use
 
+import sys
+from array import array
+from heapq import heappush, heappop
 from inspect import signature
+import numpy as np
+
+# *********************************** SCHEDULER
+# * Writing to pins changes them straight away, but only queues the callbacks if the value actually changed
+# * Combinational callbacks run in delta cycles (each one at most once per delta) until nothing changes,
+# * then clocked callbacks (pins clocking a chip, EEPROM flash) run one at a time, in the same order
+# * the callbacks used to reach them depth-first, each settling everything it causes before the next one
+MAX_DELTAS = 1000
+
+class Scheduler():
+    __slots__ = ('events', '_path', '_delta', '_clocked', '_running')
+
+    def __init__(self):
+        self.events = 0     # Number of callbacks run (to measure the simulator)
+        self._path = ()     # Callback list positions that lead to the callback running now (orders the clocked callbacks)
+        self._delta = {}    # (callback, arg) -> path, for the next delta
+        self._clocked = {}  # (callback, arg) -> path, reached while settling
+        self._running = False
+
+    # Queue the callbacks of pins that just changed
+    def notify(self, pin):
+        path = self._path
+        delta = self._delta
+        clocked = self._clocked
+        for index, (callback, arg, is_clocked) in enumerate(pin._callbacks):
+            queue = clocked if is_clocked else delta
+            key = path + (index,)
+            item = (callback, arg)
+            if item not in queue or key < queue[item]:
+                queue[item] = key
+        if not self._running:
+            self._propagate()
+
+    def _propagate(self):
+        self._running = True
+        try:
+            heap = []
+            self._settle(heap)
+            while heap:
+                self._path, _, callback, arg = heappop(heap)
+                self._call(callback, arg)
+                self._settle(heap)
+        finally:
+            self._running = False
+            self._path = ()
+            self._delta = {}
+            self._clocked = {}
+
+    # Run delta cycles until no combinational pins change, then hand over the clocked callbacks they reached
+    def _settle(self, heap):
+        deltas = 0
+        while self._delta:
+            deltas += 1
+            if deltas > MAX_DELTAS:
+                names = ', '.join(getattr(callback.__self__, 'name', '?') or '?' for callback, _ in self._delta)
+                raise RecursionError(f"[SCHED]\tCombinational loop, still changing after {MAX_DELTAS} delta cycles: {names}")
+            batch = self._delta
+            self._delta = {}
+            for (callback, arg), path in batch.items():
+                self._path = path
+                self._call(callback, arg)
+        for (callback, arg), path in self._clocked.items():
+            heappush(heap, (path, id(callback), callback, arg))
+        self._clocked = {}
+
+    def _call(self, callback, arg):
+        self.events += 1
+        if arg is None:
+            callback()
+        else:
+            callback(arg)
+
+scheduler = Scheduler()
+
+# *********************************** WALKING THE CIRCUIT
+# Inputs a chip may have (anything that is not wired is None)
+_INPUTS = ('a', 'b', 'sel', 'addr', 'data_in', 'rd_wr', 'flash', 'up_down', 'load', 'reset', 'clk', 'data')
+
+# Every pins / chip / clock reachable from 'roots' (through callbacks, inputs, groups, sources and slices), depth first
+# * A clock is anything with synced_objects (CLOCK lives in ChipsClocked, which imports this module)
+def reachable(roots):
+    found = {}
+    stack = [roots]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, (list, tuple)):
+            stack.extend(reversed(obj))
+            continue
+        if id(obj) in found or not (isinstance(obj, (pins, CHIP)) or hasattr(obj, 'synced_objects')):
+            continue
+        found[id(obj)] = obj
+        if isinstance(obj, pins):
+            stack.extend(getattr(callback, '__self__', None) for callback, _, _ in obj._callbacks)
+            stack.extend(getattr(obj, 'pins_list', ()))
+            stack.append(getattr(obj, 'source', None))
+            stack.append(getattr(obj, 'parent', None))
+        else:
+            stack.append(obj.output)
+            stack.extend(getattr(obj, 'synced_objects', ()))
+            stack.extend(getattr(obj, attr, None) for attr in _INPUTS)
+    return list(found.values())
+
+# *********************************** LANES
+# * In lane mode the data pins hold a numpy array with one value per image (lane), while the control
+# * signals (clocks, counters, selects, rd/wr) stay plain ints shared by every lane
+# * Arrays are never changed in place, a new value is always a new array
+
+# Turn a comparison into 0/1 (per lane if it is an array)
+def _bit(cond):
+    if isinstance(cond, np.ndarray):
+        return cond.astype(np.int64)
+    return int(cond)
+
+def _same(a, b):
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    return a == b
 
 # *********************************** PIN DEFINITION
+# * Pins are stored as a single int (raw), the list of bits (value) is only built when someone asks for it
+# * Every sim class declares its attributes in __slots__ (no per-object __dict__), so new attributes have to be added there
 class pins():
+    __slots__ = ('name', '_callbacks', '_raw', '_value', 'max_val', '_width', 'pins_list', 'source')
+
     def __init__(self, length=1, val=0, pins_list=None, name=""):
         # Permanent attributes
         self.name = name
-        self._callbacks = []
+        self._callbacks = [] # (callback, pins to pass it or None if it takes no parameters, clocked)
         self._raw = 0
+        self._value = None
         # Default Constructor
         if pins_list == None:
             self.max_val = 2 ** length - 1
-            self._value = [0] * length
             self._width = length
             self.value = val
         # Packing Constructor
@@ -22,7 +146,6 @@ class pins():
             # * List of pins if from least significant group to most
             self.pins_list = pins_list
             self._width = sum(pin.width for pin in pins_list)
-            self._value = [0] * self.width
             self.max_val = 2 ** self.width - 1
 
             for pins_sel in pins_list:
@@ -37,6 +160,10 @@ class pins():
         return self._width
     @property
     def value(self):
+        # Split bits into a list (LSB first) the first time it is read since the last update
+        if self._value is None:
+            raw = self._raw
+            self._value = [(raw >> i) & 1 for i in range(self._width)]
         return self._value
     @property
     def raw(self):
@@ -59,28 +186,24 @@ class pins():
         else: start = k.start
         if k.stop is None: stop = 0 if step == -1 else self.width
         else: stop = k.stop
-        # Create new set of pins
-        _sliced_pins = pins( abs(stop-start), name=f"{self.name}[{start}:{stop}:{step}]" )
+        # Work out which bit of these pins feeds each bit of the slice
+        bits = list(range(self.width))
+        if abs(stop-start) == self.width:
+            bits = bits[::-1]
+        elif step <= 0:
+            bits = bits[start:stop - 1:step]
+        else:
+            bits = bits[start:stop:step]
+        # The slice is only a view, nothing is copied when these pins change
+        _sliced_pins = pinSlice(self, bits, name=f"{self.name}[{start}:{stop}:{step}]")
         _sliced_pins.start = start
         _sliced_pins.stop = stop
         _sliced_pins.step = step
-        # Force new pins to update with current ones
-        self.register_callback(_sliced_pins._force_update)
-        _sliced_pins._force_update(self)
         return _sliced_pins
     # * BOOL
     def __bool__(self):
         return bool(self.raw)
 
-    # * Only used with __getitem__
-    def _force_update(self, input_pin):
-        if self.width == input_pin.width: 
-            self.value = input_pin.value[::-1]
-        elif self.step <= 0: 
-            self.value = input_pin.value[ self.start:self.stop - 1:self.step ]
-        else:
-            self.value = input_pin.value[ self.start:self.stop    :self.step ]
-
     # Setters
     @raw.setter
     def raw(self, val):
@@ -90,54 +213,113 @@ class pins():
         # If value given is a list of bits
         if isinstance(val, list):
             assert len(val) == self.width, f"[PIN]\t{self.name} expected input of {self.width} bits, but got {len(val)}"
-            self._value = val
             # Pack bits into number for raw
             raw = 0
             for i in val[::-1]:
                 raw |= i
                 raw <<= 1
-            self._raw = raw >> 1
+            raw >>= 1
         # If value given is a raw value
         elif isinstance(val, int):
             assert val <= self.max_val, f"[PIN]\t{self.name} expected value below {self.max_val}, but got {val}"
-            self._raw = val
-            # Split bits into array
-            for i in range(self.width):
-                self._value[i] = 1 if val & (1 << i) else 0
+            raw = val
+        # If value given is one raw value per lane
+        elif isinstance(val, np.ndarray):
+            assert (val <= self.max_val).all(), f"[PIN]\t{self.name} expected values below {self.max_val}, but got {val.max()}"
+            raw = val
+        elif isinstance(val, np.integer):
+            assert val <= self.max_val, f"[PIN]\t{self.name} expected value below {self.max_val}, but got {val}"
+            raw = int(val)
         else:
-            raise TypeError(f"{val} is of type {type(val)}, not list or int")
+            raise TypeError(f"{val} is of type {type(val)}, not list, int or array")
+        # Nothing to tell anyone if nothing changed
+        if _same(raw, self._raw):
+            return
+        self._raw = raw
+        self._value = None
         # Update every async object connected
         self._notify_observers()
 
     def _updateGroup(self):
-        temp = []
-        # Iterate through input pins
+        raw = 0
+        offset = 0
+        # Iterate through input pins (first group is the least significant)
         for pin_group in self.pins_list:
-            temp.extend( pin_group.value )
-        self.value = temp
+            raw |= (pin_group.raw & pin_group.max_val) << offset
+            offset += pin_group.width
+        self.value = raw
 
     # Let all async objects update
     def _notify_observers(self):
-        for callback in self._callbacks:
-            # If the callback needs a parameter
-            if len(signature(callback).parameters) == 1:
-                callback(self)
-            else:
-                callback()
+        scheduler.notify(self)
 
-    def register_callback(self, callback):
-        self._callbacks.append(callback)
+    # Clocked callbacks change state (chips clocked by these pins, EEPROM flash), everything else must be combinational
+    def register_callback(self, callback, clocked=False):
+        # Check once if the callback needs a parameter, rather than on every update
+        self._callbacks.append((callback, self if len(signature(callback).parameters) == 1 else None, clocked))
 
     # Wire pin to listen to input 'a'
     def wire(self, a):
         assert isinstance(a, pins), f"[PIN]\t{self.name} must have 'a' be an pin"
         assert a.width == self.width , f"[PIN]\t{self.name} input is size {a.width} when expected {self.width}"
-        def _update():
-            self.value = a.value
-        a._callbacks.append(_update)
+        self.source = a
+        a.register_callback(self._follow)
+
+    # * Only used with wire
+    def _follow(self):
+        self.value = self.source.raw & self.source.max_val
+
+# * View of some of the bits of another set of pins (what pins[start:stop:step] returns)
+# * Raw is worked out from the parent when it is read, and callbacks are registered straight on the parent
+class pinSlice(pins):
+    __slots__ = ('parent', '_bits', '_shift', 'start', 'stop', 'step')
+
+    def __init__(self, parent, bits, name=""):
+        # Slices of slices look straight at the original pins
+        if isinstance(parent, pinSlice):
+            bits = [parent._bits[bit] for bit in bits]
+            parent = parent.parent
+        self.name = name
+        self.parent = parent
+        self._bits = bits # Bit of the parent that feeds each bit of the slice
+        self._width = len(bits)
+        self.max_val = 2 ** self._width - 1
+        self._callbacks = ()
+        # Contiguous slices are just a shift
+        first = bits[0] if bits else 0
+        self._shift = first if bits == list(range(first, first + len(bits))) else None
+
+    @property
+    def raw(self):
+        raw = self.parent.raw
+        if self._shift is not None:
+            return (raw >> self._shift) & self.max_val
+        val = 0
+        for i, bit in enumerate(self._bits):
+            val |= ((raw >> bit) & 1) << i
+        return val
+    @property
+    def value(self):
+        raw = self.raw
+        return [(raw >> i) & 1 for i in range(self._width)]
+
+    @raw.setter
+    def raw(self, val):
+        self.value = val
+    @value.setter
+    def value(self, val):
+        raise TypeError(f"[PIN]\t{self.name} is a slice of {self.parent.name}, set the parent pins instead")
+
+    def register_callback(self, callback, clocked=False):
+        self.parent._callbacks.append((callback, self if len(signature(callback).parameters) == 1 else None, clocked))
+
+    def wire(self, a):
+        raise TypeError(f"[PIN]\t{self.name} is a slice of {self.parent.name}, wire the parent pins instead")
 
 # *********************************** CHIP BASE DEFINITION
 class CHIP():
+    __slots__ = ('name', '_raw', '_value', '_in_width', 'output')
+
     def __init__(self, out_len=8, val=0, name=""):
         self.name = name
         self._raw = 0
@@ -162,7 +344,7 @@ class CHIP():
         return self._in_width # By default, output matches input
     @raw.setter
     def raw(self, val):
-        assert isinstance(val, int), f"[GENIC]\t{self.name} raw setter needs object of type int, not {type(val)}"
+        assert isinstance(val, (int, np.ndarray)), f"[GENIC]\t{self.name} raw setter needs object of type int (or array of lanes), not {type(val)}"
         self.output.value = val
         self._raw = val
     @value.setter
@@ -184,6 +366,8 @@ class CHIP():
 
 # ********************************** GATE DEFINITIONS
 class GATE(CHIP):
+    __slots__ = ('gate_name', 'expression', 'a', 'b')
+
     # Init is built off CHIP
     def __init__(self, gate_name, expression, out_len, name=""):
         super(GATE, self).__init__(out_len=out_len, name=name)
@@ -202,87 +386,87 @@ class GATE(CHIP):
             b.register_callback(self.calc)
             self.b = b
         self.calc() # Run the initial multiplication
-    # Run the expression to compute output
+    # Run the expression to compute output (expressions work on every bit of the raw values at once)
     def calc(self):
-        temp = []
-        for i in range(self.width):
-            if self.expression(i):  temp.append(1)
-            else:                   temp.append(0)
-        self.value = temp
+        self.value = self.expression() & self.max_val
 
 class XOR(GATE):
+    __slots__ = ()
     def __init__(self, out_len=1, name=""):
         super(XOR, self).__init__("XOR", self.expr, out_len, name)
-    def expr(self, i):
-        return self.a.value[i] != self.b.value[i]
+    def expr(self):
+        return self.a.raw ^ self.b.raw
 class AND(GATE):
+    __slots__ = ()
     def __init__(self, out_len=1, name=""):
         super(AND, self).__init__("AND", self.expr, out_len, name)
-    def expr(self, i):
-        return self.a.value[i] and self.b.value[i]
+    def expr(self):
+        return self.a.raw & self.b.raw
 class OR(GATE):
+    __slots__ = ()
     def __init__(self, out_len=1, name=""):
         super(OR, self).__init__("OR", self.expr, out_len, name)
-    def expr(self, i):
-        return self.a.value[i] or self.b.value[i]
+    def expr(self):
+        return self.a.raw | self.b.raw
 # * NOTTED VERSIONS
 class NOT(GATE):
+    __slots__ = ()
     def __init__(self, out_len=1, name=""):
         super(NOT, self).__init__("NOT", self.expr, out_len, name)
-    def expr(self, i):
-        return not self.a.value[i]
+    def expr(self):
+        return ~self.a.raw
 class XNOR(GATE):
+    __slots__ = ()
     def __init__(self, out_len=1, name=""):
         super(XNOR, self).__init__("XNOR", self.expr, out_len, name)
-    def expr(self, i):
-        return self.a.value[i] == self.b.value[i]
+    def expr(self):
+        return ~(self.a.raw ^ self.b.raw)
 class NAND(GATE):
+    __slots__ = ()
     def __init__(self, out_len=1, name=""):
         super(NAND, self).__init__("NAND", self.expr, out_len, name)
-    def expr(self, i):
-        return not (self.a.value[i] and self.b.value[i])
+    def expr(self):
+        return ~(self.a.raw & self.b.raw)
 class NOR(GATE):
+    __slots__ = ()
     def __init__(self, out_len=1, name=""):
         super(NOR, self).__init__("NOR", self.expr, out_len, name)
-    def expr(self, i):
-        return not (self.a.value[i] or self.b.value[i])
+    def expr(self):
+        return ~(self.a.raw | self.b.raw)
 
 # * SINGLE INPUT GATES
 class bitGate(GATE):
+    __slots__ = ()
     def __init__(self, gate_name, expression, in_len, name=""):
         super(bitGate, self).__init__(gate_name, expression, 1, name)
         self.in_width = in_len
 class bitAND(bitGate):
+    __slots__ = ()
     def __init__(self, in_len=1, name=""):
         super(bitAND, self).__init__("bAND", self.expr, in_len, name)
-    def expr(self, i):
+    def expr(self):
         # Make sure all of input is on
-        for a in self.a.value:
-            if not a: # If anything is not on, AND is off
-                return False
-        return True
+        return _bit(self.a.raw & self.a.max_val == self.a.max_val)
 class bitNOR(bitGate):
+    __slots__ = ()
     def __init__(self, in_len=1, name=""):
         super(bitNOR, self).__init__("bNOR", self.expr, in_len, name)
-    def expr(self, i):
-        # Make sure all of input is on
-        for a in self.a.value:
-            if a: # If anything is on, NOR is off
-                return False
-        return True
+    def expr(self):
+        # If anything is on, NOR is off
+        return _bit(self.a.raw & self.a.max_val == 0)
 class bitOR(bitGate):
+    __slots__ = ()
     def __init__(self, in_len=1, name=""):
         super(bitOR, self).__init__("bOR", self.expr, in_len, name)
-    def expr(self, i):
-        # Make sure all of input is on
-        for a in self.a.value:
-            if a: # If anything is on, NOR is off
-                return True
-        return False
+    def expr(self):
+        # If anything is on, OR is on
+        return _bit(self.a.raw & self.a.max_val != 0)
 
 # ********************************** ASYNC IC DEFINITIONS
 # Selects one bit out of the input (Generally used in conjunction with EEPROM)
 class bitMux(CHIP):
+    __slots__ = ('in_len', 'sel_len', 'a', 'sel')
+
     def __init__(self, name=""):
         self.name = name
         self._raw = 0
@@ -301,12 +485,14 @@ class bitMux(CHIP):
         self.a = a
         self.sel = sel
         self.select() # Initialize state
-    # Parse input and put it into output directly (as a list)
+    # Pick the selected bit straight out of the input
     def select(self):
-        self.value = self.a.value[self.sel.raw:self.sel.raw+1]
+        self.value = (self.a.raw >> self.sel.raw) & 1
 
 # Choose between two different inputs
 class Mux(CHIP):
+    __slots__ = ('in_len', 'a', 'b', 'sel')
+
     # Define input pins
     def wire(self, a, b, sel):
         assert a.width <= self.in_width, f"[MUX]\t{self.name} pin dimensions don't match: {a.width} != {self.in_width}"
@@ -331,6 +517,8 @@ class Mux(CHIP):
             self.raw = self.a.raw
 
 class IdentityComparator(CHIP):
+    __slots__ = ('a', 'b')
+
     def __init__(self, in_len, name=""):
         super(IdentityComparator, self).__init__(1, name=name)
         self.in_width = in_len
@@ -345,13 +533,12 @@ class IdentityComparator(CHIP):
         self.update()
 
     def update(self):
-        if self.a.raw == self.b.raw:
-            self.output.value = 1
-        else:
-            self.output.value = 0
+        self.output.value = _bit(self.a.raw == self.b.raw)
 
 # Has three output bits     0: a > b    1: a = b    2: a < b
 class MagnitudeComparator(CHIP):
+    __slots__ = ('a', 'b')
+
     def __init__(self, in_len, name=""):
         super(MagnitudeComparator, self).__init__(3, name=name)
         self.in_width = in_len
@@ -366,25 +553,74 @@ class MagnitudeComparator(CHIP):
         self.update()
 
     def update(self):
-        if self.a.raw > self.b.raw:
-            self.output.value = [1, 0, 0]
-        elif self.a.raw < self.b.raw:
-            self.output.value = [0, 0, 1]
-        else:
-            self.output.value = [0, 1, 0]
+        a, b = self.a.raw, self.b.raw
+        self.output.value = _bit(a > b) | _bit(a == b) << 1 | _bit(a < b) << 2
 
 # ******************************************************** EEPROM DEFINITION
+# * Contents are an array of bytes (8-bit words) or of C ints for wider words: signed, since the sim stores negative
+# * accumulators, and wide enough for every unsigned 16-bit word as well
+# * Lane mode stores one array per address, so the first array written turns the contents into a list
 # ? D1 needs to have i/o pins together
 class EEPROM(CHIP):
+    __slots__ = ('DEFAULT_VALUE', 'max_addr', 'data', 'addr_width', 'rd_wr', 'addr', 'data_in', 'flash')
+
     # Define output pins and constants
     def __init__(self, addr_len=12, io_len=8, name=""):
         super(EEPROM, self).__init__(io_len, name=name)
+        assert io_len <= 16, f"[EEPROM]\t{self.name} words can be at most 16 bits, not {io_len}"
         self.DEFAULT_VALUE = 0 # ? EEPROMS generally store 0xFF as default, not 0
         self.max_addr = (1 << addr_len) - 1 # Measured in bits
-        self.data = [self.DEFAULT_VALUE] * (self.max_addr + 1)
+        self.data = self._empty(self.max_addr + 1)
         self.addr_width = addr_len
         self.rd_wr = 0
 
+    # 'length' words of DEFAULT_VALUE in the same storage as data
+    def _empty(self, length):
+        if self.in_width <= 8:
+            return array('B', [self.DEFAULT_VALUE]) * length
+        return array('i', [self.DEFAULT_VALUE]) * length
+
+    @property
+    def lanes(self):
+        return isinstance(self.data, list)
+
+    # Write one address (an array of lanes switches the contents over to a list)
+    def store(self, addr, val):
+        if isinstance(val, np.ndarray) and not self.lanes:
+            self.data = list(self.data)
+        self.data[addr] = val
+
+    # Write a run of words starting at 'start' with one slice assignment
+    def load(self, words, start=0):
+        assert start + len(words) <= len(self.data), f"[EEPROM]\t{self.name} {len(words)} words at {start} do not fit in {len(self.data)} addresses"
+        # Lanes are filled with an array for every word
+        if len(words) and isinstance(words[0], np.ndarray):
+            if not self.lanes:
+                self.data = list(self.data)
+            self.data[start:start + len(words)] = list(words)
+        elif self.lanes:
+            self.data[start:start + len(words)] = list(words)
+        # Packed bytes go straight into the byte array
+        elif self.data.typecode == 'B' and isinstance(words, (bytes, bytearray, memoryview)):
+            memoryview(self.data)[start:start + len(words)] = words
+        else:
+            self.data[start:start + len(words)] = array(self.data.typecode, words)
+
+    # Contents as the chip would be burnt: one byte per address, or two (little endian) for wider words
+    def image(self):
+        assert not self.lanes, f"[EEPROM]\t{self.name} holds one value per lane, only a single image can be dumped"
+        if self.data.typecode == 'B':
+            return self.data.tobytes()
+        # Negative accumulators are stored as the io_len bit two's complement the chip would hold
+        words = array('H', [word & self.max_val for word in self.data])
+        if sys.byteorder == 'big':
+            words.byteswap()
+        return words.tobytes()
+
+    def dump(self, path):
+        with open(path, 'wb') as file:
+            file.write(self.image())
+
     def binData(self, start, end):
         string = f'{self.name}: '
         for el in self.data[start:end]:
@@ -411,48 +647,34 @@ class EEPROM(CHIP):
             assert data_in.width == self.in_width, f"[EEPROM]\t{self.name} needs {self.in_width} input pins, but got {data_in.width}"
             assert rd_wr.width == 1, f"[EEPROM]\t{self.name} needs 1 pin for rd/wr, but got {rd_wr.width}"
             assert flash.width == 1, f"[EEPROM]\t{self.name} needs 1 pin for flash, but got {flash.width}"
-            flash.register_callback(self.update) # Listen to flash
+            flash.register_callback(self.update, clocked=True) # Listen to flash
             rd_wr.register_callback(self.display) # Listen to rd/wr
             # Save pins
             self.data_in = data_in
             self.flash = flash
             self.rd_wr = rd_wr
 
-    # * Assumes data is three dimensional - LAYER : NODE : WEIGHT
+    # * Assumes data is three dimensional - LAYER : NODE : WEIGHT (nothing in it is padded or copied)
+    # * data[layer][node][i] goes to address (layer : node : i), each padded out to its number of address bits
     def fill3D(self, data, addr_bits_per_dim):
         assert len(addr_bits_per_dim) == 3, f"[EEPROM]\t{self.name} fill3D requires addr_bits_per_dim has 3 values"
         assert sum(addr_bits_per_dim) <= self.addr_width, f"[EEPROM]\t{self.name} addr width {self.addr_width} does not match those given to fill3D"
-        assert isinstance(data, list), f"[EEPROM]\t{self.name} fill3D requires data is 3 dimensional, not type {type(data)}"
-        assert isinstance(data[0], list), f"[EEPROM]\t{self.name} fill3D requires data is 3 dimensional, not 1"
-        assert isinstance(data[0][0], list), f"[EEPROM]\t{self.name} fill3D requires data is 3 dimensional, not 2"
-        
-        layer_size = 1 << addr_bits_per_dim[1]
-        weight_size = 1 << addr_bits_per_dim[2]
-        emptyNode = [self.DEFAULT_VALUE] * weight_size # Doesn't matter that this is pass by reference since all the values are getting inserted into self.data  
-
-        # Pad data with zeros
-        for layer in data:
-            # Extend nodes to be same length as weight size
-            for node in layer:
-                node.extend( [0] * (weight_size - len(node)) )
-            # Make enough dummy nodes to pad out layer
-            layer.extend( [emptyNode] * (layer_size - len(layer)) ) 
-
-        # Iterate through data and linearize it
-        index = 0
-        for layer in data:
-            for node in layer:
-                for eight_weights in node:
-                    self.data[index] = eight_weights
-                    index += 1
+        layer_bits, node_bits, weight_bits = addr_bits_per_dim
+        assert len(data) <= 1 << layer_bits, f"[EEPROM]\t{self.name} fill3D got {len(data)} layers, but only has room for {1 << layer_bits}"
 
+        self.data = self._empty(len(self.data))
+        for l_index, layer in enumerate(data):
+            assert len(layer) <= 1 << node_bits, f"[EEPROM]\t{self.name} fill3D got {len(layer)} nodes in layer {l_index}, but only has room for {1 << node_bits}"
+            for node_index, node in enumerate(layer):
+                assert len(node) <= 1 << weight_bits, f"[EEPROM]\t{self.name} fill3D got {len(node)} words in node {node_index}, but only has room for {1 << weight_bits}"
+                self.load(node, ((l_index << node_bits) | node_index) << weight_bits)
+
+    # Writes the words from address 0 and clears the rest
     def fill(self, data):
-        # Make data 3D
         if not isinstance(data, list): data = [data]
-        if not isinstance(data[0], list): data = [data]
-        if not isinstance(data[0][0], list): data = [data]
-
-        self.fill3D(data, (0, 0, self.addr_width))
+        assert len(data) <= len(self.data), f"[EEPROM]\t{self.name} has {len(self.data)} addresses, but got {len(data)} words"
+        self.data = self._empty(len(self.data))
+        self.load(data)
 
     
     def display(self):
@@ -465,4 +687,4 @@ class EEPROM(CHIP):
     def update(self):
         if self.flash and self.rd_wr:
             # print(f"FLASHING {self.name} with {self.data_in} at {self.addr.raw}")
-            self.data[self.addr.raw] = self.data_in.raw
\ No newline at end of file
+            self.store(self.addr.raw, self.data_in.raw)
\ No newline at end of file
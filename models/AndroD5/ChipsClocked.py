@@ -2,10 +2,13 @@
 # DATE  : 2020-04-07
 # ABOUT : Initial software implementation of all the chips used in the circuit - used in AndroD5
 
+import numpy as np
 from ChipsAsync import pins, CHIP
 
 # ********************************** CLOCK-SYNCED BASE CLASS
 class ClockedChip(CHIP):
+    __slots__ = ('_i_val', 'clk')
+
     def __init__(self, out_len=8, val=0, name=""):
         super(ClockedChip, self).__init__(out_len=out_len, val=val, name=name)
         self._i_val = self.raw # Intermediate value
@@ -24,7 +27,7 @@ class ClockedChip(CHIP):
         self._i_val = self._raw
     @raw.setter
     def raw(self, val):
-        assert isinstance(val, int), f"[CLKIC]\t{self.name} raw setter needs object of type int, not {type(val)}"
+        assert isinstance(val, (int, np.ndarray)), f"[CLKIC]\t{self.name} raw setter needs object of type int (or array of lanes), not {type(val)}"
         self.output.value = val
         self._raw = val
         self._i_val = val
@@ -33,16 +36,23 @@ class ClockedChip(CHIP):
         raise OSError(f"[CLKIC]\t{self.name} object needs the _calculate function defined in order to be used")
 
     def _display(self):
-        assert self._i_val <= self.max_val, f"[CLKIC]\t{self.name} has calculated intermediate value that exceeds maximum of {self.max_val}, but got {self._i_val}"
+        assert np.all(self._i_val <= self.max_val), f"[CLKIC]\t{self.name} has calculated intermediate value that exceeds maximum of {self.max_val}, but got {self._i_val}"
         self.value = self._i_val
 
     def update(self):
         self._calculate()
         self._display()
 
+    # Called whenever a clock pin updates, only acts while it is high
+    def _clockPin(self):
+        if self.clk.raw:
+            self.update()
+
 # ********************************** CLOCK-SYNCED IC DEFINITIONS
 # Accumulator for node math
 class UpDownCounter(ClockedChip):
+    __slots__ = ('up_down',)
+
     # Connect incoming signals to the chip
     def wire(self, up_down, clk=None):
         assert isinstance(up_down, pins), "[UPDWN]\tCounter must be driven by pins"
@@ -53,7 +63,7 @@ class UpDownCounter(ClockedChip):
         if isinstance(clk, pins):
             assert clk.width == 1, f"[UPDWN]\t{self.name} clock must be 1 bit, not {clk.width}"
             self.clk = clk
-            clk.register_callback(lambda: self.update() if self.clk.raw else None)
+            clk.register_callback(self._clockPin, clocked=True)
         elif isinstance(clk, CLOCK):
             clk.sync(self)
         elif clk is not None:
@@ -61,13 +71,15 @@ class UpDownCounter(ClockedChip):
 
     def _calculate(self):
         try:
-            self._i_val += 1 if self.up_down else -1
+            self._i_val = self._i_val + 2 * self.up_down.raw - 1 # +1 when up, -1 when down (per lane)
             self.value = self._i_val # Update array in value
         except AttributeError:
             AttributeError(f"[UPDWN]\t{self.name} has not been wired, but an update has been triggered (FLOATING INPUT)")
 
 # Increments with update/clk
 class Counter(ClockedChip):
+    __slots__ = ('reset', 'load')
+
     def __init__(self, out_len=8, val=0, name=""):
         super(Counter, self).__init__(out_len=out_len, val=val, name=name)
         self.reset = None # Initialize data_in
@@ -84,7 +96,7 @@ class Counter(ClockedChip):
         if isinstance(clk, pins):
             assert clk.width == 1, f"[COUNT]\t{self.name} clock must be 1 bit, not {clk.width}"
             self.clk = clk
-            clk.register_callback(lambda: self.update() if self.clk.raw else None)
+            clk.register_callback(self._clockPin, clocked=True)
         elif isinstance(clk, CLOCK):
             clk.sync(self)
         elif clk is not None:
@@ -99,6 +111,8 @@ class Counter(ClockedChip):
 
 # ? D1 Needs latch
 class ShiftRegister(ClockedChip):
+    __slots__ = ('data',)
+
     # Wire inputs
     def wire(self, data, clk=None):
         assert isinstance(data, pins), f"[SREG]\t{self.name} must be driven by pins"
@@ -107,7 +121,7 @@ class ShiftRegister(ClockedChip):
         if isinstance(clk, pins):
             assert clk.width == 1, f"[SREG]\t{self.name} clock must be 1 bit, not {clk.width}"
             self.clk = clk
-            clk.register_callback(lambda: self.update() if self.clk.raw else None)
+            clk.register_callback(self._clockPin, clocked=True)
         elif isinstance(clk, CLOCK):
             clk.sync(self)
         elif clk is not None:
@@ -121,6 +135,8 @@ class ShiftRegister(ClockedChip):
         self._i_val = _raw % (1 << self.width)
 
 class FlipFlop(ClockedChip):
+    __slots__ = ('data_in',)
+
     def __init__(self, out_len=8, val=0, name=""):
         super(FlipFlop, self).__init__(out_len=out_len, val=val, name=name)
         self.data_in = None # Initialize data_in
@@ -133,7 +149,7 @@ class FlipFlop(ClockedChip):
         if isinstance(clk, pins):
             assert clk.width == 1, f"[FLFP]\t{self.name} clock must be 1 bit, not {clk.width}"
             self.clk = clk
-            clk.register_callback(lambda: self.update() if self.clk.raw else None)
+            clk.register_callback(self._clockPin, clocked=True)
         elif isinstance(clk, CLOCK):
             clk.sync(self)
         elif clk is not None:
@@ -148,6 +164,8 @@ class FlipFlop(ClockedChip):
 # ********************************** CLOCK DEFINITION
 # Calculates all objects outputs, then display all values so that it doesn't matter what order objects are tethered in
 class CLOCK():
+    __slots__ = ('state', 'name', 'output', 'synced_objects')
+
     def __init__(self, tethers=[]):
         self.state = 0
         self.name = 'CLOCK'
@@ -2,22 +2,46 @@
 # DATE  : 2020-04-013
 # ABOUT : Main body -> Takes input image and calculates logits
 
-from src.model_packed import weights, shape
-from src.data_packed import x_test, y_test
+import os
+import sys
+# Share the packed binaries in models/src with the other generations (D5 has no src directory of its own, so "src" is always models/src)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src.packed_io import load_data, shared_model
+from PackedBatch import popcount, toArray
+from ByteKernel import byteMatches
 import ChipsClocked as IC
 import ChipsAsync as asyncIC
+from Netlist import Netlist
 from tqdm import tqdm
+import numpy as np
 
 BITS_LAYER = 2
 BITS_NODES = 9
 BITS_WEIGHTS = 7
+# (address bits, bits per word) of every EEPROM
+EEPROM_SIZES = {
+    'WEIGHTS': (18, 8),
+    'INPUT1':  (7, 8),
+    'INPUT2':  (7, 8),
+    'SHAPE':   (2, 10),
+    'FINAL':   (10, 10),
+}
+
+x_test, y_test = load_data()
+weights, shape = shared_model()
 
 class Model():
-    def __init__(self):
+    def __init__(self, weights=weights, shape=shape):
+        self.shape = shape
         self.bar = True # Display variable
+        self.verbose = True # Print the final logits and the last layer's accumulators
+        self.net = None # Compiled program (see compile)
+        self._saved = None # State reset goes back to (see save)
+        self.fast_forward = False # Jump through the steady part of every node (see _fastForward)
+        self.byte_kernel = False # Fast-forward one EEPROM byte per step with ByteKernel instead of one popcount per row
         self.clk = IC.CLOCK()
 
-        self._initEEPROMs()
+        self._initEEPROMs(weights)
         self._initCounters()
         self._initRDSignals()
         self._initMult()
@@ -32,18 +56,18 @@ class Model():
         ])
         # I1_RD_delayed, I2_RD_delayed, i_addr_listen, layer_done_delayed
 
-    def _initEEPROMs(self):
+    def _initEEPROMs(self, weights):
         # Weights currently require 98 kB : addr_len >= 17 if packed to the max
-        self.WEIGHTS_EEPROM = asyncIC.EEPROM(addr_len=18, name='WEIGHTS')
+        self.WEIGHTS_EEPROM = asyncIC.EEPROM(*EEPROM_SIZES['WEIGHTS'], name='WEIGHTS')
         # * Current model max dimensions - # of: layers=2, nodes=512, weights-bytes-in-node=98
         # MINIMUM address bits for current model - 1, 9, 7
         self.WEIGHTS_EEPROM.fill3D(weights, (BITS_LAYER, BITS_NODES, BITS_WEIGHTS))
         # Alternating data EEPROMs
-        self.INPUT1_EEPROM = asyncIC.EEPROM(addr_len=7, name='INPUT1')
-        self.INPUT2_EEPROM = asyncIC.EEPROM(addr_len=7, name='INPUT2') # ? Storage EEPROM
+        self.INPUT1_EEPROM = asyncIC.EEPROM(*EEPROM_SIZES['INPUT1'], name='INPUT1')
+        self.INPUT2_EEPROM = asyncIC.EEPROM(*EEPROM_SIZES['INPUT2'], name='INPUT2') # ? Storage EEPROM
         # MINIMUM address bits for current model - 2 (784, 512, 10)
-        self.SHAPE_EEPROM = asyncIC.EEPROM(addr_len=2, io_len=10, name='SHAPE')
-        self.SHAPE_EEPROM.fill(shape)
+        self.SHAPE_EEPROM = asyncIC.EEPROM(*EEPROM_SIZES['SHAPE'], name='SHAPE')
+        self.SHAPE_EEPROM.fill(self.shape)
         self.INPUT_SIZE = IC.FlipFlop(10, val=784, name='SHAPE_WEIGHT_COUNT')
         self.LAYER_SIZE = IC.FlipFlop(10, val=512, name='SHAPE_NODE_COUNT')
 
@@ -159,7 +183,7 @@ class Model():
         self.INPUT2_EEPROM.wire(addr=self.I2_ADDR_MUX.output, data_in=self.I2_SR_OUT, rd_wr=self.I1_RD_delayed, flash=self.input_flash_delayed.output)
 
     def _finalEEPROM(self):
-        self.FINAL_EEPROM = asyncIC.EEPROM(addr_len=10, io_len=10, name='FINAL')
+        self.FINAL_EEPROM = asyncIC.EEPROM(*EEPROM_SIZES['FINAL'], name='FINAL')
         # Rd/wr signal
         self.model_not_done = asyncIC.NOT(name='NOT M-DONE')
         self.model_not_done.wire(self.model_done.output)
@@ -169,10 +193,41 @@ class Model():
         # Wiring
         self.FINAL_EEPROM.wire(self.node_counter_delayed.output, self.accum.output, self.model_not_done.output, self.node_done.output)
 
+    # Lower the wired chips into a flat program of integer ops (same state after every clock edge, much faster)
+    def compile(self):
+        self.net = Netlist(self.clk, list(self.__dict__.values()))
+        return self.net
+
+    # * RESET - a prediction leaves the circuit in its end state, so save it once and reset before every image
+    # Remember the state everything is in now (after compile, if the model is compiled)
+    def save(self):
+        # An uncompiled model still uses a netlist to find every pin and clocked chip
+        net = self.net or Netlist(self.clk, list(self.__dict__.values()))
+        eeproms = [obj for obj in self.__dict__.values() if isinstance(obj, asyncIC.EEPROM)]
+        self._saved = (net, net.state(), [(eeprom, eeprom.data[:]) for eeprom in eeproms])
+
+    def reset(self):
+        assert self._saved, "[MODEL]\tNothing to reset to, call save first"
+        net, state, eeproms = self._saved
+        net.restore(state)
+        for eeprom, data in eeproms:
+            eeprom.data = data[:]
+
+    # * Go through the compiled program if there is one
+    def _pulse(self):
+        if self.net: self.net.pulse()
+        else:        self.clk.pulse()
+    def _read(self, obj):
+        if self.net: return self.net.read(obj)
+        else:        return obj.raw
+    def _write(self, obj, val):
+        if self.net: self.net.write(obj, val)
+        else:        obj.value = val
+
     # * CALCULATION FUNCTIONS (Should be removed in final iteration except predict function)
-    # Given an image, returns the value
+    # Given an image, returns the logits
     def predict(self, x, start=(0, 0, 0)):
-        self.INPUT1_EEPROM.fill(x)
+        self.INPUT1_EEPROM.fill(list(x))
 
         # self.INPUT2_EEPROM.data = [
         #     31, 202, 236, 107, 15, 75, 61, 199, 245, 245, 25, 243, 122, 39, 82, 140, 
@@ -180,56 +235,124 @@ class Model():
         #     182, 178, 51, 61, 104, 54, 166, 203, 60, 116, 155, 12, 124, 186, 187, 205, 
         #     151, 101, 21, 95, 198, 12, 33, 175, 228, 163, 174, 223, 87, 188, 36, 43
         # ]
-        self.layer_counter.value = start[0]
-        self.node_counter.value = start[1]
-        self.weight_counter.value = start[2] 
+        self._write(self.layer_counter, start[0])
+        self._write(self.node_counter, start[1])
+        self._write(self.weight_counter, start[2])
 
         self.modelMult()
         # self.layerMult()
         # self.nodeMult()
-        print('FINAL')
-        print(self.FINAL_EEPROM.data[0:10])
+        if self.net:
+            self.net.sync()
+        if self.verbose:
+            print('FINAL')
+            print(list(self.FINAL_EEPROM.data[0:10]))
+        return list(self.FINAL_EEPROM.data[:self.shape[-1]])
+
+    # Runs every image through at once (lane mode): data pins hold one value per image, control is shared
+    # Returns an N x 10 array of logits
+    def predict_batch(self, images, start=(0, 0, 0)):
+        assert self.net is None, "[MODEL]\tThe compiled netlist runs one image at a time, use a model that was not compiled"
+        # One row per EEPROM address, one column per image
+        self.INPUT1_EEPROM.fill(list(toArray(images).T.astype(np.int64)))
+
+        self._write(self.layer_counter, start[0])
+        self._write(self.node_counter, start[1])
+        self._write(self.weight_counter, start[2])
+
+        self.modelMult()
+        return np.stack([np.broadcast_to(logit, len(images)) for logit in self.FINAL_EEPROM.data[:self.shape[-1]]], axis=1)
 
     def modelMult(self):
-        while not self.model_done:
+        while not self._read(self.model_done):
             self.layerMult()
             self.bar = False
             
     def layerMult(self):
         if self.bar:
-            pbar = tqdm(total=self.LAYER_SIZE.raw  - self.node_counter.raw)
+            pbar = tqdm(total=self._read(self.LAYER_SIZE)  - self._read(self.node_counter))
 
-        while not self.layer_done:
+        while not self._read(self.layer_done):
             self.nodeMult()
             if self.bar:
                 pbar.update(n=1)
         
-        if self.layer_counter.raw == 1: # On the first iteration, load 10 temporarily
-            self.SHAPE_EEPROM.output.value = 10
-        self.clk.pulse() # One more clock pulse and the rd/wr changes
-        self.accum.value = 0 # Reset (This is needed because of the extra clock pulse?)
-        self.weight_counter.value = 0
+        if self._read(self.layer_counter) == 1: # On the first iteration, load 10 temporarily
+            self._write(self.SHAPE_EEPROM.output, 10)
+        self._pulse() # One more clock pulse and the rd/wr changes
+        self._write(self.accum, 0) # Reset (This is needed because of the extra clock pulse?)
+        self._write(self.weight_counter, 0)
 
-        self.node_counter.value = 0
-        self.SHAPE_EEPROM.output.value = 0 # Notify this the last layer
+        self._write(self.node_counter, 0)
+        self._write(self.SHAPE_EEPROM.output, 0) # Notify this the last layer
 
-        self.INPUT2_EEPROM.data[63] >>= 1 # ! Correct value because it's wrong (due to faulty sim)
+        self.INPUT2_EEPROM.data[63] = self.INPUT2_EEPROM.data[63] >> 1 # ! Correct value because it's wrong (due to faulty sim)
 
         if self.bar:
             pbar.close()
 
     def nodeMult(self):
-        while not self.node_done:
-            self.clk.pulse()
+        if self.fast_forward:
+            self._fastForward()
+        while not self._read(self.node_done):
+            self._pulse()
         
         # ! Layer goes to 2 for some dumbass reason (delay layer_counter incrementing)
-        if self.layer_counter.raw >= 1 and self.node_counter.raw <= 100: 
-            print(self.node_counter.raw - 1, self.accum.raw) # node increments then we print, so - 1
+        if self.verbose and self._read(self.layer_counter) >= 1 and self._read(self.node_counter) <= 100: 
+            print(self._read(self.node_counter) - 1, self._read(self.accum)) # node increments then we print, so - 1
+
+        self._write(self.accum, 0)
+        self._write(self.weight_counter, 0)
+
+    # * FAST FORWARD
+    # Steady state: every flip flop on the clock already holds its input, so each pulse only
+    # adds +-1 (XNOR of the weight and input bits at weight_counter) to accum and increments weight_counter
+    def _steady(self):
+        for obj in self.clk.synced_objects:
+            if isinstance(obj, IC.FlipFlop) and self._read(obj.data_in) != self._read(obj):
+                return False
+        return not self._read(self.node_done)
 
-        self.accum.value = 0
-        self.weight_counter.value = 0
+    # Pulse until the node is in steady state, then jump accum and weight_counter to one pulse before node_done
+    # (the last pulse is left to the clock so node_done triggers everything it normally does)
+    def _fastForward(self):
+        while not self._read(self.node_done) and not self._steady():
+            self._pulse()
+        if self._read(self.node_done):
+            return
+        start = self._read(self.weight_counter)
+        end = self._read(self.INPUT_SIZE) - 1
+        if end <= start:
+            return
+        # Same addresses as w_addr (weights) and the active address of the EEPROM being read (inputs)
+        base = (self._read(self.node_counter) & ((1 << BITS_NODES) - 1)) << BITS_WEIGHTS
+        base |= self._read(self.layer_counter) << (BITS_WEIGHTS + BITS_NODES)
+        input_eeprom = self.INPUT1_EEPROM if self._read(self.I1_RD) else self.INPUT2_EEPROM
+        num_bytes = (end + 7) >> 3
+        weights = self.WEIGHTS_EEPROM.data[base:base + num_bytes]
+        inputs = input_eeprom.data[:num_bytes]
+        # Bits start to end - 1 are the pulses being skipped
+        mask = ((1 << end) - 1) ^ ((1 << start) - 1)
+        if any(isinstance(byte, np.ndarray) for byte in inputs):
+            # Lane mode, count every image's matches at once (bytes x lanes)
+            weights = np.array(weights, dtype=np.uint8)[:, None]
+            inputs = np.stack(np.broadcast_arrays(*inputs)).astype(np.uint8)
+            byte_mask = np.frombuffer(mask.to_bytes(num_bytes, 'little'), dtype=np.uint8)[:, None]
+            matches = popcount(~(weights ^ inputs) & byte_mask).sum(axis=0, dtype=np.int64)
+        elif self.byte_kernel:
+            # One EEPROM byte of weights and inputs per step, like the hardware reads them
+            matches = byteMatches(weights, inputs, start, end)
+        else:
+            # Whole row at once as one int
+            weight_bits = int.from_bytes(bytes(weights), 'little')
+            input_bits = int.from_bytes(bytes(inputs), 'little')
+            matches = (~(weight_bits ^ input_bits) & mask).bit_count()
+        self._write(self.accum, self._read(self.accum) + 2 * matches - (end - start))
+        self._write(self.weight_counter, end)
 
-model = Model()
-model.predict(x_test[0], (1, 0, 0)) # (0, 508, 0)
+if __name__ == "__main__":
+    model = Model()
+    model.compile()
+    model.predict(x_test[0], (1, 0, 0)) # (0, 508, 0)
 
-print('ANSWER: ', y_test[0])
+    print('ANSWER: ', y_test[0])
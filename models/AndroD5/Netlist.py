@@ -0,0 +1,403 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Compiles a wired circuit into a flat, levelized program of integer operations (same state after every clock edge)
+
+from heapq import heappush, heappop
+import ChipsClocked as IC
+import ChipsAsync as asyncIC
+
+# * Every pins object becomes a slot in 'raw' (same int as pins.raw, negatives included)
+# * Every async chip / slice / group becomes a function of those slots, sorted by level so one pass settles it
+# * Clocked chips and EEPROM writes (events) stay event driven: after a pin is set and the ops have settled,
+# * every event listening to a pin that changed runs in the same depth-first order the callbacks would have reached it
+
+def _mask(width):
+    return (1 << width) - 1
+
+# ********************************** NETLIST DEFINITION
+class Netlist():
+    def __init__(self, clock, roots=()):
+        self.clock = clock
+        self.raw = []       # Value of every pin
+        self._pins = []     # pins objects, indexed like raw
+        self._pin_ids = {}  # id(pins) -> index
+        self._chips = []    # Clocked chips, indexed like _state
+        self._chip_ids = {}
+        self._state = []    # Intermediate value (_i_val) of every clocked chip
+
+        self._discover([clock, list(roots)])
+        self._compile()
+        self._compileChips()
+        # Dirty ops (heap of positions in level order)
+        self._dirty = [False] * len(self._op_fns)
+        self._heap = []
+
+    # ****************************** DISCOVERY
+    def _discover(self, roots):
+        for obj in asyncIC.reachable(roots):
+            if isinstance(obj, asyncIC.pins):
+                self._pinId(obj)
+                for callback, _, _ in obj._callbacks:
+                    if getattr(callback, '__self__', None) is None:
+                        raise TypeError(f"[NET]\t{obj.name} has a callback that is not a bound method ({callback}), it cannot be compiled")
+            elif isinstance(obj, IC.ClockedChip):
+                self._chipId(obj)
+
+    def _pinId(self, pin):
+        key = id(pin)
+        if key not in self._pin_ids:
+            self._pin_ids[key] = len(self._pins)
+            self._pins.append(pin)
+            self.raw.append(pin.raw)
+        return self._pin_ids[key]
+
+    def _chipId(self, chip):
+        key = id(chip)
+        if key not in self._chip_ids:
+            self._chip_ids[key] = len(self._chips)
+            self._chips.append(chip)
+            self._state.append(chip._i_val)
+        return self._chip_ids[key]
+
+    # ****************************** COMPILATION
+    def _compile(self):
+        ops = {}            # (id(owner), func) -> [fn, inputs, output]
+        listeners = [[] for _ in self._pins] # Callbacks of every pin in order: ('op', key) or ('event', index)
+        self._event_list = []
+        event_ids = {}
+
+        for pin_index, pin in enumerate(list(self._pins)):
+            for callback, _, _ in pin._callbacks:
+                owner = callback.__self__
+                func = callback.__func__
+                key = (id(owner), func)
+                # Events that change state (clocked chips on a pins clock, EEPROM flashing)
+                if func is IC.ClockedChip._clockPin or func is asyncIC.EEPROM.update:
+                    if key not in event_ids:
+                        event_ids[key] = len(self._event_list)
+                        self._event_list.append(self._compileEvent(owner, func))
+                    listeners[pin_index].append(('event', event_ids[key]))
+                    continue
+                # Everything else is a pure function of its inputs
+                if key not in ops:
+                    ops[key] = self._compileOp(owner, func)
+                listeners[pin_index].append(('op', key))
+
+        # Pins that were only found while compiling have nothing listening to them
+        listeners.extend([] for _ in range(len(self._pins) - len(listeners)))
+
+        # Slices have no callbacks of their own, they are recomputed before anything listening to their parent
+        for pin_index, pin in enumerate(self._pins):
+            if isinstance(pin, asyncIC.pinSlice):
+                key = (id(pin), asyncIC.pinSlice)
+                ops[key] = self._compileSlice(pin, pin.parent)
+                listeners[self._pinId(pin.parent)].insert(0, ('op', key))
+
+        # Level every op (level = 1 + deepest op driving one of its inputs)
+        producer = {op[2]: key for key, op in ops.items()}
+        levels = {}
+        def level(key, path=()):
+            if key in levels:
+                return levels[key]
+            if key in path:
+                names = ', '.join(self._pins[ops[k][2]].name or '?' for k in path)
+                raise RecursionError(f"[NET]\tCombinational loop through {names}")
+            depth = 0
+            for inp in ops[key][1]:
+                if inp in producer:
+                    depth = max(depth, level(producer[inp], path + (key,)) + 1)
+            levels[key] = depth
+            return depth
+        for key in ops:
+            level(key)
+
+        order = sorted(ops, key=lambda k: levels[k])
+        position = {key: i for i, key in enumerate(order)}
+        self._op_fns = [ops[key][0] for key in order]
+        self._op_outs = [ops[key][2] for key in order]
+        # Duplicate registrations (same op listening twice to a pin) only need to be marked once
+        self._fanout = [sorted(set(position[key] for kind, key in entries if kind == 'op')) for entries in listeners]
+
+        # Events reached by setting each pin, in the order the callbacks would reach them (through any number of ops)
+        # with the pin they listen to (they only run if that pin changed), each event only once
+        reached = {}
+        def reach(index):
+            if index not in reached:
+                events = []
+                for kind, key in listeners[index]:
+                    if kind == 'op':
+                        events.extend(reach(ops[key][2]))
+                    else:
+                        events.append((key, index))
+                reached[index] = events
+            return reached[index]
+        self._events = []
+        for index in range(len(self._pins)):
+            seen = set()
+            events = []
+            for event, via in reach(index):
+                if event not in seen:
+                    seen.add(event)
+                    events.append((event, via))
+            self._events.append(events)
+
+    # Returns [function returning the new output, input pin indices, output pin index]
+    def _compileOp(self, owner, func):
+        raw = self.raw
+        pin = self._pinId
+
+        # * PINS (groups, wired copies)
+        if func is asyncIC.pins._updateGroup:
+            parts = [(pin(p), _mask(p.width)) for p in owner.pins_list]
+            offsets = []
+            offset = 0
+            for p in owner.pins_list:
+                offsets.append(offset)
+                offset += p.width
+            parts = [(index, mask, off) for (index, mask), off in zip(parts, offsets)]
+            def group():
+                out = 0
+                for index, mask, off in parts:
+                    out |= (raw[index] & mask) << off
+                return out
+            return [group, [p[0] for p in parts], pin(owner)]
+        if func is asyncIC.pins._follow:
+            a, m = pin(owner.source), _mask(owner.width)
+            return [lambda: raw[a] & m, [a], pin(owner)]
+
+        out = pin(owner.output)
+        # * GATES
+        if func is asyncIC.GATE.calc:
+            a = pin(owner.a)
+            b = pin(owner.b) if hasattr(owner, 'b') else None
+            m = _mask(owner.width)
+            mi = _mask(owner.in_width)
+            inputs = [a] if b is None else [a, b]
+            kind = type(owner)
+            if kind is asyncIC.XOR:    fn = lambda: (raw[a] ^ raw[b]) & m
+            elif kind is asyncIC.AND:  fn = lambda: raw[a] & raw[b] & m
+            elif kind is asyncIC.OR:   fn = lambda: (raw[a] | raw[b]) & m
+            elif kind is asyncIC.NOT:  fn = lambda: ~raw[a] & m
+            elif kind is asyncIC.XNOR: fn = lambda: ~(raw[a] ^ raw[b]) & m
+            elif kind is asyncIC.NAND: fn = lambda: ~(raw[a] & raw[b]) & m
+            elif kind is asyncIC.NOR:  fn = lambda: ~(raw[a] | raw[b]) & m
+            elif kind is asyncIC.bitAND: fn = lambda: 1 if raw[a] & mi == mi else 0
+            elif kind is asyncIC.bitNOR: fn = lambda: 0 if raw[a] & mi else 1
+            elif kind is asyncIC.bitOR:  fn = lambda: 1 if raw[a] & mi else 0
+            else:
+                raise TypeError(f"[NET]\t{owner.name} is a {kind.__name__}, which has no compiled version")
+            return [fn, inputs, out]
+
+        # * ASYNC ICS
+        if func is asyncIC.bitMux.select:
+            a, sel = pin(owner.a), pin(owner.sel)
+            return [lambda: (raw[a] >> raw[sel]) & 1, [a, sel], out]
+        if func is asyncIC.Mux.select:
+            a, b, sel = pin(owner.a), pin(owner.b), pin(owner.sel)
+            return [lambda: raw[b] if raw[sel] else raw[a], [a, b, sel], out]
+        if func is asyncIC.IdentityComparator.update:
+            a, b = pin(owner.a), pin(owner.b)
+            return [lambda: 1 if raw[a] == raw[b] else 0, [a, b], out]
+        if func is asyncIC.MagnitudeComparator.update:
+            a, b = pin(owner.a), pin(owner.b)
+            # Output bits 0: a > b    1: a = b    2: a < b
+            return [lambda: 1 if raw[a] > raw[b] else (4 if raw[a] < raw[b] else 2), [a, b], out]
+        if func is asyncIC.EEPROM.display:
+            addr = pin(owner.addr)
+            eeprom = owner
+            if isinstance(owner.rd_wr, asyncIC.pins):
+                rd_wr = pin(owner.rd_wr)
+                return [lambda: 0 if raw[rd_wr] else eeprom.data[raw[addr]], [addr, rd_wr], out]
+            if owner.rd_wr:
+                return [lambda: 0, [addr], out]
+            return [lambda: eeprom.data[raw[addr]], [addr], out]
+
+        raise TypeError(f"[NET]\t{getattr(owner, 'name', owner)} callback {func.__qualname__} has no compiled version")
+
+    # Same bit selection as pinSlice.raw
+    def _compileSlice(self, sliced, parent):
+        raw = self.raw
+        a = self._pinId(parent)
+        out = self._pinId(sliced)
+        bits = sliced._bits
+        assert len(bits) == sliced.width, f"[NET]\t{sliced.name} slice selects {len(bits)} bits but is {sliced.width} wide"
+
+        m = _mask(sliced.width)
+        start = bits[0] if bits else 0
+        if bits == list(range(start, start + len(bits))):
+            return [lambda: (raw[a] >> start) & m, [a], out]
+        # Anything else is a fixed permutation of the bits
+        def gather(value):
+            result = 0
+            for i, bit in enumerate(bits):
+                result |= ((value >> bit) & 1) << i
+            return result
+        if parent.width <= 12:
+            table = [gather(value) for value in range(1 << parent.width)]
+            pm = _mask(parent.width)
+            return [lambda: table[raw[a] & pm], [a], out]
+        return [lambda: gather(raw[a]), [a], out]
+
+    # Returns a function that runs the event
+    def _compileEvent(self, owner, func):
+        raw = self.raw
+        pin = self._pinId
+        if func is asyncIC.EEPROM.update:
+            addr, data_in, flash = pin(owner.addr), pin(owner.data_in), pin(owner.flash)
+            rd_wr = pin(owner.rd_wr)
+            eeprom = owner
+            def flashEEPROM():
+                if raw[flash] and raw[rd_wr]:
+                    eeprom.data[raw[addr]] = raw[data_in]
+            return flashEEPROM
+        chip = self._chipId(owner)
+        clk = pin(owner.clk)
+        def clockPin():
+            if raw[clk]:
+                self._calculate(chip)
+                self._display(chip)
+        return clockPin
+
+    # Look up the pins of every clocked chip once
+    def _compileChips(self):
+        pin = self._pinId
+        self._chip_info = []
+        for obj in self._chips:
+            kind = type(obj)
+            if kind is IC.UpDownCounter:
+                inputs = (pin(obj.up_down),)
+            elif kind is IC.Counter:
+                inputs = (pin(obj.reset), pin(obj.load)) if obj.reset is not None else (None, None)
+            elif kind is IC.ShiftRegister:
+                inputs = (pin(obj.data),)
+            elif kind is IC.FlipFlop:
+                inputs = (pin(obj.data_in) if obj.data_in is not None else None,)
+            else:
+                raise TypeError(f"[NET]\t{obj.name} is a {kind.__name__}, which has no compiled version")
+            self._chip_info.append((kind, pin(obj.output), inputs))
+
+        for obj in self.clock.synced_objects:
+            if not isinstance(obj, IC.ClockedChip):
+                raise TypeError(f"[NET]\t{obj} is synced to the clock but is not a clocked chip")
+        self._synced = [self._chipId(obj) for obj in self.clock.synced_objects]
+        self._clock_pin = pin(self.clock.output)
+
+    # ****************************** SIMULATION
+    # Update a pin, settle every op that depends on it, then run the events it reaches (only changes propagate, like the scheduler)
+    def _set(self, index, value):
+        raw = self.raw
+        if raw[index] == value:
+            return
+        raw[index] = value
+        self._mark(index)
+        changed = {index}
+        heap = self._heap
+        dirty = self._dirty
+        # Each op runs at most once, in level order
+        while heap:
+            position = heappop(heap)
+            dirty[position] = False
+            out = self._op_outs[position]
+            value = self._op_fns[position]()
+            if raw[out] != value:
+                raw[out] = value
+                changed.add(out)
+                self._mark(out)
+        # Each event finishes everything it causes before the next one starts (depth-first like the callbacks)
+        for event, via in self._events[index]:
+            if via in changed:
+                self._event_list[event]()
+
+    def _mark(self, index):
+        dirty = self._dirty
+        for position in self._fanout[index]:
+            if not dirty[position]:
+                dirty[position] = True
+                heappush(self._heap, position)
+
+    def _calculate(self, chip):
+        kind, out, inputs = self._chip_info[chip]
+        raw = self.raw
+        if kind is IC.UpDownCounter:
+            self._state[chip] += 1 if raw[inputs[0]] else -1
+            self._set(out, self._state[chip]) # Shows its value straight away (same as UpDownCounter._calculate)
+        elif kind is IC.Counter:
+            reset, load = inputs
+            if reset is not None and raw[reset]:
+                self._state[chip] = raw[load]
+            else:
+                self._state[chip] += 1
+        elif kind is IC.ShiftRegister:
+            self._state[chip] = ((raw[out] << 1) | raw[inputs[0]]) % (1 << self._chips[chip].width)
+        else:
+            if inputs[0] is None:
+                raise AttributeError(f"[FLFP]\t{self._chips[chip].name} updated with floating input")
+            self._state[chip] = raw[inputs[0]]
+
+    def _display(self, chip):
+        obj = self._chips[chip]
+        assert self._state[chip] <= obj.max_val, f"[CLKIC]\t{obj.name} has calculated intermediate value that exceeds maximum of {obj.max_val}, but got {self._state[chip]}"
+        self._set(self._chip_info[chip][1], self._state[chip])
+
+    # Same as CLOCK.toggle
+    def toggle(self):
+        clock = self.clock
+        clock.state ^= 1
+        self._set(self._clock_pin, clock.state)
+        # On rising edge
+        if clock.state:
+            for chip in self._synced:
+                self._calculate(chip)
+            for chip in self._synced:
+                self._display(chip)
+
+    def pulse(self, times=1):
+        for _ in range(2 * times):
+            self.toggle()
+
+    # ****************************** ACCESS
+    def _index(self, obj):
+        if isinstance(obj, asyncIC.CHIP):
+            obj = obj.output
+        return self._pin_ids[id(obj)]
+
+    # Raw value of a pins object or a chip's output
+    def read(self, obj):
+        return self.raw[self._index(obj)]
+
+    # Same as setting obj.value (clocked chips also take the value as their intermediate value)
+    def write(self, obj, value):
+        if isinstance(obj, IC.ClockedChip):
+            self._state[self._chipId(obj)] = value
+        self._set(self._index(obj), value)
+
+    # Copy the compiled state back onto the objects (EEPROM data is shared, so it is always up to date)
+    def sync(self):
+        for pin, value in zip(self._pins, self.raw):
+            # Slices read their parent
+            if isinstance(pin, asyncIC.pinSlice):
+                continue
+            pin._raw = value
+            pin._value = None
+        for chip, value in zip(self._chips, self._state):
+            chip._i_val = value
+            chip._raw = chip.output.raw
+
+    # Copy of everything that changes while running (pins, clocked chips and the clock), see restore
+    def state(self):
+        return (list(self.raw), list(self._state), self.clock.state)
+
+    # Go back to a copy from state(), the objects are synced to it as well
+    def restore(self, state):
+        raw, chip_state, clock_state = state
+        self.raw[:] = raw
+        self._state[:] = chip_state
+        self.clock.state = clock_state
+        self.sync()
+
+    # Re-read the state of the objects (after changing them directly)
+    def load(self):
+        for index, pin in enumerate(self._pins):
+            self.raw[index] = pin.raw
+        for index, chip in enumerate(self._chips):
+            self._state[index] = chip._i_val
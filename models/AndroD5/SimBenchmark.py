@@ -0,0 +1,86 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Measures the simulator's object model -> memory of a built Model, per-object size, attribute access and simulation speed
+
+import gc
+import sys
+import time
+import timeit
+import tracemalloc
+from LogitCalculator import Model, x_test
+import ChipsClocked as IC
+import ChipsAsync as asyncIC
+
+# Every pins / chip / clock object reachable from the model (the same walk Netlist does)
+def simObjects(model):
+    return asyncIC.reachable(list(model.__dict__.values()))
+
+# Bytes of the object itself plus its __dict__ (if it has one), not what it points to
+def objectSize(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+def memory():
+    gc.collect()
+    tracemalloc.start()
+    model = Model()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects = simObjects(model)
+    # The EEPROM contents are the same either way, leave them out of the per-object numbers
+    eeprom_data = sum(sys.getsizeof(obj.data) for obj in objects if isinstance(obj, asyncIC.EEPROM))
+    return {
+        'objects': len(objects),
+        'with_dict': sum(1 for obj in objects if hasattr(obj, '__dict__')),
+        'object_bytes': sum(objectSize(obj) for obj in objects),
+        'model_kb': (current - eeprom_data) / 1024,
+        'peak_kb': peak / 1024,
+    }
+
+# Bytes per gate of a chain of 'length' XOR gates (a large netlist: output pins, callbacks and all)
+def chainMemory(length=10000):
+    gc.collect()
+    tracemalloc.start()
+    start = asyncIC.pins(8, name='IN')
+    chain = [start]
+    for i in range(length):
+        gate = asyncIC.XOR(8, name=f'XOR{i}')
+        gate.wire(chain[-1], start)
+        chain.append(gate.output)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / length
+
+# Nanoseconds per attribute read / write
+def attributeAccess(number=1_000_000):
+    pin = asyncIC.pins(8, name='PIN')
+    gate = asyncIC.AND(8, name='GATE')
+    gate.wire(pin, pin)
+    flip_flop = IC.FlipFlop(8, name='FF')
+    return {
+        'pin.raw': timeit.timeit('pin.raw', globals=locals(), number=number) / number * 1e9,
+        'pin._raw': timeit.timeit('pin._raw', globals=locals(), number=number) / number * 1e9,
+        'gate.a.raw': timeit.timeit('gate.a.raw', globals=locals(), number=number) / number * 1e9,
+        'flip_flop._i_val = 1': timeit.timeit('flip_flop._i_val = 1', globals=locals(), number=number) / number * 1e9,
+    }
+
+# Seconds per node of the first layer (784 weights) in the object simulator, every pulse simulated
+def nodeTime(nodes=3):
+    model = Model()
+    model.bar = False
+    model.INPUT1_EEPROM.fill(list(x_test[0]))
+    start = time.perf_counter()
+    for _ in range(nodes):
+        model.nodeMult()
+    return (time.perf_counter() - start) / nodes
+
+if __name__ == "__main__":
+    mem = memory()
+    print(f"{mem['objects']} sim objects, {mem['with_dict']} with a __dict__, {mem['object_bytes'] / 1024:.1f} kB of objects")
+    print(f"Model() allocates {mem['model_kb']:.1f} kB without the EEPROM contents (peak {mem['peak_kb']:.1f} kB)")
+    print(f"{chainMemory():.0f} bytes per wired gate in a 10000 gate chain")
+    for name, ns in attributeAccess().items():
+        print(f"{name:<22} {ns:6.1f} ns")
+    print(f"{nodeTime() * 1000:.0f} ms per node (784 pulses)")
@@ -1,104 +0,0 @@
-x_test = [[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11000000, 0b11111111, 0b00011111, 0b00000000, 0b11000000, 0b11111111, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11111110, 0b00000001, 0b00000000, 0b11110000, 0b00011111, 0b00000000, 0b00000000, 0b10000111, 0b00000011, 0b00000000, 0b00110000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00111100, 0b00000000, 0b11111111, 0b11111111, 0b00000011, 0b11110000, 0b11111111, 0b00001111, 0b00000000, 0b11100000, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b10000000, 0b00011111, 0b00000000, 0b00000000, 0b11111100, 0b00000111, 0b00000000, 0b11100000, 0b11111111, 0b00000000, 0b00000000, 0b01111110, 0b00001110, 0b00000000, 0b11110000, 0b11000011, 0b00000001, 0b00000000, 0b00001111, 0b00111000, 0b00000000, 0b01110000, 0b10000000, 0b00000011, 0b00000000, 0b00000011, 0b01111000, 0b00000000, 0b00111000, 0b10000000, 0b00000011, 0b10000000, 0b00000011, 0b00111100, 0b00000000, 0b00111000, 0b11110000, 0b00000001, 0b10000000, 0b10000011, 0b00011111, 0b00000000, 0b00111000, 0b11111111, 0b00000000, 0b00000000, 0b11111111, 0b00001111, 0b00000000, 0b11110000, 0b00111111, 0b00000000, 0b00000000, 0b11111110, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00000000, 0b00000000, 0b00000000, 0b00001000, 0b00011000, 0b00000000, 0b11000000, 0b00000000, 0b00000001, 0b00000000, 0b00001100, 0b00010000, 0b00000000, 0b01100000, 0b10000000, 0b00000001, 0b00000000, 0b00000011, 0b00011000, 0b00000000, 0b00110000, 0b11000000, 0b00000001, 0b10000000, 0b00000001, 0b00001100, 0b00000000, 0b00011000, 0b11100000, 0b00000000, 0b10000000, 0b00000001, 0b00001110, 0b00000000, 0b00011000, 0b01100000, 0b00000000, 0b10000000, 0b11000011, 0b00000111, 0b00000000, 0b11110000, 0b01111111, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b01100000, 0b00000000, 0b01110000, 0b00000000, 0b00000011, 0b00000000, 0b00000011, 0b00110000, 0b00000000, 0b00011000, 0b10000000, 0b00000001, 0b11000000, 0b00000001, 0b00011000, 0b00000000, 0b00011100, 0b11100000, 0b00000000, 0b11000000, 0b10000111, 0b00001111, 0b00000000, 0b11111000, 0b01111111, 0b00000000, 0b00000000, 0b01111110, 0b00000111, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000110, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b11100000, 0b00001111, 0b00000000, 0b00000000, 0b11111110, 0b00000001, 0b00000000, 0b01100000, 0b00111100, 0b00000000, 0b00000000, 0b11000010, 0b00000011, 0b00000000, 0b01110000, 0b00111100, 0b00000000, 0b00000000, 0b11100110, 0b00000011, 0b00000000, 0b11100000, 0b01110111, 0b00000000, 0b00000000, 0b00111100, 0b00000111, 0b00000000, 0b10000000, 0b11100001, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b11110000, 0b00011111, 0b00000000, 0b11100000, 0b11111111, 0b00000001, 0b00000000, 0b11111110, 0b00011111, 0b00000000, 0b11100010, 0b00000001, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b01111110, 0b00000000, 0b00000000, 0b11100000, 0b11111111, 0b00000111, 0b00000000, 0b11111000, 0b01111111, 0b00000000, 0b00000000, 0b11111000, 0b00001111, 0b00000000, 0b00000000, 0b11110111, 0b00000000, 0b00000000, 0b11110000, 0b00001111, 0b00000000, 0b00000000, 0b01111111, 0b00000000, 0b00000000, 0b11100000, 0b00000011, 0b00000000, 0b00000000, 0b00001000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11110000, 0b00111111, 0b00000000, 0b11000000, 0b11111111, 0b00000011, 0b00000000, 0b00111111, 0b01111010, 0b00000000, 0b11110000, 0b00100000, 0b00000111, 0b10000000, 0b00000011, 0b01111100, 0b00000000, 0b10111000, 0b11111111, 0b00000011, 0b10000000, 0b11111111, 0b00011111, 0b00000000, 0b11100000, 0b11111111, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00000000, 0b00000000, 0b11000000, 0b11111111, 0b00000000, 0b00000000, 0b11111110, 0b00011111, 0b00000000, 0b11100000, 0b11000000, 0b00000011, 0b00000000, 0b00000110, 0b00111000, 0b00000000, 0b01100000, 0b00000000, 0b00000111, 0b00000000, 0b00000011, 0b01110000, 0b00000000, 0b00110000, 0b00000000, 0b00000110, 0b00000000, 0b00000011, 0b01100000, 0b00000000, 0b00011000, 0b00000000, 0b00000110, 0b10000000, 0b00000001, 0b01100000, 0b00000000, 0b00011000, 0b00000000, 0b00000110, 0b10000000, 0b00000001, 0b01110000, 0b00000000, 0b00011000, 0b00000000, 0b00000011, 0b10000000, 0b00000001, 0b00111000, 0b00000000, 0b00011000, 0b11000000, 0b00000001, 0b10000000, 0b00000001, 0b00001111, 0b00000000, 0b11111000, 0b11111111, 0b00000000, 0b00000000, 0b11111111, 0b00000011, 0b00000000, 0b11100000, 0b00001111, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00111111, 0b00000000, 0b00110000, 0b11111000, 0b00000111, 0b00000000, 0b11100011, 0b01100011, 0b00000000, 0b00011000, 0b00001111, 0b00000110, 0b10000000, 0b01110001, 0b01100000, 0b00000000, 0b10011000, 0b00000011, 0b00000110, 0b10000000, 0b00111001, 0b01100000, 0b00000000, 0b00011000, 0b00000011, 0b00000011, 0b10000000, 0b11100001, 0b00011000, 0b00000000, 0b00111000, 0b11100000, 0b00000000, 0b00000000, 0b11000111, 0b00000111, 0b00000000, 0b11100000, 0b00111111, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11110000, 0b00011111, 0b00000000, 0b10000000, 0b10000011, 0b00000001, 0b00000000, 0b00011100, 0b00011100, 0b00000000, 0b11100000, 0b11000000, 0b00000000, 0b00000000, 0b00000111, 0b00001110, 0b00000000, 0b01110000, 0b01110000, 0b00000000, 0b00000000, 0b10000111, 0b00000111, 0b00000000, 0b11110000, 0b01111111, 0b00000000, 0b00000000, 0b01111110, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b11110000, 0b00001111, 0b00000000, 0b10000000, 0b11111111, 0b00000000, 0b00000000, 0b00111100, 0b00001111, 0b00000000, 0b11100000, 0b11000001, 0b00000001, 0b00000000, 0b00001110, 0b00111100, 0b00000000, 0b11110000, 0b10000000, 0b00000011, 0b00000000, 0b00000111, 0b00110000, 0b00000000, 0b01110000, 0b00000000, 0b00000011, 0b00000000, 0b00000011, 0b00110000, 0b00000000, 0b00111000, 0b00000000, 0b00000011, 0b10000000, 0b00000011, 0b00110000, 0b00000000, 0b00111000, 0b00000000, 0b00000011, 0b10000000, 0b00000011, 0b00011000, 0b00000000, 0b01110000, 0b10000000, 0b00000001, 0b00000000, 0b00000110, 0b00011100, 0b00000000, 0b01100000, 0b11000000, 0b00000000, 0b00000000, 0b00011100, 0b00001110, 0b00000000, 0b10000000, 0b01111011, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11100000, 0b00001111, 0b00000000, 0b11100000, 0b00011111, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b11100000, 0b00001111, 0b00000000, 0b00000000, 0b11001111, 0b00000011, 0b00000000, 0b00110000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00110000, 0b10000000, 0b00000011, 0b00000000, 0b11111111, 0b00011111, 0b00000000, 0b11100000, 0b00011111, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b11000000, 0b00011111, 0b00000000, 0b00000000, 0b00001110, 0b00000011, 0b00000000, 0b01110000, 0b10000000, 0b00000001, 0b00000000, 0b00000011, 0b00011100, 0b00000000, 0b00111000, 0b11000000, 0b00000001, 0b10000000, 0b00000001, 0b00001100, 0b00000000, 0b00011000, 0b11100000, 0b00000000, 0b10000000, 0b00000001, 0b00001110, 0b00000000, 0b00011000, 0b01110000, 0b00000000, 0b00000000, 0b11110111, 0b00000111, 0b00000000, 0b11100000, 0b01110111, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11111110, 0b00000001, 0b00000000, 0b11100000, 0b11111111, 0b00000001, 0b00000000, 0b11000100, 0b11111111, 0b00000001, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b11111100, 0b00000000, 0b00000000, 0b11100000, 0b00011111, 0b00000000, 0b00000000, 0b10011100, 0b00000111, 0b00000000, 0b11100000, 0b11110000, 0b00000000, 0b00000000, 0b00000110, 0b00011110, 0b00000000, 0b01100000, 0b11000000, 0b00000001, 0b00000000, 0b01000110, 0b00011100, 0b00000000, 0b01000000, 0b11111110, 0b00000011, 0b00000000, 0b11100000, 0b11111111, 0b00000000, 0b00000000, 0b11111100, 0b00111111, 0b00000000, 0b00000000, 0b11000000, 0b00000111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b01100000, 0b00000000, 0b00001110, 0b00000000, 0b00001110, 0b11000000, 0b00000001, 0b11000000, 0b00000000, 0b00011100, 0b00000000, 0b00111100, 0b11110000, 0b00000001, 0b10000000, 0b11111111, 0b00001111, 0b00000000, 0b11100000, 0b00111111, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000100, 0b00000100, 0b00000000, 0b01000000, 0b01000000, 0b00000000, 0b00000000, 0b00000110, 0b00000110, 0b00000000, 0b01100000, 0b01100000, 0b00000000, 0b00000000, 0b00000010, 0b00000110, 0b00000000, 0b00100000, 0b00100000, 0b00000000, 0b00000000, 0b11111011, 0b00000011, 0b00000000, 0b11110000, 0b01111111, 0b00000000, 0b00000000, 0b00000011, 0b00001111, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b11100000, 0b00111111, 0b00000000, 0b10000000, 0b11111111, 0b00000011, 0b00000000, 0b00111100, 0b00011111, 0b00000000, 0b11100000, 0b11111001, 0b00000001, 0b00000000, 0b11101110, 0b00001111, 0b00000000, 0b11110000, 0b01111111, 0b00000000, 0b00000000, 0b00111111, 0b00000111, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b11100000, 0b00111111, 0b00000000, 0b00000000, 0b11111110, 0b00000111, 0b00000000, 0b11100000, 0b11100001, 0b00000000, 0b00000000, 0b00001110, 0b00001100, 0b00000000, 0b11000000, 0b11000000, 0b00000000, 0b00000000, 0b00001100, 0b00001100, 0b00000000, 0b11000000, 0b11100001, 0b00000000, 0b00000000, 0b00111000, 0b00001111, 0b00000000, 0b00000000, 0b00111111, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b10000000, 0b00000000, 0b10000000, 0b00000001, 0b00011111, 0b00000000, 0b00011000, 0b00111000, 0b00000011, 0b10000000, 0b10000001, 0b00110001, 0b00000000, 0b00011000, 0b00001100, 0b00000011, 0b10000000, 0b11000001, 0b00110000, 0b00000000, 0b00110000, 0b00000110, 0b00000011, 0b00000000, 0b01100011, 0b00010000, 0b00000000, 0b11100000, 0b10000110, 0b00000001, 0b00000000, 0b01111100, 0b00001110, 0b00000000, 0b10000000, 0b01111111, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11100000, 0b00001111, 0b00000000, 0b11000000, 0b11001111, 0b00000001, 0b10000000, 0b00011111, 0b00001000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00011111, 0b00000000, 0b00000000, 0b11111100, 0b00000111, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b01111110, 0b00000000, 0b00000000, 0b11111000, 0b00000001, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00000000, 0b00000000, 0b00000000, 0b00001000, 0b00000000, 0b00000000, 0b11000000, 0b00010000, 0b00000000, 0b00000000, 0b00000100, 0b00000011, 0b00000000, 0b00100000, 0b00100000, 0b00000000, 0b00000000, 0b00000010, 0b00000010, 0b00000000, 0b00100000, 0b00110000, 0b00000000, 0b00000000, 0b00000001, 0b00000011, 0b00000000, 0b00010000, 0b00110000, 0b00000000, 0b10000000, 0b00000001, 0b00000011, 0b00000000, 0b00111000, 0b00100000, 0b00000000, 0b00000000, 0b11111110, 0b00001111, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00000000, 0b00000000, 0b00000000, 0b11111100, 0b00000001, 0b00000000, 0b11000000, 0b00111111, 0b00000000, 0b11100000, 0b11111100, 0b00000011, 0b00000000, 0b10011111, 0b01111111, 0b00000000, 0b11111000, 0b11110001, 0b00000111, 0b11000000, 0b00011111, 0b11110000, 0b00000000, 0b11111100, 0b00000001, 0b00001110, 0b11000000, 0b00001111, 0b11100000, 0b00000000, 0b11111110, 0b00000000, 0b00001111, 0b11100000, 0b00000111, 0b11110000, 0b00000000, 0b00111110, 0b11000000, 0b00001111, 0b11100000, 0b00000011, 0b01111111, 0b00000000, 0b00111110, 0b11111110, 0b00000011, 0b11100000, 0b11111111, 0b00111111, 0b00000000, 0b11111100, 0b11111111, 0b00000001, 0b11000000, 0b11111111, 0b00000111, 0b00000000, 0b11111000, 0b00111111, 0b00000000, 0b00000000, 0b11111111, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11110000, 0b00000011, 0b00000000, 0b11000100, 0b01111111, 0b00000000, 0b11100000, 0b00000111, 0b00000111, 0b00000000, 0b00011110, 0b11100000, 0b00000000, 0b00100000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00001000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00110000, 0b00011000, 0b00000000, 0b10000000, 0b10000001, 0b00000001, 0b00000000, 0b00011000, 0b00011000, 0b00000000, 0b11000000, 0b11000001, 0b00000000, 0b00000000, 0b00001100, 0b00001100, 0b00000000, 0b01100000, 0b11000000, 0b00000000, 0b00000000, 0b00000111, 0b00001100, 0b00000000, 0b00111000, 0b11000000, 0b00000000, 0b10000000, 0b00001111, 0b00001110, 0b00000000, 0b11111000, 0b11111111, 0b00000000, 0b00000000, 0b11111111, 0b00000111, 0b00000000, 0b00000000, 0b01110110, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11000000, 0b00111111, 0b00000000, 0b00000000, 0b11111100, 0b00000111, 0b00000000, 0b11000000, 0b11111111, 0b00000000, 0b00000000, 0b11110000, 0b00001111, 0b00000000, 0b10000000, 0b11110011, 0b00000001, 0b00000000, 0b00011100, 0b00011110, 0b00000000, 0b11000000, 0b11000000, 0b00000001, 0b00000000, 0b00001100, 0b00111100, 0b00000000, 0b01100000, 0b10000000, 0b00000011, 0b00000000, 0b00000111, 0b00111000, 0b00000000, 0b00110000, 0b10000000, 0b00000011, 0b00000000, 0b00000011, 0b00111000, 0b00000000, 0b00110000, 0b10000000, 0b00000001, 0b00000000, 0b00000111, 0b00011000, 0b00000000, 0b01110000, 0b11000000, 0b00000001, 0b00000000, 0b00001111, 0b00001110, 0b00000000, 0b11110000, 0b01111111, 0b00000000, 0b00000000, 0b11111110, 0b00000011, 0b00000000, 0b11000000, 0b00011111, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11111110, 0b00000000, 0b00000000, 0b11111000, 0b00011111, 0b00000000, 0b10000000, 0b11110111, 0b00000011, 0b00000000, 0b00010000, 0b00011100, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b10000000, 0b00011111, 0b00000000, 0b00000000, 0b11100000, 0b00000111, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b01111110, 0b00000000, 0b00000000, 0b11110000, 0b00000011, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11100000, 0b00000011, 0b00000000, 0b10000000, 0b11111111, 0b00000000, 0b00000000, 0b11111000, 0b00001100, 0b00000000, 0b10000000, 0b11000001, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b11100000, 0b00001111, 0b00000000, 0b00000000, 0b11111110, 0b00000011, 0b00000000, 0b11100000, 0b01111000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b11100000, 0b00001111, 0b00000000, 0b11000000, 0b00111111, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b10000000, 0b00000001, 0b10000000, 0b00000000, 0b00011000, 0b00000000, 0b00001100, 0b11000000, 0b00000001, 0b11000000, 0b00000000, 0b00001100, 0b00000000, 0b00001100, 0b11000000, 0b00000000, 0b11100000, 0b00000000, 0b00001100, 0b00000000, 0b00000111, 0b11100000, 0b00000000, 0b01110000, 0b00000000, 0b00001110, 0b10000000, 0b00000011, 0b01100000, 0b00000000, 0b00111000, 0b00000000, 0b00000110, 0b11000000, 0b00000001, 0b01100000, 0b00000000, 0b11111110, 0b00111111, 0b00000110, 0b11100000, 0b11111111, 0b00111111, 0b00000000, 0b11111100, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00111000, 0b00000000, 0b11110000, 0b11111111, 0b00000011, 0b00000000, 0b11111110, 0b00111111, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11100000, 0b00000011, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11000000, 0b00001111, 0b00000000, 0b10000000, 0b11111111, 0b00000011, 0b00000000, 0b01111100, 0b00110000, 0b00000000, 0b11100000, 0b00000000, 0b00000011, 0b00000000, 0b00000111, 0b00110000, 0b00000000, 0b00011000, 0b00000000, 0b00000011, 0b10000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b11110000, 0b00011111, 0b00000100, 0b11000000, 0b11111111, 0b00101111, 0b00000000, 0b11111110, 0b11110000, 0b00000011, 0b11100000, 0b00000111, 0b00001100, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10011000, 0b01111111, 0b00000000, 0b11000000, 0b11111111, 0b00001111, 0b00000000, 0b01111110, 0b11000000, 0b00000000, 0b11110000, 0b00000000, 0b00001100, 0b10000000, 0b00000111, 0b11000000, 0b00000000, 0b00011000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00011111, 0b00000000, 0b00000000, 0b11111110, 0b00000001, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11111000, 0b00000001, 0b00000000, 0b11100000, 0b00011000, 0b00000000, 0b00000000, 0b10000011, 0b00000001, 0b00000000, 0b00000000, 0b00001000, 0b00000000, 0b00000000, 0b10000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b10000000, 0b00000000, 0b10000000, 0b00000001, 0b00001110, 0b00000000, 0b00001100, 0b00111100, 0b00000000, 0b01100000, 0b11110000, 0b00000000, 0b00000000, 0b11000110, 0b00000011, 0b00000000, 0b10110000, 0b00001111, 0b00000000, 0b00000000, 0b00111111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11100000, 0b00000011, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11111110, 0b00000011, 0b00000000, 0b11111000, 0b00110011, 0b00000000, 0b10000000, 0b00000011, 0b00000010, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b11111100, 0b00000000, 0b00000000, 0b11000000, 0b00011111, 0b00000000, 0b00000000, 0b10001100, 0b00000001, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000000, 0b00000000, 0b00000000, 0b00001000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00001100, 0b00000000, 0b01110000, 0b11000000, 0b00000000, 0b00000000, 0b00000011, 0b00001110, 0b00000000, 0b00110000, 0b11100000, 0b00000000, 0b00000000, 0b00000011, 0b00001111, 0b00000000, 0b00110000, 0b01111000, 0b00000000, 0b10000000, 0b10000011, 0b00000111, 0b00000000, 0b00111000, 0b01111100, 0b00000000, 0b00000000, 0b11100011, 0b00000111, 0b00000000, 0b01110000, 0b00111111, 0b00000000, 0b00000000, 0b11111110, 0b00000011, 0b00000000, 0b10000000, 0b00111001, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00001100, 0b00000000, 0b11111000, 0b11111111, 0b00000000, 0b11100000, 0b00000111, 0b00011000, 0b10000000, 0b00001111, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11100000, 0b00000011, 0b00000000, 0b00000000, 0b01111111, 0b00000000, 0b00000000, 0b00010000, 0b00000111, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11110000, 0b00000011, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b10000000, 0b00001111, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b11110000, 0b00011111, 0b00000000, 0b00000000, 0b00000001, 0b00000010, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b11111000, 0b00000001, 0b00000000, 0b10000000, 0b00111111, 0b00000000, 0b00000000, 0b00011100, 0b00000110, 0b00000000, 0b11100000, 0b01100000, 0b00000000, 0b00000000, 0b00000100, 0b00000100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000010, 0b00000110, 0b00000000, 0b00110000, 0b01100000, 0b00000000, 0b00000000, 0b00000001, 0b00000111, 0b00000000, 0b00010000, 0b00111000, 0b00000000, 0b00000000, 0b11100011, 0b00000001, 0b00000000, 0b11100000, 0b00000111, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00001111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b00100000, 0b00000110, 0b00000000, 0b00000000, 0b10000000, 0b00000000, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b11100000, 0b00010011, 0b00000000, 0b00000000, 0b11000011, 0b00000001, 0b00000000, 0b00010000, 0b00011000, 0b00000000, 0b00000000, 0b11000001, 0b00000011, 0b00000000, 0b00010000, 0b01100110, 0b00000000, 0b00000000, 0b00111111, 0b00011100, 0b00000000, 0b01100000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00001000, 0b00011000, 0b00000000, 0b11000000, 0b11000001, 0b00000001, 0b00000000, 0b00011110, 0b00011110, 0b00000000, 0b11110000, 0b11100001, 0b00000011, 0b00000000, 0b00001111, 0b00011110, 0b00000000, 0b11111000, 0b11110000, 0b00000001, 0b10000000, 0b11001111, 0b00011111, 0b00000000, 0b11111100, 0b11111111, 0b00000000, 0b10000000, 0b11111111, 0b00001111, 0b00000000, 0b11111000, 0b11111111, 0b00000000, 0b10000000, 0b11111111, 0b00001111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b10000000, 0b00001111, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b11000000, 0b00000111, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000100, 0b00000000, 0b00011000, 0b11000000, 0b00000000, 0b10000000, 0b00000001, 0b00001100, 0b00000000, 0b00011000, 0b11000000, 0b00000000, 0b10000000, 0b00000001, 0b00001100, 0b00000000, 0b00011000, 0b11000000, 0b00000100, 0b10000000, 0b00000001, 0b01101100, 0b00000000, 0b00011000, 0b11100000, 0b00000011, 0b10000000, 0b00000001, 0b00011110, 0b00000000, 0b01111000, 0b11111100, 0b00000000, 0b00000000, 0b11111111, 0b00001111, 0b00000000, 0b11100000, 0b11101111, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b10001100, 0b00000111, 0b00000000, 0b11000000, 0b11111100, 0b00000000, 0b00000000, 0b00001110, 0b00001110, 0b00000000, 0b01100000, 0b11100000, 0b00000000, 0b00000000, 0b00001110, 0b00001110, 0b00000000, 0b11100000, 0b01100000, 0b00000000, 0b00000000, 0b10111110, 0b00000111, 0b00000000, 0b10000000, 0b00111111, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b11111111, 0b00000000, 0b00000000, 0b11111111, 0b00111111, 0b00000000, 0b11110000, 0b11111111, 0b00000111, 0b00000000, 0b00111110, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11111000, 0b00000011, 0b00000000, 0b11110000, 0b11111111, 0b00000000, 0b00000000, 0b11111111, 0b01111111, 0b00000000, 0b11110000, 0b11000000, 0b00000111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b01100000, 0b00000000, 0b00000111, 0b00000000, 0b00111110, 0b01111111, 0b00000000, 0b11100000, 0b11111111, 0b00000011, 0b00000000, 0b11111000, 0b00011111, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b11000000, 0b00000111, 0b00000000, 0b11110000, 0b00001111, 0b00000000, 0b10000000, 0b00011111, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b11100011, 0b00000000, 0b00000000, 0b11110000, 0b00111111, 0b00000000, 0b10000000, 0b00001111, 0b00000111, 0b00000000, 0b00010000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11111000, 0b00000001, 0b00000000, 0b11111100, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b00000000, 0b11110001, 0b00000111, 0b00000000, 0b11110000, 0b11000001, 0b00000000, 0b00000000, 0b00000111, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00100000, 0b11000000, 0b00000001, 0b00000000, 0b00000100, 0b00001111, 0b00000000, 0b11000000, 0b00011111, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b11111000, 0b00000111, 0b11000000, 0b11000001, 0b11111111, 0b00000001, 0b00011100, 0b00011110, 0b00111000, 0b11000000, 0b11100001, 0b00000000, 0b00000011, 0b00011100, 0b00001110, 0b00110000, 0b11000000, 0b11100001, 0b00000001, 0b00000001, 0b00111000, 0b00111000, 0b00011000, 0b10000000, 0b00000111, 0b10000111, 0b00000001, 0b11110000, 0b11100000, 0b00001101, 0b00000000, 0b00111110, 0b01111000, 0b00000000, 0b11000000, 0b11111111, 0b00000001, 0b00000000, 0b11100000, 0b00000111, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11110000, 0b00000011, 0b00000000, 0b00000000, 0b11101111, 0b00000000, 0b00000000, 0b00111000, 0b00001110, 0b00000000, 0b11000000, 0b11000011, 0b00000000, 0b00000000, 0b00111100, 0b00011100, 0b00000000, 0b11000000, 0b10000001, 0b00000001, 0b00000000, 0b00011100, 0b00011000, 0b00000000, 0b11000000, 0b10000001, 0b00000001, 0b00000000, 0b00011110, 0b00011000, 0b00000000, 0b11100000, 0b10000001, 0b00000001, 0b00000000, 0b00001110, 0b00011000, 0b00000000, 0b11100000, 0b10000000, 0b00000001, 0b00000000, 0b00000110, 0b00001100, 0b00000000, 0b01100000, 0b11000000, 0b00000000, 0b00000000, 0b00001110, 0b00001110, 0b00000000, 0b11100000, 0b01110000, 0b00000000, 0b00000000, 0b11111100, 0b00000011, 0b00000000, 0b11000000, 0b00011111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00110000, 0b00000000, 0b01110000, 0b00000000, 0b00000111, 0b00000000, 0b00000111, 0b00111000, 0b00000000, 0b01110000, 0b10000000, 0b00000011, 0b00000000, 0b00000111, 0b00111000, 0b00000000, 0b01111000, 0b10000000, 0b00000001, 0b10000000, 0b00000011, 0b00011000, 0b00000000, 0b00111000, 0b11000000, 0b00000001, 0b10000000, 0b01111111, 0b00011110, 0b00000000, 0b11111000, 0b11111111, 0b00000001, 0b10000000, 0b11111111, 0b00011111, 0b00000000, 0b00110000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b11110000, 0b00001111, 0b00000000, 0b11000000, 0b11101111, 0b00000000, 0b00000000, 0b00011110, 0b00001100, 0b00000000, 0b01110000, 0b11000000, 0b00000001, 0b10000000, 0b00000011, 0b00011100, 0b00000000, 0b00011100, 0b11100000, 0b00000001, 0b11000000, 0b11000001, 0b00011111, 0b00000000, 0b11111000, 0b11111111, 0b00000000, 0b00000000, 0b01111111, 0b00001110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b11111000, 0b00000011, 0b00000000, 0b11000000, 0b00000111, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00001111, 0b00000000, 0b00000000, 0b11111100, 0b01111111, 0b00000000, 0b10000000, 0b11111111, 0b00011111, 0b00000000, 0b11000000, 0b11111111, 0b00000111, 0b00000000, 0b00000000, 0b11111100, 0b00000000, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b11000000, 0b00000111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11100000, 0b00011111, 0b00000000, 0b10000000, 0b11111111, 0b00000111, 0b00000000, 0b00111100, 0b11110000, 0b00000000, 0b11100000, 0b00000001, 0b00001110, 0b00000000, 0b00001110, 0b11100000, 0b00000000, 0b11000000, 0b00000000, 0b00001111, 0b00000000, 0b00011100, 0b01111100, 0b00000000, 0b10000000, 0b11100011, 0b00000011, 0b00000000, 0b11110000, 0b00001111, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11111110, 0b00000000, 0b00000000, 0b11111100, 0b00011100, 0b00000000, 0b11110000, 0b11000011, 0b00000001, 0b00000000, 0b10011111, 0b00011111, 0b00000000, 0b11100000, 0b11111111, 0b00000000, 0b00000000, 0b11110000, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11111100, 0b00000000, 0b00000000, 0b01000000, 0b01111110, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000001, 0b00000000, 0b01100000, 0b00110000, 0b00000000, 0b00000000, 0b00000100, 0b00000001, 0b00000000, 0b11000000, 0b00011000, 0b00000000, 0b00000000, 0b10011000, 0b00000001, 0b00000000, 0b10000000, 0b00011111, 0b00000000, 0b00000000, 0b10100000, 0b00000001, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11100000, 0b00000011, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b11100000, 0b01111011, 0b00000000, 0b00000000, 0b11111110, 0b00000001, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00001000, 0b00011110, 0b00000000, 0b11000000, 0b11110000, 0b00000001, 0b00000000, 0b11111100, 0b00000011, 0b00000000, 0b11000000, 0b00001111, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11111110, 0b00100111, 0b00000000, 0b11100000, 0b11111111, 0b01111111, 0b00000000, 0b00000000, 0b11111111, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b11111110, 0b00001111, 0b00000000, 0b11100000, 0b11111111, 0b00000111, 0b00000000, 0b11111000, 0b01111111, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00010000, 0b00000011, 0b00000000, 0b00000000, 0b00110001, 0b00000000, 0b00000000, 0b00010000, 0b00000011, 0b00000000, 0b10000000, 0b00110001, 0b00000000, 0b00000000, 0b00011000, 0b00000011, 0b00000000, 0b11000000, 0b00110011, 0b00000000, 0b00000000, 0b11111100, 0b00000011, 0b00000000, 0b11000000, 0b00110001, 0b00000000, 0b00000000, 0b00000100, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00111000, 0b00000000, 0b00110000, 0b11100000, 0b00000011, 0b00000000, 0b00000011, 0b00110111, 0b00000000, 0b00010000, 0b00111000, 0b00000011, 0b10000000, 0b10000001, 0b00110001, 0b00000000, 0b00011000, 0b00001100, 0b00000011, 0b10000000, 0b11000001, 0b00110000, 0b00000000, 0b00001000, 0b10001100, 0b00000001, 0b10000000, 0b01000001, 0b00011000, 0b00000000, 0b00011000, 0b11000100, 0b00000000, 0b00000000, 0b11000011, 0b00000110, 0b00000000, 0b01110000, 0b00111100, 0b00000000, 0b00000000, 0b11111110, 0b00000011, 0b00000000, 0b11000000, 0b00011111, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00110000, 0b10000000, 0b00000001, 0b10000000, 0b00000001, 0b00001100, 0b00000000, 0b00001110, 0b11100000, 0b00000000, 0b01100000, 0b00000000, 0b00001110, 0b00000000, 0b00000110, 0b01100000, 0b00000000, 0b11100000, 0b00000000, 0b00000110, 0b00000000, 0b00011110, 0b01111000, 0b00000000, 0b11000000, 0b11111111, 0b00000111, 0b00000000, 0b11111000, 0b00111111, 0b00000000, 0b00000000, 0b00000010, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11100000, 0b00011111, 0b00000000, 0b00000000, 0b11111111, 0b00000011, 0b00000000, 0b11111000, 0b01111111, 0b00000000, 0b00000000, 0b11001111, 0b00001111, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b11100000, 0b00000111, 0b00000000, 0b10000000, 0b01111111, 0b00000000, 0b00000000, 0b11111000, 0b00000011, 0b00000000, 0b11100000, 0b00011111, 0b00000000, 0b00000000, 0b11111110, 0b00000011, 0b00000000, 0b11100000, 0b01111111, 0b00000000, 0b00000000, 0b11111100, 0b00001111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b10011100, 0b00001111, 0b00000000, 0b11100000, 0b01111111, 0b00000000, 0b00000000, 0b11111100, 0b00000111, 0b00000000, 0b11000000, 0b00011111, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b11000000, 0b11111111, 0b00000011, 0b00000000, 0b11111110, 0b01111111, 0b00000000, 0b11110000, 0b00000110, 0b00001110, 0b10000000, 0b00000011, 0b11000000, 0b00000000, 0b00011000, 0b00000000, 0b00011000, 0b11000000, 0b00000000, 0b10000000, 0b00000001, 0b00001110, 0b00000000, 0b00011000, 0b01100000, 0b00000000, 0b10000000, 0b00000001, 0b00000110, 0b00000000, 0b00011100, 0b01100000, 0b00000000, 0b11000000, 0b00000001, 0b00000110, 0b00000000, 0b00001110, 0b11100000, 0b00000000, 0b01111000, 0b00000000, 0b01111100, 0b11111110, 0b00000011, 0b10000000, 0b11111111, 0b00000111, 0b00000000, 0b11100000, 0b00001111, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11111100, 0b11111111, 0b00000001, 0b11000000, 0b11111111, 0b11111111, 0b00000000, 0b00000000, 0b11010000, 0b00011111, 0b00000000, 0b00000000, 0b11100000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b10000000, 0b01111111, 0b00000000, 0b00000000, 0b11111100, 0b00011111, 0b00000000, 0b11100000, 0b11110011, 0b00000011, 0b00000000, 0b00011110, 0b01111100, 0b00000000, 0b11110000, 0b10000000, 0b00000111, 0b10000000, 0b00001111, 0b01110000, 0b00000000, 0b01111000, 0b00000000, 0b00000111, 0b10000000, 0b00000011, 0b01110000, 0b00000000, 0b00111100, 0b00000000, 0b00001111, 0b11000000, 0b00000001, 0b11110000, 0b00000000, 0b00011100, 0b00000000, 0b00001111, 0b11000000, 0b00000011, 0b01110000, 0b00000000, 0b00111100, 0b10000000, 0b00000111, 0b10000000, 0b00000011, 0b01111000, 0b00000000, 0b00111000, 0b11100000, 0b00000111, 0b10000000, 0b11110111, 0b00111111, 0b00000000, 0b11110000, 0b11111111, 0b00000001, 0b00000000, 0b11111111, 0b00000111, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11111111, 0b00000011, 0b00000000, 0b11111000, 0b01111111, 0b00000000, 0b10000000, 0b00001111, 0b00001110, 0b00000000, 0b00110000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00100000, 0b11100000, 0b00000000, 0b10000000, 0b00011111, 0b00000110, 0b00000000, 0b11011100, 0b00111111, 0b00000000, 0b11000000, 0b11100000, 0b00000011, 0b00000000, 0b00001100, 0b01111111, 0b00000000, 0b11000000, 0b01111111, 0b00001110, 0b00000000, 0b11110000, 0b11000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11100000, 0b00001111, 0b00000000, 0b00000000, 0b11111111, 0b00000000, 0b00000000, 0b11111000, 0b00001111, 0b00000000, 0b10000000, 0b11100111, 0b00000001, 0b00000000, 0b00111100, 0b00011110, 0b00000000, 0b10000000, 0b11111011, 0b00000000, 0b00000000, 0b11111000, 0b00001111, 0b00000000, 0b00000000, 0b11111110, 0b00000000, 0b00000000, 0b11000000, 0b00000111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11100000, 0b00000011, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b11000000, 0b00000111, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b11101111, 0b11111111, 0b00000000, 0b11100000, 0b11111111, 0b00000111, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00111100, 0b00000001, 0b00000000, 0b11111100, 0b00011111, 0b00000000, 0b10000000, 0b01111111, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b10011000, 0b00000011, 0b00000000, 0b11000000, 0b00010000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b11000000, 0b00001111, 0b00000000, 0b00000000, 0b11111000, 0b00000001, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00010000, 0b01111000, 0b00000000, 0b00000000, 0b11000011, 0b00000011, 0b00000000, 0b11110000, 0b00001111, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b11111110, 0b00000001, 0b00000000, 0b01111000, 0b01110000, 0b00000000, 0b11000000, 0b00000000, 0b00000110, 0b00000000, 0b00000110, 0b01100000, 0b00000000, 0b01100000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b11111100, 0b11111111, 0b00000001, 0b11000000, 0b11100000, 0b00011110, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b11000000, 0b00000111, 0b00000000, 0b00000000, 0b01001110, 0b00000000, 0b00000000, 0b00110000, 0b00001100, 0b00000000, 0b10000000, 0b11100011, 0b00000000, 0b00000000, 0b11011100, 0b00000111, 0b00000000, 0b11000000, 0b01111111, 0b00000000, 0b00000000, 0b11111100, 0b00000011, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11111000, 0b00000011, 0b00000000, 0b11111110, 0b00111111, 0b00000000, 0b11111100, 0b11111111, 0b00000011, 0b11000000, 0b11111111, 0b00111111, 0b00000000, 0b11111100, 0b11111111, 0b00000011, 0b10000000, 0b00000001, 0b00111110, 0b00000000, 0b00000000, 0b11110000, 0b00000011, 0b00000000, 0b10000000, 0b00011111, 0b00000000, 0b00000000, 0b11111100, 0b00000000, 0b00000000, 0b11100000, 0b00001111, 0b00000000, 0b00000000, 0b00111111, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b11000000, 0b00011111, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b11100000, 0b00000111, 0b00000000, 0b00000000, 0b00111111, 0b00000000, 0b00000000, 0b11111000, 0b00000001, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01000000, 0b00010000, 0b00000000, 0b00000000, 0b11111110, 0b00000011, 0b00000000, 0b11100000, 0b00111111, 0b00000000, 0b00000000, 0b11110110, 0b00000011, 0b00000000, 0b01100000, 0b00110000, 0b00000000, 0b00000000, 0b00000110, 0b00000011, 0b00000000, 0b01100000, 0b01110000, 0b00000000, 0b00000000, 0b00000110, 0b00000111, 0b00000000, 0b01100000, 0b01110000, 0b00000000, 0b00000000, 0b00000100, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11110000, 0b00000011, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01100000, 0b11000000, 0b00000000, 0b00000000, 0b00000110, 0b00001111, 0b00000000, 0b01100000, 0b11111000, 0b00000001, 0b00000000, 0b10000110, 0b00011111, 0b00000000, 0b01100000, 0b10011100, 0b00000001, 0b00000000, 0b11001110, 0b00011000, 0b00000000, 0b11000000, 0b11011101, 0b00000000, 0b00000000, 0b11111100, 0b00001111, 0b00000000, 0b10000000, 0b01111111, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b11110000, 0b00001111, 0b00000000, 0b11100000, 0b11111111, 0b00000000, 0b00000000, 0b01111111, 0b00001110, 0b00000000, 0b11100000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b11111110, 0b00000011, 0b00000000, 0b11110000, 0b01111111, 0b00000000, 0b10000000, 0b11111111, 0b00001111, 0b00000000, 0b11111100, 0b11110111, 0b00000011, 0b11000000, 0b00111111, 0b01111000, 0b00000000, 0b11111100, 0b00000000, 0b00000110, 0b10000000, 0b00000111, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b11111111, 0b00000111, 0b00000000, 0b11100000, 0b11111111, 0b00000000, 0b00000000, 0b00000011, 0b00001110, 0b00000000, 0b00110000, 0b01100000, 0b00000000, 0b10000000, 0b00000001, 0b00000110, 0b00000000, 0b00011000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b10000000, 0b01111001, 0b00000000, 0b00000000, 0b00001110, 0b00000111, 0b00000000, 0b00111100, 0b00111000, 0b00000000, 0b11110000, 0b11100000, 0b00000001, 0b00000000, 0b00000111, 0b00000111, 0b00000000, 0b00111000, 0b00111000, 0b00000000, 0b10000000, 0b11000001, 0b00000001, 0b00000000, 0b01111000, 0b00001110, 0b00000000, 0b00000000, 0b01111111, 0b00000000, 0b00000000, 0b11000000, 0b00001111, 0b00000000, 0b00000000, 0b11111000, 0b00000011, 0b00000000, 0b10000000, 0b11100001, 0b00000000, 0b00000000, 0b00011000, 0b00001100, 0b00000000, 0b10000000, 0b10000001, 0b00000001, 0b00000000, 0b00011000, 0b00001100, 0b00000000, 0b10000000, 0b11000001, 0b00000000, 0b00000000, 0b00110000, 0b00001100, 0b00000000, 0b00000000, 0b01110110, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000001, 0b00111100, 0b00000000, 0b00111000, 0b11000000, 0b00000011, 0b10000000, 0b00000111, 0b00111100, 0b00000000, 0b01111000, 0b11100000, 0b00000001, 0b10000000, 0b00000111, 0b00011110, 0b00000000, 0b01111100, 0b11111000, 0b00000001, 0b11000000, 0b11111111, 0b00001111, 0b00000000, 0b11111100, 0b11111111, 0b00000000, 0b11000000, 0b11111111, 0b00001111, 0b00000000, 0b11111100, 0b01111111, 0b00000000, 0b10000000, 0b10111111, 0b00000111, 0b00000000, 0b01110000, 0b11110000, 0b00000001, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11100000, 0b00000011, 0b00000000, 0b00000000, 0b11111111, 0b00001111, 0b00000000, 0b11110000, 0b11111111, 0b00000000, 0b00000000, 0b11111110, 0b00001111, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b11000000, 0b00000111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11111000, 0b00000111, 0b00000000, 0b11000000, 0b01111111, 0b00000000, 0b00000000, 0b00011110, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b11111110, 0b00000001, 0b00000000, 0b11111000, 0b00111110, 0b00000000, 0b00000000, 0b00000011, 0b10000111, 0b00000000, 0b00000000, 0b01100000, 0b00000110, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b11000000, 0b00001110, 0b00000000, 0b00000000, 0b01110110, 0b00000000, 0b00000000, 0b10110000, 0b00000111, 0b00000000, 0b00000000, 0b00111111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b01011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b10000000, 0b00000001, 0b00000000, 0b00000111, 0b00111100, 0b00000000, 0b01110000, 0b11100000, 0b00000111, 0b00000000, 0b00000111, 0b01101111, 0b00000000, 0b01100000, 0b00111000, 0b00001110, 0b00000000, 0b11000110, 0b11100001, 0b00000000, 0b11100000, 0b00001100, 0b00000110, 0b00000000, 0b11111100, 0b01111000, 0b00000000, 0b10000000, 0b11111111, 0b00000011, 0b00000000, 0b11110000, 0b00001111, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b11000000, 0b00000011, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b11110000, 0b00001111, 0b00000000, 0b11000000, 0b11000111, 0b00000000, 0b00000000, 0b00011100, 0b00001100, 0b00000000, 0b01000000, 0b01100000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11111000, 0b00000011, 0b00000000, 0b10000000, 0b01111111, 0b00000000, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00011000, 0b11000000, 0b00000000, 0b10000000, 0b00000001, 0b00001110, 0b00000000, 0b00011000, 0b01111000, 0b00000000, 0b10000000, 0b11100011, 0b00000011, 0b00000000, 0b11111000, 0b00001111, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11100000, 0b11111000, 0b00000000, 0b00000000, 0b11001110, 0b00001101, 0b00000000, 0b11100000, 0b11001110, 0b00000001, 0b00000000, 0b00111110, 0b00001100, 0b00000000, 0b11000000, 0b11000011, 0b00000000, 0b00000000, 0b00011100, 0b00001100, 0b00000000, 0b10000000, 0b01111111, 0b00000000, 0b00000000, 0b11110000, 0b00000111, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01001100, 0b00000110, 0b00000000, 0b01100000, 0b00110000, 0b00000000, 0b00000000, 0b00000010, 0b00000001, 0b00000000, 0b00100000, 0b00011000, 0b00000000, 0b10000000, 0b11000001, 0b00000000, 0b00000000, 0b00001000, 0b00001110, 0b00000000, 0b01000000, 0b00110000, 0b00000000, 0b00000000, 0b11000100, 0b00000001, 0b00000000, 0b11000000, 0b00011111, 0b00000000, 0b00000000, 0b11001000, 0b00000001, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b00000000, 0b10000000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b11111111, 0b00000001, 0b00000000, 0b11110000, 0b01111111, 0b00000000, 0b00000000, 0b11111100, 0b00000111, 0b00000000, 0b10000000, 0b01111111, 0b00000000, 0b00000000, 0b11111000, 0b00000111, 0b00000000, 0b10000000, 0b00111111, 0b00000000, 0b00000000, 0b11111100, 0b00000111, 0b00000000, 0b10000000, 0b01111111, 0b00000000, 0b00000000, 0b11110000, 0b00000111, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b01111100, 0b00000000, 0b00000000, 0b11110111, 0b00000111, 0b00000000, 0b11110000, 0b00111111, 0b00000000, 0b00000000, 0b11111111, 0b00000011, 0b00000000, 0b11110000, 0b00001111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00000111, 0b00000000, 0b00000000, 0b01111000, 0b00000000, 0b00000000, 0b10000000, 0b00001111, 0b00000000, 0b00000000, 0b11111000, 0b00000000, 0b00000000, 0b10000000, 0b00011111, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b00000000, 0b00011111, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b11100000, 0b00000111, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b11100111, 0b00000011, 0b00000000, 0b00111000, 0b00011111, 0b00000000, 0b11000000, 0b01111001, 0b00000000, 0b00000000, 0b10001110, 0b00000111, 0b00000000, 0b11110000, 0b01111100, 0b00000000, 0b10000000, 0b11000111, 0b00110011, 0b00000000, 0b00111100, 0b10111100, 0b00000011, 0b11000000, 0b11000011, 0b00111111, 0b00000000, 0b11111100, 0b11111111, 0b00000011, 0b11000000, 0b11111111, 0b00011111, 0b00000000, 0b11111100, 0b11111111, 0b00000000, 0b00000000, 0b11111111, 0b00000011, 0b00000000, 0b10000000, 0b00011111, 0b00000000, 0b00000000, 0b11110000, 0b00000001, 0b00000000, 0b00000000, 0b01111111, 0b00000000, 0b00000000, 0b11100000, 0b00000111, 0b00000000, 0b00000000, 0b00111100, 0b00000000, 0b00000000, 0b10000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00111000, 0b00000000, 0b00000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b11100000, 0b00000000, 0b00000000, 0b00000000, 0b00001100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b10000000, 0b00000001, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000001, 0b00000001, 0b00000000, 0b11111000, 0b00111111, 0b00000000, 0b10000000, 0b11111111, 0b00000011, 0b00000000, 0b10110000, 0b00111111, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b00000000, 0b00011110, 0b00000000, 0b00000000, 0b11100000, 0b00000001, 0b00000000, 0b10000000, 0b00001111, 0b00000000, 0b00000000, 0b11111110, 0b11111111, 0b00000111, 0b10000000, 0b11111111, 0b00011111, 0b00000000, 0b11110000, 0b00000111, 0b00000000, 0b00000000, 0b00001111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b10000000, 0b00011111, 0b00000000, 0b00000000, 0b10001110, 0b00000001, 0b00000000, 0b01110000, 0b00010000, 0b00000000, 0b00000000, 0b00000011, 0b00000000, 0b00000000, 0b00011000, 0b00000000, 0b00000000, 0b11000000, 0b00000001, 0b00000000, 0b00000000, 0b00001110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b11111000, 0b00000000, 0b00000000, 0b11110111, 0b00011111, 0b00000000, 0b11100000, 0b11000011, 0b00000001, 0b00000000, 0b00011110, 0b00011100, 0b00000000, 0b11000000, 0b11111111, 0b00000000, 0b00000000, 0b11110000, 0b00000011, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b11110000, 0b00000000, 0b00000000, 0b11100000, 0b00111111, 0b00000000, 0b00000000, 0b11111111, 0b00000011, 0b00000000, 0b11110000, 0b01111000, 0b00000000, 0b10000000, 0b00000111, 0b00000111, 0b00000000, 0b00111000, 0b11100000, 0b00000000, 0b10000000, 0b00000001, 0b00011111, 0b00000000, 0b00011000, 0b11111000, 0b00000001, 0b10000000, 0b11000001, 0b00011111, 0b00000000, 0b00111000, 0b11111111, 0b00000000, 0b10000000, 0b11111111, 0b00001111, 0b00000000, 0b11100000, 0b01100111, 0b00000000, 0b00000000, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000010, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b00000000, 0b00000111, 0b00000000, 0b00000000, 0b01100000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000],
-]
-
-y_test = [7,2,1,0,4,1,4,9,5,9,0,6,9,0,1,5,9,7,3,4,9,6,6,5,4,0,7,4,0,1,3,1,3,4,7,2,7,1,2,1,1,7,4,2,3,5,1,2,4,4,6,3,5,5,6,0,4,1,9,5,7,8,9,3,7,4,6,4,3,0,7,0,2,9,1,7,3,2,9,7,7,6,2,7,8,4,7,3,6,1,3,6,9,3,1,4,1,7,6,9,]
-
@@ -1,531 +0,0 @@
-weights = [
-### LAYER
-[
-[0b11000100, 0b11111100, 0b00011001, 0b01011110, 0b11000101, 0b01110010, 0b01001010, 0b00000101, 0b11000010, 0b00011000, 0b10000001, 0b01010000, 0b11011110, 0b10000000, 0b00101000, 0b00101011, 0b01110001, 0b11010010, 0b11010000, 0b10000111, 0b00111100, 0b00000000, 0b00010010, 0b00111010, 0b00111110, 0b00011111, 0b11010001, 0b11101101, 0b00111001, 0b00110011, 0b10101000, 0b01010000, 0b11010000, 0b11000011, 0b01110001, 0b11000010, 0b00001100, 0b10011110, 0b01111001, 0b10100011, 0b11100011, 0b00010100, 0b01100010, 0b10110110, 0b00000000, 0b11101000, 0b10100001, 0b01111111, 0b00010111, 0b10010101, 0b11100111, 0b11101101, 0b01111000, 0b00101100, 0b01001100, 0b00100010, 0b10001010, 0b11001000, 0b10001000, 0b10010011, 0b11001100, 0b00000001, 0b00001100, 0b01100010, 0b11001000, 0b10011110, 0b10101101, 0b11000101, 0b11111101, 0b11100100, 0b00100100, 0b10110000, 0b01001000, 0b00001010, 0b10001100, 0b10111011, 0b10110010, 0b00011000, 0b01000010, 0b00011100, 0b00110000, 0b10010101, 0b10101101, 0b00100000, 0b10011100, 0b00000101, 0b01101001, 0b10000100, 0b00100110, 0b00110111, 0b01111100, 0b10010100, 0b10101100, 0b10000110, 0b01001000, 0b11110001, 0b11000010, 0b00011001], # Node 0
-[0b00111110, 0b10000110, 0b11010100, 0b00000001, 0b00001100, 0b00101100, 0b00101100, 0b00010011, 0b00101010, 0b01110010, 0b10000110, 0b00000110, 0b10100001, 0b01000100, 0b10001000, 0b11100010, 0b01100101, 0b01111110, 0b10011100, 0b00001001, 0b01000100, 0b00001110, 0b10100100, 0b00110010, 0b11101000, 0b00000011, 0b10011010, 0b10110011, 0b01001100, 0b10110110, 0b01000100, 0b10000001, 0b01100100, 0b10100100, 0b01000001, 0b11101001, 0b01011110, 0b11111001, 0b01100101, 0b00010010, 0b10110000, 0b10001101, 0b01010111, 0b01010111, 0b10100101, 0b00000100, 0b10101001, 0b10000001, 0b11010111, 0b01101011, 0b00011010, 0b00000000, 0b00001010, 0b11001000, 0b11011100, 0b00000000, 0b11101110, 0b00100000, 0b00100100, 0b00011010, 0b00011111, 0b11000101, 0b00100111, 0b10001001, 0b00001001, 0b01001000, 0b01011000, 0b11110110, 0b11011100, 0b00111111, 0b10100001, 0b11110000, 0b00101101, 0b10001011, 0b01010000, 0b11001001, 0b11011010, 0b01001011, 0b10000110, 0b10000010, 0b11001011, 0b01100110, 0b01111100, 0b10010000, 0b10101010, 0b01010111, 0b00010110, 0b00110011, 0b11100110, 0b00000000, 0b01001001, 0b01001000, 0b01001000, 0b10101100, 0b11010001, 0b01000010, 0b00110100, 0b00011000], # Node 1
-[0b00000100, 0b00100000, 0b10000100, 0b01011011, 0b10101000, 0b00000100, 0b10001011, 0b10010111, 0b11000001, 0b10100110, 0b10010111, 0b11001001, 0b00000011, 0b11000001, 0b11010100, 0b10000110, 0b00111000, 0b01000010, 0b11011000, 0b01111011, 0b10100010, 0b01110101, 0b00111101, 0b10000010, 0b01101110, 0b11101101, 0b01101000, 0b01111000, 0b11111000, 0b11011000, 0b00000101, 0b00000011, 0b01110011, 0b00110000, 0b00101010, 0b00010111, 0b11100000, 0b11110010, 0b11100111, 0b00000000, 0b00100110, 0b00000000, 0b00110111, 0b00010101, 0b11110000, 0b10010001, 0b11010000, 0b11001100, 0b10101111, 0b00001110, 0b11110101, 0b11100000, 0b00111001, 0b00000010, 0b01001110, 0b00011100, 0b10100000, 0b11000000, 0b00100010, 0b00010011, 0b10001010, 0b01111101, 0b11101000, 0b01000000, 0b01111000, 0b10100010, 0b10001111, 0b00000011, 0b01001001, 0b10000001, 0b10100000, 0b01110011, 0b10100101, 0b10101000, 0b10101000, 0b00001110, 0b10010101, 0b01000011, 0b10101100, 0b11101100, 0b10001010, 0b00001101, 0b01100011, 0b00011000, 0b00111010, 0b11000110, 0b10000010, 0b01110010, 0b01011010, 0b10110001, 0b00000000, 0b01000010, 0b11000001, 0b01101100, 0b00001001, 0b11111101, 0b01110110, 0b10001010], # Node 2
-[0b11000000, 0b01010000, 0b01001110, 0b11000001, 0b00001000, 0b00001000, 0b00101000, 0b00011000, 0b01101010, 0b00111000, 0b10010101, 0b00000101, 0b00000000, 0b11000000, 0b00000110, 0b00101001, 0b00000001, 0b10110001, 0b00001100, 0b00011111, 0b00010000, 0b00000000, 0b11110000, 0b00110011, 0b00011110, 0b11111100, 0b10110011, 0b00000111, 0b01010000, 0b00011110, 0b01111100, 0b01110100, 0b11110001, 0b11100011, 0b11111111, 0b00000000, 0b00000011, 0b11111110, 0b11010111, 0b00110000, 0b10101000, 0b01011110, 0b11101001, 0b10000011, 0b10101111, 0b00010001, 0b00101101, 0b01111010, 0b00011010, 0b11111000, 0b01010010, 0b01010011, 0b00000101, 0b10000011, 0b00101100, 0b10011000, 0b00100100, 0b10000000, 0b10010000, 0b01010001, 0b01000000, 0b11110111, 0b10011001, 0b00101110, 0b01110000, 0b01000111, 0b01010001, 0b10110000, 0b00000110, 0b00000010, 0b00000010, 0b00000010, 0b00011010, 0b11100000, 0b10000001, 0b01111000, 0b00000000, 0b01010101, 0b11000000, 0b00010111, 0b10001100, 0b11110000, 0b10101111, 0b11110000, 0b11001011, 0b10001111, 0b00011010, 0b01011100, 0b00100100, 0b11000000, 0b01011000, 0b00000101, 0b00000001, 0b01010000, 0b10000110, 0b00010010, 0b10100000, 0b11000010], # Node 3
-[0b10011010, 0b00101111, 0b10101010, 0b00011001, 0b01001000, 0b00010100, 0b11100011, 0b00100000, 0b10000010, 0b10101101, 0b10111010, 0b00011100, 0b00111001, 0b00101100, 0b00001000, 0b11010000, 0b00110000, 0b00010111, 0b10100110, 0b10011011, 0b11110001, 0b01101001, 0b11101110, 0b10100110, 0b10110101, 0b11011001, 0b01101110, 0b00010111, 0b00100001, 0b00100001, 0b10011111, 0b11000000, 0b10010110, 0b00001000, 0b10110011, 0b01110000, 0b00001110, 0b01010110, 0b10100011, 0b11100000, 0b01100010, 0b00100101, 0b00000000, 0b00011011, 0b01010110, 0b00001101, 0b00011010, 0b11001000, 0b01001001, 0b10001101, 0b10010000, 0b00011000, 0b00100110, 0b00110001, 0b01010010, 0b11101101, 0b01100110, 0b11111110, 0b01001100, 0b01000011, 0b11111011, 0b10110101, 0b11011011, 0b11011100, 0b11111011, 0b00100011, 0b00010010, 0b11001010, 0b11000101, 0b11001010, 0b01110100, 0b11111000, 0b01011001, 0b10000000, 0b00001001, 0b10101000, 0b01010110, 0b01111000, 0b10001010, 0b00110000, 0b00001110, 0b10001100, 0b01100000, 0b10110001, 0b01000000, 0b11010011, 0b11000101, 0b00011100, 0b10011000, 0b10110000, 0b00010001, 0b01101010, 0b10000111, 0b10000111, 0b10010010, 0b01001101, 0b00001001, 0b10110111], # Node 4
-[0b00010011, 0b01101110, 0b00110010, 0b11111011, 0b00100110, 0b11011101, 0b11111100, 0b00100010, 0b10000100, 0b00000010, 0b11001101, 0b11100110, 0b01001100, 0b00000111, 0b11111100, 0b11001001, 0b11001010, 0b01101001, 0b01110100, 0b11010000, 0b11011111, 0b10010111, 0b00011111, 0b01011100, 0b11110110, 0b00110000, 0b11001001, 0b01101011, 0b00101110, 0b10100010, 0b10011100, 0b10101100, 0b11101100, 0b11100010, 0b10011011, 0b11110111, 0b10010110, 0b10001101, 0b11010011, 0b11010010, 0b11101001, 0b11001110, 0b00011111, 0b00111111, 0b11011110, 0b11001101, 0b11110111, 0b10010100, 0b01110101, 0b01101111, 0b01001111, 0b10101111, 0b11011111, 0b00111001, 0b11011010, 0b11011110, 0b10110000, 0b01000101, 0b01101100, 0b01111111, 0b00101000, 0b10101000, 0b11100111, 0b11111111, 0b10000001, 0b10100011, 0b11100101, 0b10110011, 0b11111111, 0b00111111, 0b01110011, 0b11000011, 0b01110101, 0b01111001, 0b00111000, 0b11100101, 0b10110101, 0b11011010, 0b00000001, 0b11101001, 0b01111110, 0b10010101, 0b01011110, 0b10100010, 0b10111010, 0b00111111, 0b00101111, 0b10010111, 0b01101001, 0b00111011, 0b11010111, 0b11110001, 0b01001111, 0b01110010, 0b11000101, 0b01111011, 0b10101000, 0b01101101], # Node 5
-[0b00000101, 0b10111100, 0b01010111, 0b11100010, 0b11101101, 0b00110101, 0b01111101, 0b01010110, 0b00001000, 0b01001111, 0b10101111, 0b11111010, 0b01001110, 0b01001111, 0b10110110, 0b00111100, 0b01011100, 0b11110110, 0b00011111, 0b00000001, 0b01111101, 0b00111111, 0b01000010, 0b11111001, 0b10111110, 0b10100101, 0b11001111, 0b11101101, 0b00111011, 0b11111010, 0b01100010, 0b01011111, 0b11100111, 0b00011100, 0b10101011, 0b11111000, 0b10110110, 0b11111110, 0b00110110, 0b01011111, 0b11110111, 0b10101111, 0b11111111, 0b11000100, 0b00111000, 0b10001100, 0b00011100, 0b00000010, 0b11111010, 0b01111110, 0b10000110, 0b11100000, 0b10100001, 0b00111110, 0b00000000, 0b11001001, 0b01111111, 0b11010101, 0b11101111, 0b11010111, 0b01000001, 0b10011011, 0b01010011, 0b00110010, 0b11011001, 0b01001010, 0b11011011, 0b10110111, 0b01011111, 0b11110000, 0b11000010, 0b11001001, 0b10110100, 0b00001111, 0b00000111, 0b01001111, 0b11111111, 0b01111100, 0b10100001, 0b11111100, 0b01100110, 0b01111110, 0b00111111, 0b01100101, 0b11110111, 0b10100001, 0b10111011, 0b10001111, 0b11111001, 0b01101111, 0b11001110, 0b01101011, 0b10101111, 0b11001010, 0b11011101, 0b11101101, 0b11000001, 0b11111100], # Node 6
-[0b11011110, 0b01101111, 0b00011111, 0b11001100, 0b10111010, 0b01101001, 0b00011110, 0b11110111, 0b10011111, 0b11010001, 0b11101101, 0b01111111, 0b01110000, 0b11100010, 0b11011010, 0b10011111, 0b01100101, 0b11101011, 0b01111011, 0b11100101, 0b11110111, 0b00111111, 0b00000001, 0b11111100, 0b01011100, 0b00101110, 0b01100101, 0b00111100, 0b00101110, 0b10001110, 0b11111111, 0b10011111, 0b10100110, 0b10111111, 0b11111111, 0b11011111, 0b00110101, 0b11100100, 0b00111001, 0b00101110, 0b01111010, 0b11011111, 0b11111111, 0b01111110, 0b10100101, 0b11111110, 0b10101111, 0b11110011, 0b11001111, 0b11111110, 0b10111111, 0b01101100, 0b01001111, 0b10011111, 0b10110000, 0b11101001, 0b11110110, 0b10100001, 0b11101110, 0b01111011, 0b00111110, 0b10111110, 0b01111110, 0b11101110, 0b00011001, 0b11101011, 0b10111101, 0b11010011, 0b01111100, 0b11000111, 0b10011010, 0b11010100, 0b11010000, 0b11101101, 0b11011010, 0b10000111, 0b11110001, 0b01101101, 0b10110010, 0b01110110, 0b01100111, 0b01110010, 0b11000101, 0b01000111, 0b00111111, 0b11101111, 0b11001111, 0b11100110, 0b10010011, 0b10011110, 0b11111100, 0b01111111, 0b10101110, 0b10111111, 0b10111101, 0b11111001, 0b11111001, 0b01101110], # Node 7
-[0b11111001, 0b11001111, 0b11111111, 0b11111111, 0b11110111, 0b11111111, 0b11101111, 0b11111110, 0b11011100, 0b10111111, 0b11111111, 0b11001110, 0b11101110, 0b01101111, 0b11111101, 0b11011111, 0b11100101, 0b00101111, 0b01010110, 0b01100000, 0b11111101, 0b11010111, 0b01000011, 0b11010000, 0b11111111, 0b10011111, 0b00001110, 0b10110000, 0b11101011, 0b01111000, 0b11100010, 0b10111101, 0b00111101, 0b01011100, 0b11111111, 0b11111101, 0b10000110, 0b11110011, 0b11100111, 0b01110111, 0b00010010, 0b11111111, 0b00011110, 0b11101110, 0b11000010, 0b11111111, 0b01100111, 0b00001110, 0b01001101, 0b11111111, 0b11100011, 0b00100001, 0b11111110, 0b11101010, 0b00110111, 0b10111000, 0b10110100, 0b11111000, 0b10000000, 0b10111111, 0b00000110, 0b00111011, 0b01111111, 0b01111111, 0b00100010, 0b10000010, 0b11111111, 0b01001101, 0b11000100, 0b11101100, 0b00111111, 0b00001101, 0b11000000, 0b11111110, 0b01011111, 0b00000000, 0b11111110, 0b11111011, 0b00000011, 0b11111111, 0b11111001, 0b01011011, 0b11011111, 0b11101010, 0b11111101, 0b11111111, 0b11111101, 0b11111111, 0b11111101, 0b11111111, 0b01111111, 0b00110011, 0b11111101, 0b11111100, 0b11111111, 0b01111011, 0b11111011, 0b10110111], # Node 8
-[0b10100000, 0b10000011, 0b00000010, 0b00011001, 0b00111000, 0b11101000, 0b01001000, 0b01000000, 0b01001011, 0b11000100, 0b01110000, 0b01100000, 0b00000010, 0b11010100, 0b00000000, 0b10010100, 0b00000010, 0b00100001, 0b11000110, 0b00001110, 0b10010000, 0b00101001, 0b01110111, 0b10101011, 0b00010101, 0b00000101, 0b01110001, 0b01000010, 0b00100001, 0b11101110, 0b00000110, 0b00111001, 0b11000000, 0b00110111, 0b11100000, 0b01000011, 0b00101110, 0b00000011, 0b00010000, 0b00010110, 0b11100111, 0b00010100, 0b10100000, 0b11000001, 0b00001010, 0b11011110, 0b01010101, 0b00111110, 0b01011100, 0b10110001, 0b00111111, 0b00000000, 0b10101000, 0b01110100, 0b00011110, 0b00110100, 0b00100101, 0b11111110, 0b00100011, 0b00000001, 0b10100000, 0b10100101, 0b01100100, 0b00001100, 0b00011000, 0b00000000, 0b01101001, 0b01000001, 0b00000000, 0b01000000, 0b00010100, 0b00000000, 0b11000000, 0b11110111, 0b00101011, 0b00000110, 0b01100111, 0b01100000, 0b11010000, 0b11000100, 0b00000000, 0b10101111, 0b11111010, 0b00111010, 0b10101010, 0b01100010, 0b00001100, 0b10000110, 0b00001100, 0b00010000, 0b00010110, 0b11111000, 0b00000100, 0b10100101, 0b00001000, 0b10000000, 0b10001100, 0b10100010], # Node 9
-[0b11000111, 0b11011111, 0b01001110, 0b01001101, 0b10110101, 0b11110010, 0b11010001, 0b10101111, 0b00110011, 0b00110001, 0b10111010, 0b11010001, 0b10001100, 0b01010011, 0b01111110, 0b00000101, 0b10101001, 0b10100110, 0b00111110, 0b00101000, 0b10101001, 0b01001110, 0b00110010, 0b00011110, 0b11010101, 0b01011000, 0b01000010, 0b10001011, 0b01110011, 0b11010000, 0b11100000, 0b00011110, 0b00011011, 0b01001110, 0b00001101, 0b01111001, 0b01000001, 0b10010001, 0b11010110, 0b01011111, 0b00001110, 0b11011001, 0b01001001, 0b11000000, 0b01111100, 0b01101010, 0b01101111, 0b10000000, 0b11111101, 0b10111011, 0b10000111, 0b11110010, 0b11010011, 0b11111011, 0b11001100, 0b11011100, 0b00000001, 0b01110001, 0b01000100, 0b01000010, 0b00011101, 0b10101110, 0b00111100, 0b10010111, 0b10110000, 0b11101100, 0b11111001, 0b00000111, 0b11000110, 0b11110011, 0b11101100, 0b11001000, 0b10100010, 0b10111111, 0b00100010, 0b11000000, 0b11011110, 0b10011011, 0b00100010, 0b01011011, 0b01011110, 0b00001101, 0b11111100, 0b11011100, 0b11101000, 0b11000001, 0b01110011, 0b11111101, 0b11010001, 0b10101111, 0b10111000, 0b10110010, 0b11010001, 0b01111000, 0b11111111, 0b11011100, 0b11101110, 0b10101101], # Node 10
-[0b10001001, 0b00100001, 0b10000010, 0b11000001, 0b00010100, 0b00110001, 0b00000000, 0b00010000, 0b01000000, 0b10001101, 0b00100111, 0b01010000, 0b00000111, 0b11000100, 0b00100000, 0b11100110, 0b11010110, 0b00100000, 0b01111010, 0b11101011, 0b00000001, 0b00000011, 0b00111000, 0b10110101, 0b00001010, 0b00000000, 0b01100000, 0b00010010, 0b00001011, 0b10000000, 0b01110000, 0b00000000, 0b00000000, 0b10001000, 0b11101011, 0b10000000, 0b00011100, 0b01011110, 0b10110010, 0b01101010, 0b01110000, 0b11111100, 0b10100000, 0b00000010, 0b01001011, 0b00010100, 0b00010101, 0b01000000, 0b00110100, 0b01100100, 0b00000110, 0b10010000, 0b01100001, 0b00011110, 0b00101011, 0b00000100, 0b00101000, 0b00111011, 0b10000010, 0b01001110, 0b01101000, 0b00011111, 0b01010001, 0b00101100, 0b00000101, 0b01000011, 0b00110000, 0b01100101, 0b00011100, 0b10101010, 0b10100000, 0b00000110, 0b01000000, 0b00000010, 0b01101100, 0b10000000, 0b00010000, 0b11001000, 0b00000001, 0b00001100, 0b01111010, 0b00110111, 0b00101000, 0b10100001, 0b01000000, 0b10001001, 0b00001011, 0b00001001, 0b11000111, 0b10001010, 0b10010010, 0b00000000, 0b11100011, 0b00001000, 0b00000010, 0b00010001, 0b10010100, 0b10010100], # Node 11
-[0b01111100, 0b01101001, 0b11111010, 0b10111011, 0b01000100, 0b11101011, 0b01100101, 0b00010100, 0b01011011, 0b01101111, 0b01111011, 0b01011010, 0b10110101, 0b01111011, 0b01011011, 0b00111100, 0b00010111, 0b00011011, 0b10011111, 0b01000010, 0b01110100, 0b11011010, 0b10100010, 0b11001110, 0b01100011, 0b11001101, 0b10010000, 0b11110100, 0b10000111, 0b01011011, 0b10011100, 0b11011011, 0b10111010, 0b10110101, 0b00011100, 0b01011100, 0b00001010, 0b00110100, 0b10100110, 0b11110110, 0b01111000, 0b11100001, 0b10101100, 0b00010111, 0b00100101, 0b01100001, 0b11110101, 0b01100001, 0b11000110, 0b10110011, 0b01001100, 0b10111001, 0b01010110, 0b01101001, 0b01100000, 0b01100000, 0b01101001, 0b10100110, 0b00110011, 0b11111101, 0b11010011, 0b00111110, 0b01100101, 0b00100000, 0b01100110, 0b11101001, 0b11011111, 0b11110100, 0b11110011, 0b00111100, 0b00101110, 0b00111000, 0b11011100, 0b01101110, 0b01111100, 0b01100110, 0b11100011, 0b00000111, 0b00101000, 0b11010111, 0b11110111, 0b11000111, 0b10001000, 0b11011111, 0b11000111, 0b10111111, 0b11011001, 0b01000101, 0b01011111, 0b00110001, 0b10110011, 0b11001111, 0b11110010, 0b00110101, 0b11011000, 0b00100100, 0b11111001, 0b10011000], # Node 12
-[0b10010011, 0b10101000, 0b11111111, 0b11111100, 0b11110100, 0b00001100, 0b00100101, 0b00001010, 0b10101111, 0b01111100, 0b00000111, 0b00111100, 0b11110111, 0b11111111, 0b11101011, 0b01010111, 0b01000010, 0b01011110, 0b01101101, 0b00000101, 0b01111110, 0b10011100, 0b10010000, 0b11011110, 0b10101110, 0b10010101, 0b01000101, 0b00001100, 0b10110101, 0b10001011, 0b00011010, 0b10111110, 0b00000100, 0b01001111, 0b10001010, 0b10011100, 0b00101101, 0b10010001, 0b01110101, 0b01011111, 0b11001111, 0b10010000, 0b11011010, 0b11101100, 0b01011100, 0b10101110, 0b01001000, 0b00001100, 0b01001101, 0b11101100, 0b11010000, 0b10111000, 0b11011001, 0b10111111, 0b10011110, 0b01010100, 0b01111011, 0b00000011, 0b00011010, 0b00101101, 0b10000111, 0b10110100, 0b01000110, 0b00010111, 0b01000000, 0b10011000, 0b00100111, 0b10001001, 0b00111101, 0b10100111, 0b11101101, 0b11110110, 0b00000111, 0b10011001, 0b01010101, 0b00010011, 0b00110010, 0b11001111, 0b01011001, 0b01100000, 0b01011000, 0b10011001, 0b11111011, 0b11100011, 0b01001001, 0b00101010, 0b10001111, 0b00100101, 0b10010111, 0b10010111, 0b00111110, 0b01100110, 0b01111111, 0b11011111, 0b01000101, 0b11111110, 0b11001111, 0b11111111], # Node 13
-[0b00000001, 0b00000000, 0b00010000, 0b10011100, 0b11010110, 0b01101011, 0b00000001, 0b01100000, 0b11110100, 0b11001000, 0b01000111, 0b00110110, 0b00001100, 0b00010110, 0b01111100, 0b11000000, 0b10111110, 0b10001110, 0b00110111, 0b00000100, 0b00000010, 0b00110110, 0b11010000, 0b01000000, 0b10001100, 0b11010001, 0b00100000, 0b00000000, 0b01111000, 0b00000001, 0b00000000, 0b00001010, 0b00100000, 0b11100100, 0b11011011, 0b00001011, 0b11001000, 0b01111111, 0b01111010, 0b11010100, 0b11010110, 0b00011111, 0b01000000, 0b10101111, 0b11110111, 0b01010100, 0b11001000, 0b00111010, 0b00001100, 0b10100000, 0b11111111, 0b01000011, 0b10000110, 0b00101000, 0b11100111, 0b11111111, 0b11010100, 0b01011001, 0b11100011, 0b11101100, 0b00000000, 0b00111101, 0b00100101, 0b10111000, 0b00001011, 0b10001010, 0b01000000, 0b10010001, 0b10000000, 0b01000100, 0b10000000, 0b00000001, 0b11111101, 0b11000000, 0b10000000, 0b10100010, 0b11010000, 0b00000001, 0b00000000, 0b01010001, 0b01010011, 0b01000010, 0b11011000, 0b10100100, 0b00001001, 0b10010000, 0b01000101, 0b01001011, 0b10001111, 0b11100110, 0b00110010, 0b01001001, 0b01000011, 0b01101110, 0b01001001, 0b11110011, 0b01110010, 0b10110011], # Node 14
-[0b01000110, 0b10001000, 0b10000100, 0b10100000, 0b01001000, 0b10101010, 0b11110101, 0b10010001, 0b10001010, 0b01010110, 0b11000100, 0b00100011, 0b00000000, 0b10100001, 0b10010110, 0b00001101, 0b00001000, 0b01001110, 0b00101000, 0b10111101, 0b01110000, 0b01010010, 0b10001101, 0b01110111, 0b00111011, 0b00011001, 0b11111000, 0b00101111, 0b10100011, 0b00000000, 0b01111000, 0b00101010, 0b00001000, 0b00000000, 0b10001011, 0b00110000, 0b00000000, 0b00111000, 0b11101000, 0b11000001, 0b10000000, 0b10010011, 0b00001001, 0b11011110, 0b11010010, 0b10101001, 0b11110000, 0b00100111, 0b00001100, 0b00000100, 0b11011111, 0b01010010, 0b10000001, 0b00000100, 0b10001000, 0b11010110, 0b00010110, 0b11101000, 0b11100001, 0b00001000, 0b10010000, 0b00011010, 0b11111100, 0b10100000, 0b11000010, 0b01100000, 0b01100011, 0b01000100, 0b00011111, 0b10010110, 0b11010001, 0b11111101, 0b10000000, 0b01001010, 0b11110000, 0b01001111, 0b11010010, 0b11100100, 0b11100010, 0b00000001, 0b10001100, 0b10011101, 0b00001110, 0b00000000, 0b11010100, 0b00101110, 0b00000000, 0b01001010, 0b11010110, 0b00000011, 0b01010100, 0b00000000, 0b00010101, 0b11000100, 0b10000001, 0b01000100, 0b00000010, 0b10101001], # Node 15
-[0b00111111, 0b10100111, 0b11001101, 0b11111001, 0b11101001, 0b11101010, 0b01010010, 0b11000101, 0b11010000, 0b00110100, 0b00011011, 0b10100111, 0b10111011, 0b01011111, 0b01011101, 0b10000011, 0b10100011, 0b01011111, 0b10010101, 0b00010000, 0b00101001, 0b01000000, 0b01110110, 0b00010100, 0b10110101, 0b01000110, 0b01000010, 0b11001110, 0b10001000, 0b00100011, 0b11110100, 0b10111011, 0b10011001, 0b11110111, 0b10111100, 0b11011111, 0b10111010, 0b11011111, 0b01011010, 0b10010100, 0b01001101, 0b11011111, 0b10101111, 0b10001011, 0b01001111, 0b10111101, 0b10101000, 0b11000001, 0b01000011, 0b10110101, 0b10001101, 0b11110101, 0b11001111, 0b00101110, 0b01110011, 0b11011111, 0b01111010, 0b00010110, 0b10101011, 0b00110111, 0b10101011, 0b10010101, 0b11010010, 0b11110000, 0b10111010, 0b10110001, 0b11011101, 0b11001110, 0b11101110, 0b11011011, 0b01010110, 0b10011110, 0b00111111, 0b10111001, 0b01010110, 0b01111110, 0b10011111, 0b01001001, 0b00011100, 0b11111000, 0b01110011, 0b10100100, 0b01100010, 0b10010011, 0b11111000, 0b11011111, 0b11011110, 0b11101011, 0b11110001, 0b11100110, 0b11011111, 0b00100100, 0b00000101, 0b00111011, 0b00011111, 0b10000111, 0b11101101, 0b10110100], # Node 16
-[0b01110000, 0b10111110, 0b00111010, 0b01000101, 0b00011111, 0b01101011, 0b11100111, 0b01110101, 0b10101111, 0b10011110, 0b10111001, 0b11010010, 0b01011110, 0b10100100, 0b01011001, 0b00010100, 0b01111011, 0b11101110, 0b11010011, 0b00101100, 0b10110110, 0b10110100, 0b10010111, 0b11010100, 0b10011110, 0b10101001, 0b10101100, 0b10110111, 0b10110111, 0b11010110, 0b11010010, 0b11111011, 0b10010000, 0b01100010, 0b01011111, 0b11111110, 0b01000110, 0b11100000, 0b11100010, 0b10000010, 0b00010101, 0b11111111, 0b11110010, 0b10101001, 0b10101111, 0b10111110, 0b00010110, 0b01010111, 0b00110111, 0b00010010, 0b01010110, 0b10110010, 0b00100000, 0b10100110, 0b00110101, 0b00010001, 0b10100010, 0b00101111, 0b01010011, 0b11100111, 0b00000000, 0b10110110, 0b10101101, 0b10101011, 0b01101100, 0b10110010, 0b01010111, 0b01110111, 0b11011011, 0b00100110, 0b10011110, 0b01011110, 0b10101110, 0b10010111, 0b00000010, 0b11011011, 0b01100000, 0b11100101, 0b10100001, 0b10000101, 0b10010011, 0b11010000, 0b11111010, 0b11010111, 0b11010101, 0b01111100, 0b00111100, 0b00101111, 0b00100100, 0b01011010, 0b10001100, 0b11101110, 0b01111010, 0b01010111, 0b10101111, 0b00111110, 0b00101011, 0b11111000], # Node 17
-[0b10000010, 0b10000000, 0b10000000, 0b00010010, 0b11001110, 0b01000000, 0b00001000, 0b11101000, 0b00000000, 0b00100001, 0b00001110, 0b00011100, 0b01001100, 0b00011100, 0b10000101, 0b01100000, 0b10001011, 0b01101000, 0b10001100, 0b01111101, 0b01000000, 0b01000011, 0b11111110, 0b11010111, 0b00000000, 0b11101010, 0b01111111, 0b00000010, 0b00011100, 0b11111110, 0b01111101, 0b00000000, 0b11110001, 0b11100100, 0b10000110, 0b11000011, 0b00010011, 0b00000111, 0b10100001, 0b01100111, 0b00011110, 0b00001000, 0b10101000, 0b11010101, 0b10000001, 0b00100011, 0b10110000, 0b00101001, 0b01110001, 0b11010010, 0b01111010, 0b10001111, 0b01000011, 0b11011101, 0b00010100, 0b00111101, 0b11001000, 0b10010010, 0b01111010, 0b10001000, 0b10100000, 0b10100000, 0b00010011, 0b01111000, 0b10001101, 0b01101011, 0b00001011, 0b10001100, 0b00111000, 0b11011010, 0b01010011, 0b11100001, 0b01101000, 0b00000001, 0b11010101, 0b11011110, 0b00011011, 0b00010010, 0b11111100, 0b00111111, 0b00000000, 0b11000000, 0b10101111, 0b00100000, 0b01101000, 0b01111010, 0b00001001, 0b00000010, 0b00001000, 0b00000100, 0b01100100, 0b01100000, 0b10011001, 0b00010001, 0b01000110, 0b00000000, 0b01100100, 0b11010010], # Node 18
-[0b10001000, 0b01111011, 0b00000010, 0b00000000, 0b01000000, 0b00001000, 0b00000001, 0b00000010, 0b00000100, 0b00100000, 0b00000101, 0b00010001, 0b00110000, 0b00000001, 0b00100000, 0b00000000, 0b11110100, 0b00000000, 0b00000000, 0b01000000, 0b00011110, 0b00000100, 0b00000000, 0b01001100, 0b00000001, 0b10100000, 0b01111000, 0b00000010, 0b00000001, 0b00001111, 0b00011110, 0b00100010, 0b11111100, 0b00110011, 0b00000000, 0b10100000, 0b00011111, 0b00111000, 0b00000000, 0b11111000, 0b10000001, 0b01100001, 0b11000000, 0b00011111, 0b00101100, 0b01001100, 0b11111000, 0b11100000, 0b00011111, 0b11000010, 0b00001111, 0b11111111, 0b00001000, 0b11111110, 0b11110000, 0b00001111, 0b11100000, 0b10000111, 0b00111111, 0b00000000, 0b01111101, 0b11111000, 0b00000000, 0b00000001, 0b10000011, 0b00011101, 0b00010000, 0b10000100, 0b11001110, 0b01000000, 0b00000000, 0b11111100, 0b00001110, 0b00000010, 0b10000000, 0b01111111, 0b00000000, 0b00000000, 0b10000000, 0b00100000, 0b00001000, 0b00000000, 0b00000000, 0b00110000, 0b11000001, 0b11110000, 0b01000110, 0b00000000, 0b10010000, 0b11101101, 0b11000010, 0b00000000, 0b11110010, 0b10010110, 0b00000000, 0b11000000, 0b00000000, 0b00110001], # Node 19
-[0b10111101, 0b01101101, 0b00111101, 0b11001001, 0b11100111, 0b01101101, 0b10101101, 0b00011010, 0b00110111, 0b11110001, 0b00111100, 0b11101010, 0b11011110, 0b01001111, 0b10000110, 0b10111000, 0b00110111, 0b00000010, 0b01100000, 0b01101000, 0b00110001, 0b00111110, 0b11111111, 0b00010110, 0b01001101, 0b10110001, 0b10100110, 0b11110001, 0b11011110, 0b11100101, 0b01000001, 0b01011010, 0b00111011, 0b10000100, 0b00011101, 0b10011001, 0b00111111, 0b11100010, 0b10111011, 0b11010000, 0b11010011, 0b11110100, 0b11010011, 0b00101100, 0b00100101, 0b10011001, 0b11001010, 0b01110011, 0b01100100, 0b11111110, 0b01101110, 0b00001011, 0b11111011, 0b11000000, 0b11010111, 0b11011010, 0b11001001, 0b10010110, 0b00000111, 0b11111000, 0b10101101, 0b10010101, 0b01000000, 0b11111011, 0b11100111, 0b11110000, 0b01100110, 0b11100000, 0b10111110, 0b10011011, 0b11001111, 0b11101101, 0b11011101, 0b11010011, 0b00101111, 0b00001101, 0b00000111, 0b11111110, 0b11010011, 0b10011111, 0b00101110, 0b01100000, 0b11001110, 0b01111110, 0b11010010, 0b01011101, 0b11010010, 0b10001111, 0b11010111, 0b10100110, 0b01010101, 0b10110111, 0b11100001, 0b11101011, 0b11111111, 0b10111111, 0b11111100, 0b01011011], # Node 20
-[0b10110000, 0b01000000, 0b01000000, 0b10100110, 0b11111110, 0b10010011, 0b10100111, 0b00010100, 0b11110110, 0b00001111, 0b10010010, 0b00000000, 0b10111010, 0b00000001, 0b10000110, 0b00111110, 0b11000101, 0b01100010, 0b11110110, 0b00011100, 0b11110001, 0b10000110, 0b01000101, 0b00010101, 0b00000001, 0b10101001, 0b00100101, 0b11001011, 0b10101010, 0b01110110, 0b11000110, 0b10000100, 0b11011110, 0b01000011, 0b00100101, 0b10110011, 0b10100001, 0b00000000, 0b00001001, 0b00100100, 0b00100001, 0b11010100, 0b01101010, 0b01110100, 0b10001101, 0b00000010, 0b11101001, 0b11011011, 0b00000110, 0b10001111, 0b01010011, 0b00100111, 0b10001101, 0b10011001, 0b01000110, 0b11001001, 0b10110100, 0b10000100, 0b10001010, 0b01110010, 0b00111101, 0b10011001, 0b11001100, 0b01010001, 0b00000111, 0b00010011, 0b00110000, 0b11010101, 0b10001101, 0b10000001, 0b00001101, 0b00001001, 0b00011011, 0b10010110, 0b00110101, 0b10010001, 0b00011110, 0b10001011, 0b11110000, 0b01111000, 0b10011011, 0b01010101, 0b00010001, 0b11001111, 0b01110010, 0b00010011, 0b00110100, 0b00101110, 0b00000111, 0b00100110, 0b01101011, 0b11000111, 0b10000100, 0b11001110, 0b11111010, 0b01101010, 0b00101000, 0b00111100], # Node 21
-[0b00000001, 0b11001000, 0b01001000, 0b00101000, 0b00101001, 0b10010101, 0b00001000, 0b10000110, 0b01000000, 0b10000000, 0b11100101, 0b00010001, 0b00011010, 0b01011010, 0b11011010, 0b00110000, 0b11110011, 0b11011100, 0b00010001, 0b00000000, 0b00001000, 0b11010000, 0b00001011, 0b01000000, 0b00101001, 0b11110010, 0b00000000, 0b11000101, 0b10111000, 0b00000011, 0b11000100, 0b11010000, 0b10010011, 0b00011011, 0b10110110, 0b00010111, 0b10111000, 0b01000011, 0b00000010, 0b10000000, 0b00110000, 0b01001011, 0b00011000, 0b01000000, 0b11110001, 0b10101000, 0b00000010, 0b10000000, 0b00010101, 0b10100000, 0b00100100, 0b10100000, 0b01011000, 0b00011000, 0b01010111, 0b01010011, 0b00000000, 0b11101000, 0b00010111, 0b00001111, 0b00001001, 0b01111010, 0b01100001, 0b00100010, 0b11100000, 0b01001111, 0b01000000, 0b00000100, 0b01100001, 0b00000000, 0b01101000, 0b10000000, 0b00001110, 0b10000000, 0b00000010, 0b11011000, 0b00010000, 0b01000100, 0b00000000, 0b10000000, 0b10110001, 0b00010100, 0b00110000, 0b00000100, 0b10110000, 0b11010011, 0b11101000, 0b00000010, 0b01110000, 0b00011110, 0b00100000, 0b00011101, 0b11001100, 0b11010110, 0b00010000, 0b00100000, 0b01100011, 0b00000011], # Node 22
-[0b01010001, 0b00001000, 0b01101000, 0b00000100, 0b00100000, 0b00000001, 0b01000110, 0b00000000, 0b10001010, 0b00110000, 0b00100000, 0b00000011, 0b01001000, 0b00000111, 0b00110011, 0b01001000, 0b11010000, 0b00100000, 0b11001110, 0b00111010, 0b01000001, 0b00010101, 0b11000111, 0b01111111, 0b00101000, 0b00110001, 0b11111100, 0b00000100, 0b10101000, 0b10111000, 0b00101110, 0b01000000, 0b00100001, 0b00111010, 0b10000101, 0b10110011, 0b00100011, 0b11000111, 0b10110000, 0b11000001, 0b11111111, 0b00101110, 0b10001110, 0b11011111, 0b00011100, 0b00000010, 0b00011001, 0b00100000, 0b00100000, 0b10100000, 0b10101111, 0b00001000, 0b00100000, 0b00000011, 0b10010010, 0b11100001, 0b00100000, 0b00010000, 0b01010001, 0b10000000, 0b00000001, 0b11000010, 0b00100111, 0b11010001, 0b00010001, 0b00000000, 0b00010000, 0b00101001, 0b10000000, 0b00101001, 0b11100110, 0b00000011, 0b11101110, 0b00100010, 0b00111100, 0b10001001, 0b10001111, 0b00001010, 0b11111111, 0b00110111, 0b00110100, 0b11011000, 0b00011111, 0b01001001, 0b00100010, 0b00100101, 0b11001000, 0b00100101, 0b00000000, 0b00100010, 0b10001000, 0b00101000, 0b10001010, 0b00000100, 0b00100001, 0b10010001, 0b00000010, 0b00000010], # Node 23
-[0b01010110, 0b00010010, 0b01101001, 0b00000010, 0b01000000, 0b01001110, 0b10111001, 0b10000001, 0b01000100, 0b01100110, 0b00110011, 0b11100011, 0b00101000, 0b01100101, 0b01001000, 0b10011011, 0b00100000, 0b01010100, 0b11101001, 0b10101000, 0b11011010, 0b00001110, 0b11011111, 0b10111101, 0b01110110, 0b10010001, 0b00010100, 0b10111101, 0b10100000, 0b01001101, 0b00010000, 0b00101110, 0b10100010, 0b00001001, 0b10000010, 0b11010000, 0b10110101, 0b01101100, 0b00000100, 0b10110110, 0b10100010, 0b01100100, 0b11000001, 0b11000010, 0b10001001, 0b10010000, 0b01010010, 0b00101100, 0b01001001, 0b01111001, 0b11101000, 0b00111110, 0b01010011, 0b11111000, 0b00010001, 0b11100000, 0b10010100, 0b11011101, 0b10000010, 0b00101001, 0b01100100, 0b10101000, 0b10010110, 0b01100011, 0b10000100, 0b01100100, 0b11000101, 0b01010011, 0b00010100, 0b01001000, 0b01110111, 0b11010100, 0b00100001, 0b00000101, 0b00111000, 0b10100101, 0b01111000, 0b10101110, 0b11111101, 0b01001101, 0b11000010, 0b11011001, 0b10011000, 0b01000000, 0b00010110, 0b01101101, 0b01101100, 0b00011100, 0b10000111, 0b01000111, 0b10010010, 0b01100000, 0b00100010, 0b01010110, 0b00000011, 0b00001010, 0b11000101, 0b01001001], # Node 24
-[0b01000100, 0b10010011, 0b11001010, 0b00010000, 0b01100011, 0b11101110, 0b11001010, 0b01101000, 0b11100100, 0b01000000, 0b00100011, 0b00111001, 0b11011010, 0b00011100, 0b11110100, 0b10101101, 0b01011110, 0b00010001, 0b00001000, 0b11011000, 0b00000110, 0b00000100, 0b10111110, 0b01110011, 0b11010010, 0b10000111, 0b01101000, 0b01011001, 0b00111111, 0b11011001, 0b10101101, 0b01011011, 0b01101001, 0b01110000, 0b01101000, 0b11110100, 0b01100111, 0b10111110, 0b00111000, 0b01111111, 0b00110110, 0b00001000, 0b00100100, 0b01000001, 0b10010001, 0b00000110, 0b11110010, 0b01000001, 0b10000000, 0b10001110, 0b00110111, 0b00100100, 0b00101010, 0b10101110, 0b11000111, 0b00010111, 0b00001111, 0b01011111, 0b10010110, 0b00000001, 0b01000110, 0b10011010, 0b00110100, 0b11100001, 0b00110010, 0b10001001, 0b01011100, 0b01111010, 0b11001111, 0b10100110, 0b11110010, 0b10000000, 0b11001100, 0b10000000, 0b01010000, 0b10001100, 0b01111100, 0b00001101, 0b01010101, 0b00001001, 0b00010011, 0b10011001, 0b10100111, 0b11011000, 0b01001000, 0b11011011, 0b01001000, 0b11101101, 0b10000010, 0b00011101, 0b00110111, 0b00101001, 0b00010100, 0b11001001, 0b01100111, 0b00010001, 0b10001100, 0b11100001], # Node 25
-[0b10101111, 0b11110011, 0b10001101, 0b01001010, 0b10101101, 0b00011111, 0b01011111, 0b00010011, 0b10111010, 0b00011110, 0b11111110, 0b11111100, 0b10010101, 0b00111000, 0b01100000, 0b11101000, 0b10110111, 0b10010100, 0b11101111, 0b10010110, 0b01011001, 0b01011011, 0b00101110, 0b00011000, 0b00101011, 0b01111101, 0b00000001, 0b00001011, 0b01011010, 0b11101001, 0b00110000, 0b01011011, 0b01011101, 0b11011101, 0b11011111, 0b11110001, 0b01010000, 0b00101101, 0b01001100, 0b10101101, 0b11000010, 0b11010101, 0b10011110, 0b01111000, 0b01110100, 0b10111101, 0b11111110, 0b00100011, 0b00100011, 0b01101011, 0b10111000, 0b00111100, 0b11010001, 0b00001010, 0b01010010, 0b11011010, 0b11011100, 0b01000100, 0b11100000, 0b10011100, 0b01001111, 0b11101100, 0b11110111, 0b01001100, 0b00101010, 0b11111110, 0b11101110, 0b00110110, 0b10111111, 0b11001111, 0b11110111, 0b01000011, 0b10010100, 0b11110001, 0b11101000, 0b11100001, 0b11011001, 0b01101110, 0b00001001, 0b11010110, 0b11011101, 0b00010110, 0b01011011, 0b00110100, 0b10101001, 0b11011011, 0b11110000, 0b11111110, 0b01011100, 0b10101111, 0b10011010, 0b10010111, 0b11111010, 0b00011111, 0b00111011, 0b10001111, 0b01101111, 0b11010110], # Node 26
-[0b10110000, 0b10110001, 0b01001111, 0b01000110, 0b00010100, 0b11110010, 0b10000001, 0b01000000, 0b01110001, 0b01000100, 0b10100110, 0b00001110, 0b00000101, 0b00010000, 0b00101000, 0b00101000, 0b10000010, 0b00001010, 0b00111010, 0b00001000, 0b10101111, 0b10110110, 0b10000100, 0b00000010, 0b00011010, 0b00010000, 0b11000100, 0b10101010, 0b11001000, 0b00010010, 0b00111000, 0b11101001, 0b00000100, 0b10001100, 0b00111011, 0b11011001, 0b10001101, 0b01000110, 0b00000000, 0b01000001, 0b11001000, 0b00100101, 0b10101000, 0b10010100, 0b11010000, 0b10000010, 0b01110101, 0b01110110, 0b01010011, 0b00111111, 0b10010101, 0b00110001, 0b01000110, 0b10111000, 0b11000101, 0b10100100, 0b00110100, 0b10100000, 0b00010101, 0b01001000, 0b01001000, 0b10011010, 0b00010101, 0b01100110, 0b00011000, 0b00011101, 0b00101000, 0b01100001, 0b11011111, 0b00100111, 0b10000000, 0b11011100, 0b00100011, 0b00101000, 0b00101101, 0b00010001, 0b10110010, 0b11000010, 0b11001010, 0b00000011, 0b00000100, 0b10110000, 0b00101000, 0b01111101, 0b00110001, 0b01000110, 0b00111011, 0b01001000, 0b00000110, 0b01101000, 0b11100101, 0b00010110, 0b00000100, 0b01100001, 0b00100110, 0b10110010, 0b01001100, 0b00010001], # Node 27
-[0b11001111, 0b11100011, 0b01010101, 0b10011110, 0b10111001, 0b01110100, 0b10001100, 0b10111111, 0b01101011, 0b10010110, 0b10101111, 0b11100011, 0b10111011, 0b01110011, 0b00110101, 0b00101110, 0b11111010, 0b01010011, 0b01001110, 0b01011001, 0b10001101, 0b01101000, 0b11011111, 0b01111111, 0b01011011, 0b11011100, 0b10101011, 0b01111101, 0b01100101, 0b00000100, 0b10001010, 0b11101011, 0b00011111, 0b11100110, 0b01010011, 0b11111100, 0b11011101, 0b11100000, 0b10001011, 0b00011011, 0b01000001, 0b10011101, 0b01101111, 0b10010110, 0b11011010, 0b01111101, 0b11011001, 0b00110011, 0b01111111, 0b00111000, 0b01011010, 0b00001111, 0b11011010, 0b10111011, 0b10111110, 0b10000011, 0b01101010, 0b10101110, 0b11110100, 0b11111110, 0b00101100, 0b00111100, 0b10011010, 0b11111111, 0b00011100, 0b11110011, 0b11010001, 0b01001011, 0b10001110, 0b11110111, 0b01101111, 0b01110110, 0b11100110, 0b01011111, 0b10100011, 0b00001010, 0b11010111, 0b01110110, 0b00010101, 0b00000111, 0b10111000, 0b01001010, 0b11001111, 0b01111011, 0b10111011, 0b01101101, 0b10011111, 0b01111110, 0b11011011, 0b01111101, 0b11000111, 0b01101101, 0b11111110, 0b10011010, 0b01011111, 0b11000110, 0b10111110, 0b10100111], # Node 28
-[0b00010111, 0b01101111, 0b01110111, 0b00101001, 0b00000000, 0b00110000, 0b11010000, 0b00001000, 0b00000010, 0b10000000, 0b10111011, 0b01111010, 0b00000010, 0b00100000, 0b01000101, 0b11110100, 0b00000001, 0b00100010, 0b11110111, 0b00010110, 0b01010000, 0b11101101, 0b00011011, 0b00100000, 0b01000111, 0b11101111, 0b10000011, 0b01111111, 0b11001111, 0b11111111, 0b11111111, 0b11110111, 0b11111111, 0b11111111, 0b11111111, 0b01111110, 0b11110101, 0b00000011, 0b11100111, 0b00000001, 0b00001000, 0b11100000, 0b00001111, 0b00000000, 0b00000000, 0b01100110, 0b00000000, 0b00000000, 0b11100000, 0b00000111, 0b00000000, 0b00000000, 0b01100110, 0b00000000, 0b01000110, 0b11110000, 0b00000000, 0b11111000, 0b00000010, 0b00101111, 0b00101100, 0b00011111, 0b01111000, 0b11100000, 0b11111111, 0b10000000, 0b00001111, 0b01011100, 0b00001110, 0b11111000, 0b11100011, 0b00111111, 0b10000001, 0b10010111, 0b11110111, 0b10000101, 0b00111110, 0b11110001, 0b00001111, 0b11110000, 0b00011011, 0b00101111, 0b00000000, 0b10111100, 0b00000011, 0b00110000, 0b00000000, 0b11111111, 0b11110011, 0b00101111, 0b01000000, 0b00000011, 0b11111111, 0b01001111, 0b10001111, 0b11111110, 0b11111111, 0b01111100], # Node 29
-[0b00001100, 0b01100000, 0b00011100, 0b11110110, 0b00000001, 0b00100100, 0b01010000, 0b01000000, 0b00000000, 0b00101101, 0b10000000, 0b01101100, 0b00010110, 0b01000000, 0b10100001, 0b11010011, 0b00010111, 0b11010011, 0b01000001, 0b11011011, 0b00001110, 0b00010110, 0b01011110, 0b11001001, 0b10101010, 0b00001000, 0b01100010, 0b10100101, 0b01001101, 0b10101000, 0b10011100, 0b00111100, 0b00100111, 0b00010100, 0b10000100, 0b00100010, 0b01111101, 0b00111000, 0b00001100, 0b00001110, 0b11110111, 0b10000000, 0b11100101, 0b11101111, 0b00001011, 0b00000011, 0b01010101, 0b10111110, 0b01111010, 0b11110111, 0b11110010, 0b00000011, 0b11101011, 0b01000010, 0b10101011, 0b10001000, 0b00000000, 0b01111010, 0b10010111, 0b00110011, 0b01000111, 0b00000010, 0b00101100, 0b00011000, 0b01111010, 0b01100110, 0b00001010, 0b00000100, 0b10011110, 0b00101100, 0b00001000, 0b00101100, 0b10011000, 0b00000000, 0b10001110, 0b00010100, 0b10100101, 0b10001100, 0b00000000, 0b11001100, 0b01000000, 0b00001110, 0b01101000, 0b01110110, 0b01001001, 0b11010100, 0b00000101, 0b00011100, 0b00010110, 0b11111110, 0b00100110, 0b11110011, 0b00011011, 0b00111001, 0b00011100, 0b10101111, 0b00011010, 0b10000111], # Node 30
-[0b10101111, 0b11101011, 0b01111011, 0b00111110, 0b10011111, 0b00111001, 0b11100110, 0b00010111, 0b11110101, 0b01111100, 0b00011111, 0b11011011, 0b11111111, 0b01000111, 0b11111011, 0b11111111, 0b00111111, 0b11110111, 0b11111100, 0b01101111, 0b01111111, 0b11011111, 0b00111111, 0b00000000, 0b11101100, 0b11111111, 0b00000001, 0b11000000, 0b11111111, 0b00001111, 0b00000000, 0b11101010, 0b01111111, 0b00101000, 0b11000000, 0b11111110, 0b11000011, 0b00000111, 0b11111100, 0b00111111, 0b01111100, 0b10000100, 0b11111010, 0b10000001, 0b10000111, 0b01110111, 0b00111111, 0b11100000, 0b00110010, 0b11100111, 0b00000000, 0b11111111, 0b01110011, 0b00000111, 0b11111000, 0b10111111, 0b11110111, 0b11110001, 0b11111111, 0b01001011, 0b00001111, 0b11101011, 0b10110111, 0b01111111, 0b00110000, 0b11111110, 0b10110101, 0b10000011, 0b11110011, 0b01111111, 0b01111111, 0b10000000, 0b01111111, 0b11111001, 0b00000011, 0b11111100, 0b11111111, 0b01011110, 0b10000000, 0b01011111, 0b11001011, 0b00001010, 0b11110000, 0b11111101, 0b01110111, 0b00000001, 0b10111110, 0b10110010, 0b01011101, 0b01111011, 0b00100100, 0b10100011, 0b00111111, 0b01101111, 0b10010101, 0b11111110, 0b01111011, 0b00101110], # Node 31
-[0b01000100, 0b00000100, 0b00100100, 0b10100010, 0b11110000, 0b11010010, 0b10001010, 0b10001100, 0b00000000, 0b00111010, 0b11110011, 0b00000010, 0b00000000, 0b01000100, 0b00000001, 0b11010111, 0b00100110, 0b10001101, 0b11111100, 0b00010000, 0b01000110, 0b10000001, 0b10101110, 0b00101110, 0b00100010, 0b00001101, 0b01010100, 0b01100000, 0b10100000, 0b10001001, 0b00111110, 0b01001000, 0b00000100, 0b01110001, 0b00100000, 0b01000000, 0b00000000, 0b00001000, 0b00001100, 0b00000110, 0b01101001, 0b00000000, 0b10010010, 0b10100101, 0b00000101, 0b10000101, 0b11011000, 0b10110101, 0b00000110, 0b01000010, 0b00000111, 0b00000000, 0b01001000, 0b10110000, 0b00001010, 0b00001110, 0b00000111, 0b01001011, 0b00100100, 0b00100100, 0b00011010, 0b11100000, 0b10110000, 0b10010000, 0b00000001, 0b10001100, 0b10101000, 0b01001001, 0b01000001, 0b11110000, 0b00000100, 0b00000100, 0b10001110, 0b00001001, 0b10000010, 0b01100000, 0b10000111, 0b00101000, 0b10011111, 0b00000111, 0b01000000, 0b01000111, 0b11100110, 0b10001100, 0b00010011, 0b00100001, 0b00010110, 0b11000101, 0b00001010, 0b11000000, 0b00000010, 0b00001010, 0b01100100, 0b00100001, 0b00100000, 0b01101000, 0b00010011, 0b00000100], # Node 32
-[0b01100001, 0b00000000, 0b10100001, 0b00000010, 0b01011100, 0b00000011, 0b01000001, 0b00110100, 0b01000011, 0b00010000, 0b00101001, 0b00100010, 0b00000101, 0b01010000, 0b10000011, 0b11111110, 0b00000001, 0b10101010, 0b10010100, 0b11111111, 0b10001011, 0b10111011, 0b11110001, 0b01010010, 0b00100010, 0b10100000, 0b00001111, 0b00001000, 0b01000101, 0b10100011, 0b00010000, 0b10010011, 0b00000000, 0b11000000, 0b10111001, 0b00001001, 0b11000000, 0b00011101, 0b00100000, 0b00000001, 0b10001100, 0b00100000, 0b00000001, 0b01100000, 0b00000000, 0b10100010, 0b00000000, 0b00001110, 0b11000000, 0b00000000, 0b11100000, 0b00000000, 0b01100000, 0b00000000, 0b00001111, 0b00110000, 0b00101100, 0b11111100, 0b00000001, 0b11000101, 0b11110110, 0b00011111, 0b00111010, 0b11111001, 0b11111111, 0b10100001, 0b00101101, 0b11111110, 0b00000111, 0b01011110, 0b11111010, 0b00000111, 0b01110000, 0b01100101, 0b00111110, 0b10000000, 0b00110111, 0b11010010, 0b00000011, 0b10110000, 0b00000101, 0b00010010, 0b01010000, 0b00101000, 0b01001101, 0b00000100, 0b00000001, 0b01001000, 0b00000100, 0b00000000, 0b00010001, 0b01100110, 0b00000000, 0b01010000, 0b00101000, 0b10101001, 0b00010000, 0b00000011], # Node 33
-[0b11000001, 0b00110100, 0b01100000, 0b00000100, 0b00100000, 0b00000011, 0b11001000, 0b10000100, 0b10010111, 0b00010110, 0b00001001, 0b00000110, 0b10000011, 0b00010011, 0b01000110, 0b10000010, 0b10011010, 0b00010000, 0b10010010, 0b00111001, 0b10001011, 0b01000100, 0b00010000, 0b10001111, 0b10000010, 0b01001010, 0b11111001, 0b01100001, 0b00000000, 0b00110010, 0b01001110, 0b10000001, 0b11101100, 0b11000111, 0b01000010, 0b10110001, 0b01110111, 0b00000000, 0b01001000, 0b00011100, 0b10111000, 0b01010011, 0b01100000, 0b00110001, 0b10101110, 0b01100011, 0b11011000, 0b11110000, 0b10101101, 0b11100100, 0b11101011, 0b01010100, 0b01100101, 0b01101111, 0b01001111, 0b00011100, 0b01001101, 0b11010111, 0b11010100, 0b00000110, 0b00010100, 0b01111001, 0b00010110, 0b11101110, 0b11110011, 0b11110111, 0b00100100, 0b01101000, 0b01101101, 0b10000011, 0b10000100, 0b11111101, 0b11110101, 0b10100001, 0b00110001, 0b11001101, 0b00010011, 0b00000010, 0b01101101, 0b10010100, 0b00000010, 0b11100101, 0b11000001, 0b10000011, 0b00010100, 0b00110001, 0b00111000, 0b10010001, 0b01100011, 0b10000011, 0b01000011, 0b10010110, 0b00001010, 0b00000100, 0b01000101, 0b00010010, 0b00011001, 0b11000110], # Node 34
-[0b00100000, 0b10100000, 0b01011011, 0b10001001, 0b00011010, 0b10010001, 0b00110100, 0b10101000, 0b10000100, 0b01110111, 0b00100011, 0b10101001, 0b10001000, 0b01011100, 0b01010110, 0b10110100, 0b00110010, 0b01000111, 0b01110000, 0b00001011, 0b01000100, 0b00011100, 0b00001000, 0b01110000, 0b00111011, 0b01001110, 0b10000001, 0b00001110, 0b01010011, 0b01100111, 0b11111000, 0b10111001, 0b11111110, 0b00111111, 0b10001111, 0b10100010, 0b10110010, 0b01010001, 0b10110010, 0b01000000, 0b10111010, 0b10000100, 0b10101001, 0b01000100, 0b00101101, 0b01000100, 0b00001000, 0b10100110, 0b11010001, 0b00110100, 0b10010111, 0b01011110, 0b10111001, 0b00001100, 0b11010100, 0b10010111, 0b00000010, 0b01111010, 0b11001110, 0b10001110, 0b00101001, 0b00110100, 0b11100111, 0b11100100, 0b10110101, 0b00011011, 0b00100111, 0b11100101, 0b11110100, 0b10001000, 0b11010000, 0b00000110, 0b00100011, 0b10011000, 0b01010101, 0b10011110, 0b00010011, 0b00001000, 0b01001111, 0b11010110, 0b01001110, 0b00000100, 0b01001101, 0b00011011, 0b01010001, 0b11101000, 0b01010001, 0b00110100, 0b01100101, 0b10101101, 0b01110001, 0b01101110, 0b11001000, 0b00110011, 0b00100000, 0b01010100, 0b01001100, 0b10100000], # Node 35
-[0b01010011, 0b10111011, 0b01110000, 0b11001110, 0b11011001, 0b00111110, 0b00101010, 0b11000110, 0b11001011, 0b01110111, 0b10110010, 0b10110010, 0b11110001, 0b11100110, 0b10001111, 0b10111111, 0b11111101, 0b00111011, 0b00111011, 0b01011111, 0b00011101, 0b01101100, 0b00010111, 0b01100001, 0b01101101, 0b10101111, 0b01000101, 0b01011011, 0b10011111, 0b01010111, 0b11001001, 0b00001101, 0b11000100, 0b11001011, 0b10100000, 0b00011111, 0b00001100, 0b01001001, 0b00101011, 0b10111010, 0b00110101, 0b10011110, 0b11010010, 0b11010111, 0b10101001, 0b10011111, 0b11010110, 0b11101000, 0b11101111, 0b00000010, 0b01000001, 0b00010110, 0b00000000, 0b10011011, 0b00010101, 0b10101111, 0b00011011, 0b01001101, 0b10110101, 0b10101111, 0b00101000, 0b00001000, 0b11111111, 0b00111000, 0b10001010, 0b10011101, 0b11011101, 0b11010001, 0b11001000, 0b11110011, 0b10101111, 0b11111010, 0b11100011, 0b10010100, 0b00001100, 0b01001111, 0b11110111, 0b01000001, 0b01001101, 0b11000111, 0b00111011, 0b01101111, 0b01011001, 0b11111101, 0b11111011, 0b10110011, 0b00110000, 0b00011001, 0b10101110, 0b11011101, 0b01000101, 0b01011000, 0b11111110, 0b01110011, 0b01100010, 0b11111000, 0b10101001, 0b01000110], # Node 36
-[0b10111100, 0b01111010, 0b11101111, 0b01111111, 0b01010110, 0b11101101, 0b00011100, 0b00010100, 0b11011010, 0b00011111, 0b11010111, 0b01011100, 0b11111000, 0b11110101, 0b10101111, 0b00000110, 0b11001010, 0b10111011, 0b11001110, 0b10000100, 0b00100011, 0b01110010, 0b11101111, 0b00000101, 0b01111111, 0b10110100, 0b01000000, 0b10001111, 0b10100011, 0b10111101, 0b11001100, 0b10110110, 0b01110011, 0b10011001, 0b01100010, 0b10110100, 0b10010000, 0b01000110, 0b10100110, 0b00001111, 0b10111100, 0b11001101, 0b01110011, 0b10110010, 0b00101101, 0b00000111, 0b00001011, 0b00101101, 0b10001010, 0b11111111, 0b00001000, 0b11011011, 0b11110100, 0b11000010, 0b11001110, 0b01001000, 0b01110101, 0b01100111, 0b11101001, 0b11111010, 0b00011101, 0b01110101, 0b10100000, 0b00101110, 0b01110010, 0b01011110, 0b00110000, 0b10111111, 0b11111110, 0b11101011, 0b11110010, 0b00000111, 0b01001101, 0b01100000, 0b00000111, 0b00100111, 0b10101101, 0b10111110, 0b00010100, 0b11110010, 0b01111111, 0b10010101, 0b11111101, 0b11101110, 0b00110010, 0b10101001, 0b10101100, 0b10100011, 0b10010110, 0b11110101, 0b01010000, 0b00011011, 0b00101111, 0b11110111, 0b10011001, 0b10001010, 0b00000001, 0b01100110], # Node 37
-[0b10010010, 0b11111011, 0b00110011, 0b11111001, 0b11000010, 0b01011111, 0b01101100, 0b00000000, 0b00111111, 0b10111011, 0b11111011, 0b10011100, 0b00100001, 0b11111110, 0b10101110, 0b00110001, 0b10110101, 0b11111110, 0b01000101, 0b10110011, 0b11111101, 0b00011011, 0b00010101, 0b10010010, 0b10111111, 0b11111001, 0b01100010, 0b11111001, 0b10001001, 0b00110111, 0b11111001, 0b10111101, 0b00110100, 0b10100101, 0b01011000, 0b01100100, 0b01011000, 0b01010001, 0b11100001, 0b00110000, 0b00110010, 0b11011001, 0b01111111, 0b10111101, 0b10101110, 0b11000010, 0b01010110, 0b11110000, 0b11010010, 0b01011101, 0b11101101, 0b11110011, 0b01101101, 0b11000100, 0b10111100, 0b10111010, 0b01111110, 0b01010101, 0b11100101, 0b00100011, 0b10111110, 0b10010110, 0b10100001, 0b00000110, 0b01100001, 0b10111001, 0b01011010, 0b01011010, 0b01011101, 0b10101000, 0b00111101, 0b00111101, 0b00000111, 0b10000101, 0b00100000, 0b00001000, 0b01011101, 0b10101001, 0b10111011, 0b00001100, 0b10011101, 0b00101000, 0b01011011, 0b11110001, 0b01011001, 0b10110110, 0b11010010, 0b11010101, 0b01111011, 0b10111100, 0b10101001, 0b01011100, 0b00000000, 0b11010111, 0b01111011, 0b11101011, 0b10011001, 0b01000111], # Node 38
-[0b11011111, 0b11111101, 0b11011001, 0b01111001, 0b11010011, 0b10011011, 0b11011100, 0b11001111, 0b11101111, 0b10111111, 0b00111011, 0b01110111, 0b10000011, 0b10111111, 0b11010000, 0b01100110, 0b10011010, 0b00110100, 0b00011111, 0b01011111, 0b11011110, 0b11110001, 0b10111111, 0b10110101, 0b01111011, 0b01111000, 0b00000000, 0b01101010, 0b10001111, 0b00000011, 0b11010001, 0b10100110, 0b00111000, 0b10010000, 0b11100111, 0b11000001, 0b11000001, 0b11100011, 0b11101110, 0b01111101, 0b10111111, 0b10110111, 0b11011011, 0b11011111, 0b11111111, 0b00010111, 0b01111111, 0b11011010, 0b11111111, 0b11010111, 0b00001111, 0b11100100, 0b11011111, 0b11100001, 0b00000000, 0b11111010, 0b01000111, 0b01000100, 0b10000110, 0b01110111, 0b01000000, 0b00110111, 0b11111000, 0b00100101, 0b01110001, 0b11000110, 0b11101111, 0b11000010, 0b00110000, 0b10001110, 0b11000110, 0b00000001, 0b10010111, 0b10100110, 0b00111100, 0b10000000, 0b11010111, 0b11111101, 0b01000111, 0b11111111, 0b11101111, 0b11111110, 0b11111101, 0b11011001, 0b10100111, 0b11111100, 0b00101111, 0b11110111, 0b11111011, 0b01001101, 0b01111110, 0b00011011, 0b11100110, 0b01111110, 0b01101111, 0b11011111, 0b11110111, 0b11101111], # Node 39
-[0b00010010, 0b00001110, 0b10011100, 0b01100000, 0b10100101, 0b11110010, 0b00100001, 0b00011000, 0b00110000, 0b00100010, 0b01010000, 0b10000000, 0b00110000, 0b10010100, 0b00000100, 0b00100000, 0b00100110, 0b10000000, 0b10000000, 0b10110110, 0b00010010, 0b10010111, 0b01100000, 0b10101111, 0b01100100, 0b00000000, 0b11100100, 0b00011001, 0b11001000, 0b11111000, 0b10111111, 0b00100001, 0b11110101, 0b11111111, 0b10001110, 0b11000011, 0b01110110, 0b01111111, 0b10010000, 0b11010111, 0b10101011, 0b00001101, 0b01100001, 0b00100000, 0b01110000, 0b00000000, 0b00101011, 0b01011011, 0b00001101, 0b00110001, 0b01011110, 0b00100000, 0b00100001, 0b11111001, 0b00101011, 0b10101011, 0b01111010, 0b01011100, 0b11101110, 0b10001001, 0b11101111, 0b11001000, 0b00000000, 0b01011111, 0b01101010, 0b01011101, 0b00000011, 0b11001111, 0b01100111, 0b00100011, 0b11100011, 0b00111111, 0b01011110, 0b11001000, 0b11111110, 0b00100110, 0b10001001, 0b11100011, 0b11101011, 0b01000011, 0b01000010, 0b01011111, 0b01100111, 0b00000000, 0b00100000, 0b00111011, 0b10000000, 0b00000000, 0b01100001, 0b01100000, 0b01001100, 0b00001000, 0b01000010, 0b01000100, 0b00000000, 0b10000000, 0b11000000, 0b00000010], # Node 40
-[0b00011011, 0b00111011, 0b01000101, 0b10110100, 0b01111101, 0b11100010, 0b00110110, 0b11001010, 0b00100011, 0b11000100, 0b00010011, 0b01010110, 0b01101000, 0b00010000, 0b00000000, 0b01001010, 0b10111011, 0b10000100, 0b10010011, 0b00100000, 0b00111110, 0b01001010, 0b00110101, 0b01010111, 0b11000000, 0b10101001, 0b11010100, 0b01111101, 0b11000000, 0b01111110, 0b00001010, 0b11000011, 0b11100101, 0b00000100, 0b11010110, 0b10111101, 0b10011100, 0b11000111, 0b10011010, 0b01011101, 0b11011011, 0b10011100, 0b10010000, 0b01000010, 0b11001100, 0b10100111, 0b01101101, 0b01000011, 0b11100110, 0b11000000, 0b10010101, 0b00111010, 0b00000110, 0b10100111, 0b11101110, 0b00100100, 0b11101101, 0b01011110, 0b01100010, 0b01100001, 0b01000010, 0b00010001, 0b10001010, 0b01001100, 0b00101010, 0b11101101, 0b00000000, 0b00100011, 0b01000001, 0b11111000, 0b11010001, 0b11011011, 0b00101100, 0b00110000, 0b00101000, 0b01110101, 0b01010110, 0b01010011, 0b01001100, 0b00011111, 0b00111100, 0b11000110, 0b00100110, 0b00011101, 0b01000100, 0b01101000, 0b10100010, 0b01011100, 0b01100101, 0b00100001, 0b11010100, 0b00110011, 0b11010110, 0b00000011, 0b00111110, 0b01100010, 0b00000001, 0b10101100], # Node 41
-[0b11110111, 0b11011011, 0b11110111, 0b10111111, 0b11101111, 0b11111110, 0b00111111, 0b11111110, 0b11111110, 0b01110111, 0b10111110, 0b10110111, 0b11110010, 0b11101111, 0b11110101, 0b11111011, 0b11011110, 0b11011001, 0b11101100, 0b01111100, 0b01111111, 0b01110001, 0b11001101, 0b01011111, 0b11111111, 0b01110101, 0b11010000, 0b11111101, 0b00111110, 0b01100100, 0b11111000, 0b01111101, 0b11110010, 0b11010100, 0b11111111, 0b11101111, 0b00111110, 0b11101100, 0b11111100, 0b10001101, 0b11100000, 0b11111111, 0b11001011, 0b11000011, 0b11011011, 0b00101101, 0b00011011, 0b10010101, 0b11011010, 0b11101101, 0b00100011, 0b01111110, 0b11011101, 0b01110111, 0b11110111, 0b10011111, 0b01111111, 0b10010101, 0b11001000, 0b01111101, 0b11010111, 0b00101111, 0b11111100, 0b11111011, 0b11111111, 0b10100011, 0b11111111, 0b11101101, 0b01000110, 0b11100000, 0b11010111, 0b10011010, 0b11101011, 0b10111011, 0b10111101, 0b11000100, 0b11111011, 0b11100101, 0b11011011, 0b10101100, 0b11111001, 0b01111001, 0b00100011, 0b11111100, 0b11111111, 0b01111011, 0b01011010, 0b01101011, 0b01110111, 0b11101111, 0b11111111, 0b01011111, 0b11111011, 0b01111111, 0b10011111, 0b01111111, 0b11111110, 0b10100111], # Node 42
-[0b11010011, 0b00000000, 0b00100000, 0b10100011, 0b00001000, 0b10011101, 0b00110101, 0b01110001, 0b10101100, 0b00000010, 0b11100000, 0b10010001, 0b01010100, 0b01000101, 0b01110100, 0b11001100, 0b00000100, 0b10011001, 0b10010010, 0b01010101, 0b00001110, 0b00100010, 0b11000100, 0b01010100, 0b01000011, 0b10100101, 0b01111110, 0b01001100, 0b11111000, 0b01010110, 0b11111000, 0b00001000, 0b00010011, 0b11101110, 0b10000001, 0b00100100, 0b10011001, 0b10000000, 0b00101101, 0b00111100, 0b01111100, 0b10001001, 0b10101000, 0b00000101, 0b00101011, 0b01100100, 0b10010001, 0b11100110, 0b00000001, 0b10010010, 0b10101101, 0b01001111, 0b01010010, 0b00110111, 0b11001100, 0b00011001, 0b01111010, 0b01111010, 0b01100000, 0b00100000, 0b01111100, 0b01000101, 0b00010110, 0b01100110, 0b11100000, 0b10011001, 0b11011011, 0b10111011, 0b00100010, 0b01001100, 0b00111000, 0b11001001, 0b01111101, 0b00110010, 0b00100010, 0b10110011, 0b01000111, 0b01110001, 0b11011000, 0b00110111, 0b11001001, 0b01110000, 0b00010000, 0b00100010, 0b01110010, 0b01010011, 0b01001000, 0b01000101, 0b10001110, 0b10011000, 0b01000111, 0b00011111, 0b10011011, 0b01010011, 0b00010101, 0b11001101, 0b11010100, 0b00010000], # Node 43
-[0b01001100, 0b00001101, 0b10110111, 0b11111110, 0b11111111, 0b11111110, 0b00001110, 0b11101101, 0b11011010, 0b11111110, 0b10110101, 0b11111010, 0b01111111, 0b01001111, 0b11111101, 0b00011001, 0b00110111, 0b01100110, 0b11011101, 0b01011111, 0b11011111, 0b01101110, 0b00111111, 0b11111000, 0b00111101, 0b10011010, 0b00011100, 0b11111100, 0b10110011, 0b10100111, 0b01110001, 0b01111110, 0b11101001, 0b11111100, 0b11111101, 0b01011111, 0b11000001, 0b11111100, 0b10010111, 0b01001101, 0b11110100, 0b11110111, 0b01111110, 0b01010001, 0b01110101, 0b01111111, 0b00010111, 0b11100000, 0b10001010, 0b11110111, 0b00011011, 0b11111010, 0b11111110, 0b01111110, 0b10100010, 0b01111111, 0b11110101, 0b11100101, 0b10110011, 0b10111111, 0b11010101, 0b10011011, 0b10111111, 0b01110101, 0b10111011, 0b11100011, 0b11011111, 0b11101111, 0b10001111, 0b11101110, 0b11111111, 0b01101111, 0b01110001, 0b11011011, 0b11111111, 0b00100011, 0b11101011, 0b00010001, 0b00001001, 0b11110010, 0b01111111, 0b00111110, 0b11110100, 0b11101111, 0b11101111, 0b11111100, 0b01111011, 0b01111000, 0b01110111, 0b11111101, 0b01110111, 0b01111111, 0b11111011, 0b01111101, 0b00111011, 0b11101101, 0b10010111, 0b00011011], # Node 44
-[0b11011101, 0b11110101, 0b01011011, 0b10011100, 0b11011010, 0b11011011, 0b11111111, 0b11111111, 0b11111100, 0b10111111, 0b01101001, 0b11011100, 0b11111111, 0b11011111, 0b10001100, 0b11111111, 0b11111111, 0b11111111, 0b01011111, 0b11100000, 0b11000111, 0b00111110, 0b00000011, 0b11111110, 0b10111110, 0b00000010, 0b00000000, 0b10101000, 0b00101111, 0b00000000, 0b00000000, 0b11101000, 0b10000001, 0b01000001, 0b11000000, 0b00111111, 0b00001100, 0b00000001, 0b11110000, 0b11000010, 0b00110001, 0b10110000, 0b00011011, 0b00001110, 0b00000111, 0b10111011, 0b11110000, 0b01111111, 0b01101100, 0b11100011, 0b10111111, 0b00000111, 0b11110111, 0b11111110, 0b11111111, 0b01110000, 0b11111111, 0b11111111, 0b00111111, 0b11110111, 0b11111100, 0b11111111, 0b10110000, 0b00011011, 0b11111101, 0b00110111, 0b11001111, 0b11100001, 0b00111111, 0b11110001, 0b00011110, 0b11111100, 0b11010111, 0b01111111, 0b00000010, 0b01000110, 0b11101000, 0b00111101, 0b00000000, 0b11010001, 0b10101111, 0b00000010, 0b11000000, 0b11111111, 0b01001101, 0b10000001, 0b11101110, 0b11001001, 0b01100110, 0b10111010, 0b01111110, 0b10011011, 0b10001101, 0b10011000, 0b00101001, 0b11111111, 0b11111111, 0b10011101], # Node 45
-[0b00000100, 0b01000000, 0b01001000, 0b10000011, 0b00000000, 0b00010100, 0b00001001, 0b01100000, 0b00100110, 0b00010110, 0b01000000, 0b00010001, 0b01111001, 0b00010011, 0b00100010, 0b01100100, 0b10110001, 0b10011010, 0b10010101, 0b11111111, 0b00010101, 0b00100000, 0b00011010, 0b01011110, 0b00000010, 0b11100100, 0b11000000, 0b00111001, 0b11110001, 0b11100100, 0b00011110, 0b10001000, 0b00011100, 0b11001101, 0b11000000, 0b10110000, 0b01111010, 0b10000110, 0b00111100, 0b11000010, 0b00111011, 0b11010010, 0b00000001, 0b11111111, 0b10000010, 0b00000011, 0b10100101, 0b00011111, 0b01101010, 0b00001000, 0b11001001, 0b10011010, 0b10011100, 0b11011100, 0b01010101, 0b00110000, 0b10000010, 0b00101001, 0b00000110, 0b00000000, 0b00100000, 0b11110000, 0b10011100, 0b11000000, 0b00100110, 0b10000110, 0b11000001, 0b10010110, 0b00100001, 0b00000000, 0b11100010, 0b10011001, 0b00010100, 0b00100000, 0b11110110, 0b01010111, 0b00010011, 0b11000010, 0b11111000, 0b00010111, 0b01010001, 0b00011010, 0b00011100, 0b00011010, 0b01000010, 0b01000110, 0b00110010, 0b00000000, 0b00100000, 0b10000000, 0b10010100, 0b11010000, 0b00000001, 0b00111101, 0b10001111, 0b00111001, 0b10000000, 0b10000000], # Node 46
-[0b00000000, 0b11101111, 0b10000111, 0b11111111, 0b01011001, 0b10000111, 0b10111111, 0b10111100, 0b11001111, 0b10111111, 0b11111010, 0b11111011, 0b11111110, 0b11010110, 0b11110101, 0b11100010, 0b01111101, 0b11101110, 0b01111111, 0b11000100, 0b10111101, 0b11010111, 0b01100010, 0b10101111, 0b01111111, 0b00011111, 0b11001000, 0b10011111, 0b11010110, 0b00100011, 0b00001111, 0b11101000, 0b00101110, 0b11101010, 0b11100110, 0b00111110, 0b01000001, 0b01111101, 0b00110000, 0b01000111, 0b00100010, 0b11111011, 0b00001001, 0b01110010, 0b10000110, 0b01000111, 0b11001110, 0b00000110, 0b01000110, 0b01100111, 0b11010001, 0b11110000, 0b00011111, 0b10111111, 0b11100100, 0b11001011, 0b11000111, 0b11101011, 0b10101001, 0b11011011, 0b00110111, 0b10111111, 0b11001011, 0b01110101, 0b10001100, 0b10000100, 0b00011111, 0b11110111, 0b11001110, 0b01110100, 0b11111101, 0b01010011, 0b11101110, 0b11111001, 0b01001101, 0b10110000, 0b11111100, 0b00110110, 0b01111111, 0b11110011, 0b01110110, 0b01111100, 0b01110111, 0b11111000, 0b11011111, 0b11001101, 0b11011001, 0b01011111, 0b11111101, 0b11010111, 0b11111111, 0b01111100, 0b01010101, 0b10111111, 0b10101111, 0b00101001, 0b11011000, 0b11110110], # Node 47
-[0b10001001, 0b10110001, 0b00000000, 0b10000111, 0b00000100, 0b01000000, 0b11000100, 0b00110000, 0b11010011, 0b00110101, 0b00001001, 0b00001011, 0b00110011, 0b10010010, 0b00010101, 0b01001111, 0b01111100, 0b00101010, 0b10001100, 0b11001001, 0b00110101, 0b00100100, 0b00101101, 0b00010101, 0b11000000, 0b11111111, 0b10110101, 0b10110010, 0b00100000, 0b11110010, 0b00000001, 0b10001001, 0b11001010, 0b01101100, 0b00000111, 0b11001100, 0b11110001, 0b10111000, 0b01000010, 0b11101001, 0b01111011, 0b01011001, 0b11110000, 0b10001111, 0b00110001, 0b00101011, 0b10110001, 0b00111100, 0b01100100, 0b11111001, 0b10111100, 0b00000001, 0b01011110, 0b11001011, 0b01111001, 0b00001101, 0b00001000, 0b00011100, 0b00000111, 0b10100100, 0b01111101, 0b10001111, 0b11000011, 0b01010100, 0b00101110, 0b00000101, 0b01011110, 0b11010011, 0b10110111, 0b11000011, 0b00000000, 0b01010000, 0b10000001, 0b01010010, 0b10000110, 0b11100000, 0b01010001, 0b00000000, 0b00010000, 0b01011000, 0b01101001, 0b00000001, 0b11110010, 0b01010000, 0b01001010, 0b11100001, 0b01000011, 0b01100001, 0b01011100, 0b11110110, 0b00011111, 0b11010101, 0b10110100, 0b10001101, 0b00010001, 0b11001000, 0b11011111, 0b01100100], # Node 48
-[0b01011110, 0b01110110, 0b01011000, 0b11100011, 0b11011100, 0b11101111, 0b11000111, 0b01001111, 0b10101001, 0b10000000, 0b00011001, 0b01111101, 0b01101110, 0b10100110, 0b00100111, 0b11111010, 0b01101101, 0b11111100, 0b11101101, 0b10010101, 0b10011101, 0b00011010, 0b11111011, 0b10011110, 0b01110100, 0b01010010, 0b11010100, 0b00011011, 0b01000011, 0b00110111, 0b01000101, 0b01011001, 0b01010101, 0b10110011, 0b00011111, 0b00010110, 0b10111101, 0b11111110, 0b11101010, 0b10000000, 0b01100101, 0b11101000, 0b11111010, 0b00110011, 0b10010100, 0b11001001, 0b11010011, 0b01111110, 0b10000101, 0b11101101, 0b11000111, 0b00000101, 0b10100001, 0b00010101, 0b00110010, 0b01000001, 0b00100111, 0b00001101, 0b11010101, 0b10111110, 0b11100000, 0b11100011, 0b10011001, 0b01001101, 0b01001011, 0b01101000, 0b01010001, 0b00101101, 0b01111011, 0b01100111, 0b10010111, 0b01111100, 0b10101110, 0b11111100, 0b00010010, 0b10110111, 0b11000011, 0b01001011, 0b01101000, 0b00110110, 0b11111100, 0b11110101, 0b11000000, 0b11110101, 0b11110101, 0b00101001, 0b01001111, 0b01111110, 0b10101010, 0b11101011, 0b00111110, 0b00111111, 0b10111111, 0b00110101, 0b11110111, 0b11001100, 0b00101100, 0b11010000], # Node 49
-[0b00000000, 0b10000000, 0b10000001, 0b10100000, 0b00001000, 0b10000010, 0b00000010, 0b10001001, 0b10110100, 0b10110110, 0b01011000, 0b00000111, 0b00110011, 0b10010000, 0b11001010, 0b01011111, 0b00100000, 0b00001010, 0b00111000, 0b00100011, 0b11000011, 0b00011001, 0b00011101, 0b01000101, 0b10001010, 0b00000101, 0b00001001, 0b00000000, 0b00100000, 0b00000110, 0b00000000, 0b01001000, 0b00111000, 0b00010001, 0b00010000, 0b11000110, 0b10100000, 0b00000101, 0b10000010, 0b10001100, 0b01111110, 0b11001000, 0b01010010, 0b01000100, 0b00000000, 0b01100101, 0b00110111, 0b11101110, 0b01100100, 0b00000001, 0b10010101, 0b01100010, 0b10000111, 0b11111010, 0b01001010, 0b01111111, 0b11110010, 0b11111101, 0b01100001, 0b01010101, 0b10111000, 0b10111111, 0b00001011, 0b01010011, 0b10011001, 0b01010101, 0b01000000, 0b01000010, 0b11011000, 0b01100101, 0b01001001, 0b11100110, 0b00101101, 0b00110001, 0b00000010, 0b00011100, 0b00010000, 0b00100010, 0b11000010, 0b11010001, 0b00111110, 0b00000001, 0b00010110, 0b10000100, 0b00001001, 0b00010000, 0b00100100, 0b00001010, 0b00001011, 0b10001010, 0b10000000, 0b00101010, 0b01000011, 0b01010000, 0b10000000, 0b10100100, 0b10110100, 0b11000000], # Node 50
-[0b00000000, 0b11000100, 0b00001100, 0b01000101, 0b01100010, 0b00011100, 0b00111100, 0b01011101, 0b01100101, 0b01001001, 0b01100010, 0b01001011, 0b00011111, 0b00000110, 0b10001101, 0b10010100, 0b00111100, 0b11100000, 0b10110011, 0b01011011, 0b00000001, 0b11000011, 0b11011110, 0b11100010, 0b10110010, 0b01100001, 0b00011101, 0b00001010, 0b10111001, 0b00100110, 0b10111010, 0b10010000, 0b01100010, 0b01011111, 0b00001110, 0b00000111, 0b11111000, 0b10100000, 0b11110110, 0b11011000, 0b00011111, 0b00010000, 0b11001100, 0b11000000, 0b10101000, 0b00010011, 0b01100101, 0b00011110, 0b10100000, 0b10110101, 0b11101101, 0b10110000, 0b01100010, 0b11011000, 0b00000010, 0b11010000, 0b11100000, 0b00100011, 0b10001010, 0b00000001, 0b01001101, 0b10110111, 0b00100111, 0b01001110, 0b01000011, 0b11001001, 0b00000001, 0b10101100, 0b01111001, 0b10111110, 0b00101001, 0b01101011, 0b00110110, 0b00010101, 0b10011011, 0b00001101, 0b01000100, 0b11010001, 0b01010001, 0b01000100, 0b10001000, 0b10100000, 0b10100100, 0b11000000, 0b01111010, 0b01000110, 0b01000000, 0b00000100, 0b00000000, 0b10000100, 0b01100000, 0b00011101, 0b10100101, 0b01011011, 0b00000001, 0b01110000, 0b00001010, 0b11100110], # Node 51
-[0b11000011, 0b00110000, 0b00000110, 0b00100000, 0b00001000, 0b00000001, 0b01000110, 0b00000110, 0b00001010, 0b01011100, 0b00000101, 0b10010100, 0b11010000, 0b00001000, 0b00000000, 0b11000111, 0b00011111, 0b00001000, 0b00001100, 0b11111010, 0b10000011, 0b00100100, 0b11100010, 0b01011111, 0b00001100, 0b00100010, 0b10100001, 0b00111111, 0b00001101, 0b00010000, 0b01011100, 0b11010010, 0b00010000, 0b11000000, 0b10011111, 0b01000100, 0b00001000, 0b11111100, 0b00000001, 0b00000001, 0b11000001, 0b01111111, 0b00000110, 0b00000100, 0b11111100, 0b00101001, 0b01000011, 0b11100001, 0b10010010, 0b00000001, 0b00000011, 0b11110110, 0b11000100, 0b11111010, 0b10111011, 0b11100001, 0b10001101, 0b10011111, 0b01000010, 0b00100011, 0b11111010, 0b00101011, 0b01010010, 0b01111000, 0b11110111, 0b10100010, 0b00000010, 0b11111111, 0b00111111, 0b10110000, 0b11110100, 0b00111111, 0b11000110, 0b10001000, 0b11111110, 0b00000110, 0b11100000, 0b11110110, 0b00111111, 0b00000000, 0b10111100, 0b00000011, 0b00000000, 0b00000111, 0b00111001, 0b00100100, 0b00010010, 0b11000000, 0b11000000, 0b01000000, 0b00011000, 0b00111000, 0b00001000, 0b11101000, 0b00001100, 0b10001101, 0b00000000, 0b00000101], # Node 52
-[0b00111001, 0b11000000, 0b11000010, 0b00011100, 0b01110011, 0b11110100, 0b10110000, 0b10010001, 0b00101001, 0b00000010, 0b10001111, 0b00110010, 0b00110000, 0b10011010, 0b00111011, 0b10000100, 0b00010001, 0b00001100, 0b01000100, 0b00010100, 0b01010101, 0b00111100, 0b01010001, 0b10010000, 0b10010101, 0b10001110, 0b01010101, 0b10110111, 0b01110100, 0b11100100, 0b00111001, 0b10111110, 0b10110100, 0b10011000, 0b01000011, 0b10000000, 0b00001001, 0b00010010, 0b10100010, 0b01001000, 0b10100110, 0b11111010, 0b00100000, 0b01000100, 0b00011010, 0b10110011, 0b11100101, 0b11110011, 0b00000100, 0b01110111, 0b01100000, 0b01011110, 0b00100000, 0b00011100, 0b10011011, 0b00010100, 0b11100000, 0b10101001, 0b00101000, 0b01100110, 0b10001000, 0b11101010, 0b01010000, 0b11001101, 0b01110111, 0b10000011, 0b11110001, 0b00101000, 0b01010000, 0b11000001, 0b01000000, 0b01110001, 0b11011000, 0b01101000, 0b10011010, 0b11011011, 0b11001110, 0b11011111, 0b10000111, 0b00011010, 0b11001011, 0b10110110, 0b00101011, 0b11100110, 0b00110011, 0b00011101, 0b10000111, 0b11111001, 0b01101000, 0b11000000, 0b00100000, 0b10001010, 0b00010110, 0b00111101, 0b11011000, 0b01110100, 0b11010101, 0b10010001], # Node 53
-[0b11101011, 0b11011111, 0b11111111, 0b01100111, 0b01101111, 0b01101101, 0b11011111, 0b01110101, 0b11110111, 0b11110110, 0b10110111, 0b11111011, 0b01001101, 0b11111111, 0b11111101, 0b11111111, 0b10111111, 0b01111111, 0b10111111, 0b11111000, 0b10111001, 0b11011111, 0b11111111, 0b10101110, 0b11111111, 0b10111111, 0b11010000, 0b10110011, 0b10101111, 0b11010000, 0b11111110, 0b11111111, 0b01100111, 0b00101101, 0b01111110, 0b01111110, 0b00111111, 0b11111001, 0b01111011, 0b10010011, 0b10001000, 0b11101010, 0b01111110, 0b11000010, 0b10010100, 0b11111111, 0b10101110, 0b11000101, 0b11111111, 0b10111111, 0b00110000, 0b11001100, 0b10001101, 0b10110111, 0b01100010, 0b10011010, 0b10111111, 0b01101101, 0b11111110, 0b01110111, 0b10111111, 0b11000111, 0b11111111, 0b10011111, 0b00101101, 0b11111100, 0b11001111, 0b00111001, 0b10000010, 0b10111111, 0b11101110, 0b10101101, 0b11110101, 0b11101011, 0b00001101, 0b11000110, 0b11011001, 0b11011111, 0b11110110, 0b11111111, 0b11111111, 0b10110111, 0b11101011, 0b10111101, 0b01111111, 0b11111111, 0b11111111, 0b11011111, 0b10011111, 0b11010111, 0b01111101, 0b11111111, 0b11111101, 0b10111111, 0b10111011, 0b01111110, 0b00110011, 0b10111111], # Node 54
-[0b01011011, 0b00110011, 0b11110011, 0b10100100, 0b00010011, 0b11001011, 0b01100011, 0b11111001, 0b01111010, 0b01111110, 0b01100101, 0b01011101, 0b00111010, 0b10100110, 0b01010110, 0b10111111, 0b00010100, 0b01110110, 0b01101010, 0b00111000, 0b11101011, 0b11101111, 0b10010000, 0b11111100, 0b01001110, 0b10010011, 0b00101111, 0b00111011, 0b01010000, 0b10010001, 0b01101011, 0b11001001, 0b10101101, 0b11110100, 0b00001001, 0b11101110, 0b11011110, 0b10101101, 0b10110100, 0b11010010, 0b01101101, 0b11100001, 0b01101110, 0b00111100, 0b10011001, 0b00011111, 0b01011011, 0b01011101, 0b11110111, 0b11111100, 0b01001101, 0b11000101, 0b11100001, 0b11011000, 0b01111100, 0b00010111, 0b11110001, 0b11101111, 0b11101101, 0b11011111, 0b11110110, 0b10001100, 0b10010010, 0b00010110, 0b11111010, 0b00101010, 0b00001111, 0b00110010, 0b10001011, 0b10000011, 0b01111111, 0b00010010, 0b00101111, 0b10000110, 0b10101110, 0b10101110, 0b11001101, 0b10011011, 0b11110110, 0b01100011, 0b01010101, 0b11101110, 0b01110111, 0b10011100, 0b00001011, 0b10011010, 0b11011111, 0b11111000, 0b01101011, 0b11011110, 0b11110110, 0b10001111, 0b01001110, 0b00110110, 0b11001100, 0b11010110, 0b01111010, 0b00110111], # Node 55
-[0b00001010, 0b10111001, 0b11110101, 0b10101010, 0b11110100, 0b11001011, 0b11100011, 0b11111001, 0b11011111, 0b11111110, 0b00110110, 0b00000101, 0b01000000, 0b11011111, 0b00001000, 0b00000000, 0b11111010, 0b01001111, 0b00000000, 0b11100000, 0b11111111, 0b00000000, 0b10000000, 0b11101000, 0b00001111, 0b00000000, 0b01000000, 0b11111100, 0b00000000, 0b00001000, 0b11110100, 0b00000111, 0b11110000, 0b10000011, 0b11111110, 0b11000001, 0b00111111, 0b11110000, 0b00000111, 0b11111111, 0b01000011, 0b01111111, 0b11111110, 0b00111111, 0b11111011, 0b10011101, 0b11111111, 0b11010011, 0b11011111, 0b11111001, 0b00111111, 0b11110011, 0b10011001, 0b11111110, 0b01110000, 0b10011110, 0b11100000, 0b00001101, 0b00000110, 0b00010000, 0b11110000, 0b00111000, 0b10000000, 0b11000000, 0b10011111, 0b00001101, 0b00100000, 0b11110000, 0b11111111, 0b00000000, 0b00000011, 0b10111100, 0b10011101, 0b00110000, 0b10000000, 0b00101111, 0b00000101, 0b00000001, 0b11111100, 0b11110100, 0b00000100, 0b11100000, 0b11111111, 0b00011111, 0b00000101, 0b11010110, 0b11111111, 0b00100111, 0b00000000, 0b11111010, 0b01011111, 0b01110110, 0b00000110, 0b11111100, 0b11111000, 0b00001110, 0b00000000, 0b11011111], # Node 56
-[0b11011100, 0b10100001, 0b01100000, 0b01001000, 0b10010001, 0b00110001, 0b10101110, 0b10101000, 0b10011111, 0b11001001, 0b01000011, 0b00010100, 0b01101101, 0b01100010, 0b00101100, 0b10000110, 0b10000000, 0b10001100, 0b00010000, 0b00000100, 0b00111001, 0b01101010, 0b11100110, 0b01101100, 0b00001001, 0b10110100, 0b00110011, 0b00001000, 0b00111110, 0b00100001, 0b00000110, 0b00000011, 0b01010011, 0b01011000, 0b00010010, 0b00010010, 0b00000100, 0b10011000, 0b10000101, 0b01110110, 0b01010000, 0b00101001, 0b00001011, 0b11001011, 0b00100110, 0b00000010, 0b01001100, 0b01111100, 0b11011000, 0b10000110, 0b00111000, 0b10011001, 0b10110101, 0b10000001, 0b01010011, 0b01000110, 0b01101110, 0b00100110, 0b11100001, 0b11000100, 0b00100110, 0b00101110, 0b01000000, 0b10101011, 0b01011111, 0b01010110, 0b01011001, 0b00001100, 0b11000100, 0b00010000, 0b00000000, 0b11010101, 0b10101100, 0b01100010, 0b00001110, 0b11011110, 0b10011100, 0b00011000, 0b00111011, 0b11000100, 0b01011100, 0b00000100, 0b01001010, 0b01101000, 0b11010101, 0b10011001, 0b10000011, 0b10011100, 0b01000101, 0b11001001, 0b10100111, 0b11010000, 0b00000001, 0b00011101, 0b11101001, 0b11110010, 0b00111110, 0b11010100], # Node 57
-[0b11110000, 0b00001101, 0b01010001, 0b00111001, 0b01001000, 0b00000010, 0b11010001, 0b00101010, 0b01111100, 0b00011011, 0b11100010, 0b01101100, 0b00000100, 0b01001000, 0b00011111, 0b00110000, 0b10011101, 0b10010001, 0b01100011, 0b00100101, 0b11101000, 0b00101010, 0b00010111, 0b00100011, 0b00111111, 0b01101000, 0b11110111, 0b00100010, 0b10000100, 0b11110000, 0b01110001, 0b00111000, 0b01001000, 0b01100111, 0b00001000, 0b10100001, 0b11011111, 0b00101000, 0b10010110, 0b11101010, 0b11100010, 0b10111101, 0b11110001, 0b10011111, 0b00001000, 0b10000100, 0b01010011, 0b11011111, 0b10001110, 0b01111101, 0b01011010, 0b01010010, 0b00100111, 0b11100101, 0b10010000, 0b11111000, 0b11111000, 0b00110110, 0b10001010, 0b10101000, 0b01101101, 0b01100101, 0b10010011, 0b11010111, 0b01110010, 0b01111001, 0b00011111, 0b01110100, 0b11001100, 0b10000011, 0b11100010, 0b00111101, 0b11001101, 0b00000101, 0b10101111, 0b01011010, 0b01100100, 0b00000001, 0b00100100, 0b10010101, 0b01100010, 0b10000110, 0b10101001, 0b10111000, 0b11100000, 0b11001101, 0b10110010, 0b10011100, 0b10101000, 0b10010110, 0b10001000, 0b10000010, 0b00000001, 0b00010101, 0b11111010, 0b11011000, 0b10000110, 0b11001101], # Node 58
-[0b10111110, 0b01100001, 0b11000001, 0b11011111, 0b00001100, 0b11001111, 0b11111111, 0b11011010, 0b11101010, 0b11111100, 0b11101110, 0b01001010, 0b00111011, 0b00101101, 0b10011000, 0b01000010, 0b00110100, 0b01000101, 0b10001101, 0b11000110, 0b11000111, 0b01111000, 0b10011111, 0b01100000, 0b10101111, 0b01101100, 0b11001101, 0b01010011, 0b11110110, 0b00101001, 0b11100011, 0b01000110, 0b00001000, 0b11001111, 0b00001010, 0b11010000, 0b01110010, 0b11100001, 0b01110011, 0b10100110, 0b10011000, 0b11010110, 0b11101110, 0b00010010, 0b11101101, 0b11011111, 0b00110110, 0b10001000, 0b01100110, 0b10101000, 0b11000011, 0b00011001, 0b00111101, 0b10100010, 0b00011111, 0b11110010, 0b01101111, 0b11000111, 0b11110000, 0b11101001, 0b10010001, 0b10010111, 0b11000110, 0b11111010, 0b01101010, 0b10110111, 0b10101101, 0b00101110, 0b11010010, 0b01100110, 0b11110111, 0b01001011, 0b00111001, 0b10101001, 0b00001100, 0b10000100, 0b11111000, 0b01100111, 0b00001001, 0b10101001, 0b01010001, 0b11000111, 0b11010111, 0b01110101, 0b11100101, 0b11010111, 0b00001110, 0b11110111, 0b00101110, 0b00111100, 0b11010001, 0b10101001, 0b01010001, 0b11110000, 0b00111101, 0b11111101, 0b10000110, 0b10100110], # Node 59
-[0b10010011, 0b01100000, 0b11000001, 0b11010010, 0b11011011, 0b11100110, 0b11100110, 0b11100100, 0b11011110, 0b11010111, 0b01010011, 0b11110111, 0b00000111, 0b01111011, 0b01001010, 0b10010011, 0b11001001, 0b11111010, 0b10010001, 0b10011001, 0b01100000, 0b10000100, 0b10011101, 0b11101010, 0b01001000, 0b10010111, 0b00100111, 0b11000101, 0b10011110, 0b01110110, 0b10001010, 0b00111011, 0b01001011, 0b10011111, 0b01111111, 0b11110110, 0b10011101, 0b11100111, 0b01001111, 0b01001010, 0b01110110, 0b10111110, 0b01111011, 0b01101111, 0b11101010, 0b00110100, 0b11000011, 0b01000101, 0b00101111, 0b11110111, 0b01001111, 0b10111001, 0b11001011, 0b01010111, 0b10101001, 0b11100101, 0b11000011, 0b00110001, 0b10001111, 0b01111111, 0b01010111, 0b00000111, 0b11101101, 0b00010101, 0b01100000, 0b11101111, 0b01010110, 0b00111000, 0b00111111, 0b11101101, 0b10001001, 0b01111111, 0b00010010, 0b10011011, 0b11110011, 0b11110101, 0b01100110, 0b11100010, 0b00000110, 0b11110001, 0b11010110, 0b10111101, 0b01010000, 0b11101110, 0b11011101, 0b11101110, 0b10100101, 0b11100010, 0b01011110, 0b00000010, 0b11110011, 0b00101010, 0b10101110, 0b11101010, 0b10011101, 0b10111001, 0b11011101, 0b00111001], # Node 60
-[0b01110111, 0b11011101, 0b11111111, 0b11011111, 0b10010111, 0b01011011, 0b00111101, 0b11110001, 0b00011101, 0b11100011, 0b11111101, 0b11011111, 0b11110000, 0b10011011, 0b11101010, 0b00000110, 0b11110000, 0b01110011, 0b00111111, 0b00000000, 0b11111000, 0b01110010, 0b00000001, 0b01011000, 0b11101000, 0b00011111, 0b00000100, 0b11110111, 0b01111111, 0b11000000, 0b11111101, 0b11101111, 0b00001111, 0b10111110, 0b01000111, 0b01111101, 0b11100000, 0b01111111, 0b01111101, 0b01011111, 0b11111110, 0b00011111, 0b11111101, 0b01001011, 0b10111111, 0b11111111, 0b00111111, 0b11111000, 0b11011010, 0b11111011, 0b11000001, 0b11111111, 0b01011111, 0b00011111, 0b11111100, 0b11111011, 0b11111110, 0b11100001, 0b00001111, 0b11111111, 0b00001111, 0b10001110, 0b01100001, 0b11101100, 0b11100000, 0b10000101, 0b10010011, 0b00001110, 0b00001110, 0b11110000, 0b01101111, 0b00000000, 0b00000000, 0b10111111, 0b00001111, 0b00000000, 0b10111000, 0b11101111, 0b00000001, 0b01000000, 0b11010111, 0b00111111, 0b00010000, 0b01111110, 0b11110100, 0b11110111, 0b01011011, 0b11011101, 0b11111010, 0b01111111, 0b11011110, 0b11011110, 0b11111111, 0b11110111, 0b11110110, 0b01111010, 0b00110101, 0b01111011], # Node 61
-[0b00010010, 0b00111000, 0b01011011, 0b01000001, 0b00100000, 0b01000010, 0b11001000, 0b00110001, 0b10100011, 0b01110000, 0b01111101, 0b10100111, 0b01001000, 0b00010000, 0b10110010, 0b10011101, 0b01001011, 0b01010110, 0b01011001, 0b10001101, 0b00111110, 0b10010111, 0b11001111, 0b00010001, 0b01000000, 0b00100000, 0b11110000, 0b00001010, 0b01001111, 0b01101100, 0b01011000, 0b10011101, 0b10000010, 0b00100101, 0b10001101, 0b10101010, 0b01010101, 0b11001111, 0b10011101, 0b00111101, 0b10010011, 0b01000010, 0b11000100, 0b10011110, 0b00010100, 0b11100001, 0b10000110, 0b01101000, 0b10000101, 0b11110100, 0b10010010, 0b10000111, 0b11001010, 0b01111000, 0b00110001, 0b11001110, 0b01110110, 0b00011001, 0b00000001, 0b01001011, 0b01011000, 0b00111101, 0b10000100, 0b00100110, 0b10000000, 0b10100001, 0b00100101, 0b11110001, 0b01010110, 0b11101010, 0b00011001, 0b01110100, 0b11011011, 0b01000000, 0b10100001, 0b10100010, 0b00001011, 0b11101000, 0b11010010, 0b01101100, 0b10100000, 0b11011010, 0b11111000, 0b01010110, 0b01010010, 0b00111110, 0b01100001, 0b10011100, 0b10000101, 0b11100001, 0b10100110, 0b00100000, 0b11101000, 0b10111110, 0b00000011, 0b00000111, 0b11111010, 0b10110000], # Node 62
-[0b00000010, 0b11001010, 0b10100100, 0b10100000, 0b10000100, 0b00100100, 0b00000000, 0b00101101, 0b00010011, 0b10000100, 0b00001000, 0b11010001, 0b00000110, 0b10000000, 0b00000000, 0b00111111, 0b10001000, 0b01011110, 0b01100000, 0b10000010, 0b00000011, 0b00000000, 0b01000111, 0b10010010, 0b01001000, 0b11111101, 0b10011001, 0b00000001, 0b11100100, 0b00010011, 0b00100000, 0b01001001, 0b11111000, 0b11000000, 0b01000111, 0b10000001, 0b00000111, 0b11111011, 0b00100011, 0b00111100, 0b11000000, 0b01111111, 0b10100000, 0b00000011, 0b11111111, 0b00000010, 0b00111100, 0b01110000, 0b00111100, 0b11011100, 0b00000011, 0b11111011, 0b00101011, 0b01111100, 0b01010000, 0b00111110, 0b11000001, 0b00011111, 0b11111001, 0b01101000, 0b01111000, 0b11001111, 0b00110111, 0b10001010, 0b11011111, 0b11111110, 0b01010100, 0b01110000, 0b11011110, 0b00110111, 0b10001010, 0b10111100, 0b01111110, 0b00000000, 0b10001001, 0b11101100, 0b10011011, 0b00110111, 0b11000010, 0b00000001, 0b00110000, 0b00000100, 0b01000010, 0b00000011, 0b00110010, 0b00010000, 0b00000010, 0b01010010, 0b10000000, 0b11010001, 0b00010000, 0b00000000, 0b00100101, 0b01100100, 0b00100000, 0b10000000, 0b01000000, 0b00101001], # Node 63
-[0b10110000, 0b11100100, 0b01001011, 0b00011001, 0b10010001, 0b00001101, 0b10001001, 0b00000010, 0b10111100, 0b10010000, 0b10010101, 0b01100000, 0b00000010, 0b10001111, 0b10011010, 0b01000010, 0b00000000, 0b00000001, 0b00010101, 0b01011111, 0b00001111, 0b01100000, 0b10010111, 0b11110000, 0b00000000, 0b11010000, 0b11000100, 0b01100010, 0b00011111, 0b11010010, 0b10000100, 0b01101001, 0b01000101, 0b10000001, 0b00001001, 0b10110101, 0b11100010, 0b01110110, 0b11100100, 0b11010101, 0b01110010, 0b10001100, 0b11000010, 0b01111000, 0b11100101, 0b01111010, 0b10000011, 0b10110000, 0b00100001, 0b10101100, 0b10001101, 0b00111110, 0b00100000, 0b01100011, 0b10111110, 0b11100011, 0b01111000, 0b01000110, 0b01101100, 0b11110010, 0b00011010, 0b10010100, 0b01001011, 0b00010000, 0b10101111, 0b01111100, 0b00101100, 0b00001101, 0b10100111, 0b11110101, 0b01111000, 0b00011001, 0b01010010, 0b01000100, 0b00101000, 0b11101011, 0b00000100, 0b10101011, 0b10101111, 0b11011111, 0b11110100, 0b00100100, 0b01110111, 0b00110111, 0b01011101, 0b00100111, 0b01011000, 0b00000011, 0b01100101, 0b01011000, 0b00001001, 0b00000011, 0b00000010, 0b01110011, 0b00110000, 0b00101010, 0b10010000, 0b11110011], # Node 64
-[0b11011111, 0b11111111, 0b11111110, 0b11110010, 0b11111111, 0b01111111, 0b01111111, 0b11111111, 0b11111111, 0b11111111, 0b10111111, 0b11111011, 0b11111111, 0b01111111, 0b11111111, 0b01111101, 0b11111111, 0b11111011, 0b11111111, 0b11011111, 0b01111111, 0b11111101, 0b11110010, 0b11001001, 0b11111111, 0b11011001, 0b00110011, 0b11111101, 0b00011111, 0b00111100, 0b00101000, 0b01011111, 0b10100111, 0b00000000, 0b01111010, 0b00110111, 0b00000000, 0b00000000, 0b01111110, 0b00000001, 0b00000000, 0b01110000, 0b00111111, 0b11100000, 0b00000111, 0b11011111, 0b00000101, 0b01111111, 0b10110000, 0b01111111, 0b11111100, 0b00000111, 0b11111111, 0b11000001, 0b00111111, 0b11000000, 0b00011111, 0b11111110, 0b00000011, 0b11111110, 0b11000001, 0b00111111, 0b01100101, 0b00011111, 0b11111100, 0b01011011, 0b11010110, 0b11000001, 0b11011111, 0b11100011, 0b00111111, 0b11111010, 0b10011101, 0b11111111, 0b11110111, 0b11000111, 0b11011100, 0b01111111, 0b00001110, 0b11110100, 0b10011111, 0b00110111, 0b11000000, 0b11111111, 0b11011101, 0b00000111, 0b11111100, 0b10101111, 0b11111111, 0b11000000, 0b01111111, 0b10111111, 0b01111111, 0b11110010, 0b11101111, 0b00111111, 0b10101110, 0b11111101], # Node 65
-[0b01100100, 0b10100000, 0b00001000, 0b00101010, 0b00000010, 0b00010000, 0b10000000, 0b00010000, 0b01100000, 0b00000000, 0b01100010, 0b11011101, 0b01111111, 0b00000000, 0b11100101, 0b11111111, 0b00001111, 0b10110110, 0b11000111, 0b11111111, 0b00000000, 0b01100001, 0b11111010, 0b00001111, 0b01000000, 0b11111110, 0b11111111, 0b00000000, 0b11110011, 0b00001111, 0b01111111, 0b11100000, 0b00001111, 0b11110000, 0b00000111, 0b00111001, 0b10000000, 0b01111111, 0b00101000, 0b00000001, 0b11111100, 0b11110111, 0b00000001, 0b11100000, 0b00011111, 0b00110110, 0b00000000, 0b01111110, 0b00100000, 0b00000000, 0b11110000, 0b00000011, 0b00100000, 0b10000000, 0b00011111, 0b00000000, 0b00011010, 0b11111100, 0b00000001, 0b11001110, 0b11101011, 0b00011111, 0b00110000, 0b01111100, 0b10111111, 0b00001111, 0b10100011, 0b11111111, 0b00110001, 0b00101100, 0b11111100, 0b00011111, 0b10011111, 0b11001111, 0b01111111, 0b11000000, 0b00011000, 0b11111100, 0b00011111, 0b01000000, 0b00000010, 0b10111111, 0b01000111, 0b10011000, 0b01111001, 0b11111001, 0b00100111, 0b01000001, 0b01000000, 0b00000000, 0b10000000, 0b00000100, 0b00000000, 0b00010001, 0b00000000, 0b00000000, 0b01100000, 0b00000100], # Node 66
-[0b00111100, 0b01111101, 0b11111111, 0b11111001, 0b11111101, 0b10111111, 0b11101011, 0b11001111, 0b11110011, 0b10111111, 0b11010101, 0b10100101, 0b11101111, 0b10110101, 0b11011110, 0b01111001, 0b11011100, 0b11010110, 0b11111100, 0b00000111, 0b01111100, 0b01010001, 0b01111111, 0b10000000, 0b11001111, 0b11110111, 0b00000100, 0b11111101, 0b11011100, 0b00010111, 0b10000000, 0b11011011, 0b00111111, 0b00011000, 0b11011000, 0b11110011, 0b00000001, 0b01000110, 0b00101111, 0b00011110, 0b11100000, 0b11000111, 0b11111011, 0b00000001, 0b10111110, 0b11100101, 0b00001111, 0b00000100, 0b11001101, 0b11101111, 0b00010001, 0b10100001, 0b00110110, 0b00111010, 0b00000000, 0b10101100, 0b01010101, 0b00000011, 0b11110000, 0b11010111, 0b00011100, 0b00000000, 0b10111100, 0b11010101, 0b00110000, 0b11000001, 0b00111001, 0b11110100, 0b00000010, 0b11001110, 0b11110101, 0b01011100, 0b11110100, 0b01111111, 0b11010111, 0b10100111, 0b01111111, 0b10110100, 0b01000001, 0b01111111, 0b01110111, 0b00001011, 0b11110000, 0b11100111, 0b01001001, 0b11011111, 0b10110101, 0b10110111, 0b01100101, 0b01111111, 0b10011100, 0b00001101, 0b10101111, 0b11111111, 0b11011011, 0b00101011, 0b11011010, 0b11011101], # Node 67
-[0b10001101, 0b00100110, 0b00010000, 0b01000011, 0b01111100, 0b10001001, 0b01101100, 0b11111010, 0b10001010, 0b00110111, 0b10001011, 0b01011010, 0b00100000, 0b10110000, 0b11111010, 0b00010100, 0b00011011, 0b11111101, 0b10010011, 0b00001010, 0b11000011, 0b11101011, 0b01011011, 0b01100110, 0b01110001, 0b00100111, 0b11010110, 0b01001000, 0b00110001, 0b00000100, 0b11011110, 0b10000100, 0b00101001, 0b01110001, 0b00010000, 0b01101000, 0b10000110, 0b01001101, 0b00110011, 0b10010100, 0b01010111, 0b00010010, 0b00000001, 0b11000100, 0b11000001, 0b00000000, 0b10010101, 0b10011101, 0b10011101, 0b11010000, 0b00100011, 0b10001101, 0b01000100, 0b01110101, 0b00101111, 0b10000111, 0b01001100, 0b11011001, 0b11011101, 0b01100000, 0b00110101, 0b11100111, 0b10110001, 0b10100000, 0b01001010, 0b10001001, 0b01010011, 0b01100100, 0b01001010, 0b11111001, 0b00000000, 0b00101011, 0b00111110, 0b11101000, 0b11111100, 0b01101100, 0b10101010, 0b11010011, 0b01000010, 0b00010000, 0b01010100, 0b01010001, 0b00000111, 0b10001000, 0b10001101, 0b00010011, 0b10000011, 0b01000011, 0b00000010, 0b00001110, 0b10100101, 0b11011100, 0b10100001, 0b00000010, 0b01100111, 0b10010000, 0b00001110, 0b00001010], # Node 68
-[0b01010001, 0b00011000, 0b10110011, 0b11101001, 0b01101100, 0b11001101, 0b01011010, 0b00010110, 0b00001010, 0b00001000, 0b00010111, 0b00000100, 0b01110001, 0b00100101, 0b10110111, 0b00000111, 0b00010100, 0b00101011, 0b11100111, 0b01111000, 0b01111111, 0b11110111, 0b11010100, 0b00001011, 0b11011101, 0b10000110, 0b00101010, 0b00011101, 0b11001000, 0b00110101, 0b01110101, 0b01011100, 0b01010000, 0b00100001, 0b01101100, 0b01110010, 0b11001110, 0b01100011, 0b00000100, 0b00111101, 0b01100010, 0b11000100, 0b11100110, 0b11000000, 0b00100101, 0b01100100, 0b01000000, 0b00100100, 0b00000000, 0b01010001, 0b10000010, 0b11011110, 0b00110010, 0b10001101, 0b11001010, 0b10001111, 0b00100010, 0b00101010, 0b10000011, 0b10010100, 0b11001110, 0b00111010, 0b11010110, 0b00110000, 0b11010001, 0b11000101, 0b01100000, 0b10010011, 0b11110001, 0b00111110, 0b10000111, 0b01110100, 0b11111110, 0b00001001, 0b11100011, 0b01010101, 0b01111001, 0b00000100, 0b00110110, 0b10100110, 0b01111100, 0b11000111, 0b00100010, 0b01100000, 0b11001100, 0b10000100, 0b00101100, 0b01011010, 0b11111000, 0b00110000, 0b10000001, 0b01000110, 0b11011111, 0b10010110, 0b11100000, 0b00010100, 0b00101010, 0b00101000], # Node 69
-[0b01100100, 0b00101000, 0b10100000, 0b00000010, 0b00010010, 0b01000000, 0b11001100, 0b00000011, 0b10010110, 0b00000000, 0b00010000, 0b00100101, 0b11011100, 0b11000011, 0b10000010, 0b00000000, 0b00100010, 0b10010011, 0b00000000, 0b00010000, 0b00000010, 0b01000000, 0b00010011, 0b10000100, 0b01000000, 0b01111000, 0b10000001, 0b00000000, 0b10010010, 0b00111111, 0b00101000, 0b00000000, 0b11101000, 0b11100000, 0b10000110, 0b01110000, 0b00011101, 0b01111110, 0b01101000, 0b00010100, 0b11110001, 0b10110011, 0b00011010, 0b00000000, 0b00001100, 0b10110100, 0b01001000, 0b01100000, 0b01100111, 0b00111010, 0b00100101, 0b00000000, 0b00000101, 0b01100001, 0b00001110, 0b10010010, 0b00000000, 0b01111111, 0b01000000, 0b01001010, 0b11111001, 0b00011111, 0b10010100, 0b11100010, 0b11111111, 0b01000000, 0b00000000, 0b11110000, 0b00001111, 0b10000010, 0b10010111, 0b11101100, 0b00000000, 0b00101010, 0b10000001, 0b00000000, 0b00101001, 0b00000110, 0b00000000, 0b11011000, 0b00010000, 0b00000001, 0b01000000, 0b00000100, 0b01101010, 0b01001100, 0b11110001, 0b10100101, 0b01100110, 0b00001101, 0b01000100, 0b11110101, 0b10010000, 0b10000001, 0b00000000, 0b10000001, 0b00000001, 0b00000100], # Node 70
-[0b00000111, 0b00000110, 0b01000010, 0b11001010, 0b00110011, 0b00100001, 0b11000111, 0b10011100, 0b00011010, 0b11000001, 0b00101001, 0b00111001, 0b00110010, 0b00001000, 0b10101000, 0b10010000, 0b10100011, 0b00000000, 0b00111101, 0b00100000, 0b01001101, 0b10010111, 0b00000100, 0b01010011, 0b11001010, 0b01101100, 0b01110110, 0b01001010, 0b00000100, 0b10110110, 0b10001100, 0b01001010, 0b10110111, 0b00001000, 0b00000011, 0b01001001, 0b11010110, 0b10010000, 0b00000101, 0b10111011, 0b00010000, 0b00100000, 0b00000110, 0b10011100, 0b00011111, 0b11010000, 0b00110010, 0b01000110, 0b10011110, 0b10010101, 0b11111100, 0b00111010, 0b10100001, 0b01100001, 0b11000111, 0b10010001, 0b11000000, 0b11000010, 0b10111000, 0b11101010, 0b10111000, 0b01001110, 0b10011001, 0b00000000, 0b11110011, 0b01000001, 0b00011101, 0b00000000, 0b11001010, 0b00000111, 0b01000000, 0b00100010, 0b00101101, 0b00000100, 0b10011101, 0b11010001, 0b11100110, 0b00001010, 0b01101001, 0b10110001, 0b01110100, 0b01011110, 0b11000010, 0b11110000, 0b01010010, 0b10110110, 0b00111101, 0b00001000, 0b01001000, 0b11001000, 0b10000001, 0b01010100, 0b10100001, 0b10001010, 0b01101000, 0b10010010, 0b11001001, 0b00100110], # Node 71
-[0b01010001, 0b10010000, 0b10000001, 0b01101001, 0b11000100, 0b10000100, 0b01101001, 0b01001000, 0b11000111, 0b00000010, 0b01100001, 0b00100010, 0b11000011, 0b01000010, 0b11001110, 0b00100111, 0b10110000, 0b00010010, 0b10110101, 0b11001101, 0b11000010, 0b01010100, 0b01001000, 0b01100011, 0b10110011, 0b01000111, 0b10010000, 0b10110001, 0b11010100, 0b01100010, 0b10010100, 0b01001100, 0b10000001, 0b10111100, 0b10110001, 0b00011001, 0b00101000, 0b00100011, 0b01011000, 0b10001000, 0b11110000, 0b10110001, 0b00000010, 0b00001110, 0b00001110, 0b01001101, 0b00010110, 0b01011100, 0b10011100, 0b01001110, 0b00101110, 0b11100000, 0b10000000, 0b00011111, 0b00101110, 0b10001010, 0b10000000, 0b10111000, 0b10100001, 0b01110001, 0b11101101, 0b10001100, 0b11110001, 0b10000111, 0b00000101, 0b01111101, 0b01100110, 0b01100111, 0b00101000, 0b01001000, 0b01011010, 0b00000000, 0b10111111, 0b11001101, 0b00001000, 0b11001010, 0b11001100, 0b10010110, 0b00011010, 0b00010011, 0b01111101, 0b10100101, 0b11000000, 0b01100100, 0b01110000, 0b00011110, 0b00101001, 0b01001101, 0b00110010, 0b00110000, 0b00010001, 0b11000001, 0b11000100, 0b01101000, 0b11001111, 0b00010100, 0b00010000, 0b01011001], # Node 72
-[0b01110111, 0b00010001, 0b11001010, 0b11101000, 0b11001101, 0b10101111, 0b11010011, 0b11011011, 0b00000111, 0b11100101, 0b00011000, 0b11111011, 0b11111010, 0b10010000, 0b00100000, 0b00011101, 0b11011010, 0b00111110, 0b01010011, 0b01101111, 0b10101000, 0b11111011, 0b11101101, 0b10010011, 0b00111101, 0b10001010, 0b01001100, 0b11011001, 0b11011101, 0b00000111, 0b10111111, 0b00011000, 0b00011001, 0b00100001, 0b11111001, 0b11100000, 0b10011101, 0b01011101, 0b11111010, 0b11001001, 0b10100011, 0b11110110, 0b10011011, 0b01011000, 0b01101101, 0b11110011, 0b10110000, 0b00010111, 0b11111110, 0b11110011, 0b10100111, 0b11011110, 0b11111001, 0b00110111, 0b00110000, 0b00011000, 0b00101100, 0b11101100, 0b10111101, 0b10011011, 0b01001111, 0b10111110, 0b10110010, 0b10110011, 0b00101001, 0b10101101, 0b11010100, 0b11001010, 0b10000001, 0b10000100, 0b11101001, 0b11110111, 0b10010000, 0b10001101, 0b00000011, 0b10001000, 0b10000011, 0b01011111, 0b00101101, 0b01000111, 0b10110100, 0b10101011, 0b01101001, 0b10111111, 0b01100111, 0b11010101, 0b10110000, 0b10100010, 0b00111010, 0b11111001, 0b01000010, 0b11101000, 0b10010111, 0b01011110, 0b10111101, 0b01111011, 0b00011001, 0b00000110], # Node 73
-[0b01110110, 0b10101111, 0b00100010, 0b00100110, 0b00010000, 0b01110110, 0b10011011, 0b00100110, 0b01110111, 0b00100111, 0b00011101, 0b10100110, 0b10101100, 0b00010010, 0b00100010, 0b11001000, 0b00000011, 0b00001010, 0b10000001, 0b01001001, 0b00100000, 0b00100111, 0b11010101, 0b01110010, 0b00010111, 0b00100000, 0b00101110, 0b00001001, 0b00110010, 0b11000000, 0b01011101, 0b10000111, 0b01111010, 0b11010100, 0b01011000, 0b11011011, 0b11100000, 0b01101110, 0b11110111, 0b10110000, 0b11100010, 0b10001100, 0b11011100, 0b11111100, 0b01000110, 0b00001011, 0b00001110, 0b10010111, 0b10100101, 0b01111000, 0b11101110, 0b11110100, 0b11010011, 0b10101011, 0b00111011, 0b01011000, 0b00101000, 0b11001100, 0b01101101, 0b10110001, 0b00011011, 0b01110010, 0b01100001, 0b10110101, 0b11000110, 0b10000101, 0b00111001, 0b11100000, 0b10110110, 0b01101000, 0b10110001, 0b01010000, 0b01011111, 0b00100001, 0b00010010, 0b11011100, 0b10000101, 0b11010000, 0b01111001, 0b01110100, 0b11001011, 0b01001000, 0b00001010, 0b01011001, 0b00000111, 0b10111110, 0b11000100, 0b00110110, 0b00001000, 0b01111000, 0b10000011, 0b00001000, 0b01001110, 0b10011111, 0b00010001, 0b01010110, 0b00110100, 0b01000100], # Node 74
-[0b00111010, 0b10000100, 0b01111010, 0b11111110, 0b11000111, 0b10001100, 0b00110000, 0b10111111, 0b11100000, 0b00110101, 0b11101000, 0b11100101, 0b10101001, 0b11101001, 0b10010110, 0b10111000, 0b00011110, 0b11001101, 0b11000011, 0b01011011, 0b11111111, 0b01010001, 0b01110010, 0b11011010, 0b01101000, 0b01010100, 0b01010010, 0b00111000, 0b01101010, 0b10011100, 0b10011011, 0b00101000, 0b11110011, 0b11011010, 0b00100101, 0b00101010, 0b01111010, 0b11000101, 0b11110010, 0b10101010, 0b01000011, 0b10100000, 0b11010100, 0b00111100, 0b10110110, 0b11110011, 0b11000101, 0b10000111, 0b11111000, 0b11001101, 0b00001110, 0b00111110, 0b11111110, 0b10101100, 0b01101100, 0b11011000, 0b10111101, 0b10101101, 0b00010111, 0b11111000, 0b10010111, 0b01111101, 0b10100001, 0b11011011, 0b11100001, 0b11101101, 0b11010111, 0b11111101, 0b00011101, 0b11100010, 0b01111110, 0b00001101, 0b10000011, 0b01001101, 0b10000101, 0b10011011, 0b10111000, 0b01011010, 0b00100011, 0b11010101, 0b01111101, 0b10100111, 0b11011110, 0b10010001, 0b01111011, 0b01010010, 0b10010000, 0b10011111, 0b11110110, 0b11111001, 0b10101011, 0b11110110, 0b01110110, 0b00101110, 0b11011100, 0b11101000, 0b11110111, 0b00001110], # Node 75
-[0b00001000, 0b01000110, 0b00001000, 0b00000100, 0b10001000, 0b00000000, 0b00001000, 0b01000100, 0b00000100, 0b00001100, 0b10100100, 0b00010001, 0b10001110, 0b00000100, 0b01000001, 0b10101100, 0b11000000, 0b00110010, 0b01000011, 0b00010111, 0b10000111, 0b00001010, 0b11111110, 0b11011011, 0b00001010, 0b11000100, 0b11011111, 0b10100001, 0b11000000, 0b01111010, 0b00001010, 0b00000110, 0b00000000, 0b00100011, 0b01100000, 0b00110010, 0b00010000, 0b00000011, 0b00000000, 0b00000100, 0b00110000, 0b11000000, 0b00000000, 0b11000000, 0b00000111, 0b10000000, 0b00000000, 0b00111110, 0b11001000, 0b00001000, 0b11110000, 0b01100000, 0b11000000, 0b10000000, 0b00001111, 0b01000011, 0b00000011, 0b01111010, 0b00000000, 0b11011001, 0b11010000, 0b11100011, 0b00100000, 0b10001001, 0b00011111, 0b10011111, 0b01010000, 0b01111101, 0b11111000, 0b10001011, 0b10000010, 0b10000011, 0b01110111, 0b00000010, 0b00101110, 0b10001100, 0b10100111, 0b01100100, 0b01100000, 0b00010000, 0b11000100, 0b00001100, 0b00000110, 0b01001101, 0b10000000, 0b00000000, 0b00100011, 0b00000001, 0b10000001, 0b11001111, 0b00000001, 0b00000000, 0b00010000, 0b00000001, 0b00100000, 0b10001001, 0b00000001, 0b00000101], # Node 76
-[0b01011011, 0b10100010, 0b10101000, 0b00010011, 0b10110010, 0b00001100, 0b10000111, 0b00111001, 0b00100000, 0b10101010, 0b11110010, 0b10011011, 0b00000010, 0b01000000, 0b00110010, 0b10011001, 0b00101001, 0b01110011, 0b00011101, 0b10011001, 0b01100000, 0b00001100, 0b01000100, 0b11011001, 0b11000010, 0b10001100, 0b01110000, 0b10100001, 0b10111111, 0b00001111, 0b10100111, 0b10101111, 0b01000000, 0b11111101, 0b11101001, 0b10001001, 0b00100010, 0b00111001, 0b11000010, 0b00011111, 0b01001011, 0b01011010, 0b11011100, 0b01001110, 0b00001101, 0b11010110, 0b11100010, 0b11011010, 0b00001100, 0b00110010, 0b00111011, 0b10100100, 0b11100000, 0b01110011, 0b00000111, 0b11000110, 0b00101010, 0b00101101, 0b10000011, 0b01011011, 0b11100000, 0b10000101, 0b01010010, 0b10100000, 0b00001101, 0b10111010, 0b00100001, 0b10110010, 0b01001011, 0b00101100, 0b00111111, 0b00101110, 0b00010010, 0b11000111, 0b00001111, 0b00011110, 0b10110100, 0b10010100, 0b00111100, 0b10001101, 0b10000100, 0b01010011, 0b00001010, 0b11100000, 0b00000000, 0b00100000, 0b00100111, 0b01100110, 0b11000100, 0b11101000, 0b00010100, 0b10001110, 0b11100000, 0b10010110, 0b00100101, 0b11001001, 0b11101001, 0b11001100], # Node 77
-[0b11110001, 0b10000100, 0b00011001, 0b11101000, 0b01001110, 0b00111101, 0b01101000, 0b00000011, 0b00001100, 0b01010110, 0b00010100, 0b00000101, 0b00000000, 0b10001000, 0b00011100, 0b11000110, 0b10111101, 0b00101001, 0b11110001, 0b11000000, 0b00111001, 0b01100011, 0b00001110, 0b01110110, 0b10100000, 0b00100101, 0b11100000, 0b01100001, 0b10100011, 0b00000000, 0b00011100, 0b11000000, 0b00110101, 0b11100000, 0b00000000, 0b01111000, 0b10000000, 0b00001110, 0b11100101, 0b00001001, 0b11111000, 0b00110100, 0b11010000, 0b11100010, 0b00011011, 0b10000000, 0b00011011, 0b01111100, 0b01001011, 0b11100101, 0b00111111, 0b01111111, 0b11001000, 0b11111101, 0b11101111, 0b00011011, 0b11000001, 0b11111111, 0b10101111, 0b11100000, 0b11011000, 0b11111111, 0b10010001, 0b00100100, 0b10101000, 0b10011110, 0b10010000, 0b00000001, 0b00000000, 0b11100001, 0b00100100, 0b00000001, 0b00010010, 0b10110000, 0b10011110, 0b10000000, 0b00001000, 0b00000000, 0b00000111, 0b11011101, 0b01000000, 0b10110101, 0b10111001, 0b10011001, 0b10000010, 0b00100000, 0b11000101, 0b01110000, 0b00010010, 0b00010000, 0b01001000, 0b00000101, 0b00001000, 0b10011010, 0b10000111, 0b10110000, 0b11101000, 0b01001000], # Node 78
-[0b00100101, 0b00111000, 0b10000110, 0b01101110, 0b11000010, 0b01010000, 0b10011000, 0b10110001, 0b00111000, 0b00000111, 0b10100111, 0b10110010, 0b01011111, 0b11010010, 0b01010011, 0b11100011, 0b01010001, 0b10000011, 0b00000011, 0b10100101, 0b11101100, 0b01001110, 0b01000000, 0b11010011, 0b00110101, 0b11110010, 0b01000100, 0b11011011, 0b11010110, 0b01100000, 0b10100100, 0b00100011, 0b01010001, 0b01001001, 0b00000100, 0b11001111, 0b01111111, 0b01100101, 0b10110101, 0b01000001, 0b00010001, 0b00010001, 0b10001001, 0b00111011, 0b00010101, 0b01000000, 0b10110101, 0b01011101, 0b11100101, 0b00101000, 0b01111100, 0b00000101, 0b10100111, 0b11111110, 0b00100101, 0b11010011, 0b01010010, 0b01111100, 0b11100000, 0b10101000, 0b11110110, 0b01001110, 0b01000011, 0b10000010, 0b00111000, 0b11010011, 0b00101001, 0b01100000, 0b01001001, 0b00000110, 0b10100000, 0b11100000, 0b01100001, 0b01011001, 0b10011000, 0b01000101, 0b01001111, 0b00010000, 0b00101111, 0b11001001, 0b00010100, 0b10100000, 0b11000010, 0b00011100, 0b01011111, 0b00100101, 0b10011110, 0b10000100, 0b00100110, 0b00100000, 0b00000010, 0b00000100, 0b01000111, 0b11110011, 0b01010000, 0b01101101, 0b10001101, 0b01010100], # Node 79
-[0b01000110, 0b10001111, 0b10111001, 0b11101100, 0b10110101, 0b11000011, 0b00001010, 0b10111000, 0b00001110, 0b11111110, 0b11110101, 0b00001111, 0b11000000, 0b01111111, 0b00000011, 0b00000000, 0b11111000, 0b01010011, 0b00000001, 0b00000000, 0b10011110, 0b00000010, 0b00001000, 0b11100100, 0b11000000, 0b11111100, 0b11111111, 0b10000111, 0b11001100, 0b11111111, 0b00000011, 0b00000000, 0b11111100, 0b00011111, 0b00000000, 0b11100100, 0b00111111, 0b00000000, 0b11001000, 0b11111111, 0b00000011, 0b01011111, 0b11111011, 0b00011111, 0b11110010, 0b11000011, 0b11111111, 0b10110000, 0b11111111, 0b11110100, 0b00001111, 0b11111011, 0b01111111, 0b11111111, 0b11110000, 0b01111111, 0b11000011, 0b00001111, 0b11111111, 0b00100011, 0b11111000, 0b01000000, 0b10111111, 0b00000000, 0b00001100, 0b11100000, 0b00010011, 0b00000000, 0b00000001, 0b10000000, 0b00000001, 0b01110000, 0b00000000, 0b00111000, 0b00000000, 0b00011111, 0b11000000, 0b00000001, 0b00010110, 0b00000000, 0b00010000, 0b01111110, 0b00000000, 0b00000000, 0b11111010, 0b10000101, 0b11000001, 0b10000100, 0b11111111, 0b01111111, 0b01011111, 0b11110101, 0b11111111, 0b10001111, 0b10110110, 0b11011100, 0b01100011, 0b00011111], # Node 80
-[0b10111011, 0b01110110, 0b11000000, 0b11010000, 0b00111011, 0b01010101, 0b00011001, 0b01001101, 0b10001110, 0b01001000, 0b11001101, 0b11010011, 0b01000110, 0b00111011, 0b11111101, 0b11101001, 0b10101111, 0b10110100, 0b01111111, 0b00110100, 0b11111110, 0b10111111, 0b01100001, 0b01101111, 0b11001010, 0b00010011, 0b11010001, 0b10001100, 0b11001011, 0b10111110, 0b00010000, 0b11000011, 0b11111110, 0b11110001, 0b10110000, 0b00011111, 0b01111111, 0b01000110, 0b01001010, 0b11100100, 0b01000111, 0b10110110, 0b11100011, 0b10101001, 0b10100110, 0b11110001, 0b01100001, 0b01011111, 0b11111010, 0b11001101, 0b10011011, 0b01111011, 0b11110000, 0b00011011, 0b00110100, 0b00111111, 0b11111101, 0b00001111, 0b00001011, 0b10111011, 0b11110111, 0b11101100, 0b00110010, 0b01111100, 0b11011001, 0b11110001, 0b01100100, 0b10011100, 0b00001010, 0b11010111, 0b11001111, 0b10010100, 0b10000000, 0b00011111, 0b01010011, 0b11100001, 0b11010111, 0b11101010, 0b01000000, 0b00101011, 0b11101011, 0b00110111, 0b01111011, 0b00011000, 0b11101010, 0b01111100, 0b11011011, 0b11011100, 0b11101111, 0b11001110, 0b01100011, 0b10011011, 0b01101011, 0b01011111, 0b11111010, 0b00111001, 0b01001011, 0b10000111], # Node 81
-[0b00110111, 0b11011101, 0b10100111, 0b11100100, 0b11000011, 0b01000100, 0b11111111, 0b01010101, 0b11111111, 0b01000010, 0b01010101, 0b10001111, 0b10111011, 0b00000011, 0b00011100, 0b01100111, 0b11001001, 0b11110111, 0b01001000, 0b01110011, 0b01111001, 0b01110110, 0b00001111, 0b11001111, 0b10000110, 0b10110110, 0b10101111, 0b11011110, 0b00111100, 0b10000010, 0b11010010, 0b11110101, 0b00001101, 0b00001111, 0b01100011, 0b00111010, 0b00111111, 0b11011010, 0b01000111, 0b10001000, 0b01101110, 0b11111001, 0b00011001, 0b00001001, 0b00100101, 0b11011010, 0b01011110, 0b11100100, 0b11111001, 0b10001010, 0b01001110, 0b11010101, 0b10011101, 0b11010111, 0b01001110, 0b01111100, 0b11001000, 0b11110110, 0b11001101, 0b01011111, 0b10111001, 0b01101001, 0b11010110, 0b00111001, 0b01111111, 0b10101000, 0b01100010, 0b11100011, 0b01111011, 0b10011100, 0b10000010, 0b10100011, 0b10011111, 0b00111101, 0b01100111, 0b11100101, 0b11111111, 0b11111111, 0b10100011, 0b11100010, 0b11101111, 0b00111001, 0b01001101, 0b00100110, 0b11111000, 0b11101010, 0b00010111, 0b01001100, 0b10111001, 0b00111111, 0b11001101, 0b10010100, 0b00111000, 0b01111001, 0b11101011, 0b10111100, 0b01111100, 0b01100101], # Node 82
-[0b00101000, 0b10000110, 0b00000010, 0b10101001, 0b01100101, 0b01100110, 0b11010011, 0b10010001, 0b01001001, 0b00011010, 0b00000100, 0b10100000, 0b00100011, 0b11100010, 0b10100000, 0b10011100, 0b11001111, 0b00000100, 0b10111010, 0b11111000, 0b00001011, 0b01000000, 0b10011000, 0b00110011, 0b10011100, 0b10001010, 0b00110110, 0b10001000, 0b10001010, 0b01110100, 0b00100111, 0b01000000, 0b00010100, 0b11000100, 0b10100010, 0b00001010, 0b00011010, 0b10111100, 0b00100110, 0b10000000, 0b00110010, 0b10000000, 0b01100000, 0b10000000, 0b01101111, 0b10100001, 0b11011011, 0b11110000, 0b10010000, 0b00100011, 0b10011111, 0b10011111, 0b00010011, 0b11000111, 0b00111111, 0b01100110, 0b10100101, 0b11101110, 0b01111110, 0b11000000, 0b11101111, 0b10101011, 0b10001111, 0b00001010, 0b11010011, 0b11101010, 0b00100001, 0b00011110, 0b11101111, 0b01100011, 0b11011000, 0b01111101, 0b00000011, 0b11000111, 0b11111110, 0b10100011, 0b01000000, 0b00100000, 0b00010101, 0b11110000, 0b10100110, 0b10010000, 0b00000000, 0b01011010, 0b00101001, 0b01010000, 0b00111010, 0b10010001, 0b00101010, 0b01101000, 0b01011010, 0b00100001, 0b01101101, 0b10101001, 0b10001100, 0b01001010, 0b10101101, 0b10101000], # Node 83
-[0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000000, 0b00000000, 0b00000000, 0b00010000, 0b00000000, 0b01110000, 0b01111101, 0b00011001, 0b10000000, 0b00111111, 0b11111110, 0b00000001, 0b11111110, 0b11011011, 0b00011111, 0b11100000, 0b00010010, 0b10000000, 0b00000011, 0b10101110, 0b00000000, 0b00010000, 0b01110000, 0b00000000, 0b00000000, 0b11000010, 0b10011111, 0b00001111, 0b00000000, 0b11111000, 0b11111111, 0b00000001, 0b11100000, 0b11011111, 0b11111111, 0b00000000, 0b11111100, 0b11111111, 0b00011111, 0b11000000, 0b00001011, 0b11110000, 0b00000011, 0b00011010, 0b00000000, 0b01111110, 0b11000010, 0b00000000, 0b11000000, 0b00011111, 0b00001000, 0b00000000, 0b11111100, 0b11000001, 0b00000000, 0b10000000, 0b00011111, 0b01111000, 0b00000000, 0b11101011, 0b11000001, 0b00111111, 0b00001001, 0b00011110, 0b11111100, 0b10101111, 0b11100010, 0b10000000, 0b11111111, 0b11101111, 0b00000111, 0b00000000, 0b11100111, 0b00101111, 0b00000000, 0b00000001, 0b11111100, 0b00000001, 0b00110000, 0b11100000, 0b00000111, 0b00000000, 0b11010000, 0b11001111, 0b00000001, 0b00010000, 0b11111010, 0b00000111, 0b00000000, 0b00000000, 0b01101111, 0b00000000], # Node 84
-[0b11100110, 0b11111110, 0b11011000, 0b11100001, 0b11110101, 0b11011110, 0b11110111, 0b11110111, 0b10110000, 0b01110010, 0b11111111, 0b00111101, 0b01010010, 0b01001100, 0b11101010, 0b00000000, 0b10101110, 0b11110010, 0b01110100, 0b11000011, 0b00010011, 0b10110011, 0b00011011, 0b10100001, 0b00010011, 0b10011100, 0b01110000, 0b00101111, 0b11111011, 0b11101110, 0b01100100, 0b11001010, 0b01000011, 0b01100110, 0b10111000, 0b00011101, 0b11111001, 0b11100011, 0b11110101, 0b00111011, 0b11011100, 0b01101011, 0b11010101, 0b00111100, 0b11110000, 0b10010011, 0b10110001, 0b00101110, 0b10001110, 0b11001111, 0b10010001, 0b11110000, 0b11100011, 0b00111111, 0b10001100, 0b01110010, 0b01101000, 0b10000111, 0b10011001, 0b01100011, 0b10001010, 0b10111010, 0b10100011, 0b11110100, 0b10000110, 0b01011111, 0b10111101, 0b10001110, 0b11010011, 0b00001001, 0b01111110, 0b10010010, 0b00101110, 0b11000110, 0b10110011, 0b10100100, 0b11100001, 0b11011111, 0b00101100, 0b00110111, 0b01101110, 0b00011111, 0b01111011, 0b11110010, 0b10111001, 0b10010011, 0b11110010, 0b00110101, 0b10101011, 0b11011011, 0b10110110, 0b00100111, 0b10000101, 0b11111110, 0b11001111, 0b11011010, 0b00110111, 0b01110011], # Node 85
-[0b10100111, 0b00100001, 0b01100010, 0b01100111, 0b10100111, 0b01111110, 0b11101111, 0b10101101, 0b01111110, 0b11001101, 0b11111111, 0b01101100, 0b11110001, 0b10111101, 0b10100010, 0b01011111, 0b11110000, 0b10000110, 0b10001000, 0b11011101, 0b10001100, 0b11111000, 0b00111111, 0b11110110, 0b11011100, 0b01000110, 0b11011010, 0b10101101, 0b01010000, 0b10000000, 0b01110001, 0b01001100, 0b01010111, 0b11011011, 0b00001100, 0b11110101, 0b01011101, 0b11111010, 0b10111001, 0b00010111, 0b00011011, 0b11011101, 0b11100110, 0b00110111, 0b01001011, 0b11111010, 0b00000110, 0b10011000, 0b00011110, 0b11111110, 0b10010110, 0b01001110, 0b00110011, 0b00010110, 0b11010001, 0b10000000, 0b10110111, 0b01011101, 0b10111011, 0b01011011, 0b01010111, 0b10011100, 0b11001011, 0b01111101, 0b11100100, 0b10010101, 0b11110010, 0b01000101, 0b11001011, 0b01111110, 0b10101011, 0b01011111, 0b10100101, 0b00010100, 0b11001011, 0b11100100, 0b00111111, 0b01010010, 0b10000101, 0b01111110, 0b10101111, 0b00001001, 0b00100100, 0b01010110, 0b11101110, 0b00110110, 0b10101001, 0b11010010, 0b01101100, 0b01000110, 0b10110111, 0b01110101, 0b10101100, 0b11000111, 0b11001101, 0b00010010, 0b01010101, 0b11111000], # Node 86
-[0b11111110, 0b00100101, 0b11100101, 0b10101111, 0b00001111, 0b10010100, 0b10111111, 0b01011001, 0b01111011, 0b11001110, 0b10101111, 0b11011111, 0b10111111, 0b11110001, 0b01011101, 0b11111111, 0b10001111, 0b11110110, 0b11110000, 0b11111111, 0b10000001, 0b01111111, 0b11111111, 0b00001111, 0b00110101, 0b10000011, 0b00111111, 0b01000000, 0b00001000, 0b00000110, 0b00000000, 0b11101100, 0b01110000, 0b00000000, 0b01000011, 0b10001101, 0b00000110, 0b00111100, 0b00000100, 0b01101110, 0b11100000, 0b01111111, 0b11000011, 0b11111110, 0b11111111, 0b10100111, 0b11110101, 0b11111111, 0b11101111, 0b01101110, 0b11111110, 0b11000111, 0b00111111, 0b11111100, 0b01111111, 0b10110101, 0b10101110, 0b10111111, 0b01110001, 0b10101100, 0b11111111, 0b10110001, 0b01110111, 0b11111111, 0b00011111, 0b01111110, 0b10011111, 0b11100011, 0b11110000, 0b10101111, 0b01111111, 0b00000000, 0b10111101, 0b11101101, 0b10001011, 0b11101100, 0b00100011, 0b11111101, 0b01111101, 0b11111110, 0b10101101, 0b11110101, 0b11110111, 0b11110111, 0b11111111, 0b10000111, 0b10011110, 0b11011100, 0b00011110, 0b11100000, 0b10101011, 0b11101111, 0b00011011, 0b11111001, 0b00101101, 0b10011001, 0b11101010, 0b11111001], # Node 87
-[0b01000110, 0b11001110, 0b11111100, 0b00000100, 0b10000110, 0b01001010, 0b10111100, 0b01011010, 0b10101010, 0b10001000, 0b10000010, 0b00001000, 0b10010110, 0b00110110, 0b11000011, 0b01100000, 0b01010100, 0b00101100, 0b00000000, 0b01000110, 0b11000001, 0b11111010, 0b11110111, 0b01001101, 0b01010010, 0b11010000, 0b11101011, 0b01001000, 0b00010001, 0b11100100, 0b00000011, 0b11100001, 0b10001011, 0b01111000, 0b10100000, 0b10010100, 0b11001101, 0b10100010, 0b00101000, 0b01000000, 0b01111100, 0b01000110, 0b11011010, 0b11000000, 0b11101011, 0b11111110, 0b00001101, 0b00011101, 0b11001010, 0b11111000, 0b10011100, 0b01100111, 0b11100110, 0b00001000, 0b01101010, 0b00000001, 0b00000010, 0b10001001, 0b10001011, 0b00110010, 0b10111100, 0b00000100, 0b00101000, 0b01100110, 0b10110111, 0b11000000, 0b00111000, 0b00110111, 0b11000000, 0b10011000, 0b11100100, 0b00001001, 0b01101110, 0b00011000, 0b10001101, 0b10000000, 0b00111000, 0b01000010, 0b00110000, 0b01000101, 0b00000011, 0b01000100, 0b11011111, 0b00101001, 0b01000000, 0b10001100, 0b11011000, 0b01011001, 0b01000101, 0b00110100, 0b10001100, 0b10000000, 0b00100011, 0b10000000, 0b01111110, 0b00110010, 0b00001111, 0b01000000], # Node 88
-[0b11000010, 0b00010100, 0b10100010, 0b11010001, 0b10100000, 0b01111110, 0b10110001, 0b01110110, 0b10000011, 0b01000001, 0b00010001, 0b00011001, 0b00100000, 0b00000100, 0b00101100, 0b10101000, 0b00001010, 0b10000101, 0b01001010, 0b00010111, 0b10101011, 0b01110110, 0b00110100, 0b10111000, 0b10000100, 0b01001111, 0b11011011, 0b01100011, 0b01010001, 0b10100000, 0b01110001, 0b10001111, 0b10010010, 0b00001001, 0b01111010, 0b10101001, 0b01100000, 0b00000110, 0b01100001, 0b01011010, 0b00001001, 0b11010000, 0b00100100, 0b10010000, 0b01110010, 0b00110110, 0b01100001, 0b10000000, 0b00000011, 0b00010101, 0b11000010, 0b10000111, 0b01101100, 0b10010110, 0b01000100, 0b01001000, 0b01110101, 0b10001110, 0b01000001, 0b11010011, 0b00110100, 0b01000010, 0b11000101, 0b11101000, 0b01101011, 0b11010100, 0b00001010, 0b10101000, 0b10000010, 0b10111100, 0b00000100, 0b00100001, 0b01110000, 0b01001011, 0b00111000, 0b11000000, 0b11011110, 0b00101110, 0b10010001, 0b00100011, 0b10110101, 0b01111100, 0b00110000, 0b10100100, 0b01001000, 0b00011000, 0b00000001, 0b10011001, 0b10110100, 0b00000110, 0b11010001, 0b11001101, 0b10000010, 0b10010101, 0b01101101, 0b00110000, 0b01000010, 0b00000101], # Node 89
-[0b11010100, 0b11101111, 0b01111111, 0b11101010, 0b10111001, 0b01110110, 0b11011111, 0b00011011, 0b11100010, 0b10100111, 0b11101010, 0b00010000, 0b11110011, 0b11100000, 0b11010101, 0b11010110, 0b10101111, 0b11011100, 0b11000110, 0b00011000, 0b10010101, 0b01000001, 0b01101101, 0b00001001, 0b01011010, 0b01110101, 0b00001111, 0b01010011, 0b01101011, 0b00101001, 0b11010101, 0b11111011, 0b10010101, 0b00000010, 0b01011011, 0b10101111, 0b10011100, 0b01011011, 0b11110101, 0b11101111, 0b11101100, 0b10101111, 0b10100110, 0b01100101, 0b10010101, 0b10100011, 0b01011010, 0b10100010, 0b10101000, 0b11001110, 0b01011010, 0b00111110, 0b10010011, 0b01111111, 0b10101100, 0b01101110, 0b11111011, 0b10010011, 0b00010101, 0b00001100, 0b01010010, 0b01101000, 0b11001101, 0b11011000, 0b00100010, 0b11101010, 0b00101001, 0b01101100, 0b00001110, 0b10111001, 0b10100110, 0b00100111, 0b11011011, 0b00110101, 0b11111011, 0b01101001, 0b10001011, 0b11010101, 0b10110100, 0b01011000, 0b01101100, 0b01000110, 0b10111001, 0b11110100, 0b00111101, 0b11100101, 0b11111110, 0b10001001, 0b10100101, 0b11111011, 0b01010110, 0b01110010, 0b01000000, 0b11110110, 0b01110111, 0b10100101, 0b11011011, 0b00111010], # Node 90
-[0b11100111, 0b01011110, 0b01101111, 0b01111101, 0b11011101, 0b11111111, 0b11100111, 0b11101111, 0b11111010, 0b11110101, 0b10001111, 0b11101100, 0b10101101, 0b11111101, 0b11110111, 0b11100111, 0b11110000, 0b11011101, 0b11101001, 0b00010011, 0b11011111, 0b11011111, 0b00111111, 0b11111000, 0b01111111, 0b00110001, 0b11010000, 0b11001110, 0b11010111, 0b00001111, 0b11111110, 0b11011101, 0b11011111, 0b11001011, 0b10111111, 0b11011001, 0b10100010, 0b11111011, 0b01111111, 0b00001101, 0b00011110, 0b01111110, 0b11011111, 0b00000011, 0b11011100, 0b11011101, 0b00011110, 0b01000100, 0b11101000, 0b11101001, 0b01001011, 0b01001101, 0b11101111, 0b01101110, 0b10101101, 0b11101110, 0b11101100, 0b11100110, 0b10110101, 0b11101111, 0b11101110, 0b10011110, 0b11111111, 0b01111111, 0b11111010, 0b10111101, 0b10111111, 0b11011101, 0b11111110, 0b11101010, 0b11011111, 0b11110111, 0b11010011, 0b10011101, 0b11111011, 0b00000011, 0b11011010, 0b11101001, 0b01001111, 0b01111001, 0b10100101, 0b11111111, 0b10010100, 0b11110111, 0b01110111, 0b10110101, 0b01100110, 0b10001110, 0b01001101, 0b11011101, 0b01100111, 0b11111101, 0b10111111, 0b11000111, 0b11111101, 0b10111110, 0b10011101, 0b01111111], # Node 91
-[0b00001110, 0b00000010, 0b00000101, 0b00000000, 0b00000000, 0b00000000, 0b00000100, 0b00010000, 0b00000000, 0b00100010, 0b00001010, 0b10010000, 0b10001100, 0b00000110, 0b00100001, 0b11111111, 0b01100100, 0b10110000, 0b01000110, 0b11110111, 0b00100000, 0b00100111, 0b01111100, 0b00011010, 0b00000011, 0b01000001, 0b10001110, 0b00000001, 0b10100000, 0b11000110, 0b01001011, 0b10001100, 0b00111011, 0b11001010, 0b00011100, 0b10110010, 0b00000010, 0b10001001, 0b11000010, 0b00100101, 0b00110001, 0b10100100, 0b00100001, 0b01100000, 0b00010000, 0b10010100, 0b00000010, 0b10001101, 0b10010110, 0b00001000, 0b01101010, 0b11110000, 0b00001101, 0b01001101, 0b00000011, 0b00011110, 0b00000001, 0b11011001, 0b11110000, 0b00000000, 0b11010010, 0b00011111, 0b00001100, 0b00000000, 0b01111110, 0b11000000, 0b00000001, 0b01100000, 0b00011101, 0b11001101, 0b00000010, 0b00100011, 0b11110001, 0b01000101, 0b11010101, 0b01000001, 0b01001010, 0b00000010, 0b10001110, 0b01110001, 0b00010000, 0b11100100, 0b00010010, 0b01000101, 0b00010100, 0b10001000, 0b00000001, 0b01000100, 0b10000100, 0b00100101, 0b00001001, 0b00001000, 0b00100001, 0b10100000, 0b01000000, 0b00000001, 0b00000011, 0b00100000], # Node 92
-[0b11100110, 0b01011000, 0b00100100, 0b01101111, 0b10000111, 0b00011100, 0b00100100, 0b11001000, 0b00001011, 0b10111010, 0b00011110, 0b01100101, 0b10101000, 0b11001110, 0b00000110, 0b01111100, 0b00001010, 0b10010000, 0b01001000, 0b01000100, 0b00100100, 0b01000000, 0b10001001, 0b01110011, 0b00001000, 0b00101100, 0b11000101, 0b11011111, 0b01010011, 0b10111100, 0b01010010, 0b01001011, 0b11000101, 0b11111000, 0b00110000, 0b00100101, 0b11000010, 0b11101111, 0b00100010, 0b10111000, 0b11110001, 0b00000111, 0b11110010, 0b00100010, 0b00001010, 0b00100101, 0b11001010, 0b10101110, 0b01001101, 0b00110000, 0b11110001, 0b00100011, 0b01001110, 0b01001100, 0b10011110, 0b11101011, 0b01110111, 0b01010000, 0b11010101, 0b10110100, 0b10000100, 0b01110001, 0b11100000, 0b10110011, 0b10011100, 0b00001001, 0b11000100, 0b00101011, 0b00010010, 0b00000011, 0b00100001, 0b00010110, 0b11101110, 0b01101001, 0b00101101, 0b01010001, 0b10000001, 0b01101100, 0b10111001, 0b00101100, 0b01101000, 0b10110001, 0b11111010, 0b00001010, 0b01110000, 0b11000010, 0b11110110, 0b01010100, 0b01000100, 0b00011100, 0b10110100, 0b00111011, 0b10101000, 0b10101010, 0b10000101, 0b10100101, 0b11111101, 0b10110110], # Node 93
-[0b10000001, 0b01010010, 0b00001000, 0b10110100, 0b11001100, 0b00001010, 0b10000001, 0b10011010, 0b10111110, 0b11001101, 0b00100100, 0b00010011, 0b10110101, 0b10100000, 0b11000000, 0b10001011, 0b00000110, 0b10100001, 0b10010011, 0b10010101, 0b10010100, 0b01010100, 0b00111010, 0b00110110, 0b00110010, 0b10100100, 0b11011100, 0b11110110, 0b11010111, 0b11001001, 0b11101100, 0b00010001, 0b00011000, 0b11011101, 0b10110001, 0b11000000, 0b01011100, 0b10010001, 0b11100100, 0b10101000, 0b00011010, 0b01000101, 0b00001000, 0b01001000, 0b10011100, 0b00000101, 0b10111111, 0b00010100, 0b11000101, 0b01010100, 0b00110011, 0b00100110, 0b11101010, 0b00111111, 0b00110110, 0b00010100, 0b01111000, 0b00001001, 0b01011110, 0b00000000, 0b00101010, 0b01100101, 0b11101101, 0b00000010, 0b01010011, 0b00111011, 0b00010000, 0b01000011, 0b11101001, 0b10111010, 0b10100000, 0b01011001, 0b00100010, 0b01110000, 0b01110101, 0b01000100, 0b11010100, 0b11011010, 0b01011001, 0b00011010, 0b00001010, 0b01011001, 0b01011111, 0b11110010, 0b01010110, 0b01000111, 0b00011001, 0b00110110, 0b01100100, 0b10000101, 0b10100011, 0b01000000, 0b00100000, 0b00110010, 0b00100101, 0b00100001, 0b00101011, 0b10000100], # Node 94
-[0b01101001, 0b00000110, 0b10111000, 0b01100000, 0b11000011, 0b00001011, 0b00100000, 0b00000101, 0b00110010, 0b11000010, 0b10100010, 0b00000111, 0b11001001, 0b01101011, 0b11110000, 0b11001000, 0b01111110, 0b10101001, 0b00011000, 0b00111110, 0b01111001, 0b11100010, 0b00000101, 0b10111110, 0b11110110, 0b01101001, 0b00101110, 0b10010000, 0b00101111, 0b10011001, 0b10000000, 0b11100010, 0b11010110, 0b00001001, 0b11101100, 0b11000100, 0b00111001, 0b10100010, 0b10100001, 0b00111111, 0b01110011, 0b00101100, 0b10000101, 0b00001111, 0b10101101, 0b00010110, 0b01010001, 0b01100110, 0b10101011, 0b10010011, 0b11001001, 0b11001110, 0b00000000, 0b00100100, 0b01011001, 0b00001110, 0b11000100, 0b01100011, 0b01111100, 0b01101100, 0b00011100, 0b01000011, 0b00010000, 0b11100110, 0b10010010, 0b00000000, 0b10011100, 0b11111101, 0b01110101, 0b10010000, 0b00010010, 0b11100011, 0b10101001, 0b11000000, 0b11010100, 0b10000010, 0b11011010, 0b10110100, 0b11110001, 0b01010000, 0b01100101, 0b01010110, 0b01000010, 0b10011000, 0b10000110, 0b01000001, 0b00000001, 0b00100100, 0b11001001, 0b10001000, 0b11110010, 0b11011010, 0b01110010, 0b10100000, 0b00000011, 0b00110000, 0b01001100, 0b01110001], # Node 95
-[0b10111110, 0b11110011, 0b11001001, 0b01101011, 0b10011111, 0b10001001, 0b01010101, 0b11000111, 0b10001111, 0b10111001, 0b00100100, 0b00111001, 0b10111001, 0b10101000, 0b01010011, 0b11111110, 0b10110110, 0b00011110, 0b11111111, 0b00110101, 0b00011011, 0b01111111, 0b00011100, 0b10111111, 0b11111101, 0b01101111, 0b00011001, 0b11111100, 0b00011111, 0b00001011, 0b00111100, 0b00111000, 0b01110111, 0b00000101, 0b11100111, 0b11010010, 0b01111101, 0b11111010, 0b11111100, 0b11110100, 0b01000010, 0b11111101, 0b11010010, 0b00111111, 0b01000001, 0b11110101, 0b00111111, 0b10111000, 0b11011010, 0b11111111, 0b11101111, 0b00101110, 0b11111101, 0b11011011, 0b11110010, 0b11101011, 0b11111110, 0b11111010, 0b11010110, 0b01111110, 0b00110101, 0b11101011, 0b11101111, 0b11111010, 0b00100101, 0b00011110, 0b10011100, 0b01110110, 0b00010101, 0b10111001, 0b11110011, 0b00000101, 0b10101010, 0b11111100, 0b01011001, 0b01001100, 0b11000011, 0b10010111, 0b00110001, 0b11011011, 0b10111011, 0b01100110, 0b01111100, 0b01000111, 0b11001110, 0b11111101, 0b10001001, 0b11011001, 0b11111010, 0b00000101, 0b11001010, 0b11001011, 0b01001011, 0b00011100, 0b11111111, 0b11000000, 0b00001111, 0b00110110], # Node 96
-[0b00010001, 0b00000000, 0b10000000, 0b11000000, 0b00000000, 0b10001010, 0b01110000, 0b00100110, 0b00000000, 0b00100000, 0b00000000, 0b00000001, 0b00000001, 0b00000000, 0b00001000, 0b00000000, 0b00000000, 0b10000110, 0b00000100, 0b00000000, 0b00010010, 0b00000000, 0b11100000, 0b00111111, 0b00000010, 0b10000100, 0b01111111, 0b01100101, 0b00000010, 0b11111100, 0b10001111, 0b00000001, 0b11100000, 0b10111111, 0b10010010, 0b10000010, 0b11111110, 0b00100001, 0b00000010, 0b11111101, 0b00000101, 0b00000010, 0b11011000, 0b10010011, 0b01110000, 0b10000000, 0b00001100, 0b10010000, 0b01001110, 0b11100000, 0b00000000, 0b11111000, 0b00000000, 0b00000110, 0b00000000, 0b10001111, 0b11110001, 0b00000001, 0b11111100, 0b00100000, 0b00010111, 0b11000000, 0b01001011, 0b01110000, 0b00000000, 0b10111110, 0b01100000, 0b00000110, 0b11000000, 0b00001111, 0b11100110, 0b00000001, 0b00110110, 0b00000000, 0b00011111, 0b11110000, 0b00100100, 0b11100000, 0b11111111, 0b01000001, 0b00000001, 0b11111101, 0b00000011, 0b01000011, 0b10000001, 0b11101111, 0b00010000, 0b00000000, 0b11110010, 0b11111111, 0b00000011, 0b00000000, 0b10111110, 0b00000101, 0b00000010, 0b00010001, 0b00100000, 0b00000000], # Node 97
-[0b11111101, 0b11011111, 0b11011101, 0b00101111, 0b11111111, 0b11111011, 0b01110111, 0b11101110, 0b10110010, 0b11111111, 0b11011111, 0b01111110, 0b00000011, 0b01111011, 0b11100110, 0b00010101, 0b11000000, 0b01111101, 0b11010111, 0b00000001, 0b11110000, 0b01001111, 0b00111000, 0b10000000, 0b11111011, 0b00011110, 0b01111110, 0b00111000, 0b11110101, 0b11111101, 0b11000011, 0b10111111, 0b11101100, 0b11111111, 0b11001000, 0b11111111, 0b11111111, 0b10100101, 0b01111111, 0b11110010, 0b00101111, 0b11111010, 0b11111111, 0b00111111, 0b00100100, 0b11111111, 0b11010110, 0b00110001, 0b11111100, 0b01111111, 0b00000000, 0b01000101, 0b11011110, 0b01100001, 0b10010000, 0b01111100, 0b00011111, 0b11000010, 0b00000010, 0b01101100, 0b00010001, 0b00011000, 0b11100000, 0b01011011, 0b01001010, 0b10000011, 0b10111101, 0b00000000, 0b00001110, 0b11111000, 0b00000111, 0b11000000, 0b10000011, 0b01011111, 0b00000000, 0b01011110, 0b11001100, 0b00001110, 0b11111100, 0b11011111, 0b11111111, 0b11100111, 0b11111111, 0b10111111, 0b11101111, 0b11111111, 0b10110111, 0b01001011, 0b11111111, 0b11000111, 0b10011101, 0b11111101, 0b10011111, 0b11111111, 0b11101100, 0b10111001, 0b11111111, 0b11111011], # Node 98
-[0b10110111, 0b00011101, 0b01011101, 0b01001111, 0b01111000, 0b11011110, 0b01101111, 0b00101100, 0b10000001, 0b01111001, 0b01101011, 0b00011010, 0b01000000, 0b10101011, 0b00111100, 0b00000000, 0b11110000, 0b01010111, 0b00001110, 0b00000000, 0b01111111, 0b11100111, 0b00000000, 0b11110000, 0b10001111, 0b00001111, 0b11000000, 0b01111111, 0b01111110, 0b00000000, 0b11111111, 0b11110111, 0b10000011, 0b01111111, 0b11111110, 0b00011111, 0b11111100, 0b00000011, 0b11100111, 0b11100001, 0b00011111, 0b01100000, 0b00011111, 0b00000010, 0b00000000, 0b11101010, 0b00000001, 0b00000000, 0b11100000, 0b00001111, 0b00000000, 0b00000000, 0b11110110, 0b00000001, 0b01111000, 0b11000000, 0b01111001, 0b11000000, 0b00000011, 0b00011100, 0b00000111, 0b00111110, 0b11000000, 0b01110000, 0b11110000, 0b00000011, 0b00101100, 0b00000001, 0b00011111, 0b11100000, 0b00000010, 0b00000000, 0b00000000, 0b00110011, 0b00000000, 0b00000000, 0b00010000, 0b00100110, 0b00000000, 0b00000000, 0b00111000, 0b00001111, 0b00011000, 0b01000000, 0b11100010, 0b11100011, 0b00000011, 0b11100011, 0b11111110, 0b00111111, 0b01010000, 0b00001010, 0b11101000, 0b11001111, 0b01001111, 0b01001001, 0b11111111, 0b10110101], # Node 99
-[0b00100101, 0b01110111, 0b10100001, 0b00100111, 0b00001010, 0b01111010, 0b01001110, 0b11101001, 0b00110001, 0b00101010, 0b11100101, 0b00110110, 0b00001011, 0b01010101, 0b10001001, 0b11001010, 0b10000111, 0b00001000, 0b00001000, 0b10011010, 0b00010111, 0b00000001, 0b10111000, 0b00110101, 0b00010000, 0b10011000, 0b11010101, 0b00011001, 0b01000111, 0b10001101, 0b10011101, 0b10001001, 0b01001100, 0b00011001, 0b10111111, 0b01110000, 0b00101010, 0b01010000, 0b00001000, 0b00000001, 0b10001110, 0b00110010, 0b10000100, 0b00111000, 0b00010000, 0b11010000, 0b10101000, 0b00000001, 0b00101001, 0b01000000, 0b10100100, 0b00100011, 0b00000110, 0b11100101, 0b00001101, 0b10000000, 0b00100110, 0b00000000, 0b00110000, 0b01001000, 0b11000010, 0b10101110, 0b01100010, 0b01000100, 0b00000100, 0b00101100, 0b01100011, 0b00001000, 0b01000010, 0b11000110, 0b11011110, 0b10101110, 0b10010001, 0b10010010, 0b00111010, 0b11101100, 0b00000000, 0b01000110, 0b00010110, 0b00100100, 0b00001010, 0b11110100, 0b00001101, 0b00001000, 0b11000010, 0b00111011, 0b10001010, 0b01001001, 0b01010100, 0b10111010, 0b10000000, 0b01010001, 0b10001001, 0b00000010, 0b01000100, 0b01011001, 0b11011011, 0b00100001], # Node 100
-[0b10101000, 0b01010001, 0b00100111, 0b10101001, 0b00010110, 0b01011011, 0b01110001, 0b00000010, 0b10010100, 0b00100111, 0b00011010, 0b00101001, 0b01000010, 0b10001111, 0b01000000, 0b01101000, 0b11111101, 0b00011101, 0b11000000, 0b01110010, 0b00111000, 0b11101010, 0b01010010, 0b01110001, 0b00100001, 0b11100110, 0b10001101, 0b01011100, 0b11100101, 0b10001011, 0b00000100, 0b00000111, 0b11101001, 0b00101100, 0b10110100, 0b10110110, 0b00111011, 0b11000011, 0b01100110, 0b01110011, 0b01100001, 0b11010000, 0b01011011, 0b00001100, 0b00001111, 0b00110000, 0b00001001, 0b10100001, 0b11100101, 0b00100111, 0b00010010, 0b01101100, 0b01011000, 0b10101000, 0b11100010, 0b00000110, 0b10000011, 0b00011101, 0b00111000, 0b01000001, 0b00111100, 0b11011111, 0b00001110, 0b01100100, 0b10011111, 0b01110111, 0b01100101, 0b10010001, 0b11110011, 0b01001110, 0b00000100, 0b00011110, 0b11101011, 0b11000101, 0b01001011, 0b11000111, 0b00001101, 0b11000111, 0b00010011, 0b10011001, 0b10011010, 0b10010101, 0b10001000, 0b00001000, 0b00111000, 0b00111000, 0b01100101, 0b01110000, 0b10100110, 0b01111100, 0b00000000, 0b01000011, 0b00111101, 0b11001001, 0b00001000, 0b00110010, 0b10011110, 0b10000100], # Node 101
-[0b11100100, 0b01101011, 0b10001010, 0b11110000, 0b11011101, 0b01101010, 0b10000100, 0b10100110, 0b10011010, 0b01010010, 0b00010100, 0b11100000, 0b11110001, 0b01000101, 0b10100000, 0b11010011, 0b10101100, 0b10000010, 0b11010011, 0b00101111, 0b10010100, 0b00011010, 0b00011011, 0b11001001, 0b01110110, 0b01010001, 0b10011111, 0b10100110, 0b10000111, 0b11000110, 0b00101001, 0b01100000, 0b00000001, 0b00011000, 0b00001010, 0b01110011, 0b10101110, 0b00100011, 0b01001000, 0b00000000, 0b11000011, 0b11101101, 0b10000011, 0b11000110, 0b11010111, 0b00100101, 0b01110100, 0b01110000, 0b11111011, 0b11100011, 0b11010110, 0b01010010, 0b00010011, 0b11000100, 0b11111001, 0b00011100, 0b01010101, 0b00011110, 0b01000100, 0b10110000, 0b10000100, 0b10111101, 0b00110111, 0b00000100, 0b10011010, 0b01010001, 0b11010110, 0b00010110, 0b10001000, 0b11011111, 0b11001010, 0b10011110, 0b01001111, 0b00000100, 0b11101001, 0b00010101, 0b00100010, 0b10000110, 0b01100111, 0b11101000, 0b01001010, 0b00001000, 0b10110001, 0b11010100, 0b10101100, 0b11011000, 0b00010100, 0b11000110, 0b01100111, 0b01011010, 0b00011010, 0b00011011, 0b01100111, 0b01001110, 0b00110101, 0b00100001, 0b10001111, 0b01100010], # Node 102
-[0b00110101, 0b11011000, 0b00011110, 0b10110111, 0b11111101, 0b00111101, 0b11111110, 0b01111001, 0b10100001, 0b10011111, 0b00001111, 0b11111101, 0b10111100, 0b11011101, 0b01001111, 0b11110111, 0b11100011, 0b10010011, 0b11010000, 0b01100001, 0b10111110, 0b01110011, 0b10110111, 0b11111010, 0b01001001, 0b10000001, 0b01101101, 0b11111010, 0b11110111, 0b11000010, 0b00000011, 0b10100111, 0b00011010, 0b10011011, 0b11001000, 0b11101111, 0b11001110, 0b10011111, 0b01110010, 0b01101010, 0b11000100, 0b01101110, 0b10010100, 0b11111011, 0b11101111, 0b00100001, 0b01011101, 0b10100000, 0b10101001, 0b10001011, 0b10000010, 0b11011100, 0b01111111, 0b11111101, 0b11111110, 0b11010001, 0b10100000, 0b10111001, 0b11100000, 0b10111101, 0b10000001, 0b11010111, 0b00011011, 0b00001001, 0b00001000, 0b10001011, 0b00111010, 0b10101000, 0b01011010, 0b10111001, 0b11011110, 0b01110011, 0b01111001, 0b11011001, 0b01010011, 0b01101101, 0b01010101, 0b10111001, 0b10101111, 0b00001100, 0b10001011, 0b01110011, 0b00010101, 0b01111110, 0b01000111, 0b00111100, 0b10101100, 0b11000100, 0b10101000, 0b11001010, 0b10111100, 0b00100101, 0b11001011, 0b10100110, 0b00000110, 0b11111010, 0b11010011, 0b00101001], # Node 103
-[0b00001000, 0b00110010, 0b00000010, 0b01000100, 0b10011100, 0b00000000, 0b10010100, 0b01010010, 0b01101100, 0b10101100, 0b00011110, 0b00000101, 0b00010100, 0b00110101, 0b01000000, 0b00001110, 0b00001010, 0b01000000, 0b11000010, 0b00001101, 0b00001110, 0b10100001, 0b01000101, 0b10000000, 0b00000001, 0b11100000, 0b11000000, 0b00010000, 0b00001001, 0b10000100, 0b01010110, 0b00000000, 0b11100011, 0b01101001, 0b00100100, 0b00000100, 0b01001111, 0b00010110, 0b00000010, 0b11100000, 0b11100001, 0b00010111, 0b00110000, 0b00100111, 0b00001100, 0b01010001, 0b11010101, 0b11000000, 0b00000011, 0b10010001, 0b10000101, 0b11011011, 0b00010101, 0b00110000, 0b11101111, 0b00011001, 0b10000010, 0b11101010, 0b11101101, 0b00000111, 0b11001000, 0b11111010, 0b00000101, 0b00000001, 0b10011111, 0b11000100, 0b01100000, 0b01011000, 0b01000001, 0b01001011, 0b10000110, 0b00100000, 0b00100110, 0b11010110, 0b01000000, 0b10100000, 0b00101011, 0b10010100, 0b10100000, 0b01111000, 0b01000000, 0b00000010, 0b10000010, 0b00100011, 0b00100011, 0b00011100, 0b00100100, 0b00100000, 0b10000001, 0b11010100, 0b00000000, 0b00000000, 0b00110011, 0b10000100, 0b10100001, 0b10000000, 0b00101010, 0b00000100], # Node 104
-[0b01110000, 0b10000100, 0b00100100, 0b11010001, 0b10101000, 0b00100101, 0b01001010, 0b11100000, 0b01000001, 0b00001010, 0b10011110, 0b00010101, 0b00011100, 0b01100000, 0b10101000, 0b10101100, 0b00000111, 0b00010000, 0b01000000, 0b00111010, 0b01010100, 0b00110101, 0b00000110, 0b00111011, 0b00000101, 0b01101100, 0b11001000, 0b01011011, 0b01101101, 0b00011011, 0b10111100, 0b11100001, 0b00000010, 0b10111001, 0b01011010, 0b10101101, 0b10000000, 0b00100000, 0b11001011, 0b11001101, 0b11010010, 0b11111111, 0b01101110, 0b01000010, 0b01110011, 0b00100010, 0b10111011, 0b11111010, 0b11010010, 0b01001101, 0b10100001, 0b00110000, 0b11110000, 0b01011111, 0b00010000, 0b00001010, 0b10101001, 0b00010011, 0b00010001, 0b10000100, 0b11110110, 0b11101110, 0b00000110, 0b10101001, 0b11101011, 0b11001111, 0b10000100, 0b10001110, 0b10100100, 0b10001100, 0b11101100, 0b01110011, 0b01101000, 0b00000101, 0b00101111, 0b00000001, 0b01010000, 0b10000100, 0b10101010, 0b01100110, 0b11000110, 0b00011110, 0b10011011, 0b00101100, 0b00100110, 0b10010100, 0b10001001, 0b00000010, 0b00101011, 0b01101110, 0b10001000, 0b00110101, 0b01001101, 0b01001000, 0b11011011, 0b01100010, 0b00101000, 0b10110111], # Node 105
-[0b00010000, 0b00010100, 0b10000000, 0b10001100, 0b01000010, 0b01000011, 0b11110000, 0b00110000, 0b01000000, 0b11000001, 0b00100001, 0b00100001, 0b01111000, 0b10000000, 0b01010000, 0b10001000, 0b10000000, 0b01010100, 0b00100010, 0b11000000, 0b01000100, 0b01000000, 0b00010000, 0b00101101, 0b01010000, 0b00010001, 0b11110101, 0b00000000, 0b00000010, 0b10010010, 0b00010001, 0b01100000, 0b10000001, 0b10111111, 0b00000111, 0b00100001, 0b10111010, 0b11111101, 0b01100001, 0b10110000, 0b11001101, 0b10100111, 0b01000000, 0b11101010, 0b00111011, 0b00000011, 0b00101110, 0b10011011, 0b10100101, 0b01010010, 0b00111110, 0b10000110, 0b10010000, 0b11000110, 0b11111001, 0b00100011, 0b11000000, 0b10001101, 0b01110111, 0b00000001, 0b11111010, 0b11100010, 0b10000001, 0b00000001, 0b00001111, 0b00001010, 0b00010000, 0b11101100, 0b10111101, 0b00101000, 0b11010101, 0b01110001, 0b00010010, 0b00000001, 0b10111000, 0b00110100, 0b01001010, 0b01000001, 0b00001100, 0b00110001, 0b01000000, 0b10010000, 0b01001000, 0b00001100, 0b00100000, 0b00000000, 0b11010000, 0b10110001, 0b10100011, 0b00010000, 0b00100100, 0b10010000, 0b00000100, 0b00000100, 0b00100011, 0b10000100, 0b01001000, 0b01000101], # Node 106
-[0b00011100, 0b01110110, 0b01011100, 0b10101111, 0b10111100, 0b11111111, 0b11111101, 0b10111101, 0b00110011, 0b11100101, 0b11010010, 0b10001110, 0b00100100, 0b01100110, 0b11101110, 0b10101110, 0b11110110, 0b11010101, 0b01011111, 0b00010011, 0b01001001, 0b10000111, 0b10000101, 0b01111111, 0b01011101, 0b10011011, 0b10001001, 0b11010111, 0b10011101, 0b00010100, 0b10001000, 0b01101111, 0b01011010, 0b01010101, 0b10001110, 0b00000101, 0b11111110, 0b10110000, 0b00111011, 0b11111110, 0b01111101, 0b01010110, 0b11011001, 0b00011100, 0b01010111, 0b11111110, 0b01011011, 0b11000101, 0b11001101, 0b11000101, 0b00010010, 0b00111110, 0b01111100, 0b11111101, 0b01010111, 0b01011111, 0b11001111, 0b01011100, 0b11001000, 0b00000010, 0b00101110, 0b11100010, 0b11110100, 0b11111001, 0b01010111, 0b00001111, 0b00101110, 0b00111001, 0b10110101, 0b10011110, 0b01111011, 0b01100111, 0b00101000, 0b10110000, 0b00101010, 0b11000111, 0b10010000, 0b10101000, 0b00101011, 0b00101100, 0b00111011, 0b01100110, 0b00110000, 0b00011110, 0b11111101, 0b01111110, 0b01101010, 0b01100001, 0b10010001, 0b01101110, 0b10111110, 0b10010110, 0b11110011, 0b11101110, 0b11010111, 0b00010101, 0b11110001, 0b10010101], # Node 107
-[0b10001111, 0b11101111, 0b01101001, 0b01000011, 0b10001110, 0b01000111, 0b10011100, 0b01011100, 0b00001101, 0b11010001, 0b10101110, 0b11110000, 0b11101101, 0b10001000, 0b11100001, 0b01010010, 0b11001011, 0b10010111, 0b10001001, 0b01110001, 0b01011000, 0b01011111, 0b10110100, 0b11001010, 0b10111110, 0b11111111, 0b10000001, 0b00111011, 0b10011111, 0b11000011, 0b00101101, 0b11001000, 0b00111011, 0b11010010, 0b10100001, 0b11011110, 0b00000011, 0b01010100, 0b11101111, 0b01110101, 0b10001100, 0b11110110, 0b00011011, 0b01110000, 0b00001111, 0b11010010, 0b00111010, 0b00100111, 0b00111110, 0b11010101, 0b01101100, 0b00010100, 0b01011100, 0b11001111, 0b00100000, 0b10101000, 0b01111001, 0b10010110, 0b01101110, 0b11111100, 0b10011010, 0b11111001, 0b11110111, 0b01110110, 0b01100011, 0b11110100, 0b11101110, 0b01100010, 0b01111010, 0b10101110, 0b01001010, 0b00110011, 0b00100000, 0b01100110, 0b11111001, 0b00011101, 0b10011101, 0b10001111, 0b01111000, 0b01111001, 0b11001011, 0b00101111, 0b10011010, 0b11001001, 0b11110000, 0b01111101, 0b01001010, 0b10110001, 0b01001100, 0b10101100, 0b01010011, 0b11100101, 0b11001100, 0b10111101, 0b11110101, 0b11110011, 0b11011111, 0b11011010], # Node 108
-[0b00000101, 0b01100000, 0b11101010, 0b00011101, 0b11101001, 0b00000100, 0b00101010, 0b00001010, 0b10000010, 0b00001001, 0b10001100, 0b00000000, 0b00010100, 0b11001110, 0b00101001, 0b01111100, 0b10110110, 0b11010100, 0b10111110, 0b00010001, 0b00011100, 0b01001001, 0b10111011, 0b00000011, 0b11101010, 0b11101000, 0b01101101, 0b00110100, 0b01000001, 0b00010100, 0b00001110, 0b01011011, 0b01111000, 0b10101010, 0b00100100, 0b01000110, 0b10001010, 0b11010100, 0b10010001, 0b10101111, 0b11111000, 0b01110010, 0b00100010, 0b11011001, 0b00010000, 0b01000000, 0b11001110, 0b01110110, 0b00101001, 0b00100001, 0b10101000, 0b01010110, 0b01100011, 0b01011000, 0b00000101, 0b00000111, 0b01110011, 0b10011001, 0b00100000, 0b01110011, 0b00110111, 0b11101110, 0b11101101, 0b01011110, 0b01010011, 0b00100010, 0b01001000, 0b10101001, 0b11100101, 0b00100100, 0b10011000, 0b11001100, 0b11010111, 0b01111110, 0b10010110, 0b10101010, 0b01100100, 0b00010101, 0b01001000, 0b11111000, 0b11111100, 0b01100000, 0b01101010, 0b01000010, 0b01000000, 0b11001110, 0b00001101, 0b00100111, 0b10010000, 0b00000110, 0b00110000, 0b10000011, 0b01000011, 0b11111010, 0b00000101, 0b00011001, 0b10111010, 0b01001100], # Node 109
-[0b11111101, 0b01100011, 0b10100100, 0b11101110, 0b11101111, 0b11000011, 0b11101111, 0b11011001, 0b10111101, 0b01000011, 0b10111000, 0b01010001, 0b11111011, 0b00101101, 0b11001111, 0b00100001, 0b11101101, 0b11101000, 0b10011100, 0b01111001, 0b11010100, 0b11101110, 0b00100100, 0b01010010, 0b11111011, 0b11101110, 0b10110101, 0b01111101, 0b11111001, 0b00101011, 0b11011100, 0b00101100, 0b01100001, 0b10101100, 0b11010100, 0b01111011, 0b11110111, 0b10101001, 0b11100000, 0b00011100, 0b01010100, 0b10101111, 0b11101100, 0b11111110, 0b10011000, 0b00001111, 0b01000001, 0b01001101, 0b00100110, 0b10100100, 0b10000100, 0b00111100, 0b10111110, 0b10110010, 0b10111011, 0b11110101, 0b11100110, 0b00100110, 0b00111011, 0b11111110, 0b00010011, 0b00110011, 0b11000001, 0b01101111, 0b10110000, 0b11101110, 0b11111001, 0b11101000, 0b11101001, 0b11111111, 0b01000101, 0b00000000, 0b10010110, 0b11101011, 0b10100101, 0b01001011, 0b10100011, 0b10011110, 0b11001110, 0b01000110, 0b01011100, 0b11110110, 0b01111111, 0b01101010, 0b11111111, 0b01000011, 0b01110111, 0b01100110, 0b00010000, 0b11001110, 0b10111000, 0b01111001, 0b11110110, 0b00111001, 0b11011101, 0b01111011, 0b11100001, 0b11111111], # Node 110
-[0b00011111, 0b11011110, 0b11111000, 0b01001111, 0b10010011, 0b11101111, 0b11111111, 0b01010000, 0b00111101, 0b01110010, 0b10001111, 0b11101110, 0b01011001, 0b01000100, 0b01101001, 0b00110100, 0b11001101, 0b11001010, 0b11110011, 0b10000001, 0b10011101, 0b11011011, 0b11110001, 0b11010100, 0b11101011, 0b11100110, 0b11010101, 0b11111101, 0b00101011, 0b10010000, 0b10010001, 0b10110110, 0b11111110, 0b11110111, 0b01101011, 0b01101100, 0b11000001, 0b11010010, 0b01100001, 0b10010111, 0b10001101, 0b01110011, 0b11001111, 0b00001100, 0b00001100, 0b11011101, 0b10111111, 0b11010111, 0b11110100, 0b11000001, 0b10100011, 0b11111001, 0b10010001, 0b11100010, 0b00100001, 0b01010110, 0b10001111, 0b00101000, 0b10111010, 0b01111001, 0b11100001, 0b01001000, 0b10110010, 0b10001111, 0b10110011, 0b00000101, 0b10110001, 0b11001100, 0b01001001, 0b01100011, 0b10111111, 0b11000010, 0b10011111, 0b10111100, 0b00101101, 0b00010001, 0b10100100, 0b01011111, 0b11011100, 0b11000100, 0b10111001, 0b01011101, 0b01001010, 0b10110101, 0b10000101, 0b10010111, 0b10001110, 0b11101110, 0b11000100, 0b11001010, 0b00000111, 0b10001011, 0b10000111, 0b10110000, 0b00100000, 0b10110111, 0b10110100, 0b01100001], # Node 111
-[0b11010111, 0b10100010, 0b11001100, 0b10111001, 0b11110011, 0b11111011, 0b00001111, 0b01000110, 0b01000011, 0b01100111, 0b11110101, 0b01110111, 0b00000011, 0b10111101, 0b01111010, 0b00101110, 0b11110011, 0b01011000, 0b01100010, 0b10110111, 0b11001111, 0b00100000, 0b00101111, 0b10011100, 0b10111110, 0b10001011, 0b10001011, 0b11111010, 0b01111110, 0b11010101, 0b10000110, 0b10010110, 0b11101110, 0b10101101, 0b10100100, 0b11100111, 0b10011101, 0b11011011, 0b10100100, 0b00001111, 0b11111101, 0b11001110, 0b11011101, 0b00000111, 0b11111111, 0b11111101, 0b00101011, 0b11011100, 0b11100011, 0b11110001, 0b00000000, 0b10110001, 0b01011000, 0b01011011, 0b11000110, 0b01000011, 0b11011101, 0b11100111, 0b11111110, 0b11101110, 0b11010111, 0b10000000, 0b10111011, 0b00011101, 0b00111001, 0b11111111, 0b11011011, 0b00101001, 0b10001111, 0b10011001, 0b01010010, 0b10000010, 0b01101000, 0b11101111, 0b00000111, 0b11110010, 0b11010001, 0b11101110, 0b01000011, 0b11001111, 0b00010101, 0b01011001, 0b10110000, 0b01111111, 0b10011110, 0b10101001, 0b10111111, 0b11111101, 0b10100100, 0b11110111, 0b10101101, 0b11100001, 0b10011101, 0b11011111, 0b10101111, 0b10111101, 0b11001111, 0b10100111], # Node 112
-[0b00001000, 0b00110001, 0b00000010, 0b10000111, 0b00111010, 0b10011010, 0b10100000, 0b01010110, 0b00011011, 0b00011100, 0b00000000, 0b10100111, 0b01111010, 0b01010101, 0b01110010, 0b01101001, 0b01010000, 0b10101101, 0b11011101, 0b10010111, 0b10110011, 0b10011000, 0b11011110, 0b01011100, 0b00000101, 0b10001101, 0b01101001, 0b00001110, 0b00101001, 0b00001010, 0b00111111, 0b11011000, 0b11111101, 0b01000100, 0b00100101, 0b11001100, 0b10001111, 0b01001001, 0b00000100, 0b10001110, 0b00011100, 0b00010100, 0b10010111, 0b11010101, 0b00001100, 0b11000101, 0b11110011, 0b11011001, 0b10010001, 0b00010110, 0b00000000, 0b00001010, 0b11100001, 0b00011101, 0b01000011, 0b00101010, 0b11000100, 0b01010011, 0b01010011, 0b11001111, 0b00111010, 0b00110010, 0b10100001, 0b01000110, 0b01000101, 0b00001100, 0b11101000, 0b10110110, 0b00110101, 0b00001110, 0b11000011, 0b10000010, 0b00001001, 0b01010000, 0b01011001, 0b11000111, 0b10100011, 0b10010000, 0b00011000, 0b01001001, 0b11000100, 0b01001110, 0b00000110, 0b10110001, 0b00110100, 0b10011010, 0b10111100, 0b10101011, 0b10111110, 0b10110001, 0b00001100, 0b11100100, 0b00011100, 0b00111100, 0b00100010, 0b10101010, 0b10110011, 0b00000000], # Node 113
-[0b11111001, 0b00011111, 0b10011111, 0b11011101, 0b11001001, 0b01011100, 0b11111111, 0b01110110, 0b11111011, 0b01111110, 0b10110101, 0b11111111, 0b10111111, 0b11110111, 0b11100011, 0b11110111, 0b11110011, 0b10101100, 0b10110101, 0b00001101, 0b11001111, 0b11101001, 0b11111010, 0b10000010, 0b11111110, 0b11001100, 0b00001001, 0b01110110, 0b01111010, 0b01011000, 0b10100010, 0b01111010, 0b00101111, 0b11110001, 0b00111011, 0b01010111, 0b10001001, 0b00111100, 0b11101110, 0b10011110, 0b11010101, 0b11110011, 0b11011000, 0b10110000, 0b00110101, 0b10100010, 0b11011101, 0b11111011, 0b11010010, 0b00101110, 0b11111110, 0b00000111, 0b01110011, 0b01000110, 0b11011111, 0b11110010, 0b00011111, 0b00011110, 0b10001111, 0b11011101, 0b11100001, 0b10011111, 0b11111100, 0b00011011, 0b10110110, 0b11000011, 0b11101100, 0b11110000, 0b00000111, 0b10011110, 0b10001011, 0b00011111, 0b11011100, 0b01010010, 0b11100011, 0b10101000, 0b01110101, 0b00010111, 0b10001000, 0b10111111, 0b00111001, 0b10000011, 0b01111111, 0b01111111, 0b11010111, 0b01111001, 0b10101101, 0b11011011, 0b11111101, 0b01111100, 0b10110110, 0b10101100, 0b11101001, 0b01100100, 0b10111101, 0b01111101, 0b11011010, 0b10111011], # Node 114
-[0b11111111, 0b10111100, 0b11101000, 0b00000011, 0b11101011, 0b01011010, 0b01010101, 0b00111111, 0b11110010, 0b11111110, 0b11011110, 0b10000011, 0b00111100, 0b11011000, 0b00101101, 0b11101111, 0b11000110, 0b10101001, 0b00011010, 0b01000111, 0b01110001, 0b11000101, 0b10100100, 0b11111011, 0b01010110, 0b10111111, 0b10100100, 0b01010100, 0b00111111, 0b10101000, 0b10001000, 0b01010010, 0b10010111, 0b10101011, 0b01100111, 0b00001110, 0b00110001, 0b10101101, 0b01111110, 0b01100110, 0b00100001, 0b00110111, 0b01111101, 0b11101111, 0b01100011, 0b01111010, 0b01110000, 0b00000110, 0b11011110, 0b00110101, 0b11010001, 0b11111010, 0b01101001, 0b00000010, 0b10111101, 0b11100111, 0b11001110, 0b10110011, 0b01011010, 0b11000000, 0b10000011, 0b11011101, 0b00000011, 0b11101111, 0b01010000, 0b01100100, 0b11100101, 0b11010000, 0b10010011, 0b10111010, 0b11100100, 0b00001011, 0b11101100, 0b11010001, 0b00110100, 0b11100011, 0b00011100, 0b10011111, 0b00011111, 0b11000010, 0b00101011, 0b01100011, 0b10001011, 0b10001101, 0b00111111, 0b11101011, 0b10101111, 0b01000111, 0b11101111, 0b00111110, 0b00111011, 0b10101011, 0b10101111, 0b11111110, 0b11011100, 0b11000000, 0b11100100, 0b00101110], # Node 115
-[0b00100000, 0b00100111, 0b01110100, 0b11010011, 0b00010100, 0b00111000, 0b00100010, 0b11001100, 0b10100001, 0b01010001, 0b11110000, 0b10011000, 0b11010100, 0b00001100, 0b00000100, 0b11000101, 0b01101010, 0b00010111, 0b00101000, 0b11100000, 0b00100000, 0b00001000, 0b00000100, 0b01000010, 0b11111000, 0b10001000, 0b10100000, 0b00100000, 0b10000000, 0b00100101, 0b00100000, 0b00000110, 0b01000110, 0b10000010, 0b11000001, 0b00111111, 0b11001001, 0b11001000, 0b10010000, 0b00001010, 0b00001110, 0b10011100, 0b00000000, 0b11110011, 0b10000100, 0b00000001, 0b01000000, 0b00000111, 0b10000010, 0b10010100, 0b00100001, 0b10000010, 0b00100011, 0b10010010, 0b10111001, 0b11011111, 0b10001111, 0b00111001, 0b11110011, 0b00101000, 0b00111101, 0b00011110, 0b00101101, 0b11000101, 0b10111111, 0b01011111, 0b01001101, 0b11111100, 0b10010010, 0b01000101, 0b00000011, 0b11111001, 0b01011000, 0b00001011, 0b11001001, 0b11011011, 0b01010101, 0b00101010, 0b10110000, 0b01110010, 0b01111011, 0b00010001, 0b10010000, 0b10010100, 0b11111101, 0b00000101, 0b00100100, 0b11100101, 0b00101100, 0b00000011, 0b10110001, 0b00011010, 0b01101110, 0b01110100, 0b00110010, 0b10010011, 0b10100100, 0b10101011], # Node 116
-[0b11101001, 0b01110000, 0b00101101, 0b01110110, 0b01111000, 0b01111010, 0b11001100, 0b00001100, 0b11001110, 0b01100010, 0b11010011, 0b11111001, 0b11101010, 0b11010100, 0b11111110, 0b11010011, 0b10011110, 0b10100101, 0b01011111, 0b01001000, 0b11111101, 0b11001000, 0b11011101, 0b11110111, 0b11011100, 0b01011101, 0b01100011, 0b10111111, 0b10110011, 0b11001110, 0b10011001, 0b00010110, 0b01011101, 0b10100101, 0b10101011, 0b10110111, 0b10101011, 0b11000110, 0b01100111, 0b01110111, 0b10110110, 0b11101000, 0b01010001, 0b11110111, 0b10001001, 0b11111001, 0b00100010, 0b11010001, 0b11110010, 0b11110110, 0b10111111, 0b11011010, 0b00110011, 0b10111101, 0b10010100, 0b00100001, 0b00111000, 0b11010001, 0b11001100, 0b01111111, 0b11010001, 0b11111101, 0b10111111, 0b10111101, 0b00001111, 0b01001101, 0b11111011, 0b11001011, 0b10000000, 0b11011100, 0b10101101, 0b00000101, 0b11011011, 0b11111010, 0b01100010, 0b10100011, 0b11101101, 0b11010010, 0b00001100, 0b00101011, 0b11001111, 0b10001110, 0b10011011, 0b11011010, 0b11110011, 0b11011001, 0b11101011, 0b11100001, 0b11111101, 0b00100011, 0b10111001, 0b00011100, 0b11111011, 0b10011111, 0b01110110, 0b11100111, 0b11111110, 0b11111001], # Node 117
-[0b11001110, 0b00100000, 0b00100000, 0b01000010, 0b10100010, 0b11001000, 0b00100100, 0b10101100, 0b00000010, 0b00011001, 0b00001000, 0b00110000, 0b00000000, 0b10111010, 0b01111001, 0b01100111, 0b00100010, 0b00100000, 0b01101010, 0b01111111, 0b11000000, 0b00000001, 0b00010000, 0b10101100, 0b01000000, 0b00000010, 0b00100100, 0b00000100, 0b11000000, 0b01101100, 0b00101101, 0b11101000, 0b10000001, 0b00011000, 0b10111011, 0b00000000, 0b01010101, 0b11010100, 0b00001100, 0b00010000, 0b11100000, 0b10001011, 0b10011100, 0b01111111, 0b11100100, 0b00100101, 0b00111011, 0b00010010, 0b00010010, 0b10100010, 0b10001011, 0b00111101, 0b10000001, 0b00011111, 0b01010110, 0b00000100, 0b01000110, 0b01110111, 0b01010011, 0b01001001, 0b00110101, 0b10110111, 0b01000110, 0b00011000, 0b10010010, 0b01011100, 0b10001000, 0b01110111, 0b11110010, 0b00000001, 0b00000101, 0b00011111, 0b00100110, 0b00000010, 0b11110010, 0b00111000, 0b10100110, 0b11100100, 0b00111010, 0b01000001, 0b10100000, 0b10110101, 0b10000000, 0b00100000, 0b00001110, 0b10101110, 0b00010000, 0b01000001, 0b10000001, 0b11000100, 0b11100110, 0b01000010, 0b01000010, 0b01100100, 0b10000000, 0b00010100, 0b00100110, 0b10000101], # Node 118
-[0b11010001, 0b11101100, 0b11110110, 0b10111111, 0b11111011, 0b11001111, 0b01101110, 0b10100110, 0b11001111, 0b11100101, 0b00011010, 0b11110110, 0b11011010, 0b10100101, 0b11101101, 0b01100110, 0b11001111, 0b10110111, 0b01110101, 0b10111100, 0b11111010, 0b00011100, 0b11110011, 0b01011011, 0b01001101, 0b00010111, 0b11111111, 0b00110101, 0b11010101, 0b10100011, 0b01111110, 0b01111100, 0b10100100, 0b11100111, 0b01111111, 0b01010001, 0b01111111, 0b10101011, 0b01000101, 0b10100100, 0b10100011, 0b11010011, 0b10011110, 0b11111110, 0b01000000, 0b11111110, 0b10111001, 0b00010111, 0b00011111, 0b01110101, 0b11011101, 0b00011011, 0b10110100, 0b00010110, 0b01001100, 0b10010110, 0b00110100, 0b11011011, 0b11101111, 0b10101110, 0b00110010, 0b00011011, 0b00011001, 0b00001110, 0b00010010, 0b10011010, 0b01111010, 0b00111000, 0b10011111, 0b11011111, 0b10101101, 0b01101100, 0b10011010, 0b10001111, 0b01110001, 0b10010000, 0b01100011, 0b11101100, 0b11110010, 0b10010001, 0b11001010, 0b11011101, 0b01000011, 0b11110110, 0b00001011, 0b01111101, 0b01110100, 0b11011110, 0b11101001, 0b00101111, 0b10001111, 0b11101111, 0b11111010, 0b11010101, 0b01110011, 0b11011111, 0b01010111, 0b11111110], # Node 119
-[0b10101100, 0b11111010, 0b00100111, 0b00010000, 0b01110010, 0b00101111, 0b11101111, 0b11100111, 0b11111111, 0b11111111, 0b10111001, 0b11111101, 0b11111111, 0b01001111, 0b11110010, 0b01100111, 0b11101111, 0b01001111, 0b11111111, 0b11100001, 0b10111111, 0b11110000, 0b00000111, 0b11110000, 0b01000111, 0b00011111, 0b10000000, 0b01111110, 0b00110100, 0b00000000, 0b11000000, 0b00001111, 0b00000000, 0b00000000, 0b01110000, 0b00000000, 0b10000000, 0b00000000, 0b00010010, 0b00000000, 0b00001000, 0b10000000, 0b00000011, 0b01001110, 0b00000000, 0b00101000, 0b11111100, 0b00001111, 0b11110000, 0b11110100, 0b11111111, 0b00001001, 0b10101111, 0b11111111, 0b10011111, 0b11100010, 0b11111001, 0b11111110, 0b01111101, 0b10101110, 0b00011111, 0b01001111, 0b01101100, 0b11101000, 0b01111001, 0b10111011, 0b00111111, 0b10000000, 0b01111111, 0b11110011, 0b00000000, 0b11111011, 0b11110111, 0b11011111, 0b00000000, 0b11111100, 0b10011111, 0b00111101, 0b00000000, 0b01111110, 0b01100110, 0b00000110, 0b10001000, 0b01100011, 0b00000101, 0b00000000, 0b00000000, 0b01000110, 0b00000000, 0b00000000, 0b01000000, 0b00000101, 0b00000000, 0b00000000, 0b00111010, 0b00000010, 0b10000000, 0b11111001], # Node 120
-[0b00100110, 0b11101011, 0b11111111, 0b11101011, 0b01111110, 0b11111010, 0b11101001, 0b11100010, 0b00011101, 0b11101101, 0b11110110, 0b10101110, 0b11110110, 0b11111111, 0b01111011, 0b01011010, 0b00010010, 0b01010110, 0b01100101, 0b11111110, 0b01101100, 0b01111101, 0b11011101, 0b10111000, 0b11001111, 0b11010101, 0b00111101, 0b11000111, 0b10111110, 0b11101111, 0b11111011, 0b00111011, 0b00111101, 0b01001011, 0b01010111, 0b11111101, 0b10100101, 0b11000101, 0b10100110, 0b11011101, 0b11111111, 0b01111000, 0b11010001, 0b11111111, 0b10111011, 0b11101101, 0b11010110, 0b01111111, 0b10111110, 0b11111110, 0b11011101, 0b00111101, 0b00010111, 0b01111110, 0b00011100, 0b11110111, 0b01011101, 0b01100011, 0b11100000, 0b01101101, 0b00011110, 0b10000100, 0b10001111, 0b11001000, 0b00010011, 0b11001000, 0b11111010, 0b00011111, 0b11000001, 0b01111111, 0b11010011, 0b10000101, 0b11110000, 0b01111101, 0b01111111, 0b11101001, 0b01110010, 0b10101101, 0b11111100, 0b10111111, 0b11100000, 0b11011100, 0b11111111, 0b11011111, 0b10110011, 0b11111110, 0b01111011, 0b10111010, 0b01111111, 0b10011101, 0b11111111, 0b00001111, 0b11111100, 0b10010111, 0b10110001, 0b11011010, 0b11010101, 0b11000110], # Node 121
-[0b00101100, 0b00000100, 0b01010000, 0b10100001, 0b11101010, 0b00000100, 0b10000001, 0b10011010, 0b00000101, 0b00100100, 0b00001010, 0b11010111, 0b01000000, 0b00001110, 0b00101010, 0b00100000, 0b01010101, 0b00001111, 0b00000101, 0b00111010, 0b01011010, 0b00000000, 0b01100001, 0b11101011, 0b00110111, 0b11111111, 0b01011000, 0b10100101, 0b11010000, 0b10011100, 0b10000010, 0b10001010, 0b00000111, 0b01011010, 0b10011011, 0b11110001, 0b01111110, 0b11100010, 0b01100000, 0b10000001, 0b10011110, 0b01101000, 0b11010001, 0b00110111, 0b01011111, 0b00010111, 0b00110011, 0b01101111, 0b11000011, 0b10100111, 0b00100110, 0b11011100, 0b10110001, 0b00010100, 0b11010001, 0b00000000, 0b00011010, 0b10101000, 0b00100110, 0b10100110, 0b11100010, 0b10110000, 0b00000000, 0b01000000, 0b11001101, 0b00110000, 0b00111001, 0b10011100, 0b01000001, 0b10011001, 0b11001000, 0b10101110, 0b11001001, 0b00100011, 0b00101111, 0b10011001, 0b00011011, 0b11001011, 0b10011010, 0b00000111, 0b11001100, 0b01100011, 0b01101000, 0b11010010, 0b11111000, 0b10001010, 0b11111111, 0b10100010, 0b10000111, 0b10100100, 0b10010100, 0b10000000, 0b00010111, 0b01110111, 0b10101000, 0b10000100, 0b00110111, 0b00010110], # Node 122
-[0b00001000, 0b00111100, 0b00111001, 0b10001001, 0b11110001, 0b00000001, 0b01101100, 0b10110000, 0b11000001, 0b11000100, 0b00010000, 0b00010101, 0b00010101, 0b00000000, 0b00010010, 0b11000100, 0b01011000, 0b10100000, 0b01010110, 0b11010010, 0b10101001, 0b00000100, 0b00100000, 0b11000101, 0b10100000, 0b01110110, 0b00010110, 0b00100100, 0b01101010, 0b11011011, 0b01011000, 0b00001000, 0b11011101, 0b10111010, 0b00110001, 0b10100001, 0b01011010, 0b10001111, 0b01100011, 0b10100110, 0b11111011, 0b10100001, 0b00011000, 0b10011011, 0b11101001, 0b00000010, 0b10111001, 0b11000110, 0b00000101, 0b11010001, 0b01110100, 0b00001110, 0b10100010, 0b01000101, 0b10110011, 0b01100001, 0b00101011, 0b00000011, 0b11010110, 0b01000101, 0b10100100, 0b00001000, 0b00000001, 0b00100101, 0b10110010, 0b10100100, 0b00010000, 0b01110011, 0b01001100, 0b00001010, 0b11001000, 0b00000010, 0b01100010, 0b00101000, 0b11011000, 0b00000101, 0b10001110, 0b11010100, 0b01000100, 0b10010011, 0b00010001, 0b11011000, 0b10110111, 0b01011000, 0b01100101, 0b01010000, 0b01101001, 0b01010001, 0b00000110, 0b00110100, 0b00000011, 0b11011100, 0b01001010, 0b11110111, 0b01110101, 0b10000001, 0b00000100, 0b11000010], # Node 123
-[0b01111110, 0b11111111, 0b11100011, 0b10010111, 0b00011100, 0b11101011, 0b11100001, 0b00111100, 0b00011110, 0b11101000, 0b10111100, 0b10101010, 0b11101111, 0b01001110, 0b01100100, 0b00000001, 0b00101011, 0b10110101, 0b01111000, 0b11000011, 0b10010010, 0b11110111, 0b11000100, 0b10001011, 0b11101011, 0b00111001, 0b01001001, 0b11011011, 0b11111010, 0b11011100, 0b10011001, 0b11100111, 0b01010100, 0b00011011, 0b01111111, 0b10101001, 0b01011101, 0b01000010, 0b11011100, 0b11000010, 0b11111000, 0b00101010, 0b01011011, 0b10000100, 0b01110111, 0b00100100, 0b00001101, 0b01100110, 0b01011111, 0b11010111, 0b10101000, 0b10110010, 0b00001011, 0b10001111, 0b10010100, 0b00110100, 0b01101010, 0b01101111, 0b11111100, 0b10011001, 0b01100101, 0b01000011, 0b01100100, 0b10011111, 0b00101100, 0b00001100, 0b11010011, 0b00101011, 0b11010011, 0b11111000, 0b10000001, 0b10011001, 0b11100011, 0b11101000, 0b01010001, 0b10110100, 0b10010000, 0b11101010, 0b00010110, 0b11111100, 0b00011111, 0b00000011, 0b01111010, 0b10101110, 0b11011100, 0b00100001, 0b01000011, 0b01111100, 0b00010100, 0b10101110, 0b10011110, 0b11110110, 0b11111011, 0b10101111, 0b10111001, 0b00111111, 0b11000011, 0b11000000], # Node 124
-[0b11100100, 0b10110011, 0b11010000, 0b11101110, 0b01101100, 0b01000011, 0b11111001, 0b11001111, 0b01111001, 0b10111101, 0b01111110, 0b11111010, 0b00110110, 0b11111111, 0b01010001, 0b10111011, 0b11101100, 0b10111100, 0b11111100, 0b10111011, 0b11111110, 0b01111100, 0b00011101, 0b01011010, 0b10100100, 0b01010110, 0b10001001, 0b11000110, 0b01100100, 0b00101011, 0b11001010, 0b11111110, 0b00111001, 0b00111011, 0b11011000, 0b00010111, 0b11111110, 0b10001101, 0b10111111, 0b01111011, 0b11110111, 0b11111100, 0b11111001, 0b11101111, 0b11001011, 0b01011101, 0b10111000, 0b10101010, 0b10011100, 0b11111111, 0b11100100, 0b11010101, 0b01111011, 0b00100100, 0b10100010, 0b01101110, 0b10000111, 0b11000000, 0b11100000, 0b11111010, 0b01000101, 0b00000000, 0b11111101, 0b10001101, 0b01000100, 0b10000001, 0b01010110, 0b11101001, 0b00000110, 0b11101010, 0b00001101, 0b11101001, 0b01000010, 0b10111011, 0b00100101, 0b01111011, 0b00111011, 0b11110010, 0b11110100, 0b11000101, 0b11011100, 0b01110101, 0b00011111, 0b11111100, 0b01111100, 0b11111011, 0b10110110, 0b00101111, 0b10111111, 0b11011000, 0b01010111, 0b11001110, 0b00001011, 0b10000000, 0b01010100, 0b11101110, 0b11101001, 0b11011111], # Node 125
-[0b11111111, 0b01110111, 0b10001011, 0b11111110, 0b11011011, 0b10011111, 0b01101101, 0b11110011, 0b11111101, 0b11000110, 0b10100111, 0b11011111, 0b01001111, 0b11001111, 0b10111010, 0b11111001, 0b11111101, 0b10101111, 0b11001110, 0b11111010, 0b11101110, 0b01011010, 0b11000001, 0b01110011, 0b01110101, 0b10100110, 0b01000000, 0b01100110, 0b00011110, 0b00001100, 0b10100011, 0b00010101, 0b11000011, 0b10000100, 0b11111111, 0b01011010, 0b00011101, 0b11110000, 0b11100011, 0b01010101, 0b01001011, 0b11000011, 0b11001111, 0b01111000, 0b11111010, 0b01110110, 0b00011001, 0b01010000, 0b10101111, 0b11111011, 0b01010101, 0b11010110, 0b01110010, 0b01111110, 0b01110000, 0b11111100, 0b11110101, 0b10101110, 0b11011110, 0b10100101, 0b01100111, 0b00000000, 0b11111110, 0b10011111, 0b01001101, 0b11010100, 0b11011001, 0b11100011, 0b00111000, 0b00101111, 0b01101101, 0b11010100, 0b11101111, 0b01100110, 0b11001001, 0b00010000, 0b01101100, 0b00111011, 0b10101000, 0b01101000, 0b01101110, 0b11001011, 0b00001010, 0b10011110, 0b01101111, 0b01101111, 0b10011000, 0b11111111, 0b10101101, 0b11001111, 0b01111011, 0b11011111, 0b11110110, 0b11111010, 0b11111011, 0b00111011, 0b01111011, 0b11110111], # Node 126
-[0b10000001, 0b11010000, 0b00100000, 0b10000010, 0b11101100, 0b11101011, 0b11100010, 0b11101010, 0b00111010, 0b00001000, 0b00000101, 0b00100111, 0b00000010, 0b01011010, 0b00100011, 0b10011110, 0b10000000, 0b00101000, 0b01000010, 0b10010111, 0b10000001, 0b00000001, 0b00111100, 0b10011011, 0b00010100, 0b01010000, 0b00111111, 0b00101010, 0b10111000, 0b11111111, 0b01001111, 0b00111000, 0b10110100, 0b10101111, 0b01000101, 0b00100110, 0b11110011, 0b00111110, 0b10101000, 0b00101110, 0b11100110, 0b00001000, 0b11000000, 0b00000000, 0b00001101, 0b00011000, 0b00000000, 0b11100000, 0b00010000, 0b00001111, 0b10011000, 0b00010000, 0b01001001, 0b01000101, 0b11110000, 0b11000110, 0b01010011, 0b00001111, 0b11000101, 0b00100010, 0b10111001, 0b11110011, 0b10110110, 0b10110001, 0b01001110, 0b10001101, 0b11010000, 0b11111001, 0b11010111, 0b00011111, 0b10010000, 0b10011111, 0b11100000, 0b00011100, 0b01111000, 0b01000111, 0b01001111, 0b01100010, 0b01010101, 0b00001111, 0b00101010, 0b01000000, 0b01010011, 0b00110000, 0b00110010, 0b10111000, 0b00010111, 0b01010011, 0b10101111, 0b00010101, 0b01000010, 0b01101100, 0b00000001, 0b00000110, 0b11100011, 0b00110000, 0b00011011, 0b11110000], # Node 127
-[0b11010101, 0b01111001, 0b01010110, 0b01110111, 0b11011110, 0b10011101, 0b10101100, 0b11110111, 0b10101111, 0b11101111, 0b11111000, 0b00010000, 0b00001110, 0b10010010, 0b11100100, 0b11100000, 0b11001001, 0b00110101, 0b01101001, 0b10001101, 0b00100001, 0b01111011, 0b01100011, 0b00010001, 0b00101111, 0b10001100, 0b00011111, 0b01100001, 0b11101001, 0b10100010, 0b10110110, 0b11111010, 0b00100111, 0b01110000, 0b11010100, 0b11001110, 0b10110101, 0b11110101, 0b10110101, 0b00111010, 0b11000111, 0b01001010, 0b00010110, 0b10100000, 0b00111100, 0b00011110, 0b11100000, 0b01000111, 0b10101000, 0b10110101, 0b00000110, 0b10111110, 0b01101011, 0b10100110, 0b10001111, 0b01111101, 0b11010110, 0b10011011, 0b01001000, 0b00011100, 0b11100011, 0b11110001, 0b00100010, 0b00111111, 0b11011000, 0b11111000, 0b11111111, 0b11111010, 0b01011000, 0b10101100, 0b11110011, 0b10101110, 0b01010010, 0b00011000, 0b00100011, 0b01110001, 0b01101111, 0b11111001, 0b00010110, 0b00110000, 0b00011010, 0b11011110, 0b10111010, 0b01111111, 0b10000011, 0b01101111, 0b10011111, 0b10100110, 0b11101100, 0b11010001, 0b11001110, 0b01100011, 0b10101110, 0b10011011, 0b00100001, 0b10100101, 0b10000011, 0b00010010], # Node 128
-[0b00000010, 0b00011011, 0b01011010, 0b11001100, 0b01110001, 0b11010000, 0b00011011, 0b01100110, 0b00111011, 0b11100010, 0b00111011, 0b00000110, 0b00110110, 0b00100000, 0b00000000, 0b11001010, 0b01010001, 0b01110101, 0b10111011, 0b11111011, 0b00000100, 0b01000110, 0b01110010, 0b00101101, 0b10111001, 0b10010000, 0b10010110, 0b00011010, 0b01010110, 0b11101010, 0b11111010, 0b00110000, 0b00011100, 0b10110100, 0b01110100, 0b00010100, 0b00100000, 0b11110010, 0b11001001, 0b10000110, 0b10111101, 0b00000101, 0b00101101, 0b10100111, 0b10011001, 0b00011110, 0b01010101, 0b00100010, 0b01000011, 0b00010011, 0b10100001, 0b00110111, 0b11111100, 0b00011000, 0b11101110, 0b10010000, 0b01101100, 0b10101111, 0b10011010, 0b11101000, 0b00000101, 0b11100100, 0b01000011, 0b11110000, 0b11010010, 0b10011110, 0b01110000, 0b00001000, 0b00110011, 0b01001111, 0b01001100, 0b10100000, 0b01000111, 0b10101001, 0b10010101, 0b10010001, 0b01010001, 0b11000101, 0b11011101, 0b01111000, 0b00110000, 0b10011011, 0b10001011, 0b00101101, 0b11000000, 0b00101011, 0b01110010, 0b01010000, 0b01011010, 0b10000100, 0b10101001, 0b00100010, 0b00101000, 0b00110010, 0b10110110, 0b00011111, 0b10010000, 0b01000000], # Node 129
-[0b01000111, 0b00001110, 0b00000000, 0b01100010, 0b10001000, 0b10010110, 0b10011001, 0b00110010, 0b00111010, 0b00100111, 0b00000100, 0b10110101, 0b01110000, 0b10110000, 0b10000011, 0b10100001, 0b00101100, 0b01111010, 0b00000110, 0b01100110, 0b01000011, 0b10001011, 0b00110101, 0b01100000, 0b11111010, 0b01001110, 0b11101111, 0b10000001, 0b00100101, 0b01111101, 0b11001110, 0b10001100, 0b11101101, 0b01100001, 0b11000010, 0b00100000, 0b11111000, 0b10001111, 0b10110101, 0b00111101, 0b10011011, 0b01001011, 0b10000100, 0b10101101, 0b01001100, 0b00100011, 0b10100001, 0b00000111, 0b00001100, 0b11101010, 0b01000110, 0b01000111, 0b00000011, 0b11100011, 0b10100100, 0b01111100, 0b01000100, 0b01111010, 0b00110100, 0b10000110, 0b01101110, 0b10001101, 0b01011110, 0b01010001, 0b01110010, 0b00001010, 0b00100100, 0b10010000, 0b00011011, 0b01011010, 0b00100111, 0b10110100, 0b00101000, 0b11111110, 0b00101000, 0b11111000, 0b00100101, 0b10110111, 0b01100110, 0b01000010, 0b00010001, 0b01101100, 0b00110000, 0b10000000, 0b10010011, 0b00011010, 0b01110001, 0b00110010, 0b01000100, 0b00001011, 0b10101000, 0b11100100, 0b01010010, 0b10101101, 0b00001110, 0b11000100, 0b01001000, 0b01100001], # Node 130
-[0b11000011, 0b10111111, 0b11110001, 0b01110111, 0b11111011, 0b11110100, 0b11111000, 0b11010101, 0b11011111, 0b01111111, 0b11111110, 0b11011010, 0b11111011, 0b00001111, 0b01111110, 0b11110110, 0b11011001, 0b11111111, 0b00001011, 0b11011100, 0b10111011, 0b11101100, 0b01100000, 0b10000011, 0b01011111, 0b11011101, 0b00100100, 0b00110010, 0b01011111, 0b11101111, 0b10111111, 0b11101111, 0b11100100, 0b11011111, 0b11111100, 0b00111111, 0b11111010, 0b11001111, 0b00011110, 0b10000111, 0b01111010, 0b11010101, 0b10111101, 0b00110011, 0b01111110, 0b00111111, 0b00001110, 0b00110000, 0b11101111, 0b11110111, 0b10101110, 0b11110000, 0b11110110, 0b00011101, 0b10000001, 0b01001110, 0b00111110, 0b01100111, 0b11100011, 0b11110111, 0b01001000, 0b01000100, 0b11101101, 0b11011110, 0b10011011, 0b10111011, 0b10111011, 0b00111001, 0b01111101, 0b10111010, 0b00011011, 0b10110101, 0b10011111, 0b01011111, 0b00010010, 0b01110100, 0b11100111, 0b11000001, 0b10000110, 0b01000001, 0b01111111, 0b11111111, 0b00001100, 0b01111010, 0b11111111, 0b10010110, 0b10101111, 0b00110111, 0b11111000, 0b10111111, 0b11110011, 0b01001111, 0b01111111, 0b11111111, 0b11011001, 0b11111101, 0b10111110, 0b01011110], # Node 131
-[0b01011110, 0b00100011, 0b10111110, 0b10100111, 0b11101111, 0b11011000, 0b10111100, 0b10101101, 0b00010101, 0b11110110, 0b11101100, 0b10111111, 0b11101111, 0b00110110, 0b11110101, 0b01111110, 0b11101001, 0b01111000, 0b00011101, 0b10110010, 0b10110111, 0b10111110, 0b00000001, 0b11100100, 0b10111011, 0b00110010, 0b01010000, 0b11110111, 0b01100101, 0b00001100, 0b10001101, 0b01111011, 0b11001010, 0b01101011, 0b01111111, 0b01011100, 0b00111011, 0b11011101, 0b11001000, 0b11110001, 0b11001001, 0b10111011, 0b11111111, 0b11101110, 0b00100010, 0b11010101, 0b11101110, 0b00100001, 0b01011100, 0b11100100, 0b10111001, 0b10001101, 0b10111110, 0b11100011, 0b11100100, 0b01011111, 0b01101100, 0b00011110, 0b00111101, 0b00001010, 0b00010101, 0b10110010, 0b10111100, 0b10110001, 0b10000000, 0b11110011, 0b11011100, 0b00100111, 0b11111000, 0b01010000, 0b01111110, 0b11101001, 0b00011111, 0b11010111, 0b01000101, 0b10011111, 0b00001110, 0b01110010, 0b01101001, 0b01001011, 0b11011111, 0b00011111, 0b01010011, 0b01111001, 0b11011111, 0b10111110, 0b00010011, 0b11110111, 0b01011011, 0b01010101, 0b11101001, 0b11111100, 0b10000100, 0b11011110, 0b00110100, 0b11111111, 0b10110101, 0b01110110], # Node 132
-[0b01000001, 0b01001010, 0b00000100, 0b01010111, 0b11111000, 0b00001010, 0b00001001, 0b10000001, 0b10000110, 0b01100111, 0b01011000, 0b10010111, 0b00000001, 0b00001000, 0b00000000, 0b11010010, 0b00001100, 0b00100001, 0b01000001, 0b00001000, 0b11000010, 0b00110100, 0b11000000, 0b01001000, 0b00011110, 0b00000110, 0b00001000, 0b01001000, 0b00101010, 0b00001001, 0b10010000, 0b00100101, 0b01100110, 0b00001101, 0b10000000, 0b00000001, 0b11001011, 0b00000001, 0b01100010, 0b00110000, 0b00001110, 0b01100000, 0b10001010, 0b11000011, 0b00000000, 0b00000100, 0b00110100, 0b00001100, 0b10000100, 0b11000000, 0b11000010, 0b00000000, 0b11010000, 0b00010100, 0b01000110, 0b00000111, 0b01000110, 0b11011000, 0b00001100, 0b00001000, 0b00000001, 0b01100110, 0b01010000, 0b01101000, 0b01011001, 0b00100101, 0b00110110, 0b11111000, 0b00110110, 0b00110001, 0b11000000, 0b01111110, 0b11000001, 0b10111100, 0b10110000, 0b00011111, 0b00001010, 0b11000111, 0b01111100, 0b10100001, 0b00001011, 0b11000000, 0b00001000, 0b00011011, 0b00100101, 0b00000000, 0b01000110, 0b11010000, 0b10000110, 0b11000100, 0b00110010, 0b11000000, 0b10010100, 0b10100110, 0b00010000, 0b00101000, 0b00011111, 0b01010000], # Node 133
-[0b10011001, 0b11010100, 0b00010100, 0b00101010, 0b00100111, 0b11010111, 0b00010001, 0b00110101, 0b00010000, 0b11000001, 0b10000000, 0b01001011, 0b01001100, 0b00110111, 0b10000110, 0b00110000, 0b11101101, 0b10000101, 0b01000001, 0b10100100, 0b01011100, 0b00000100, 0b10000000, 0b11001110, 0b10010000, 0b00011000, 0b11110000, 0b11001011, 0b00111100, 0b01000101, 0b11110100, 0b11100010, 0b11010010, 0b10100011, 0b00000100, 0b10010011, 0b01011111, 0b01001100, 0b01000000, 0b00110111, 0b10110000, 0b01010100, 0b01010010, 0b11000001, 0b00100111, 0b01000101, 0b01000010, 0b01000010, 0b11100001, 0b11001000, 0b01000101, 0b01001101, 0b10000111, 0b11010101, 0b01100101, 0b11011100, 0b01111010, 0b01000011, 0b00000000, 0b00010010, 0b00000011, 0b10100100, 0b11011010, 0b00010001, 0b11101010, 0b10000000, 0b10000101, 0b01110011, 0b10011111, 0b01010000, 0b11010100, 0b10101100, 0b11000101, 0b10000010, 0b11000000, 0b00100101, 0b01110010, 0b10001000, 0b10101000, 0b00000010, 0b00001110, 0b00010000, 0b00000000, 0b00011101, 0b11000001, 0b10100101, 0b10010000, 0b00111100, 0b10001010, 0b00110001, 0b00100101, 0b11001001, 0b11101010, 0b01110100, 0b11110011, 0b01110100, 0b00100000, 0b00101101], # Node 134
-[0b01110111, 0b01000110, 0b01111100, 0b01101100, 0b00001010, 0b10010110, 0b01101101, 0b00010101, 0b10100000, 0b10001101, 0b00110111, 0b10100110, 0b01011100, 0b01100011, 0b11000010, 0b10111110, 0b11010101, 0b01001111, 0b00001001, 0b00101001, 0b11001111, 0b01111110, 0b00110010, 0b10101001, 0b10111110, 0b10101111, 0b00111001, 0b00100000, 0b10000010, 0b00011101, 0b00011110, 0b01010100, 0b11101000, 0b01110011, 0b01101101, 0b00000110, 0b00010100, 0b11101101, 0b00101101, 0b10100011, 0b11011000, 0b01001110, 0b11000110, 0b00100011, 0b01000011, 0b01001001, 0b10100011, 0b10011111, 0b00101010, 0b00100001, 0b10100000, 0b11000110, 0b11001010, 0b00100010, 0b10101100, 0b10000101, 0b10101011, 0b11010010, 0b01101101, 0b01001110, 0b00000110, 0b01011001, 0b01001011, 0b01011000, 0b01000011, 0b01000011, 0b00000101, 0b01110001, 0b01110011, 0b10100000, 0b01000001, 0b01101010, 0b11101010, 0b10000001, 0b11010001, 0b01001000, 0b10000100, 0b01110100, 0b11001010, 0b00010010, 0b00110000, 0b11000010, 0b00111111, 0b00110001, 0b10001001, 0b01000001, 0b10101000, 0b00100100, 0b01100010, 0b01010101, 0b00000001, 0b10101011, 0b01000000, 0b01000110, 0b01111011, 0b00110000, 0b00110001, 0b00001110], # Node 135
-[0b01010110, 0b10011100, 0b00111111, 0b11100001, 0b00110101, 0b11010111, 0b01101001, 0b10000100, 0b11110101, 0b11100001, 0b11010000, 0b10110111, 0b11010110, 0b11000111, 0b11101011, 0b01011111, 0b11111010, 0b10011110, 0b11110010, 0b11001010, 0b11111111, 0b10101111, 0b00011001, 0b01011101, 0b00101110, 0b11100000, 0b11111000, 0b00111110, 0b00100010, 0b01001011, 0b11101110, 0b10001110, 0b01110000, 0b01100110, 0b00101000, 0b11011010, 0b00110111, 0b10011111, 0b11101111, 0b11111110, 0b01110001, 0b11010110, 0b11011011, 0b10101011, 0b01010111, 0b11101110, 0b01111111, 0b01111111, 0b00100111, 0b11101001, 0b11010111, 0b01001111, 0b11100000, 0b11111111, 0b10101011, 0b10101110, 0b11100100, 0b10110110, 0b01111101, 0b10110111, 0b11110110, 0b11110000, 0b10111111, 0b01011101, 0b11101110, 0b01101111, 0b11100101, 0b11100111, 0b11111010, 0b00111110, 0b01111011, 0b11100000, 0b01101111, 0b11111110, 0b00011111, 0b11011010, 0b11000111, 0b11101111, 0b11100001, 0b11110110, 0b01111100, 0b00000111, 0b11000101, 0b11100101, 0b10110001, 0b10000001, 0b11111110, 0b10011110, 0b10010011, 0b00011101, 0b11110111, 0b11111100, 0b11011011, 0b01100110, 0b11000001, 0b11010000, 0b01100111, 0b11110010], # Node 136
-[0b11011001, 0b11001110, 0b00100110, 0b10011010, 0b01010000, 0b10110101, 0b11011101, 0b01101101, 0b10000110, 0b01100010, 0b10000100, 0b01101110, 0b10001001, 0b11001111, 0b10010010, 0b10010011, 0b01010010, 0b00001101, 0b11001101, 0b01010001, 0b01101111, 0b01111101, 0b10110101, 0b00010001, 0b01001000, 0b00011000, 0b01110100, 0b00101101, 0b01111010, 0b10110101, 0b00010101, 0b00001101, 0b01011000, 0b00110000, 0b00011010, 0b01111101, 0b10110011, 0b01010010, 0b11001101, 0b10111100, 0b10100111, 0b01100000, 0b10100011, 0b01111101, 0b10000110, 0b10000011, 0b10101000, 0b10001110, 0b00001000, 0b01001011, 0b01010110, 0b00011101, 0b00110011, 0b11011010, 0b10101001, 0b00011010, 0b00001100, 0b11000110, 0b11010111, 0b00110001, 0b11110011, 0b11000000, 0b01000100, 0b10100001, 0b00000110, 0b10000000, 0b00100001, 0b10000111, 0b01010111, 0b01101001, 0b01110010, 0b00001101, 0b01001011, 0b11001110, 0b10001100, 0b00000010, 0b01001001, 0b00000000, 0b11010010, 0b01011010, 0b00110001, 0b00100000, 0b00001010, 0b11100010, 0b00000010, 0b00011110, 0b10011100, 0b00011011, 0b00000001, 0b10111101, 0b10011000, 0b01010001, 0b00000001, 0b10010101, 0b10100001, 0b10101010, 0b01100100, 0b00001110], # Node 137
-[0b11011110, 0b11110110, 0b11011111, 0b00110110, 0b11111111, 0b01010011, 0b00110100, 0b11111101, 0b01111111, 0b11110110, 0b11010111, 0b10010111, 0b01011111, 0b10111111, 0b10111111, 0b11110110, 0b00101110, 0b10011110, 0b01011111, 0b01000110, 0b11000111, 0b01101111, 0b11110011, 0b10100100, 0b10111110, 0b10101010, 0b00010000, 0b11111100, 0b01011010, 0b00100001, 0b10111000, 0b01010111, 0b00100001, 0b10000000, 0b11001001, 0b00000110, 0b11010000, 0b10001000, 0b11110110, 0b11000010, 0b00001100, 0b01101111, 0b01101111, 0b10110000, 0b11111000, 0b11111110, 0b00000101, 0b10000000, 0b11111111, 0b10110110, 0b00000000, 0b11110000, 0b10101011, 0b00100011, 0b01000000, 0b11111011, 0b00011011, 0b00001010, 0b11000000, 0b10110111, 0b00011111, 0b00000100, 0b01110111, 0b11110111, 0b01110010, 0b00100011, 0b01100011, 0b01001010, 0b00001111, 0b11100101, 0b01001101, 0b11101110, 0b10000000, 0b10111111, 0b11100011, 0b00000100, 0b11110100, 0b10011010, 0b11101111, 0b01100000, 0b10011110, 0b11011100, 0b00010100, 0b01011100, 0b01110011, 0b10011110, 0b11110000, 0b01110011, 0b10111101, 0b11011000, 0b11000111, 0b11110111, 0b11111101, 0b11010111, 0b01110111, 0b11011111, 0b11111011, 0b01110111], # Node 138
-[0b01000000, 0b10100101, 0b00000010, 0b00110011, 0b01111110, 0b01100000, 0b01000100, 0b01001000, 0b00010000, 0b11010000, 0b10100000, 0b00000010, 0b01011000, 0b00001100, 0b00110000, 0b00100000, 0b00000110, 0b10000100, 0b10110000, 0b10101100, 0b00111100, 0b00101000, 0b10010100, 0b00000000, 0b00100001, 0b00001010, 0b10110110, 0b01100101, 0b10100001, 0b00010000, 0b11010100, 0b01000000, 0b00100011, 0b10000000, 0b00000001, 0b00001010, 0b00110000, 0b01000111, 0b00110000, 0b01000100, 0b01110010, 0b00101000, 0b00011101, 0b00000011, 0b10110011, 0b01111010, 0b00010000, 0b10100010, 0b00011000, 0b11011010, 0b01001000, 0b00110110, 0b00000111, 0b00000000, 0b10010011, 0b00010011, 0b00111000, 0b01000000, 0b00000001, 0b01000000, 0b11000011, 0b00000010, 0b00000000, 0b00101001, 0b00000000, 0b00000100, 0b00010000, 0b10100100, 0b10100100, 0b01101011, 0b00101001, 0b10001001, 0b00100001, 0b01000000, 0b10111110, 0b10011000, 0b00001001, 0b00001000, 0b10011001, 0b01000111, 0b00001011, 0b10011000, 0b01011110, 0b10101000, 0b00001010, 0b01110000, 0b00101000, 0b10010010, 0b00010000, 0b10010001, 0b01000001, 0b10010000, 0b00110001, 0b10101000, 0b00011110, 0b00011010, 0b10101010, 0b10010010], # Node 139
-[0b11011011, 0b00110001, 0b10001110, 0b11000110, 0b11101000, 0b00000101, 0b00011100, 0b01000001, 0b10110101, 0b11010100, 0b01010011, 0b00100010, 0b00101010, 0b00000000, 0b00101111, 0b10100010, 0b10010101, 0b00011000, 0b11100000, 0b00101110, 0b00000111, 0b00110101, 0b10101010, 0b00111101, 0b11100010, 0b11110100, 0b01101000, 0b11001001, 0b01101111, 0b10101000, 0b00101011, 0b01000000, 0b00000111, 0b10010101, 0b10000011, 0b10111000, 0b01000001, 0b00001000, 0b01010111, 0b00010110, 0b10100101, 0b00100111, 0b10101010, 0b11000011, 0b10011001, 0b11000100, 0b10010001, 0b11010101, 0b10010100, 0b01000001, 0b00111010, 0b00001010, 0b10110001, 0b10011100, 0b10001010, 0b00101111, 0b10100000, 0b11000101, 0b01000110, 0b10010010, 0b00110001, 0b00001011, 0b11110000, 0b10001100, 0b00100100, 0b00111001, 0b00101100, 0b01000100, 0b10110000, 0b11010001, 0b00101110, 0b10110010, 0b00000100, 0b00000111, 0b11000011, 0b01011111, 0b10000011, 0b10100001, 0b10110000, 0b10011100, 0b00010101, 0b11101110, 0b11000100, 0b10111000, 0b11101000, 0b00111100, 0b10110111, 0b01101000, 0b00001011, 0b10000001, 0b00010000, 0b00000010, 0b01000101, 0b01110110, 0b01100000, 0b11110100, 0b01101100, 0b00100010], # Node 140
-[0b01011011, 0b01001100, 0b01101101, 0b01111110, 0b11111111, 0b11010100, 0b11100111, 0b11001111, 0b11100111, 0b10100101, 0b11111001, 0b00000001, 0b00110010, 0b00110111, 0b01000010, 0b01110101, 0b11100010, 0b10111000, 0b11110111, 0b01110101, 0b10110010, 0b11001101, 0b00000011, 0b11110100, 0b00101100, 0b01001010, 0b11001011, 0b01000100, 0b00001110, 0b10010101, 0b01101010, 0b11101000, 0b10100011, 0b10000010, 0b11000100, 0b00000110, 0b00100010, 0b10000111, 0b01101010, 0b11000010, 0b01110111, 0b10001001, 0b00111110, 0b01010011, 0b01000110, 0b01111010, 0b11110110, 0b01100111, 0b01111111, 0b00111011, 0b11111110, 0b01101101, 0b00110011, 0b10101010, 0b10000011, 0b10100011, 0b00111100, 0b11000111, 0b01011100, 0b00001010, 0b01011010, 0b00110001, 0b11111001, 0b00111111, 0b01000100, 0b10001100, 0b11111000, 0b01110011, 0b11010011, 0b11101010, 0b01011100, 0b11110110, 0b11101011, 0b01111011, 0b01011001, 0b10111000, 0b11100110, 0b11010001, 0b00101010, 0b01001100, 0b10010111, 0b11111110, 0b11110100, 0b11011010, 0b01111100, 0b01011000, 0b10101010, 0b11101111, 0b01100110, 0b11101011, 0b10000101, 0b11001101, 0b11100010, 0b10011001, 0b01011111, 0b00111110, 0b01111001, 0b01100101], # Node 141
-[0b11000100, 0b10011011, 0b11111111, 0b00100111, 0b01011011, 0b01110101, 0b10101101, 0b00101110, 0b01011100, 0b10011101, 0b10000010, 0b00001001, 0b00010010, 0b10001000, 0b10110000, 0b00100110, 0b01100011, 0b01111110, 0b10100110, 0b10111010, 0b10101011, 0b11011101, 0b10101010, 0b11110111, 0b11110111, 0b01110011, 0b00011000, 0b01000001, 0b11101010, 0b00101101, 0b01000010, 0b11011011, 0b00001111, 0b11001000, 0b10011010, 0b01101011, 0b00011111, 0b10110100, 0b00101001, 0b10010111, 0b10011100, 0b11110111, 0b01100100, 0b00111100, 0b10010101, 0b11111100, 0b01011100, 0b01010001, 0b10100001, 0b00101100, 0b01010011, 0b11010101, 0b11000011, 0b00100011, 0b10100011, 0b00111101, 0b11010101, 0b11111000, 0b10011100, 0b01110111, 0b00010111, 0b10100011, 0b01011101, 0b01111101, 0b11100110, 0b11000000, 0b00101000, 0b01101101, 0b01011101, 0b01000010, 0b11011101, 0b00110001, 0b10011000, 0b10111011, 0b00110000, 0b10110011, 0b10001001, 0b01111001, 0b10000101, 0b11001100, 0b10110011, 0b01111011, 0b00110111, 0b01111010, 0b01011110, 0b10101000, 0b01100100, 0b11010001, 0b11111011, 0b11100011, 0b01100101, 0b11110001, 0b11110001, 0b11110110, 0b00110001, 0b00100110, 0b11011011, 0b11000010], # Node 142
-[0b10100001, 0b10000100, 0b10010000, 0b11111100, 0b00100000, 0b11100010, 0b01100010, 0b10010011, 0b11101100, 0b10011101, 0b11100110, 0b11001101, 0b00001101, 0b10000000, 0b00001000, 0b01001100, 0b00010110, 0b10010101, 0b01000010, 0b00111001, 0b00111100, 0b00001111, 0b01010111, 0b01100000, 0b00100001, 0b01001101, 0b00101110, 0b10000001, 0b00010000, 0b10110100, 0b01010101, 0b00010011, 0b10001000, 0b00110000, 0b00000101, 0b11111000, 0b00100001, 0b01111001, 0b01001111, 0b10100011, 0b11101100, 0b10010101, 0b01100001, 0b10000111, 0b00010001, 0b11101000, 0b01011001, 0b11000011, 0b01111001, 0b10101000, 0b00111000, 0b11000100, 0b01100000, 0b11000101, 0b01010101, 0b00101000, 0b00100000, 0b11000001, 0b11100001, 0b00010100, 0b00101101, 0b11011011, 0b00011000, 0b00010101, 0b00101010, 0b10100100, 0b10110000, 0b01010010, 0b10110101, 0b00001000, 0b01000101, 0b10111001, 0b11011010, 0b01100101, 0b10100001, 0b10000101, 0b00100111, 0b01000110, 0b11101001, 0b00110011, 0b00000110, 0b11010010, 0b00100100, 0b01100100, 0b01100110, 0b01001101, 0b10110111, 0b00101111, 0b10000001, 0b01000001, 0b10100000, 0b11010000, 0b10010001, 0b10100010, 0b01000000, 0b10000001, 0b00010000, 0b00110111], # Node 143
-[0b00000001, 0b01100100, 0b10001111, 0b00101101, 0b00000001, 0b00000000, 0b10110000, 0b00001000, 0b00000000, 0b00000000, 0b00101001, 0b01000011, 0b00000000, 0b00000000, 0b11110101, 0b00110111, 0b00000000, 0b11000010, 0b00111111, 0b00000000, 0b10000000, 0b11111011, 0b00001011, 0b00000000, 0b11101000, 0b00001111, 0b00000000, 0b10000000, 0b11111101, 0b10000010, 0b01111111, 0b10011000, 0b00100111, 0b11111100, 0b10001111, 0b11111100, 0b11100000, 0b11111111, 0b11010000, 0b00000000, 0b11111110, 0b10000111, 0b00001011, 0b11110000, 0b00011111, 0b10011110, 0b00110001, 0b11111111, 0b11100001, 0b00011001, 0b11111001, 0b00011111, 0b10011100, 0b10000111, 0b11111111, 0b01000000, 0b11111110, 0b11111111, 0b00000111, 0b11111110, 0b11111111, 0b00111111, 0b01101010, 0b11111110, 0b11111110, 0b00000001, 0b10111110, 0b10100011, 0b00001111, 0b11100010, 0b10111000, 0b00100000, 0b00011101, 0b11110001, 0b00111111, 0b11110000, 0b10000000, 0b11111101, 0b00101110, 0b00101000, 0b11001101, 0b01101111, 0b11000001, 0b11001100, 0b11111001, 0b10001101, 0b01100001, 0b01110001, 0b01110010, 0b00010110, 0b01000001, 0b00101011, 0b00000110, 0b10010010, 0b01111001, 0b00000100, 0b10001110, 0b11001011], # Node 144
-[0b10000001, 0b10001011, 0b01001011, 0b01000001, 0b10101000, 0b10011011, 0b10111000, 0b00101011, 0b10001001, 0b01000100, 0b00011000, 0b10100001, 0b11010011, 0b10000001, 0b10111101, 0b11001000, 0b11000110, 0b00100100, 0b10100011, 0b11000110, 0b11011101, 0b10110001, 0b01100100, 0b00110110, 0b11001110, 0b10001011, 0b00110110, 0b01000100, 0b10001000, 0b00011111, 0b10000111, 0b01001100, 0b01000000, 0b10111100, 0b01111000, 0b00001110, 0b01000001, 0b00010000, 0b01111000, 0b00010100, 0b10001101, 0b01111010, 0b00111101, 0b11011100, 0b01010110, 0b11000100, 0b01011001, 0b10010011, 0b01110110, 0b00011111, 0b10111100, 0b10111111, 0b00000011, 0b00011000, 0b00001010, 0b10001000, 0b11110100, 0b10011011, 0b11110010, 0b10111100, 0b11100001, 0b01101000, 0b00100101, 0b11111000, 0b11101001, 0b11001010, 0b10100001, 0b01010100, 0b01101101, 0b01101100, 0b10010000, 0b00011000, 0b10010000, 0b01111100, 0b10011110, 0b10101100, 0b00001110, 0b01000011, 0b00010100, 0b01010010, 0b00000101, 0b10000000, 0b01110011, 0b11000100, 0b01000000, 0b10011100, 0b11000001, 0b00100111, 0b10010001, 0b10110010, 0b00001010, 0b01001000, 0b11010011, 0b00001000, 0b10011000, 0b11000110, 0b01000101, 0b00000000], # Node 145
-[0b00010111, 0b01101001, 0b01111011, 0b00110011, 0b00101111, 0b01000011, 0b11111011, 0b11111001, 0b10111100, 0b10111111, 0b00110100, 0b11010110, 0b01100001, 0b10111011, 0b00100001, 0b10000000, 0b01111100, 0b01101111, 0b01001111, 0b01011110, 0b11010111, 0b10111111, 0b10001010, 0b10011100, 0b01100111, 0b11011100, 0b01001000, 0b11111010, 0b11011101, 0b10011111, 0b01110111, 0b10111011, 0b01001111, 0b11110010, 0b11011111, 0b11011010, 0b10101011, 0b10110110, 0b11001000, 0b11101011, 0b11101111, 0b10110011, 0b11001001, 0b11111110, 0b11010010, 0b11010110, 0b01001001, 0b00111101, 0b00111110, 0b10011011, 0b01101110, 0b10100111, 0b01101111, 0b11111110, 0b11100011, 0b01111110, 0b10101011, 0b10111110, 0b10100001, 0b11011011, 0b01100100, 0b01011001, 0b11001101, 0b00111111, 0b01001101, 0b11001110, 0b10111101, 0b10001010, 0b01101001, 0b11101111, 0b11011011, 0b01100010, 0b01001000, 0b11111011, 0b11000011, 0b00011011, 0b11111111, 0b01111011, 0b10111111, 0b00111100, 0b10011111, 0b11001111, 0b00110101, 0b00111110, 0b10000111, 0b10011001, 0b01000101, 0b10011001, 0b01011101, 0b10111001, 0b11111101, 0b01110011, 0b11111111, 0b11001101, 0b11110111, 0b11101011, 0b11111101, 0b11111100], # Node 146
-[0b01000001, 0b11010011, 0b11100110, 0b01110010, 0b00101111, 0b10001100, 0b10110001, 0b01011111, 0b00000000, 0b00000000, 0b01010100, 0b11011001, 0b00000001, 0b11000000, 0b11111010, 0b00111111, 0b00000000, 0b11111100, 0b11111111, 0b00000001, 0b00000000, 0b11111111, 0b11111111, 0b00000001, 0b10111000, 0b11100111, 0b01111111, 0b00000000, 0b00111111, 0b11111000, 0b00001111, 0b11110000, 0b11000011, 0b00111111, 0b10000001, 0b00011101, 0b11100000, 0b01111111, 0b11101000, 0b00000111, 0b11111100, 0b10000111, 0b11111111, 0b11000011, 0b01011111, 0b11101100, 0b00011111, 0b11111100, 0b00000011, 0b00011011, 0b10000000, 0b00101111, 0b11010000, 0b00000101, 0b11111000, 0b00000111, 0b00011101, 0b00000000, 0b01110101, 0b11000000, 0b00000001, 0b10101000, 0b10000111, 0b00011111, 0b10000000, 0b00000111, 0b11010000, 0b00000001, 0b10100000, 0b00000010, 0b00011110, 0b01000000, 0b00011000, 0b11100110, 0b00000001, 0b01000000, 0b10100001, 0b00111100, 0b00011110, 0b10000000, 0b10001001, 0b01011111, 0b00000000, 0b11011100, 0b11111010, 0b10111111, 0b11111111, 0b10110101, 0b11111111, 0b11111111, 0b10111111, 0b11111101, 0b11111111, 0b11111111, 0b00100101, 0b11111001, 0b11111111, 0b01100111], # Node 147
-[0b11111110, 0b01010110, 0b10001111, 0b11110110, 0b01011100, 0b00100001, 0b11111111, 0b01111100, 0b01111111, 0b00100100, 0b00111010, 0b11110011, 0b11001111, 0b11111101, 0b00101011, 0b00000110, 0b00011110, 0b01011010, 0b11110011, 0b10011011, 0b01100000, 0b11111001, 0b00111100, 0b00010101, 0b00010110, 0b10110011, 0b01001100, 0b11011010, 0b11111001, 0b00101100, 0b11100111, 0b10100111, 0b01001111, 0b01000000, 0b11000111, 0b00010000, 0b11010001, 0b11010011, 0b01001111, 0b00100101, 0b10110101, 0b10110100, 0b11111001, 0b11110100, 0b00001000, 0b01001100, 0b00100111, 0b01101011, 0b00100010, 0b01001110, 0b10100101, 0b00001111, 0b11111111, 0b00111111, 0b00110011, 0b11111000, 0b11101011, 0b01000011, 0b00000110, 0b11111110, 0b01001101, 0b01010010, 0b10111000, 0b10111110, 0b00001100, 0b10111110, 0b00110000, 0b11111101, 0b00010010, 0b11111110, 0b01110111, 0b11011011, 0b10100000, 0b11111111, 0b11101001, 0b10100111, 0b11110001, 0b00011100, 0b11110111, 0b11110110, 0b10011101, 0b11111111, 0b00010100, 0b11011101, 0b11010101, 0b01110111, 0b11111101, 0b10101010, 0b11000111, 0b01011111, 0b00110101, 0b11011101, 0b11101101, 0b10111001, 0b01111011, 0b01111111, 0b01010111, 0b10011100], # Node 148
-[0b01110101, 0b01111011, 0b11101101, 0b10111111, 0b00100100, 0b11010110, 0b10011111, 0b01010101, 0b11111111, 0b11011111, 0b11111111, 0b11101111, 0b01101110, 0b01011111, 0b10111101, 0b00111111, 0b01100110, 0b11111111, 0b11101110, 0b10111111, 0b00001111, 0b11101111, 0b00111111, 0b11111111, 0b11000111, 0b11111000, 0b00011000, 0b11001111, 0b11010101, 0b00001011, 0b00010100, 0b00010110, 0b00011111, 0b10000000, 0b11000010, 0b11110011, 0b01110001, 0b10100000, 0b10011111, 0b11111111, 0b00111011, 0b11110100, 0b11111011, 0b11111110, 0b11110011, 0b11110100, 0b11111111, 0b00111111, 0b01111111, 0b11110111, 0b01111111, 0b11110101, 0b11110110, 0b11111111, 0b11000001, 0b11001111, 0b11101111, 0b00001111, 0b11111100, 0b00111110, 0b00101100, 0b11000000, 0b00001111, 0b10000101, 0b00000000, 0b11111110, 0b01111110, 0b10000100, 0b11110000, 0b10110111, 0b01011011, 0b11100000, 0b10011111, 0b11110111, 0b11010000, 0b11111111, 0b11110001, 0b11111110, 0b11111111, 0b01111111, 0b11110111, 0b11111110, 0b01111111, 0b10001010, 0b11110101, 0b11011111, 0b10101100, 0b10111111, 0b01001111, 0b11100000, 0b01100110, 0b00111101, 0b11111001, 0b00110101, 0b11110011, 0b00101101, 0b00101010, 0b01011111], # Node 149
-[0b10000010, 0b00000000, 0b00001001, 0b00000000, 0b00001001, 0b01001000, 0b10000001, 0b00000000, 0b10100001, 0b10101001, 0b00000010, 0b00010000, 0b00001100, 0b00000010, 0b01000001, 0b01000010, 0b00000010, 0b00000110, 0b00010100, 0b01000001, 0b00010000, 0b00100010, 0b01011111, 0b11000000, 0b00101011, 0b11011010, 0b11011011, 0b11101001, 0b11001000, 0b10110111, 0b10011111, 0b01000001, 0b11111100, 0b11111111, 0b10001111, 0b11000001, 0b11111111, 0b00111111, 0b00000100, 0b11011111, 0b11101111, 0b00000001, 0b00110000, 0b00111100, 0b10011101, 0b10000100, 0b11000000, 0b11000001, 0b10110001, 0b00000000, 0b00000000, 0b00011100, 0b00000000, 0b00000001, 0b01000000, 0b00000111, 0b00011000, 0b00000000, 0b01110110, 0b00010001, 0b00000000, 0b11110000, 0b00110010, 0b00101000, 0b00000000, 0b00101010, 0b00100010, 0b00001111, 0b10110000, 0b10011111, 0b10110000, 0b10100011, 0b10111001, 0b10000000, 0b11111110, 0b11111011, 0b00001110, 0b10000000, 0b11111111, 0b01101100, 0b00011000, 0b11111000, 0b10100111, 0b00101000, 0b00010100, 0b00111100, 0b00010000, 0b01000001, 0b01100000, 0b10100001, 0b00000000, 0b01000111, 0b00100100, 0b01010001, 0b10000000, 0b10000000, 0b00000000, 0b00100101], # Node 150
-[0b01010101, 0b00000101, 0b11110001, 0b01000010, 0b00100101, 0b01011101, 0b00101010, 0b10100101, 0b00000000, 0b00000000, 0b00100011, 0b11111110, 0b00000011, 0b11100000, 0b11111000, 0b01111111, 0b10000000, 0b01101011, 0b11111111, 0b01110100, 0b11110101, 0b01111101, 0b01111111, 0b00111111, 0b10111111, 0b10111111, 0b11111111, 0b11111111, 0b00111011, 0b11110100, 0b11011101, 0b11010111, 0b00000001, 0b00000000, 0b11111000, 0b00001000, 0b00000000, 0b00000000, 0b00111110, 0b00000000, 0b00000000, 0b01000000, 0b00000000, 0b00000100, 0b00000000, 0b11000100, 0b10100000, 0b00000011, 0b00000000, 0b11100000, 0b00110111, 0b11100000, 0b10011101, 0b11011110, 0b00000010, 0b11010011, 0b00101010, 0b00000000, 0b01111000, 0b01000101, 0b00000011, 0b11000000, 0b11100101, 0b00111100, 0b00000000, 0b11111111, 0b11101111, 0b00000111, 0b01110000, 0b11110111, 0b01111110, 0b11000000, 0b11110111, 0b11000011, 0b11111111, 0b01111111, 0b01111111, 0b11111101, 0b11111111, 0b11111100, 0b11011101, 0b11111111, 0b00010111, 0b01101101, 0b11111100, 0b01111111, 0b11100111, 0b11001011, 0b11110110, 0b11101111, 0b11001101, 0b00010001, 0b00000000, 0b00011100, 0b11010010, 0b10011110, 0b01110011, 0b00010110], # Node 151
-[0b01111010, 0b01101010, 0b10000111, 0b11001010, 0b01110110, 0b01101100, 0b10111111, 0b01110000, 0b01010110, 0b10010001, 0b10110010, 0b11001000, 0b01010110, 0b00000110, 0b01001100, 0b10010110, 0b00100100, 0b01100110, 0b01011110, 0b11100001, 0b00000001, 0b10100010, 0b10100100, 0b10011011, 0b00000001, 0b00101111, 0b11111111, 0b00011101, 0b01010110, 0b01101011, 0b11010111, 0b00101111, 0b01100101, 0b10000101, 0b00000111, 0b10110011, 0b10000111, 0b01100000, 0b01010111, 0b10100110, 0b10010010, 0b01101001, 0b01000000, 0b01001110, 0b01111111, 0b11001100, 0b10100011, 0b00011101, 0b00110111, 0b10010010, 0b01011011, 0b10010101, 0b10010011, 0b10000111, 0b01100001, 0b01100010, 0b11011001, 0b01000000, 0b11100010, 0b00001000, 0b00011000, 0b01001001, 0b01000001, 0b11100100, 0b10011010, 0b00000100, 0b01111010, 0b00001111, 0b11010000, 0b00100010, 0b00100100, 0b01010100, 0b00101011, 0b00011011, 0b11111000, 0b00000000, 0b00010011, 0b11101000, 0b01100000, 0b10000100, 0b00010111, 0b01100000, 0b00100010, 0b10010111, 0b10010001, 0b00110001, 0b11100101, 0b01100000, 0b01110011, 0b11010010, 0b00100101, 0b01110001, 0b01000010, 0b10101000, 0b10100000, 0b01010001, 0b10100010, 0b01010001], # Node 152
-[0b01000101, 0b10010111, 0b10001000, 0b11010000, 0b01010010, 0b00001001, 0b11001010, 0b01011001, 0b11010000, 0b11111010, 0b10110011, 0b01001101, 0b01010110, 0b01010010, 0b01010101, 0b01110000, 0b10101110, 0b11000000, 0b01110001, 0b10101000, 0b10001001, 0b00011000, 0b00101110, 0b10110000, 0b10111011, 0b00100110, 0b00110100, 0b00001100, 0b01000011, 0b01011110, 0b11001111, 0b10000000, 0b01100110, 0b00110011, 0b01011100, 0b00001110, 0b10100011, 0b00010010, 0b00010100, 0b10110001, 0b00110101, 0b10010011, 0b01000001, 0b00010110, 0b01010011, 0b01010000, 0b01011001, 0b00101111, 0b01110110, 0b10000100, 0b00010011, 0b01110010, 0b00100100, 0b01010110, 0b10000011, 0b01010111, 0b01100101, 0b01101011, 0b10011011, 0b10011000, 0b00100010, 0b01001111, 0b00011110, 0b11000000, 0b01011010, 0b10101111, 0b00011100, 0b10001100, 0b01100000, 0b11111110, 0b00111001, 0b00100100, 0b11011001, 0b10110001, 0b10011001, 0b01001001, 0b00010110, 0b00011000, 0b11011010, 0b00010001, 0b00000110, 0b11111101, 0b01001101, 0b11001100, 0b01110001, 0b00010100, 0b11110000, 0b01001001, 0b11111010, 0b10010000, 0b10011000, 0b10010110, 0b00110100, 0b00000100, 0b10000100, 0b11001101, 0b00110001, 0b10000101], # Node 153
-[0b11100110, 0b10101110, 0b00001010, 0b00001000, 0b00100111, 0b00010100, 0b01110000, 0b11010010, 0b00000011, 0b10100010, 0b00001000, 0b11010000, 0b11101001, 0b01000000, 0b01000000, 0b00000101, 0b11011010, 0b11100110, 0b00000000, 0b10010001, 0b11001101, 0b00000010, 0b11011001, 0b11010000, 0b01100001, 0b00011001, 0b01011100, 0b00001110, 0b11011010, 0b11110010, 0b11000111, 0b11111000, 0b10001001, 0b01001110, 0b00000010, 0b01100100, 0b11110000, 0b01010111, 0b00000011, 0b00000110, 0b00110011, 0b11000001, 0b11010111, 0b11010000, 0b11011111, 0b10000010, 0b00000010, 0b10010000, 0b01110001, 0b00000100, 0b00000000, 0b00001001, 0b00000001, 0b00000101, 0b11000100, 0b10000000, 0b10001010, 0b11101001, 0b11000101, 0b00011000, 0b10001100, 0b00011111, 0b00011011, 0b00100000, 0b11111101, 0b00110110, 0b11010011, 0b01010110, 0b01100111, 0b00111100, 0b10001111, 0b10111111, 0b10000110, 0b10101110, 0b11101010, 0b00000001, 0b01001000, 0b10001000, 0b11000110, 0b00010000, 0b00000111, 0b00101110, 0b00011001, 0b00001001, 0b10001110, 0b10000001, 0b10000000, 0b10001000, 0b01011010, 0b00111100, 0b00010010, 0b10000111, 0b01110010, 0b00000001, 0b11011100, 0b11100011, 0b00100111, 0b01110001], # Node 154
-[0b00000000, 0b01100101, 0b00000001, 0b00100010, 0b00101011, 0b00000000, 0b00000001, 0b01110101, 0b01001010, 0b01000010, 0b00000000, 0b10000000, 0b11101000, 0b10001000, 0b00000011, 0b11100110, 0b00010000, 0b00100110, 0b00000001, 0b11110110, 0b01011110, 0b00000001, 0b01010110, 0b01010000, 0b00010000, 0b10100011, 0b01100100, 0b00000101, 0b00000110, 0b11101000, 0b00110001, 0b00000000, 0b10100101, 0b01000101, 0b00001101, 0b10011000, 0b10010010, 0b01111000, 0b01100010, 0b10000101, 0b01000101, 0b00000010, 0b00100010, 0b00000101, 0b00011000, 0b10100010, 0b00001000, 0b11111000, 0b00000000, 0b00000000, 0b11111110, 0b00111001, 0b01100001, 0b00011101, 0b11001101, 0b01101101, 0b00100001, 0b11001111, 0b10100110, 0b00100000, 0b01111110, 0b11110011, 0b01000110, 0b11011000, 0b00001111, 0b00101111, 0b00000001, 0b10111010, 0b11000000, 0b00001101, 0b10110001, 0b00001010, 0b00001100, 0b00100010, 0b10010100, 0b01000000, 0b00000101, 0b00000000, 0b00100110, 0b10001011, 0b00000000, 0b10000000, 0b01011000, 0b01000100, 0b10010100, 0b10001000, 0b01001000, 0b10000000, 0b00000001, 0b00001100, 0b00000110, 0b10001100, 0b00101010, 0b00001000, 0b01001000, 0b01000010, 0b00000000, 0b00011000], # Node 155
-[0b10001001, 0b00110011, 0b00110111, 0b10011001, 0b10111001, 0b10001110, 0b11111001, 0b01011111, 0b01001101, 0b01001101, 0b01101010, 0b11011111, 0b00100111, 0b01111100, 0b01110111, 0b10010110, 0b11101001, 0b00110100, 0b11011111, 0b01011101, 0b00001011, 0b01111101, 0b01001011, 0b10000111, 0b11011010, 0b01111101, 0b11011100, 0b01100001, 0b11000101, 0b10001010, 0b01100100, 0b01011110, 0b11101110, 0b01001001, 0b11110101, 0b01010000, 0b01011001, 0b01010000, 0b01011001, 0b10011111, 0b01101110, 0b00110000, 0b01010101, 0b10110010, 0b11111100, 0b00001001, 0b01011001, 0b01110110, 0b11101001, 0b11011111, 0b10011111, 0b11011110, 0b10110011, 0b11110100, 0b11100111, 0b00011110, 0b01010110, 0b00000110, 0b00001100, 0b11010111, 0b10101111, 0b10101001, 0b01101110, 0b10011111, 0b01111010, 0b10111011, 0b01011110, 0b10011111, 0b11010001, 0b01001110, 0b00011011, 0b11000000, 0b10000001, 0b01101000, 0b10100001, 0b01011011, 0b11011100, 0b11001000, 0b01001011, 0b00100101, 0b00110111, 0b00000110, 0b01111001, 0b10000111, 0b01111010, 0b01111100, 0b10111001, 0b11011001, 0b00111010, 0b01111011, 0b01100110, 0b00111011, 0b11010111, 0b11011110, 0b00101111, 0b10110101, 0b10110011, 0b11111011], # Node 156
-[0b10100001, 0b11000111, 0b01111111, 0b00011000, 0b00101001, 0b10111000, 0b01010100, 0b11111011, 0b01110100, 0b11011111, 0b01011001, 0b00010100, 0b10101100, 0b00001111, 0b00111001, 0b11110110, 0b11101111, 0b01011111, 0b01101111, 0b11111010, 0b01110001, 0b11001101, 0b00100011, 0b00110000, 0b00001011, 0b10111000, 0b10001010, 0b10111000, 0b10111010, 0b11010110, 0b01100000, 0b11011010, 0b11110111, 0b01110100, 0b11110011, 0b11101110, 0b11011111, 0b11001111, 0b00011111, 0b10001100, 0b11011111, 0b01000010, 0b11001111, 0b11111101, 0b01111110, 0b11011101, 0b01111111, 0b11000011, 0b11001001, 0b11111010, 0b00111001, 0b10111110, 0b00110101, 0b11000000, 0b10100001, 0b00111011, 0b11101111, 0b00000001, 0b11111110, 0b11001111, 0b00001011, 0b11100000, 0b01001011, 0b01111111, 0b01000001, 0b11010011, 0b10011010, 0b01001111, 0b11000110, 0b00000011, 0b11110001, 0b00010110, 0b01011111, 0b11011101, 0b00110110, 0b01110001, 0b11111101, 0b01111110, 0b11100111, 0b11110111, 0b11010111, 0b10101111, 0b00100111, 0b10011111, 0b11110110, 0b01101111, 0b10110010, 0b01110010, 0b10001001, 0b01010011, 0b01111111, 0b11111100, 0b11011110, 0b10111111, 0b11011110, 0b01010101, 0b10100010, 0b01111011], # Node 157
-[0b00011000, 0b11100011, 0b01001010, 0b00000100, 0b00111001, 0b11110101, 0b01001000, 0b00000000, 0b11111100, 0b00110110, 0b01110000, 0b00100011, 0b10010001, 0b11101111, 0b01101110, 0b00000000, 0b11111101, 0b11001110, 0b01100000, 0b00010001, 0b00010110, 0b00100110, 0b11001101, 0b00000110, 0b01011010, 0b11100101, 0b00011110, 0b00101111, 0b10010100, 0b00010011, 0b10111100, 0b10101100, 0b00110001, 0b10010010, 0b00011000, 0b11000000, 0b11110011, 0b11110100, 0b10101100, 0b00011011, 0b11110000, 0b10010111, 0b10000110, 0b00110100, 0b10011010, 0b01000010, 0b01000010, 0b01100110, 0b11101001, 0b01010110, 0b11010100, 0b00110110, 0b00000011, 0b01101110, 0b00100001, 0b00110000, 0b01100011, 0b11000000, 0b00010011, 0b11101010, 0b00011100, 0b00101001, 0b01011011, 0b11101110, 0b01110000, 0b10010111, 0b11100000, 0b00010111, 0b01111110, 0b00111011, 0b00111100, 0b01011101, 0b00100000, 0b00000101, 0b11110100, 0b01111010, 0b00000000, 0b01100010, 0b11001100, 0b10011100, 0b00000000, 0b11000111, 0b10111001, 0b01010000, 0b11111100, 0b11010010, 0b10011100, 0b11101011, 0b11101100, 0b11010011, 0b11010010, 0b01101001, 0b00000100, 0b00010101, 0b00100110, 0b10000101, 0b10101110, 0b00000001], # Node 158
-[0b11011011, 0b10000100, 0b10110100, 0b01000001, 0b00110000, 0b01100110, 0b10000001, 0b01011000, 0b10101000, 0b10000011, 0b10010010, 0b01001100, 0b10100110, 0b10010001, 0b00011000, 0b11001100, 0b01001000, 0b01000100, 0b01011010, 0b10000000, 0b00000111, 0b11011101, 0b11100000, 0b11101100, 0b11010010, 0b11001000, 0b01000000, 0b00000011, 0b10101100, 0b11101001, 0b11111101, 0b01000000, 0b00110110, 0b11101000, 0b01111101, 0b01011001, 0b10101111, 0b10101110, 0b10011011, 0b00011001, 0b10100100, 0b00101100, 0b01010001, 0b10111010, 0b01110111, 0b00011010, 0b00101000, 0b10110011, 0b10001000, 0b10000111, 0b01000010, 0b01010000, 0b10001111, 0b01000001, 0b10000010, 0b10001110, 0b11010001, 0b00010100, 0b01000000, 0b11000101, 0b00001110, 0b01010001, 0b00010001, 0b10001010, 0b10100101, 0b00001001, 0b11010110, 0b11000101, 0b10001100, 0b00011100, 0b00110000, 0b11010111, 0b11100001, 0b00100111, 0b01100010, 0b01000110, 0b10011100, 0b10010011, 0b10111101, 0b01001000, 0b00100000, 0b11100111, 0b01011011, 0b11011101, 0b01010100, 0b00110100, 0b11000011, 0b00010111, 0b00110001, 0b01010000, 0b10001001, 0b01101110, 0b11001010, 0b10001000, 0b00001010, 0b11110011, 0b00001000, 0b00010001], # Node 159
-[0b10011101, 0b00100010, 0b01111011, 0b10111100, 0b11010110, 0b10111111, 0b11111111, 0b00001101, 0b10100111, 0b11100110, 0b01000001, 0b11011111, 0b10111010, 0b10111110, 0b11011111, 0b00111010, 0b11111010, 0b11111110, 0b10010001, 0b11011000, 0b00101100, 0b10111001, 0b11001101, 0b10000010, 0b01010100, 0b11011110, 0b11000000, 0b01011011, 0b11100011, 0b10001001, 0b01000110, 0b11110000, 0b10000101, 0b10111011, 0b01101001, 0b01111111, 0b01001101, 0b00101111, 0b11101011, 0b00111101, 0b01000101, 0b00110110, 0b10001001, 0b00010101, 0b10111001, 0b11011101, 0b11011100, 0b00011011, 0b11101011, 0b01010100, 0b00101000, 0b11111111, 0b10101011, 0b10010001, 0b11001110, 0b00101101, 0b11001101, 0b10101101, 0b00011110, 0b01101110, 0b01110010, 0b00110000, 0b00010101, 0b11101100, 0b11111011, 0b11000101, 0b01111000, 0b01110011, 0b11000110, 0b01110110, 0b10100001, 0b01110011, 0b01001111, 0b10011111, 0b01011111, 0b00101011, 0b00001100, 0b10100101, 0b00110110, 0b11111100, 0b00001101, 0b01010100, 0b01011011, 0b11011011, 0b11100000, 0b11110100, 0b11110111, 0b01001010, 0b00101010, 0b10101100, 0b01000110, 0b10110111, 0b11101010, 0b10100111, 0b00000100, 0b11000110, 0b11110010, 0b01111011], # Node 160
-[0b10110001, 0b01100010, 0b00000111, 0b01000101, 0b01010100, 0b00000001, 0b11000000, 0b10110001, 0b00010000, 0b10100001, 0b01000000, 0b01001000, 0b01110100, 0b10011100, 0b00001000, 0b10101001, 0b10010101, 0b00001010, 0b00101000, 0b11110100, 0b01110101, 0b10000000, 0b11110001, 0b00100111, 0b10000000, 0b00011001, 0b10000111, 0b10000000, 0b00010110, 0b01111111, 0b01110010, 0b11000011, 0b10100110, 0b10100001, 0b00101111, 0b11011111, 0b01011110, 0b01111110, 0b00011000, 0b11111001, 0b01110111, 0b01010101, 0b01011000, 0b11111111, 0b00001110, 0b00000100, 0b11101011, 0b10111111, 0b11101001, 0b10111000, 0b11111111, 0b10000001, 0b10010000, 0b10001000, 0b01100011, 0b10110010, 0b10010110, 0b11111001, 0b01100100, 0b10101100, 0b11111101, 0b11111001, 0b01000000, 0b10000110, 0b10011111, 0b00110111, 0b01001001, 0b00110001, 0b00110101, 0b10011010, 0b11000000, 0b11000000, 0b00110011, 0b10101100, 0b00010000, 0b00010101, 0b11000000, 0b10011111, 0b11110111, 0b10101001, 0b00101000, 0b11110101, 0b01110111, 0b01100011, 0b01001010, 0b11111101, 0b10001100, 0b10000011, 0b11011010, 0b00010100, 0b01110010, 0b00110111, 0b10100010, 0b00000000, 0b10110001, 0b10000100, 0b00001110, 0b01110000], # Node 161
-[0b01100000, 0b00011000, 0b00100000, 0b00000010, 0b10000110, 0b00000000, 0b00000100, 0b00000011, 0b00000110, 0b01101001, 0b01101000, 0b11110111, 0b11010101, 0b00100000, 0b00010000, 0b10001011, 0b00000110, 0b10101100, 0b00100100, 0b00000000, 0b10011000, 0b01000000, 0b00000011, 0b00000000, 0b00010000, 0b01011000, 0b00000101, 0b00100000, 0b00000000, 0b10110110, 0b00001000, 0b00010000, 0b10100000, 0b10111111, 0b10000000, 0b00010000, 0b10100000, 0b00001111, 0b00100000, 0b00000011, 0b11110000, 0b00000011, 0b00101001, 0b00000010, 0b01011111, 0b01001000, 0b00000000, 0b11110000, 0b10100001, 0b11011001, 0b10001101, 0b00100111, 0b00000000, 0b01000110, 0b10111000, 0b11000111, 0b10001011, 0b11101111, 0b01001011, 0b10000011, 0b10001101, 0b10111111, 0b00110001, 0b00000100, 0b11111101, 0b01001011, 0b00000000, 0b10000101, 0b00110111, 0b10011100, 0b00000101, 0b11110000, 0b11000100, 0b01100000, 0b00100000, 0b00000001, 0b01101101, 0b00000000, 0b00000000, 0b01110000, 0b10011001, 0b00000000, 0b00000000, 0b11001000, 0b10000001, 0b10000000, 0b01011001, 0b00000001, 0b11111010, 0b11010110, 0b10000001, 0b10110110, 0b01010100, 0b00101100, 0b01011001, 0b00010001, 0b00001010, 0b00010000], # Node 162
-[0b11010111, 0b11101111, 0b11110111, 0b11110110, 0b10100010, 0b11010011, 0b11011010, 0b01111000, 0b00001011, 0b11111100, 0b10100110, 0b01011110, 0b00011101, 0b01101100, 0b10110111, 0b00000001, 0b01100000, 0b11011111, 0b00100000, 0b00000000, 0b00101100, 0b01110010, 0b00011111, 0b01000000, 0b10111110, 0b11110111, 0b00000111, 0b10111100, 0b11011101, 0b10111111, 0b11000001, 0b11011111, 0b11111111, 0b00010111, 0b10111100, 0b11001101, 0b00011111, 0b11111100, 0b11110101, 0b11111110, 0b01000001, 0b01111111, 0b11110111, 0b00010111, 0b11111110, 0b10000110, 0b11111111, 0b11110000, 0b11111001, 0b11110111, 0b10010111, 0b11011111, 0b01101100, 0b00010011, 0b11111100, 0b11110101, 0b10010101, 0b11000000, 0b10011111, 0b01011101, 0b00000001, 0b11011100, 0b11111011, 0b00010111, 0b10100000, 0b00101101, 0b11011100, 0b00000001, 0b11000000, 0b11100000, 0b00111100, 0b00000000, 0b00000000, 0b10111111, 0b00000010, 0b00000000, 0b11111010, 0b00011011, 0b00000000, 0b11111001, 0b10000101, 0b00001010, 0b11111110, 0b10011111, 0b10101011, 0b11111111, 0b11111111, 0b11111111, 0b11101001, 0b11111101, 0b01011111, 0b11110111, 0b01011101, 0b11110011, 0b01111101, 0b11101111, 0b11011101, 0b11111111], # Node 163
-[0b00000000, 0b01101010, 0b11101110, 0b01110101, 0b11011100, 0b01110011, 0b00100111, 0b10101111, 0b11100111, 0b11110111, 0b11011101, 0b11001100, 0b00010100, 0b11001110, 0b11100110, 0b10101001, 0b10110110, 0b00101000, 0b10010011, 0b00100010, 0b01110011, 0b00101001, 0b11111010, 0b00000111, 0b10001100, 0b00101111, 0b00011110, 0b11111110, 0b01011011, 0b01111111, 0b11110010, 0b11000111, 0b01000011, 0b00110000, 0b10111111, 0b11101111, 0b00111000, 0b01100100, 0b10010010, 0b00110000, 0b10100010, 0b01011111, 0b01101111, 0b00100010, 0b00100111, 0b01111110, 0b00011011, 0b00011010, 0b10011010, 0b10111001, 0b10010101, 0b01100111, 0b01000110, 0b11110100, 0b00011111, 0b11001110, 0b01010101, 0b00010110, 0b11010111, 0b01011110, 0b00101110, 0b11111001, 0b00111101, 0b01001100, 0b11100011, 0b11010000, 0b11111101, 0b00011010, 0b00001100, 0b00001110, 0b10111000, 0b11010111, 0b11100000, 0b10111001, 0b00101101, 0b00111111, 0b00110011, 0b01010101, 0b00111000, 0b11110111, 0b11100111, 0b11011111, 0b11000100, 0b11111101, 0b11001101, 0b00101011, 0b11011010, 0b11101100, 0b10011101, 0b00111000, 0b00101101, 0b01110101, 0b01000010, 0b11111010, 0b11011001, 0b00110100, 0b10100011, 0b11110111], # Node 164
-[0b11111100, 0b01011001, 0b11110000, 0b01101011, 0b01010110, 0b11011100, 0b11110110, 0b10100111, 0b10011100, 0b11001111, 0b11011000, 0b10010100, 0b11101100, 0b11111100, 0b01001110, 0b01011110, 0b10010111, 0b11011110, 0b11111111, 0b11101111, 0b01110110, 0b11111101, 0b01111100, 0b10110000, 0b01101011, 0b00110011, 0b00001000, 0b00011001, 0b10001011, 0b10000000, 0b00101011, 0b01111111, 0b11100001, 0b01000011, 0b01110011, 0b11110101, 0b10111110, 0b01011010, 0b10111101, 0b10110101, 0b00001001, 0b01011110, 0b11111101, 0b01001001, 0b10011100, 0b01011111, 0b10010010, 0b10011111, 0b00101010, 0b00101111, 0b11110101, 0b01111001, 0b11111100, 0b11110001, 0b01110011, 0b11110010, 0b00011110, 0b01001111, 0b11111111, 0b01101011, 0b11111101, 0b01100001, 0b10101110, 0b11111111, 0b00111111, 0b11100110, 0b00111110, 0b10100010, 0b01101100, 0b10101111, 0b00100111, 0b01111010, 0b10010101, 0b01010010, 0b01001111, 0b01010011, 0b11101100, 0b01111100, 0b01110111, 0b01101000, 0b10101011, 0b01000111, 0b00100011, 0b10010111, 0b01111110, 0b01111100, 0b10110110, 0b11110101, 0b01001110, 0b11101101, 0b11010101, 0b10010110, 0b01100001, 0b01101100, 0b11111110, 0b01010000, 0b11110010, 0b11111011], # Node 165
-[0b11000001, 0b01001000, 0b00011100, 0b00100001, 0b11100000, 0b00000010, 0b11100001, 0b00110001, 0b11010100, 0b01100011, 0b10000000, 0b10011110, 0b00100100, 0b01001010, 0b01110000, 0b11110110, 0b10010011, 0b10110100, 0b00101011, 0b01111110, 0b10100000, 0b00010001, 0b11101000, 0b00010111, 0b10010010, 0b11010100, 0b10010101, 0b01000011, 0b11000011, 0b00000001, 0b10001010, 0b01000100, 0b00001011, 0b00001010, 0b00000011, 0b10001001, 0b01010001, 0b01101100, 0b00100111, 0b01010111, 0b01000101, 0b10100001, 0b11100001, 0b10110010, 0b00101001, 0b01100001, 0b00100000, 0b11001011, 0b11000001, 0b10010110, 0b10101000, 0b01101001, 0b00110100, 0b01011000, 0b10001010, 0b00011101, 0b00010110, 0b10000101, 0b00100000, 0b00000001, 0b00001110, 0b00010010, 0b00011110, 0b10010000, 0b01010011, 0b10100000, 0b00000010, 0b00101000, 0b11110001, 0b01110000, 0b10001000, 0b01100111, 0b01001111, 0b01011010, 0b00101011, 0b10010011, 0b10100001, 0b01100011, 0b01101111, 0b00011000, 0b11000000, 0b11110011, 0b00101001, 0b11010100, 0b01001010, 0b10110000, 0b00110101, 0b01011101, 0b01011110, 0b00011101, 0b00011010, 0b00001001, 0b01100101, 0b11000011, 0b11000110, 0b01000011, 0b01111111, 0b10001100], # Node 166
-[0b10010001, 0b00110100, 0b00000000, 0b10000100, 0b10100111, 0b10011000, 0b10000000, 0b10101000, 0b01110000, 0b01000000, 0b00001110, 0b10000011, 0b00011010, 0b00110100, 0b00010010, 0b10001110, 0b00010110, 0b00001001, 0b11000111, 0b00001000, 0b00011100, 0b10011100, 0b01000110, 0b00001111, 0b01010010, 0b01100001, 0b01110110, 0b00010000, 0b01101001, 0b11000000, 0b10010101, 0b01010000, 0b00010000, 0b11110100, 0b01010001, 0b11100000, 0b01110000, 0b00111101, 0b10110000, 0b11011111, 0b11100001, 0b00010000, 0b01111000, 0b00000000, 0b00001100, 0b10011001, 0b00000110, 0b10100001, 0b10011010, 0b00001000, 0b00010000, 0b11110101, 0b00111100, 0b00000000, 0b11111000, 0b10010100, 0b00011011, 0b01000000, 0b01101010, 0b01000100, 0b10101010, 0b11110101, 0b00001000, 0b00100010, 0b10001010, 0b01001111, 0b00000000, 0b11000000, 0b01111111, 0b01001000, 0b00100111, 0b11110000, 0b01100011, 0b10100001, 0b10100000, 0b00001111, 0b01011000, 0b01101001, 0b01111100, 0b00100000, 0b00010000, 0b01000001, 0b01000000, 0b01110111, 0b00011000, 0b00000100, 0b00111000, 0b00100100, 0b00010110, 0b11001100, 0b01001110, 0b01000000, 0b10100001, 0b00000101, 0b00010100, 0b10011010, 0b01100100, 0b00100100], # Node 167
-[0b10100110, 0b11011010, 0b01111011, 0b10101001, 0b11110100, 0b11001101, 0b10000011, 0b10001011, 0b11111101, 0b01111111, 0b11001101, 0b00000101, 0b11111100, 0b10011111, 0b11101001, 0b00001111, 0b11111100, 0b11111001, 0b01111111, 0b11000000, 0b11111111, 0b11111110, 0b00000111, 0b11010000, 0b10001101, 0b00111111, 0b10000000, 0b11001111, 0b11111111, 0b00000011, 0b00000110, 0b11001010, 0b01011111, 0b00111100, 0b00100000, 0b10111110, 0b11100011, 0b00000011, 0b11010110, 0b10000001, 0b00111111, 0b00000000, 0b00001100, 0b11111101, 0b00000011, 0b01100000, 0b00001011, 0b01111110, 0b10000000, 0b01110001, 0b00000000, 0b00111111, 0b11010000, 0b00000110, 0b11101000, 0b10001111, 0b00010111, 0b10000000, 0b01111110, 0b11000000, 0b00000001, 0b11000110, 0b10000111, 0b00001100, 0b01100000, 0b00111000, 0b11000000, 0b00000001, 0b01011111, 0b00000000, 0b00001101, 0b11111000, 0b00000011, 0b10011000, 0b00000000, 0b00111110, 0b10000000, 0b10111111, 0b00000001, 0b00000011, 0b10001000, 0b01111111, 0b00000000, 0b01000000, 0b11111011, 0b00000111, 0b00000000, 0b01000100, 0b11111111, 0b00000111, 0b00000000, 0b11110111, 0b00111111, 0b01000000, 0b10000111, 0b01111111, 0b00111110, 0b10111000], # Node 168
-[0b00000011, 0b01101001, 0b11110110, 0b10011111, 0b10101011, 0b11111001, 0b11110110, 0b00010101, 0b10011111, 0b01111110, 0b10011111, 0b01111001, 0b11111110, 0b11100001, 0b01110101, 0b10000101, 0b11001101, 0b01110011, 0b01011011, 0b10000001, 0b01011010, 0b11101011, 0b10001010, 0b00001110, 0b00111011, 0b11000101, 0b10111000, 0b11010010, 0b00011110, 0b01011010, 0b00100100, 0b01110101, 0b10000011, 0b11101111, 0b11001110, 0b01110110, 0b10110100, 0b11111010, 0b11000101, 0b10110101, 0b11011001, 0b00110101, 0b11000000, 0b11001011, 0b11001100, 0b11101000, 0b01010111, 0b00101010, 0b10010011, 0b11100101, 0b11010111, 0b01100010, 0b11011010, 0b01110111, 0b11001100, 0b11010110, 0b01100010, 0b00111101, 0b10111110, 0b10001001, 0b11011101, 0b00111010, 0b01010100, 0b11001001, 0b01111000, 0b10100101, 0b10011111, 0b00001110, 0b11000110, 0b11111010, 0b10101100, 0b10111101, 0b10011001, 0b10110110, 0b00101111, 0b10110010, 0b11111011, 0b10101011, 0b00100100, 0b11011101, 0b00011100, 0b01110111, 0b00000001, 0b11111001, 0b01001100, 0b11011001, 0b00110011, 0b11001011, 0b11110110, 0b11000010, 0b10100101, 0b01000001, 0b10011001, 0b01010011, 0b00101110, 0b11101111, 0b01010010, 0b01110101], # Node 169
-[0b00100011, 0b00100111, 0b00100000, 0b01001110, 0b10101100, 0b01101010, 0b01110110, 0b10001000, 0b11101110, 0b01101110, 0b01010000, 0b00011011, 0b10000000, 0b01101000, 0b10110000, 0b00110010, 0b01000100, 0b00000010, 0b01111000, 0b11101001, 0b00011100, 0b00111101, 0b10010001, 0b11100001, 0b10100011, 0b00110001, 0b00110001, 0b00111101, 0b00010110, 0b01100110, 0b11001000, 0b00000110, 0b00101010, 0b10101110, 0b00101001, 0b11000001, 0b01001100, 0b00000011, 0b01000000, 0b00101011, 0b01010000, 0b11000100, 0b10100000, 0b10111000, 0b01000001, 0b10001000, 0b00101010, 0b00010110, 0b11101101, 0b01110000, 0b10000011, 0b01001001, 0b10101000, 0b00000110, 0b01101111, 0b10101010, 0b00011011, 0b10010110, 0b11001111, 0b00011100, 0b10000100, 0b11011011, 0b00010001, 0b01110000, 0b11101010, 0b11101011, 0b00000110, 0b01011111, 0b11110011, 0b01100010, 0b00001100, 0b11001110, 0b00000001, 0b11000100, 0b10010010, 0b11000100, 0b00000011, 0b01100101, 0b11010100, 0b00100100, 0b11001101, 0b00100010, 0b10110101, 0b00001010, 0b00001010, 0b10001010, 0b11101001, 0b01000100, 0b10011111, 0b01001010, 0b10011000, 0b10000000, 0b00000010, 0b00110000, 0b11101011, 0b10011110, 0b00000001, 0b01000110], # Node 170
-[0b01110000, 0b10101110, 0b11001100, 0b11110000, 0b10110110, 0b01011101, 0b00000001, 0b01110000, 0b10001001, 0b11000000, 0b01010100, 0b01111000, 0b11000000, 0b10000100, 0b01001001, 0b10001101, 0b10000100, 0b01000101, 0b00010010, 0b11100000, 0b00111100, 0b00111001, 0b00000000, 0b11000100, 0b00000011, 0b11110001, 0b01010101, 0b00111010, 0b10100001, 0b00010101, 0b10010100, 0b00010100, 0b01011101, 0b00001111, 0b00101011, 0b00101001, 0b10001010, 0b11010011, 0b00000110, 0b11011000, 0b10010100, 0b00101100, 0b11001101, 0b01100000, 0b11110000, 0b01100001, 0b11100110, 0b01110000, 0b00010001, 0b10001010, 0b01000100, 0b11010111, 0b10010010, 0b01010100, 0b01100010, 0b00000101, 0b01000100, 0b01100111, 0b11010101, 0b00011000, 0b01010001, 0b11100001, 0b01100111, 0b10011000, 0b01111011, 0b10111011, 0b00011000, 0b00110011, 0b00111000, 0b00011000, 0b10110010, 0b01101000, 0b11100101, 0b01001100, 0b11000011, 0b01110111, 0b01011010, 0b00010001, 0b10111111, 0b01000110, 0b01100111, 0b01001010, 0b01010000, 0b10101010, 0b01000001, 0b01010011, 0b00110101, 0b00101110, 0b10111101, 0b00101010, 0b00000110, 0b01011011, 0b00011010, 0b00100001, 0b10000001, 0b01001100, 0b11001111, 0b01100001], # Node 171
-[0b10101110, 0b01001000, 0b11100001, 0b11011011, 0b00000010, 0b00000000, 0b01101010, 0b00100000, 0b00000000, 0b00000000, 0b10001010, 0b00000000, 0b00000000, 0b01000000, 0b00001011, 0b00000000, 0b11100110, 0b10000101, 0b00000000, 0b11110100, 0b00111111, 0b00000100, 0b11000000, 0b11111111, 0b00000111, 0b10000000, 0b11111111, 0b10111111, 0b00000011, 0b00111111, 0b11111100, 0b00001111, 0b11111100, 0b11100011, 0b11111111, 0b11100100, 0b00011111, 0b11111110, 0b00010111, 0b11111111, 0b11110001, 0b01111111, 0b11111000, 0b00001111, 0b01111110, 0b11000000, 0b11111111, 0b11110001, 0b00000001, 0b11110000, 0b00001110, 0b00000010, 0b00111000, 0b11011111, 0b01110001, 0b00000000, 0b11110000, 0b10010001, 0b00000011, 0b00010000, 0b01101111, 0b00011001, 0b10010000, 0b11110000, 0b11000101, 0b00000000, 0b00110000, 0b01111111, 0b00000100, 0b10010000, 0b11110011, 0b00000011, 0b11000000, 0b00100001, 0b11111110, 0b00010000, 0b11111111, 0b11100000, 0b11111000, 0b11111101, 0b00100111, 0b10000111, 0b01111111, 0b10111111, 0b11110000, 0b00110000, 0b11111100, 0b10010000, 0b11111001, 0b11111010, 0b11111011, 0b11010010, 0b11111111, 0b11000111, 0b10011111, 0b11001100, 0b01111111, 0b01100011], # Node 172
-[0b11011000, 0b11100110, 0b00101111, 0b10110100, 0b10110001, 0b10111101, 0b11111011, 0b10111101, 0b10010011, 0b01111111, 0b10110011, 0b11000110, 0b11101100, 0b10011001, 0b11011000, 0b00100011, 0b00001010, 0b10010110, 0b00001101, 0b10001001, 0b00110001, 0b10011110, 0b11011111, 0b11001100, 0b01000111, 0b10110001, 0b10010011, 0b01111100, 0b00110011, 0b01000111, 0b10111000, 0b01101111, 0b11111001, 0b11100101, 0b01110110, 0b11111111, 0b10000001, 0b00110010, 0b10010011, 0b10000010, 0b11101111, 0b10011011, 0b01001010, 0b10011110, 0b11000101, 0b00110001, 0b00110010, 0b00010101, 0b10010000, 0b11010101, 0b10101100, 0b00101010, 0b11101100, 0b00001001, 0b11010000, 0b10111000, 0b01110101, 0b11101011, 0b01011100, 0b00001000, 0b00001110, 0b00010101, 0b10111111, 0b01111111, 0b00110011, 0b00001110, 0b10000000, 0b11010101, 0b01000110, 0b01010010, 0b11011011, 0b00011111, 0b11101010, 0b11011101, 0b11000111, 0b11110010, 0b01100111, 0b01011001, 0b00011101, 0b01111110, 0b11110000, 0b10110001, 0b11111100, 0b10011111, 0b10101011, 0b01111111, 0b00110001, 0b10111001, 0b11101000, 0b11111000, 0b10010111, 0b00010001, 0b11001111, 0b00001001, 0b11110011, 0b11101101, 0b01011000, 0b10010110], # Node 173
-[0b11101111, 0b11111111, 0b10111111, 0b11111010, 0b01111111, 0b11111010, 0b11111111, 0b01111111, 0b01010111, 0b10111000, 0b10111010, 0b11111110, 0b01111111, 0b01000111, 0b11101110, 0b01111111, 0b01100101, 0b01011011, 0b11101101, 0b00010110, 0b11111001, 0b00100110, 0b01000010, 0b10000000, 0b11001111, 0b11100010, 0b11000011, 0b11011100, 0b00011101, 0b11011111, 0b10111111, 0b01110111, 0b10000101, 0b10111110, 0b11110001, 0b11001101, 0b11110001, 0b11111101, 0b01111111, 0b00001010, 0b10001111, 0b10011110, 0b11111011, 0b00101100, 0b11100001, 0b11111111, 0b00001110, 0b00100110, 0b11111111, 0b11111110, 0b11100111, 0b11100000, 0b11101011, 0b01110101, 0b10001000, 0b11101101, 0b10011111, 0b01110101, 0b10011000, 0b11111110, 0b11000001, 0b00001010, 0b11100001, 0b11011011, 0b11110101, 0b00111111, 0b11111011, 0b11110010, 0b11010111, 0b11110101, 0b11111011, 0b10111010, 0b11001110, 0b11111111, 0b01100111, 0b01101111, 0b01011011, 0b10011111, 0b10001101, 0b11000100, 0b10011111, 0b11111111, 0b00001000, 0b10011111, 0b11111111, 0b01001111, 0b11111111, 0b01001111, 0b01111110, 0b11111011, 0b11110011, 0b11011111, 0b11111111, 0b10111111, 0b11101110, 0b11111101, 0b11101001, 0b11111111], # Node 174
-[0b10101001, 0b01111011, 0b10011011, 0b00110011, 0b00111101, 0b01001101, 0b11010111, 0b11010011, 0b01111110, 0b10100100, 0b11100110, 0b11110101, 0b11011100, 0b11110001, 0b11110111, 0b00111001, 0b01011110, 0b01110101, 0b01010110, 0b10101101, 0b01000011, 0b11101000, 0b00111011, 0b10101101, 0b00100101, 0b11011010, 0b11011101, 0b00010110, 0b10010011, 0b10100011, 0b11101010, 0b10010011, 0b01001010, 0b00000001, 0b01100010, 0b01111111, 0b00111111, 0b10000000, 0b01101110, 0b11011111, 0b00111111, 0b00000001, 0b00111111, 0b10011100, 0b01111111, 0b10010100, 0b00101011, 0b11000010, 0b01111001, 0b10110000, 0b00111011, 0b10100000, 0b00111011, 0b10111110, 0b01001010, 0b10101110, 0b10001010, 0b01101001, 0b10000101, 0b11111100, 0b10011011, 0b10011110, 0b10100001, 0b10111111, 0b00000011, 0b10000111, 0b11011111, 0b01100101, 0b01110000, 0b11111000, 0b01100001, 0b00101100, 0b00100010, 0b00110101, 0b10111011, 0b11011011, 0b10110010, 0b10011011, 0b11001111, 0b10001010, 0b00101101, 0b01001010, 0b10111010, 0b01101111, 0b01010110, 0b10111010, 0b11001101, 0b11111110, 0b00110000, 0b10010110, 0b00001101, 0b01100010, 0b11101011, 0b00111010, 0b10001101, 0b01111011, 0b00110100, 0b01111011], # Node 175
-[0b10110110, 0b01011110, 0b00011110, 0b11100011, 0b01101100, 0b11000110, 0b00011000, 0b11111001, 0b10011010, 0b01101101, 0b10010110, 0b11001010, 0b11011101, 0b11111101, 0b11001011, 0b00011110, 0b01110011, 0b01111010, 0b10100000, 0b00001101, 0b00111100, 0b01111011, 0b01101111, 0b00011001, 0b01011101, 0b11100100, 0b11101011, 0b11111101, 0b01010101, 0b10011010, 0b11100101, 0b00011111, 0b11111101, 0b00011101, 0b01000001, 0b11101010, 0b00010100, 0b00110000, 0b11111101, 0b11001011, 0b01110111, 0b00101100, 0b11111001, 0b11000101, 0b11101001, 0b11010011, 0b10000111, 0b11100010, 0b00110000, 0b10011000, 0b01100111, 0b11010010, 0b00000011, 0b10010010, 0b10101111, 0b11101010, 0b01111011, 0b01001000, 0b01111011, 0b00111011, 0b01101111, 0b01011101, 0b01110100, 0b10111111, 0b10011111, 0b00101010, 0b01111101, 0b00011000, 0b00100111, 0b11011100, 0b01101110, 0b10110010, 0b10100110, 0b10100010, 0b01001011, 0b00101001, 0b00111101, 0b01111000, 0b10011100, 0b11100100, 0b11111011, 0b01111111, 0b01011001, 0b11100110, 0b11110100, 0b00111111, 0b10111110, 0b00110100, 0b10001101, 0b00101010, 0b00011010, 0b10110101, 0b10111111, 0b01011110, 0b10110101, 0b10000111, 0b01001001, 0b00111000], # Node 176
-[0b01111011, 0b11110001, 0b01111010, 0b11011010, 0b01100101, 0b01110000, 0b11011001, 0b11111000, 0b11110010, 0b00001110, 0b10000111, 0b11101001, 0b10000001, 0b11101101, 0b00011110, 0b01111001, 0b00110001, 0b11000001, 0b00010001, 0b10011001, 0b01110111, 0b10111001, 0b11110001, 0b11101100, 0b00110110, 0b01101011, 0b11011001, 0b00110001, 0b11111111, 0b01011110, 0b01011010, 0b11111000, 0b00001110, 0b01001000, 0b11110101, 0b11111111, 0b01001001, 0b10111010, 0b00011110, 0b11011101, 0b10111110, 0b11111010, 0b00010111, 0b10101001, 0b00011100, 0b10111111, 0b00110100, 0b10100101, 0b01001011, 0b11100111, 0b00000110, 0b00001010, 0b10010101, 0b01010110, 0b00010000, 0b11111111, 0b01100110, 0b10011110, 0b11101100, 0b00010111, 0b11010011, 0b11011011, 0b10110011, 0b01011101, 0b11011010, 0b11111100, 0b00011100, 0b00101010, 0b01010110, 0b00010001, 0b11110111, 0b10001111, 0b00111111, 0b00100011, 0b11001101, 0b10000111, 0b11101110, 0b01101011, 0b10100000, 0b11011100, 0b11101110, 0b10101101, 0b11011100, 0b11110111, 0b10101000, 0b11001110, 0b01010100, 0b11010110, 0b10101101, 0b11111111, 0b11111100, 0b10110010, 0b00100110, 0b11011011, 0b11111111, 0b00001100, 0b11100000, 0b11001001], # Node 177
-[0b11001000, 0b10001000, 0b00010011, 0b10100101, 0b01110001, 0b11111111, 0b11010110, 0b11111100, 0b11111101, 0b00100110, 0b10111100, 0b01011011, 0b10100100, 0b01101001, 0b10101101, 0b10100001, 0b11011011, 0b10011101, 0b11111110, 0b11000110, 0b11011110, 0b11100111, 0b11100101, 0b11110100, 0b00110101, 0b10100001, 0b00000110, 0b10000010, 0b10001101, 0b01001000, 0b10101001, 0b00100000, 0b01011111, 0b10010110, 0b00111100, 0b11110011, 0b00111110, 0b10100111, 0b00001100, 0b00011000, 0b10101100, 0b10000000, 0b01101111, 0b00110000, 0b01011001, 0b10000000, 0b10001001, 0b01011100, 0b11011010, 0b01110011, 0b10001000, 0b00100110, 0b10110110, 0b01110101, 0b10001001, 0b11110110, 0b01011110, 0b11111110, 0b01011111, 0b10011110, 0b00110010, 0b10110000, 0b10100011, 0b11111111, 0b11001111, 0b10110111, 0b11011011, 0b00001111, 0b00010011, 0b10110111, 0b00110010, 0b01110101, 0b11101100, 0b11110000, 0b11011110, 0b10110100, 0b10111010, 0b11111101, 0b10110111, 0b10100110, 0b10011001, 0b11000010, 0b01111111, 0b11001111, 0b01101110, 0b01110111, 0b01001010, 0b11111101, 0b01011001, 0b10011110, 0b01000000, 0b00111011, 0b01101011, 0b11110100, 0b01000101, 0b10011111, 0b01010101, 0b00101011], # Node 178
-[0b11111110, 0b11011110, 0b11101011, 0b11011000, 0b01110001, 0b11111000, 0b11001111, 0b11011100, 0b11101111, 0b11001111, 0b10101111, 0b11011111, 0b11111111, 0b10111011, 0b00111101, 0b01110111, 0b11111111, 0b01111111, 0b00110011, 0b11111101, 0b11110000, 0b11111101, 0b01001011, 0b11010000, 0b00001001, 0b10111001, 0b11110001, 0b11110101, 0b10110111, 0b01011101, 0b11011111, 0b01111101, 0b00101001, 0b11110101, 0b11111011, 0b01110011, 0b10000001, 0b11000010, 0b01111011, 0b00000110, 0b11001101, 0b00011010, 0b00101111, 0b01110111, 0b11100111, 0b11111110, 0b11111101, 0b10101011, 0b10111101, 0b11110011, 0b10000111, 0b11111100, 0b01011111, 0b11000111, 0b10011011, 0b01111101, 0b00110111, 0b11101010, 0b11011101, 0b10111111, 0b11011111, 0b11011100, 0b00111111, 0b10001110, 0b00010010, 0b11111100, 0b01110111, 0b01111011, 0b00001101, 0b01000000, 0b00101101, 0b00000111, 0b01101110, 0b00111010, 0b11110101, 0b10101000, 0b00110011, 0b00111101, 0b10001101, 0b01110101, 0b10111110, 0b01001110, 0b01111011, 0b10111110, 0b01111001, 0b11011001, 0b11111001, 0b11111111, 0b11011111, 0b10111011, 0b11111110, 0b01111011, 0b01110000, 0b11011111, 0b11101111, 0b10011011, 0b11001110, 0b10111101], # Node 179
-[0b10001100, 0b01000010, 0b01001111, 0b10110110, 0b00001000, 0b00000111, 0b00010100, 0b01010001, 0b01000001, 0b10001010, 0b01110000, 0b01101111, 0b00101011, 0b00110010, 0b01010000, 0b10010110, 0b00110010, 0b00111101, 0b11011111, 0b10100010, 0b10100000, 0b01010001, 0b01010000, 0b00011011, 0b11001101, 0b11001100, 0b01011011, 0b01110001, 0b11101001, 0b01011011, 0b10111011, 0b00011111, 0b01100010, 0b01000011, 0b00010001, 0b10010101, 0b00111110, 0b10000001, 0b10000001, 0b10001101, 0b01111101, 0b01000110, 0b01100010, 0b00111001, 0b01100000, 0b11010000, 0b00000101, 0b01101110, 0b10000010, 0b00000001, 0b10001101, 0b01100001, 0b00010010, 0b11001100, 0b01111110, 0b01001011, 0b00000001, 0b10101010, 0b01001111, 0b10001001, 0b01100100, 0b10101101, 0b01101111, 0b00111011, 0b00001100, 0b11101110, 0b00100100, 0b10111100, 0b00011110, 0b01011010, 0b11110101, 0b00001100, 0b00100101, 0b01101000, 0b11000010, 0b01110110, 0b01000101, 0b00011001, 0b11000000, 0b01010100, 0b11011000, 0b00000000, 0b10101010, 0b11000100, 0b10111111, 0b11101111, 0b00010000, 0b01000111, 0b00000100, 0b10100001, 0b10001101, 0b11001011, 0b01011100, 0b10010110, 0b01010111, 0b00010100, 0b00001010, 0b01100011], # Node 180
-[0b01111101, 0b10011110, 0b01100111, 0b11100001, 0b10111001, 0b10111111, 0b11011010, 0b11111111, 0b11101111, 0b01001101, 0b00101111, 0b11100111, 0b10011111, 0b10011101, 0b01111101, 0b01001010, 0b01100111, 0b10111100, 0b01110111, 0b01111110, 0b10110100, 0b10010011, 0b10111110, 0b01101111, 0b11100110, 0b11111111, 0b11111111, 0b11011011, 0b11111110, 0b01110111, 0b11011101, 0b11010111, 0b01111110, 0b11110110, 0b00110011, 0b11100110, 0b11110000, 0b01111111, 0b01111011, 0b00010011, 0b11110111, 0b10111111, 0b00011110, 0b11010111, 0b11111001, 0b10111001, 0b10100010, 0b01110110, 0b01111110, 0b01101111, 0b11111110, 0b10100110, 0b00101010, 0b10100100, 0b00000111, 0b11111010, 0b01011010, 0b00011000, 0b11111000, 0b01110011, 0b11111111, 0b00001111, 0b00010010, 0b01110011, 0b00111100, 0b10110100, 0b10111001, 0b10111001, 0b11110000, 0b11001111, 0b10001011, 0b00101111, 0b11110111, 0b11100010, 0b11100001, 0b11111001, 0b00011111, 0b11011011, 0b11011110, 0b10111111, 0b11001100, 0b10100100, 0b01111111, 0b01110101, 0b11010111, 0b11111101, 0b11100011, 0b11101111, 0b00101110, 0b00100101, 0b10111001, 0b11110111, 0b11100101, 0b01111001, 0b10111110, 0b01110100, 0b11101011, 0b11111100], # Node 181
-[0b11111010, 0b01100011, 0b11101110, 0b10001101, 0b00111111, 0b11011111, 0b01111111, 0b11010101, 0b11101110, 0b11111101, 0b11101111, 0b11101110, 0b01111100, 0b01101011, 0b01011111, 0b00100000, 0b10110110, 0b11111111, 0b00100110, 0b11111000, 0b01111110, 0b10101011, 0b01000000, 0b10001111, 0b11011011, 0b00000111, 0b10111110, 0b11110100, 0b01011101, 0b11111000, 0b00111111, 0b11011101, 0b11101101, 0b10111111, 0b01000111, 0b00111110, 0b10101100, 0b11111010, 0b11110111, 0b01100101, 0b00001000, 0b10010111, 0b00111011, 0b00000101, 0b10100110, 0b11101101, 0b11000010, 0b11111100, 0b11000010, 0b01011010, 0b10110010, 0b10111111, 0b01111110, 0b00010011, 0b11111110, 0b10110010, 0b01011011, 0b10110010, 0b01011011, 0b10100110, 0b01010111, 0b01111101, 0b10010111, 0b11110011, 0b10010010, 0b01101101, 0b00101100, 0b10111110, 0b01110101, 0b01100000, 0b10011111, 0b11100011, 0b00001010, 0b11111101, 0b10011111, 0b00000000, 0b11001000, 0b11101011, 0b00010011, 0b01001000, 0b10111011, 0b11111100, 0b10100010, 0b11001010, 0b10001011, 0b01111111, 0b11110101, 0b01110111, 0b11111111, 0b01111011, 0b10000110, 0b11001101, 0b10101111, 0b10101110, 0b10110011, 0b10011110, 0b11110111, 0b10000111], # Node 182
-[0b00011111, 0b10110101, 0b00101001, 0b10000000, 0b01011011, 0b10010111, 0b01110101, 0b10101001, 0b10101111, 0b10100011, 0b01011011, 0b11011100, 0b11100101, 0b11001101, 0b11100110, 0b11111111, 0b10111010, 0b11111111, 0b01011011, 0b00000001, 0b10111100, 0b11111111, 0b01111010, 0b11101110, 0b01100001, 0b11010011, 0b00010000, 0b10100000, 0b01101010, 0b10101101, 0b11101011, 0b10100011, 0b11110111, 0b00001001, 0b01101101, 0b01001101, 0b11111100, 0b10100000, 0b10011011, 0b00011101, 0b00110011, 0b11110111, 0b11011011, 0b00010100, 0b11110000, 0b11011111, 0b01110010, 0b10000101, 0b10100101, 0b00010001, 0b10101101, 0b11010011, 0b00110111, 0b11100100, 0b01001010, 0b11110110, 0b00010001, 0b11011110, 0b10101011, 0b11001011, 0b01111000, 0b00110110, 0b10110011, 0b00101110, 0b00111011, 0b11001010, 0b00101000, 0b10010010, 0b11000001, 0b01110110, 0b01000111, 0b01001000, 0b10110111, 0b11001111, 0b00101001, 0b01011111, 0b10110110, 0b01110110, 0b00000000, 0b00010110, 0b00000001, 0b00111101, 0b11011101, 0b11001101, 0b10111001, 0b11011111, 0b01111011, 0b00111010, 0b00011101, 0b00101011, 0b11011110, 0b01111010, 0b11111011, 0b11110010, 0b11011100, 0b01101110, 0b01110100, 0b11010101], # Node 183
-[0b10110111, 0b00011111, 0b10110111, 0b11010110, 0b00000010, 0b11110110, 0b11010111, 0b01100110, 0b11111101, 0b10110110, 0b10111110, 0b11111101, 0b11110111, 0b11111101, 0b01110010, 0b00111001, 0b10111011, 0b01111011, 0b11110111, 0b00110100, 0b10111110, 0b10011111, 0b01100111, 0b10011001, 0b10001101, 0b01111011, 0b01001101, 0b10111100, 0b01110010, 0b00111011, 0b01001101, 0b10111101, 0b11001111, 0b00001010, 0b11101101, 0b11111110, 0b11111111, 0b11110101, 0b11111111, 0b00010101, 0b10001101, 0b11111101, 0b10010111, 0b10001100, 0b01100011, 0b10111111, 0b00101000, 0b01010101, 0b11111001, 0b11100010, 0b00010110, 0b00011000, 0b00011110, 0b01111100, 0b10011001, 0b00110111, 0b00101111, 0b11101101, 0b10011010, 0b01000110, 0b11111010, 0b11010101, 0b00110011, 0b01110110, 0b01111110, 0b01110111, 0b01110010, 0b10111111, 0b10001101, 0b11111000, 0b11111111, 0b10100011, 0b11110100, 0b01101111, 0b10111110, 0b11111000, 0b11101111, 0b01110110, 0b11000110, 0b11111111, 0b11111101, 0b11101111, 0b11011100, 0b10111110, 0b10011101, 0b00101100, 0b01001110, 0b10101011, 0b11110101, 0b11111111, 0b11111110, 0b01000110, 0b11010001, 0b00110111, 0b11101101, 0b11111111, 0b10111010, 0b10111101], # Node 184
-[0b01001001, 0b01000101, 0b01100100, 0b01101011, 0b11011111, 0b10101000, 0b11010100, 0b11001010, 0b11000110, 0b01111000, 0b11101111, 0b11110100, 0b10101010, 0b11111101, 0b11001001, 0b10111111, 0b11111111, 0b00110100, 0b01101101, 0b00111111, 0b10110011, 0b11011010, 0b00001011, 0b11111110, 0b01010110, 0b00110101, 0b01110011, 0b01110010, 0b11010111, 0b10011111, 0b11110001, 0b11110011, 0b00101001, 0b11011010, 0b11101100, 0b11110001, 0b10011011, 0b11000110, 0b00010100, 0b11111010, 0b01010111, 0b11111111, 0b11111001, 0b00110011, 0b10010101, 0b11111100, 0b10101101, 0b11010101, 0b11110111, 0b11011110, 0b00001001, 0b11000000, 0b01110101, 0b01110010, 0b00010101, 0b11011001, 0b01101110, 0b10001011, 0b11001110, 0b11011001, 0b10110110, 0b10001001, 0b11001101, 0b00101111, 0b00001111, 0b10110011, 0b00111101, 0b00111111, 0b00100000, 0b11011100, 0b10111011, 0b10100111, 0b11001000, 0b01101010, 0b11001100, 0b10101010, 0b10100110, 0b01101101, 0b01001011, 0b11111111, 0b11011011, 0b01101111, 0b10001110, 0b01100000, 0b10110100, 0b11110000, 0b11000000, 0b01101010, 0b00111110, 0b11100101, 0b11101110, 0b10011101, 0b01100100, 0b11011111, 0b11010011, 0b00011010, 0b01100001, 0b10101010], # Node 185
-[0b10010111, 0b11001111, 0b11100111, 0b11110000, 0b10001111, 0b01110111, 0b01010100, 0b10011111, 0b11111001, 0b11110010, 0b10011000, 0b00001111, 0b01110011, 0b00100000, 0b00110011, 0b00010100, 0b01010100, 0b11000111, 0b10110101, 0b10000100, 0b01011100, 0b00011011, 0b01110010, 0b01110110, 0b10111010, 0b10111100, 0b00011001, 0b11100001, 0b11000101, 0b10111110, 0b11101010, 0b00001001, 0b11111110, 0b00110111, 0b11000100, 0b11001111, 0b00111111, 0b10101011, 0b10000001, 0b00111111, 0b10011101, 0b10100111, 0b10010111, 0b00010000, 0b10011000, 0b01111110, 0b01011101, 0b01001011, 0b01011100, 0b00111111, 0b10000101, 0b11101101, 0b00010100, 0b11110001, 0b11100110, 0b00111010, 0b11111111, 0b00110110, 0b11111100, 0b10111110, 0b10001101, 0b10101100, 0b11101111, 0b11100111, 0b10100011, 0b11010111, 0b11110100, 0b10111101, 0b01010001, 0b10101001, 0b11111011, 0b10100000, 0b01011101, 0b01001110, 0b01101100, 0b01100111, 0b10011101, 0b10010100, 0b10100101, 0b11110000, 0b00100111, 0b10101101, 0b10111010, 0b01111111, 0b10111101, 0b01111000, 0b10101101, 0b10101101, 0b00011111, 0b01110100, 0b00111110, 0b00101101, 0b11011011, 0b10111001, 0b11010101, 0b00111010, 0b11111001, 0b00111001], # Node 186
-[0b10001111, 0b01110111, 0b00000000, 0b01110101, 0b11101000, 0b00101111, 0b11001011, 0b11000100, 0b11111111, 0b00100010, 0b11111110, 0b11000101, 0b11100001, 0b11011101, 0b11010010, 0b00011011, 0b00111011, 0b11110011, 0b01001101, 0b01010011, 0b11100101, 0b01111101, 0b01110111, 0b11110001, 0b01111001, 0b00100011, 0b11100011, 0b01111110, 0b11100000, 0b00011101, 0b11001110, 0b01001110, 0b10101101, 0b10110011, 0b00011110, 0b00111100, 0b00111101, 0b10011000, 0b10111100, 0b11101110, 0b00100101, 0b00111010, 0b10001110, 0b10110000, 0b11011110, 0b11100000, 0b10000100, 0b01101111, 0b10111010, 0b11111011, 0b11011100, 0b01010100, 0b01110000, 0b01011101, 0b01000100, 0b00111010, 0b01001111, 0b01001111, 0b11101001, 0b10001100, 0b11000100, 0b11110011, 0b10101000, 0b11110110, 0b00111111, 0b11110101, 0b01011101, 0b10100011, 0b10000100, 0b11101101, 0b11011111, 0b11010100, 0b10001001, 0b00011100, 0b00000010, 0b11000000, 0b01110001, 0b00110100, 0b10001110, 0b10111111, 0b00111100, 0b10011101, 0b11011111, 0b10010010, 0b01010110, 0b01010110, 0b01000101, 0b10100000, 0b01011011, 0b11000011, 0b11011101, 0b01100111, 0b10111100, 0b01101011, 0b00000110, 0b11111010, 0b10011011, 0b11111010], # Node 187
-[0b11101101, 0b00010001, 0b11111111, 0b10111110, 0b00010101, 0b11010011, 0b11100110, 0b10001111, 0b11001100, 0b11111111, 0b11101000, 0b00110111, 0b11100101, 0b10001011, 0b01100001, 0b11000011, 0b11101010, 0b00010111, 0b11111010, 0b11101101, 0b01111001, 0b01011111, 0b00001001, 0b01000010, 0b00111011, 0b01111100, 0b00000000, 0b11010111, 0b00101101, 0b11110111, 0b11101111, 0b11101101, 0b11111110, 0b01011110, 0b01000111, 0b10110110, 0b11101000, 0b01011000, 0b11111110, 0b10011010, 0b10001111, 0b11101110, 0b10100011, 0b11000010, 0b11111110, 0b10101011, 0b00000111, 0b11111001, 0b11011011, 0b10110111, 0b00111111, 0b11110111, 0b00001110, 0b11000101, 0b10011001, 0b11011101, 0b11011101, 0b01011001, 0b11111000, 0b10101001, 0b11001001, 0b10100010, 0b11111001, 0b11000111, 0b11111010, 0b11000011, 0b11100101, 0b11010101, 0b10101000, 0b01110101, 0b01111000, 0b00001000, 0b00101010, 0b11101110, 0b11101010, 0b10001011, 0b10111101, 0b11111010, 0b00011110, 0b00001001, 0b10000011, 0b10101011, 0b10010000, 0b11011011, 0b10010101, 0b11101101, 0b11101101, 0b01110000, 0b11111101, 0b11010111, 0b10111001, 0b01011010, 0b11011111, 0b11101111, 0b10011010, 0b11111111, 0b11101011, 0b01000111], # Node 188
-[0b00000010, 0b00100010, 0b01100110, 0b00100000, 0b00001000, 0b10100100, 0b01001010, 0b00010000, 0b00001000, 0b00011011, 0b01011000, 0b00001000, 0b00000000, 0b00000011, 0b10010011, 0b00011000, 0b10000101, 0b01000001, 0b10010000, 0b01000111, 0b10000001, 0b01100000, 0b01010000, 0b01000111, 0b01101000, 0b00010011, 0b00000000, 0b01010100, 0b00001000, 0b10000100, 0b00010010, 0b11100001, 0b00001010, 0b01110100, 0b00000010, 0b01100100, 0b11100000, 0b00011101, 0b00001001, 0b00000000, 0b11110011, 0b00001000, 0b01100100, 0b00101000, 0b00100101, 0b00010101, 0b00010000, 0b10100111, 0b11010110, 0b00000010, 0b01000010, 0b00010000, 0b00010001, 0b00000000, 0b00001000, 0b01000010, 0b00100000, 0b00000000, 0b01001000, 0b00100100, 0b00000100, 0b11001010, 0b10000000, 0b00010100, 0b01000001, 0b00001110, 0b00010110, 0b00011000, 0b01100010, 0b01100110, 0b00001100, 0b11011001, 0b00000000, 0b10010010, 0b00000100, 0b00000001, 0b11000000, 0b01011000, 0b00000101, 0b01100010, 0b10000001, 0b01011000, 0b10000100, 0b10000000, 0b01101000, 0b10000100, 0b00000010, 0b00000000, 0b01000000, 0b00000100, 0b00000000, 0b10010000, 0b00000001, 0b10000001, 0b10000000, 0b10000110, 0b00000000, 0b01000010], # Node 189
-[0b10110100, 0b10011000, 0b00001000, 0b01110001, 0b01110001, 0b10110000, 0b10110110, 0b00010101, 0b01110001, 0b11101110, 0b10110000, 0b00010000, 0b00001110, 0b11101010, 0b11010101, 0b00100110, 0b00011001, 0b01010100, 0b10000000, 0b10010001, 0b10100000, 0b10001101, 0b10010010, 0b10010101, 0b01100010, 0b11100000, 0b10111000, 0b11110100, 0b10010111, 0b01101101, 0b01001101, 0b00010010, 0b00110101, 0b10100001, 0b10010001, 0b11110000, 0b10001100, 0b10100100, 0b01011011, 0b00100001, 0b01110011, 0b00010001, 0b01011101, 0b01111111, 0b01001100, 0b01011111, 0b11100010, 0b00010001, 0b00101000, 0b01100001, 0b11100100, 0b01001110, 0b00000000, 0b11110101, 0b01001000, 0b10110010, 0b10010100, 0b10100010, 0b00000101, 0b11001100, 0b01001111, 0b00001010, 0b00010001, 0b00010000, 0b00001001, 0b11110101, 0b00100110, 0b10000110, 0b11100110, 0b11111111, 0b11100101, 0b01110110, 0b11010101, 0b10101000, 0b10001101, 0b01111001, 0b10001000, 0b01111011, 0b00101100, 0b01000000, 0b00010110, 0b01111000, 0b10101111, 0b01001100, 0b00001100, 0b11100101, 0b00110000, 0b00000111, 0b10111111, 0b11111010, 0b00100010, 0b00001110, 0b01000011, 0b00101100, 0b00011001, 0b00011011, 0b01010001, 0b00111001], # Node 190
-[0b11010001, 0b00000000, 0b11110100, 0b00101100, 0b10000000, 0b00001001, 0b10000000, 0b10101100, 0b11010010, 0b00001000, 0b00011100, 0b10010000, 0b11010001, 0b00001101, 0b01010000, 0b10100001, 0b11100100, 0b01110010, 0b00000100, 0b10000000, 0b01000000, 0b10110101, 0b00000000, 0b00000000, 0b00000010, 0b00000101, 0b00000000, 0b10100000, 0b00100000, 0b01010001, 0b00000000, 0b01000000, 0b01000010, 0b00100100, 0b00100000, 0b10001001, 0b10010010, 0b00000000, 0b10000000, 0b00001101, 0b00000001, 0b10000000, 0b01000000, 0b11010000, 0b00000111, 0b01010000, 0b10101000, 0b11111111, 0b01000001, 0b00000000, 0b00010110, 0b00001111, 0b10001001, 0b11101000, 0b11111001, 0b01000001, 0b00000011, 0b11001110, 0b00001011, 0b00100000, 0b11101000, 0b00101111, 0b00000000, 0b00000000, 0b01001110, 0b00001000, 0b00000100, 0b11100000, 0b01000101, 0b01000000, 0b00000010, 0b01000100, 0b00001000, 0b00001110, 0b00000001, 0b10011000, 0b10011000, 0b00000111, 0b00000000, 0b10001110, 0b11000000, 0b00000001, 0b01000000, 0b01011001, 0b00010010, 0b10000000, 0b11100101, 0b00100000, 0b00000000, 0b00010001, 0b00111010, 0b00000000, 0b01100100, 0b00011001, 0b01001000, 0b00000001, 0b01010000, 0b01010000], # Node 191
-[0b10010100, 0b00110110, 0b01101000, 0b11011111, 0b01101010, 0b10010111, 0b11010011, 0b01000000, 0b00000010, 0b01101001, 0b01001011, 0b10001001, 0b01101100, 0b01000000, 0b10100011, 0b01001000, 0b00001010, 0b11100010, 0b01100010, 0b10001010, 0b00010001, 0b11110010, 0b11000000, 0b01100101, 0b11100000, 0b00000001, 0b00000111, 0b01011011, 0b00011110, 0b00111011, 0b10110000, 0b00000101, 0b10101000, 0b01001000, 0b01001011, 0b10010100, 0b00000110, 0b11010100, 0b01001000, 0b10110011, 0b10100101, 0b00010011, 0b01001100, 0b01111000, 0b10001010, 0b11011000, 0b10100111, 0b00100000, 0b10111000, 0b00110100, 0b10011010, 0b01011111, 0b11001101, 0b11111110, 0b01001010, 0b10001100, 0b10100000, 0b00011111, 0b11010100, 0b00001010, 0b01000100, 0b00011000, 0b10000100, 0b01110101, 0b11000001, 0b00010100, 0b11001111, 0b10110000, 0b00101110, 0b00010101, 0b11110001, 0b11000001, 0b11011111, 0b10010011, 0b00100011, 0b10001011, 0b00011010, 0b10001110, 0b00101010, 0b01001010, 0b11100101, 0b01111110, 0b01001100, 0b10001111, 0b00000001, 0b10011111, 0b00001010, 0b01011000, 0b00000111, 0b10001101, 0b01000011, 0b01111011, 0b01000100, 0b01010100, 0b01011010, 0b00111001, 0b00011110, 0b11100001], # Node 192
-[0b10011000, 0b00000110, 0b01010101, 0b01001001, 0b10001101, 0b11000000, 0b11100001, 0b10001000, 0b00010000, 0b10000000, 0b00100000, 0b10010000, 0b00000100, 0b00000011, 0b11101110, 0b10000001, 0b00111100, 0b11011010, 0b00000100, 0b10000000, 0b01100001, 0b01100101, 0b00000001, 0b01111111, 0b00001101, 0b00000000, 0b11111100, 0b00011111, 0b00000100, 0b11010000, 0b11111110, 0b00110000, 0b00000000, 0b11000100, 0b01111111, 0b01000010, 0b00010000, 0b11111000, 0b01000110, 0b00000010, 0b10000001, 0b00001111, 0b00001100, 0b00111100, 0b01101000, 0b01000000, 0b11110010, 0b10100011, 0b00100111, 0b10000000, 0b00001111, 0b00111100, 0b01001010, 0b11111000, 0b00000001, 0b10110011, 0b11000111, 0b01101101, 0b00110000, 0b10000011, 0b11011100, 0b00000101, 0b01010001, 0b11000000, 0b00111000, 0b00000100, 0b00000001, 0b11101110, 0b00110010, 0b00101000, 0b11100000, 0b11111101, 0b10000000, 0b00110101, 0b11011111, 0b00001111, 0b00100000, 0b11100110, 0b00101111, 0b10000000, 0b00001000, 0b11111000, 0b00000001, 0b00001011, 0b10000000, 0b00001010, 0b11000000, 0b00100000, 0b10001000, 0b00010110, 0b10101000, 0b10000110, 0b10010101, 0b01000000, 0b10010001, 0b00001000, 0b00001100, 0b10101010], # Node 193
-[0b00000011, 0b10001001, 0b01010010, 0b00110001, 0b00001011, 0b00000100, 0b00110001, 0b01001100, 0b11110100, 0b00100001, 0b01111101, 0b01101001, 0b10101101, 0b00000010, 0b10100110, 0b00000100, 0b10010001, 0b01000000, 0b00010100, 0b00000000, 0b00001001, 0b10100010, 0b00100001, 0b10011011, 0b01101100, 0b01101000, 0b00110000, 0b00100100, 0b00010111, 0b01000100, 0b10010001, 0b00000100, 0b11111110, 0b00100100, 0b01100010, 0b10100000, 0b00011001, 0b00000000, 0b01001011, 0b10101100, 0b00110001, 0b00010111, 0b00001000, 0b00101011, 0b01110101, 0b11011010, 0b10011101, 0b00101111, 0b01110110, 0b11001010, 0b10110100, 0b01010000, 0b00001101, 0b00000101, 0b10110111, 0b00110101, 0b01000111, 0b11001010, 0b11100001, 0b10101010, 0b00011111, 0b00000101, 0b00001000, 0b00010101, 0b10101101, 0b10101000, 0b00111100, 0b11000010, 0b11100000, 0b01100011, 0b10010100, 0b10111110, 0b11110010, 0b00100101, 0b10101101, 0b01100111, 0b01100111, 0b11000000, 0b01000000, 0b00000101, 0b10101011, 0b00001101, 0b00110001, 0b10111001, 0b01111110, 0b01110000, 0b00011100, 0b11111000, 0b10010011, 0b00000010, 0b10110100, 0b11000110, 0b00110111, 0b11011000, 0b00010000, 0b10010000, 0b10011111, 0b10000001], # Node 194
-[0b10100010, 0b10100000, 0b10010000, 0b10100010, 0b00110000, 0b01000000, 0b00001110, 0b00010000, 0b00011000, 0b01010011, 0b10000100, 0b11111001, 0b10100010, 0b00000110, 0b01000001, 0b00010010, 0b01010001, 0b00000001, 0b11011001, 0b10100001, 0b00110000, 0b10100000, 0b01000100, 0b00000000, 0b01000000, 0b10101011, 0b10101001, 0b00110000, 0b00000000, 0b00101100, 0b01001000, 0b00000001, 0b11101110, 0b10100100, 0b01001100, 0b11101100, 0b01100010, 0b01001001, 0b11100000, 0b11101010, 0b11011111, 0b00100100, 0b00010000, 0b01011001, 0b00000111, 0b01100000, 0b11001010, 0b00000110, 0b00001000, 0b10100000, 0b00000000, 0b00011111, 0b11010000, 0b11010100, 0b11001100, 0b11010100, 0b10000000, 0b00110100, 0b00011010, 0b11101000, 0b00010011, 0b01011000, 0b11111011, 0b00100101, 0b01000010, 0b10011001, 0b11100010, 0b11001111, 0b11000000, 0b00111000, 0b01001001, 0b10101000, 0b01100010, 0b00000010, 0b01000100, 0b01100001, 0b11000001, 0b00100010, 0b10100100, 0b10010000, 0b00000001, 0b01000000, 0b10000001, 0b00000000, 0b00011100, 0b00101011, 0b00000010, 0b01001000, 0b10000100, 0b01001010, 0b00000001, 0b01000000, 0b01000011, 0b00000010, 0b10000100, 0b10100000, 0b11100110, 0b11000000], # Node 195
-[0b00110111, 0b00001011, 0b01010111, 0b10101101, 0b11110101, 0b11011000, 0b10111001, 0b10000101, 0b10001100, 0b10111101, 0b11011111, 0b10010100, 0b00110011, 0b11011011, 0b00110001, 0b00010111, 0b01100001, 0b11001001, 0b11011000, 0b11110101, 0b10011011, 0b01011111, 0b01000101, 0b10101111, 0b00010000, 0b00010010, 0b10010011, 0b10111010, 0b01011110, 0b00111110, 0b10010011, 0b10100101, 0b11111101, 0b10000110, 0b10110110, 0b11110101, 0b00111001, 0b00011110, 0b00111011, 0b10001100, 0b01010111, 0b11001111, 0b11101000, 0b10010101, 0b11100111, 0b11011111, 0b00110101, 0b00001101, 0b11111110, 0b10101011, 0b11110000, 0b01101000, 0b01000000, 0b10011010, 0b10110111, 0b10111100, 0b10011010, 0b01100011, 0b11001111, 0b00111111, 0b10010011, 0b11000110, 0b10000011, 0b11100100, 0b01001001, 0b01101111, 0b11111110, 0b00110110, 0b01001010, 0b11101001, 0b00111110, 0b01100101, 0b01101010, 0b11001000, 0b10011100, 0b11100000, 0b01001000, 0b01010011, 0b00001010, 0b01110010, 0b01010110, 0b01001100, 0b11001101, 0b10011111, 0b00001111, 0b10011111, 0b11001011, 0b00011011, 0b10011001, 0b10111001, 0b11111110, 0b10011110, 0b00011001, 0b10100100, 0b00010000, 0b01011000, 0b10101010, 0b11111111], # Node 196
-[0b10000010, 0b11110000, 0b00000010, 0b10000101, 0b01000000, 0b00010110, 0b00111101, 0b00010110, 0b01000000, 0b00011111, 0b00000000, 0b00001000, 0b00011010, 0b01000010, 0b00001001, 0b00000000, 0b00010000, 0b00100110, 0b00100001, 0b01000001, 0b00010001, 0b00001000, 0b01011010, 0b10001011, 0b00010011, 0b11000000, 0b00101100, 0b00101001, 0b00011100, 0b10101001, 0b00110111, 0b11000000, 0b01000010, 0b00011111, 0b00000111, 0b10000100, 0b10000000, 0b01010100, 0b10000100, 0b01000000, 0b11010010, 0b10010011, 0b11000001, 0b00001100, 0b01011001, 0b11000010, 0b10000010, 0b11101001, 0b10000011, 0b00100000, 0b10100000, 0b11100111, 0b00000000, 0b11101100, 0b00011110, 0b00110011, 0b10100011, 0b10110000, 0b01011000, 0b01100001, 0b01001111, 0b11101110, 0b10011100, 0b01010110, 0b11000100, 0b00000101, 0b10101110, 0b00001001, 0b11010011, 0b00101010, 0b10101000, 0b11111101, 0b00111000, 0b10110100, 0b11110000, 0b00011111, 0b01011000, 0b00000000, 0b00001100, 0b11101000, 0b01001000, 0b00100010, 0b01000000, 0b00001100, 0b00110001, 0b00011000, 0b00001001, 0b10011001, 0b11000101, 0b00000000, 0b10110100, 0b00000011, 0b10100001, 0b10101110, 0b00000000, 0b10010000, 0b01000000, 0b00000100], # Node 197
-[0b00000001, 0b11100101, 0b00100011, 0b01110011, 0b01100011, 0b00110100, 0b01100001, 0b10100001, 0b01011100, 0b00000000, 0b10010100, 0b00100100, 0b10110101, 0b10000010, 0b01010000, 0b11100000, 0b01011111, 0b10001010, 0b11110100, 0b11111111, 0b01110011, 0b01010000, 0b11101100, 0b01101111, 0b10101010, 0b10000011, 0b01111111, 0b00000000, 0b00011010, 0b11100001, 0b00100111, 0b10001000, 0b00010000, 0b00000100, 0b01100100, 0b00001110, 0b01100000, 0b00100001, 0b10010000, 0b00000101, 0b00000001, 0b01110001, 0b00010000, 0b00110000, 0b00001111, 0b10001000, 0b00000010, 0b11000011, 0b01000001, 0b10001001, 0b11011000, 0b11011111, 0b10110010, 0b11111010, 0b00011001, 0b00111011, 0b00011010, 0b11011111, 0b00000101, 0b01011100, 0b11101010, 0b01101111, 0b01110110, 0b10001001, 0b11111111, 0b01111111, 0b00001101, 0b11101110, 0b11111101, 0b01000110, 0b11111100, 0b01111111, 0b11100011, 0b00101111, 0b11111111, 0b01100011, 0b10000111, 0b00001010, 0b10001000, 0b00011100, 0b00000001, 0b00100001, 0b00100000, 0b10100001, 0b00110110, 0b11100001, 0b11010001, 0b00010011, 0b00001010, 0b01010001, 0b00000000, 0b11110000, 0b00000000, 0b00000111, 0b01000010, 0b01100110, 0b00011000, 0b10000100], # Node 198
-[0b01100100, 0b00011110, 0b11110110, 0b01010001, 0b11111101, 0b11000010, 0b10001011, 0b00110011, 0b00011111, 0b11000101, 0b10100001, 0b10001111, 0b10111110, 0b11001010, 0b01101110, 0b11010011, 0b11101011, 0b10011001, 0b00001011, 0b01111110, 0b11001111, 0b10011001, 0b00111111, 0b00101010, 0b11110001, 0b11111100, 0b00110011, 0b00110110, 0b01111110, 0b00100011, 0b01011110, 0b11000110, 0b11011100, 0b11100101, 0b11100111, 0b11110011, 0b00101011, 0b00110000, 0b11100110, 0b00111101, 0b10001010, 0b00010101, 0b00000010, 0b11101010, 0b10101110, 0b00110000, 0b00000101, 0b10010000, 0b00001101, 0b01111000, 0b10110000, 0b00111000, 0b11001110, 0b01110000, 0b00100111, 0b11000101, 0b10110010, 0b11101101, 0b01111010, 0b10101111, 0b01110010, 0b01100110, 0b11111100, 0b01111010, 0b10000110, 0b10011001, 0b10011101, 0b11010101, 0b00100010, 0b11001001, 0b00111011, 0b01110000, 0b01101101, 0b01001101, 0b00011111, 0b01000000, 0b11111011, 0b10101110, 0b10100000, 0b11011110, 0b11011000, 0b10011101, 0b10101111, 0b01000101, 0b10111110, 0b00001000, 0b11100101, 0b01101101, 0b10111100, 0b11010111, 0b01111101, 0b11101010, 0b01011010, 0b11110101, 0b11111010, 0b00001110, 0b01011010, 0b11110001], # Node 199
-[0b11111100, 0b01110111, 0b01001011, 0b10011010, 0b01110111, 0b10001100, 0b10111110, 0b11010110, 0b00011010, 0b11111011, 0b11001000, 0b00001010, 0b11000111, 0b10111101, 0b10111110, 0b00111100, 0b10011001, 0b11011111, 0b01111000, 0b10101111, 0b10111111, 0b01011100, 0b00111000, 0b10110111, 0b10011010, 0b00101101, 0b00011001, 0b11110010, 0b10010110, 0b00001111, 0b01001011, 0b01111001, 0b00100011, 0b11101010, 0b01011110, 0b00111010, 0b10101011, 0b00101101, 0b01101010, 0b00010110, 0b00101011, 0b00111001, 0b11010000, 0b10011100, 0b11000110, 0b11001001, 0b01100100, 0b00000111, 0b01011011, 0b11111110, 0b00101000, 0b00111101, 0b10001001, 0b00011101, 0b01010000, 0b01011010, 0b11110111, 0b11001110, 0b11001001, 0b11111110, 0b00101000, 0b00101001, 0b11000010, 0b10110101, 0b11010010, 0b10001000, 0b10111001, 0b11111011, 0b10100001, 0b11011101, 0b01001000, 0b11100000, 0b10101100, 0b01101100, 0b00010101, 0b10101110, 0b01111101, 0b10010110, 0b00000111, 0b10111101, 0b00001110, 0b11100111, 0b00110000, 0b11110011, 0b00101010, 0b11001101, 0b01111110, 0b01011111, 0b00101010, 0b11010111, 0b10111000, 0b10010111, 0b11110010, 0b00101101, 0b10101011, 0b01101111, 0b10111000, 0b11100111], # Node 200
-[0b11001100, 0b01010001, 0b00001010, 0b00000011, 0b10001011, 0b00000111, 0b11111101, 0b11001011, 0b10000000, 0b01110000, 0b00101011, 0b00011100, 0b10000010, 0b10011010, 0b11001100, 0b10100000, 0b01000100, 0b10001000, 0b10000001, 0b00111110, 0b11111010, 0b11110000, 0b01011110, 0b01001011, 0b00110001, 0b01100000, 0b01000110, 0b00011111, 0b01110101, 0b11111101, 0b11010100, 0b00110010, 0b00010010, 0b01000111, 0b00101100, 0b01100001, 0b00110101, 0b10101001, 0b10000011, 0b00000101, 0b10110101, 0b01110001, 0b10110000, 0b00110111, 0b11111101, 0b01000100, 0b10001000, 0b11100011, 0b01000101, 0b00100010, 0b11011001, 0b00111011, 0b00111101, 0b01000110, 0b00011011, 0b01010010, 0b01000011, 0b00001100, 0b01011101, 0b00010001, 0b10110110, 0b01011010, 0b01000000, 0b11110101, 0b01100010, 0b01100110, 0b01101111, 0b10000001, 0b11111100, 0b11011000, 0b11000110, 0b00011100, 0b11100010, 0b00100110, 0b00011011, 0b00101111, 0b11010110, 0b00110010, 0b11000000, 0b10111001, 0b11001110, 0b11000110, 0b01010110, 0b00100111, 0b01000001, 0b01101010, 0b01000000, 0b01100011, 0b01011000, 0b01000110, 0b11010001, 0b00111000, 0b10101001, 0b00010010, 0b10000101, 0b11100110, 0b00010111, 0b10001001], # Node 201
-[0b00100011, 0b11000010, 0b00110000, 0b11000010, 0b10010010, 0b11110100, 0b01000010, 0b10011100, 0b11101001, 0b00000011, 0b01110110, 0b01001011, 0b00110111, 0b01000001, 0b00110100, 0b10010110, 0b11010010, 0b01011010, 0b01000000, 0b01010000, 0b00000101, 0b00010001, 0b11011001, 0b10011111, 0b11101111, 0b10011000, 0b01000110, 0b00110011, 0b01100101, 0b00111011, 0b00101001, 0b10100111, 0b01000011, 0b01110010, 0b00000000, 0b01000001, 0b00110100, 0b10000001, 0b01110110, 0b00011110, 0b10001101, 0b01011111, 0b00011001, 0b00110110, 0b10100011, 0b11100011, 0b00001100, 0b10110010, 0b11100010, 0b10110111, 0b01010101, 0b10000010, 0b01011100, 0b01001010, 0b10010001, 0b00010100, 0b11001100, 0b01111111, 0b11101100, 0b00011010, 0b00011110, 0b01111000, 0b01111010, 0b01100001, 0b01101011, 0b00101010, 0b00010000, 0b00100100, 0b01011100, 0b10000011, 0b01010100, 0b11101001, 0b01001100, 0b11100011, 0b11000101, 0b00011011, 0b00010011, 0b01001100, 0b10110110, 0b01101101, 0b10010110, 0b11100110, 0b01011000, 0b00001001, 0b00010111, 0b01110111, 0b11001010, 0b11001101, 0b00001110, 0b10010001, 0b11000110, 0b11010101, 0b11110011, 0b00000010, 0b00110110, 0b11000100, 0b10110001, 0b01000110], # Node 202
-[0b10111001, 0b11011101, 0b10111100, 0b01111111, 0b00111111, 0b10110101, 0b11001110, 0b11101111, 0b10111111, 0b01100111, 0b00111111, 0b11011111, 0b11010000, 0b11111111, 0b11101111, 0b11110111, 0b10011111, 0b11111111, 0b00111111, 0b11011000, 0b01111101, 0b11001111, 0b01001011, 0b11111100, 0b11111111, 0b00111111, 0b10001010, 0b11111111, 0b01111101, 0b00100101, 0b11010101, 0b11110110, 0b00001111, 0b10111111, 0b01111101, 0b10111101, 0b11100011, 0b01111110, 0b11101111, 0b11110011, 0b10000011, 0b11110011, 0b11011111, 0b01101011, 0b10000111, 0b01101001, 0b10010101, 0b01100011, 0b01000000, 0b10001011, 0b10000110, 0b11010111, 0b11101111, 0b10110001, 0b01100110, 0b11101000, 0b00011111, 0b11001100, 0b00100010, 0b11111111, 0b01100001, 0b00111010, 0b11111010, 0b11111101, 0b01000100, 0b11010100, 0b10101111, 0b11111001, 0b11000011, 0b10111100, 0b01111111, 0b10001111, 0b10110100, 0b01110011, 0b11111111, 0b01110110, 0b01011111, 0b01000111, 0b11011110, 0b11110111, 0b01111111, 0b10111111, 0b11111111, 0b11011111, 0b11111111, 0b11111111, 0b01101111, 0b11111111, 0b10011100, 0b11101111, 0b11111111, 0b11111111, 0b10111111, 0b01110111, 0b11100111, 0b11110111, 0b10111110, 0b11111101], # Node 203
-[0b00000001, 0b00110000, 0b00011100, 0b00101000, 0b10010010, 0b00101011, 0b01001001, 0b00011000, 0b11011010, 0b00111111, 0b00000000, 0b00000000, 0b11111000, 0b10011110, 0b00000001, 0b11000000, 0b00100011, 0b00010000, 0b00000000, 0b11111100, 0b01101111, 0b00000100, 0b11110000, 0b11111111, 0b00001011, 0b11000000, 0b11111010, 0b11111111, 0b00000010, 0b00111111, 0b11110100, 0b00001111, 0b11110000, 0b00000011, 0b01111100, 0b11000000, 0b00111111, 0b11000000, 0b00000011, 0b11111110, 0b00000011, 0b00111100, 0b11100010, 0b00111111, 0b11000000, 0b00000011, 0b10001100, 0b00000001, 0b00111100, 0b00000001, 0b00001100, 0b11000000, 0b00000111, 0b11000000, 0b00000011, 0b00111000, 0b00000000, 0b00111100, 0b00100000, 0b00100011, 0b11100000, 0b00000001, 0b01110010, 0b00000000, 0b00011111, 0b11010000, 0b00010001, 0b11111000, 0b11100001, 0b00111111, 0b10000000, 0b10011111, 0b11100111, 0b00100101, 0b11111000, 0b11001111, 0b00111111, 0b01000010, 0b11111100, 0b11111101, 0b10100100, 0b11100000, 0b11011111, 0b00001111, 0b00000100, 0b11111010, 0b01001111, 0b10101000, 0b00000000, 0b01111010, 0b00100000, 0b00001010, 0b00001100, 0b01010000, 0b11110001, 0b10000000, 0b00000011, 0b00100000], # Node 204
-[0b01011110, 0b00101011, 0b01001000, 0b01111111, 0b10111110, 0b11110101, 0b10110111, 0b10111111, 0b00001010, 0b10111010, 0b00111001, 0b10110111, 0b11111101, 0b11101110, 0b00011010, 0b00010111, 0b11100101, 0b10001111, 0b01001011, 0b10011011, 0b11101100, 0b01101111, 0b01010011, 0b01010101, 0b01001111, 0b00011100, 0b10111101, 0b11111100, 0b11101111, 0b11111110, 0b01001101, 0b11111000, 0b01100001, 0b00010111, 0b11011100, 0b10001011, 0b01100011, 0b10011110, 0b01100100, 0b11010010, 0b01110000, 0b00000101, 0b10001110, 0b00001101, 0b10111101, 0b11110110, 0b11111111, 0b00011001, 0b01111011, 0b11001011, 0b00010101, 0b10011001, 0b01111000, 0b01100100, 0b10011010, 0b10111111, 0b11111100, 0b01101011, 0b10101100, 0b01110111, 0b10111110, 0b01011001, 0b11011100, 0b11111110, 0b10011001, 0b01110010, 0b11101010, 0b01011001, 0b10000010, 0b11110111, 0b11101010, 0b10011011, 0b11111111, 0b00011100, 0b01001010, 0b01110000, 0b11101001, 0b00110011, 0b01110111, 0b11110111, 0b01001111, 0b11110110, 0b01111111, 0b10001101, 0b00010101, 0b01010111, 0b11110111, 0b10010011, 0b00100101, 0b11101000, 0b11010001, 0b00111010, 0b01011000, 0b01000111, 0b10011011, 0b00111011, 0b00101100, 0b01101011], # Node 205
-[0b11100000, 0b00010001, 0b00000111, 0b00111000, 0b00001001, 0b10100100, 0b01101110, 0b01000110, 0b10101101, 0b01001100, 0b10011100, 0b11000001, 0b00000001, 0b01110100, 0b10010100, 0b10010000, 0b00111001, 0b10001010, 0b00010010, 0b10110010, 0b01101110, 0b10111001, 0b10110110, 0b01011101, 0b00000110, 0b11100001, 0b10100110, 0b11010010, 0b01011101, 0b01110101, 0b10111111, 0b01011110, 0b00100110, 0b10010010, 0b01000101, 0b00001100, 0b11001110, 0b00011001, 0b01011001, 0b11101100, 0b01001111, 0b01001111, 0b01000000, 0b10011000, 0b00000011, 0b00100100, 0b11111111, 0b10101110, 0b11001001, 0b01101011, 0b11101010, 0b01111100, 0b11000010, 0b11001010, 0b01111101, 0b10000101, 0b00100110, 0b10001000, 0b10100000, 0b10010010, 0b00100010, 0b11110011, 0b11001110, 0b11011011, 0b10100001, 0b11101001, 0b10011001, 0b01110111, 0b10111011, 0b00001001, 0b10010100, 0b00101010, 0b11000100, 0b11011101, 0b11010000, 0b01110010, 0b10010011, 0b00100001, 0b10001111, 0b11011011, 0b11001101, 0b00100111, 0b10101010, 0b00010100, 0b10110011, 0b10010100, 0b11000010, 0b01100000, 0b01000101, 0b00111101, 0b10000101, 0b01000110, 0b00100011, 0b00110001, 0b00000110, 0b01001111, 0b10010000, 0b11110010], # Node 206
-[0b01111001, 0b00100000, 0b11000101, 0b01100000, 0b11111101, 0b11111111, 0b11101111, 0b11011000, 0b11111111, 0b11111111, 0b00111101, 0b11111111, 0b11111111, 0b00111111, 0b11111101, 0b11111111, 0b11111111, 0b10101100, 0b11111111, 0b11111111, 0b01011111, 0b00000001, 0b10101000, 0b00011101, 0b00001000, 0b00000001, 0b00000000, 0b11010000, 0b01010011, 0b00110000, 0b00000000, 0b00110100, 0b11111111, 0b00000000, 0b10000100, 0b11110000, 0b00000111, 0b11000000, 0b00001000, 0b11011011, 0b00000100, 0b11011111, 0b00010010, 0b11100000, 0b11110010, 0b00011011, 0b00000000, 0b11111111, 0b00011110, 0b00001111, 0b11110000, 0b10100001, 0b01000001, 0b00000000, 0b00001111, 0b00100110, 0b00000001, 0b11111100, 0b01100000, 0b01111010, 0b11100000, 0b00000111, 0b00000001, 0b00000000, 0b01111111, 0b11111110, 0b00011110, 0b11111000, 0b11111111, 0b01001110, 0b11110000, 0b11111111, 0b01111111, 0b01100000, 0b11111111, 0b11111111, 0b00000111, 0b11101100, 0b11111111, 0b00111111, 0b00000010, 0b00100000, 0b11011111, 0b11100001, 0b00000100, 0b10000000, 0b00101111, 0b01100110, 0b00000000, 0b00111000, 0b00111000, 0b00001111, 0b00000000, 0b10000000, 0b01101100, 0b00110100, 0b00011101, 0b00110101], # Node 207
-[0b11000011, 0b01000101, 0b01001000, 0b10100001, 0b10101001, 0b00100001, 0b00010000, 0b00011111, 0b10011001, 0b01100001, 0b01010011, 0b00010111, 0b00100010, 0b01000101, 0b00000000, 0b00110111, 0b00011011, 0b00100001, 0b01001111, 0b11000100, 0b00000101, 0b00101110, 0b11011011, 0b01000001, 0b10011001, 0b11110100, 0b00001100, 0b01000100, 0b11011101, 0b01001101, 0b10101101, 0b10100010, 0b01001000, 0b11010000, 0b10011111, 0b01110000, 0b00010000, 0b01100000, 0b00110001, 0b10001000, 0b01101000, 0b01010010, 0b00011101, 0b00100100, 0b00010010, 0b00010100, 0b11111011, 0b10001101, 0b01000001, 0b10000111, 0b00111111, 0b10101100, 0b00101111, 0b10101110, 0b11010100, 0b11101010, 0b01101110, 0b00101100, 0b01000110, 0b10010111, 0b00100110, 0b11111100, 0b10010000, 0b11000111, 0b00110000, 0b10000111, 0b01100100, 0b11111001, 0b10110100, 0b00000011, 0b10000000, 0b00101100, 0b00000011, 0b01000010, 0b11011110, 0b01000011, 0b11101100, 0b00100010, 0b11101100, 0b10000101, 0b00001110, 0b01011010, 0b00100011, 0b00001000, 0b00010101, 0b00110101, 0b10000001, 0b00000100, 0b01101111, 0b00001100, 0b01101100, 0b10000101, 0b10100000, 0b01111100, 0b00111000, 0b00010011, 0b00100110, 0b01100010], # Node 208
-[0b10000001, 0b00001000, 0b11100000, 0b10000000, 0b00010000, 0b10011010, 0b10000000, 0b10001000, 0b00100011, 0b10101100, 0b10001000, 0b00001101, 0b00000010, 0b01000101, 0b00010100, 0b00000001, 0b00100001, 0b00100000, 0b00010010, 0b01000010, 0b01001110, 0b00100000, 0b00000000, 0b01000100, 0b11101001, 0b11001011, 0b10011101, 0b01100001, 0b01110000, 0b11001000, 0b00110011, 0b01100010, 0b11000101, 0b10000110, 0b11000000, 0b01010101, 0b11000100, 0b11101010, 0b01000000, 0b10000010, 0b11011111, 0b01100011, 0b10101111, 0b01111000, 0b10000101, 0b10100010, 0b00000100, 0b00111110, 0b00110000, 0b01001010, 0b01101000, 0b10100001, 0b00011011, 0b00001100, 0b01010111, 0b01100000, 0b01000011, 0b00000100, 0b00000000, 0b00011101, 0b00001100, 0b10000001, 0b10000000, 0b11000010, 0b00001000, 0b00000011, 0b00010110, 0b00111000, 0b00000000, 0b10000000, 0b10101110, 0b00000010, 0b00001001, 0b00111000, 0b10010101, 0b01000001, 0b00000000, 0b01001110, 0b11010000, 0b01000101, 0b11000001, 0b11100001, 0b01001001, 0b11011000, 0b01001000, 0b00100000, 0b11001110, 0b00010010, 0b11001111, 0b10011000, 0b00000111, 0b01100100, 0b00101001, 0b00000111, 0b10010110, 0b00101011, 0b10100100, 0b00100000], # Node 209
-[0b10000010, 0b00000000, 0b00000001, 0b01101100, 0b10101111, 0b01000110, 0b10100001, 0b00010010, 0b00000000, 0b00010100, 0b00010000, 0b10011100, 0b01010001, 0b10101010, 0b00011000, 0b01001010, 0b00001011, 0b00000111, 0b10000110, 0b01011100, 0b00010111, 0b00010010, 0b11011100, 0b11111101, 0b00110001, 0b11000000, 0b01110101, 0b10001001, 0b10001100, 0b00011000, 0b00010110, 0b11010100, 0b00000100, 0b01100000, 0b00010000, 0b00110011, 0b00100000, 0b00000010, 0b01110001, 0b00000001, 0b00111100, 0b00000000, 0b00001010, 0b10100000, 0b00100011, 0b00001000, 0b00010011, 0b01001100, 0b00001010, 0b10001100, 0b11011100, 0b00000111, 0b10001000, 0b01010000, 0b01101111, 0b00001010, 0b00000010, 0b10110000, 0b11101000, 0b11010110, 0b11000000, 0b00110110, 0b00111001, 0b00000001, 0b00000110, 0b01000011, 0b10011000, 0b01110100, 0b01110000, 0b00100110, 0b10110001, 0b00000011, 0b11101001, 0b01000000, 0b00111111, 0b10000100, 0b01010100, 0b00010000, 0b11101101, 0b10000000, 0b01000000, 0b01110000, 0b00000101, 0b00100001, 0b00000010, 0b01001001, 0b00100001, 0b01001000, 0b10001011, 0b00000001, 0b10100010, 0b10100000, 0b11101000, 0b01010000, 0b01000000, 0b01100000, 0b00000011, 0b00010100], # Node 210
-[0b00000100, 0b00010000, 0b10100010, 0b10100001, 0b10011000, 0b00110000, 0b00100011, 0b00001001, 0b10100011, 0b11000000, 0b10011101, 0b00000010, 0b00100000, 0b00110000, 0b00001001, 0b00000000, 0b11010000, 0b00110010, 0b01110000, 0b00000010, 0b00000101, 0b01010000, 0b01100000, 0b10100001, 0b00000000, 0b01011110, 0b00001111, 0b11010010, 0b01110111, 0b11111111, 0b10000001, 0b00110010, 0b11000101, 0b00111111, 0b11100000, 0b11100000, 0b11111010, 0b00100001, 0b00111001, 0b11000010, 0b00000101, 0b01011010, 0b00000000, 0b00110010, 0b00000000, 0b00111111, 0b00000011, 0b00100000, 0b00010000, 0b01100010, 0b01000010, 0b01000010, 0b10101100, 0b01101000, 0b01111110, 0b01100100, 0b11000001, 0b11111000, 0b01000111, 0b01001001, 0b11000001, 0b00011111, 0b01000000, 0b00000000, 0b11110010, 0b11100111, 0b00010100, 0b11000011, 0b01101110, 0b10101100, 0b00101011, 0b00010000, 0b00010000, 0b10010000, 0b00000010, 0b00000000, 0b10101110, 0b01101100, 0b00000000, 0b11110100, 0b10000000, 0b00100000, 0b11100000, 0b10001000, 0b10000100, 0b00010000, 0b00100011, 0b10110001, 0b10101000, 0b01100001, 0b00001000, 0b01001001, 0b10000000, 0b01000110, 0b01101000, 0b00001001, 0b10001110, 0b10001011], # Node 211
-[0b00111000, 0b11011110, 0b11101001, 0b00101010, 0b00111011, 0b11101111, 0b00101001, 0b01110111, 0b11010010, 0b00110101, 0b00010101, 0b10001110, 0b00010000, 0b01111001, 0b01110000, 0b11101010, 0b01100100, 0b01111010, 0b00100110, 0b11011001, 0b10101110, 0b11110010, 0b10101111, 0b01100100, 0b11100111, 0b10000111, 0b10001111, 0b01110110, 0b00101000, 0b01001010, 0b10001011, 0b01011101, 0b01011110, 0b01110111, 0b11101000, 0b11111000, 0b10110111, 0b00010010, 0b10101101, 0b11011011, 0b00001101, 0b01110101, 0b00100110, 0b01010110, 0b10001101, 0b00110111, 0b01010110, 0b11101011, 0b10111101, 0b01010011, 0b10101000, 0b10010011, 0b10110011, 0b11000111, 0b11000011, 0b00010100, 0b00110011, 0b00111100, 0b01001110, 0b11001110, 0b00110110, 0b11001000, 0b01101110, 0b10111110, 0b10001101, 0b01111110, 0b01110111, 0b10101011, 0b01101101, 0b11011000, 0b00011010, 0b10011101, 0b10001100, 0b11101111, 0b10001010, 0b11111101, 0b11100101, 0b01100011, 0b11010111, 0b01011010, 0b10000110, 0b11101101, 0b00011010, 0b01111111, 0b11000011, 0b10111000, 0b10100110, 0b00110111, 0b11101100, 0b11110011, 0b11100101, 0b00011110, 0b11101110, 0b10100010, 0b11000000, 0b01101010, 0b00111001, 0b00110001], # Node 212
-[0b11011010, 0b10111110, 0b01110111, 0b01011000, 0b00100101, 0b01000001, 0b10010100, 0b11010101, 0b10000100, 0b00000100, 0b00011011, 0b10100101, 0b00101000, 0b10001110, 0b01001100, 0b00110100, 0b01000000, 0b00000000, 0b11100010, 0b00010110, 0b10110000, 0b00010000, 0b01100001, 0b10000000, 0b10101000, 0b10000100, 0b10010101, 0b00000001, 0b10000100, 0b10111011, 0b00100011, 0b10101111, 0b01100010, 0b01011000, 0b11001110, 0b00000111, 0b00010000, 0b00111000, 0b01010010, 0b10000000, 0b11101010, 0b10111010, 0b01001010, 0b01010001, 0b10000001, 0b00010010, 0b01011011, 0b01001010, 0b10101111, 0b10000111, 0b11001100, 0b00100010, 0b11101110, 0b10001010, 0b01110010, 0b00100001, 0b10101000, 0b10010010, 0b00101101, 0b10001000, 0b10100011, 0b10000101, 0b10101010, 0b01001100, 0b10010000, 0b01110010, 0b11001001, 0b00100111, 0b11010110, 0b10100001, 0b00000000, 0b11110000, 0b01010111, 0b01001001, 0b01101111, 0b00001101, 0b00001100, 0b10100110, 0b00110101, 0b10111101, 0b11101011, 0b10000110, 0b10100011, 0b10010000, 0b00101111, 0b10011001, 0b01100011, 0b00101000, 0b11101101, 0b11100011, 0b01100101, 0b11110100, 0b01000110, 0b00001010, 0b00000101, 0b00010010, 0b00000000, 0b01111010], # Node 213
-[0b10101110, 0b01000111, 0b11011111, 0b00010111, 0b10101010, 0b01100000, 0b11011011, 0b01101110, 0b00110011, 0b11111010, 0b10110011, 0b11011001, 0b01001001, 0b11010110, 0b00001111, 0b01001111, 0b10100001, 0b01010110, 0b10000111, 0b10010010, 0b10001010, 0b00010101, 0b00011010, 0b11100010, 0b10101001, 0b00001011, 0b11001010, 0b10111100, 0b01011010, 0b11110100, 0b10000100, 0b10111111, 0b10111000, 0b00001000, 0b10101010, 0b00000011, 0b01110101, 0b01100110, 0b10111101, 0b11111110, 0b11101110, 0b10000010, 0b11000000, 0b00101000, 0b10111000, 0b00111001, 0b00111101, 0b11001111, 0b01110101, 0b11110111, 0b11110001, 0b11100111, 0b00011101, 0b00010110, 0b10000000, 0b11110100, 0b00111111, 0b11001011, 0b10101000, 0b01111110, 0b00011101, 0b00100010, 0b10010111, 0b01011011, 0b11111011, 0b00100010, 0b01110111, 0b11101000, 0b10110111, 0b11101111, 0b11111111, 0b10011011, 0b11100100, 0b10100101, 0b10110101, 0b11101010, 0b11111001, 0b11001101, 0b00111111, 0b11010001, 0b11011111, 0b11101010, 0b11001001, 0b11111100, 0b00111100, 0b01110000, 0b11110101, 0b01101100, 0b01001010, 0b11111111, 0b11111111, 0b01001001, 0b01110001, 0b10111111, 0b10110001, 0b10111101, 0b00100000, 0b00001101], # Node 214
-[0b10100101, 0b01000010, 0b00111000, 0b11001001, 0b01111010, 0b10011111, 0b01100101, 0b10110100, 0b00110010, 0b01000010, 0b00010100, 0b00101011, 0b01101100, 0b11001001, 0b10101100, 0b00100111, 0b01001001, 0b01001111, 0b10110001, 0b11011111, 0b01110001, 0b00101001, 0b00100010, 0b00110100, 0b01100100, 0b01101010, 0b00111010, 0b00100101, 0b00110110, 0b00000010, 0b00000101, 0b00000011, 0b00000001, 0b11010010, 0b10010110, 0b01000100, 0b10001100, 0b01100011, 0b00100000, 0b00110100, 0b00101001, 0b11010010, 0b11110011, 0b00011100, 0b00000010, 0b10100011, 0b01101101, 0b00110111, 0b11100101, 0b00010101, 0b00111010, 0b00000000, 0b01001100, 0b11010100, 0b01000000, 0b10000111, 0b00000011, 0b10011001, 0b00011101, 0b01001000, 0b11111000, 0b11010101, 0b00000010, 0b01000001, 0b10001001, 0b10110011, 0b00101110, 0b00110100, 0b10100101, 0b01101011, 0b00001000, 0b00110011, 0b10101110, 0b01000000, 0b11000011, 0b11000010, 0b01101001, 0b01110100, 0b10100100, 0b11111010, 0b11100110, 0b11101000, 0b11011111, 0b10100001, 0b10010001, 0b11111110, 0b00011001, 0b01000000, 0b00000000, 0b01100001, 0b11100001, 0b00001001, 0b10001100, 0b00110100, 0b00010101, 0b01010011, 0b11010000, 0b10010001], # Node 215
-[0b00011010, 0b01000110, 0b11111111, 0b11001010, 0b10000000, 0b11010001, 0b01000000, 0b00110100, 0b00000000, 0b10000000, 0b01011100, 0b11010110, 0b00100101, 0b00010000, 0b11111100, 0b00011111, 0b00000100, 0b10101010, 0b00011111, 0b10010111, 0b10000000, 0b11111110, 0b10110001, 0b00000110, 0b11100000, 0b10111111, 0b11100000, 0b10000000, 0b11111111, 0b11011111, 0b00001111, 0b11100000, 0b00001111, 0b11111110, 0b00000001, 0b01111110, 0b11100000, 0b11111111, 0b11101000, 0b00000001, 0b11111100, 0b00001111, 0b00011111, 0b00011000, 0b11111110, 0b11001001, 0b11100000, 0b00000000, 0b10011100, 0b00100111, 0b00000010, 0b11110100, 0b01101101, 0b00101110, 0b11000000, 0b00011111, 0b01111101, 0b00000000, 0b11111110, 0b11101101, 0b00010011, 0b11110000, 0b00001111, 0b00101101, 0b00000001, 0b11101111, 0b11100000, 0b00110111, 0b10101000, 0b01000001, 0b11111110, 0b11100100, 0b00001101, 0b11101000, 0b10000111, 0b01001111, 0b10000000, 0b11101111, 0b11111100, 0b00000011, 0b11011000, 0b11101101, 0b01111111, 0b01000000, 0b11111010, 0b11111111, 0b00000001, 0b00110000, 0b11111111, 0b01011111, 0b11100000, 0b11011110, 0b11111111, 0b10001111, 0b00101101, 0b11011101, 0b11111111, 0b01100000], # Node 216
-[0b10111110, 0b01111111, 0b11110101, 0b10011111, 0b10111110, 0b01111101, 0b11111110, 0b01101111, 0b11101001, 0b11011111, 0b10111111, 0b11111000, 0b11101111, 0b11101110, 0b11101011, 0b11100010, 0b10011011, 0b01011111, 0b11010110, 0b00100100, 0b10010001, 0b11111111, 0b10010011, 0b01010011, 0b11011010, 0b01001111, 0b01000000, 0b10100101, 0b11111111, 0b11001101, 0b01110010, 0b11110110, 0b10010000, 0b10110100, 0b10010000, 0b11011111, 0b11100011, 0b10011101, 0b11101100, 0b00111111, 0b11111000, 0b10110111, 0b11110011, 0b01000010, 0b11011111, 0b10110011, 0b00000100, 0b01110000, 0b11111111, 0b10011011, 0b01000001, 0b11100101, 0b10101111, 0b00101111, 0b11100100, 0b10100101, 0b11111110, 0b00011100, 0b10111011, 0b01110011, 0b11010111, 0b00110011, 0b01010101, 0b01100000, 0b11101110, 0b10110001, 0b01111110, 0b11001110, 0b10001101, 0b11111111, 0b01110010, 0b10111101, 0b10110010, 0b01001111, 0b01000111, 0b11000110, 0b01101111, 0b00110111, 0b00100010, 0b10101000, 0b11110110, 0b00111101, 0b11110000, 0b11010110, 0b01111101, 0b00010110, 0b11111010, 0b10000001, 0b11011111, 0b11110111, 0b11111011, 0b10011111, 0b11001010, 0b11111110, 0b11111001, 0b11001111, 0b01111011, 0b10100000], # Node 217
-[0b11011011, 0b11101111, 0b11010101, 0b10100010, 0b11110111, 0b00101101, 0b00100101, 0b11101111, 0b01111111, 0b00100100, 0b11110011, 0b01111101, 0b10110011, 0b10110011, 0b01110010, 0b10101010, 0b00110110, 0b10100011, 0b00111011, 0b00101100, 0b00101001, 0b10110011, 0b01111111, 0b11111111, 0b10010001, 0b11111111, 0b10001001, 0b01110011, 0b11111111, 0b11110101, 0b10100110, 0b11111000, 0b10111111, 0b11111000, 0b11011101, 0b11110001, 0b10110001, 0b11101111, 0b11000001, 0b10001111, 0b10111011, 0b01111101, 0b00011101, 0b01110100, 0b01010000, 0b00111001, 0b00011101, 0b00000100, 0b11111111, 0b00010100, 0b00100100, 0b11111110, 0b10111101, 0b01000010, 0b11011010, 0b11110010, 0b01010000, 0b00001100, 0b01010001, 0b11001110, 0b10100101, 0b10011011, 0b01011100, 0b01010111, 0b00111011, 0b10000000, 0b00110111, 0b11110110, 0b11000001, 0b11110111, 0b00000101, 0b00010110, 0b11011010, 0b11100111, 0b10010011, 0b01101011, 0b10110111, 0b01001001, 0b00100001, 0b11100100, 0b11001010, 0b10011111, 0b11100111, 0b10111111, 0b11101001, 0b00101111, 0b10100000, 0b10100100, 0b11110110, 0b10101100, 0b01011111, 0b01100111, 0b01100111, 0b11000001, 0b11011001, 0b11111110, 0b00010100, 0b11001110], # Node 218
-[0b00000010, 0b11000001, 0b00000000, 0b00100000, 0b01101000, 0b10100000, 0b10100110, 0b00000110, 0b10000111, 0b10011000, 0b01101001, 0b00000000, 0b10100000, 0b00001100, 0b00000001, 0b00000000, 0b00010100, 0b00000000, 0b00000001, 0b11001100, 0b00110100, 0b00110000, 0b11010001, 0b00010011, 0b00001000, 0b10101100, 0b11101111, 0b11101101, 0b00110001, 0b11111110, 0b01111111, 0b10000110, 0b10100000, 0b11111111, 0b00101001, 0b00001001, 0b11111001, 0b00001111, 0b00000110, 0b00000000, 0b11111000, 0b01000000, 0b00001001, 0b00000100, 0b00000110, 0b10101000, 0b01000000, 0b01000000, 0b00000110, 0b00000000, 0b00010011, 0b00011010, 0b11101000, 0b00100110, 0b11001000, 0b00000011, 0b00101000, 0b00001100, 0b00111110, 0b01010000, 0b10000001, 0b10111000, 0b00000010, 0b01100101, 0b10010000, 0b00000100, 0b00100000, 0b01000110, 0b00000110, 0b00100001, 0b11010010, 0b00011111, 0b00001000, 0b10110100, 0b11111101, 0b10100010, 0b00001110, 0b01110000, 0b11001110, 0b11010110, 0b00100000, 0b01001000, 0b00011001, 0b01001011, 0b00010110, 0b00101111, 0b00001010, 0b00100001, 0b01000011, 0b10000010, 0b00010000, 0b01010011, 0b00001110, 0b00110000, 0b00110000, 0b01000000, 0b00110100, 0b00001100], # Node 219
-[0b10001111, 0b00000010, 0b11001111, 0b00101010, 0b00000100, 0b00000001, 0b01000100, 0b11010010, 0b01000110, 0b01100110, 0b01010010, 0b00110000, 0b10100101, 0b00010101, 0b00010001, 0b00110010, 0b00101111, 0b10010101, 0b11000000, 0b00010011, 0b10001000, 0b10111111, 0b00000111, 0b10011111, 0b01100101, 0b10110111, 0b00010101, 0b01110101, 0b11110000, 0b00001001, 0b10000001, 0b10000010, 0b00001010, 0b01011110, 0b01001100, 0b01100111, 0b10010011, 0b11011001, 0b10010000, 0b11011100, 0b01110111, 0b00011000, 0b01011001, 0b01000001, 0b00011001, 0b01100010, 0b10100101, 0b00011100, 0b00010101, 0b01001000, 0b11011101, 0b00010100, 0b00011100, 0b11111101, 0b11101101, 0b10100101, 0b11101100, 0b11100010, 0b00101111, 0b11101110, 0b01000100, 0b11111101, 0b00000101, 0b11101000, 0b01100101, 0b01110001, 0b10011101, 0b11100100, 0b00100100, 0b11010101, 0b00001100, 0b11010000, 0b01111101, 0b01001111, 0b01010010, 0b00011110, 0b00010111, 0b01110111, 0b00011111, 0b00100010, 0b00001100, 0b10100001, 0b01000100, 0b01111101, 0b10011110, 0b01011110, 0b10100010, 0b01100100, 0b11101101, 0b11011000, 0b00100000, 0b00001101, 0b10010001, 0b00001010, 0b01010100, 0b00010100, 0b00000100, 0b11000011], # Node 220
-[0b11110000, 0b10101110, 0b01000000, 0b01101101, 0b10011000, 0b01011010, 0b01011101, 0b11110001, 0b10010001, 0b00001111, 0b01011111, 0b11111101, 0b00001011, 0b01101110, 0b10001100, 0b10011111, 0b01101101, 0b11111111, 0b01001111, 0b00110011, 0b10110100, 0b11101101, 0b01110011, 0b10100000, 0b10010001, 0b10011101, 0b01110011, 0b00100110, 0b01001011, 0b10000111, 0b01010100, 0b11011000, 0b01011001, 0b10101100, 0b11011111, 0b10101110, 0b11010011, 0b10011100, 0b00101011, 0b01000000, 0b10000110, 0b01010110, 0b01000100, 0b10111000, 0b10111100, 0b01100101, 0b00111111, 0b01001000, 0b10111110, 0b10011011, 0b01100100, 0b11011110, 0b10111101, 0b01011111, 0b01000110, 0b10110101, 0b00010011, 0b00101111, 0b10010011, 0b00011010, 0b11110011, 0b00101100, 0b01101110, 0b00100110, 0b11100010, 0b11001010, 0b10111011, 0b10110010, 0b01011001, 0b01110000, 0b10110101, 0b01011000, 0b11011010, 0b10111010, 0b00111101, 0b11001001, 0b11101110, 0b11000111, 0b00110111, 0b01111110, 0b11011011, 0b01111100, 0b11000111, 0b10000100, 0b11011001, 0b11110111, 0b01100001, 0b00011000, 0b01111001, 0b00101101, 0b01111011, 0b01101111, 0b01001101, 0b11101101, 0b01111110, 0b10011101, 0b10010000, 0b11011001], # Node 221
-[0b10011101, 0b10000100, 0b00011001, 0b01110110, 0b00110110, 0b11100101, 0b00111110, 0b00100010, 0b01000000, 0b11000010, 0b01101000, 0b01011010, 0b11101000, 0b01000100, 0b01010100, 0b00010000, 0b01100000, 0b00000000, 0b01111101, 0b00000010, 0b11000000, 0b01000000, 0b11010011, 0b01000111, 0b00010101, 0b11010101, 0b01011001, 0b10001001, 0b00010000, 0b01110000, 0b00100111, 0b00001101, 0b00001100, 0b10100110, 0b10101111, 0b11100100, 0b00001101, 0b00100101, 0b01000111, 0b01110101, 0b11010111, 0b01110011, 0b00101100, 0b01000010, 0b10001100, 0b01000000, 0b11101000, 0b11100101, 0b00110101, 0b11011010, 0b11111101, 0b10100000, 0b01000101, 0b10110001, 0b00100101, 0b01001110, 0b00111101, 0b01011100, 0b11110101, 0b10000011, 0b01111001, 0b01011010, 0b10110000, 0b00011000, 0b00110110, 0b01010000, 0b00001010, 0b11011011, 0b10010000, 0b10110000, 0b11010000, 0b00111010, 0b01101011, 0b10111000, 0b00000001, 0b01011100, 0b11111000, 0b10110000, 0b00101100, 0b10011110, 0b00011001, 0b10001000, 0b11010111, 0b11010000, 0b00010010, 0b01001101, 0b11001110, 0b01001101, 0b10100010, 0b00101100, 0b00101100, 0b11111001, 0b00101001, 0b01010000, 0b10000001, 0b10100110, 0b00100100, 0b10100000], # Node 222
-[0b00000000, 0b01000000, 0b00000001, 0b00000101, 0b00000000, 0b00000000, 0b10010000, 0b00000010, 0b00111000, 0b00110100, 0b00000010, 0b00010010, 0b11000000, 0b00000000, 0b00011100, 0b00000100, 0b10101100, 0b00000000, 0b10001010, 0b01101111, 0b00000001, 0b00010000, 0b10111100, 0b00111110, 0b00001001, 0b01000100, 0b11001101, 0b00100011, 0b10000011, 0b10011111, 0b00101111, 0b10000000, 0b10011110, 0b11100000, 0b00010010, 0b00000100, 0b00100110, 0b00111011, 0b00001001, 0b10011011, 0b01010100, 0b01011001, 0b01100000, 0b00101110, 0b01011100, 0b10001001, 0b10011100, 0b10110110, 0b00100110, 0b00100000, 0b00000001, 0b01011101, 0b00000001, 0b10110010, 0b10000000, 0b10000111, 0b11000011, 0b00010010, 0b01111000, 0b00010000, 0b01101111, 0b10010001, 0b00001010, 0b01100001, 0b00001011, 0b00011110, 0b00010000, 0b01010110, 0b01000101, 0b10000000, 0b01100000, 0b00111110, 0b10010111, 0b11000000, 0b11100000, 0b01111110, 0b00000000, 0b00000101, 0b11000110, 0b00001111, 0b00000100, 0b01100000, 0b10101100, 0b10100000, 0b00000100, 0b00110100, 0b00100000, 0b00000001, 0b00010100, 0b00001000, 0b00000000, 0b01000000, 0b00011001, 0b10100000, 0b10000000, 0b00000000, 0b10100100, 0b00100010], # Node 223
-[0b00010110, 0b01000111, 0b00001101, 0b00000001, 0b00110011, 0b01000000, 0b00111101, 0b10111000, 0b00010010, 0b10101000, 0b00111010, 0b00101110, 0b00010001, 0b00000011, 0b01101010, 0b01100100, 0b01110001, 0b10110111, 0b00001011, 0b10000100, 0b11000100, 0b00001001, 0b00011110, 0b00101100, 0b11011001, 0b00110000, 0b10011011, 0b00011101, 0b11010110, 0b10100111, 0b00111011, 0b10110100, 0b00010100, 0b11101000, 0b10011100, 0b11111010, 0b00010001, 0b10001011, 0b10100101, 0b11001100, 0b11100101, 0b01000010, 0b11110010, 0b01011000, 0b11011100, 0b11000000, 0b01011001, 0b11011101, 0b00010001, 0b00100001, 0b00100111, 0b00011010, 0b00100001, 0b01110110, 0b11111110, 0b00100011, 0b00001001, 0b11000111, 0b01100001, 0b01000011, 0b10100000, 0b00011010, 0b11001100, 0b01001111, 0b11100011, 0b10001000, 0b10110100, 0b00000001, 0b00111000, 0b00100100, 0b11100100, 0b10101010, 0b11111100, 0b00110001, 0b00001000, 0b11110000, 0b00111110, 0b10110010, 0b11010001, 0b11111100, 0b00010010, 0b00100101, 0b10101011, 0b00010111, 0b00000110, 0b00010110, 0b10001101, 0b00010110, 0b00000110, 0b00000010, 0b01000011, 0b01000000, 0b01100001, 0b10000010, 0b10000101, 0b10000001, 0b00001101, 0b00000100], # Node 224
-[0b01111111, 0b11000001, 0b01001011, 0b10010011, 0b11110111, 0b01100111, 0b11111111, 0b01101001, 0b10101101, 0b11100111, 0b01111111, 0b10110010, 0b11111011, 0b10110110, 0b00011011, 0b11111100, 0b11110011, 0b10111011, 0b11111001, 0b11110100, 0b11000011, 0b10100111, 0b10000110, 0b00101000, 0b11111110, 0b00011101, 0b00110000, 0b01001010, 0b01111101, 0b01001111, 0b11100011, 0b11100100, 0b01000010, 0b01010100, 0b01111111, 0b11011111, 0b00011000, 0b10011010, 0b01100101, 0b00000000, 0b10000111, 0b01111110, 0b01101101, 0b01110000, 0b10010010, 0b11111101, 0b00000111, 0b11101111, 0b10101011, 0b01011111, 0b11111000, 0b10001001, 0b11110000, 0b10100001, 0b00111111, 0b11001100, 0b00111111, 0b10101100, 0b10001100, 0b00101110, 0b01100011, 0b01000101, 0b11101101, 0b01111101, 0b00011110, 0b10001110, 0b11001110, 0b01110011, 0b11100010, 0b01110010, 0b00010011, 0b10011111, 0b00000011, 0b01010101, 0b11110011, 0b01111111, 0b11011000, 0b11010101, 0b11110100, 0b01001111, 0b11110111, 0b00111110, 0b01000111, 0b10001110, 0b11011101, 0b01000001, 0b10111000, 0b00101111, 0b11110111, 0b10101111, 0b01101100, 0b01111101, 0b11101011, 0b01011101, 0b00101110, 0b11110111, 0b00110111, 0b11011101], # Node 225
-[0b10011000, 0b00000100, 0b10010000, 0b00011001, 0b10011010, 0b11110100, 0b00001110, 0b01111000, 0b01111110, 0b01000010, 0b00000000, 0b10011100, 0b10001001, 0b01000001, 0b00110001, 0b00100011, 0b11100010, 0b00110100, 0b00101000, 0b01001010, 0b01011001, 0b10010100, 0b00001101, 0b00101010, 0b01001100, 0b11111100, 0b11111101, 0b11000000, 0b00010000, 0b11100010, 0b10101001, 0b00000000, 0b11100100, 0b00001111, 0b01100010, 0b00101110, 0b00001011, 0b11001010, 0b01000000, 0b00001100, 0b11110100, 0b10000110, 0b11010100, 0b11100010, 0b00100010, 0b11100000, 0b01010101, 0b10010101, 0b00100001, 0b10010000, 0b11110000, 0b10101001, 0b10101000, 0b11101110, 0b11110010, 0b10001100, 0b01111010, 0b00111100, 0b00001100, 0b11000001, 0b11000110, 0b11000000, 0b01000001, 0b01000010, 0b00101000, 0b00000001, 0b00000000, 0b10011110, 0b11101000, 0b11001100, 0b01010100, 0b01011010, 0b00011001, 0b00000100, 0b10001010, 0b11110000, 0b11000100, 0b01110110, 0b00011010, 0b11100010, 0b00000000, 0b00000010, 0b00100010, 0b01110000, 0b10001001, 0b01110001, 0b01001100, 0b00001111, 0b01001100, 0b00000001, 0b10001110, 0b11010010, 0b00011100, 0b11000101, 0b00010000, 0b01001001, 0b00111010, 0b10100000], # Node 226
-[0b01111111, 0b01011101, 0b11011110, 0b00101011, 0b00001111, 0b11010100, 0b01110111, 0b01100101, 0b11110110, 0b00101101, 0b10110110, 0b10011001, 0b11010111, 0b11010010, 0b11101101, 0b11111000, 0b00111101, 0b11010000, 0b00010111, 0b11111110, 0b11011100, 0b10100100, 0b01111111, 0b11110010, 0b10100011, 0b11111010, 0b01000000, 0b11100001, 0b10010010, 0b00000010, 0b11101000, 0b10101101, 0b00011100, 0b01000010, 0b11111010, 0b11100100, 0b01011000, 0b00011100, 0b11110100, 0b01111100, 0b01101101, 0b10101111, 0b11011111, 0b01011001, 0b11111100, 0b11101010, 0b10010111, 0b11000101, 0b01111110, 0b11111111, 0b00001111, 0b11110000, 0b01011101, 0b11001110, 0b11111000, 0b01001111, 0b00100101, 0b00111111, 0b11001101, 0b10101100, 0b11101101, 0b11101001, 0b00111111, 0b00111111, 0b10111111, 0b00111101, 0b11001011, 0b10110011, 0b01110011, 0b10010110, 0b00001010, 0b11111111, 0b11001110, 0b11110000, 0b10010011, 0b01101110, 0b11110011, 0b10111111, 0b11011110, 0b11011101, 0b01111111, 0b11100110, 0b01100100, 0b11110111, 0b01001101, 0b10011110, 0b10010111, 0b00010011, 0b01010011, 0b11000110, 0b11100100, 0b11000000, 0b11001101, 0b10011100, 0b01011100, 0b00010011, 0b00011111, 0b10010011], # Node 227
-[0b00000110, 0b10101010, 0b10000000, 0b00110010, 0b01101001, 0b00000100, 0b00010011, 0b00100001, 0b10001011, 0b01100100, 0b10010110, 0b10110000, 0b01001011, 0b01101000, 0b11111100, 0b10000000, 0b10000111, 0b10010010, 0b00001000, 0b00110100, 0b11010100, 0b00010011, 0b11101000, 0b00100110, 0b00110001, 0b11000010, 0b01010111, 0b00010011, 0b00000010, 0b01011100, 0b01010000, 0b00001000, 0b11010011, 0b01000000, 0b11010011, 0b00010110, 0b00101001, 0b11101001, 0b00100101, 0b01011100, 0b00111001, 0b10100010, 0b01010100, 0b00000100, 0b01011110, 0b01100000, 0b01111101, 0b10110000, 0b00111000, 0b11000000, 0b11000111, 0b01000000, 0b11110010, 0b01101010, 0b01111011, 0b00010111, 0b11100001, 0b01111000, 0b10100010, 0b01101010, 0b10011011, 0b01011101, 0b01000000, 0b00010000, 0b11110001, 0b00000011, 0b11010111, 0b10110100, 0b10101100, 0b01000100, 0b00100011, 0b01010000, 0b10101101, 0b11100000, 0b10000101, 0b01010010, 0b01110001, 0b01100001, 0b10010011, 0b10111000, 0b10111010, 0b00000011, 0b11110001, 0b11011000, 0b00000001, 0b00001100, 0b00001110, 0b01011010, 0b11111101, 0b10101111, 0b10011101, 0b00111101, 0b01000000, 0b01010101, 0b11100110, 0b10110110, 0b00000011, 0b10101000], # Node 228
-[0b10111101, 0b11000011, 0b00111101, 0b11110111, 0b00010101, 0b11110101, 0b01111001, 0b10111101, 0b11111111, 0b10101101, 0b11001000, 0b01101010, 0b10010000, 0b01000110, 0b01111110, 0b11100101, 0b10111011, 0b00011011, 0b01011110, 0b11000011, 0b11011110, 0b01101110, 0b11111011, 0b11110010, 0b10110101, 0b10010111, 0b00101100, 0b01111110, 0b01100110, 0b00111011, 0b01111100, 0b01101111, 0b00110111, 0b00101010, 0b00110110, 0b01110110, 0b01101110, 0b11000001, 0b01111000, 0b01001100, 0b11111000, 0b11101011, 0b01100101, 0b10110101, 0b11111101, 0b01111011, 0b10101111, 0b11010011, 0b01011100, 0b01110111, 0b00110001, 0b01011111, 0b00010100, 0b00010001, 0b11110101, 0b11001101, 0b11101010, 0b00010001, 0b11010101, 0b11011010, 0b00101011, 0b11001110, 0b00000011, 0b10001000, 0b00100000, 0b10100001, 0b11110010, 0b01111000, 0b01100101, 0b10101100, 0b00111001, 0b00100000, 0b11011010, 0b11011010, 0b10001011, 0b11011010, 0b11001111, 0b11100101, 0b11111111, 0b00011011, 0b10100111, 0b01001101, 0b11000100, 0b10000001, 0b10101001, 0b01011111, 0b10110111, 0b11110110, 0b01111101, 0b10101011, 0b10010101, 0b10011111, 0b11010011, 0b10101011, 0b01000111, 0b10011000, 0b10001011, 0b10111111], # Node 229
-[0b00011111, 0b11011111, 0b11001011, 0b11011011, 0b01101111, 0b01101101, 0b11010101, 0b00100010, 0b11011111, 0b01010111, 0b01101101, 0b00110111, 0b10000000, 0b10111001, 0b11101101, 0b10011010, 0b11111000, 0b11110101, 0b01101111, 0b11001000, 0b11111111, 0b11010111, 0b00000001, 0b11010000, 0b11011111, 0b00001110, 0b11000000, 0b11111101, 0b11010111, 0b00000011, 0b01110100, 0b10011110, 0b00001111, 0b11101010, 0b01100011, 0b11001100, 0b11100000, 0b10111100, 0b01000110, 0b00000111, 0b10111000, 0b10000111, 0b00111100, 0b11110000, 0b11111110, 0b10001101, 0b00001010, 0b11001100, 0b00100111, 0b01101101, 0b00000001, 0b01111100, 0b11110000, 0b00000011, 0b01011001, 0b01010010, 0b11111111, 0b11000010, 0b00001111, 0b11101111, 0b00011111, 0b01111100, 0b10010100, 0b01110101, 0b11010001, 0b11000111, 0b10101011, 0b00000011, 0b01001101, 0b00011100, 0b01111110, 0b00001010, 0b10100110, 0b01111011, 0b00110111, 0b00000000, 0b11101110, 0b01111011, 0b00000011, 0b01000000, 0b01111101, 0b01111101, 0b11000010, 0b01110110, 0b11011101, 0b01100111, 0b10011001, 0b10111011, 0b10111111, 0b11011000, 0b01110011, 0b01111100, 0b11011110, 0b00111101, 0b11000111, 0b10001001, 0b10010001, 0b01111001], # Node 230
-[0b00101110, 0b11111101, 0b01110111, 0b01100010, 0b11110011, 0b00111101, 0b11010110, 0b10000011, 0b10110101, 0b00011101, 0b00010100, 0b01101010, 0b11011110, 0b01100111, 0b11110100, 0b10100101, 0b01111111, 0b11110111, 0b10010010, 0b10100111, 0b01100101, 0b11011011, 0b01101001, 0b01101001, 0b10101100, 0b00110101, 0b10011000, 0b00101101, 0b01010101, 0b01111111, 0b10111110, 0b10011101, 0b11111100, 0b01101100, 0b10101101, 0b00111000, 0b11101011, 0b11011110, 0b00000110, 0b11001011, 0b01001010, 0b00001001, 0b01101110, 0b01110111, 0b10001000, 0b01010101, 0b01100111, 0b11001110, 0b01000010, 0b00011011, 0b01110011, 0b10101001, 0b01001100, 0b00101101, 0b01010111, 0b10101000, 0b00011001, 0b01010011, 0b10011001, 0b10100101, 0b11001110, 0b11100100, 0b10110011, 0b01101000, 0b11000100, 0b10001101, 0b11011001, 0b00110111, 0b10101101, 0b11001100, 0b00111111, 0b01011011, 0b10000010, 0b11010001, 0b00001111, 0b11101111, 0b10011101, 0b00011011, 0b10101101, 0b10101011, 0b10111111, 0b11000101, 0b11001111, 0b11100010, 0b01001110, 0b11001111, 0b11001100, 0b00101010, 0b11100101, 0b01111111, 0b10000111, 0b11011110, 0b11000010, 0b10110101, 0b10101011, 0b11011110, 0b01110110, 0b00101111], # Node 231
-[0b11110111, 0b00111110, 0b01110111, 0b10110101, 0b10101001, 0b11010111, 0b11101011, 0b11110100, 0b10110101, 0b10111111, 0b11100100, 0b11110110, 0b00011111, 0b10010111, 0b01110111, 0b01111111, 0b01100011, 0b01111110, 0b11111100, 0b00000001, 0b01001111, 0b11111111, 0b00001111, 0b11010100, 0b01110111, 0b00011111, 0b00000010, 0b11011100, 0b11101110, 0b11111011, 0b11111001, 0b10111111, 0b10010101, 0b10111111, 0b10100011, 0b11110111, 0b10111100, 0b10010101, 0b01111111, 0b10000011, 0b11110111, 0b01100001, 0b11111111, 0b01110011, 0b00001111, 0b01101110, 0b10110101, 0b11111111, 0b11100001, 0b01111111, 0b11111011, 0b00011011, 0b01010011, 0b11110001, 0b11101111, 0b11000110, 0b10110111, 0b11111111, 0b11011001, 0b11111100, 0b10111000, 0b00111011, 0b11110000, 0b10011111, 0b01101110, 0b11011110, 0b10011110, 0b10111001, 0b01110001, 0b11100000, 0b00001111, 0b11111100, 0b11110001, 0b01011110, 0b10100010, 0b10011111, 0b11101110, 0b00111111, 0b01011000, 0b11111001, 0b11111100, 0b00100010, 0b01001100, 0b01101111, 0b11111111, 0b10000001, 0b11001010, 0b11110110, 0b10110110, 0b11111111, 0b11111111, 0b11001111, 0b11101110, 0b11111101, 0b11101101, 0b11111001, 0b11111100, 0b00110110], # Node 232
-[0b10111000, 0b10010000, 0b00011011, 0b01000110, 0b01000000, 0b00001000, 0b01001011, 0b11000001, 0b10010100, 0b01110100, 0b10110101, 0b00101100, 0b01010011, 0b11000000, 0b01011001, 0b00101101, 0b00110000, 0b10110100, 0b11100010, 0b01110110, 0b00001011, 0b01111000, 0b01011010, 0b01001000, 0b00110000, 0b00011000, 0b11000100, 0b01101000, 0b01001011, 0b01101101, 0b00101000, 0b10000000, 0b10100010, 0b01101010, 0b01101101, 0b11111111, 0b10110100, 0b11111000, 0b11000010, 0b00110000, 0b11000011, 0b10101001, 0b00000011, 0b11111010, 0b00011111, 0b11010010, 0b10110010, 0b11111000, 0b00010110, 0b00000101, 0b00111101, 0b10010000, 0b10001111, 0b01001100, 0b10011111, 0b00000001, 0b10000010, 0b10011101, 0b01101101, 0b10100110, 0b01111110, 0b11001001, 0b00010101, 0b11000011, 0b01110011, 0b11000111, 0b01000000, 0b11111110, 0b01101100, 0b01001100, 0b00101000, 0b00111000, 0b10011000, 0b01111001, 0b01100010, 0b10111111, 0b00111001, 0b01101001, 0b11110001, 0b01111001, 0b01111101, 0b11111100, 0b10001011, 0b10011010, 0b01011100, 0b10011010, 0b01101011, 0b00001001, 0b11011000, 0b10111101, 0b01001001, 0b01001001, 0b01101101, 0b01110000, 0b01100000, 0b01010001, 0b01100000, 0b00100101], # Node 233
-[0b01110110, 0b11010000, 0b01101110, 0b01110110, 0b10101110, 0b11111101, 0b11111101, 0b10101001, 0b11100101, 0b11011100, 0b11010010, 0b01011110, 0b00110100, 0b11110111, 0b11110000, 0b10111100, 0b10010000, 0b10010010, 0b10101111, 0b10110001, 0b11110110, 0b11111101, 0b10101011, 0b11100011, 0b01010110, 0b01000011, 0b01110000, 0b01110101, 0b01111110, 0b10111111, 0b01100101, 0b10111101, 0b01101011, 0b10110001, 0b11111111, 0b10101011, 0b11101011, 0b11001100, 0b11111000, 0b00001111, 0b01010001, 0b01111100, 0b10000010, 0b11111100, 0b01111000, 0b10111100, 0b00010011, 0b01000101, 0b11001010, 0b10100111, 0b00110100, 0b11000100, 0b00100100, 0b01010001, 0b00000101, 0b00111110, 0b10000111, 0b11100010, 0b10111111, 0b00100101, 0b00100110, 0b01000100, 0b10011100, 0b10110100, 0b01011110, 0b01111010, 0b10101111, 0b10111000, 0b11100000, 0b11101111, 0b00100111, 0b10110100, 0b01010110, 0b11101111, 0b11101011, 0b01100110, 0b10110011, 0b01010111, 0b11111001, 0b10001101, 0b11111101, 0b11011011, 0b01000111, 0b11011111, 0b11100111, 0b11110101, 0b10101011, 0b01011101, 0b00011111, 0b10010100, 0b00110001, 0b11111111, 0b10110010, 0b10111101, 0b01111100, 0b00100111, 0b01100001, 0b01011111], # Node 234
-[0b00110000, 0b00000000, 0b01001000, 0b00011001, 0b10101100, 0b10010100, 0b11000100, 0b00110000, 0b00111100, 0b00000011, 0b00100000, 0b10000001, 0b01110111, 0b00100110, 0b00110000, 0b00111110, 0b00110100, 0b00110000, 0b01111010, 0b00000001, 0b01000100, 0b01000000, 0b01000010, 0b00000000, 0b01010001, 0b00010110, 0b00100001, 0b00000000, 0b11100000, 0b00000000, 0b00001100, 0b00001100, 0b11100011, 0b10010101, 0b00011011, 0b00010000, 0b10001101, 0b11111100, 0b00100000, 0b11111010, 0b11000000, 0b00001111, 0b11100100, 0b00000111, 0b11111000, 0b01101111, 0b01111110, 0b00000000, 0b10111111, 0b11111000, 0b00000011, 0b11100000, 0b10000011, 0b00111110, 0b00000000, 0b00111111, 0b11100110, 0b00000011, 0b11111000, 0b11010001, 0b00111100, 0b10000000, 0b10011111, 0b11000000, 0b10000111, 0b11111110, 0b00010111, 0b01111110, 0b11101000, 0b10000011, 0b00000011, 0b10100111, 0b00101111, 0b00011000, 0b01000000, 0b10111100, 0b10000000, 0b10001100, 0b00000000, 0b00000011, 0b00001001, 0b00000100, 0b10001111, 0b10001010, 0b00000100, 0b00110110, 0b01000011, 0b10001001, 0b00000101, 0b00011010, 0b00110010, 0b00101101, 0b01000001, 0b01000000, 0b01110101, 0b00001010, 0b01101001, 0b00010101], # Node 235
-[0b01000000, 0b00010110, 0b01010101, 0b00111100, 0b10010111, 0b00101100, 0b10010001, 0b10111111, 0b10011110, 0b00111001, 0b00001011, 0b11100000, 0b01010101, 0b11101000, 0b11010101, 0b00010000, 0b01101000, 0b01101110, 0b01101000, 0b11001101, 0b01011010, 0b10010000, 0b00110110, 0b01110011, 0b10100001, 0b11110000, 0b01000100, 0b11010101, 0b00111001, 0b01011100, 0b11100100, 0b10000101, 0b00011100, 0b11110111, 0b01001101, 0b01110000, 0b11011100, 0b00110000, 0b10011001, 0b01101001, 0b01000100, 0b11101101, 0b11001000, 0b00111001, 0b00101010, 0b00101000, 0b10011100, 0b01000111, 0b01110101, 0b00001001, 0b01010001, 0b11101110, 0b01111010, 0b10100000, 0b11000110, 0b10111100, 0b10100011, 0b00101001, 0b11011000, 0b10000010, 0b00110111, 0b10000010, 0b10111110, 0b10010000, 0b01010010, 0b00011001, 0b01000110, 0b01110011, 0b01110111, 0b00010100, 0b10011011, 0b00000001, 0b10101100, 0b10000000, 0b11001001, 0b10101100, 0b00110100, 0b10001100, 0b10001111, 0b01010011, 0b00010001, 0b10101001, 0b00011010, 0b00000001, 0b10010000, 0b11010100, 0b00100101, 0b00110110, 0b00100000, 0b01000101, 0b10010101, 0b00010100, 0b01100001, 0b01101110, 0b11110110, 0b10110000, 0b10101101, 0b01011000], # Node 236
-[0b01010101, 0b11100011, 0b11110110, 0b10010111, 0b01110011, 0b00101100, 0b11111010, 0b11111110, 0b00101011, 0b01011111, 0b11011001, 0b11111101, 0b10000110, 0b10110101, 0b10001011, 0b00110100, 0b11100110, 0b10110011, 0b10100100, 0b00001101, 0b01111111, 0b00011011, 0b10001000, 0b10100001, 0b10001110, 0b10100111, 0b00111110, 0b11111110, 0b00111111, 0b11111111, 0b11101111, 0b01010111, 0b11100100, 0b01101111, 0b11000001, 0b10010111, 0b11111110, 0b01111000, 0b00011011, 0b10001101, 0b01001110, 0b11111011, 0b11101101, 0b00001110, 0b11011100, 0b11101010, 0b10101111, 0b00101000, 0b00011100, 0b00111111, 0b01000100, 0b11000111, 0b00000111, 0b00101111, 0b00011100, 0b11100101, 0b11100110, 0b01111111, 0b11011100, 0b11111001, 0b00111011, 0b10001010, 0b01001100, 0b01100001, 0b11101100, 0b10110001, 0b10011010, 0b10000110, 0b11111011, 0b11011111, 0b01111101, 0b10110100, 0b11011101, 0b10101111, 0b10000101, 0b01100001, 0b01101001, 0b10100110, 0b01100010, 0b01011000, 0b01100111, 0b10110110, 0b01000101, 0b10011101, 0b11110100, 0b01110101, 0b01001011, 0b10011111, 0b01011110, 0b10101110, 0b11001101, 0b10011111, 0b00110010, 0b01110101, 0b11010010, 0b11001110, 0b11010101, 0b10111101], # Node 237
-[0b10001011, 0b10011110, 0b01110101, 0b10110111, 0b10111111, 0b10101110, 0b11001011, 0b10010100, 0b01111100, 0b01011011, 0b00010010, 0b00101011, 0b10101110, 0b01100110, 0b00100010, 0b01011110, 0b10000111, 0b00101010, 0b11001100, 0b11001001, 0b00011110, 0b11101101, 0b00011110, 0b11110010, 0b10100111, 0b11001111, 0b01010010, 0b11011101, 0b00100000, 0b11100111, 0b11111011, 0b01000111, 0b11110010, 0b11001000, 0b10110010, 0b00000110, 0b11101011, 0b01111011, 0b10101101, 0b11100110, 0b10110101, 0b10111100, 0b10110011, 0b10101010, 0b00110110, 0b00010110, 0b00010111, 0b10101010, 0b11101111, 0b01010001, 0b10011001, 0b10111110, 0b11011111, 0b01001110, 0b11000101, 0b10110001, 0b01011111, 0b01010011, 0b11111110, 0b10111001, 0b00111101, 0b00111110, 0b11011010, 0b11101100, 0b10001101, 0b00101011, 0b10111110, 0b10110110, 0b01100101, 0b00111111, 0b11111101, 0b00110010, 0b11001000, 0b00111010, 0b11111111, 0b11101011, 0b11111110, 0b11111010, 0b10011100, 0b11010000, 0b10110011, 0b10111110, 0b11000001, 0b00100001, 0b10110101, 0b00111101, 0b10101010, 0b01111011, 0b00111010, 0b01110110, 0b11001101, 0b01011001, 0b01011111, 0b00100010, 0b11111011, 0b01100100, 0b10010110, 0b00100111], # Node 238
-[0b11101110, 0b01011101, 0b00010001, 0b10010101, 0b01101101, 0b01011111, 0b01100111, 0b01101011, 0b11100010, 0b11110111, 0b11111011, 0b11100110, 0b00011000, 0b01011100, 0b10111100, 0b01100001, 0b10011111, 0b00001001, 0b10001100, 0b00111001, 0b11111100, 0b01101011, 0b00100110, 0b11111110, 0b01111001, 0b11011001, 0b10100100, 0b10111010, 0b01110111, 0b10011001, 0b10111100, 0b11101100, 0b00011011, 0b11000110, 0b10111111, 0b01000011, 0b01101000, 0b01111000, 0b10111000, 0b01010000, 0b11110101, 0b01001101, 0b00000111, 0b00010111, 0b01111010, 0b11001000, 0b00110101, 0b10111010, 0b01101000, 0b00100010, 0b00100100, 0b11000010, 0b00111001, 0b00000101, 0b00010111, 0b10010011, 0b00001101, 0b11110010, 0b11011100, 0b11111111, 0b10111011, 0b01110111, 0b10000011, 0b10011011, 0b01111111, 0b11000010, 0b11010110, 0b01111100, 0b00001101, 0b10011110, 0b01111100, 0b10110000, 0b11101100, 0b00111111, 0b00001111, 0b10001011, 0b10110011, 0b01000101, 0b00100000, 0b10111011, 0b00110011, 0b10101111, 0b11100111, 0b11101011, 0b11000110, 0b00000011, 0b01101001, 0b10100010, 0b10011110, 0b11110011, 0b01101111, 0b11111111, 0b01100111, 0b01111111, 0b10001011, 0b10010111, 0b11110100, 0b11000011], # Node 239
-[0b01111001, 0b00011001, 0b10101010, 0b00000010, 0b01110101, 0b11100011, 0b01011000, 0b10010100, 0b00001000, 0b00010110, 0b11000010, 0b11100110, 0b01101001, 0b10110000, 0b11000011, 0b11111101, 0b10110010, 0b00001111, 0b00101010, 0b11001100, 0b00100000, 0b00011010, 0b10101001, 0b10011000, 0b00010000, 0b11110010, 0b10111000, 0b11111110, 0b00010110, 0b00011110, 0b00011100, 0b10110010, 0b00000100, 0b11011100, 0b00111011, 0b00111010, 0b01110001, 0b00011100, 0b11100111, 0b01101110, 0b00101110, 0b01100010, 0b10000000, 0b11000100, 0b01100001, 0b00000001, 0b10110100, 0b01101010, 0b11111010, 0b10011110, 0b10101000, 0b00000010, 0b10100001, 0b01100110, 0b10100101, 0b11011101, 0b11000010, 0b11011011, 0b11111000, 0b10100001, 0b10100001, 0b10100110, 0b00100001, 0b10101011, 0b00110010, 0b10100010, 0b01001110, 0b01010011, 0b01111100, 0b00011101, 0b10010001, 0b00001011, 0b11101011, 0b00110010, 0b01101011, 0b10011010, 0b11100110, 0b10001101, 0b00100001, 0b01011001, 0b11000110, 0b00010001, 0b10111101, 0b10100011, 0b10000000, 0b11100011, 0b01010000, 0b10101101, 0b00111010, 0b10000101, 0b01000000, 0b10100010, 0b11111000, 0b00000111, 0b11000100, 0b10001000, 0b00100000, 0b10011110], # Node 240
-[0b10100101, 0b11010100, 0b10000111, 0b00000111, 0b01111011, 0b00011010, 0b00010111, 0b00010100, 0b00001011, 0b01100000, 0b11110101, 0b01000001, 0b01001101, 0b00010010, 0b00111000, 0b00110110, 0b10000001, 0b00100111, 0b11010110, 0b00000000, 0b11010101, 0b11100100, 0b00011000, 0b10100001, 0b11011001, 0b11001100, 0b10110100, 0b01011011, 0b01100001, 0b00110010, 0b00111000, 0b00110010, 0b00110000, 0b01011010, 0b10100100, 0b11000100, 0b00010101, 0b10110010, 0b01110001, 0b11111010, 0b00001000, 0b11100000, 0b01000111, 0b10011100, 0b00010000, 0b00000001, 0b10000100, 0b11010100, 0b11010101, 0b01101000, 0b11000110, 0b10100111, 0b00001010, 0b01001100, 0b11001001, 0b00001110, 0b01111011, 0b11101011, 0b01100111, 0b01101101, 0b11000101, 0b10011010, 0b00010110, 0b10000011, 0b00011111, 0b00000001, 0b01110110, 0b00110100, 0b11000010, 0b00001000, 0b11001111, 0b11100110, 0b10100001, 0b00111010, 0b00110001, 0b00010100, 0b11001000, 0b00010110, 0b00111010, 0b00000111, 0b01000100, 0b00011101, 0b10000100, 0b10001001, 0b11101011, 0b10111010, 0b00100001, 0b00000100, 0b01010001, 0b01110100, 0b11000010, 0b10100100, 0b11100111, 0b10000100, 0b10010000, 0b10001011, 0b11010100, 0b01010100], # Node 241
-[0b01011100, 0b11000110, 0b01111001, 0b10111011, 0b00000100, 0b00000000, 0b00100000, 0b00001001, 0b00000000, 0b00000000, 0b10001011, 0b00000011, 0b00000000, 0b01000000, 0b00010111, 0b00000000, 0b00001001, 0b00101111, 0b00001110, 0b00000000, 0b01111100, 0b01010111, 0b00001111, 0b10001000, 0b10111111, 0b01111110, 0b10000000, 0b01111011, 0b11111010, 0b00000001, 0b11111100, 0b10000111, 0b00111111, 0b10001000, 0b01111111, 0b11011011, 0b11101111, 0b10100011, 0b11101111, 0b11111111, 0b01111111, 0b11110000, 0b11101101, 0b11111111, 0b00001111, 0b00110000, 0b11111111, 0b01111111, 0b00000001, 0b00111010, 0b11110111, 0b00101111, 0b11010000, 0b00000000, 0b01111111, 0b00001110, 0b00000110, 0b11110000, 0b00000011, 0b01011000, 0b00000000, 0b00011100, 0b10000000, 0b00000100, 0b00000000, 0b00000000, 0b11010000, 0b00000000, 0b00000000, 0b11000000, 0b01101111, 0b00000000, 0b00000000, 0b11100100, 0b00011111, 0b00000010, 0b11000000, 0b10111110, 0b11111110, 0b01000010, 0b11101100, 0b11001001, 0b10111111, 0b10001101, 0b11111001, 0b11101101, 0b11111111, 0b00011100, 0b11111111, 0b00111111, 0b01011100, 0b11110011, 0b11111111, 0b01000011, 0b00111010, 0b01001011, 0b11111111, 0b01100000], # Node 242
-[0b00101101, 0b01110000, 0b00010000, 0b00001100, 0b00011010, 0b10101000, 0b00010100, 0b00010001, 0b00101101, 0b00000000, 0b10001111, 0b01100010, 0b00000110, 0b01000010, 0b11101000, 0b00100000, 0b00100111, 0b00110110, 0b01110000, 0b00101000, 0b00100100, 0b10000111, 0b01010100, 0b00000100, 0b00010001, 0b10001010, 0b01001001, 0b00101110, 0b10010000, 0b01110001, 0b00000111, 0b11010010, 0b00000011, 0b01111001, 0b11010001, 0b01001100, 0b10111011, 0b01111111, 0b01000000, 0b01000000, 0b10100100, 0b01000000, 0b01101010, 0b01100100, 0b00100011, 0b00011010, 0b11110100, 0b00011010, 0b00100100, 0b00100000, 0b10100010, 0b00000011, 0b01001100, 0b00010000, 0b00100010, 0b00000000, 0b00000000, 0b10001010, 0b01001100, 0b10000010, 0b01010000, 0b11001100, 0b00010001, 0b11010010, 0b11110100, 0b00001010, 0b11111001, 0b00001010, 0b11100110, 0b00100110, 0b10100011, 0b11011000, 0b00000000, 0b00000000, 0b11000010, 0b01010011, 0b10100011, 0b10000000, 0b01001010, 0b10010000, 0b00001100, 0b11000001, 0b00110001, 0b10010010, 0b00100101, 0b10100100, 0b00101100, 0b10010000, 0b11101001, 0b00100000, 0b00101010, 0b10100001, 0b00000101, 0b10000001, 0b00100110, 0b00100100, 0b00101000, 0b10111101], # Node 243
-[0b00111110, 0b11101111, 0b10001110, 0b11001110, 0b01100100, 0b11010101, 0b11111011, 0b10011010, 0b10111011, 0b00110111, 0b10111101, 0b01101100, 0b10100010, 0b10101100, 0b11011011, 0b11101011, 0b11101011, 0b10100001, 0b10110100, 0b10100111, 0b10111010, 0b01001010, 0b11110011, 0b11001110, 0b10101000, 0b01011101, 0b10101010, 0b10101011, 0b00110010, 0b10001010, 0b01010110, 0b10011011, 0b11011010, 0b01001100, 0b11101011, 0b11010011, 0b01111010, 0b11101000, 0b00011101, 0b10000101, 0b10001110, 0b01101111, 0b10001101, 0b11011000, 0b00010000, 0b10111001, 0b10010101, 0b01001010, 0b10101110, 0b11011111, 0b00001010, 0b11010000, 0b10010101, 0b10100001, 0b01001110, 0b00101001, 0b10111100, 0b00110110, 0b11111100, 0b11101011, 0b11001100, 0b10000011, 0b01111111, 0b01001110, 0b00101111, 0b10010011, 0b10011010, 0b11101100, 0b10011010, 0b10100000, 0b10111100, 0b11111011, 0b11111111, 0b10111101, 0b10110100, 0b10011111, 0b10111011, 0b11011010, 0b00101101, 0b01100110, 0b01101001, 0b01000011, 0b01100100, 0b10101111, 0b10110000, 0b01010100, 0b10011011, 0b11011011, 0b11001010, 0b11100100, 0b11000110, 0b11000010, 0b10010001, 0b01001001, 0b10110011, 0b00101111, 0b11001010, 0b11001111], # Node 244
-[0b11011111, 0b11011111, 0b11011110, 0b11111110, 0b01101101, 0b10110011, 0b10011011, 0b00111111, 0b11100111, 0b11100001, 0b11011111, 0b11111111, 0b10111110, 0b01011010, 0b11101101, 0b00000101, 0b11100000, 0b01010001, 0b00111011, 0b00000000, 0b11111100, 0b11111110, 0b00000011, 0b11100000, 0b11100111, 0b00111111, 0b00000100, 0b11111100, 0b11000010, 0b11110000, 0b11100000, 0b11111100, 0b00010011, 0b00001110, 0b11100000, 0b11110111, 0b10100000, 0b10000000, 0b01010111, 0b10101111, 0b01010000, 0b10100000, 0b11011011, 0b01000111, 0b00001111, 0b00111101, 0b11111011, 0b11110000, 0b10011000, 0b10110100, 0b11001111, 0b11101111, 0b11111111, 0b11101101, 0b01111111, 0b11111100, 0b10110111, 0b11011001, 0b00000111, 0b01111110, 0b00000001, 0b01111101, 0b11100100, 0b00011111, 0b11100000, 0b10100011, 0b01110101, 0b10000000, 0b10011111, 0b11110000, 0b00001111, 0b00000000, 0b10000000, 0b11101100, 0b00000001, 0b00000001, 0b10000010, 0b00011100, 0b00000000, 0b01100000, 0b10110110, 0b00001101, 0b01100000, 0b10111010, 0b10101110, 0b10001010, 0b11111111, 0b01111011, 0b11111111, 0b01111111, 0b01111101, 0b10111001, 0b11110111, 0b00111111, 0b11001110, 0b01010110, 0b10111111, 0b00100110], # Node 245
-[0b01110000, 0b10000000, 0b00100110, 0b00110100, 0b01000010, 0b10000010, 0b11101101, 0b01000001, 0b00100111, 0b00111010, 0b00011000, 0b00000111, 0b11011100, 0b01101101, 0b10000110, 0b11101000, 0b10100100, 0b01010000, 0b10101000, 0b00110010, 0b00101010, 0b00001111, 0b10010100, 0b01100001, 0b00000000, 0b01011011, 0b00101000, 0b01000100, 0b01010000, 0b01110010, 0b00011101, 0b01000000, 0b00011001, 0b10001011, 0b10001100, 0b11001011, 0b00010000, 0b10011101, 0b01100000, 0b10000001, 0b01111011, 0b01110101, 0b00000001, 0b00011011, 0b10111001, 0b01111001, 0b00101000, 0b00001110, 0b00000100, 0b11111000, 0b11100101, 0b01110100, 0b10101101, 0b10011111, 0b00100110, 0b01110000, 0b00000100, 0b00011001, 0b00111110, 0b10001100, 0b10100010, 0b10010111, 0b10100100, 0b00001000, 0b01000101, 0b00010100, 0b01000010, 0b10110111, 0b10100111, 0b10000010, 0b10011010, 0b00110100, 0b01001110, 0b01000100, 0b00010010, 0b01001001, 0b11010001, 0b00110110, 0b01101010, 0b00110100, 0b00001110, 0b01001101, 0b11100000, 0b10100111, 0b11001010, 0b01000111, 0b00000111, 0b00100111, 0b00001001, 0b11001000, 0b11011000, 0b00011000, 0b00000101, 0b00010000, 0b10100101, 0b00000011, 0b10000010, 0b10110110], # Node 246
-[0b10110010, 0b10100100, 0b00000110, 0b10100010, 0b10111001, 0b11011001, 0b00110111, 0b01110010, 0b10011001, 0b00000001, 0b11001100, 0b11000000, 0b00110100, 0b00000001, 0b00000010, 0b00111000, 0b11001010, 0b10010100, 0b01110101, 0b00010000, 0b00100000, 0b01100010, 0b11010101, 0b10000101, 0b00000101, 0b00000100, 0b01110000, 0b10001000, 0b01001000, 0b10001101, 0b00111011, 0b00111001, 0b00000010, 0b01000000, 0b01110001, 0b11100110, 0b01100100, 0b00010110, 0b11100110, 0b00001101, 0b01010111, 0b11000001, 0b10000100, 0b00011110, 0b10001000, 0b01000101, 0b11111001, 0b10100011, 0b10001110, 0b11010010, 0b10111111, 0b10011110, 0b11010000, 0b01101100, 0b01110000, 0b00001011, 0b11100001, 0b00000110, 0b00111011, 0b10111100, 0b01000001, 0b11111100, 0b00100100, 0b01110000, 0b10100010, 0b11011011, 0b00011000, 0b00000111, 0b01111010, 0b01000011, 0b00100001, 0b10110100, 0b01000011, 0b00001110, 0b11000000, 0b00010111, 0b10000001, 0b01000101, 0b00011110, 0b00000000, 0b00010001, 0b01100110, 0b00100001, 0b01000001, 0b00100011, 0b01100011, 0b00000011, 0b01001001, 0b00000110, 0b10101110, 0b10100110, 0b01100010, 0b00110110, 0b11010011, 0b00001110, 0b00000011, 0b01000111, 0b10100011], # Node 247
-[0b00110001, 0b01000100, 0b00010110, 0b01110101, 0b01000100, 0b00010110, 0b10010100, 0b00001001, 0b00010110, 0b01000100, 0b10111001, 0b00101110, 0b10110000, 0b01010110, 0b00111001, 0b00000000, 0b10110010, 0b00010000, 0b10001000, 0b01111111, 0b11100111, 0b10101001, 0b11100100, 0b00001011, 0b00111101, 0b01100010, 0b00110011, 0b00110100, 0b00011100, 0b11000110, 0b00111011, 0b00011011, 0b01100000, 0b10100000, 0b10001000, 0b00100111, 0b00001111, 0b10111010, 0b10110110, 0b10000001, 0b11101010, 0b10111111, 0b11100010, 0b11111001, 0b01111010, 0b00111010, 0b11100000, 0b11010110, 0b10110001, 0b10011010, 0b11110000, 0b11011011, 0b01100001, 0b11000100, 0b00111101, 0b00000100, 0b01110001, 0b11110010, 0b01011001, 0b01000110, 0b11100110, 0b00110011, 0b01000001, 0b01011111, 0b11000110, 0b00110100, 0b10000000, 0b11010000, 0b11001100, 0b10001100, 0b11100010, 0b00011110, 0b00101100, 0b00000000, 0b11010000, 0b10111001, 0b00000011, 0b00000101, 0b10111011, 0b01111001, 0b00100000, 0b10111001, 0b00011111, 0b01011000, 0b00101101, 0b11111100, 0b00110111, 0b11100001, 0b00000110, 0b10001000, 0b00000010, 0b10010100, 0b01101010, 0b01010000, 0b11001001, 0b11001000, 0b01110110, 0b10000101], # Node 248
-[0b01011100, 0b10100000, 0b00100010, 0b00010000, 0b11011011, 0b00000110, 0b10110100, 0b01001000, 0b11010010, 0b01110010, 0b00011100, 0b00001010, 0b01101010, 0b11000101, 0b00100011, 0b10110101, 0b01011010, 0b01110011, 0b01100011, 0b01101110, 0b01010001, 0b01100100, 0b00101110, 0b10001101, 0b11111000, 0b00100101, 0b00100100, 0b00000001, 0b11000010, 0b10100101, 0b00100011, 0b10010100, 0b00010001, 0b01000010, 0b10011011, 0b00011010, 0b00000101, 0b00010001, 0b00110010, 0b11100101, 0b11111110, 0b01000101, 0b00000001, 0b11001010, 0b01000011, 0b00000100, 0b01101010, 0b01001100, 0b01111001, 0b01110001, 0b00011100, 0b00011010, 0b01000000, 0b01000100, 0b00011111, 0b00100001, 0b01011001, 0b01111000, 0b10110111, 0b10111000, 0b00000100, 0b00001010, 0b00100101, 0b10110100, 0b10101100, 0b00110001, 0b01011001, 0b00001100, 0b00011111, 0b00100101, 0b01111010, 0b10101001, 0b00010001, 0b00101000, 0b11100001, 0b00101100, 0b00000111, 0b00011011, 0b01111111, 0b00100010, 0b00110010, 0b00010100, 0b00000011, 0b00001000, 0b00011110, 0b00111110, 0b10110001, 0b01100001, 0b01001001, 0b11110110, 0b11011000, 0b01000001, 0b01110010, 0b11101000, 0b10011100, 0b00101100, 0b10010011, 0b11000000], # Node 249
-[0b01010101, 0b10110110, 0b00110001, 0b11000101, 0b00100100, 0b11001000, 0b11100100, 0b11010001, 0b00000100, 0b01000100, 0b00011000, 0b00111110, 0b00000111, 0b00000000, 0b00100100, 0b11010110, 0b00010010, 0b01001010, 0b11011100, 0b10101000, 0b01000000, 0b01000010, 0b10000101, 0b00100011, 0b00101111, 0b11101011, 0b00100001, 0b01001010, 0b00100100, 0b01111000, 0b10100000, 0b01111111, 0b01101010, 0b01010010, 0b10111001, 0b01110011, 0b00001100, 0b10000110, 0b11000111, 0b00001011, 0b01100001, 0b00010010, 0b11000000, 0b11010100, 0b01110101, 0b10001000, 0b01001110, 0b01011001, 0b10111101, 0b01000000, 0b01111110, 0b10001000, 0b11110100, 0b10001011, 0b01011011, 0b01001001, 0b00111000, 0b10110111, 0b11001100, 0b01011100, 0b01000100, 0b10111111, 0b01000011, 0b01000111, 0b11011100, 0b00101100, 0b01000000, 0b01000100, 0b01110011, 0b01000000, 0b10111000, 0b00011101, 0b01100011, 0b10001110, 0b00000000, 0b00010101, 0b01101000, 0b10101000, 0b11010001, 0b10110001, 0b00001001, 0b00101000, 0b10010010, 0b01100011, 0b11001001, 0b10111011, 0b10001110, 0b00001110, 0b01110110, 0b01000000, 0b00010011, 0b10111011, 0b01001110, 0b00111101, 0b11101000, 0b10100010, 0b10001011, 0b10010010], # Node 250
-[0b10101010, 0b10101110, 0b01101110, 0b01101001, 0b00110101, 0b11100100, 0b01110111, 0b11000100, 0b11101111, 0b00111011, 0b11111111, 0b11110010, 0b01110010, 0b11011110, 0b00111000, 0b10111101, 0b11111110, 0b00111000, 0b11011001, 0b11100010, 0b11010011, 0b01001000, 0b00100101, 0b00100010, 0b11010000, 0b01100110, 0b01100100, 0b11100101, 0b10111101, 0b00110011, 0b01000001, 0b00111000, 0b00011101, 0b11001110, 0b11010111, 0b10011111, 0b11011111, 0b01101100, 0b11110011, 0b00000000, 0b10011011, 0b11010111, 0b00010010, 0b01010010, 0b11111100, 0b11011000, 0b10100110, 0b11000001, 0b10110101, 0b00101111, 0b01111010, 0b10101011, 0b11101111, 0b00001010, 0b01100011, 0b01100011, 0b00101001, 0b01011010, 0b01111110, 0b01001100, 0b10010111, 0b11100101, 0b00101100, 0b11010110, 0b11111000, 0b10011010, 0b01011101, 0b11101010, 0b00110001, 0b10101111, 0b11100010, 0b11110010, 0b11110111, 0b10010101, 0b10111101, 0b11001111, 0b00010010, 0b00001110, 0b10110101, 0b01010000, 0b11101110, 0b10111110, 0b10001111, 0b10101111, 0b10100011, 0b01000111, 0b00110101, 0b11111000, 0b10111111, 0b01011011, 0b11011011, 0b11101111, 0b11110111, 0b01101000, 0b11100000, 0b01100111, 0b01000101, 0b00101111], # Node 251
-[0b01011001, 0b10000000, 0b00100110, 0b00010010, 0b10101001, 0b00010100, 0b11010011, 0b11001001, 0b00010111, 0b10000001, 0b00101000, 0b01011111, 0b10011000, 0b01000110, 0b00010010, 0b00001101, 0b00111110, 0b01001110, 0b10001001, 0b10000011, 0b10001011, 0b11111001, 0b01001110, 0b10101000, 0b10010111, 0b01011001, 0b01000000, 0b01100111, 0b10110000, 0b11010100, 0b10001000, 0b10110010, 0b01001000, 0b00000110, 0b00100110, 0b01101110, 0b10010111, 0b01010111, 0b00010001, 0b11001111, 0b01110011, 0b10111101, 0b00000010, 0b11101010, 0b00111110, 0b00100101, 0b11011111, 0b00001010, 0b11001011, 0b00000111, 0b00010010, 0b01101110, 0b10111100, 0b10001001, 0b11111001, 0b00010110, 0b10010000, 0b00001000, 0b10111111, 0b10111000, 0b00011001, 0b10011001, 0b01100100, 0b00010010, 0b00010100, 0b11000111, 0b01001001, 0b01111000, 0b00010100, 0b10000011, 0b01011101, 0b01100000, 0b11010001, 0b10001100, 0b00101100, 0b10011110, 0b01001010, 0b00000111, 0b00100101, 0b11001100, 0b10100111, 0b11010110, 0b11111000, 0b10100000, 0b11010100, 0b01111010, 0b01001010, 0b01011001, 0b01111000, 0b01100000, 0b00101100, 0b00100000, 0b01010000, 0b10010000, 0b01001000, 0b00000001, 0b10011101, 0b11000011], # Node 252
-[0b01100001, 0b00010010, 0b00000000, 0b00000001, 0b10001010, 0b11000000, 0b00001000, 0b10000100, 0b00001000, 0b01000101, 0b11000010, 0b10100001, 0b00001001, 0b00000010, 0b00110011, 0b00010100, 0b00000000, 0b01110000, 0b00100100, 0b01001110, 0b00100000, 0b00001000, 0b00011000, 0b10000000, 0b01000100, 0b11001011, 0b01001011, 0b11000000, 0b01000110, 0b10111110, 0b00001101, 0b00001000, 0b11110110, 0b11011001, 0b00010000, 0b01000000, 0b11100001, 0b01000001, 0b10000010, 0b11111010, 0b11111111, 0b00000100, 0b01110000, 0b10101111, 0b10011011, 0b00001000, 0b00011110, 0b00101000, 0b10000100, 0b00011101, 0b00100000, 0b11000010, 0b10100000, 0b01011000, 0b11011001, 0b00101000, 0b00000000, 0b01001111, 0b10101011, 0b10000101, 0b01001000, 0b10010000, 0b00111111, 0b00000000, 0b00000000, 0b11010000, 0b00110000, 0b00010000, 0b10000100, 0b10001011, 0b00000000, 0b00101001, 0b00011101, 0b01100000, 0b11110000, 0b01110011, 0b11100000, 0b00000000, 0b01011110, 0b00001101, 0b10010000, 0b00100000, 0b11000000, 0b01000000, 0b00000000, 0b00000010, 0b00111110, 0b10110001, 0b10000001, 0b11010100, 0b10000000, 0b00010111, 0b10000000, 0b10101001, 0b10000110, 0b00000011, 0b00001001, 0b00000000], # Node 253
-[0b00100111, 0b10000111, 0b11011110, 0b01010101, 0b11111100, 0b01011111, 0b10010000, 0b11101001, 0b01110111, 0b11000111, 0b00100111, 0b10110011, 0b11111001, 0b11000011, 0b11111110, 0b11001110, 0b10010010, 0b01111011, 0b10111000, 0b01000101, 0b00000010, 0b11011011, 0b01010100, 0b01001010, 0b11100111, 0b00001010, 0b11101000, 0b10001110, 0b10111110, 0b11011011, 0b11000010, 0b00011101, 0b01100101, 0b11000001, 0b11101010, 0b11000011, 0b01110011, 0b00000111, 0b11110111, 0b01010111, 0b10000110, 0b10110011, 0b00101110, 0b01000010, 0b00001100, 0b00001100, 0b01011111, 0b11000011, 0b11111010, 0b11010101, 0b00010001, 0b01010100, 0b01010010, 0b11011001, 0b00011111, 0b00100001, 0b01110111, 0b01011101, 0b01010010, 0b10010011, 0b00100010, 0b11110111, 0b10000111, 0b10000001, 0b00100100, 0b10111001, 0b01111010, 0b10011111, 0b01101010, 0b11111000, 0b01000010, 0b10111011, 0b11111101, 0b11001010, 0b00110001, 0b11001111, 0b01101011, 0b11111111, 0b11110010, 0b11010101, 0b11111100, 0b11010111, 0b10100111, 0b01001010, 0b01000101, 0b11000101, 0b10011111, 0b10000111, 0b00111101, 0b00110101, 0b10111100, 0b10000111, 0b10001010, 0b11011000, 0b11010110, 0b10111100, 0b01000101, 0b11001101], # Node 254
-[0b00110011, 0b01101010, 0b11001000, 0b01001111, 0b10110000, 0b01101111, 0b11010100, 0b00010101, 0b00001010, 0b00100100, 0b11000001, 0b11010101, 0b11111001, 0b01011001, 0b00000011, 0b01011010, 0b00011100, 0b10111001, 0b01001001, 0b01010011, 0b00000010, 0b01010100, 0b11100100, 0b00011001, 0b11001000, 0b10011101, 0b10101001, 0b10000011, 0b10110110, 0b00000110, 0b11111111, 0b10010000, 0b11001111, 0b01010001, 0b00101100, 0b01001001, 0b11100010, 0b01001000, 0b10101010, 0b11110100, 0b10001111, 0b01011010, 0b11010000, 0b00001100, 0b01010000, 0b10010100, 0b01100011, 0b10101010, 0b01110110, 0b01000110, 0b00101100, 0b01010000, 0b10001110, 0b11110110, 0b00101100, 0b11111100, 0b00001111, 0b01110011, 0b10100101, 0b01001100, 0b11000111, 0b10110110, 0b10011100, 0b01111001, 0b01110000, 0b01001010, 0b00101101, 0b10000001, 0b01000011, 0b11000010, 0b01100010, 0b00010111, 0b01001000, 0b00110010, 0b11010010, 0b10111010, 0b00000101, 0b00011101, 0b10010000, 0b00011001, 0b00100111, 0b10111000, 0b11000011, 0b01110100, 0b11000101, 0b11010100, 0b01000000, 0b00011110, 0b11010110, 0b00000001, 0b10010001, 0b10010001, 0b00000010, 0b10000110, 0b00010010, 0b10010001, 0b00001011, 0b00000010], # Node 255
-[0b00010100, 0b11101010, 0b10010000, 0b10110000, 0b00111100, 0b01011001, 0b00111111, 0b00001100, 0b00000010, 0b00101101, 0b00010011, 0b01111001, 0b11000000, 0b00111111, 0b11111100, 0b11111111, 0b11111111, 0b10101011, 0b11101011, 0b10111011, 0b00111111, 0b10001011, 0b11111100, 0b11111101, 0b01010111, 0b11110011, 0b01111111, 0b11111001, 0b01100001, 0b11111110, 0b00000000, 0b00010111, 0b00101110, 0b00000000, 0b10110000, 0b11111010, 0b00000011, 0b00000000, 0b10010010, 0b10000111, 0b00001111, 0b11000000, 0b00111001, 0b11111110, 0b00000001, 0b01111100, 0b11101010, 0b11111111, 0b01000000, 0b00000010, 0b11111110, 0b00000111, 0b01101000, 0b00000000, 0b11110001, 0b01000001, 0b00001110, 0b00000000, 0b11111111, 0b11011001, 0b00000000, 0b11100000, 0b01011111, 0b00011101, 0b00000000, 0b11111110, 0b11110001, 0b00000011, 0b11100000, 0b00001111, 0b01111101, 0b00000000, 0b11111100, 0b11011000, 0b00011111, 0b10011100, 0b11001111, 0b11111100, 0b01011111, 0b11111001, 0b11110000, 0b11111111, 0b10101111, 0b00011011, 0b11111111, 0b11111111, 0b11100000, 0b00100001, 0b11111111, 0b00011111, 0b00111111, 0b11001001, 0b00000111, 0b01111000, 0b10010111, 0b11000010, 0b00010111, 0b00011100], # Node 256
-[0b10010011, 0b00000110, 0b00010010, 0b01001110, 0b10000100, 0b10001000, 0b00010010, 0b01000001, 0b00110010, 0b00010000, 0b00101100, 0b00011001, 0b00100011, 0b00000100, 0b10000100, 0b10110111, 0b01001011, 0b00000011, 0b00000010, 0b00101111, 0b00101000, 0b00010001, 0b10011111, 0b10101100, 0b10101101, 0b00011001, 0b11110111, 0b10100101, 0b01010000, 0b00001001, 0b00000001, 0b00100000, 0b10101001, 0b01100111, 0b00001001, 0b10100110, 0b00111000, 0b11100111, 0b00101110, 0b00001110, 0b10000111, 0b11011011, 0b00010011, 0b00001101, 0b00010110, 0b00010001, 0b01110000, 0b11111010, 0b01100000, 0b11010100, 0b00010110, 0b10001110, 0b01000101, 0b10001001, 0b10000000, 0b01000000, 0b00001000, 0b00100010, 0b10110001, 0b00000001, 0b11100001, 0b01111101, 0b10001100, 0b10000110, 0b00111110, 0b00100011, 0b11110101, 0b00000100, 0b00110000, 0b10111110, 0b00000101, 0b00101101, 0b10101101, 0b01000110, 0b00010100, 0b10001000, 0b10100000, 0b00000111, 0b01101100, 0b01101100, 0b00110101, 0b00000010, 0b01100100, 0b11110111, 0b00000001, 0b00001010, 0b00110011, 0b11010011, 0b01101110, 0b00101011, 0b10001000, 0b00011000, 0b00110110, 0b11110100, 0b00100000, 0b00100000, 0b01001010, 0b11011011], # Node 257
-[0b10001010, 0b11100110, 0b00000001, 0b11100100, 0b00110100, 0b00011100, 0b00001010, 0b00100000, 0b00001110, 0b10010000, 0b00000111, 0b00110000, 0b00010000, 0b00110000, 0b00101100, 0b00011000, 0b00000000, 0b00000000, 0b01001010, 0b11000100, 0b00100000, 0b10010010, 0b11000000, 0b00011111, 0b00100000, 0b00011000, 0b01010100, 0b01101001, 0b00000000, 0b10000000, 0b00001111, 0b10010011, 0b10100000, 0b11010001, 0b00010100, 0b00100000, 0b10101000, 0b00000111, 0b00000000, 0b11101000, 0b01110110, 0b00011000, 0b00010000, 0b00101100, 0b01000011, 0b00000000, 0b01000000, 0b00001110, 0b11011110, 0b11100001, 0b01100010, 0b10011000, 0b10010011, 0b10001010, 0b11000111, 0b00100011, 0b00000000, 0b00011000, 0b01001000, 0b10000101, 0b00000001, 0b00000000, 0b10000110, 0b00000000, 0b00000110, 0b00000011, 0b11000000, 0b00110000, 0b10101100, 0b10000000, 0b00001000, 0b01100010, 0b00000011, 0b01001100, 0b11001000, 0b00110011, 0b00010000, 0b00000000, 0b11111110, 0b10000111, 0b01010000, 0b11110010, 0b01001110, 0b11001110, 0b10010101, 0b01011001, 0b00010111, 0b11001000, 0b00000001, 0b00000000, 0b11001110, 0b10111001, 0b00000011, 0b01001000, 0b00010000, 0b11000000, 0b01010010, 0b00001000], # Node 258
-[0b10111101, 0b11111110, 0b10110011, 0b00111111, 0b01101101, 0b10111111, 0b11101101, 0b11111111, 0b00111000, 0b11001111, 0b10001110, 0b11100000, 0b11110111, 0b01111011, 0b11010100, 0b11111101, 0b11111101, 0b01111011, 0b11101011, 0b11111110, 0b01001111, 0b01011100, 0b10110110, 0b11011011, 0b11111100, 0b00011011, 0b00010101, 0b11000001, 0b11001111, 0b11010000, 0b00000100, 0b11111101, 0b00001000, 0b00001110, 0b11011101, 0b00111111, 0b11111010, 0b10101110, 0b10010110, 0b00000001, 0b01111111, 0b11111111, 0b00000110, 0b11111110, 0b11100101, 0b11001011, 0b11100011, 0b11101111, 0b10001110, 0b00010111, 0b11111000, 0b11110110, 0b00100011, 0b10000011, 0b00001111, 0b11101110, 0b01011111, 0b11110000, 0b11000000, 0b11110011, 0b11000000, 0b00011111, 0b00011010, 0b01111111, 0b11111010, 0b10000000, 0b01000001, 0b11111101, 0b01010111, 0b11110000, 0b11111110, 0b11111111, 0b00100011, 0b11010101, 0b11101101, 0b10011111, 0b01111010, 0b00000101, 0b11111111, 0b11110001, 0b11110100, 0b11110101, 0b00001010, 0b11111010, 0b11101010, 0b01111111, 0b11111000, 0b01000110, 0b00111011, 0b10011001, 0b11111101, 0b11010011, 0b10011000, 0b00101111, 0b10110111, 0b10011011, 0b11110101, 0b00110110], # Node 259
-[0b10011101, 0b01000000, 0b11001000, 0b11110011, 0b10101001, 0b01000001, 0b00000100, 0b01000110, 0b00100011, 0b10010100, 0b01000011, 0b10001010, 0b01010000, 0b11101001, 0b01100100, 0b10000100, 0b00000000, 0b00110100, 0b00000110, 0b00111100, 0b10101010, 0b00100011, 0b10101010, 0b00101000, 0b11011011, 0b01001111, 0b01001101, 0b00011010, 0b11000010, 0b00100000, 0b01011101, 0b10000010, 0b01001011, 0b01111111, 0b00000111, 0b01011011, 0b11011001, 0b01011011, 0b10011000, 0b00001110, 0b01111001, 0b10010100, 0b01011010, 0b01100010, 0b00101101, 0b00000010, 0b10000100, 0b00010110, 0b01100110, 0b01000000, 0b00100111, 0b11010100, 0b00101000, 0b00011100, 0b01110000, 0b10001011, 0b11010101, 0b11000101, 0b10100101, 0b10010010, 0b11000110, 0b01001010, 0b00000111, 0b01001100, 0b11000000, 0b11110110, 0b10111001, 0b01111000, 0b11000000, 0b00001111, 0b11100101, 0b01010000, 0b01100001, 0b10110000, 0b11101011, 0b01000010, 0b01001110, 0b10000110, 0b01010110, 0b01010110, 0b11010011, 0b00100110, 0b01010111, 0b00011000, 0b00111101, 0b10100000, 0b11110011, 0b00110100, 0b11111010, 0b01110000, 0b10111000, 0b01100000, 0b00100110, 0b01010011, 0b11100000, 0b10100000, 0b01100101, 0b00011011], # Node 260
-[0b00000001, 0b00000000, 0b10010101, 0b01001010, 0b00000111, 0b00101000, 0b10000000, 0b00010000, 0b10000001, 0b01010010, 0b01010100, 0b00000011, 0b00010100, 0b01011000, 0b10001000, 0b01000100, 0b00000010, 0b00000001, 0b11110010, 0b10000001, 0b00000000, 0b00010000, 0b01000101, 0b00001111, 0b10100110, 0b10110011, 0b00110010, 0b00100011, 0b00000010, 0b00100011, 0b00110000, 0b10101011, 0b00100110, 0b10000010, 0b11100001, 0b11001000, 0b00000100, 0b11000001, 0b00001010, 0b00001000, 0b11101000, 0b00000001, 0b00000000, 0b01000000, 0b00001101, 0b01100101, 0b00000100, 0b11100000, 0b11000000, 0b00001000, 0b10100000, 0b00011111, 0b00000100, 0b11000000, 0b01111000, 0b00110000, 0b00000000, 0b11101000, 0b00000001, 0b01010001, 0b10100000, 0b00000110, 0b01001000, 0b00000000, 0b11111110, 0b01010000, 0b01111000, 0b11001000, 0b00000011, 0b00010100, 0b00000000, 0b01001101, 0b10000000, 0b01011011, 0b00100000, 0b01101001, 0b01100000, 0b00000100, 0b11101011, 0b01101100, 0b00000000, 0b00010001, 0b00000010, 0b01100010, 0b00101001, 0b11111100, 0b01101011, 0b00001000, 0b11011010, 0b01110010, 0b01000100, 0b00001101, 0b11101001, 0b00000100, 0b00101000, 0b00000000, 0b00100100, 0b01011000], # Node 261
-[0b10111111, 0b10100101, 0b11110101, 0b01011010, 0b01111111, 0b10011011, 0b11111111, 0b10110011, 0b10110111, 0b11111111, 0b10011111, 0b00010101, 0b11100010, 0b10010011, 0b00011110, 0b01010100, 0b00101110, 0b11010011, 0b11011111, 0b11001011, 0b10001100, 0b01111001, 0b00001100, 0b10011000, 0b01010001, 0b11011010, 0b01001110, 0b11111101, 0b11111111, 0b01000001, 0b11010010, 0b01000101, 0b00100011, 0b11001100, 0b11110001, 0b01010101, 0b01010101, 0b10100010, 0b10010101, 0b10011011, 0b01111000, 0b01111110, 0b01010111, 0b01011011, 0b11101110, 0b01111111, 0b10001101, 0b10001000, 0b10101110, 0b10101001, 0b00010000, 0b01110100, 0b10101111, 0b00011010, 0b11101000, 0b11101001, 0b11111011, 0b01001011, 0b11101001, 0b00111110, 0b01101110, 0b10101101, 0b11111101, 0b11111101, 0b10111101, 0b11101000, 0b11111110, 0b10010011, 0b11001000, 0b11101110, 0b11001111, 0b01111010, 0b01111101, 0b11111100, 0b10101111, 0b10111011, 0b00110011, 0b10100101, 0b10110000, 0b11001001, 0b00111111, 0b01111100, 0b11101011, 0b10011101, 0b10101110, 0b10011011, 0b11111111, 0b01101010, 0b11101011, 0b11100001, 0b11110110, 0b11111011, 0b01101101, 0b00100011, 0b11101101, 0b00011111, 0b00111100, 0b10111111], # Node 262
-[0b00110010, 0b00011100, 0b10001100, 0b01100011, 0b01100110, 0b00010110, 0b10101110, 0b01110001, 0b11010000, 0b00000001, 0b11001100, 0b00000001, 0b01100000, 0b00010101, 0b00010011, 0b01100000, 0b01101000, 0b10001001, 0b11001000, 0b01100101, 0b11010001, 0b00010101, 0b01001101, 0b00111111, 0b00010100, 0b11010001, 0b10111010, 0b11000111, 0b01100110, 0b01011011, 0b01111011, 0b00010011, 0b01101010, 0b10010100, 0b01011010, 0b00010000, 0b10110000, 0b11101110, 0b10010010, 0b00100000, 0b01101111, 0b00101000, 0b10110101, 0b11111010, 0b11001101, 0b11000000, 0b10110101, 0b11111101, 0b10110001, 0b10110010, 0b10100110, 0b10110001, 0b11010000, 0b00011110, 0b00001011, 0b00000001, 0b00000000, 0b10111111, 0b00110001, 0b00001000, 0b00101000, 0b01100010, 0b01101110, 0b00100000, 0b11011111, 0b10100000, 0b00100101, 0b10110111, 0b00110001, 0b00101000, 0b10001110, 0b00111111, 0b11000011, 0b01110001, 0b00011010, 0b00001101, 0b00001000, 0b00100011, 0b00110000, 0b10111001, 0b01000110, 0b11101110, 0b01000110, 0b00011110, 0b01001000, 0b11101110, 0b10000100, 0b01000000, 0b00000101, 0b00001111, 0b11001111, 0b00001011, 0b10000000, 0b11111001, 0b00000100, 0b11100000, 0b00010100, 0b00100010], # Node 263
-[0b00010111, 0b11000101, 0b11101111, 0b11010011, 0b11111001, 0b11001111, 0b10100000, 0b01101111, 0b01001111, 0b01001110, 0b11101111, 0b11110100, 0b00110011, 0b10111101, 0b11110111, 0b11101010, 0b11111111, 0b10111000, 0b01000010, 0b10111111, 0b11011110, 0b01011010, 0b11000000, 0b10111101, 0b10101101, 0b11110000, 0b11111111, 0b01011100, 0b11111011, 0b00111100, 0b11111111, 0b10001011, 0b01101010, 0b00011111, 0b10100101, 0b00001000, 0b11111010, 0b01101000, 0b01111000, 0b10110101, 0b10000000, 0b11001011, 0b10000011, 0b00111111, 0b01111111, 0b01110011, 0b01101101, 0b00101010, 0b11110010, 0b11010011, 0b00000011, 0b11100011, 0b10110100, 0b10011010, 0b10001011, 0b01111101, 0b01111111, 0b01010000, 0b01100001, 0b01011011, 0b11101011, 0b11001011, 0b11011111, 0b01111110, 0b01001111, 0b01011000, 0b01101110, 0b11011011, 0b01001111, 0b11111111, 0b11011001, 0b11101000, 0b00011110, 0b10100001, 0b10100101, 0b11111100, 0b01011001, 0b00011101, 0b10111110, 0b00011111, 0b10110111, 0b11000011, 0b01110011, 0b01110100, 0b11011111, 0b11111110, 0b10101101, 0b11100111, 0b11110010, 0b10100111, 0b01111100, 0b11001011, 0b01111110, 0b11010100, 0b01010010, 0b10011100, 0b11111110, 0b10110001], # Node 264
-[0b10100000, 0b00000001, 0b00000000, 0b00000001, 0b00001000, 0b10000000, 0b00000000, 0b01000001, 0b00010010, 0b01000000, 0b00000000, 0b00000000, 0b00010000, 0b00000100, 0b00100001, 0b00101000, 0b10000100, 0b00110000, 0b00000100, 0b00000000, 0b00000001, 0b11000000, 0b00111110, 0b01100101, 0b00000000, 0b11001101, 0b10111111, 0b11000011, 0b00010000, 0b10110111, 0b10000111, 0b10010010, 0b00000001, 0b10100010, 0b00000001, 0b00000000, 0b11000001, 0b01011011, 0b01000100, 0b10000100, 0b00110001, 0b00001010, 0b00001100, 0b00100011, 0b00101111, 0b00011010, 0b00001010, 0b01011101, 0b00000000, 0b00000000, 0b00010100, 0b00101110, 0b10000000, 0b01011001, 0b00100100, 0b00000001, 0b00000000, 0b00010101, 0b10000110, 0b01000000, 0b00000000, 0b00000010, 0b00001101, 0b00000000, 0b11000000, 0b10001101, 0b01000010, 0b10000001, 0b11100110, 0b01010011, 0b01100010, 0b00001101, 0b00111110, 0b01000000, 0b11010001, 0b11001101, 0b00100100, 0b10010001, 0b01111011, 0b00000010, 0b10000010, 0b10100000, 0b00111010, 0b00000001, 0b00000000, 0b01011101, 0b00000000, 0b00000010, 0b10000110, 0b00000000, 0b10011000, 0b00000000, 0b00000111, 0b00100001, 0b01001001, 0b10001000, 0b00010010, 0b10010010], # Node 265
-[0b01100111, 0b10111010, 0b00111100, 0b11110011, 0b10000100, 0b11110111, 0b01110000, 0b01010100, 0b01010000, 0b10010101, 0b11011111, 0b10110000, 0b01110111, 0b01110110, 0b01101111, 0b00100110, 0b00110001, 0b00010001, 0b00101011, 0b11010100, 0b10110100, 0b01010010, 0b10000000, 0b00010011, 0b01111110, 0b01001000, 0b11010010, 0b01001010, 0b00110111, 0b01111101, 0b10011100, 0b10110111, 0b11000110, 0b11101010, 0b00010101, 0b01100011, 0b00011110, 0b11011111, 0b10101111, 0b00011100, 0b11001101, 0b11011011, 0b11111010, 0b10100111, 0b10111111, 0b11011111, 0b11111110, 0b10010001, 0b11010111, 0b00111100, 0b01000111, 0b11011010, 0b01110110, 0b11100111, 0b11100011, 0b00110110, 0b00101011, 0b00100011, 0b01100010, 0b11100110, 0b10001111, 0b00111010, 0b11111011, 0b00111111, 0b00110100, 0b11100000, 0b11110101, 0b00111100, 0b10101011, 0b11111011, 0b11110001, 0b10111100, 0b10110010, 0b11001100, 0b00011001, 0b10011001, 0b01011100, 0b00000110, 0b10111110, 0b11111100, 0b00100010, 0b11100101, 0b10011101, 0b00001010, 0b10001111, 0b11110011, 0b01101101, 0b11110111, 0b11011111, 0b01110000, 0b10100111, 0b10000011, 0b01011101, 0b10111111, 0b01111101, 0b00001110, 0b11111101, 0b00011001], # Node 266
-[0b11011011, 0b00111010, 0b01111000, 0b10111110, 0b11011000, 0b11111001, 0b00100101, 0b00010111, 0b11011101, 0b11111011, 0b11010110, 0b10111111, 0b11111111, 0b01111111, 0b01011110, 0b11100111, 0b00010101, 0b01111011, 0b10101000, 0b11001100, 0b11101111, 0b10001101, 0b00001111, 0b10000001, 0b00101001, 0b11100011, 0b00110000, 0b00100000, 0b01100110, 0b10001010, 0b10101000, 0b00000000, 0b01010010, 0b00100100, 0b01111110, 0b11110110, 0b11010101, 0b11000001, 0b00010001, 0b10001101, 0b11111000, 0b11100000, 0b11111111, 0b11101111, 0b11010110, 0b10001011, 0b11100010, 0b00111011, 0b11101101, 0b01010011, 0b01000100, 0b11000000, 0b01000111, 0b01011100, 0b01000010, 0b11111100, 0b11110101, 0b00000011, 0b01000101, 0b10111101, 0b11011111, 0b10000111, 0b01010010, 0b10111111, 0b01011011, 0b11010010, 0b01110011, 0b00001111, 0b11000111, 0b00001111, 0b01001111, 0b01010000, 0b10110111, 0b01011101, 0b01111100, 0b11111001, 0b01111111, 0b00010111, 0b00101110, 0b01001011, 0b01110010, 0b00000001, 0b11111000, 0b11001111, 0b01111010, 0b10011001, 0b11110111, 0b01010011, 0b10100110, 0b01001011, 0b01111100, 0b11010111, 0b01101001, 0b11110010, 0b11001111, 0b01001111, 0b01101011, 0b10100111], # Node 267
-[0b01001011, 0b01111111, 0b00010101, 0b01111010, 0b10101110, 0b11101000, 0b00011000, 0b00001000, 0b11010000, 0b01000010, 0b00000000, 0b00100101, 0b01000000, 0b01100000, 0b10010101, 0b00001100, 0b11101110, 0b01001011, 0b01010010, 0b00110011, 0b00100101, 0b01010000, 0b10110010, 0b00010000, 0b10000110, 0b11110000, 0b11100110, 0b01001000, 0b10101000, 0b01010000, 0b00101001, 0b10010110, 0b11011010, 0b10100100, 0b01100001, 0b10001010, 0b00000110, 0b00100011, 0b11000111, 0b10101000, 0b11101110, 0b00011100, 0b10100110, 0b01101101, 0b01000010, 0b00111110, 0b00011000, 0b01011001, 0b11101010, 0b00110011, 0b10000111, 0b10001101, 0b01010001, 0b10101100, 0b00101001, 0b01010101, 0b00100100, 0b10011010, 0b00010100, 0b00101101, 0b10000000, 0b00100100, 0b11100001, 0b10010011, 0b11101000, 0b00110011, 0b00110110, 0b11000100, 0b01111000, 0b01110001, 0b10111101, 0b11010011, 0b01111000, 0b00001110, 0b10010110, 0b00010011, 0b00011011, 0b01110100, 0b11100110, 0b00010011, 0b10011100, 0b00110000, 0b11111110, 0b11001110, 0b01001001, 0b01001101, 0b11110001, 0b10001001, 0b00100010, 0b01001001, 0b10001001, 0b11101110, 0b10000000, 0b00000010, 0b11001001, 0b10101010, 0b00100000, 0b11011011], # Node 268
-[0b11100110, 0b01000010, 0b00110100, 0b00000000, 0b10011001, 0b10110011, 0b01011111, 0b01000001, 0b01010000, 0b11101111, 0b00110001, 0b01100001, 0b01011001, 0b00110000, 0b11010010, 0b11001011, 0b00100101, 0b11000001, 0b00010100, 0b10111111, 0b01101011, 0b10110001, 0b11110010, 0b11001000, 0b00100000, 0b01100010, 0b00110001, 0b01100000, 0b11000110, 0b01010001, 0b11100001, 0b10010000, 0b10100010, 0b10100111, 0b01000111, 0b00000000, 0b00001011, 0b01001110, 0b11010011, 0b10000111, 0b00001001, 0b10011111, 0b01001000, 0b01000100, 0b01000111, 0b10000110, 0b11111010, 0b10001110, 0b01101100, 0b01111010, 0b01100001, 0b10001001, 0b01000010, 0b11100010, 0b11101110, 0b10100000, 0b11001010, 0b01001111, 0b10100000, 0b11101110, 0b11010110, 0b01000010, 0b01100111, 0b11100101, 0b10110011, 0b10111010, 0b10000010, 0b00111100, 0b01101000, 0b10000010, 0b00111000, 0b01101111, 0b01100100, 0b11101001, 0b11111100, 0b00001001, 0b10100000, 0b01101100, 0b00001000, 0b01110011, 0b00110110, 0b00111010, 0b01001100, 0b00100011, 0b00000110, 0b00111000, 0b00101010, 0b01010000, 0b00010011, 0b11010001, 0b11100001, 0b10110111, 0b10000100, 0b00101000, 0b00001100, 0b10011101, 0b00010001, 0b10011101], # Node 269
-[0b11111111, 0b01011101, 0b10111011, 0b10010101, 0b11000100, 0b11111010, 0b11111011, 0b10111111, 0b11011111, 0b01101110, 0b11010101, 0b10111101, 0b01101111, 0b00010111, 0b11011100, 0b11111111, 0b00100001, 0b11010001, 0b11011111, 0b00011111, 0b11000011, 0b11011001, 0b11110000, 0b11001111, 0b01111100, 0b11101011, 0b01001001, 0b11110010, 0b10110101, 0b00011110, 0b10010011, 0b10111111, 0b00111110, 0b00100110, 0b10100001, 0b01001111, 0b01001000, 0b10001000, 0b10100110, 0b10010010, 0b01001101, 0b10000011, 0b01001101, 0b00011101, 0b01101011, 0b00011110, 0b01101101, 0b01110001, 0b11100100, 0b00011101, 0b00001101, 0b00111111, 0b11011111, 0b11101001, 0b11110010, 0b01001001, 0b01010110, 0b01110011, 0b10001110, 0b10000010, 0b01101110, 0b00001100, 0b11110010, 0b00010001, 0b01110011, 0b01010100, 0b01111011, 0b01101101, 0b11100000, 0b11011110, 0b10111111, 0b00011110, 0b11011110, 0b11100110, 0b00100010, 0b10111000, 0b11111110, 0b11101011, 0b11111110, 0b01101110, 0b11110100, 0b10001011, 0b01100111, 0b01101111, 0b10101110, 0b11011111, 0b11111111, 0b00011100, 0b11111101, 0b11110111, 0b10011000, 0b01011001, 0b10101111, 0b11110111, 0b11010011, 0b11011111, 0b00111111, 0b11101110], # Node 270
-[0b00100011, 0b00100001, 0b01100010, 0b11010010, 0b00100001, 0b00110101, 0b00010010, 0b01000110, 0b01100000, 0b00000110, 0b11000100, 0b01000010, 0b01011001, 0b00000110, 0b11000001, 0b00110001, 0b01100001, 0b00100001, 0b10000000, 0b00110011, 0b10000001, 0b10101001, 0b01111111, 0b01010001, 0b10010101, 0b01110000, 0b11111100, 0b01111110, 0b10000100, 0b10101111, 0b00011001, 0b01000000, 0b11110010, 0b10000011, 0b00000111, 0b01110000, 0b00000000, 0b10111100, 0b00111011, 0b01110011, 0b11100101, 0b00001011, 0b11100111, 0b10000111, 0b11111111, 0b11000001, 0b00100010, 0b01111000, 0b10001111, 0b10110100, 0b10011000, 0b01101110, 0b11100100, 0b10100101, 0b10110110, 0b10011101, 0b00000001, 0b01010110, 0b00001000, 0b11000000, 0b11110101, 0b00100000, 0b00001110, 0b11101000, 0b00011000, 0b10111100, 0b11100000, 0b10100001, 0b10000000, 0b00010000, 0b10100011, 0b00000000, 0b00111110, 0b01001000, 0b00111000, 0b01010111, 0b01111101, 0b00010011, 0b10000010, 0b01011110, 0b00001110, 0b00010010, 0b10000001, 0b00010000, 0b00110000, 0b00011100, 0b10010010, 0b00100010, 0b01010001, 0b00001010, 0b10000000, 0b10100010, 0b00111011, 0b00011000, 0b01100110, 0b01001001, 0b00100100, 0b10100100], # Node 271
-[0b01001010, 0b11000001, 0b11001011, 0b00000000, 0b00010110, 0b00000101, 0b01111110, 0b00001010, 0b00000000, 0b00011100, 0b00010101, 0b00111000, 0b11001111, 0b00000010, 0b11001100, 0b00001100, 0b00111010, 0b01111001, 0b11101001, 0b10001010, 0b00101110, 0b00000100, 0b01101000, 0b10111101, 0b00001001, 0b00100101, 0b11000010, 0b00000001, 0b00010100, 0b01000110, 0b11000001, 0b00100100, 0b11011101, 0b00111101, 0b00001000, 0b10110001, 0b00110000, 0b00100110, 0b10101010, 0b01000000, 0b11010000, 0b10110001, 0b00101010, 0b11011111, 0b00110100, 0b01001100, 0b01011111, 0b00111110, 0b01100111, 0b01001010, 0b11011010, 0b00100110, 0b01011001, 0b00000011, 0b01100010, 0b01000001, 0b10101000, 0b10111001, 0b10000010, 0b01101001, 0b10101111, 0b01000011, 0b10000000, 0b10111010, 0b01111101, 0b01100000, 0b01100110, 0b10111100, 0b01101110, 0b01101011, 0b10001011, 0b00001000, 0b01101001, 0b00001100, 0b01101110, 0b00000010, 0b01110000, 0b01010100, 0b01010111, 0b01100011, 0b00110010, 0b10011000, 0b00001001, 0b00000110, 0b10110110, 0b10010010, 0b11000000, 0b00001101, 0b00110110, 0b10001001, 0b01100101, 0b00100000, 0b11000100, 0b00101000, 0b10000011, 0b10101011, 0b01001110, 0b01101000], # Node 272
-[0b01001100, 0b10000000, 0b00001010, 0b00000100, 0b00000011, 0b01101000, 0b00010011, 0b01101110, 0b00101000, 0b11000101, 0b11011101, 0b00010100, 0b10010100, 0b11011100, 0b01000001, 0b11100101, 0b10000101, 0b01000101, 0b11101010, 0b01010100, 0b10111011, 0b01101100, 0b00100110, 0b01000011, 0b10110101, 0b10001000, 0b01011010, 0b10010100, 0b00001001, 0b11111011, 0b01100110, 0b10010100, 0b00101010, 0b10111011, 0b10010100, 0b01010101, 0b01100101, 0b00010101, 0b01000010, 0b01010100, 0b10101001, 0b00011110, 0b00010011, 0b11000101, 0b11011011, 0b10001111, 0b00001101, 0b00001111, 0b00110110, 0b01000100, 0b00001001, 0b10001101, 0b01001010, 0b10011001, 0b11010001, 0b10001000, 0b00110010, 0b01010001, 0b00011111, 0b01110011, 0b11011011, 0b00001000, 0b01001001, 0b11000101, 0b00001001, 0b10000101, 0b00111001, 0b11111001, 0b10001110, 0b11000000, 0b11011000, 0b01111011, 0b11100101, 0b11010111, 0b00100110, 0b10111100, 0b01010010, 0b01010001, 0b01000110, 0b01011110, 0b11000010, 0b01101010, 0b10001101, 0b10100000, 0b00001100, 0b10011101, 0b10111001, 0b00011011, 0b01011000, 0b00000110, 0b00011100, 0b11001110, 0b11000001, 0b01000111, 0b00101001, 0b01101111, 0b00101111, 0b00101000], # Node 273
-[0b10011001, 0b11111111, 0b11111111, 0b11111100, 0b10001001, 0b10111011, 0b11100111, 0b11100010, 0b10110010, 0b10001001, 0b00110110, 0b10011101, 0b10011011, 0b11111101, 0b11111000, 0b11101011, 0b00101111, 0b00001100, 0b11000000, 0b11101011, 0b11001101, 0b11101010, 0b11111111, 0b10000100, 0b10111100, 0b11111111, 0b00001011, 0b00110100, 0b11111101, 0b11111111, 0b01110001, 0b10001100, 0b11111111, 0b00011111, 0b10001101, 0b11111110, 0b11111101, 0b01001001, 0b11101100, 0b11101111, 0b10001111, 0b00101001, 0b11101110, 0b11111000, 0b10101111, 0b01110111, 0b11001101, 0b11110111, 0b10111011, 0b00111101, 0b11011001, 0b10111111, 0b10101010, 0b10000011, 0b11110001, 0b01010111, 0b00000001, 0b11100000, 0b01111111, 0b11011101, 0b01100010, 0b10101000, 0b10011111, 0b01001100, 0b10001101, 0b11111011, 0b10101111, 0b11011111, 0b01111101, 0b01011111, 0b10011111, 0b11111111, 0b11111111, 0b11011101, 0b11111111, 0b11111111, 0b11101111, 0b11111101, 0b11110111, 0b10110111, 0b01001000, 0b10111101, 0b11110010, 0b01101110, 0b11111100, 0b11010100, 0b10010010, 0b10100101, 0b01111101, 0b11110111, 0b01110001, 0b10101011, 0b10011101, 0b10010111, 0b01111110, 0b11000111, 0b11101111, 0b11111110], # Node 274
-[0b11100111, 0b11111110, 0b11101110, 0b11101001, 0b00011111, 0b10111111, 0b11111111, 0b10111000, 0b01110111, 0b11111001, 0b10111110, 0b11111111, 0b11111010, 0b11111111, 0b11001111, 0b01111101, 0b11110111, 0b11111111, 0b01001011, 0b11011001, 0b10111110, 0b01011111, 0b10011100, 0b11010100, 0b11111110, 0b00011011, 0b00000001, 0b11110100, 0b10101001, 0b00000000, 0b11010000, 0b01011111, 0b00000110, 0b00000000, 0b11111110, 0b00110111, 0b01100010, 0b01000001, 0b11111111, 0b10100001, 0b10000100, 0b01101110, 0b00111110, 0b11000001, 0b10001101, 0b11011101, 0b10001000, 0b01010100, 0b11110000, 0b11110111, 0b01100000, 0b00000000, 0b11111110, 0b01101001, 0b00011101, 0b01110100, 0b00010100, 0b00000111, 0b00001111, 0b11110100, 0b00011101, 0b10100100, 0b01101000, 0b11011101, 0b00001001, 0b00010011, 0b11010101, 0b10011100, 0b11000111, 0b01110011, 0b00110111, 0b00000011, 0b01100100, 0b11111111, 0b10011110, 0b10011011, 0b11111011, 0b01101110, 0b10010000, 0b10010110, 0b01111101, 0b00110111, 0b11000011, 0b11111010, 0b01101111, 0b01111000, 0b10011101, 0b01111001, 0b10110011, 0b11011011, 0b00011110, 0b11111011, 0b11111011, 0b01111111, 0b11000111, 0b11111111, 0b11111101, 0b01111111], # Node 275
-[0b01010000, 0b01100000, 0b00100000, 0b00110000, 0b00010000, 0b00000001, 0b00000100, 0b00001000, 0b00001000, 0b01000100, 0b10001010, 0b00010000, 0b00110000, 0b00000100, 0b00000010, 0b11101100, 0b10011110, 0b00101100, 0b11110001, 0b01100011, 0b10000000, 0b00000000, 0b00111010, 0b01010100, 0b00000001, 0b00100110, 0b01101101, 0b10001101, 0b00100000, 0b10011001, 0b11010000, 0b10010000, 0b00000110, 0b00010010, 0b00000111, 0b10101000, 0b00000000, 0b00010000, 0b00000001, 0b00001001, 0b11100000, 0b00000000, 0b10000100, 0b01000100, 0b00001110, 0b00000001, 0b00000001, 0b11111000, 0b00000101, 0b00000000, 0b10010111, 0b01110011, 0b11000011, 0b10000000, 0b01011000, 0b10000000, 0b01010000, 0b11111011, 0b00010000, 0b11011000, 0b10011101, 0b00100111, 0b00011000, 0b11111110, 0b01001111, 0b00001100, 0b00101110, 0b10100001, 0b00111111, 0b10010110, 0b11001001, 0b10000010, 0b00110101, 0b00000101, 0b00011100, 0b01110010, 0b00000100, 0b10001001, 0b10100011, 0b11100110, 0b00000001, 0b01000100, 0b10000010, 0b00000010, 0b00001110, 0b00101001, 0b00000001, 0b00000101, 0b11000000, 0b00000000, 0b01101000, 0b00010100, 0b01111100, 0b10100001, 0b10000000, 0b10000000, 0b10000000, 0b00100101], # Node 276
-[0b00000100, 0b00000110, 0b01000000, 0b00100001, 0b10000000, 0b00100110, 0b10000100, 0b00011010, 0b00001011, 0b11010111, 0b00101000, 0b00001010, 0b00100001, 0b00011100, 0b11100000, 0b10010100, 0b11000111, 0b10010011, 0b00110000, 0b10110000, 0b00010111, 0b01010000, 0b10000101, 0b00000000, 0b00110011, 0b00011110, 0b10001010, 0b10000000, 0b11000101, 0b10011110, 0b11111010, 0b10000000, 0b11001001, 0b01101001, 0b10000011, 0b11100111, 0b00001010, 0b10010100, 0b01001001, 0b00100000, 0b11101100, 0b10100000, 0b00110100, 0b01010010, 0b11000010, 0b00001101, 0b11101010, 0b00011001, 0b00001101, 0b01100011, 0b01100111, 0b00000001, 0b00010000, 0b00110011, 0b00111000, 0b00011001, 0b10001010, 0b01111100, 0b10011010, 0b01001100, 0b00011111, 0b10110010, 0b00100011, 0b00000010, 0b01100110, 0b00000111, 0b00001011, 0b10011000, 0b00011100, 0b00000011, 0b00101100, 0b10101101, 0b00101110, 0b01000001, 0b01000110, 0b01100111, 0b00000000, 0b01100110, 0b10111000, 0b00101111, 0b10010101, 0b10110001, 0b00010010, 0b01100001, 0b00000000, 0b10010010, 0b00010000, 0b00100000, 0b10100011, 0b00010100, 0b00010001, 0b00110101, 0b00010011, 0b00011000, 0b00001001, 0b11011000, 0b00110000, 0b00011011], # Node 277
-[0b11101001, 0b10111110, 0b01110100, 0b10101101, 0b11111010, 0b01111001, 0b00111011, 0b00111111, 0b10011010, 0b10100011, 0b11110010, 0b11001100, 0b11101011, 0b10100011, 0b11101100, 0b10010000, 0b00011100, 0b11100011, 0b11010010, 0b11001011, 0b10000011, 0b11100101, 0b00101001, 0b00100011, 0b11001101, 0b01000000, 0b00010001, 0b10111101, 0b10110000, 0b01100000, 0b01010010, 0b11101010, 0b01110101, 0b10111100, 0b10000001, 0b00010110, 0b00011000, 0b00100011, 0b10000101, 0b01111101, 0b11111100, 0b11010100, 0b01011000, 0b10110101, 0b10101111, 0b11011111, 0b00011110, 0b01111111, 0b10000101, 0b00011111, 0b10000011, 0b11100110, 0b00010000, 0b01111111, 0b10110011, 0b11011010, 0b11100111, 0b10101101, 0b11100001, 0b11001010, 0b01101101, 0b01111010, 0b11001101, 0b11111011, 0b00010011, 0b11100111, 0b11100101, 0b00000111, 0b11101011, 0b00010001, 0b01001111, 0b10010110, 0b11101010, 0b11011011, 0b00000111, 0b00010111, 0b11111111, 0b00111001, 0b11111101, 0b11110111, 0b10111100, 0b01100100, 0b11100001, 0b01010010, 0b11101111, 0b01000110, 0b11110000, 0b10101111, 0b11001110, 0b00000111, 0b10001010, 0b10110011, 0b01100010, 0b01110101, 0b01111100, 0b11001110, 0b01010101, 0b01111011], # Node 278
-[0b11101110, 0b11101111, 0b01111110, 0b11110010, 0b11011111, 0b11111110, 0b11110001, 0b11001101, 0b11001100, 0b01101110, 0b01011110, 0b01010100, 0b11111101, 0b11100110, 0b10111001, 0b01101000, 0b01111110, 0b10010001, 0b10100010, 0b00001110, 0b01100001, 0b11110110, 0b00101000, 0b10111001, 0b11001010, 0b11100000, 0b00000001, 0b10101100, 0b11101011, 0b11001001, 0b11001000, 0b11011111, 0b10010111, 0b01101111, 0b10101110, 0b00101011, 0b00011001, 0b10000000, 0b10001011, 0b01110101, 0b11111001, 0b10110001, 0b00001111, 0b00111010, 0b01100111, 0b01001111, 0b01010000, 0b10011001, 0b01001110, 0b11111100, 0b10111110, 0b00111001, 0b10000110, 0b01101001, 0b10010100, 0b10110011, 0b01010110, 0b00111110, 0b01100110, 0b11111101, 0b00010100, 0b11101011, 0b01111110, 0b11010101, 0b01111110, 0b10101111, 0b00111000, 0b00010110, 0b10111000, 0b00000011, 0b11011111, 0b00000000, 0b11110111, 0b11000001, 0b11101000, 0b11000000, 0b11000101, 0b00010101, 0b10000001, 0b10000100, 0b10000010, 0b01001111, 0b00111011, 0b00101111, 0b00101100, 0b01001100, 0b11011101, 0b10011111, 0b01110110, 0b00111100, 0b10011111, 0b01101100, 0b11001101, 0b10111010, 0b00110100, 0b10100001, 0b10111111, 0b00011010], # Node 279
-[0b00000001, 0b00001110, 0b00001000, 0b10001001, 0b00000000, 0b00100001, 0b00110100, 0b01110000, 0b01000011, 0b00011000, 0b00000000, 0b00001000, 0b11111101, 0b00001000, 0b00100110, 0b11000000, 0b10001111, 0b01101100, 0b00000000, 0b11111100, 0b00100111, 0b00000000, 0b11100000, 0b11111111, 0b01010100, 0b10000000, 0b10111111, 0b10111111, 0b00001000, 0b00011110, 0b11110000, 0b01001111, 0b11110000, 0b10000011, 0b10111110, 0b00000000, 0b00111011, 0b11100000, 0b01000011, 0b10110000, 0b00000011, 0b00011110, 0b00000000, 0b00111100, 0b01000000, 0b01000101, 0b11000000, 0b00000001, 0b00000000, 0b00011001, 0b00111100, 0b00000000, 0b00110000, 0b11100000, 0b00000001, 0b01000000, 0b11100010, 0b00011000, 0b00011000, 0b00101010, 0b11111111, 0b01100000, 0b01100010, 0b11110010, 0b00001111, 0b00110110, 0b01010010, 0b11111110, 0b11111001, 0b11001110, 0b11100010, 0b11111111, 0b11110011, 0b00100111, 0b11111100, 0b00010011, 0b00011111, 0b00000000, 0b10011111, 0b01110100, 0b00000010, 0b10000010, 0b00000111, 0b00010100, 0b00000010, 0b01011100, 0b00010011, 0b00100000, 0b00000000, 0b11000100, 0b00110001, 0b00011100, 0b00000000, 0b00000000, 0b00001000, 0b00000001, 0b00110011, 0b10011010], # Node 280
-[0b01100101, 0b00111100, 0b11001111, 0b11011010, 0b01010010, 0b10011001, 0b01101011, 0b11011101, 0b10101011, 0b11010101, 0b11101111, 0b11010001, 0b11100110, 0b00011100, 0b00111111, 0b00101110, 0b11100110, 0b11111011, 0b00101111, 0b11100000, 0b01110111, 0b10001100, 0b01011100, 0b11111001, 0b10011100, 0b11010100, 0b01000101, 0b10001100, 0b11111111, 0b01111101, 0b11011111, 0b01111111, 0b01110111, 0b11111100, 0b01001000, 0b11111011, 0b11101111, 0b01001001, 0b00111101, 0b01100111, 0b00011111, 0b11101011, 0b11011011, 0b00000110, 0b11001101, 0b10110101, 0b10101110, 0b11100110, 0b11110000, 0b11110001, 0b00000000, 0b10101110, 0b10111110, 0b01101111, 0b00000001, 0b11010111, 0b11101111, 0b01101110, 0b01111011, 0b11011001, 0b11011101, 0b10010010, 0b11101010, 0b10111111, 0b00111010, 0b10100111, 0b00111111, 0b01101111, 0b00000011, 0b10110010, 0b10000001, 0b10000101, 0b11011001, 0b11110011, 0b11001111, 0b10000001, 0b00010010, 0b01111110, 0b00011101, 0b11111010, 0b11101110, 0b11111101, 0b00010001, 0b11111010, 0b11011101, 0b11110101, 0b11111100, 0b01001011, 0b10011001, 0b00011010, 0b10101111, 0b01011010, 0b00011010, 0b01001110, 0b00001100, 0b10010010, 0b01111111, 0b11011000], # Node 281
-[0b10000000, 0b10010010, 0b00001101, 0b10000101, 0b01110000, 0b00000011, 0b10010111, 0b00011001, 0b00010000, 0b10011001, 0b00011000, 0b00000001, 0b00001011, 0b10010011, 0b11100100, 0b01100100, 0b01100100, 0b00011101, 0b01111000, 0b00001000, 0b10101000, 0b10000101, 0b00110100, 0b11111010, 0b00000001, 0b00111110, 0b10001110, 0b10110110, 0b10111011, 0b00100101, 0b00100001, 0b10001010, 0b00011010, 0b00101011, 0b10110110, 0b11011111, 0b00110101, 0b00110101, 0b01001000, 0b01010110, 0b00100011, 0b01100111, 0b00100111, 0b11000100, 0b11000001, 0b01000110, 0b00011000, 0b01101000, 0b00100111, 0b10011100, 0b00001111, 0b00011001, 0b10001100, 0b00010101, 0b01001101, 0b10110111, 0b00000001, 0b11001000, 0b10110100, 0b01110001, 0b00111011, 0b01010101, 0b10011010, 0b00000001, 0b00001000, 0b11111011, 0b00101000, 0b01000011, 0b00110100, 0b11010000, 0b10001000, 0b01100111, 0b10000011, 0b00101110, 0b00111101, 0b01001001, 0b00001100, 0b00011011, 0b01000111, 0b00110101, 0b01000001, 0b00000100, 0b00000001, 0b00000001, 0b11000000, 0b00101010, 0b10000110, 0b11001101, 0b11011000, 0b10100100, 0b01001000, 0b11111110, 0b11101000, 0b01100000, 0b11111111, 0b00000001, 0b11111100, 0b01000010], # Node 282
-[0b10001001, 0b00100000, 0b00100000, 0b10100000, 0b10001111, 0b00000101, 0b00011010, 0b01110110, 0b11000000, 0b10100110, 0b00110100, 0b10110000, 0b01100000, 0b10000101, 0b10001001, 0b10111001, 0b11000100, 0b10001000, 0b01000100, 0b10010011, 0b01001010, 0b00000010, 0b01110101, 0b11111101, 0b01000111, 0b10110011, 0b10001011, 0b10101110, 0b00011011, 0b00111111, 0b01010001, 0b00010110, 0b01010101, 0b00000011, 0b01000101, 0b10000111, 0b01111101, 0b00101010, 0b10000110, 0b10010011, 0b10011000, 0b00100110, 0b11010000, 0b10101110, 0b11001100, 0b00000100, 0b00110110, 0b11001101, 0b00110001, 0b11100100, 0b11011001, 0b11110001, 0b00000001, 0b11111100, 0b10001110, 0b11100011, 0b11101110, 0b10101101, 0b01001110, 0b01010000, 0b10101000, 0b10111101, 0b10001111, 0b00001101, 0b01100000, 0b00010100, 0b01100010, 0b00111101, 0b10010111, 0b11000000, 0b00100000, 0b00111001, 0b10010100, 0b11100000, 0b00101000, 0b11000000, 0b01000001, 0b11000110, 0b00101001, 0b10011100, 0b10001100, 0b01010010, 0b11010011, 0b00100000, 0b00001110, 0b01000000, 0b10010101, 0b11001000, 0b00010010, 0b00111111, 0b10001000, 0b10010111, 0b00011100, 0b00001001, 0b11110100, 0b01100001, 0b00101100, 0b11010000], # Node 283
-[0b00111111, 0b11000101, 0b00101010, 0b10000011, 0b00100100, 0b00110000, 0b10010000, 0b01001011, 0b00101010, 0b00010001, 0b00001000, 0b01100010, 0b00011101, 0b00010001, 0b00001001, 0b00011001, 0b10010000, 0b00001010, 0b00000001, 0b01000000, 0b10000000, 0b00001111, 0b10000101, 0b10111111, 0b11010000, 0b01000100, 0b11111111, 0b00101000, 0b00000000, 0b11111000, 0b00111001, 0b00000011, 0b10000001, 0b10001111, 0b00000110, 0b00000010, 0b00111111, 0b10100100, 0b00000000, 0b11110000, 0b11000000, 0b00110101, 0b00010010, 0b00000111, 0b01111110, 0b00110001, 0b11111011, 0b11110000, 0b00100000, 0b10011100, 0b01111111, 0b01000011, 0b00100101, 0b11110110, 0b00111111, 0b00000000, 0b01001101, 0b10111100, 0b00100001, 0b01101110, 0b01000000, 0b00011110, 0b01000000, 0b10000011, 0b11000000, 0b00000000, 0b00110000, 0b00100010, 0b00001111, 0b10100010, 0b11100100, 0b00110001, 0b10000000, 0b01001011, 0b11111110, 0b11000011, 0b10101000, 0b10100000, 0b00011101, 0b11100110, 0b00001100, 0b11110000, 0b00000001, 0b00010100, 0b00010000, 0b00001110, 0b10011100, 0b00010000, 0b11110110, 0b10011000, 0b00011110, 0b11001000, 0b01000011, 0b00001000, 0b10000110, 0b00011111, 0b00110001, 0b11010000], # Node 284
-[0b00100010, 0b01010001, 0b00010000, 0b11000000, 0b01001000, 0b11010010, 0b00000000, 0b01001010, 0b10001101, 0b11000110, 0b00010111, 0b11001000, 0b01110000, 0b01010100, 0b00001000, 0b10100001, 0b11111000, 0b11111101, 0b00001000, 0b01001100, 0b00000101, 0b01101000, 0b10000101, 0b11010001, 0b00001000, 0b01001010, 0b10001011, 0b01001000, 0b11000100, 0b11001000, 0b10001000, 0b01100000, 0b11110010, 0b11110010, 0b00100001, 0b11101100, 0b11001011, 0b11100100, 0b10010110, 0b11110000, 0b01001100, 0b00010100, 0b10000110, 0b10110111, 0b01010010, 0b00101001, 0b00011000, 0b11111100, 0b00101001, 0b10110011, 0b11100011, 0b01010101, 0b00101001, 0b01001001, 0b00011110, 0b11100000, 0b01011001, 0b01001001, 0b00000101, 0b00010010, 0b00110010, 0b10010011, 0b00000001, 0b00010110, 0b10000000, 0b00011101, 0b01000000, 0b00101100, 0b00101000, 0b10001011, 0b10010011, 0b00100000, 0b00101110, 0b10101011, 0b01001000, 0b11010111, 0b11011000, 0b11000001, 0b00001000, 0b01011100, 0b00101000, 0b00110111, 0b00101010, 0b00010100, 0b01010001, 0b11000010, 0b11101111, 0b10110000, 0b10000001, 0b00110001, 0b10000010, 0b00000010, 0b10110100, 0b01101000, 0b01010011, 0b00000011, 0b00000000, 0b10100001], # Node 285
-[0b10000000, 0b01111011, 0b01111000, 0b10100101, 0b00000100, 0b00010100, 0b11101000, 0b01011011, 0b01000000, 0b10000011, 0b11011111, 0b11111010, 0b01111111, 0b01100000, 0b10100010, 0b11111110, 0b00011111, 0b00011010, 0b01001110, 0b11111111, 0b01100011, 0b01111010, 0b11111110, 0b00111111, 0b10010110, 0b11111111, 0b10011111, 0b11111111, 0b11111111, 0b00111111, 0b01111110, 0b11011000, 0b00001111, 0b11100000, 0b01001111, 0b00011001, 0b00000000, 0b11111111, 0b11100100, 0b00000000, 0b11110000, 0b11110111, 0b00001010, 0b10000000, 0b00011111, 0b00100110, 0b00000000, 0b01111111, 0b11100000, 0b00000001, 0b11110000, 0b00000011, 0b01001110, 0b11000000, 0b00001111, 0b11100000, 0b00111111, 0b11111110, 0b00000000, 0b11001111, 0b11111011, 0b10010111, 0b01111000, 0b11111101, 0b10011111, 0b11001011, 0b11111111, 0b11111111, 0b11111000, 0b11111110, 0b11111110, 0b00000111, 0b11100111, 0b11110111, 0b01011111, 0b11000000, 0b00011100, 0b11111101, 0b00011111, 0b00001000, 0b11100000, 0b00111111, 0b00000111, 0b10000000, 0b01110101, 0b11111111, 0b00000001, 0b10110110, 0b11110001, 0b00101111, 0b00100000, 0b00000110, 0b00000000, 0b01000000, 0b00110110, 0b11110000, 0b10011110, 0b11101100], # Node 286
-[0b11010111, 0b11011011, 0b11001100, 0b11101111, 0b11100101, 0b11001011, 0b00101011, 0b11111011, 0b11111111, 0b11101100, 0b00110110, 0b10011111, 0b01101111, 0b10111001, 0b10011100, 0b11111011, 0b10111111, 0b10011011, 0b11011111, 0b11111000, 0b01111110, 0b11010110, 0b00000111, 0b11110101, 0b10010011, 0b00011011, 0b11000100, 0b01110110, 0b10111111, 0b00100001, 0b00011110, 0b10111101, 0b01001010, 0b11110001, 0b11111100, 0b11011011, 0b10110010, 0b00111110, 0b11011110, 0b01001001, 0b11111001, 0b10110111, 0b01100000, 0b01111110, 0b01111011, 0b10111100, 0b11110110, 0b11101011, 0b10010110, 0b00111101, 0b10111011, 0b00111110, 0b11100101, 0b11110001, 0b11111100, 0b11100011, 0b10011110, 0b10011111, 0b00101111, 0b10110010, 0b01111000, 0b11001100, 0b10111100, 0b00011001, 0b01111111, 0b00010111, 0b11110111, 0b11011111, 0b00001000, 0b11100110, 0b00011011, 0b11111110, 0b11110000, 0b11110011, 0b10110011, 0b11000101, 0b11011010, 0b01110011, 0b00001100, 0b11001000, 0b00111101, 0b01000100, 0b10010010, 0b01101010, 0b01111101, 0b10011110, 0b01111010, 0b11111001, 0b11010111, 0b11110011, 0b11011001, 0b01111001, 0b01111111, 0b11011001, 0b01111001, 0b10011000, 0b11111111, 0b01000101], # Node 287
-[0b11101000, 0b00101110, 0b01101111, 0b11001011, 0b01111110, 0b11100001, 0b01111011, 0b00101110, 0b01101011, 0b10001110, 0b01100101, 0b01111010, 0b00000000, 0b01011111, 0b11101001, 0b00111100, 0b10010100, 0b11110110, 0b01001110, 0b01110100, 0b11111101, 0b01101001, 0b11001111, 0b01100001, 0b01000100, 0b01101000, 0b10011010, 0b10101101, 0b01010011, 0b11111000, 0b10010100, 0b10100111, 0b00100011, 0b10100111, 0b01111111, 0b10111101, 0b00101111, 0b00100001, 0b01000100, 0b11000011, 0b00111110, 0b00110011, 0b00010111, 0b00101010, 0b11001011, 0b11110111, 0b00010111, 0b00000111, 0b11010000, 0b00101111, 0b11011101, 0b10111111, 0b11011101, 0b01000011, 0b01001010, 0b11101000, 0b00110111, 0b11101110, 0b00001000, 0b10011010, 0b11011101, 0b10011110, 0b10001010, 0b11011110, 0b10010001, 0b01110011, 0b11111111, 0b00101110, 0b01010111, 0b11111101, 0b01011101, 0b01000010, 0b00000000, 0b00001110, 0b00101111, 0b00111101, 0b00010101, 0b00010010, 0b01101010, 0b11101111, 0b10010101, 0b10101100, 0b00001110, 0b11101101, 0b10001111, 0b11100101, 0b00101111, 0b11100010, 0b11011100, 0b10111100, 0b11111110, 0b01111010, 0b10011001, 0b10001111, 0b01110101, 0b11001100, 0b01011011, 0b11010001], # Node 288
-[0b00111100, 0b01011000, 0b10111010, 0b11011111, 0b11010010, 0b10101101, 0b11111000, 0b00001101, 0b00111111, 0b00011001, 0b10111001, 0b10101110, 0b01111001, 0b11101010, 0b01010111, 0b00011010, 0b01111001, 0b00110101, 0b00100011, 0b10101111, 0b11110111, 0b00000110, 0b10100011, 0b10100111, 0b11100111, 0b00011011, 0b00110011, 0b11101110, 0b10110001, 0b00000010, 0b01011010, 0b11111110, 0b11011000, 0b00010010, 0b00111010, 0b01111100, 0b01010110, 0b10101110, 0b01111000, 0b00011111, 0b01010011, 0b01001001, 0b00011010, 0b01000001, 0b01010011, 0b10011001, 0b10101110, 0b11000001, 0b11010011, 0b11111110, 0b00100011, 0b00100111, 0b00110101, 0b11011110, 0b01001010, 0b11110110, 0b10010011, 0b10011011, 0b00101101, 0b11011011, 0b10101101, 0b01000001, 0b00010111, 0b01001111, 0b01100101, 0b10111011, 0b01011001, 0b01010110, 0b01010011, 0b10101010, 0b00110100, 0b11110011, 0b10111100, 0b11001000, 0b01001011, 0b10100100, 0b01000101, 0b01001111, 0b10000100, 0b10100000, 0b11101100, 0b01111101, 0b00110011, 0b00111011, 0b01010111, 0b11001111, 0b00101111, 0b11010110, 0b11111111, 0b01110001, 0b11001110, 0b01111011, 0b11101010, 0b11001011, 0b01010010, 0b00010111, 0b00110110, 0b00101010], # Node 289
-[0b11101111, 0b01110111, 0b10100111, 0b10111101, 0b10111111, 0b11011111, 0b10111011, 0b11110100, 0b11101111, 0b11111100, 0b11111111, 0b11101011, 0b11111001, 0b10110101, 0b00101011, 0b01101111, 0b00111110, 0b01011111, 0b10010010, 0b11001000, 0b11101011, 0b00110110, 0b10100111, 0b00100000, 0b11110111, 0b00010011, 0b10000100, 0b01100111, 0b00100110, 0b00000010, 0b01100001, 0b11101011, 0b11110011, 0b00000000, 0b11001110, 0b11101011, 0b01010101, 0b11101100, 0b10010111, 0b11111110, 0b01000111, 0b11101110, 0b11011001, 0b11101101, 0b01110011, 0b11111111, 0b11001010, 0b01011111, 0b11011011, 0b11110010, 0b01011111, 0b00100101, 0b01111100, 0b11111110, 0b11100010, 0b10110011, 0b11101110, 0b00000000, 0b10011111, 0b11011101, 0b00101000, 0b11111000, 0b11110001, 0b10100001, 0b10000100, 0b01000111, 0b11101111, 0b00000111, 0b10111000, 0b11100000, 0b00000111, 0b11110010, 0b10001000, 0b11111100, 0b00100100, 0b00010100, 0b10000001, 0b00111111, 0b11000100, 0b00100101, 0b11111110, 0b00001011, 0b00001110, 0b11101001, 0b11011111, 0b11110010, 0b01011110, 0b10101100, 0b01100011, 0b11111111, 0b11010010, 0b11011010, 0b11111111, 0b11010101, 0b11111001, 0b11111111, 0b11011111, 0b10101011], # Node 290
-[0b01001010, 0b00011101, 0b01000110, 0b01001000, 0b00000010, 0b00001001, 0b10100100, 0b10001110, 0b01000110, 0b10011000, 0b00011110, 0b10100100, 0b10010001, 0b00010100, 0b00011001, 0b00000100, 0b00101101, 0b11011001, 0b01010000, 0b11001010, 0b01110010, 0b01100000, 0b01110011, 0b00101100, 0b00000000, 0b01000010, 0b01111000, 0b10011100, 0b10100111, 0b00000000, 0b11101001, 0b00011010, 0b00001000, 0b01100111, 0b00110000, 0b00001110, 0b01000000, 0b00110001, 0b10010110, 0b01110011, 0b01001010, 0b01000110, 0b11100000, 0b00101000, 0b00111100, 0b00010110, 0b01101100, 0b11001001, 0b11000111, 0b01101101, 0b10111101, 0b10100100, 0b01101001, 0b11101010, 0b10110000, 0b01001101, 0b01101000, 0b10100000, 0b01001111, 0b11100111, 0b00100000, 0b10100000, 0b00001101, 0b01100101, 0b00010001, 0b10110100, 0b00000111, 0b00000011, 0b01000000, 0b10000101, 0b10000010, 0b01010000, 0b00000000, 0b01000100, 0b01010110, 0b00001100, 0b00100000, 0b10111110, 0b11011010, 0b10010100, 0b11011000, 0b01101000, 0b10011111, 0b10000100, 0b00000010, 0b00101000, 0b00111100, 0b00000110, 0b10010011, 0b10100111, 0b00000000, 0b10000100, 0b00011000, 0b11010100, 0b00101001, 0b00110001, 0b10010000, 0b00001000], # Node 291
-[0b00110011, 0b00001111, 0b00010011, 0b10110110, 0b11101111, 0b00011001, 0b11110110, 0b01010110, 0b01011010, 0b11011010, 0b11101101, 0b11010111, 0b11000111, 0b11011101, 0b10001110, 0b10011011, 0b11011100, 0b11011011, 0b11011101, 0b11111100, 0b10101111, 0b00011010, 0b11001111, 0b11100111, 0b11011110, 0b01000011, 0b11010010, 0b01101111, 0b01001110, 0b00000001, 0b10111010, 0b01111010, 0b10001001, 0b11000010, 0b11111000, 0b10110110, 0b01000001, 0b10000100, 0b10101111, 0b11101110, 0b11011111, 0b01101011, 0b01110111, 0b01110010, 0b10111111, 0b01100010, 0b10101110, 0b11110111, 0b00110000, 0b10010011, 0b11110000, 0b11111111, 0b01111101, 0b10110100, 0b11001011, 0b01101100, 0b11110111, 0b10101110, 0b01100101, 0b11001011, 0b01111010, 0b11010011, 0b00001000, 0b11101111, 0b01110101, 0b11100101, 0b10111110, 0b01111111, 0b10001001, 0b11111010, 0b00011000, 0b00111100, 0b01101101, 0b10011101, 0b10000111, 0b11010111, 0b10011100, 0b10110001, 0b01011011, 0b10001111, 0b10100100, 0b10001111, 0b11000010, 0b01111111, 0b10100101, 0b11110001, 0b01000111, 0b10010010, 0b11101010, 0b10001011, 0b11011001, 0b10110011, 0b00001010, 0b10010111, 0b11000011, 0b01110111, 0b01101001, 0b11111111], # Node 292
-[0b00000100, 0b01000001, 0b11100111, 0b01100001, 0b11010001, 0b11101101, 0b10000101, 0b10001001, 0b00001111, 0b10100100, 0b01111110, 0b11000010, 0b01110010, 0b00000100, 0b00100100, 0b10000111, 0b01101011, 0b01100001, 0b01100100, 0b00111111, 0b11001110, 0b10001011, 0b01111001, 0b01000111, 0b00101010, 0b10100110, 0b00000100, 0b11010001, 0b11010100, 0b00110110, 0b01001011, 0b01001000, 0b11111111, 0b10101110, 0b10001001, 0b00000000, 0b00011011, 0b01110101, 0b11010111, 0b01100110, 0b11100110, 0b00100100, 0b01110001, 0b01011010, 0b11111001, 0b00100001, 0b00011001, 0b11001101, 0b10100110, 0b00011100, 0b11011111, 0b01000000, 0b10100101, 0b11011101, 0b01010001, 0b00100011, 0b11010110, 0b01000000, 0b11110110, 0b00101000, 0b11010101, 0b10001110, 0b00001101, 0b01100001, 0b00110010, 0b10001000, 0b10001000, 0b10001000, 0b10100011, 0b00001011, 0b00000110, 0b11111111, 0b00011011, 0b00101100, 0b00001001, 0b00000000, 0b00111000, 0b10001101, 0b01010110, 0b00000110, 0b11010000, 0b01000101, 0b00100010, 0b00011000, 0b10001110, 0b01100010, 0b11010110, 0b10100011, 0b11111111, 0b10000100, 0b11100000, 0b10111000, 0b00000000, 0b01110110, 0b00101101, 0b10000011, 0b10000010, 0b10000010], # Node 293
-[0b11010110, 0b00101100, 0b01100011, 0b11000000, 0b11100011, 0b00010001, 0b10100100, 0b11000000, 0b00000000, 0b01001000, 0b10000000, 0b10010010, 0b00001001, 0b10001000, 0b11000001, 0b11101011, 0b11101110, 0b00000010, 0b11111001, 0b00111100, 0b10000010, 0b01001000, 0b01101100, 0b10001010, 0b11011101, 0b00110000, 0b10100000, 0b01100000, 0b11111001, 0b01101010, 0b00001011, 0b00001100, 0b10111001, 0b10000100, 0b00100001, 0b11101000, 0b01010100, 0b10011111, 0b01101101, 0b00001101, 0b01101100, 0b11101011, 0b11111001, 0b10100100, 0b10110010, 0b11000100, 0b00111100, 0b10110100, 0b01100011, 0b01000000, 0b11010010, 0b01111001, 0b11010000, 0b00011111, 0b01001110, 0b01010101, 0b11011000, 0b01100011, 0b11011110, 0b01110000, 0b01101110, 0b00011100, 0b00010101, 0b00110101, 0b11110111, 0b01100000, 0b10001000, 0b00010000, 0b01011111, 0b11000111, 0b00111001, 0b11111001, 0b01111100, 0b10010010, 0b10111010, 0b11011101, 0b01010010, 0b10100001, 0b00011100, 0b00010101, 0b01011010, 0b10000100, 0b10001000, 0b01111001, 0b00100011, 0b11010101, 0b01110010, 0b10110001, 0b11101000, 0b10011111, 0b01011100, 0b00100000, 0b00101010, 0b10000001, 0b01000100, 0b00000001, 0b11110000, 0b01000001], # Node 294
-[0b11001110, 0b00011111, 0b11110011, 0b01111000, 0b11011111, 0b11110110, 0b11101011, 0b11010010, 0b11100100, 0b01101110, 0b10001101, 0b10100100, 0b10011011, 0b01111110, 0b01000101, 0b01011000, 0b10101101, 0b01101101, 0b10111001, 0b11010001, 0b00011010, 0b11110010, 0b00100111, 0b10001000, 0b11111100, 0b10010011, 0b10100111, 0b01101111, 0b11001010, 0b00111001, 0b00101100, 0b00111010, 0b10100101, 0b00111110, 0b01111001, 0b10010110, 0b00000111, 0b10100100, 0b11011010, 0b00101111, 0b11101000, 0b00111101, 0b10011111, 0b01001000, 0b10111111, 0b11010011, 0b01011010, 0b01001001, 0b00001011, 0b11011111, 0b01110101, 0b11010010, 0b11110011, 0b10100010, 0b10100110, 0b00011110, 0b10111000, 0b01110010, 0b11100010, 0b10101001, 0b00010100, 0b00011111, 0b11111011, 0b00101101, 0b10101000, 0b10111110, 0b11110111, 0b01100110, 0b01000001, 0b11000000, 0b00001101, 0b01011100, 0b11000111, 0b00000110, 0b01011000, 0b11100110, 0b10110001, 0b10100100, 0b10101010, 0b10100110, 0b00110110, 0b01101010, 0b10011010, 0b01111101, 0b00110111, 0b11100110, 0b01100111, 0b10011011, 0b01111101, 0b11011111, 0b01001001, 0b11011110, 0b11101101, 0b10111000, 0b11111110, 0b01111101, 0b01111000, 0b10000011], # Node 295
-[0b00111011, 0b01100000, 0b00101001, 0b10010011, 0b10000001, 0b01110111, 0b11001101, 0b00010010, 0b10010010, 0b11000101, 0b00100111, 0b10110110, 0b10101011, 0b11110001, 0b10110111, 0b01111011, 0b10001010, 0b10001001, 0b00111101, 0b01000101, 0b01011100, 0b10110111, 0b00010111, 0b11111011, 0b10001101, 0b10100101, 0b10001100, 0b11110100, 0b00110110, 0b00110100, 0b10010111, 0b01110101, 0b01011000, 0b10101010, 0b11111101, 0b01011001, 0b11111011, 0b11100011, 0b11011101, 0b10100100, 0b10110111, 0b01100001, 0b01111101, 0b00110011, 0b00101010, 0b01011100, 0b00000111, 0b11010100, 0b01111010, 0b00110111, 0b11100000, 0b01111100, 0b11111001, 0b01101111, 0b11000110, 0b10111101, 0b10101011, 0b11011111, 0b01100110, 0b01100011, 0b11100011, 0b10010100, 0b11011110, 0b01011001, 0b01110100, 0b00011011, 0b11111111, 0b11101111, 0b10010000, 0b11101110, 0b11110011, 0b00100011, 0b10100011, 0b11100101, 0b10000000, 0b00101011, 0b00101101, 0b11011001, 0b11111110, 0b00111001, 0b11010111, 0b01100011, 0b11100001, 0b01110011, 0b01000010, 0b10101011, 0b00111100, 0b01111110, 0b01100011, 0b01010110, 0b01001011, 0b01111011, 0b01110110, 0b00101111, 0b00101010, 0b11101100, 0b01001001, 0b11011110], # Node 296
-[0b11101110, 0b10100000, 0b10000000, 0b01010101, 0b00100010, 0b01000110, 0b00100001, 0b10000101, 0b00110100, 0b00110110, 0b01001011, 0b11000101, 0b01001000, 0b11110100, 0b01001001, 0b01011001, 0b10110100, 0b11011001, 0b00001010, 0b10000011, 0b01010000, 0b01100101, 0b00101011, 0b11101101, 0b10100010, 0b00001100, 0b00111011, 0b10011010, 0b10000111, 0b01001001, 0b00001101, 0b00110001, 0b01010101, 0b11000100, 0b10010110, 0b00100000, 0b01100001, 0b10010010, 0b10000011, 0b00101011, 0b11011001, 0b00110001, 0b00101110, 0b01001001, 0b00000000, 0b00010010, 0b11101000, 0b10000010, 0b00010101, 0b01100100, 0b01011000, 0b00011011, 0b11010111, 0b11101001, 0b00110101, 0b01000001, 0b00100100, 0b10001001, 0b00111110, 0b00010001, 0b10001000, 0b00001101, 0b11110010, 0b11001011, 0b10101000, 0b11100101, 0b01000011, 0b00101010, 0b00101101, 0b00110100, 0b11001000, 0b11110100, 0b10110011, 0b00101110, 0b00010010, 0b00000000, 0b01100110, 0b11011010, 0b10010000, 0b11000101, 0b10110100, 0b01100000, 0b01000110, 0b01000010, 0b11010101, 0b11010000, 0b00011111, 0b10110000, 0b11100000, 0b00000010, 0b11110111, 0b00000100, 0b01001100, 0b10010010, 0b00100100, 0b01100111, 0b10001010, 0b01000100], # Node 297
-[0b10001100, 0b10010010, 0b00011101, 0b10000101, 0b00011110, 0b11000100, 0b00001001, 0b00001001, 0b01001000, 0b00101110, 0b10110110, 0b01010101, 0b00010101, 0b10110000, 0b01100000, 0b10010111, 0b11101001, 0b01001000, 0b01010011, 0b01111100, 0b10000010, 0b11100000, 0b11110000, 0b10111000, 0b00000000, 0b11000000, 0b00010111, 0b10010010, 0b10000000, 0b11111000, 0b11000000, 0b00010001, 0b11110011, 0b01001011, 0b10001100, 0b01011010, 0b11001111, 0b10101000, 0b01010110, 0b11100100, 0b01100111, 0b10111011, 0b00100000, 0b01111110, 0b01010111, 0b00000010, 0b11110000, 0b00010101, 0b00100010, 0b10001110, 0b01111110, 0b10001110, 0b11001000, 0b11000010, 0b01011110, 0b10101101, 0b00001000, 0b10010000, 0b10000111, 0b01000000, 0b00000101, 0b11101000, 0b11000010, 0b00100000, 0b01111000, 0b10110011, 0b00010000, 0b11001110, 0b10000011, 0b00100100, 0b00010100, 0b10011001, 0b01110000, 0b01100000, 0b11011101, 0b11011010, 0b00100000, 0b10100001, 0b11011010, 0b01010101, 0b00000000, 0b11110010, 0b00101111, 0b00000001, 0b00100101, 0b11011000, 0b00100000, 0b01000100, 0b10000000, 0b00001001, 0b01101010, 0b01110000, 0b00000100, 0b01110000, 0b10110011, 0b01001110, 0b00100100, 0b00010101], # Node 298
-[0b01101011, 0b00011110, 0b10011101, 0b01010101, 0b11111110, 0b11011001, 0b10000111, 0b00110011, 0b01100101, 0b11101111, 0b10011001, 0b01101000, 0b10110101, 0b11011010, 0b11110110, 0b11110010, 0b00001011, 0b00111001, 0b00010111, 0b01100101, 0b00000000, 0b11100010, 0b11111011, 0b00100110, 0b11010011, 0b11000100, 0b11111001, 0b11011010, 0b00000101, 0b00001111, 0b01111101, 0b10100101, 0b11111110, 0b01111000, 0b11001101, 0b00001100, 0b10010001, 0b11001000, 0b11110101, 0b00101011, 0b11000110, 0b11011110, 0b11101110, 0b11111000, 0b10111110, 0b11101110, 0b11001010, 0b01110100, 0b00010101, 0b01010100, 0b00001110, 0b00010010, 0b10010001, 0b01110110, 0b11010000, 0b11011010, 0b00100011, 0b01110101, 0b11110111, 0b11110011, 0b10111001, 0b11011111, 0b00111111, 0b11111011, 0b10010010, 0b10110010, 0b00010101, 0b01111100, 0b11000100, 0b11001100, 0b01001100, 0b11010111, 0b11111100, 0b11111011, 0b10010101, 0b11111010, 0b11111011, 0b10111101, 0b11010010, 0b11001111, 0b11111110, 0b00011111, 0b00000101, 0b10001110, 0b11001101, 0b10111110, 0b11011101, 0b10101111, 0b01011111, 0b01110111, 0b10110100, 0b11111110, 0b01101110, 0b11101011, 0b11011011, 0b11001101, 0b00100111, 0b11111110], # Node 299
-[0b00011111, 0b11000011, 0b10000011, 0b11000010, 0b11001100, 0b01001000, 0b11001101, 0b11100011, 0b01101011, 0b10000101, 0b11111010, 0b01101111, 0b10100000, 0b10100010, 0b01100101, 0b00111000, 0b10001011, 0b01010000, 0b01100100, 0b01000001, 0b01000000, 0b10001001, 0b01110100, 0b00000100, 0b01001011, 0b01011101, 0b01110110, 0b11100001, 0b00100010, 0b10100110, 0b01010011, 0b00010100, 0b00000100, 0b00001000, 0b01110111, 0b11011100, 0b11111010, 0b10001111, 0b10101000, 0b11001110, 0b01000111, 0b11101000, 0b00000010, 0b11100000, 0b10001101, 0b00001000, 0b11010011, 0b00010111, 0b00000001, 0b01100000, 0b00101100, 0b11111010, 0b10100001, 0b11101011, 0b11100100, 0b01000000, 0b11000000, 0b10010010, 0b01000011, 0b10111001, 0b10010110, 0b10101001, 0b01001011, 0b10101110, 0b11011001, 0b01011110, 0b10100011, 0b10010000, 0b01011101, 0b01001101, 0b01001101, 0b00101111, 0b10100001, 0b00000001, 0b01111000, 0b10001110, 0b10101011, 0b11111001, 0b00010100, 0b00000101, 0b10001011, 0b10111101, 0b01101101, 0b11000101, 0b00100110, 0b01111011, 0b01100100, 0b10001001, 0b01100111, 0b00001110, 0b11110110, 0b00011100, 0b11100101, 0b10011010, 0b10000111, 0b10100000, 0b00101010, 0b10010010], # Node 300
-[0b10101111, 0b00000000, 0b10000100, 0b00000011, 0b01010000, 0b00101001, 0b10100010, 0b10000000, 0b00010101, 0b10000110, 0b10000011, 0b10101100, 0b00000000, 0b00100100, 0b01000010, 0b00000000, 0b01100000, 0b10101100, 0b11110111, 0b10010101, 0b00101011, 0b00001001, 0b00101000, 0b00010000, 0b00001000, 0b01111110, 0b00011110, 0b10010100, 0b00100001, 0b01110001, 0b01101000, 0b00000000, 0b00011010, 0b00011000, 0b00000001, 0b01001000, 0b01001000, 0b01100010, 0b01110010, 0b10110100, 0b00010000, 0b00001001, 0b01010000, 0b11100111, 0b11001001, 0b00110000, 0b10101011, 0b00010001, 0b00010110, 0b00001100, 0b11111000, 0b00111111, 0b00100111, 0b10000000, 0b10011110, 0b01111000, 0b01011000, 0b00101110, 0b00000011, 0b10000010, 0b01001010, 0b11000111, 0b01000010, 0b00000001, 0b00111010, 0b00001010, 0b10000001, 0b01101001, 0b00100010, 0b01100001, 0b00111110, 0b00100100, 0b00010001, 0b01001000, 0b00100001, 0b00000110, 0b10010011, 0b10001010, 0b11110011, 0b01110101, 0b01000001, 0b11010010, 0b10000110, 0b01000110, 0b11110000, 0b00011000, 0b10111110, 0b01101110, 0b10010101, 0b01000000, 0b01010000, 0b00010000, 0b11100001, 0b00010001, 0b00001001, 0b11011010, 0b00100111, 0b00011010], # Node 301
-[0b11011100, 0b10100011, 0b10111011, 0b01110010, 0b11101101, 0b11000100, 0b11001111, 0b11110001, 0b10101011, 0b11001111, 0b10101101, 0b11101011, 0b10001100, 0b10110011, 0b11111001, 0b11111110, 0b10111101, 0b11011111, 0b11100010, 0b00100010, 0b10010110, 0b10001111, 0b11001011, 0b10100111, 0b11111101, 0b00110110, 0b10100001, 0b00101011, 0b00011000, 0b10001001, 0b11000101, 0b10010000, 0b01111101, 0b00101111, 0b01000111, 0b00010110, 0b11111101, 0b11000011, 0b01000101, 0b10111000, 0b01011111, 0b11101100, 0b00000100, 0b01010111, 0b00100000, 0b10111100, 0b01001110, 0b10010101, 0b11101101, 0b00001111, 0b11100010, 0b11001101, 0b11111111, 0b11111011, 0b10010101, 0b11001111, 0b11010111, 0b10010010, 0b11100001, 0b01001011, 0b01010111, 0b00100010, 0b11111111, 0b01001100, 0b10001111, 0b11110101, 0b11011010, 0b10000100, 0b00101000, 0b01110001, 0b00111110, 0b11101101, 0b00110111, 0b11111111, 0b10011011, 0b10010010, 0b11011100, 0b00100101, 0b01110010, 0b11111110, 0b10110111, 0b11101111, 0b11000100, 0b10011110, 0b01011101, 0b10111111, 0b00110111, 0b00111110, 0b11010101, 0b01111010, 0b11101110, 0b01111110, 0b10101011, 0b00010111, 0b11001101, 0b10011111, 0b00100000, 0b00100011], # Node 302
-[0b10010111, 0b10011101, 0b11110110, 0b11001101, 0b01011111, 0b10111111, 0b00011010, 0b10100000, 0b10111000, 0b11100000, 0b11000110, 0b11101101, 0b01000111, 0b11010100, 0b11110011, 0b00110101, 0b10010111, 0b11101101, 0b00000111, 0b10111100, 0b11001000, 0b10011101, 0b11101100, 0b11011001, 0b11011111, 0b11111111, 0b00100000, 0b00110111, 0b11010010, 0b10110100, 0b11101100, 0b11011011, 0b11100111, 0b00100111, 0b11110101, 0b11110110, 0b11010110, 0b00011101, 0b11011111, 0b01111101, 0b10001100, 0b10111101, 0b01010000, 0b01101101, 0b11110010, 0b11111101, 0b10000100, 0b00000011, 0b11111010, 0b10110111, 0b10101000, 0b10110111, 0b00010101, 0b11101001, 0b10010111, 0b10100010, 0b11011100, 0b01110010, 0b11000110, 0b10011001, 0b11111100, 0b10100011, 0b11110111, 0b10011010, 0b11011011, 0b01110111, 0b00011111, 0b11111011, 0b00110001, 0b11111100, 0b01110011, 0b10100110, 0b00110100, 0b11101111, 0b01000100, 0b00011010, 0b11110111, 0b11000010, 0b01010000, 0b01110000, 0b10100100, 0b10010001, 0b10010100, 0b01101110, 0b01011010, 0b00010101, 0b00011101, 0b01001100, 0b00001001, 0b11010111, 0b01000100, 0b11101100, 0b11101111, 0b00011001, 0b00101111, 0b11101011, 0b11101110, 0b01011100], # Node 303
-[0b01011001, 0b11101111, 0b00101101, 0b00000111, 0b11110100, 0b01110010, 0b01111100, 0b10111110, 0b00010110, 0b01101011, 0b00101101, 0b10111000, 0b01111110, 0b11011101, 0b10100110, 0b01100001, 0b11111110, 0b10100100, 0b00000110, 0b01000101, 0b11001010, 0b00100101, 0b00111110, 0b00000011, 0b01011110, 0b11110011, 0b11011000, 0b01111001, 0b00001011, 0b00110111, 0b11010101, 0b10010010, 0b00011111, 0b01010011, 0b01101111, 0b10011110, 0b10000011, 0b11111100, 0b01111001, 0b11111011, 0b10101001, 0b11111110, 0b11111011, 0b01011111, 0b10110100, 0b10110101, 0b11110111, 0b00001111, 0b10011011, 0b10101011, 0b01011000, 0b11011000, 0b11100001, 0b00100111, 0b01101011, 0b00111111, 0b01001000, 0b11111111, 0b11100101, 0b11010110, 0b11100011, 0b00001001, 0b00111100, 0b00100111, 0b00111111, 0b11101010, 0b01101110, 0b01100010, 0b10110011, 0b11011100, 0b01100011, 0b10011110, 0b11001100, 0b01001010, 0b11111010, 0b01100010, 0b11011111, 0b10001111, 0b10111111, 0b10010111, 0b10111111, 0b00000011, 0b10011011, 0b00101011, 0b00111011, 0b01111001, 0b01100110, 0b01100010, 0b10101000, 0b10111110, 0b11001111, 0b11001110, 0b11001111, 0b11101111, 0b00111011, 0b10000100, 0b11110101, 0b10101010], # Node 304
-[0b11011011, 0b10001110, 0b00000000, 0b01000110, 0b10000101, 0b00110101, 0b00100100, 0b10010011, 0b00100010, 0b00001111, 0b11000101, 0b01110110, 0b00000001, 0b00000000, 0b10000000, 0b00010110, 0b01010010, 0b00010001, 0b10100000, 0b00100110, 0b01001110, 0b10110100, 0b00010000, 0b11010101, 0b10001010, 0b10001111, 0b00010101, 0b01001011, 0b01010000, 0b10000000, 0b01100010, 0b01111000, 0b11100010, 0b11110010, 0b11011100, 0b00011001, 0b01101000, 0b00001000, 0b00101100, 0b00101011, 0b11111100, 0b00101010, 0b00111001, 0b10100101, 0b11110001, 0b01100101, 0b10000011, 0b01010011, 0b11000110, 0b01110111, 0b01101100, 0b10000100, 0b00000010, 0b11101100, 0b10001100, 0b10000000, 0b00011101, 0b10101010, 0b10001011, 0b01011100, 0b10111001, 0b01101101, 0b11100110, 0b01010000, 0b01101001, 0b11000101, 0b00001001, 0b11100101, 0b10110000, 0b00000000, 0b10100001, 0b11001111, 0b10100011, 0b01101111, 0b10100111, 0b10101001, 0b10000010, 0b11011001, 0b11111011, 0b10000101, 0b11100011, 0b01101001, 0b01111101, 0b10011000, 0b10100000, 0b10001001, 0b00001000, 0b11110001, 0b11110001, 0b01010010, 0b01000110, 0b10100010, 0b00111111, 0b10001100, 0b01000101, 0b11111100, 0b00010000, 0b01101010], # Node 305
-[0b00000001, 0b11100010, 0b11110000, 0b00000010, 0b00000000, 0b00011000, 0b10000001, 0b00000010, 0b00000000, 0b00000110, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000100, 0b00000010, 0b01110001, 0b01000010, 0b01101001, 0b00010000, 0b10000110, 0b10110000, 0b11101110, 0b01110111, 0b00000110, 0b01110100, 0b00111111, 0b11110110, 0b01000011, 0b11111111, 0b11100000, 0b00000001, 0b11111100, 0b00000011, 0b10111111, 0b11000001, 0b00111111, 0b11110000, 0b01000011, 0b11111110, 0b10000011, 0b00011111, 0b11100001, 0b00111111, 0b11111000, 0b00000011, 0b11111111, 0b11000001, 0b00001111, 0b11101000, 0b00000111, 0b11111110, 0b00100100, 0b01111111, 0b11000000, 0b00001111, 0b11100000, 0b00000111, 0b01111110, 0b00001001, 0b01111110, 0b11110000, 0b00000111, 0b11100000, 0b10000011, 0b01111111, 0b00000001, 0b00011110, 0b11101100, 0b00000011, 0b11100011, 0b11111011, 0b01111110, 0b00000001, 0b11111000, 0b10111111, 0b01000001, 0b00000100, 0b11111110, 0b01001011, 0b01000011, 0b10000011, 0b00011111, 0b00100100, 0b00100001, 0b10000000, 0b01000000, 0b00000000, 0b00000100, 0b10000000, 0b00010101, 0b00000000, 0b11000000, 0b00000001, 0b00000001, 0b00100001, 0b10000000, 0b00000000], # Node 306
-[0b10001011, 0b01000111, 0b10011110, 0b01111101, 0b01101101, 0b11111001, 0b11010001, 0b11110100, 0b01111001, 0b00000110, 0b01110010, 0b11010000, 0b10010110, 0b11011101, 0b10111011, 0b00101111, 0b00011001, 0b00010010, 0b00000110, 0b10001000, 0b10101001, 0b11011111, 0b11111111, 0b01000000, 0b10100111, 0b10010111, 0b01000110, 0b11111100, 0b10110111, 0b10111110, 0b11010110, 0b11110011, 0b11110010, 0b10000101, 0b11011001, 0b00111111, 0b11111111, 0b10001111, 0b10011000, 0b01011001, 0b11011010, 0b11110101, 0b11100111, 0b00111111, 0b10110000, 0b11011111, 0b01111101, 0b00101001, 0b01011011, 0b11101011, 0b01110000, 0b11100100, 0b10001011, 0b10001100, 0b01001010, 0b00100100, 0b11110010, 0b01000101, 0b11001011, 0b11010101, 0b00010001, 0b11010110, 0b11101110, 0b01001100, 0b00101011, 0b01000101, 0b01110100, 0b00110000, 0b11101010, 0b11110110, 0b01110110, 0b11110101, 0b01010101, 0b11111011, 0b11011010, 0b11001010, 0b00000111, 0b11101111, 0b01000100, 0b11000010, 0b11001001, 0b01011011, 0b11100100, 0b11101001, 0b11010010, 0b11010110, 0b01000111, 0b01101111, 0b11101011, 0b01011111, 0b10111010, 0b11100001, 0b11010110, 0b11111110, 0b11101111, 0b00111111, 0b11001101, 0b01111011], # Node 307
-[0b00111110, 0b10100010, 0b00001110, 0b01111111, 0b10101010, 0b10111110, 0b11011111, 0b00000000, 0b00100111, 0b11101000, 0b01011010, 0b01101000, 0b01111101, 0b11111011, 0b00000001, 0b10111001, 0b11111000, 0b10100101, 0b10010001, 0b01111101, 0b11011110, 0b01110110, 0b00100010, 0b00111000, 0b01101101, 0b11110100, 0b01100010, 0b10001101, 0b00111011, 0b10110110, 0b00101001, 0b11011111, 0b11011000, 0b00011001, 0b11010100, 0b10010100, 0b10111100, 0b00111110, 0b00110101, 0b00101101, 0b01011100, 0b10001111, 0b01111100, 0b10110111, 0b00101100, 0b00111001, 0b10110010, 0b01110011, 0b10011101, 0b11101101, 0b00011100, 0b00011010, 0b11011100, 0b11100111, 0b11110011, 0b10110111, 0b11100000, 0b11000011, 0b11000010, 0b10101101, 0b01000110, 0b00111111, 0b10100010, 0b11011100, 0b00010101, 0b11100000, 0b10010001, 0b11010010, 0b11010011, 0b00110110, 0b00101111, 0b01011110, 0b10010011, 0b01010101, 0b11010010, 0b10000101, 0b11110111, 0b01001010, 0b01011001, 0b10010011, 0b01111101, 0b00101010, 0b10011111, 0b01111010, 0b10000011, 0b11101011, 0b01111111, 0b10110100, 0b10101101, 0b01011110, 0b01001110, 0b11101010, 0b11111001, 0b00111110, 0b10111011, 0b10110011, 0b00111111, 0b11100000], # Node 308
-[0b00010110, 0b00001001, 0b00000001, 0b01110100, 0b01000000, 0b01000000, 0b00000000, 0b00000100, 0b10001100, 0b10010010, 0b00111001, 0b00110000, 0b00101010, 0b00000100, 0b10010101, 0b01111111, 0b01011111, 0b01010011, 0b11110000, 0b11111111, 0b00111111, 0b11000000, 0b11111111, 0b00000111, 0b00001001, 0b11111100, 0b11110011, 0b10000000, 0b11011000, 0b00000011, 0b00001100, 0b00000000, 0b00000100, 0b00000000, 0b00000000, 0b10100001, 0b01100100, 0b00000000, 0b10110000, 0b10001100, 0b00111111, 0b10000000, 0b01011100, 0b11111111, 0b00000111, 0b01100000, 0b11110001, 0b11111111, 0b01110000, 0b00010101, 0b11111110, 0b00001111, 0b00000000, 0b11000000, 0b10001001, 0b00000111, 0b00010000, 0b00001000, 0b01111000, 0b00000010, 0b01000000, 0b00000000, 0b11111101, 0b00100000, 0b00000100, 0b11110000, 0b11000000, 0b11100100, 0b00001111, 0b00101111, 0b11111100, 0b11110100, 0b01111000, 0b00000001, 0b00111001, 0b11111111, 0b00001111, 0b10000100, 0b11110011, 0b00111111, 0b00101001, 0b10011000, 0b11111111, 0b00011110, 0b00001000, 0b00101000, 0b11000000, 0b00000001, 0b10001001, 0b10000000, 0b00001010, 0b00001101, 0b00000001, 0b10100000, 0b01101001, 0b01001110, 0b10101010, 0b01010010], # Node 309
-[0b10101011, 0b11111001, 0b11011100, 0b00110010, 0b10010101, 0b11011001, 0b10010100, 0b10000011, 0b11110011, 0b11111000, 0b11110101, 0b10011010, 0b01010110, 0b11011100, 0b11011100, 0b00001111, 0b11111110, 0b11111001, 0b11100001, 0b10111011, 0b10101011, 0b01101111, 0b00011011, 0b11110110, 0b01101011, 0b00011110, 0b11111100, 0b01110100, 0b11011101, 0b01100000, 0b10110101, 0b11011110, 0b00011101, 0b01001001, 0b00010000, 0b10110011, 0b01110010, 0b11101000, 0b11110111, 0b00000110, 0b11101110, 0b00001010, 0b11100111, 0b10010111, 0b00111100, 0b11000111, 0b10000101, 0b01011111, 0b10001111, 0b00101110, 0b00010100, 0b10010001, 0b11000110, 0b10100011, 0b00010111, 0b10100010, 0b11111000, 0b10001100, 0b11100001, 0b01101011, 0b11000001, 0b00010101, 0b10100101, 0b10111000, 0b10001110, 0b11101011, 0b01011100, 0b10100011, 0b00010000, 0b10001110, 0b01101101, 0b11111110, 0b11011101, 0b11101011, 0b11010111, 0b10001011, 0b10110110, 0b10010010, 0b11110011, 0b10001010, 0b00111101, 0b10011100, 0b10010100, 0b00001101, 0b00110110, 0b00111011, 0b01010011, 0b11111111, 0b10101111, 0b00010011, 0b01010011, 0b11001010, 0b01101101, 0b10110101, 0b00111101, 0b00001111, 0b00011100, 0b01011110], # Node 310
-[0b00001100, 0b00101010, 0b10000111, 0b01111001, 0b01111100, 0b01010001, 0b01000010, 0b01110001, 0b10000000, 0b01000001, 0b11000010, 0b00010011, 0b10100001, 0b00000010, 0b11001100, 0b00000100, 0b11000100, 0b00110100, 0b10001010, 0b10011100, 0b01101011, 0b11000111, 0b10000110, 0b01011000, 0b11100100, 0b00000001, 0b00000000, 0b00001000, 0b00000101, 0b10100000, 0b00101001, 0b10110000, 0b11101100, 0b00110110, 0b01100000, 0b10010010, 0b11110000, 0b10110100, 0b00001110, 0b00100000, 0b11110000, 0b00001110, 0b00000000, 0b11111000, 0b11000100, 0b10010010, 0b10011101, 0b11011110, 0b01100110, 0b10000101, 0b00000010, 0b01111011, 0b00110010, 0b00100001, 0b00101100, 0b10011000, 0b10010000, 0b11100010, 0b11010001, 0b01010000, 0b00110000, 0b00011001, 0b01000000, 0b01010000, 0b11111000, 0b00100001, 0b10000011, 0b11001011, 0b01011011, 0b00010000, 0b01000001, 0b01010011, 0b11010011, 0b01010000, 0b10101101, 0b00010001, 0b01110000, 0b10001100, 0b01110010, 0b11010000, 0b00001000, 0b11111010, 0b00001111, 0b01101001, 0b10001100, 0b10111000, 0b01000000, 0b01000011, 0b10000001, 0b00100100, 0b00100010, 0b00000001, 0b01111101, 0b00001100, 0b10000100, 0b00110100, 0b00001110, 0b00101010], # Node 311
-[0b00000110, 0b00000010, 0b00001000, 0b00000000, 0b00100000, 0b10000100, 0b00000000, 0b00000100, 0b00000001, 0b00000000, 0b00010000, 0b00010100, 0b00100000, 0b00000000, 0b01000100, 0b00000010, 0b00111010, 0b00000010, 0b00000000, 0b11101100, 0b01010001, 0b00000000, 0b11110100, 0b00011111, 0b00100000, 0b11000000, 0b11011111, 0b00000011, 0b00000001, 0b01111110, 0b00101110, 0b00000000, 0b11110000, 0b11101001, 0b00000101, 0b00000000, 0b00000011, 0b01111100, 0b00000000, 0b00011100, 0b11000000, 0b00011111, 0b11111100, 0b00000001, 0b11101100, 0b10000001, 0b00011111, 0b00000000, 0b10011111, 0b11100100, 0b00000001, 0b11100000, 0b00000001, 0b10011111, 0b00000000, 0b00011100, 0b11111001, 0b10111111, 0b01101111, 0b00100100, 0b11111111, 0b11111111, 0b00101111, 0b11110100, 0b11111111, 0b01001111, 0b00000000, 0b11011110, 0b11001111, 0b00010111, 0b11110000, 0b00000011, 0b01111100, 0b00000011, 0b00001011, 0b11000000, 0b00010011, 0b00100000, 0b00000001, 0b10111100, 0b00010000, 0b10000000, 0b10000000, 0b00000011, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b00000000, 0b00001000, 0b00000100, 0b00100000, 0b00010000, 0b00010000, 0b00000000, 0b00000000, 0b00000000], # Node 312
-[0b00000000, 0b00001101, 0b00000000, 0b11100000, 0b01011001, 0b00011011, 0b01101100, 0b01101111, 0b01000110, 0b10001111, 0b11010010, 0b10010110, 0b11111111, 0b01001110, 0b01000111, 0b11100011, 0b00001011, 0b00011001, 0b11000010, 0b00111010, 0b11001000, 0b11000000, 0b00100111, 0b10101001, 0b11001011, 0b10011111, 0b10010001, 0b00111000, 0b11101000, 0b11111111, 0b00010001, 0b10010000, 0b00001001, 0b01101101, 0b11101010, 0b00000001, 0b10000000, 0b10001001, 0b00010011, 0b00010111, 0b00000010, 0b10011101, 0b10110001, 0b00000110, 0b11111100, 0b00100110, 0b11010011, 0b11010100, 0b00100110, 0b00010001, 0b11101110, 0b00010101, 0b10001010, 0b10011001, 0b00010000, 0b10100101, 0b11011010, 0b10111000, 0b10000101, 0b10000000, 0b10010110, 0b11101111, 0b11000011, 0b00011100, 0b00100000, 0b00001001, 0b11110010, 0b11010110, 0b00011000, 0b01100010, 0b00001110, 0b01101100, 0b00011011, 0b10010110, 0b00101000, 0b00000010, 0b10000101, 0b10010110, 0b11011010, 0b01110010, 0b10100100, 0b00101000, 0b11010001, 0b00010001, 0b10001011, 0b11111011, 0b00001000, 0b10000011, 0b00001000, 0b00011000, 0b10101111, 0b10110010, 0b01000101, 0b10000100, 0b00000010, 0b01100000, 0b11011010, 0b00000000], # Node 313
-[0b10110111, 0b00011111, 0b11000111, 0b10101011, 0b11111100, 0b11110111, 0b11111111, 0b10110110, 0b11111111, 0b11111111, 0b11010011, 0b11111110, 0b11011010, 0b10011111, 0b11011011, 0b00000001, 0b11111110, 0b11111111, 0b00000010, 0b11000000, 0b11111111, 0b01101111, 0b00000000, 0b11110000, 0b11111111, 0b00000000, 0b00000000, 0b11111110, 0b10011100, 0b00100000, 0b11000000, 0b01111111, 0b11010001, 0b00000111, 0b11110000, 0b10110011, 0b01111111, 0b00000000, 0b11110110, 0b11111011, 0b10001111, 0b10100000, 0b10011011, 0b11111111, 0b00111111, 0b11110110, 0b11111011, 0b11111111, 0b01110001, 0b00011111, 0b11111110, 0b00011111, 0b11111110, 0b11100000, 0b01111111, 0b10111000, 0b00001000, 0b11111110, 0b10000111, 0b10001111, 0b11100000, 0b01111111, 0b11111000, 0b00000111, 0b11111100, 0b11000010, 0b01111111, 0b10000000, 0b00011100, 0b11111110, 0b00000111, 0b10000000, 0b11100001, 0b11110101, 0b00000001, 0b00001000, 0b01110111, 0b00011111, 0b00000000, 0b10000000, 0b01111110, 0b00000101, 0b01001000, 0b11111100, 0b00111111, 0b11011000, 0b10110101, 0b11110101, 0b11011110, 0b00111011, 0b11100111, 0b11101101, 0b01110110, 0b11101111, 0b11101101, 0b11011110, 0b10001110, 0b11010111], # Node 314
-[0b00011110, 0b00101100, 0b01111100, 0b11100010, 0b01001110, 0b00001011, 0b01111101, 0b00001001, 0b11110101, 0b00000000, 0b00100011, 0b01010101, 0b00101111, 0b01011010, 0b01100110, 0b10110000, 0b00000000, 0b00101011, 0b01000001, 0b00001011, 0b11010000, 0b10001110, 0b11100000, 0b11101000, 0b01010111, 0b01111000, 0b11000110, 0b11011111, 0b01000111, 0b11100110, 0b01100001, 0b00101100, 0b11000001, 0b11000000, 0b10001100, 0b01110100, 0b10011101, 0b01001001, 0b00110001, 0b00110000, 0b11001110, 0b10001110, 0b10011000, 0b00010000, 0b01000100, 0b11000101, 0b00011110, 0b00010011, 0b00011000, 0b00011010, 0b10100000, 0b00111110, 0b00010001, 0b00000100, 0b00001111, 0b00000001, 0b10011001, 0b01000100, 0b01100100, 0b00101110, 0b00001111, 0b00111101, 0b00100010, 0b00100110, 0b10000000, 0b11001011, 0b01100001, 0b11001110, 0b00100000, 0b01010101, 0b01000011, 0b11100011, 0b10001110, 0b10000110, 0b00101011, 0b10000010, 0b00000010, 0b01001001, 0b00111100, 0b00110010, 0b01000000, 0b11010000, 0b00011001, 0b10000100, 0b11010111, 0b01001000, 0b00001011, 0b10110001, 0b10010010, 0b10110000, 0b00000101, 0b10111011, 0b00001100, 0b11110101, 0b00010001, 0b00011000, 0b10010001, 0b11001001], # Node 315
-[0b11111011, 0b10101101, 0b10011111, 0b01101011, 0b11101111, 0b11110111, 0b10101011, 0b11111111, 0b11110110, 0b11111111, 0b11001001, 0b11011111, 0b11111111, 0b11100101, 0b11110011, 0b01111111, 0b11100011, 0b10010011, 0b11111011, 0b00110111, 0b11111101, 0b11111111, 0b11111111, 0b11100001, 0b11111111, 0b11111111, 0b11111111, 0b01111110, 0b11111101, 0b10111011, 0b11001111, 0b11111111, 0b10001111, 0b00110001, 0b11110100, 0b01111011, 0b11000010, 0b00000011, 0b01101110, 0b10100111, 0b00111110, 0b11100000, 0b01110011, 0b11111000, 0b00000011, 0b11111101, 0b10001111, 0b00011111, 0b11110000, 0b10111111, 0b11111000, 0b10011110, 0b11100111, 0b00000001, 0b11100000, 0b11101011, 0b00101111, 0b00000000, 0b00111111, 0b11110110, 0b00000111, 0b11100000, 0b10110111, 0b01111110, 0b00000000, 0b11111111, 0b11111011, 0b00000111, 0b11110000, 0b11101111, 0b11111111, 0b10000011, 0b01111111, 0b11000110, 0b11111111, 0b11111101, 0b11101011, 0b11111110, 0b11110111, 0b11111001, 0b11111101, 0b11111111, 0b11101111, 0b01110010, 0b11111111, 0b11111111, 0b11111011, 0b11001111, 0b11111111, 0b11111111, 0b11111111, 0b11110111, 0b01111111, 0b11111111, 0b00011110, 0b11111110, 0b11111111, 0b11010111], # Node 316
-[0b10111000, 0b10110011, 0b11111101, 0b10110011, 0b10011100, 0b00111111, 0b01111011, 0b00011101, 0b11001011, 0b10111011, 0b00011111, 0b10111011, 0b10100011, 0b11000011, 0b00000111, 0b00101110, 0b11011100, 0b01011100, 0b11101010, 0b10100100, 0b11110100, 0b11010011, 0b10001101, 0b11000110, 0b00110110, 0b01101100, 0b10010011, 0b01001011, 0b10000110, 0b11001010, 0b10111001, 0b11110001, 0b10101101, 0b11001100, 0b11010101, 0b00101101, 0b10111101, 0b00101011, 0b10011111, 0b11110000, 0b11010000, 0b00010101, 0b01101010, 0b01111010, 0b01110100, 0b10100100, 0b10011011, 0b01110100, 0b11000010, 0b00011111, 0b00010111, 0b11100010, 0b00100001, 0b01000010, 0b10010011, 0b11111001, 0b11011011, 0b00100010, 0b10001000, 0b01101101, 0b00101110, 0b00001010, 0b10111111, 0b00110110, 0b00011110, 0b11001100, 0b11001100, 0b00111100, 0b01011001, 0b01101000, 0b11101001, 0b01011101, 0b11010100, 0b00001111, 0b00100110, 0b10001000, 0b10110000, 0b11100100, 0b00111101, 0b00111011, 0b10111100, 0b10111111, 0b11110000, 0b11010000, 0b00011111, 0b00011111, 0b10101111, 0b01110111, 0b00111111, 0b00111010, 0b10001110, 0b11001010, 0b10011011, 0b00011011, 0b11001111, 0b00100010, 0b00101110, 0b11111101], # Node 317
-[0b10000010, 0b00000000, 0b00100000, 0b10000100, 0b01010001, 0b00011111, 0b10101100, 0b00000100, 0b01010011, 0b10000011, 0b01001110, 0b01010010, 0b11011110, 0b00000100, 0b00010100, 0b10000100, 0b11100100, 0b01001101, 0b00010101, 0b10110010, 0b00100001, 0b10000011, 0b10000000, 0b11000001, 0b11001000, 0b00001001, 0b00011100, 0b00010001, 0b01100000, 0b00000001, 0b00000000, 0b00010000, 0b00000010, 0b10010111, 0b00010000, 0b00111000, 0b11110000, 0b00111101, 0b10011110, 0b10000111, 0b11111111, 0b01000011, 0b00100100, 0b11101000, 0b00111011, 0b10010010, 0b10101101, 0b10111110, 0b00100111, 0b00011000, 0b11100010, 0b10100101, 0b10101000, 0b00000010, 0b10111110, 0b10010011, 0b00010010, 0b11100010, 0b10111010, 0b00111101, 0b00011000, 0b00001010, 0b10010001, 0b11100000, 0b01100101, 0b00110010, 0b00000000, 0b11000010, 0b01111101, 0b10000011, 0b00000101, 0b11001100, 0b00010101, 0b01000000, 0b10000001, 0b00011111, 0b00010111, 0b01100001, 0b01010000, 0b01111001, 0b00110110, 0b00000101, 0b11100000, 0b11100111, 0b01001000, 0b10000000, 0b00110100, 0b01001001, 0b00101110, 0b00101001, 0b11011101, 0b00001110, 0b01100101, 0b00111000, 0b00101000, 0b10000000, 0b10000000, 0b00011000], # Node 318
-[0b00000001, 0b01010000, 0b11010000, 0b10001000, 0b00011000, 0b01000001, 0b11111100, 0b01100110, 0b00011110, 0b01100000, 0b11110101, 0b10101101, 0b10101100, 0b01000010, 0b11010101, 0b00000000, 0b00100111, 0b00000000, 0b01000000, 0b01010101, 0b10001001, 0b11110010, 0b00001000, 0b01011100, 0b01000100, 0b10111110, 0b10000100, 0b00000010, 0b00010000, 0b11111111, 0b00010001, 0b10100110, 0b01011101, 0b10010101, 0b01000101, 0b10101001, 0b01001100, 0b10111000, 0b00000001, 0b10101101, 0b01010000, 0b00010000, 0b01110011, 0b10101010, 0b00101011, 0b10000011, 0b01100000, 0b11100011, 0b01101101, 0b11100100, 0b00001101, 0b01001011, 0b10110001, 0b01100010, 0b10101011, 0b00000010, 0b01001000, 0b01111001, 0b01010000, 0b00101101, 0b11001001, 0b00111110, 0b10010000, 0b01001000, 0b10011000, 0b10101000, 0b00010101, 0b11010100, 0b11111110, 0b10000010, 0b11000010, 0b00110111, 0b01101100, 0b10100000, 0b01111110, 0b01101000, 0b00000101, 0b10001111, 0b10110010, 0b01111110, 0b01001111, 0b00110000, 0b10001111, 0b10000100, 0b00000101, 0b00100101, 0b00100010, 0b11101010, 0b10110010, 0b10011110, 0b01000010, 0b00000000, 0b00010011, 0b01000100, 0b00010000, 0b00110000, 0b00100000, 0b01101100], # Node 319
-[0b01110111, 0b11111011, 0b11101001, 0b10110001, 0b11111111, 0b01011010, 0b01000101, 0b01001011, 0b01110001, 0b01110111, 0b11111101, 0b11011101, 0b01111111, 0b01011011, 0b11111111, 0b11011011, 0b11111111, 0b01111110, 0b00000011, 0b11100110, 0b11110111, 0b11110011, 0b11000111, 0b01111111, 0b00100110, 0b00101101, 0b11111100, 0b11101111, 0b10101111, 0b11110000, 0b00111001, 0b01101000, 0b10001011, 0b10000111, 0b01001011, 0b00000110, 0b00011110, 0b11111000, 0b01111011, 0b11000111, 0b11100010, 0b01101011, 0b01101101, 0b01000111, 0b01111111, 0b11111010, 0b11011101, 0b11111111, 0b11101011, 0b00110001, 0b01111111, 0b11011111, 0b00111010, 0b11111010, 0b11111111, 0b11110100, 0b11000010, 0b00011111, 0b01011110, 0b11101101, 0b10111101, 0b01111010, 0b01011101, 0b11111111, 0b10110111, 0b11101111, 0b10010011, 0b11111110, 0b11011111, 0b00110110, 0b11110100, 0b01111111, 0b00100101, 0b11011110, 0b01111111, 0b00100010, 0b01111100, 0b11100001, 0b01100011, 0b01101000, 0b11100111, 0b11111111, 0b01000001, 0b11011101, 0b11001101, 0b00011111, 0b11111000, 0b01011010, 0b11111100, 0b11011010, 0b10111111, 0b11111111, 0b00111011, 0b11101110, 0b10110001, 0b11010110, 0b11101110, 0b11001110], # Node 320
-[0b00110101, 0b01011101, 0b11110100, 0b00111111, 0b01010110, 0b11001111, 0b10111001, 0b10100011, 0b10000101, 0b11111010, 0b11101010, 0b11110001, 0b10110111, 0b00100100, 0b11010111, 0b11010110, 0b00100011, 0b00100010, 0b01010010, 0b10111010, 0b10111110, 0b11011000, 0b11111111, 0b10110100, 0b00100111, 0b11011010, 0b01100011, 0b10011011, 0b01110111, 0b11111100, 0b11100011, 0b11111000, 0b00000011, 0b11000110, 0b11110011, 0b00101110, 0b10010101, 0b10111000, 0b11111001, 0b00100111, 0b01011100, 0b01011111, 0b11010011, 0b00001001, 0b01000101, 0b11000010, 0b01100100, 0b01011001, 0b10110111, 0b10111100, 0b11010101, 0b10001011, 0b10101111, 0b01000101, 0b00000000, 0b10111110, 0b10111010, 0b01000101, 0b10100000, 0b00010111, 0b01111000, 0b00001110, 0b00010110, 0b11100111, 0b11001001, 0b11110111, 0b01101010, 0b10111010, 0b01111001, 0b01110100, 0b11110001, 0b01111010, 0b01110011, 0b11111110, 0b11000011, 0b11011011, 0b11001011, 0b00110011, 0b11101001, 0b01101111, 0b00100110, 0b00101111, 0b10101000, 0b01110000, 0b10001011, 0b10100101, 0b10011011, 0b00110110, 0b10011101, 0b00111111, 0b00011001, 0b11011110, 0b11111110, 0b01101111, 0b00101011, 0b11111111, 0b10101000, 0b11001100], # Node 321
-[0b10100010, 0b11110001, 0b00010000, 0b10000100, 0b00001001, 0b00100000, 0b11000110, 0b00011101, 0b10100000, 0b10101100, 0b10010100, 0b10000011, 0b00010101, 0b01111110, 0b01001100, 0b00000111, 0b10010110, 0b00011100, 0b01100010, 0b01010001, 0b00001101, 0b01011000, 0b10110100, 0b10011100, 0b01100100, 0b11000001, 0b00010001, 0b11011011, 0b10000101, 0b10010000, 0b10111001, 0b00100111, 0b10101001, 0b11111001, 0b11011011, 0b01111000, 0b00101101, 0b11000101, 0b01100100, 0b10100010, 0b10100110, 0b10010101, 0b01000100, 0b01010011, 0b10000110, 0b00110110, 0b00010011, 0b10110101, 0b10110000, 0b11010011, 0b01101110, 0b01111111, 0b01010101, 0b11010010, 0b01111000, 0b10000100, 0b00010110, 0b01100011, 0b00011111, 0b01100101, 0b10010001, 0b01111100, 0b11001110, 0b10010010, 0b11001000, 0b11010111, 0b00111010, 0b10000011, 0b00110110, 0b10100111, 0b01000101, 0b11000001, 0b01000100, 0b10011101, 0b11000000, 0b11111010, 0b01000110, 0b10010010, 0b11000011, 0b10100011, 0b10110010, 0b10001101, 0b00011101, 0b00100010, 0b01010101, 0b10110001, 0b11001111, 0b01001100, 0b01000101, 0b01011011, 0b00001100, 0b01001001, 0b00010001, 0b01010000, 0b10100101, 0b10100101, 0b00100100, 0b10011010], # Node 322
-[0b10010110, 0b10111000, 0b00100001, 0b01101010, 0b00011000, 0b00000110, 0b10010100, 0b00111001, 0b10000011, 0b01111000, 0b11011111, 0b00000100, 0b00011011, 0b10000100, 0b00010110, 0b00011000, 0b01011000, 0b00100110, 0b11010001, 0b10010010, 0b00000111, 0b11111000, 0b10010110, 0b00000011, 0b01001010, 0b00011110, 0b10110111, 0b00100001, 0b01100101, 0b01111110, 0b00110011, 0b00101000, 0b10110101, 0b00101101, 0b00010010, 0b01001011, 0b00010000, 0b11010101, 0b01000110, 0b10100110, 0b10100110, 0b01001110, 0b00001110, 0b00101011, 0b00001010, 0b10010000, 0b00101010, 0b01001010, 0b00001111, 0b00000001, 0b11001011, 0b01010111, 0b00101010, 0b10110101, 0b10011011, 0b11000101, 0b11011111, 0b11010101, 0b01000000, 0b01001101, 0b10000010, 0b00110100, 0b00110001, 0b01010110, 0b10010101, 0b01111101, 0b11110000, 0b11011011, 0b00011001, 0b11010001, 0b01100000, 0b00111101, 0b00011010, 0b01110010, 0b11011000, 0b01110011, 0b00110011, 0b11010101, 0b01100100, 0b11110010, 0b00011111, 0b10000111, 0b01001000, 0b10001111, 0b01100001, 0b11101110, 0b00110000, 0b01001000, 0b11001101, 0b01011010, 0b10110101, 0b10111000, 0b11001100, 0b10101000, 0b11001101, 0b10111001, 0b00111010, 0b11000001], # Node 323
-[0b01101001, 0b11000000, 0b01111001, 0b00001010, 0b00100011, 0b10101111, 0b10100110, 0b00111010, 0b01001011, 0b00010110, 0b10000001, 0b11110001, 0b01001100, 0b10010100, 0b00110101, 0b10010010, 0b11011101, 0b01011100, 0b10110100, 0b10100010, 0b11101110, 0b01000001, 0b11110001, 0b00100100, 0b11000100, 0b10010101, 0b00000111, 0b00000011, 0b01001100, 0b00110000, 0b00000000, 0b01110000, 0b00110010, 0b00110000, 0b00000001, 0b00101101, 0b01000011, 0b01110001, 0b01100010, 0b11001011, 0b00011110, 0b00000111, 0b00111001, 0b11110000, 0b11100000, 0b01101000, 0b00111101, 0b10011111, 0b00111110, 0b11000000, 0b10000000, 0b11010000, 0b00000001, 0b00000011, 0b10000000, 0b01000011, 0b00000000, 0b00000000, 0b00001010, 0b10110000, 0b01000001, 0b01010000, 0b01000010, 0b00000101, 0b10000010, 0b10001101, 0b11101000, 0b11100000, 0b01110011, 0b10000001, 0b00000110, 0b11100111, 0b10000011, 0b10000111, 0b10001001, 0b11111111, 0b01101000, 0b01010010, 0b11111000, 0b10100101, 0b00001110, 0b10100000, 0b00111111, 0b00101100, 0b00000101, 0b00011110, 0b00001000, 0b01001100, 0b00000001, 0b11100110, 0b00000001, 0b00000100, 0b01000001, 0b10110110, 0b00010101, 0b00011000, 0b10001110, 0b00001001], # Node 324
-[0b00101000, 0b00001000, 0b01000001, 0b00011001, 0b00100000, 0b01000010, 0b01000010, 0b00000000, 0b00000111, 0b00100111, 0b00011000, 0b01111000, 0b01000010, 0b00000000, 0b01010000, 0b00000001, 0b00001000, 0b00001000, 0b00101010, 0b00000000, 0b00000101, 0b10011000, 0b01101011, 0b00100000, 0b10011001, 0b00011010, 0b01110000, 0b00010000, 0b00010000, 0b10001000, 0b00000011, 0b00010000, 0b00010100, 0b01110000, 0b01100000, 0b11001000, 0b00000001, 0b01100010, 0b00100000, 0b10000100, 0b10010000, 0b00000011, 0b11000000, 0b00000111, 0b11111110, 0b00000100, 0b01001001, 0b11110000, 0b00010011, 0b11100001, 0b01010111, 0b10000111, 0b10110100, 0b01111101, 0b01010100, 0b01001010, 0b01000000, 0b10000011, 0b01010111, 0b10000010, 0b00010110, 0b11111100, 0b11000101, 0b11100000, 0b11011101, 0b10000001, 0b00000001, 0b00001110, 0b00111100, 0b01111010, 0b00000001, 0b10011110, 0b00001111, 0b10011100, 0b00000100, 0b01111011, 0b10100000, 0b01111100, 0b00000001, 0b11000010, 0b00100000, 0b00100000, 0b01100000, 0b00101001, 0b10100000, 0b00010000, 0b00011000, 0b00100001, 0b00011000, 0b10010000, 0b01000001, 0b10000001, 0b01000100, 0b00010001, 0b00101000, 0b01010100, 0b00000100, 0b00001000], # Node 325
-[0b01000101, 0b00010100, 0b11110101, 0b11111111, 0b11001011, 0b10110100, 0b01111001, 0b01110111, 0b11111111, 0b01111100, 0b11101100, 0b00101100, 0b01101111, 0b01101111, 0b10011010, 0b10110010, 0b10000111, 0b00110111, 0b11101110, 0b00111111, 0b01111000, 0b01111010, 0b11111110, 0b10010001, 0b11111010, 0b11011010, 0b11001011, 0b01110111, 0b10111101, 0b00000111, 0b10101111, 0b01110000, 0b00101100, 0b11010100, 0b11111110, 0b00011001, 0b00000101, 0b11011001, 0b01011101, 0b11011010, 0b11010001, 0b11111111, 0b11011101, 0b11001000, 0b01011101, 0b00010011, 0b01110001, 0b11111001, 0b11100110, 0b00011100, 0b11111110, 0b10001001, 0b11110101, 0b11101001, 0b11011101, 0b10110110, 0b11001001, 0b01001101, 0b00111011, 0b11111010, 0b00000110, 0b11110000, 0b10101011, 0b10001101, 0b00100011, 0b00001111, 0b10011010, 0b00111111, 0b11111001, 0b11100110, 0b10111101, 0b10111000, 0b11111011, 0b11111001, 0b00110101, 0b00000000, 0b01010010, 0b10001101, 0b10000101, 0b01000111, 0b00011000, 0b10000111, 0b00010000, 0b01011011, 0b01011011, 0b11100101, 0b11010101, 0b01100110, 0b00111111, 0b11011101, 0b11011111, 0b10100110, 0b10101011, 0b00001111, 0b11101100, 0b10101101, 0b01001111, 0b00101111], # Node 326
-[0b11001101, 0b10111010, 0b10011111, 0b01111101, 0b01000100, 0b11111011, 0b00101001, 0b11111100, 0b01001101, 0b01100010, 0b01010110, 0b11111110, 0b11111001, 0b11101110, 0b11011011, 0b11001100, 0b01001111, 0b01100110, 0b11101111, 0b10101110, 0b00000000, 0b00101111, 0b10101010, 0b10111010, 0b00111100, 0b10111000, 0b10001111, 0b01001110, 0b01111001, 0b00110111, 0b00111000, 0b11110110, 0b11101110, 0b10100001, 0b01100000, 0b11001110, 0b11011101, 0b01011011, 0b10010110, 0b11111001, 0b00110100, 0b10110001, 0b11011011, 0b10110011, 0b11100001, 0b10001110, 0b10111010, 0b11111011, 0b10000101, 0b01101111, 0b11110110, 0b11001110, 0b01001110, 0b11011110, 0b00110011, 0b00111011, 0b10111111, 0b11110010, 0b00110111, 0b00011100, 0b11111001, 0b10111111, 0b00001001, 0b10011101, 0b01111100, 0b00100111, 0b11111101, 0b11001001, 0b10101111, 0b01110100, 0b00111001, 0b00111000, 0b00011010, 0b10111010, 0b11001010, 0b11110000, 0b10010001, 0b11011011, 0b10000001, 0b00000100, 0b01110111, 0b00111101, 0b01111100, 0b11101110, 0b01011010, 0b10101001, 0b01111111, 0b11110011, 0b11101101, 0b11001101, 0b01100011, 0b01011000, 0b00111110, 0b00001101, 0b01001110, 0b01000111, 0b11111111, 0b00110011], # Node 327
-[0b11110101, 0b01111110, 0b11010011, 0b00011111, 0b10101110, 0b00101000, 0b01101011, 0b11111010, 0b00110010, 0b01001011, 0b01110101, 0b11011111, 0b11011011, 0b00101101, 0b11101111, 0b01000101, 0b11011011, 0b01101001, 0b01011100, 0b10100110, 0b11010010, 0b11001111, 0b00111111, 0b10000010, 0b01100001, 0b10101011, 0b01001111, 0b10001110, 0b01011011, 0b00101010, 0b01001011, 0b00100010, 0b11100011, 0b11000110, 0b10110111, 0b10000101, 0b10000010, 0b11011111, 0b01001001, 0b10100010, 0b01001110, 0b11011100, 0b00001101, 0b11001110, 0b11110001, 0b00010011, 0b01000111, 0b01100011, 0b10000010, 0b10101010, 0b11110100, 0b01000100, 0b01000000, 0b10100000, 0b10100111, 0b10111101, 0b11100010, 0b10111010, 0b01011100, 0b11001111, 0b11110010, 0b00111010, 0b10111100, 0b00111000, 0b01101110, 0b10100010, 0b11100010, 0b01011100, 0b01100011, 0b11111101, 0b01110110, 0b00111111, 0b10101110, 0b11110011, 0b01110111, 0b01011110, 0b10010000, 0b11110100, 0b11000111, 0b00101101, 0b10111010, 0b11111011, 0b11001010, 0b01111110, 0b11100011, 0b11011001, 0b10001000, 0b00110100, 0b10001010, 0b11111111, 0b11011100, 0b11001101, 0b11011111, 0b01010110, 0b01011100, 0b10111001, 0b01111000, 0b01011101], # Node 328
-[0b11001011, 0b10111111, 0b11101000, 0b11110101, 0b11010101, 0b11111101, 0b00010011, 0b00011110, 0b00000101, 0b10111111, 0b10001111, 0b00001111, 0b10010001, 0b10111001, 0b11001000, 0b01101001, 0b01000111, 0b01111001, 0b11100111, 0b01000011, 0b10101010, 0b10111001, 0b10001110, 0b10111000, 0b01011101, 0b10110010, 0b00100001, 0b01101001, 0b01010100, 0b00001100, 0b11101000, 0b00001001, 0b00011110, 0b10101000, 0b11011110, 0b00111101, 0b11000000, 0b00000000, 0b11011111, 0b00001110, 0b10111110, 0b11100000, 0b11101110, 0b11010100, 0b10001110, 0b01101101, 0b11011010, 0b11001000, 0b10011001, 0b11001011, 0b00001101, 0b11100111, 0b01110110, 0b11011001, 0b01101110, 0b11011000, 0b00010110, 0b01010010, 0b01100010, 0b11001001, 0b01011010, 0b01110010, 0b11111100, 0b11010110, 0b00101001, 0b01000001, 0b11110111, 0b01110011, 0b11111010, 0b01101100, 0b11111001, 0b11011011, 0b00100001, 0b11101011, 0b11110011, 0b00010011, 0b10011100, 0b10111100, 0b11111011, 0b01000001, 0b11110110, 0b11011101, 0b01100010, 0b11111110, 0b00101110, 0b01101111, 0b00001011, 0b01000000, 0b10111100, 0b11110111, 0b11111001, 0b11011101, 0b01001001, 0b00110010, 0b11111111, 0b11101010, 0b01011101, 0b11101111], # Node 329
-[0b10101111, 0b00001001, 0b10111010, 0b00000000, 0b00001011, 0b01101011, 0b01100001, 0b00011000, 0b00010100, 0b01100001, 0b01000000, 0b00000010, 0b10010110, 0b10101000, 0b00100000, 0b01001100, 0b10001011, 0b00101000, 0b00010010, 0b00000010, 0b10000000, 0b00100001, 0b10100101, 0b00000011, 0b00101011, 0b01010100, 0b00011111, 0b11010100, 0b01010110, 0b10110001, 0b11010000, 0b00000011, 0b01111000, 0b00100110, 0b01000011, 0b11100101, 0b01111010, 0b00000010, 0b01010110, 0b10100010, 0b11011010, 0b00100001, 0b00101011, 0b10011100, 0b11010000, 0b01000001, 0b01000010, 0b00110010, 0b10000110, 0b00000110, 0b11001010, 0b01000011, 0b00100100, 0b00011001, 0b01110110, 0b00100000, 0b00110010, 0b00000000, 0b00110000, 0b01001100, 0b10000010, 0b00100000, 0b01101101, 0b01010000, 0b01000000, 0b10010111, 0b01010010, 0b00110100, 0b10100010, 0b00001011, 0b11011010, 0b11010000, 0b01100010, 0b10010010, 0b00000000, 0b01111110, 0b11000001, 0b00011011, 0b10110001, 0b01000111, 0b11001001, 0b10010100, 0b10001100, 0b10001101, 0b00110010, 0b01001000, 0b00001111, 0b00010100, 0b10110110, 0b00010010, 0b10001101, 0b01000101, 0b10110001, 0b01100000, 0b10000110, 0b01011000, 0b00100010, 0b01100100], # Node 330
-[0b10111011, 0b11101110, 0b00111111, 0b01010101, 0b10111100, 0b10000000, 0b10101111, 0b11101100, 0b11100011, 0b11111111, 0b01111111, 0b01100010, 0b11111010, 0b11111111, 0b11010100, 0b00101000, 0b11111110, 0b11011010, 0b10111110, 0b10110100, 0b00110100, 0b01001011, 0b11100010, 0b01000001, 0b10100111, 0b00000001, 0b11110111, 0b11100110, 0b01100111, 0b00111110, 0b11100111, 0b10100101, 0b11111100, 0b11010000, 0b10110010, 0b10010111, 0b10111111, 0b11110110, 0b11001101, 0b00111110, 0b11100001, 0b01111111, 0b10100111, 0b00100111, 0b11111101, 0b11110011, 0b11101110, 0b01111100, 0b01011111, 0b11100111, 0b00101111, 0b11011011, 0b11011111, 0b11011111, 0b10001001, 0b11111110, 0b11001001, 0b01101100, 0b01101100, 0b00010111, 0b01110011, 0b00011110, 0b11100100, 0b01011101, 0b01111111, 0b10110100, 0b11011101, 0b11000101, 0b00101111, 0b00100000, 0b11010011, 0b11001011, 0b11011100, 0b10110100, 0b01101010, 0b10001110, 0b10100100, 0b10011111, 0b11101110, 0b01101000, 0b11000111, 0b10010001, 0b10110111, 0b00101111, 0b01111111, 0b01111110, 0b11111101, 0b11010011, 0b11111010, 0b11111111, 0b11110110, 0b00001111, 0b01110111, 0b01100000, 0b01111100, 0b11000111, 0b01110101, 0b11111010], # Node 331
-[0b00110100, 0b11010000, 0b01001001, 0b10100010, 0b10001100, 0b10001100, 0b01100001, 0b11110011, 0b00000111, 0b00101000, 0b00110000, 0b11111110, 0b00000100, 0b01100001, 0b10000010, 0b00000000, 0b11101001, 0b01001111, 0b00000010, 0b11011000, 0b00000111, 0b10100000, 0b01000000, 0b00010110, 0b11101011, 0b11111100, 0b10100000, 0b00111000, 0b10100001, 0b00000101, 0b01001100, 0b01110001, 0b01111100, 0b00000000, 0b01110100, 0b11011000, 0b01001101, 0b00100011, 0b00001000, 0b00111000, 0b00000100, 0b10010110, 0b11011000, 0b01100011, 0b00001100, 0b10000110, 0b11111110, 0b10010110, 0b10000010, 0b11000010, 0b00101111, 0b01011111, 0b01100010, 0b11111100, 0b11110001, 0b00000110, 0b11111001, 0b01110111, 0b01101111, 0b01000110, 0b00001110, 0b01111111, 0b10101010, 0b11011000, 0b11100000, 0b11000100, 0b00100001, 0b00001101, 0b10011000, 0b10100100, 0b00101100, 0b00100000, 0b00110001, 0b00001001, 0b00000000, 0b11000100, 0b00011010, 0b00100100, 0b11000000, 0b00111111, 0b00000100, 0b00000010, 0b11011010, 0b11110011, 0b10010111, 0b10000000, 0b01000011, 0b11010111, 0b00110100, 0b00000000, 0b00001001, 0b10001010, 0b00001000, 0b00011000, 0b11011110, 0b00010001, 0b11101001, 0b11101000], # Node 332
-[0b01110010, 0b00110110, 0b00000011, 0b00110001, 0b11010010, 0b01011000, 0b10100110, 0b00101001, 0b00010101, 0b10010101, 0b10101110, 0b01000000, 0b10101110, 0b10000000, 0b00010000, 0b10010010, 0b10001111, 0b10111000, 0b00010110, 0b10100100, 0b01110010, 0b00101001, 0b01010010, 0b01101101, 0b10000010, 0b10000001, 0b11101111, 0b00010001, 0b10010000, 0b11000010, 0b10100001, 0b10010101, 0b00010000, 0b01101001, 0b11101001, 0b00000010, 0b10101100, 0b01011100, 0b00010001, 0b01011100, 0b01010110, 0b01111001, 0b00011100, 0b00011000, 0b01100000, 0b11010101, 0b01011000, 0b10111000, 0b01011011, 0b10011011, 0b11101001, 0b10001100, 0b01001111, 0b00111101, 0b01000000, 0b10000011, 0b01100001, 0b11100011, 0b00100001, 0b00101000, 0b01101000, 0b01011111, 0b10101011, 0b00001101, 0b11000000, 0b11001010, 0b10010001, 0b11011000, 0b00011011, 0b10110000, 0b10110010, 0b11001000, 0b00100001, 0b00001000, 0b00001111, 0b01011110, 0b11000011, 0b11110011, 0b01000101, 0b00100001, 0b01110110, 0b00100101, 0b01001010, 0b00100000, 0b00010011, 0b00100101, 0b10110110, 0b10100010, 0b00001101, 0b00110100, 0b01000111, 0b10010111, 0b01010001, 0b10000001, 0b10111111, 0b01111000, 0b00101111, 0b00110000], # Node 333
-[0b01011001, 0b11010010, 0b10111010, 0b01101010, 0b01000100, 0b00010001, 0b01000110, 0b01010000, 0b10101010, 0b00011100, 0b10010011, 0b11111101, 0b10000010, 0b00111001, 0b11001010, 0b01011001, 0b01001110, 0b00111001, 0b11001000, 0b11001100, 0b10011001, 0b01011101, 0b01010000, 0b10111101, 0b01010011, 0b10010011, 0b01111001, 0b00100011, 0b11101001, 0b01101001, 0b11001111, 0b00101000, 0b11101000, 0b01100100, 0b10011001, 0b01101101, 0b11010111, 0b01100011, 0b00100111, 0b10000001, 0b00110100, 0b00010100, 0b01101000, 0b10100110, 0b01010111, 0b11100100, 0b10111100, 0b10111111, 0b00011001, 0b01001000, 0b00111101, 0b01001011, 0b10000110, 0b11001100, 0b10010001, 0b10000010, 0b10001011, 0b10100010, 0b00010000, 0b00000010, 0b11101100, 0b00100111, 0b00111010, 0b01011000, 0b00101101, 0b10110011, 0b00100100, 0b10100110, 0b01000100, 0b11001011, 0b10011111, 0b00111100, 0b10111101, 0b01010110, 0b11110110, 0b00001100, 0b10000111, 0b10011101, 0b00010111, 0b11110001, 0b00100001, 0b00000001, 0b10001011, 0b00000011, 0b10011101, 0b10011100, 0b00010000, 0b00011110, 0b11101010, 0b11000010, 0b00001101, 0b10001100, 0b01100100, 0b11010000, 0b10100011, 0b00110000, 0b01011110, 0b00000110], # Node 334
-[0b11111001, 0b01111011, 0b11010110, 0b10100111, 0b10101111, 0b11100110, 0b10010011, 0b11111110, 0b11011000, 0b01110000, 0b11010011, 0b00011011, 0b00100110, 0b10100011, 0b00100110, 0b01010110, 0b00011011, 0b00111000, 0b11001011, 0b01001101, 0b11011010, 0b10111100, 0b11001011, 0b11101011, 0b11011011, 0b10111110, 0b11001111, 0b11111011, 0b01111011, 0b01110111, 0b11101110, 0b01111111, 0b00110100, 0b11100001, 0b01010101, 0b11011111, 0b00001011, 0b01111110, 0b00001001, 0b10001101, 0b11110000, 0b10100101, 0b01010111, 0b11001111, 0b01001111, 0b11101001, 0b11111110, 0b11111011, 0b11010111, 0b11111111, 0b11111111, 0b11111111, 0b11100110, 0b10111101, 0b11111111, 0b10111111, 0b11110110, 0b11111111, 0b11111111, 0b11100111, 0b10111111, 0b11111110, 0b11010111, 0b11111010, 0b00010111, 0b11111010, 0b10001011, 0b00011010, 0b11010000, 0b01111111, 0b11111111, 0b00000001, 0b11110110, 0b11000110, 0b01011110, 0b01100000, 0b01101111, 0b10111111, 0b00000001, 0b11111100, 0b11001011, 0b00010110, 0b11011000, 0b11111110, 0b11011111, 0b01000001, 0b11011110, 0b11110111, 0b10010101, 0b11001100, 0b11010110, 0b11011110, 0b10111111, 0b00111101, 0b01111010, 0b10011111, 0b00111101, 0b10010111], # Node 335
-[0b11110000, 0b10110000, 0b00010000, 0b10100110, 0b10001101, 0b00100111, 0b10101111, 0b00100000, 0b10100001, 0b10110101, 0b11001110, 0b10101100, 0b00000000, 0b00000101, 0b01000000, 0b01011010, 0b10010110, 0b01101000, 0b00010010, 0b10110101, 0b00110011, 0b10100100, 0b11111000, 0b10101010, 0b00000010, 0b00111000, 0b10001101, 0b11110110, 0b01110111, 0b01011101, 0b10010011, 0b11010001, 0b01000100, 0b01000101, 0b10101011, 0b01001000, 0b00011011, 0b11110100, 0b11001001, 0b11100011, 0b01110000, 0b00011100, 0b10001000, 0b01000000, 0b10110000, 0b00101111, 0b11001100, 0b00010010, 0b01110101, 0b00101000, 0b01101011, 0b00000110, 0b00100010, 0b00101101, 0b01101101, 0b01001000, 0b11011001, 0b01000010, 0b01010101, 0b00000001, 0b00000101, 0b11001001, 0b10011010, 0b11011100, 0b10111010, 0b01111110, 0b11110110, 0b10100100, 0b00100111, 0b00000011, 0b01100111, 0b11101010, 0b10101001, 0b00001111, 0b00011000, 0b10100001, 0b00001010, 0b01001111, 0b01101110, 0b11110110, 0b11101100, 0b11001010, 0b01110111, 0b00000001, 0b10110110, 0b01111001, 0b10110110, 0b00100000, 0b11000111, 0b00000101, 0b10010000, 0b11100000, 0b10001110, 0b00001100, 0b00000001, 0b01001100, 0b00011111, 0b10011001], # Node 336
-[0b11100001, 0b11000100, 0b00000101, 0b00001100, 0b01011001, 0b00101100, 0b11000000, 0b00000000, 0b01000110, 0b10101111, 0b00000000, 0b10000000, 0b11111100, 0b00100010, 0b00100000, 0b00000100, 0b00011111, 0b00000001, 0b00100000, 0b10110000, 0b10001110, 0b00010001, 0b10000000, 0b10100001, 0b00101000, 0b00000000, 0b00011110, 0b00010100, 0b00000000, 0b11111000, 0b00000000, 0b00001100, 0b00000000, 0b00000110, 0b00100000, 0b00000011, 0b00110000, 0b10000000, 0b00000001, 0b10100000, 0b00000011, 0b10001010, 0b01000000, 0b00000011, 0b11110000, 0b00101001, 0b11011000, 0b00000001, 0b00101001, 0b00001000, 0b00011111, 0b11001100, 0b10011111, 0b11111010, 0b10100000, 0b00011011, 0b00001001, 0b00001111, 0b10011101, 0b00110110, 0b11111000, 0b11000000, 0b10111100, 0b10001001, 0b11111111, 0b00000110, 0b00100001, 0b11110000, 0b01111111, 0b10000000, 0b10000010, 0b11111111, 0b00000011, 0b00000100, 0b11100000, 0b00001111, 0b01100000, 0b00000100, 0b00100110, 0b00000000, 0b01110000, 0b00000001, 0b00000000, 0b01001000, 0b01001000, 0b10000000, 0b00000000, 0b00000011, 0b00101111, 0b00001100, 0b00100011, 0b01011110, 0b00101011, 0b10110010, 0b00110000, 0b01010010, 0b00110000, 0b01101101], # Node 337
-[0b10001011, 0b10111011, 0b10011100, 0b01001101, 0b01100101, 0b10111100, 0b10101111, 0b11101110, 0b01011010, 0b11001000, 0b00111111, 0b01101100, 0b11000000, 0b11000110, 0b00011101, 0b11100110, 0b11010010, 0b11111011, 0b00011111, 0b00011011, 0b11101101, 0b11111111, 0b10001000, 0b01011111, 0b00110111, 0b01100001, 0b10010001, 0b01111001, 0b00011011, 0b01101011, 0b10000111, 0b11011011, 0b10100011, 0b11000111, 0b11110000, 0b11001110, 0b00101101, 0b10001100, 0b10101100, 0b11001110, 0b00111101, 0b01110110, 0b11010010, 0b00011101, 0b10111100, 0b11100110, 0b11101001, 0b10011101, 0b10110111, 0b00100010, 0b01011101, 0b11100000, 0b11001110, 0b10011111, 0b00111100, 0b10101100, 0b01101011, 0b10011101, 0b00111101, 0b10111111, 0b10100110, 0b10100101, 0b10110101, 0b11111011, 0b11101001, 0b00110010, 0b11001010, 0b11100011, 0b01111101, 0b11010010, 0b10100010, 0b01011110, 0b01101000, 0b11001001, 0b00010001, 0b11011001, 0b01100100, 0b10111111, 0b10010101, 0b10110101, 0b11101011, 0b01100010, 0b01110011, 0b10000010, 0b11101101, 0b10101100, 0b01001011, 0b01101000, 0b11110101, 0b11111010, 0b01111001, 0b10011100, 0b00011100, 0b00010110, 0b10100010, 0b10110101, 0b11101011, 0b10100111], # Node 338
-[0b11010100, 0b00100101, 0b00110010, 0b00100110, 0b11110011, 0b10100001, 0b00000100, 0b01001101, 0b00010010, 0b01000010, 0b10100101, 0b10001001, 0b10100010, 0b10010000, 0b10001010, 0b11010001, 0b11000001, 0b00001000, 0b00110001, 0b11000111, 0b11111001, 0b11000110, 0b00110000, 0b01111110, 0b11001001, 0b11110001, 0b00010111, 0b00001001, 0b11000001, 0b01011101, 0b00111011, 0b11101000, 0b00111000, 0b00010111, 0b01100000, 0b00101110, 0b01010111, 0b11111100, 0b10001000, 0b10001110, 0b00100001, 0b11111000, 0b00011011, 0b11011111, 0b00010110, 0b10010100, 0b01010000, 0b10010101, 0b00001001, 0b00100011, 0b01000110, 0b01011000, 0b11110011, 0b10100101, 0b01010111, 0b01010001, 0b10000001, 0b10001000, 0b10011100, 0b01011110, 0b10100101, 0b00100101, 0b00001100, 0b00101010, 0b00110010, 0b11010000, 0b01001110, 0b00000111, 0b11010101, 0b00010000, 0b00000101, 0b00100011, 0b11110100, 0b00111001, 0b00000000, 0b01100010, 0b10010110, 0b10000101, 0b11110110, 0b00000111, 0b00101001, 0b01010001, 0b00101101, 0b00010100, 0b10100001, 0b01000001, 0b01111100, 0b00001001, 0b10011110, 0b11001101, 0b01100010, 0b00000010, 0b10001001, 0b10101101, 0b10010010, 0b00100100, 0b10111001, 0b01111010], # Node 339
-[0b10110000, 0b11011011, 0b10100110, 0b00010100, 0b10000000, 0b01100110, 0b00110101, 0b10010000, 0b00000000, 0b10000111, 0b10001010, 0b10110010, 0b10111010, 0b11001011, 0b01010111, 0b11110101, 0b10010010, 0b01100111, 0b01000000, 0b01101001, 0b01011001, 0b01001000, 0b11001001, 0b01000000, 0b11001001, 0b00101100, 0b11111111, 0b01000101, 0b11101000, 0b00001001, 0b01000111, 0b00000000, 0b10100110, 0b10100001, 0b01000001, 0b00110100, 0b11110010, 0b10100110, 0b01100110, 0b00000001, 0b01001100, 0b01000000, 0b00100110, 0b00010000, 0b11000011, 0b10000100, 0b00000111, 0b11111100, 0b01010101, 0b11101010, 0b01000000, 0b01010111, 0b10100111, 0b00000000, 0b11011010, 0b00000100, 0b00010000, 0b11101011, 0b01000100, 0b11010010, 0b10000111, 0b10010100, 0b11001010, 0b11001001, 0b01010111, 0b00101001, 0b00010000, 0b00001001, 0b00011110, 0b00110000, 0b10010000, 0b10011111, 0b11110010, 0b11100101, 0b10000010, 0b00001010, 0b11010101, 0b01011000, 0b01111111, 0b10000111, 0b11001000, 0b00000010, 0b00001100, 0b00110000, 0b10100010, 0b01110110, 0b11000101, 0b10001000, 0b10000001, 0b01110101, 0b00011010, 0b00000110, 0b11000100, 0b10111000, 0b10001010, 0b01001010, 0b01001111, 0b01110110], # Node 340
-[0b10010010, 0b10111000, 0b00111010, 0b01001111, 0b11111110, 0b11111110, 0b00111011, 0b01111001, 0b01001111, 0b11011111, 0b01111100, 0b10111111, 0b11010100, 0b10010000, 0b11110100, 0b10011010, 0b01100101, 0b10111111, 0b11011011, 0b11001011, 0b01101010, 0b11101101, 0b11011110, 0b01010000, 0b11101100, 0b10010101, 0b00110001, 0b10001100, 0b01111010, 0b01000110, 0b11100000, 0b10111011, 0b01101110, 0b11100001, 0b00110111, 0b01111110, 0b00000001, 0b10101001, 0b11111100, 0b01101111, 0b00000110, 0b00000111, 0b00111000, 0b10100101, 0b11011111, 0b01110110, 0b00101011, 0b11011111, 0b11110010, 0b10010111, 0b11001111, 0b11111111, 0b11011011, 0b11011100, 0b10111111, 0b01111110, 0b00011110, 0b01110001, 0b11110111, 0b10110111, 0b11100000, 0b00100001, 0b10111110, 0b10001111, 0b00100000, 0b11110011, 0b01111111, 0b01010101, 0b11001000, 0b11101110, 0b10111111, 0b01011000, 0b11111111, 0b00111101, 0b11000110, 0b11110110, 0b01111101, 0b00010010, 0b01111111, 0b01101110, 0b00000001, 0b10100111, 0b11001000, 0b10001100, 0b11100111, 0b00100111, 0b01011010, 0b00111111, 0b10010111, 0b10110001, 0b11010110, 0b01111010, 0b01010101, 0b11101111, 0b01011111, 0b10111111, 0b01010111, 0b11000101], # Node 341
-[0b11111001, 0b10100001, 0b00110110, 0b11111111, 0b10111101, 0b11110010, 0b11010110, 0b01111001, 0b11110110, 0b01110111, 0b10111101, 0b01001001, 0b01100101, 0b01001100, 0b00010110, 0b01101011, 0b11111011, 0b10111111, 0b11101011, 0b00100000, 0b11111100, 0b00111011, 0b11110111, 0b01010001, 0b01010011, 0b11101111, 0b10111110, 0b10110111, 0b11011101, 0b11001001, 0b00010001, 0b11010100, 0b11011110, 0b01001110, 0b11111011, 0b11101111, 0b00111110, 0b01010111, 0b10100101, 0b11111110, 0b00001101, 0b11111110, 0b11111011, 0b11111110, 0b11100001, 0b10111010, 0b10111001, 0b01111110, 0b11101001, 0b11111011, 0b00011010, 0b11011001, 0b11100110, 0b10010101, 0b11000010, 0b10001010, 0b01001000, 0b01110000, 0b11100100, 0b01001011, 0b00001011, 0b00000010, 0b01001110, 0b11010010, 0b11101001, 0b01101100, 0b00111010, 0b11110101, 0b11100101, 0b11111111, 0b00100100, 0b10001001, 0b11111101, 0b11100110, 0b00101111, 0b11111010, 0b10011000, 0b01011110, 0b10101110, 0b00111011, 0b11001110, 0b01000100, 0b01101101, 0b00110011, 0b01010111, 0b11111111, 0b01101110, 0b01111111, 0b01110011, 0b11010011, 0b01001011, 0b00111110, 0b11110011, 0b10010100, 0b00101010, 0b01011010, 0b11011010, 0b10001010], # Node 342
-[0b10110010, 0b11100100, 0b11010100, 0b10011010, 0b00001001, 0b00011000, 0b01001100, 0b11011101, 0b00000000, 0b00000000, 0b10010011, 0b00100010, 0b00000000, 0b11111000, 0b00001110, 0b00110111, 0b00000000, 0b00110100, 0b00010000, 0b00001011, 0b00100000, 0b00001101, 0b11101101, 0b00000111, 0b01001000, 0b11110001, 0b11111111, 0b10000001, 0b11100010, 0b11111101, 0b00000111, 0b11011000, 0b11111111, 0b10111111, 0b00000001, 0b11111111, 0b11111111, 0b01110000, 0b10000000, 0b00111111, 0b11001100, 0b11111111, 0b01110100, 0b11000000, 0b11111111, 0b11100111, 0b00000001, 0b01111100, 0b11100001, 0b00011000, 0b11100000, 0b00000100, 0b01101110, 0b00000001, 0b00010110, 0b11110000, 0b00000000, 0b01111100, 0b00000000, 0b00001111, 0b11100000, 0b00001111, 0b11110000, 0b00000010, 0b01111111, 0b10000000, 0b00101111, 0b11111000, 0b00000011, 0b11111100, 0b10000000, 0b00000000, 0b11110000, 0b00101111, 0b00001010, 0b01010000, 0b00111101, 0b11100001, 0b01000001, 0b11111111, 0b00110111, 0b11111100, 0b10111111, 0b10011110, 0b10100010, 0b11111111, 0b01111111, 0b10001101, 0b11111110, 0b11111111, 0b10111111, 0b11111010, 0b11111111, 0b11111111, 0b00011100, 0b11111100, 0b11111111, 0b11110110], # Node 343
-[0b11111101, 0b10110111, 0b10101100, 0b10110111, 0b01110110, 0b11101000, 0b01010111, 0b11111010, 0b11100011, 0b11111101, 0b11101001, 0b11011111, 0b01011111, 0b10111001, 0b01111011, 0b00000000, 0b11010111, 0b11111100, 0b00111111, 0b10000100, 0b10101111, 0b01111110, 0b10000010, 0b11100101, 0b11011110, 0b01000001, 0b10011100, 0b11101111, 0b01110111, 0b11110010, 0b11111111, 0b10111101, 0b10000101, 0b10111111, 0b11110010, 0b01110101, 0b11110010, 0b01000010, 0b00110100, 0b00100100, 0b00001101, 0b11110000, 0b11111011, 0b00100000, 0b00000010, 0b01011101, 0b00100111, 0b10000101, 0b11110000, 0b10101011, 0b01100000, 0b00011100, 0b10010100, 0b00001111, 0b11001011, 0b00010001, 0b01111100, 0b01000000, 0b00011110, 0b11001010, 0b10000011, 0b00000100, 0b11100000, 0b00011101, 0b01000000, 0b10010001, 0b10110110, 0b00000110, 0b00001000, 0b01110000, 0b11011011, 0b00000000, 0b10000000, 0b11011000, 0b01011111, 0b10000010, 0b01111101, 0b11101100, 0b11010100, 0b10010100, 0b01101110, 0b11111110, 0b11011101, 0b10101101, 0b01100011, 0b11101011, 0b11100011, 0b01001111, 0b11100100, 0b11011110, 0b10110111, 0b11001101, 0b10100111, 0b00011111, 0b11100110, 0b00111111, 0b10110011, 0b11011011], # Node 344
-[0b00001111, 0b00011111, 0b00100111, 0b00010111, 0b01111110, 0b00111011, 0b10110000, 0b01100011, 0b11010010, 0b01110100, 0b11010101, 0b11110101, 0b01101101, 0b00110111, 0b01111010, 0b01101101, 0b10010101, 0b00000111, 0b01101010, 0b01011101, 0b00110110, 0b11100001, 0b11110001, 0b11110110, 0b10001011, 0b01010011, 0b00101000, 0b11001010, 0b00111110, 0b11110011, 0b01001000, 0b11100010, 0b11100000, 0b11110100, 0b11111000, 0b01101010, 0b00010010, 0b00110111, 0b11110001, 0b01110001, 0b10101001, 0b11001001, 0b11111011, 0b10101001, 0b01001100, 0b01101000, 0b10101010, 0b11100110, 0b11011001, 0b01110001, 0b01101110, 0b01111101, 0b11101111, 0b00111010, 0b00111000, 0b10101111, 0b10111110, 0b01101110, 0b11110011, 0b11101110, 0b11110101, 0b00001111, 0b01111010, 0b01110111, 0b11100101, 0b10001010, 0b10001111, 0b00100111, 0b01110101, 0b01001101, 0b10110101, 0b10100111, 0b11010001, 0b10010110, 0b10011011, 0b10010011, 0b00100000, 0b11011101, 0b01100101, 0b11010001, 0b10111110, 0b10101001, 0b00010010, 0b00001101, 0b11010000, 0b11101001, 0b11111011, 0b11110101, 0b10011111, 0b11010010, 0b01110111, 0b01110011, 0b11001110, 0b01001010, 0b00110111, 0b00111100, 0b01010111, 0b11101001], # Node 345
-[0b01000110, 0b00100000, 0b10001101, 0b00010000, 0b10100111, 0b00010110, 0b00100100, 0b10101101, 0b11010001, 0b00100100, 0b01000101, 0b11100100, 0b00010100, 0b00100000, 0b00001101, 0b00101111, 0b00000011, 0b10010000, 0b00010011, 0b11001100, 0b01001000, 0b01100110, 0b10001100, 0b00011000, 0b01111101, 0b00100001, 0b00111101, 0b00100110, 0b01110101, 0b10110000, 0b01000000, 0b00100000, 0b00100100, 0b01100100, 0b00010010, 0b01110000, 0b11100101, 0b10000100, 0b00010101, 0b10110000, 0b00001100, 0b00110100, 0b00100101, 0b00100000, 0b00100101, 0b11000100, 0b00001100, 0b10101110, 0b11010000, 0b11011110, 0b01000110, 0b11010111, 0b00001001, 0b10100100, 0b10001100, 0b00010010, 0b11011010, 0b00100010, 0b00100010, 0b10100001, 0b01000100, 0b10111100, 0b10001000, 0b11000100, 0b10000010, 0b11001100, 0b01011000, 0b00011001, 0b11010011, 0b01000100, 0b00010100, 0b00110001, 0b10001111, 0b01110110, 0b10001001, 0b10011101, 0b00000100, 0b10011001, 0b01010010, 0b10000101, 0b00100011, 0b01100111, 0b10000100, 0b01001011, 0b01111011, 0b01101111, 0b10110000, 0b00010000, 0b00100010, 0b00010100, 0b10110100, 0b10010100, 0b10001000, 0b00001110, 0b11111001, 0b10010010, 0b00100110, 0b11000011], # Node 346
-[0b01100100, 0b00001000, 0b10101011, 0b00101111, 0b00011101, 0b11011011, 0b01100100, 0b01110100, 0b00110001, 0b00010011, 0b10110000, 0b10100110, 0b00100101, 0b01010010, 0b10101010, 0b10101101, 0b11000001, 0b00000100, 0b11000110, 0b01101001, 0b01011000, 0b11110100, 0b10101001, 0b11111101, 0b00100101, 0b00100001, 0b10101100, 0b00101101, 0b00010001, 0b01000001, 0b11000100, 0b10110001, 0b00000010, 0b10000010, 0b00110001, 0b00000001, 0b00010110, 0b11001010, 0b11001001, 0b01100101, 0b10100000, 0b01001011, 0b00001010, 0b00011100, 0b00000000, 0b00000001, 0b00010000, 0b00110110, 0b00000010, 0b11101001, 0b00010010, 0b00001100, 0b10101101, 0b00100011, 0b11101101, 0b00001011, 0b00001010, 0b11000000, 0b10110111, 0b11001010, 0b01100010, 0b00101111, 0b00010011, 0b11001010, 0b00011100, 0b10101110, 0b01111101, 0b10111001, 0b10000011, 0b00011111, 0b10001111, 0b01000100, 0b01100111, 0b10110000, 0b00011110, 0b10010100, 0b00011110, 0b01000100, 0b01110111, 0b01001000, 0b11100100, 0b10101000, 0b01001011, 0b00000001, 0b11000111, 0b01010110, 0b00000010, 0b10001001, 0b01000001, 0b00100001, 0b11100110, 0b11011010, 0b00100100, 0b11000110, 0b00110001, 0b00011000, 0b10001010, 0b10011000], # Node 347
-[0b01110101, 0b10011111, 0b11011101, 0b10010101, 0b00111000, 0b11010110, 0b11111111, 0b11100110, 0b01111011, 0b10011111, 0b01101100, 0b10001111, 0b11011101, 0b10111111, 0b00010110, 0b10011111, 0b11111100, 0b10110110, 0b01010101, 0b11011101, 0b10101110, 0b01111110, 0b11110011, 0b11011110, 0b00111111, 0b00010000, 0b10100001, 0b10001101, 0b00101110, 0b10000011, 0b11001111, 0b10101101, 0b01100110, 0b11101001, 0b01011110, 0b10111110, 0b00000110, 0b00111100, 0b01000100, 0b01010001, 0b11001011, 0b11011011, 0b11011101, 0b10101010, 0b10000001, 0b00111101, 0b01000101, 0b00010000, 0b00011101, 0b11111011, 0b00010110, 0b11111011, 0b11111101, 0b10101111, 0b11010100, 0b11100110, 0b00110000, 0b10100100, 0b11111000, 0b00111011, 0b11010101, 0b01111001, 0b11111010, 0b00011111, 0b00101011, 0b10010000, 0b01110100, 0b00111111, 0b00010100, 0b00110001, 0b10100001, 0b10011100, 0b01110001, 0b10011011, 0b00101011, 0b11111011, 0b11111111, 0b11111101, 0b01000110, 0b10100011, 0b00111111, 0b11111110, 0b01000110, 0b01111001, 0b01111011, 0b11110001, 0b10111111, 0b00101111, 0b00101110, 0b10111011, 0b11110111, 0b10011111, 0b11011110, 0b00101110, 0b10000001, 0b01101010, 0b10111010, 0b01010001], # Node 348
-[0b11101101, 0b11110110, 0b01010010, 0b11100111, 0b01111111, 0b00110110, 0b11110100, 0b10101101, 0b11101011, 0b11111111, 0b01111001, 0b11111010, 0b11011111, 0b11011101, 0b10110110, 0b01011011, 0b10000110, 0b01111011, 0b11111111, 0b11111011, 0b11110011, 0b01111111, 0b01000011, 0b11110011, 0b01011010, 0b11010111, 0b10100001, 0b11011110, 0b01110011, 0b11111111, 0b11111110, 0b10111000, 0b10001101, 0b11011010, 0b10100101, 0b10101011, 0b00010011, 0b01111110, 0b10110111, 0b00111100, 0b01010000, 0b11011001, 0b11111111, 0b10111000, 0b11000001, 0b01011111, 0b01001100, 0b00000110, 0b00110000, 0b00000101, 0b11110111, 0b10000000, 0b01011010, 0b01000001, 0b10010000, 0b11100110, 0b00001111, 0b11101001, 0b11010010, 0b10101111, 0b11111110, 0b10001001, 0b01110100, 0b00001000, 0b01001001, 0b10001001, 0b00110111, 0b11011100, 0b00011001, 0b10100001, 0b01011100, 0b00101110, 0b10010001, 0b01101010, 0b00111110, 0b10100110, 0b01001101, 0b11101100, 0b00001011, 0b11001110, 0b11010100, 0b11001111, 0b01110010, 0b10110110, 0b10110101, 0b11010100, 0b11111110, 0b11111001, 0b10011000, 0b11011110, 0b10010001, 0b01101101, 0b10100000, 0b01001010, 0b11100111, 0b01011101, 0b11010111, 0b00001111], # Node 349
-[0b01011101, 0b10101110, 0b11000111, 0b10001110, 0b10001010, 0b01000101, 0b11101111, 0b10011011, 0b00111011, 0b10110110, 0b10111001, 0b11010111, 0b11000111, 0b01011010, 0b11011110, 0b00110110, 0b10111101, 0b01011101, 0b10101010, 0b10101111, 0b11010100, 0b10101111, 0b01111011, 0b10001001, 0b10110110, 0b00011001, 0b11101010, 0b11110101, 0b10111000, 0b10010010, 0b01110110, 0b00011101, 0b11110101, 0b01000110, 0b01000101, 0b00010001, 0b00000101, 0b10000010, 0b01011010, 0b01001001, 0b10110100, 0b00100010, 0b11101010, 0b11010111, 0b10001100, 0b11001010, 0b11000111, 0b00010001, 0b01011110, 0b01111010, 0b11000010, 0b01111001, 0b01110011, 0b10101011, 0b00010111, 0b11011001, 0b10111010, 0b01001111, 0b11111000, 0b11111000, 0b10001001, 0b10001011, 0b10001001, 0b10110101, 0b00101101, 0b00010100, 0b11111001, 0b10001111, 0b11101111, 0b01011010, 0b10011100, 0b01100001, 0b10000011, 0b11011111, 0b01011111, 0b01100000, 0b11000110, 0b01111100, 0b01010110, 0b00000011, 0b11101100, 0b11111101, 0b11111000, 0b10110110, 0b11000000, 0b11010010, 0b11100111, 0b10110110, 0b00101111, 0b11100010, 0b10010111, 0b11000001, 0b01001110, 0b01011100, 0b11111110, 0b00101111, 0b01010001, 0b10100011], # Node 350
-[0b11111100, 0b00100010, 0b00111111, 0b11111110, 0b11011111, 0b10111110, 0b01110111, 0b01110110, 0b11110011, 0b01101011, 0b01111101, 0b11111111, 0b11011111, 0b01111100, 0b10111111, 0b00111110, 0b01001111, 0b11101010, 0b11010000, 0b10100011, 0b00011111, 0b00101011, 0b11010100, 0b11111110, 0b10111111, 0b10010000, 0b10111000, 0b01110010, 0b00000101, 0b10001000, 0b01101000, 0b01101111, 0b01001001, 0b10000000, 0b01101111, 0b10100100, 0b00011111, 0b11111000, 0b11010010, 0b11111111, 0b00000110, 0b01111110, 0b10101001, 0b10001011, 0b11110111, 0b00110111, 0b01111010, 0b11111110, 0b00111111, 0b11010101, 0b11101111, 0b10111111, 0b00100111, 0b00110100, 0b11111111, 0b00111111, 0b10010000, 0b01101111, 0b11010111, 0b11001101, 0b11000010, 0b00010100, 0b10110000, 0b11101010, 0b10111100, 0b11111100, 0b11001111, 0b01111011, 0b00011111, 0b01101101, 0b10111001, 0b01111110, 0b01101001, 0b11011110, 0b10110100, 0b11001110, 0b11001101, 0b10001111, 0b11100101, 0b01001000, 0b11111010, 0b11110100, 0b01101001, 0b00100110, 0b11111111, 0b00011111, 0b10101010, 0b11111000, 0b11101011, 0b10111101, 0b01111110, 0b11111001, 0b01100111, 0b11010101, 0b10111101, 0b10111011, 0b10110110, 0b01100111], # Node 351
-[0b00111101, 0b10111111, 0b01110111, 0b11111110, 0b11111110, 0b00111011, 0b01111110, 0b11101111, 0b11111111, 0b01111111, 0b10111101, 0b10111111, 0b10000000, 0b01011100, 0b11011001, 0b01001111, 0b11000010, 0b10101111, 0b00111110, 0b00111000, 0b00111111, 0b11001111, 0b10111011, 0b10000000, 0b11111100, 0b00110101, 0b10111111, 0b01110010, 0b00101110, 0b11011100, 0b10000011, 0b11101111, 0b01001110, 0b00010010, 0b01111100, 0b00011101, 0b10000111, 0b11000000, 0b11010101, 0b11001100, 0b01010001, 0b11111100, 0b01001111, 0b10101111, 0b11001111, 0b01011011, 0b11111111, 0b00111001, 0b01010110, 0b01111111, 0b10011111, 0b11000001, 0b00001010, 0b11100110, 0b01011111, 0b11011001, 0b10000101, 0b10110011, 0b00001100, 0b11111111, 0b01100001, 0b01111001, 0b11100011, 0b11001110, 0b11001111, 0b10101100, 0b01101111, 0b11110101, 0b00111101, 0b10110110, 0b01011101, 0b11111110, 0b11111101, 0b10111110, 0b10100000, 0b00000010, 0b11111011, 0b11100111, 0b00100110, 0b11111110, 0b00101111, 0b01111101, 0b11110000, 0b11011111, 0b11110101, 0b00111111, 0b01111111, 0b11111111, 0b00111011, 0b10111001, 0b11111111, 0b00011011, 0b11110101, 0b11010111, 0b01110111, 0b11010101, 0b11100011, 0b10010111], # Node 352
-[0b01100001, 0b00110000, 0b01111001, 0b00110010, 0b01111001, 0b11110111, 0b00110111, 0b11101101, 0b10010010, 0b11110011, 0b11011110, 0b01000111, 0b11111000, 0b10110101, 0b01110111, 0b00000010, 0b11101110, 0b01011110, 0b00111110, 0b01110000, 0b00111111, 0b11011001, 0b00011011, 0b01111111, 0b00101011, 0b01111101, 0b11111100, 0b00110110, 0b11110100, 0b00101111, 0b01111110, 0b00000101, 0b01111110, 0b00000000, 0b11111111, 0b11101111, 0b00111111, 0b11101000, 0b00100111, 0b11111111, 0b10110011, 0b00010011, 0b11111001, 0b00111111, 0b00110111, 0b11111000, 0b11111110, 0b11111011, 0b10111001, 0b11110101, 0b10101111, 0b01101101, 0b11101111, 0b11011011, 0b11110111, 0b11101111, 0b00111101, 0b11000000, 0b11011111, 0b10001000, 0b00001110, 0b00111000, 0b01010101, 0b00010111, 0b01000000, 0b10101000, 0b10011111, 0b00000000, 0b00000000, 0b11000111, 0b00110111, 0b00000101, 0b11110000, 0b11111111, 0b00010000, 0b11000010, 0b11111111, 0b00001111, 0b00101101, 0b11111111, 0b01011111, 0b11001011, 0b11111111, 0b01111111, 0b11101001, 0b11111001, 0b11111111, 0b01110011, 0b11110111, 0b11110111, 0b11111111, 0b00011001, 0b10110011, 0b10011010, 0b11111000, 0b11110110, 0b01110111, 0b11111110], # Node 353
-[0b00000010, 0b00101111, 0b10010010, 0b00100001, 0b00010010, 0b00110111, 0b01010000, 0b01011010, 0b01001000, 0b00000010, 0b10011000, 0b01010000, 0b10100000, 0b00010000, 0b00000000, 0b11010010, 0b01001001, 0b11111100, 0b00001000, 0b00000000, 0b01010111, 0b00001000, 0b11111101, 0b01011101, 0b10111000, 0b10000101, 0b01111011, 0b00001111, 0b00001110, 0b11010000, 0b11111111, 0b01101110, 0b11000000, 0b11111011, 0b10111110, 0b11010000, 0b10000111, 0b00001110, 0b11000010, 0b01000100, 0b01100011, 0b00110101, 0b10010100, 0b00100111, 0b01100111, 0b00010010, 0b10010110, 0b01101100, 0b11100011, 0b00011101, 0b11011000, 0b00000111, 0b00011100, 0b00111110, 0b00111000, 0b00100010, 0b01110100, 0b11100001, 0b00000100, 0b01000000, 0b00000001, 0b00000001, 0b01100000, 0b01010011, 0b00000001, 0b10000000, 0b00011010, 0b00011100, 0b00000100, 0b00011000, 0b01110011, 0b01001000, 0b10111000, 0b01100110, 0b01110000, 0b11001111, 0b00000101, 0b01000110, 0b01111111, 0b00111111, 0b00000000, 0b10001000, 0b11011111, 0b11001101, 0b10001100, 0b11100010, 0b01001110, 0b10000000, 0b00111100, 0b00010010, 0b00100100, 0b11101011, 0b10001010, 0b01000011, 0b01111011, 0b10001100, 0b10001111, 0b11010100], # Node 354
-[0b01011001, 0b00010010, 0b11101010, 0b01111001, 0b00010011, 0b00010100, 0b01111001, 0b00110110, 0b01101010, 0b00000100, 0b11000010, 0b00001100, 0b00110110, 0b10001010, 0b00100101, 0b00010101, 0b10110011, 0b11010111, 0b11000100, 0b11010101, 0b01000010, 0b10101011, 0b00000010, 0b01001001, 0b00011100, 0b11010111, 0b10000000, 0b10100010, 0b00001000, 0b01101000, 0b00010101, 0b01010001, 0b10110000, 0b00111011, 0b11110001, 0b00000011, 0b01100101, 0b01101101, 0b01111110, 0b00010111, 0b00011000, 0b11000010, 0b00101000, 0b00001101, 0b10001100, 0b01000000, 0b00001000, 0b11101001, 0b00000000, 0b11001000, 0b10010101, 0b01101000, 0b00011100, 0b01011011, 0b01001011, 0b01100110, 0b00010011, 0b00101100, 0b11010000, 0b01111010, 0b10001000, 0b01010001, 0b10010101, 0b11000000, 0b10100101, 0b01001011, 0b10010010, 0b01000101, 0b10011111, 0b01100100, 0b10110100, 0b10100000, 0b01001000, 0b01001001, 0b11111100, 0b01100000, 0b00101011, 0b11001101, 0b01111000, 0b01100001, 0b11100011, 0b00000010, 0b10100011, 0b00000101, 0b01001100, 0b00011000, 0b00011101, 0b01000000, 0b10001101, 0b00000011, 0b11110110, 0b00100001, 0b00000100, 0b01010101, 0b00001000, 0b10010000, 0b00010001, 0b01110011], # Node 355
-[0b01000011, 0b01100010, 0b10001001, 0b00110111, 0b11111001, 0b10010101, 0b01000011, 0b10010000, 0b11001101, 0b01000010, 0b01101010, 0b00111001, 0b01100011, 0b00110111, 0b00000111, 0b11011100, 0b00110011, 0b10100000, 0b00000000, 0b01000000, 0b10100101, 0b00101110, 0b00111010, 0b00010110, 0b11010101, 0b10011001, 0b11101010, 0b11001101, 0b01011000, 0b00100110, 0b11001010, 0b00001000, 0b10111100, 0b10110000, 0b01100011, 0b10100101, 0b10010100, 0b00011100, 0b11010010, 0b11000100, 0b11011011, 0b00001101, 0b01011011, 0b10101011, 0b11011110, 0b10110000, 0b00010011, 0b10111001, 0b01110100, 0b10000010, 0b01000001, 0b00011100, 0b00001000, 0b11010100, 0b10111111, 0b01000111, 0b10011111, 0b11001011, 0b01111010, 0b01001111, 0b10000001, 0b10111110, 0b10111011, 0b11010100, 0b00011111, 0b11000111, 0b11000100, 0b00000010, 0b01110110, 0b00101101, 0b00101101, 0b10110110, 0b10110110, 0b01010110, 0b01100101, 0b00001100, 0b00011111, 0b11000110, 0b11101001, 0b00010100, 0b10100001, 0b01010000, 0b01000010, 0b00000110, 0b00111110, 0b00111110, 0b01010101, 0b00000010, 0b01101011, 0b00100001, 0b11000000, 0b11010000, 0b00011000, 0b01100110, 0b00100001, 0b00011101, 0b00010010, 0b10100100], # Node 356
-[0b01000010, 0b01001000, 0b11001001, 0b00001001, 0b01001011, 0b00101110, 0b00100110, 0b11011111, 0b10101011, 0b01110000, 0b00000000, 0b00010000, 0b00011001, 0b01010000, 0b01000001, 0b11111110, 0b01001100, 0b00000000, 0b11000011, 0b11101101, 0b00100111, 0b10110100, 0b10011100, 0b10010101, 0b01101100, 0b00001000, 0b00011100, 0b10000001, 0b00010001, 0b11110110, 0b00001100, 0b01101010, 0b00000100, 0b00110000, 0b11101100, 0b11000101, 0b01111001, 0b00001101, 0b00011000, 0b10101001, 0b01011001, 0b10111111, 0b10101111, 0b00111101, 0b01010110, 0b00110111, 0b01001100, 0b01000100, 0b11110111, 0b00010000, 0b11111011, 0b10111100, 0b00001101, 0b01010101, 0b01000000, 0b00000000, 0b11011111, 0b01000011, 0b10011111, 0b10001000, 0b01011000, 0b11111100, 0b01000000, 0b00001010, 0b00111101, 0b00101110, 0b11101010, 0b00010101, 0b00111111, 0b10111100, 0b00011011, 0b11111111, 0b00010111, 0b11110101, 0b00111101, 0b00001111, 0b10100011, 0b10001110, 0b11111011, 0b10110011, 0b01100101, 0b00000000, 0b11101111, 0b01010011, 0b00010101, 0b00001110, 0b00010000, 0b11000100, 0b11100010, 0b10000010, 0b01010011, 0b01011000, 0b01110110, 0b01010010, 0b00110010, 0b00100110, 0b00010101, 0b01010101], # Node 357
-[0b00100111, 0b11010001, 0b00000100, 0b00001100, 0b10001000, 0b01101010, 0b01011001, 0b00110000, 0b00110011, 0b11101101, 0b00011011, 0b00100011, 0b11110111, 0b00000011, 0b00000111, 0b10001010, 0b01001011, 0b00110111, 0b01010011, 0b10101110, 0b11001010, 0b10010000, 0b01101100, 0b01000000, 0b00101100, 0b00100000, 0b11001011, 0b10100000, 0b11010001, 0b00110000, 0b10010111, 0b10011000, 0b10100011, 0b01100110, 0b00001101, 0b01100101, 0b10001000, 0b11001100, 0b10001101, 0b00001100, 0b00101110, 0b00001100, 0b10010101, 0b11001101, 0b01011011, 0b11000001, 0b01111101, 0b01001101, 0b01010101, 0b01000000, 0b10101110, 0b00001111, 0b00110001, 0b11010000, 0b11011011, 0b10011000, 0b00001000, 0b11110010, 0b01010001, 0b00101000, 0b11111100, 0b10001110, 0b00000101, 0b10000101, 0b01010010, 0b10011101, 0b01010000, 0b11011000, 0b10101011, 0b00110100, 0b01010110, 0b00111110, 0b00010111, 0b01010001, 0b00110100, 0b10001010, 0b11011000, 0b00011000, 0b10111010, 0b10011100, 0b01001101, 0b10100110, 0b11101001, 0b10111010, 0b11100101, 0b10100001, 0b01000011, 0b11101111, 0b10101010, 0b00000010, 0b10000000, 0b01101101, 0b01011010, 0b11000000, 0b10100100, 0b00001101, 0b10000011, 0b01001000], # Node 358
-[0b11010000, 0b10000100, 0b11111111, 0b00010110, 0b11010100, 0b01111100, 0b00011101, 0b11110111, 0b01100110, 0b10111010, 0b01100110, 0b00011111, 0b11110111, 0b10001100, 0b10100100, 0b01101110, 0b11101101, 0b01011111, 0b01011111, 0b00000101, 0b01110110, 0b00010010, 0b10101101, 0b11100001, 0b11110100, 0b00101010, 0b10010000, 0b11001110, 0b11110101, 0b01101100, 0b00010101, 0b11010110, 0b10100101, 0b00100111, 0b11100011, 0b01111010, 0b01011110, 0b10111101, 0b01001000, 0b10000010, 0b00010111, 0b10101101, 0b10000100, 0b00111000, 0b01010010, 0b10010010, 0b01100101, 0b10010000, 0b00110011, 0b11101111, 0b11011011, 0b11001110, 0b01101111, 0b01111100, 0b00100001, 0b11001111, 0b11101011, 0b11100111, 0b01000001, 0b11111001, 0b01101000, 0b11111100, 0b01011010, 0b10100100, 0b01101001, 0b11111001, 0b10101110, 0b01110011, 0b11000000, 0b10010111, 0b11110111, 0b00101011, 0b01111010, 0b00111010, 0b10011000, 0b11011100, 0b11101110, 0b11111100, 0b10111010, 0b01101110, 0b00110101, 0b10001111, 0b11111001, 0b11111000, 0b11011111, 0b00011010, 0b01011011, 0b11011011, 0b00110011, 0b01011000, 0b11101110, 0b00011000, 0b10101011, 0b11001011, 0b11001111, 0b10000001, 0b11100001, 0b01000111], # Node 359
-[0b01110111, 0b01100101, 0b01111010, 0b00011110, 0b11010101, 0b10100010, 0b00001000, 0b11111111, 0b11101101, 0b10011010, 0b01010011, 0b00001101, 0b11011010, 0b10100111, 0b00110101, 0b00001011, 0b01111011, 0b00001111, 0b10100011, 0b11011111, 0b11000010, 0b01001000, 0b00000000, 0b00001001, 0b00101111, 0b10011111, 0b10000010, 0b11111100, 0b11111101, 0b10101000, 0b01110111, 0b11110101, 0b01110011, 0b00100011, 0b10100101, 0b11111010, 0b11001101, 0b01101101, 0b01011001, 0b11011010, 0b01101011, 0b11111101, 0b11000110, 0b01011001, 0b11111111, 0b10110100, 0b00111111, 0b10110000, 0b10010010, 0b01100111, 0b11011011, 0b10100110, 0b01010011, 0b10010100, 0b00010110, 0b01001010, 0b01110110, 0b01101111, 0b00111011, 0b01010001, 0b11101101, 0b00000101, 0b01110100, 0b00001111, 0b11110110, 0b10000111, 0b10011000, 0b00111000, 0b00010000, 0b10100101, 0b11011110, 0b01011000, 0b01101001, 0b10110010, 0b01110111, 0b10100010, 0b01101110, 0b10101010, 0b10010001, 0b11101000, 0b11111100, 0b11010011, 0b11111010, 0b00100100, 0b11001101, 0b10100011, 0b01011100, 0b10100001, 0b10111000, 0b00110011, 0b01010011, 0b10110111, 0b11011100, 0b11110001, 0b11011101, 0b00010100, 0b10110110, 0b11101101], # Node 360
-[0b01111011, 0b10000001, 0b01010010, 0b01000001, 0b00110010, 0b10110011, 0b10001101, 0b11010000, 0b11000000, 0b00011110, 0b11000011, 0b00010110, 0b10110001, 0b00010110, 0b00110100, 0b11001001, 0b01001100, 0b10000100, 0b10110001, 0b01111100, 0b00110000, 0b00011110, 0b11111011, 0b11110101, 0b10001001, 0b00111010, 0b10011000, 0b00100011, 0b10111010, 0b10111100, 0b10001110, 0b00101011, 0b01110001, 0b11100001, 0b10001101, 0b10000110, 0b00101000, 0b01100010, 0b00011111, 0b10100111, 0b01000100, 0b10110000, 0b00100011, 0b00100010, 0b01100101, 0b00110100, 0b11110001, 0b00100101, 0b11100000, 0b00010000, 0b11001101, 0b11010101, 0b11000011, 0b00000001, 0b00001100, 0b00110001, 0b10011010, 0b00011110, 0b10010001, 0b00000110, 0b10110001, 0b00011110, 0b01110110, 0b11011011, 0b10000010, 0b01001100, 0b00010001, 0b10000000, 0b10101100, 0b01110001, 0b10111011, 0b00001001, 0b10111010, 0b10011111, 0b01101011, 0b00111001, 0b11001101, 0b01001100, 0b10101001, 0b01010111, 0b10000001, 0b00110001, 0b10000011, 0b00110011, 0b00000011, 0b00000001, 0b10100100, 0b00001001, 0b00000001, 0b00000100, 0b00101101, 0b01100001, 0b00000110, 0b00100100, 0b01000011, 0b11010001, 0b01110110, 0b10001100], # Node 361
-[0b01110011, 0b10100001, 0b01001101, 0b01001111, 0b01011000, 0b11011001, 0b01100110, 0b11101110, 0b00111010, 0b10011010, 0b10011111, 0b11111101, 0b11000011, 0b01011101, 0b10101111, 0b10111101, 0b01011001, 0b11101000, 0b10111010, 0b11111001, 0b10011110, 0b11110111, 0b11010000, 0b10101101, 0b01101000, 0b10110110, 0b10101100, 0b01101010, 0b00101011, 0b00101011, 0b11111110, 0b01111111, 0b00101100, 0b10001111, 0b01010000, 0b01101111, 0b01111101, 0b01100110, 0b11011000, 0b00001101, 0b01100100, 0b01000000, 0b10011101, 0b11000100, 0b01111010, 0b11100010, 0b01001010, 0b11111011, 0b11110011, 0b01011111, 0b01101000, 0b10111000, 0b11010110, 0b01011110, 0b01100101, 0b01101111, 0b10100111, 0b01101000, 0b01010100, 0b11001101, 0b01110010, 0b11100011, 0b10101110, 0b01001010, 0b11001100, 0b11011100, 0b01110101, 0b00111110, 0b11001110, 0b01011011, 0b00001100, 0b11000011, 0b01101110, 0b01011001, 0b10100000, 0b00111110, 0b01111000, 0b01100100, 0b00010101, 0b11111100, 0b00100100, 0b10101010, 0b10000010, 0b01111101, 0b10101111, 0b11111101, 0b00111110, 0b10110010, 0b00011001, 0b10001101, 0b00011101, 0b11010110, 0b11010111, 0b00110010, 0b10001100, 0b10111110, 0b11100100, 0b10111101], # Node 362
-[0b01101000, 0b01101100, 0b10001100, 0b10010010, 0b10110011, 0b10111101, 0b11001010, 0b10100001, 0b00011110, 0b10000000, 0b01100111, 0b11111111, 0b00000001, 0b00000000, 0b11000000, 0b00111111, 0b00000000, 0b11110100, 0b11111001, 0b01111111, 0b10000111, 0b11101000, 0b00011111, 0b01111000, 0b11111000, 0b11111110, 0b00000000, 0b00001111, 0b11111100, 0b00001111, 0b01111100, 0b11100000, 0b11111111, 0b11110000, 0b10000011, 0b11111111, 0b00010111, 0b01101111, 0b11110000, 0b11101111, 0b11110000, 0b00001110, 0b01111111, 0b00001000, 0b11110010, 0b11110111, 0b01000111, 0b00100000, 0b11111111, 0b11111110, 0b00000000, 0b11111111, 0b10010111, 0b00011111, 0b11111000, 0b01111111, 0b11110000, 0b11000001, 0b11111111, 0b00011111, 0b00111111, 0b01111110, 0b01111111, 0b11100010, 0b11110000, 0b10000111, 0b00110111, 0b00000000, 0b00000111, 0b11111100, 0b00010011, 0b00010000, 0b11000000, 0b00000111, 0b10000000, 0b00000000, 0b11011110, 0b00000001, 0b00000010, 0b11111000, 0b00100001, 0b11000000, 0b11001000, 0b10111111, 0b00000000, 0b00100000, 0b11111000, 0b01111011, 0b00000001, 0b00001000, 0b00101000, 0b10000100, 0b00000001, 0b11000000, 0b10000111, 0b01011010, 0b11111111, 0b10011111], # Node 363
-[0b00000000, 0b00000000, 0b10000000, 0b10000100, 0b00010000, 0b00010010, 0b10000000, 0b00110000, 0b00010010, 0b10000000, 0b00000000, 0b01100001, 0b00000000, 0b10100000, 0b00000000, 0b01011010, 0b00000000, 0b00010100, 0b00110100, 0b01101000, 0b10000010, 0b10100000, 0b00001111, 0b00100000, 0b00000000, 0b11111100, 0b11000000, 0b00001111, 0b10100000, 0b10001111, 0b11111111, 0b11110001, 0b11111111, 0b11111110, 0b00110001, 0b11101100, 0b11100011, 0b10001111, 0b01000110, 0b00001110, 0b00011000, 0b00101000, 0b10110000, 0b00000001, 0b00000000, 0b10000000, 0b00000010, 0b00000000, 0b00010000, 0b01101000, 0b00000000, 0b10000000, 0b00000101, 0b00000110, 0b00000000, 0b00111000, 0b11111000, 0b00000000, 0b11100000, 0b00000011, 0b00001111, 0b00110110, 0b01111100, 0b11110000, 0b11111001, 0b11100000, 0b00000111, 0b11111111, 0b00000111, 0b00111111, 0b11110000, 0b01111111, 0b11000100, 0b00001011, 0b11111111, 0b01000000, 0b00111110, 0b11100000, 0b10000111, 0b11100111, 0b00000011, 0b00000000, 0b00010000, 0b11000000, 0b00000010, 0b00000000, 0b00000000, 0b11000000, 0b10000000, 0b00011101, 0b00000000, 0b00000000, 0b11111001, 0b00000101, 0b00000000, 0b00000000, 0b10111111, 0b01000000], # Node 364
-[0b10110110, 0b10010011, 0b10110101, 0b00100000, 0b10100100, 0b00010100, 0b00000100, 0b00000000, 0b10111101, 0b00000001, 0b10010001, 0b11001110, 0b10001101, 0b10011001, 0b10010100, 0b11101010, 0b01001000, 0b11001111, 0b10010000, 0b11101011, 0b00110100, 0b01110111, 0b01110011, 0b00001010, 0b00111100, 0b01010101, 0b01010011, 0b10100101, 0b00100001, 0b00111110, 0b11010110, 0b01100111, 0b11101000, 0b01101100, 0b01100001, 0b10000110, 0b00101111, 0b00011110, 0b01110001, 0b01110111, 0b00001001, 0b00010010, 0b00011001, 0b10011110, 0b11101100, 0b10011001, 0b11110000, 0b11100000, 0b00010111, 0b01001010, 0b00010001, 0b00111101, 0b00010101, 0b00000000, 0b11111001, 0b01100111, 0b00001100, 0b10101110, 0b10100111, 0b10100010, 0b01111101, 0b11111111, 0b01000101, 0b01011011, 0b10111101, 0b10010000, 0b00000101, 0b10011011, 0b11110011, 0b00001011, 0b11000000, 0b10110110, 0b00101111, 0b00110001, 0b00010000, 0b11110101, 0b10100001, 0b10100100, 0b11000111, 0b11011110, 0b00111101, 0b10000001, 0b01011101, 0b10101000, 0b11010101, 0b11001111, 0b10010000, 0b00000010, 0b11000011, 0b01010100, 0b10011100, 0b00001010, 0b01011011, 0b01011000, 0b10101111, 0b10000110, 0b10001011, 0b10001010], # Node 365
-[0b11000101, 0b00011011, 0b11001011, 0b11001110, 0b11010111, 0b11111010, 0b11010111, 0b00111111, 0b11010101, 0b11100000, 0b11111001, 0b10110010, 0b01110110, 0b01010100, 0b00110001, 0b11110001, 0b10000001, 0b00111011, 0b11110011, 0b00001000, 0b00000111, 0b11100100, 0b01010110, 0b11101111, 0b10110111, 0b01111111, 0b11110110, 0b11111111, 0b00001011, 0b11101110, 0b01101001, 0b10000000, 0b10001110, 0b10010110, 0b00100010, 0b01001110, 0b11001100, 0b10111011, 0b11111101, 0b01011101, 0b11111111, 0b10110110, 0b00110010, 0b10101001, 0b00100110, 0b11111011, 0b11111001, 0b11101101, 0b11100000, 0b01010110, 0b11101001, 0b01000000, 0b10111110, 0b11001001, 0b00110011, 0b00000011, 0b11111111, 0b11001001, 0b01110011, 0b10101111, 0b11000101, 0b10110110, 0b10010110, 0b01001111, 0b01110000, 0b01101110, 0b11110001, 0b11011111, 0b11100101, 0b11001100, 0b00111000, 0b11110100, 0b10010001, 0b11111011, 0b11101101, 0b00000101, 0b01110000, 0b00111100, 0b00100010, 0b11111101, 0b00000101, 0b00111010, 0b10010001, 0b01110110, 0b11101110, 0b11000001, 0b00000011, 0b11100010, 0b10000111, 0b10000100, 0b11010001, 0b10110010, 0b11111101, 0b01001001, 0b01111001, 0b00000011, 0b01110011, 0b11010011], # Node 366
-[0b10100000, 0b01101000, 0b01101000, 0b01111001, 0b01011111, 0b10001100, 0b10100001, 0b00100001, 0b00001111, 0b10010110, 0b10010010, 0b00011110, 0b11111010, 0b01110010, 0b11010100, 0b00000111, 0b10011110, 0b01011000, 0b01011001, 0b01001011, 0b01101011, 0b11000100, 0b10100100, 0b01000011, 0b01101100, 0b01100100, 0b01110110, 0b00000111, 0b01001100, 0b10110000, 0b10100111, 0b00100001, 0b11001110, 0b01100000, 0b01011011, 0b10111000, 0b10110000, 0b01101110, 0b11111000, 0b10111000, 0b00110001, 0b10000010, 0b00000101, 0b11000001, 0b10001001, 0b00100111, 0b01101010, 0b01111100, 0b00100101, 0b01011010, 0b11011111, 0b00101100, 0b11001010, 0b00100101, 0b11011101, 0b01100001, 0b10001001, 0b11100000, 0b01100100, 0b01010111, 0b11000100, 0b10110100, 0b01100100, 0b00000011, 0b00100110, 0b01001010, 0b00000100, 0b00001111, 0b01000001, 0b01001001, 0b10000111, 0b01011000, 0b01001010, 0b10000110, 0b10000000, 0b00111111, 0b10010101, 0b10000101, 0b00111111, 0b11001000, 0b10010001, 0b10010100, 0b10001001, 0b10000000, 0b10011000, 0b01101110, 0b01000100, 0b10001010, 0b00000100, 0b10101000, 0b00110010, 0b10110010, 0b00101111, 0b00001000, 0b01010100, 0b01010100, 0b10101000, 0b01011000], # Node 367
-[0b00101111, 0b01110111, 0b10010111, 0b10101000, 0b01010100, 0b10111101, 0b10100000, 0b01101100, 0b00101101, 0b10010100, 0b00010001, 0b10010001, 0b00110001, 0b10011101, 0b10110011, 0b10100100, 0b01010011, 0b10010010, 0b00000000, 0b01011000, 0b10110100, 0b01110111, 0b11101100, 0b10000110, 0b00110100, 0b00001000, 0b11001111, 0b11000100, 0b10001100, 0b10111010, 0b01000111, 0b11011011, 0b11010101, 0b11010011, 0b01010100, 0b10010010, 0b01101010, 0b00000100, 0b00000000, 0b10001110, 0b10000001, 0b11101001, 0b10000011, 0b10110001, 0b01111000, 0b01100110, 0b00100100, 0b01111111, 0b11110101, 0b00100001, 0b01100011, 0b01011000, 0b10001100, 0b00111111, 0b00101011, 0b01100010, 0b01000100, 0b01001100, 0b00110011, 0b10110001, 0b10110100, 0b01000101, 0b00000111, 0b10010000, 0b00100010, 0b00011010, 0b10010111, 0b00001110, 0b11110000, 0b11000011, 0b11100110, 0b01100010, 0b11101001, 0b00101010, 0b00110100, 0b01111111, 0b10001100, 0b10110001, 0b00100001, 0b01000101, 0b00010010, 0b00101010, 0b01111110, 0b01011001, 0b00100010, 0b01110100, 0b00010001, 0b11100001, 0b00000101, 0b11000000, 0b01011110, 0b00001000, 0b01110011, 0b01101001, 0b10010111, 0b00010000, 0b00101001, 0b00100101], # Node 368
-[0b00000011, 0b11010000, 0b11010101, 0b01011000, 0b11000110, 0b01000110, 0b00000001, 0b11010111, 0b00111110, 0b10001100, 0b01000000, 0b01001001, 0b01000011, 0b00010110, 0b00101100, 0b10101000, 0b01100101, 0b00000000, 0b00000000, 0b11101110, 0b00001101, 0b01001001, 0b01111100, 0b10111001, 0b10000011, 0b11010010, 0b00000110, 0b01100001, 0b01001000, 0b11100100, 0b10111011, 0b11011110, 0b11010000, 0b10011111, 0b10010010, 0b11010100, 0b01111000, 0b01100100, 0b10100000, 0b10110000, 0b10010010, 0b10001011, 0b11101100, 0b10110000, 0b01001001, 0b00101001, 0b10010111, 0b00110100, 0b11010010, 0b01011110, 0b10101100, 0b01000101, 0b00110100, 0b01000011, 0b00101110, 0b00001010, 0b11010010, 0b10000010, 0b11000010, 0b11101101, 0b01101100, 0b11000001, 0b00000100, 0b11000000, 0b00011101, 0b10110000, 0b00011000, 0b10011000, 0b11100010, 0b10010001, 0b10100100, 0b10111111, 0b00100011, 0b10000010, 0b11011111, 0b00000101, 0b10000001, 0b11010100, 0b11010100, 0b01000000, 0b01100110, 0b10000011, 0b10011100, 0b00011000, 0b01101101, 0b00010110, 0b00110111, 0b10010000, 0b11110101, 0b10001001, 0b00100001, 0b01010010, 0b01111100, 0b01000001, 0b01000000, 0b10000010, 0b10010101, 0b10110010], # Node 369
-[0b00101110, 0b11010100, 0b00010101, 0b01101011, 0b01011100, 0b01100000, 0b01010011, 0b00110011, 0b00000001, 0b00000000, 0b00011111, 0b10011011, 0b00000001, 0b10100000, 0b11100011, 0b11111111, 0b00000001, 0b10011100, 0b11111000, 0b11111111, 0b11100000, 0b10001111, 0b11111111, 0b11111111, 0b01000111, 0b11110101, 0b11111110, 0b01111111, 0b11110001, 0b01111111, 0b11111111, 0b00011111, 0b11111111, 0b11010010, 0b11111111, 0b01110011, 0b00000111, 0b11110000, 0b00001111, 0b10000001, 0b10000011, 0b01111100, 0b00000010, 0b00111100, 0b00000000, 0b01110111, 0b10000000, 0b00000111, 0b11000000, 0b00000000, 0b01111000, 0b00000000, 0b00101100, 0b11100000, 0b00001111, 0b01111100, 0b00000000, 0b10111111, 0b11100000, 0b10111111, 0b00000111, 0b11000001, 0b01111111, 0b11111001, 0b00000001, 0b11111111, 0b10001111, 0b00011111, 0b11100000, 0b01111111, 0b11111001, 0b00000011, 0b11111000, 0b11010001, 0b00111111, 0b11000011, 0b10001111, 0b11011100, 0b11111111, 0b11111111, 0b10000100, 0b11111101, 0b11111111, 0b10111111, 0b10001000, 0b11111111, 0b01011111, 0b01011000, 0b01000000, 0b11111111, 0b00010100, 0b00011001, 0b00000000, 0b11110010, 0b01001001, 0b10000001, 0b00100000, 0b10001011], # Node 370
-[0b00101100, 0b10111001, 0b00010001, 0b10111100, 0b10001100, 0b01001011, 0b11001000, 0b10000001, 0b00100000, 0b11100100, 0b10000110, 0b01000000, 0b00000000, 0b10001101, 0b10010101, 0b01001100, 0b10111111, 0b01111000, 0b11010110, 0b10111100, 0b10100001, 0b00110010, 0b11111011, 0b10000001, 0b10001010, 0b11011000, 0b00111010, 0b10100001, 0b00110111, 0b00101100, 0b01100011, 0b00000100, 0b00100010, 0b11010001, 0b11011001, 0b10101010, 0b01000011, 0b10001100, 0b11110001, 0b00101001, 0b10110100, 0b01010000, 0b11001000, 0b10100101, 0b01001111, 0b10100100, 0b01010111, 0b11111110, 0b01000010, 0b10000100, 0b11100000, 0b00101111, 0b00001101, 0b00010101, 0b11010000, 0b00010000, 0b00001111, 0b11100000, 0b01101111, 0b10110110, 0b11010110, 0b01111011, 0b10101111, 0b00000010, 0b01010101, 0b01101000, 0b01000100, 0b11000011, 0b11000101, 0b00000110, 0b00001010, 0b00000011, 0b01011010, 0b01010100, 0b01010100, 0b11000000, 0b01000001, 0b01100100, 0b00110111, 0b00001110, 0b01000100, 0b10010100, 0b11111111, 0b00000001, 0b00011100, 0b10110000, 0b11000000, 0b00001011, 0b00100100, 0b00100101, 0b00000000, 0b00010000, 0b10000110, 0b01100001, 0b00000110, 0b10100000, 0b11011010, 0b10011110], # Node 371
-[0b00111000, 0b11000100, 0b00000110, 0b00000010, 0b00100100, 0b01100001, 0b00011000, 0b00001111, 0b10110010, 0b01000000, 0b01110000, 0b01011000, 0b01001111, 0b01001110, 0b01100000, 0b10001010, 0b10011110, 0b10011100, 0b00000001, 0b10101000, 0b00110110, 0b00000001, 0b00110011, 0b10010101, 0b01000011, 0b00100000, 0b01101100, 0b11000010, 0b01001010, 0b10010001, 0b01110001, 0b10100101, 0b01100011, 0b00101001, 0b11010110, 0b10101001, 0b00010000, 0b00001111, 0b01000111, 0b10010101, 0b11011000, 0b01001000, 0b00001000, 0b01001011, 0b00100110, 0b00001000, 0b11100100, 0b00101100, 0b00111100, 0b11001010, 0b11000111, 0b00010101, 0b11000110, 0b11000001, 0b01011110, 0b01110111, 0b10110100, 0b10101000, 0b01100010, 0b10010011, 0b00010100, 0b01101100, 0b10110101, 0b10111100, 0b01110111, 0b10111101, 0b10010010, 0b00001011, 0b11000111, 0b01101001, 0b01110010, 0b11001100, 0b11000100, 0b00111001, 0b10110100, 0b11000110, 0b01001000, 0b01001110, 0b10110000, 0b01011111, 0b01110011, 0b10110000, 0b00001001, 0b00001001, 0b00010100, 0b10111000, 0b00111010, 0b00001000, 0b10010100, 0b10101011, 0b00101010, 0b01010010, 0b11110010, 0b10001000, 0b10001011, 0b11000011, 0b11111110, 0b01111010], # Node 372
-[0b10000001, 0b00111100, 0b00000110, 0b01110010, 0b00000101, 0b00010010, 0b11001001, 0b00101001, 0b00000000, 0b00001000, 0b00000000, 0b00001100, 0b01110000, 0b01000000, 0b00000011, 0b00000011, 0b00000010, 0b11001001, 0b01010111, 0b10101100, 0b01001100, 0b00010101, 0b00000000, 0b01110100, 0b00001000, 0b00000000, 0b00000000, 0b00101111, 0b00000010, 0b00000000, 0b00010110, 0b00000001, 0b00000000, 0b00110101, 0b00011100, 0b00000011, 0b11111000, 0b01100000, 0b00000001, 0b11000000, 0b00011111, 0b01000010, 0b10001000, 0b11111111, 0b00000000, 0b10000000, 0b11111010, 0b00000111, 0b00100000, 0b10001111, 0b01111111, 0b00110100, 0b00100000, 0b01111000, 0b11100101, 0b00000101, 0b10100010, 0b00000001, 0b11100001, 0b00000100, 0b00001100, 0b00110000, 0b00101100, 0b00011010, 0b01000000, 0b00000000, 0b11010011, 0b00001110, 0b00100100, 0b10100000, 0b01000011, 0b10000010, 0b00000010, 0b00011011, 0b00011110, 0b00100000, 0b00100000, 0b01000000, 0b10001100, 0b00000111, 0b00001011, 0b01101100, 0b10001110, 0b01010000, 0b10001010, 0b10100111, 0b00100011, 0b11101101, 0b00000000, 0b00100000, 0b10000100, 0b01000000, 0b00010000, 0b11000000, 0b00100000, 0b00001000, 0b00010101, 0b01001010], # Node 373
-[0b11110101, 0b11101101, 0b11111111, 0b01011111, 0b11101010, 0b10100001, 0b10101011, 0b11011110, 0b11111010, 0b01011110, 0b11111111, 0b10011100, 0b10110011, 0b01111001, 0b11111100, 0b10011101, 0b10001010, 0b10101101, 0b00011011, 0b11001011, 0b11101110, 0b10001111, 0b01101111, 0b11111001, 0b00011110, 0b11100001, 0b01110001, 0b01010101, 0b11111000, 0b10000100, 0b10100101, 0b01111100, 0b10001001, 0b11010001, 0b00101110, 0b11100100, 0b01111010, 0b10011001, 0b01100111, 0b00011100, 0b00111011, 0b11000011, 0b01111101, 0b00100001, 0b11000100, 0b10111001, 0b01100101, 0b01100100, 0b11101001, 0b00011101, 0b11010011, 0b10100101, 0b00001001, 0b10001111, 0b01100000, 0b11101010, 0b00100011, 0b11111100, 0b01101001, 0b01101000, 0b01010010, 0b01111011, 0b11011111, 0b11111100, 0b10110000, 0b10111001, 0b11100010, 0b11100100, 0b11101000, 0b11001111, 0b01110101, 0b00001100, 0b01110111, 0b00011011, 0b10011000, 0b00010100, 0b00111111, 0b10101011, 0b00001101, 0b01101011, 0b01100001, 0b00011101, 0b10000001, 0b01101100, 0b01011100, 0b11011100, 0b10001001, 0b01001010, 0b01001101, 0b10110111, 0b11101101, 0b10010001, 0b10001110, 0b01001111, 0b11010000, 0b11001011, 0b00111000, 0b11111111], # Node 374
-[0b11000100, 0b00110111, 0b00011100, 0b01110100, 0b00111000, 0b10110100, 0b01001000, 0b11000000, 0b00110000, 0b00010100, 0b10010001, 0b01001100, 0b01001111, 0b00001001, 0b00001001, 0b10000101, 0b01100011, 0b10010001, 0b01011110, 0b01000000, 0b10011010, 0b00010010, 0b11000000, 0b01101001, 0b10010100, 0b10001010, 0b10111011, 0b00100101, 0b01000001, 0b10000000, 0b01001100, 0b01010111, 0b00110110, 0b11001101, 0b00001111, 0b11010010, 0b00011000, 0b11111000, 0b11000100, 0b01010001, 0b01100110, 0b01010011, 0b10010010, 0b00110011, 0b00101000, 0b11101101, 0b00001011, 0b01010110, 0b01001011, 0b00000000, 0b01111101, 0b01111011, 0b11000001, 0b01100010, 0b11011111, 0b00010110, 0b00000100, 0b11001010, 0b00001011, 0b00010011, 0b10000000, 0b10011111, 0b10000101, 0b10100110, 0b00101101, 0b11001100, 0b10000111, 0b11111001, 0b10000101, 0b00100100, 0b00101010, 0b11101101, 0b11000110, 0b11100100, 0b11010101, 0b11011110, 0b10101010, 0b10101001, 0b00001010, 0b10100010, 0b00101000, 0b00011001, 0b10111101, 0b10100110, 0b11111000, 0b00011100, 0b10000010, 0b01001100, 0b01000010, 0b00000000, 0b11010000, 0b10110100, 0b00100000, 0b00000001, 0b00000011, 0b11101110, 0b00100101, 0b01001000], # Node 375
-[0b00110010, 0b01111010, 0b01001101, 0b10110001, 0b10000100, 0b01000100, 0b00000000, 0b01011011, 0b01010010, 0b01101001, 0b01100001, 0b11100001, 0b00001110, 0b00101100, 0b10000001, 0b01000011, 0b10100111, 0b01010000, 0b00001001, 0b00001001, 0b01000010, 0b00010000, 0b01000100, 0b11010101, 0b01011000, 0b00110000, 0b10110001, 0b00100101, 0b00111011, 0b01011001, 0b11000111, 0b10000000, 0b01001001, 0b00111111, 0b11100001, 0b11110110, 0b10010111, 0b00100101, 0b01011010, 0b01000011, 0b01010010, 0b00001001, 0b11000010, 0b11101111, 0b11001111, 0b01000000, 0b00010111, 0b01110111, 0b10000110, 0b00100001, 0b10010001, 0b10001110, 0b00000111, 0b10000000, 0b00100101, 0b10110011, 0b10100000, 0b00100101, 0b10001001, 0b01111000, 0b11000110, 0b01100101, 0b00000111, 0b11010010, 0b10011000, 0b01000011, 0b00011001, 0b01100100, 0b01100101, 0b00000001, 0b01110000, 0b00111101, 0b01101110, 0b01000111, 0b01000100, 0b10101011, 0b01010100, 0b11001000, 0b10001111, 0b10110010, 0b10000111, 0b00010100, 0b00100010, 0b01000101, 0b11011000, 0b10110100, 0b01000000, 0b01100000, 0b00101000, 0b10111001, 0b00011000, 0b00011110, 0b01110001, 0b00100000, 0b11101000, 0b10010000, 0b10100100, 0b10111101], # Node 376
-[0b11111100, 0b10000011, 0b11111111, 0b11011111, 0b01011101, 0b10110011, 0b11111101, 0b11110111, 0b01111111, 0b01110111, 0b10101011, 0b01101011, 0b10000111, 0b01000100, 0b01001111, 0b11111111, 0b11011100, 0b11111101, 0b01110101, 0b00010100, 0b11111100, 0b11001001, 0b01101101, 0b10111011, 0b10011111, 0b01000111, 0b11011100, 0b11001110, 0b11111011, 0b00000001, 0b01000001, 0b11101111, 0b11000001, 0b10100110, 0b01111000, 0b00110011, 0b01001010, 0b00111010, 0b11111100, 0b00010011, 0b10111000, 0b01011111, 0b00111110, 0b00100111, 0b01000111, 0b11111111, 0b11101011, 0b01011011, 0b11111000, 0b10101111, 0b00010011, 0b10100010, 0b01101111, 0b01000111, 0b00100100, 0b00110110, 0b11111111, 0b00100100, 0b01001011, 0b11101111, 0b11010111, 0b11010000, 0b00101111, 0b10111110, 0b00011001, 0b10111111, 0b11111111, 0b00110110, 0b11011111, 0b11111101, 0b11001111, 0b00111011, 0b01101100, 0b11111111, 0b00001111, 0b00001011, 0b11111110, 0b11111111, 0b10100110, 0b01011100, 0b11101100, 0b01111101, 0b11010100, 0b01101101, 0b10111011, 0b11111100, 0b11111011, 0b11100011, 0b10100011, 0b11110100, 0b00110110, 0b10100101, 0b11010110, 0b01111111, 0b01101111, 0b01000110, 0b00101011, 0b11101001], # Node 377
-[0b01000001, 0b00001000, 0b11100100, 0b00100010, 0b00000100, 0b11100001, 0b00001111, 0b11010010, 0b11001101, 0b00101000, 0b01110010, 0b11101011, 0b00010100, 0b10011000, 0b00010001, 0b10111100, 0b10001011, 0b11111001, 0b00011010, 0b11010010, 0b00101001, 0b01000110, 0b00101011, 0b10001000, 0b10101111, 0b00000000, 0b00111100, 0b11000000, 0b11000010, 0b10100110, 0b00110110, 0b01011100, 0b10011100, 0b01011001, 0b01101010, 0b11010011, 0b00111010, 0b01110000, 0b00100000, 0b01001011, 0b01001110, 0b00111100, 0b10010111, 0b11110010, 0b00111000, 0b00001010, 0b11010000, 0b01101101, 0b11101101, 0b00010010, 0b00010001, 0b01110011, 0b00110100, 0b10010101, 0b01101110, 0b01100011, 0b10110110, 0b10011001, 0b01111110, 0b10011011, 0b01000111, 0b00111011, 0b01110000, 0b10010000, 0b00111100, 0b01110101, 0b10001111, 0b00000010, 0b10011010, 0b11101101, 0b00010001, 0b11000000, 0b01000100, 0b00101001, 0b00101101, 0b11001100, 0b00101001, 0b11011010, 0b01110011, 0b00000000, 0b10110000, 0b11111000, 0b11001101, 0b01010101, 0b00110100, 0b00101110, 0b10000000, 0b01001010, 0b10010010, 0b01000101, 0b00110001, 0b10101110, 0b11100100, 0b00101010, 0b00000111, 0b10001010, 0b10010100, 0b00001001], # Node 378
-[0b00000000, 0b01010010, 0b10001000, 0b01100000, 0b00000000, 0b00100000, 0b11010001, 0b01001010, 0b01100000, 0b00010000, 0b10000000, 0b01100000, 0b01011100, 0b00100000, 0b10001011, 0b01000010, 0b01000001, 0b01000000, 0b11001111, 0b00101111, 0b00000000, 0b10000000, 0b01111100, 0b00000000, 0b00000000, 0b00010001, 0b00111010, 0b10101111, 0b01000001, 0b01000001, 0b11000101, 0b00000010, 0b00000000, 0b10011000, 0b10000000, 0b00010101, 0b01000000, 0b00001111, 0b11001011, 0b00000000, 0b11110000, 0b10000010, 0b00000000, 0b11010101, 0b00001000, 0b00010100, 0b01000001, 0b10001100, 0b00010100, 0b00010001, 0b10000001, 0b00101001, 0b00000000, 0b00101100, 0b00010011, 0b01000010, 0b00101000, 0b01010100, 0b00000101, 0b10000010, 0b00111101, 0b00101110, 0b00010000, 0b00000001, 0b11110100, 0b10110000, 0b00001110, 0b00010000, 0b00001110, 0b01000110, 0b10000000, 0b11010010, 0b10000000, 0b00000110, 0b00010101, 0b00001100, 0b10001101, 0b00001000, 0b01111101, 0b00100101, 0b10000100, 0b00100001, 0b01100010, 0b00101100, 0b01000100, 0b10000000, 0b01000110, 0b00000110, 0b10010011, 0b00000101, 0b00001000, 0b00000010, 0b00110000, 0b01000100, 0b00100010, 0b10000010, 0b00000000, 0b00001001], # Node 379
-[0b11100011, 0b01010101, 0b10011011, 0b10111110, 0b01010010, 0b00011010, 0b10111101, 0b01110111, 0b11111101, 0b01111110, 0b11111011, 0b11101100, 0b10110111, 0b11001010, 0b11111011, 0b10001001, 0b11011001, 0b01010111, 0b10100101, 0b10001100, 0b10110011, 0b10011010, 0b01000011, 0b00000110, 0b11111011, 0b10001000, 0b10101000, 0b10111010, 0b11100110, 0b01111011, 0b11110000, 0b11100100, 0b11000011, 0b10010100, 0b01100110, 0b11101011, 0b01101001, 0b10111111, 0b00100010, 0b01101001, 0b11111101, 0b11111011, 0b01101110, 0b01111100, 0b10001101, 0b01010111, 0b01001110, 0b10111110, 0b11110011, 0b10010011, 0b00111111, 0b10000110, 0b10101001, 0b00010000, 0b10111011, 0b01110100, 0b01010111, 0b01001000, 0b11000110, 0b00101000, 0b11000001, 0b11100110, 0b01010101, 0b00011101, 0b11010000, 0b11001110, 0b01110100, 0b11101111, 0b11001011, 0b11111011, 0b10100110, 0b00110011, 0b11111001, 0b10011010, 0b01001101, 0b11110110, 0b01000011, 0b00100011, 0b11010100, 0b01111110, 0b01001111, 0b00010011, 0b11010000, 0b11000001, 0b11011110, 0b10000001, 0b10100000, 0b11100000, 0b11101100, 0b00110111, 0b11101000, 0b01111110, 0b10111100, 0b11111010, 0b01100010, 0b00011001, 0b11101001, 0b11010111], # Node 380
-[0b11111110, 0b00111110, 0b10101111, 0b10011111, 0b01001111, 0b00000001, 0b11111110, 0b10101101, 0b11111011, 0b11111101, 0b01010101, 0b11110010, 0b11111111, 0b01101111, 0b01001111, 0b00001101, 0b00101001, 0b10110011, 0b01100010, 0b01001110, 0b01100110, 0b00011111, 0b10001011, 0b11100001, 0b00110011, 0b11111010, 0b01011011, 0b11001100, 0b11111001, 0b11010010, 0b10001101, 0b11110110, 0b10000011, 0b01101000, 0b11010000, 0b01001000, 0b10000010, 0b11111110, 0b01110101, 0b11000110, 0b11011111, 0b10101010, 0b10011110, 0b01000101, 0b11001010, 0b10100101, 0b11010011, 0b00001010, 0b01101110, 0b00100101, 0b11101010, 0b10001110, 0b01111011, 0b01011110, 0b00000001, 0b11101100, 0b01110101, 0b01000010, 0b11010000, 0b01110010, 0b00111001, 0b00001110, 0b00111011, 0b10110011, 0b10010011, 0b11000001, 0b11111110, 0b00101111, 0b11100001, 0b10110010, 0b00111111, 0b11110001, 0b11101010, 0b11011100, 0b10101101, 0b10000100, 0b11001100, 0b00111111, 0b10110100, 0b11011100, 0b11111111, 0b10110110, 0b10100101, 0b11111101, 0b10110110, 0b00010100, 0b11010101, 0b00111011, 0b01011111, 0b01001001, 0b11011110, 0b00011101, 0b01111110, 0b10110111, 0b11111011, 0b10001111, 0b11011010, 0b10110011], # Node 381
-[0b00000110, 0b00000101, 0b00001001, 0b00001000, 0b00000100, 0b01000100, 0b00000001, 0b00010010, 0b00100000, 0b00010000, 0b00001010, 0b11000000, 0b00000010, 0b01110000, 0b00001001, 0b10110110, 0b00101011, 0b10101100, 0b10011110, 0b11111111, 0b10000111, 0b01000010, 0b11111101, 0b00001111, 0b01100000, 0b11011110, 0b11111111, 0b00000001, 0b11100011, 0b00111111, 0b00001110, 0b10000000, 0b11111100, 0b11110001, 0b00000001, 0b11100000, 0b00000001, 0b00111111, 0b01011110, 0b00010010, 0b11111100, 0b01000001, 0b00010000, 0b11000000, 0b00001111, 0b00000000, 0b00000001, 0b01111110, 0b00000001, 0b00010001, 0b11110000, 0b00000011, 0b00000000, 0b10000100, 0b01111111, 0b00110000, 0b00101000, 0b11111000, 0b00000111, 0b10000000, 0b11110010, 0b11111111, 0b10010010, 0b10000000, 0b11111111, 0b00101111, 0b10101101, 0b11101000, 0b11100001, 0b01000000, 0b10101001, 0b00011001, 0b00011110, 0b10000000, 0b00001001, 0b11001001, 0b11001000, 0b10111010, 0b11111110, 0b11000101, 0b00000001, 0b11100010, 0b00111101, 0b00000000, 0b11001001, 0b11110011, 0b00011011, 0b00010110, 0b11000000, 0b00011010, 0b00110011, 0b00110011, 0b00100000, 0b00010001, 0b00100010, 0b01100000, 0b00110100, 0b00001000], # Node 382
-[0b00010100, 0b00101011, 0b11110100, 0b00010000, 0b10011100, 0b00100101, 0b10000111, 0b00111111, 0b10000000, 0b10010100, 0b00001110, 0b00100111, 0b10111101, 0b01001000, 0b11010100, 0b11000000, 0b10001110, 0b01010100, 0b00100000, 0b10000110, 0b00110100, 0b01010000, 0b00111100, 0b01000000, 0b01100010, 0b10011111, 0b00010100, 0b10001100, 0b00010110, 0b01100011, 0b10010011, 0b00011111, 0b00010010, 0b01110011, 0b00000000, 0b00100110, 0b11101001, 0b01101101, 0b00100011, 0b10100001, 0b00011100, 0b01010011, 0b01110100, 0b10001000, 0b01000011, 0b11010000, 0b00001111, 0b10011100, 0b11100110, 0b10000001, 0b11000100, 0b01000111, 0b00011110, 0b01101001, 0b11001000, 0b01010010, 0b01101010, 0b00001011, 0b11010010, 0b10111000, 0b10000100, 0b01110001, 0b00101001, 0b01101110, 0b10001001, 0b10011111, 0b11100100, 0b00000011, 0b11100100, 0b10111101, 0b01010010, 0b10100101, 0b11101111, 0b00010001, 0b10101110, 0b00110110, 0b01001110, 0b01000010, 0b00110000, 0b11001000, 0b10100001, 0b10010000, 0b00010000, 0b01100100, 0b11010001, 0b10000100, 0b10001110, 0b00010001, 0b01110000, 0b11100000, 0b00011100, 0b01001100, 0b01100111, 0b10010010, 0b10110010, 0b00011100, 0b00000000, 0b00000000], # Node 383
-[0b10001001, 0b10010001, 0b11010011, 0b01110100, 0b00000000, 0b10010010, 0b10100100, 0b00001100, 0b11100100, 0b00010000, 0b10001101, 0b10101110, 0b00001000, 0b11001000, 0b00110110, 0b00110010, 0b10100110, 0b00100100, 0b11111111, 0b00001011, 0b11000100, 0b01000100, 0b10010111, 0b00100100, 0b00011001, 0b11010100, 0b01111000, 0b10000001, 0b00000000, 0b10110001, 0b01101100, 0b01000100, 0b01011100, 0b11001101, 0b01010111, 0b01000100, 0b10011000, 0b00101100, 0b10001001, 0b01100101, 0b10110100, 0b01010010, 0b01000000, 0b00000010, 0b10000110, 0b11100100, 0b00000010, 0b00011001, 0b10101001, 0b01011000, 0b10100011, 0b10011111, 0b10011110, 0b01110000, 0b00110111, 0b11110000, 0b10000011, 0b11111111, 0b00001000, 0b00010001, 0b11100001, 0b10010110, 0b00000011, 0b00000001, 0b00010100, 0b11010101, 0b11001011, 0b10000000, 0b01111101, 0b00000100, 0b00000100, 0b00000000, 0b00000100, 0b01010000, 0b11100010, 0b01010011, 0b11001000, 0b01001111, 0b01110111, 0b10000001, 0b00010001, 0b11101000, 0b11111110, 0b10100100, 0b10001000, 0b10101110, 0b01110010, 0b10101101, 0b00010001, 0b00101100, 0b10000000, 0b10010001, 0b10100111, 0b11001001, 0b01010010, 0b00001010, 0b00011101, 0b10011011], # Node 384
-[0b10101001, 0b00000000, 0b10101010, 0b00000000, 0b10010010, 0b00101000, 0b00111010, 0b00100111, 0b01000110, 0b10001000, 0b00010010, 0b00010011, 0b11101100, 0b00101001, 0b00010000, 0b10111001, 0b10011101, 0b01001110, 0b01010000, 0b01001011, 0b10001110, 0b01010000, 0b10011001, 0b01100110, 0b00000010, 0b00010110, 0b01001100, 0b00110001, 0b11101010, 0b00001010, 0b01101111, 0b11100000, 0b00101100, 0b01111011, 0b10110110, 0b00111011, 0b11001010, 0b11101011, 0b10101000, 0b01110101, 0b01101100, 0b01110101, 0b00100110, 0b11111110, 0b11000110, 0b01010110, 0b01011000, 0b00001011, 0b01010110, 0b00110110, 0b10000000, 0b00101011, 0b01100100, 0b00100001, 0b00001000, 0b00110010, 0b10010011, 0b00111000, 0b11000000, 0b00001100, 0b11001100, 0b10100110, 0b00100101, 0b01111010, 0b00001000, 0b00101110, 0b00000110, 0b10101110, 0b10010110, 0b01111010, 0b11010100, 0b10110101, 0b11110000, 0b11000011, 0b01100010, 0b11011010, 0b00011111, 0b01001010, 0b00110000, 0b11000001, 0b01101000, 0b10000000, 0b01011000, 0b11000000, 0b11100000, 0b01001001, 0b00100000, 0b11011100, 0b01100110, 0b01100010, 0b01001011, 0b10011000, 0b11100010, 0b01001000, 0b00011110, 0b10011101, 0b10100000, 0b10101101], # Node 385
-[0b00110100, 0b00010100, 0b00101011, 0b11100111, 0b00011111, 0b01000100, 0b00100100, 0b00111010, 0b01100010, 0b10111100, 0b11001001, 0b01000111, 0b01001100, 0b11101010, 0b11000001, 0b10100101, 0b01101100, 0b11101110, 0b00001001, 0b11001100, 0b00011010, 0b00001001, 0b01101011, 0b11111111, 0b11110011, 0b11100010, 0b10011001, 0b01100001, 0b01001110, 0b00000110, 0b01111001, 0b00010100, 0b00100000, 0b01010100, 0b00110011, 0b10001011, 0b10010011, 0b00100000, 0b00000011, 0b01101010, 0b10101110, 0b00000001, 0b00001001, 0b10111001, 0b00000010, 0b01111101, 0b11011111, 0b11100001, 0b11001011, 0b10100110, 0b11010110, 0b01111100, 0b00000010, 0b01100001, 0b10101001, 0b11100100, 0b00010101, 0b00010100, 0b00100011, 0b00001010, 0b01011100, 0b00100100, 0b00100001, 0b01111101, 0b10110000, 0b00110010, 0b01000000, 0b10100110, 0b01100010, 0b00001001, 0b10000011, 0b11001101, 0b00000010, 0b01001010, 0b10110110, 0b00001111, 0b10101001, 0b11111110, 0b11100001, 0b00010011, 0b00011010, 0b00111100, 0b10011110, 0b11110110, 0b11100100, 0b10001000, 0b10100001, 0b00000010, 0b10111000, 0b01101101, 0b11000000, 0b11000000, 0b00110001, 0b01110100, 0b01001001, 0b01011010, 0b00000100, 0b00010110], # Node 386
-[0b01011111, 0b10100100, 0b10111011, 0b01011111, 0b11001011, 0b00011010, 0b00001101, 0b00100101, 0b00011110, 0b11000000, 0b10110101, 0b11110110, 0b11011100, 0b11101101, 0b01001101, 0b11100011, 0b11101111, 0b11100111, 0b11100110, 0b10101011, 0b10000010, 0b11011011, 0b01101111, 0b00001100, 0b11111111, 0b11110001, 0b11000111, 0b01101110, 0b11111001, 0b00111110, 0b01100011, 0b01101110, 0b10100110, 0b01100011, 0b10010101, 0b11100011, 0b11100001, 0b11011101, 0b00100111, 0b10110010, 0b11000010, 0b11111001, 0b00101111, 0b11110011, 0b11110111, 0b10111100, 0b01010010, 0b00111111, 0b01101001, 0b11110000, 0b00000011, 0b00100111, 0b10110111, 0b11101111, 0b01000000, 0b10111010, 0b11110000, 0b01101011, 0b01100001, 0b11111011, 0b00000001, 0b11101010, 0b11101111, 0b01100011, 0b10011000, 0b01100010, 0b01000000, 0b00001001, 0b01111110, 0b10000100, 0b01111110, 0b01001010, 0b11100111, 0b00010110, 0b01000111, 0b11101001, 0b01010011, 0b00100100, 0b00011110, 0b11100000, 0b11110100, 0b01111110, 0b01010001, 0b01110001, 0b10110101, 0b01000100, 0b10110010, 0b01100101, 0b10000100, 0b11100111, 0b01100100, 0b11101011, 0b10110101, 0b10111100, 0b10100111, 0b10011111, 0b11001001, 0b10111111], # Node 387
-[0b00000011, 0b11010000, 0b00000100, 0b01001000, 0b11011111, 0b10000101, 0b01010010, 0b10110100, 0b01100010, 0b00100001, 0b10000000, 0b00100010, 0b01001100, 0b01001000, 0b11011010, 0b10001101, 0b01011001, 0b10010101, 0b11010001, 0b00001000, 0b01001101, 0b10011010, 0b00000000, 0b10010010, 0b00011010, 0b00000010, 0b01000000, 0b00100100, 0b01011101, 0b11110000, 0b01000001, 0b11101000, 0b10100110, 0b00011001, 0b01000010, 0b11001011, 0b01010111, 0b00100011, 0b01010110, 0b00000011, 0b10111100, 0b11101110, 0b10100011, 0b11100010, 0b00110011, 0b10110010, 0b01110010, 0b11101001, 0b00100100, 0b01100000, 0b01110110, 0b00101011, 0b00000001, 0b10101110, 0b00110111, 0b00100101, 0b01100101, 0b00001101, 0b01111111, 0b01101101, 0b11000000, 0b01101111, 0b01100001, 0b00110000, 0b01010100, 0b00111111, 0b00001001, 0b00000010, 0b00011101, 0b11000000, 0b10110000, 0b11100000, 0b00101000, 0b01000010, 0b01000100, 0b01110111, 0b11010011, 0b10111101, 0b00100001, 0b00100001, 0b01000000, 0b11010000, 0b00000101, 0b01010110, 0b01010100, 0b10000010, 0b00100000, 0b10110101, 0b00000111, 0b11001001, 0b10010001, 0b10000001, 0b01101000, 0b00100101, 0b10001000, 0b10101100, 0b01010110, 0b11000000], # Node 388
-[0b11100110, 0b00111111, 0b01111111, 0b10011000, 0b10010010, 0b10101011, 0b11011110, 0b10011101, 0b11111101, 0b01100111, 0b00010111, 0b10011111, 0b01011101, 0b00010011, 0b11111111, 0b11011111, 0b11111110, 0b01101101, 0b11110110, 0b11100011, 0b10011101, 0b11110001, 0b10110010, 0b00001100, 0b10100100, 0b11010100, 0b01111101, 0b01001001, 0b01111111, 0b01011000, 0b01100001, 0b11000110, 0b01111000, 0b11110110, 0b10100010, 0b10111100, 0b11111101, 0b11011011, 0b11011001, 0b11101111, 0b00111011, 0b01100011, 0b01011010, 0b11000111, 0b10111000, 0b10111111, 0b01100110, 0b00110101, 0b11010011, 0b00100011, 0b10011101, 0b11001111, 0b01110110, 0b10111000, 0b11000010, 0b01101001, 0b11111111, 0b01100111, 0b11100011, 0b01100100, 0b01001001, 0b00101110, 0b01110100, 0b01111110, 0b00111011, 0b00000000, 0b11011110, 0b01010111, 0b10010110, 0b00101101, 0b10111111, 0b11000001, 0b10011110, 0b01110100, 0b01110100, 0b10000000, 0b01110111, 0b10111011, 0b11110011, 0b01001101, 0b10011110, 0b01010001, 0b00100101, 0b11000001, 0b00011110, 0b01000000, 0b10100000, 0b11001101, 0b11111101, 0b01101010, 0b10111100, 0b00111010, 0b00011111, 0b11011000, 0b10101110, 0b10011100, 0b01111011, 0b11111101], # Node 389
-[0b11111111, 0b11110101, 0b11100111, 0b11001110, 0b01111001, 0b01111000, 0b01110110, 0b01101110, 0b10100110, 0b10001110, 0b10110011, 0b11001110, 0b11011011, 0b00101110, 0b00000011, 0b11110111, 0b00110001, 0b11101010, 0b00101001, 0b11011111, 0b11111001, 0b10011010, 0b10001011, 0b11001100, 0b10110011, 0b11001111, 0b11001110, 0b11111111, 0b01111110, 0b11110101, 0b10110100, 0b10010111, 0b00111001, 0b11111111, 0b10110111, 0b11010111, 0b10000110, 0b00000110, 0b10111011, 0b00010000, 0b11110101, 0b00110001, 0b11001011, 0b10000110, 0b00101110, 0b11101111, 0b00101011, 0b10111011, 0b01011001, 0b00001101, 0b11010011, 0b11010111, 0b11101011, 0b01011001, 0b10101000, 0b10010111, 0b11111111, 0b10100010, 0b10101101, 0b10110110, 0b01000111, 0b01010000, 0b11110010, 0b01100011, 0b01101000, 0b11101110, 0b10011010, 0b10011111, 0b00001011, 0b01000000, 0b00100111, 0b10011010, 0b00001001, 0b11101111, 0b01110100, 0b01100110, 0b11101101, 0b11101100, 0b01011111, 0b01111001, 0b11111111, 0b10111100, 0b00110001, 0b01111011, 0b11110100, 0b10101011, 0b10101110, 0b11101111, 0b10101011, 0b11011001, 0b11101101, 0b10101111, 0b11011111, 0b11011111, 0b10001000, 0b11110010, 0b10111101, 0b10011011], # Node 390
-[0b00110100, 0b01000001, 0b10011001, 0b01010000, 0b01011000, 0b01110100, 0b00111000, 0b00010001, 0b11000011, 0b00000010, 0b10100100, 0b01000011, 0b00110110, 0b00011001, 0b11000001, 0b10100111, 0b01100000, 0b10000100, 0b01000011, 0b10000110, 0b00000100, 0b00011011, 0b00110011, 0b10101101, 0b00000000, 0b00101001, 0b10001101, 0b00001101, 0b00000010, 0b10010101, 0b01011110, 0b00010000, 0b00101010, 0b01001011, 0b00110010, 0b00000001, 0b01001101, 0b01101111, 0b00110000, 0b10100000, 0b11010000, 0b00010001, 0b01000101, 0b10111011, 0b11000001, 0b11010111, 0b01101001, 0b10000010, 0b11110110, 0b10010100, 0b00101101, 0b00101100, 0b10111010, 0b00001101, 0b11001000, 0b10001001, 0b11101110, 0b00101001, 0b10010100, 0b10010010, 0b11111110, 0b10100110, 0b00010101, 0b01001100, 0b10101110, 0b10111101, 0b01001000, 0b01010010, 0b01101001, 0b11101010, 0b01010011, 0b00001111, 0b01101000, 0b00001100, 0b00111101, 0b00100000, 0b00010101, 0b11011101, 0b00111100, 0b00010011, 0b01100010, 0b01010010, 0b00101111, 0b11111010, 0b11001101, 0b10111100, 0b11110100, 0b01100011, 0b01010100, 0b00111000, 0b11011000, 0b01001110, 0b11101011, 0b10010010, 0b01011111, 0b01010011, 0b00000111, 0b10001111], # Node 391
-[0b00101000, 0b01000001, 0b01000011, 0b00000110, 0b00010010, 0b10010001, 0b10111100, 0b01000001, 0b00011000, 0b00010001, 0b01000111, 0b01110111, 0b00000010, 0b00000100, 0b00011001, 0b11110000, 0b01001001, 0b00011010, 0b10000100, 0b00111011, 0b00100001, 0b00000000, 0b10111001, 0b00000110, 0b00010000, 0b10010000, 0b11000001, 0b00100000, 0b00001010, 0b00110000, 0b00011110, 0b00001010, 0b10000001, 0b11110000, 0b00011000, 0b00100010, 0b00000000, 0b11011111, 0b00000001, 0b00010001, 0b11110100, 0b00000011, 0b00000011, 0b10000110, 0b00101111, 0b00000000, 0b10000001, 0b00110000, 0b00000000, 0b00000000, 0b11000001, 0b10100011, 0b10100000, 0b11110000, 0b00011111, 0b00100000, 0b10010101, 0b11111101, 0b00010011, 0b00100000, 0b01111001, 0b10011111, 0b00000001, 0b11000011, 0b11111111, 0b10000101, 0b01010011, 0b01110000, 0b00001011, 0b00101110, 0b11010000, 0b01011111, 0b00000000, 0b01001110, 0b11001001, 0b00000000, 0b01001001, 0b10001010, 0b00110011, 0b00101000, 0b00101001, 0b00000000, 0b00000001, 0b00000000, 0b00010000, 0b00000010, 0b00000100, 0b00000001, 0b01000000, 0b00011011, 0b00000000, 0b01000000, 0b01000000, 0b00100001, 0b10010001, 0b00001000, 0b00000000, 0b00000100], # Node 392
-[0b11000100, 0b00011010, 0b10001001, 0b00111000, 0b01101000, 0b01001100, 0b01110001, 0b10001111, 0b11011111, 0b01011011, 0b10111001, 0b11010110, 0b00011111, 0b01110101, 0b10111010, 0b00101100, 0b00111111, 0b10000110, 0b00100011, 0b11000000, 0b11111101, 0b11101101, 0b00011000, 0b01011100, 0b00111011, 0b11110111, 0b00010111, 0b10011000, 0b11011011, 0b00111111, 0b11110000, 0b01010101, 0b01100100, 0b01111101, 0b01101100, 0b11111101, 0b10010111, 0b00000110, 0b00111011, 0b11110101, 0b10110001, 0b11100010, 0b01111111, 0b00101101, 0b00111110, 0b00001010, 0b01100100, 0b11110001, 0b00111010, 0b11010101, 0b00001101, 0b10100101, 0b10111011, 0b01110001, 0b00111001, 0b11100110, 0b01011111, 0b10010011, 0b10100001, 0b10111011, 0b10110111, 0b00100110, 0b10101000, 0b00011011, 0b10001100, 0b01100100, 0b00010100, 0b11101111, 0b11110011, 0b01010101, 0b01011000, 0b00001101, 0b01100011, 0b11011011, 0b10001101, 0b01111001, 0b01100011, 0b10111111, 0b00000110, 0b11011100, 0b10110011, 0b11000110, 0b10001010, 0b11111111, 0b11011110, 0b00001011, 0b11111101, 0b01111111, 0b11110110, 0b01101001, 0b01010011, 0b10110101, 0b11011010, 0b01111101, 0b00111111, 0b10000110, 0b11001011, 0b01010110], # Node 393
-[0b01011001, 0b01000011, 0b00001100, 0b10001000, 0b10110000, 0b11100000, 0b00010111, 0b10001101, 0b00010010, 0b11000010, 0b01000101, 0b11100001, 0b01001000, 0b00000101, 0b00111011, 0b01010001, 0b00111011, 0b01100010, 0b11100000, 0b01000111, 0b01101110, 0b00000010, 0b00100101, 0b00100101, 0b11110011, 0b01100110, 0b00010100, 0b01001000, 0b10000011, 0b10100000, 0b01001000, 0b10111101, 0b10110011, 0b01110100, 0b10000110, 0b10000001, 0b10101010, 0b00000010, 0b00110011, 0b11001010, 0b00111100, 0b10001000, 0b01011111, 0b11010101, 0b01000100, 0b01110111, 0b00110101, 0b00001110, 0b00001011, 0b11010100, 0b11101110, 0b10100110, 0b11011010, 0b10100001, 0b01010010, 0b00110001, 0b10100011, 0b01011101, 0b10001010, 0b10000000, 0b00010000, 0b11110110, 0b00001100, 0b01010100, 0b00010000, 0b00100010, 0b01001101, 0b00010100, 0b00101101, 0b11110000, 0b10111001, 0b00111100, 0b01100101, 0b00000100, 0b00110000, 0b00011110, 0b01101000, 0b10000110, 0b11111011, 0b10001000, 0b11100000, 0b00101000, 0b01001111, 0b00001100, 0b10010000, 0b01110001, 0b10001101, 0b00100001, 0b01110101, 0b00100000, 0b10101100, 0b01001001, 0b10000000, 0b00100110, 0b10001000, 0b00000001, 0b01001001, 0b11011000], # Node 394
-[0b00101000, 0b11100111, 0b00011111, 0b10000000, 0b11111110, 0b11111111, 0b00011111, 0b10011000, 0b11111111, 0b11111111, 0b10111011, 0b11111101, 0b11111111, 0b01111011, 0b11111111, 0b11111111, 0b00011111, 0b01010010, 0b11111100, 0b01111111, 0b11011111, 0b00000010, 0b10111001, 0b11101101, 0b00011111, 0b00000000, 0b10000000, 0b11111110, 0b00000001, 0b10000000, 0b11001101, 0b00111111, 0b10000000, 0b00000000, 0b11111110, 0b00000010, 0b01100101, 0b11010000, 0b00001111, 0b11111100, 0b00000111, 0b01111110, 0b11000001, 0b11111111, 0b11100000, 0b00000011, 0b11011110, 0b00000111, 0b00011111, 0b00100001, 0b01101100, 0b11100000, 0b00000001, 0b01100000, 0b00000100, 0b00011000, 0b00000010, 0b00000000, 0b10000000, 0b00000001, 0b11101000, 0b10000011, 0b00000000, 0b10000010, 0b00111111, 0b00010111, 0b00010000, 0b11111100, 0b11111111, 0b10000001, 0b11000011, 0b11111111, 0b01111111, 0b00100100, 0b11111110, 0b11111111, 0b10000111, 0b11100001, 0b11111111, 0b00111111, 0b01111100, 0b11110000, 0b11111111, 0b11000001, 0b00000010, 0b11111110, 0b00000101, 0b10001000, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b00000000, 0b11110000, 0b11001100, 0b10000000, 0b00000000, 0b10011100], # Node 395
-[0b01001001, 0b11111101, 0b01000011, 0b10001011, 0b01001100, 0b11100011, 0b01110111, 0b01010110, 0b11101100, 0b01100101, 0b11111001, 0b11101100, 0b01101110, 0b00101010, 0b10111111, 0b01101110, 0b10100111, 0b10001110, 0b11101101, 0b11110111, 0b01110110, 0b10010000, 0b00101010, 0b11101100, 0b10111011, 0b11111000, 0b11000011, 0b01011010, 0b10011011, 0b10000000, 0b10100001, 0b10111010, 0b11110100, 0b10010101, 0b01110011, 0b10000110, 0b11101110, 0b11011101, 0b10111100, 0b01110001, 0b01000111, 0b10011101, 0b00011000, 0b00000100, 0b10100100, 0b10001111, 0b01001011, 0b11101001, 0b11101110, 0b01110101, 0b11111110, 0b11110100, 0b00001011, 0b01100100, 0b00111100, 0b10101111, 0b11011100, 0b10110011, 0b11110001, 0b11111011, 0b10110000, 0b01011101, 0b10101100, 0b11101011, 0b11111011, 0b00000001, 0b00111010, 0b01101100, 0b10010100, 0b01110100, 0b01011110, 0b11011111, 0b00010011, 0b11010110, 0b11110111, 0b01010111, 0b11101101, 0b11110011, 0b11001001, 0b10011100, 0b01000110, 0b00110100, 0b00001110, 0b11001100, 0b11010101, 0b01011101, 0b01101000, 0b00111101, 0b10010110, 0b01011111, 0b01001000, 0b00010000, 0b11111111, 0b11100111, 0b11010001, 0b01111011, 0b10001011, 0b10110010], # Node 396
-[0b01100000, 0b00001100, 0b10001001, 0b00100000, 0b01100010, 0b10000010, 0b10010101, 0b10010000, 0b11001101, 0b00010001, 0b10000110, 0b11110000, 0b00111110, 0b10100100, 0b01011100, 0b10101101, 0b00101100, 0b10110010, 0b11101111, 0b01110100, 0b00010000, 0b01100010, 0b10111111, 0b00000000, 0b00001111, 0b00100011, 0b00000110, 0b11000100, 0b00100100, 0b11010100, 0b10000000, 0b10100000, 0b11010101, 0b10110100, 0b10001011, 0b10001100, 0b00000111, 0b11001101, 0b00100000, 0b01101000, 0b11001100, 0b01101001, 0b00100100, 0b10000110, 0b00111011, 0b11001011, 0b00011001, 0b11101110, 0b00010100, 0b11110100, 0b00001011, 0b01101111, 0b00100011, 0b00011101, 0b00001011, 0b11001100, 0b11010100, 0b00111001, 0b10111010, 0b00011100, 0b01111101, 0b10010110, 0b01010111, 0b11010100, 0b11010110, 0b11011101, 0b10000000, 0b11011011, 0b11101101, 0b10100011, 0b11001000, 0b11111111, 0b11111111, 0b00100111, 0b00111111, 0b11101101, 0b00101010, 0b11011100, 0b00000011, 0b10011000, 0b00101110, 0b10010111, 0b00000000, 0b00100111, 0b01000101, 0b01001001, 0b10101000, 0b00010111, 0b10101000, 0b00001110, 0b00000011, 0b10100011, 0b00001000, 0b00010101, 0b10000001, 0b00101000, 0b10100000, 0b10001000], # Node 397
-[0b00000001, 0b00110111, 0b00101011, 0b00101001, 0b00000100, 0b00000011, 0b00111001, 0b00000011, 0b10111010, 0b10110101, 0b01101011, 0b00010010, 0b11000101, 0b10110011, 0b00000110, 0b00100100, 0b10010101, 0b01010000, 0b11101010, 0b01110011, 0b10110011, 0b00001001, 0b10001110, 0b00100011, 0b11100100, 0b00010000, 0b00111000, 0b00111110, 0b10110011, 0b01011100, 0b01110011, 0b01011010, 0b10000011, 0b00111101, 0b11001101, 0b10010011, 0b00000001, 0b00101101, 0b10011100, 0b10111101, 0b11101101, 0b01000001, 0b10110000, 0b01111001, 0b01100001, 0b00010111, 0b01100100, 0b10000000, 0b00011000, 0b01011101, 0b10101001, 0b00101000, 0b01110001, 0b01011100, 0b10011110, 0b10111011, 0b01000010, 0b11111001, 0b00001111, 0b10100010, 0b11101000, 0b01100000, 0b00100111, 0b01101101, 0b11111000, 0b01000110, 0b01001000, 0b01100000, 0b11010101, 0b10100101, 0b11100111, 0b01010110, 0b01011101, 0b00010000, 0b01100001, 0b01101111, 0b11110001, 0b10000011, 0b01010111, 0b01010000, 0b10100000, 0b10011011, 0b11101000, 0b00101011, 0b00110001, 0b00000000, 0b10000111, 0b10101010, 0b10100100, 0b00000000, 0b10011001, 0b10101011, 0b00000110, 0b01000000, 0b01001111, 0b11101001, 0b01111001, 0b10101010], # Node 398
-[0b11111110, 0b10000111, 0b11111110, 0b11011011, 0b11101111, 0b10111100, 0b01111111, 0b10111111, 0b11101101, 0b10110011, 0b11110110, 0b11111011, 0b11110111, 0b00111111, 0b10010111, 0b11111111, 0b01101111, 0b01111111, 0b11011100, 0b11111111, 0b11001111, 0b10111111, 0b11110101, 0b11101111, 0b11110110, 0b10000001, 0b11111111, 0b11111100, 0b10011110, 0b00000001, 0b11000000, 0b01111011, 0b01001000, 0b00001000, 0b11111000, 0b00110110, 0b11000000, 0b11000000, 0b11011111, 0b00001001, 0b00001110, 0b10110110, 0b00001111, 0b11110000, 0b01000000, 0b10000000, 0b00000011, 0b10001111, 0b10111110, 0b10001111, 0b00110010, 0b11111000, 0b10101111, 0b01101111, 0b00000110, 0b10111111, 0b11101111, 0b01010011, 0b11110000, 0b11111000, 0b00000111, 0b11000001, 0b01111111, 0b11111111, 0b00111111, 0b11111100, 0b11000101, 0b11111101, 0b11100101, 0b11111111, 0b11110100, 0b00111111, 0b11111111, 0b11100111, 0b11111101, 0b11111111, 0b11100111, 0b00010101, 0b11111111, 0b01011111, 0b11011110, 0b11001011, 0b10111111, 0b11111101, 0b00000111, 0b10001110, 0b11000100, 0b11110111, 0b10011110, 0b10100000, 0b11010101, 0b11111000, 0b00110111, 0b10001101, 0b11111101, 0b11101111, 0b11011101, 0b10101101], # Node 399
-[0b00010011, 0b10100001, 0b00101010, 0b10000000, 0b11000111, 0b01110111, 0b11111000, 0b00010100, 0b11000100, 0b10000100, 0b00010101, 0b00000101, 0b10111100, 0b00010011, 0b00111001, 0b11111000, 0b01100001, 0b01000111, 0b00110111, 0b10110110, 0b00000100, 0b10000001, 0b10100011, 0b10110000, 0b01000100, 0b00010001, 0b01001101, 0b01110111, 0b10110101, 0b11100101, 0b11010111, 0b10110101, 0b00101000, 0b10010000, 0b00001011, 0b00001010, 0b00011000, 0b01111011, 0b11011100, 0b00100010, 0b01110111, 0b00001100, 0b11000000, 0b11111110, 0b00000011, 0b11100000, 0b01001110, 0b00011000, 0b10010100, 0b00010001, 0b10010100, 0b00101001, 0b01111001, 0b10001011, 0b10010100, 0b00010111, 0b00100001, 0b00111001, 0b00011001, 0b01011110, 0b00101011, 0b00110011, 0b00111110, 0b10010011, 0b11101110, 0b00111101, 0b01000000, 0b00000011, 0b01110011, 0b01000011, 0b11001000, 0b11111010, 0b01100000, 0b00000000, 0b11010101, 0b10100100, 0b01001110, 0b11010011, 0b01101001, 0b01010101, 0b11010010, 0b10010001, 0b00010110, 0b01110101, 0b01110100, 0b00110001, 0b10000010, 0b10110100, 0b11011000, 0b10000110, 0b00010101, 0b01010011, 0b10100100, 0b00010100, 0b00110011, 0b00100001, 0b10101111, 0b10011000], # Node 400
-[0b10101101, 0b11111100, 0b00100100, 0b01101000, 0b01111101, 0b10001010, 0b01010111, 0b11100101, 0b00001111, 0b11111111, 0b00110101, 0b00101101, 0b11000000, 0b01011111, 0b00011110, 0b00000000, 0b11101000, 0b11000011, 0b00000000, 0b10000000, 0b10111110, 0b00000111, 0b00000000, 0b11011000, 0b00001111, 0b10111000, 0b00000000, 0b01111100, 0b11000000, 0b01111111, 0b11000000, 0b01011111, 0b11111111, 0b00000111, 0b01111000, 0b11110100, 0b11111111, 0b00000000, 0b11011111, 0b11111111, 0b00001111, 0b01110000, 0b11111011, 0b11111111, 0b00100111, 0b11111010, 0b11111111, 0b11011111, 0b10010101, 0b00111100, 0b11110000, 0b01011111, 0b11101011, 0b00000000, 0b11111111, 0b00111111, 0b00000001, 0b11111000, 0b11110001, 0b00001001, 0b11110000, 0b11100111, 0b00011111, 0b10000001, 0b01111001, 0b11110100, 0b00100000, 0b00000000, 0b01000010, 0b00001111, 0b00000001, 0b00000001, 0b11011011, 0b00011000, 0b00110000, 0b00101101, 0b00000001, 0b00000011, 0b01010100, 0b10000000, 0b00110000, 0b00100000, 0b00010000, 0b11110000, 0b00000001, 0b10001110, 0b10111110, 0b11110010, 0b11111000, 0b11111111, 0b01001111, 0b01110000, 0b00110010, 0b11011111, 0b01011010, 0b11000110, 0b11110111, 0b01100110], # Node 401
-[0b00010100, 0b01001100, 0b00000000, 0b00110101, 0b00100101, 0b00000000, 0b00110000, 0b00010111, 0b00000000, 0b01001000, 0b11001000, 0b00000000, 0b00000000, 0b01101010, 0b01100110, 0b10000100, 0b10110011, 0b01101111, 0b11111110, 0b00000000, 0b11110000, 0b01100111, 0b00011111, 0b11011010, 0b11000111, 0b11110000, 0b11101011, 0b11111111, 0b11111100, 0b00011111, 0b11111011, 0b11111111, 0b11110101, 0b10000001, 0b11111111, 0b10111100, 0b00011110, 0b11111100, 0b11111111, 0b11111111, 0b00110011, 0b01110001, 0b11111111, 0b11111111, 0b00000011, 0b11100000, 0b11111111, 0b01111111, 0b00000000, 0b11111101, 0b11111111, 0b00001111, 0b10110000, 0b10100101, 0b01111011, 0b10000000, 0b00001111, 0b10010001, 0b00000111, 0b00010000, 0b00000000, 0b10111100, 0b00000000, 0b11000110, 0b10000000, 0b00000001, 0b11101000, 0b00000010, 0b11110000, 0b00000000, 0b00101100, 0b00000000, 0b00000010, 0b00001000, 0b00000000, 0b00100000, 0b01000000, 0b00010000, 0b01100000, 0b00111100, 0b10110000, 0b11000000, 0b11111111, 0b10000011, 0b11111000, 0b11111111, 0b11111111, 0b11111000, 0b11111111, 0b11111111, 0b11111111, 0b11111111, 0b11111111, 0b11111111, 0b10010001, 0b10110111, 0b11001100, 0b10000101], # Node 402
-[0b11011111, 0b11001101, 0b10111010, 0b11110101, 0b10110111, 0b10011111, 0b11101101, 0b11111100, 0b11010110, 0b01110010, 0b10111111, 0b10100101, 0b10100101, 0b01110011, 0b11001110, 0b10110110, 0b01100011, 0b11010101, 0b11111111, 0b00111111, 0b10101110, 0b00111011, 0b11010000, 0b10011010, 0b11111111, 0b01001111, 0b11000000, 0b00101010, 0b11111111, 0b00000110, 0b01001000, 0b00010111, 0b00000011, 0b11010000, 0b11001011, 0b01111011, 0b11000011, 0b01111110, 0b11111000, 0b00000000, 0b11110010, 0b11110010, 0b01000100, 0b11000001, 0b11110001, 0b10110101, 0b11011111, 0b01011111, 0b11101100, 0b11011111, 0b11101111, 0b00110001, 0b11111011, 0b11111101, 0b10000100, 0b11110110, 0b11101100, 0b01110110, 0b00000011, 0b00010101, 0b10111100, 0b01111010, 0b11010110, 0b11011111, 0b01101111, 0b10000001, 0b01101011, 0b11111110, 0b11000001, 0b11101111, 0b01110011, 0b11111100, 0b11010100, 0b00111111, 0b10010011, 0b10111011, 0b10111111, 0b01101111, 0b11001000, 0b11111101, 0b00011110, 0b01010110, 0b00000000, 0b10111110, 0b11011001, 0b00000011, 0b11011000, 0b00111111, 0b10101001, 0b10101111, 0b11111110, 0b01101101, 0b10110110, 0b11111110, 0b10100001, 0b10101011, 0b01001110, 0b11101110], # Node 403
-[0b00111101, 0b01100101, 0b00110100, 0b00110001, 0b10000110, 0b00101101, 0b10001000, 0b00100010, 0b10001010, 0b01000010, 0b00010110, 0b01101110, 0b10000101, 0b11000101, 0b00000001, 0b11000010, 0b00000001, 0b00001000, 0b00100001, 0b00110100, 0b10101001, 0b01001000, 0b01000010, 0b00100111, 0b01011010, 0b11011000, 0b11101000, 0b01011101, 0b10010000, 0b10101100, 0b10000001, 0b11001010, 0b00010010, 0b01000011, 0b01110111, 0b00000001, 0b00100001, 0b01011000, 0b00100100, 0b10111000, 0b10000110, 0b01000100, 0b10011000, 0b00001000, 0b01001010, 0b00100110, 0b10011110, 0b10111100, 0b01111100, 0b10111010, 0b10000110, 0b11110101, 0b00100100, 0b10001001, 0b11000010, 0b10100001, 0b10010101, 0b10100101, 0b00100111, 0b01110000, 0b00001100, 0b10001001, 0b10001001, 0b11000101, 0b01101010, 0b10110111, 0b00000001, 0b10000000, 0b00000001, 0b11001010, 0b01100000, 0b11001011, 0b10011110, 0b11100100, 0b10100110, 0b00010101, 0b11110111, 0b00111011, 0b00101011, 0b10100110, 0b10101000, 0b10101010, 0b00111101, 0b11001000, 0b11000111, 0b00100110, 0b00010101, 0b10100101, 0b00100010, 0b00100111, 0b01110111, 0b10100100, 0b10010110, 0b01000001, 0b11111110, 0b01001001, 0b00100110, 0b00001000], # Node 404
-[0b11111100, 0b11111001, 0b11101011, 0b11110111, 0b11100110, 0b11110111, 0b10001101, 0b11110111, 0b11010100, 0b01101111, 0b11110101, 0b11011111, 0b01101011, 0b00101110, 0b11101111, 0b01100110, 0b11100010, 0b01110111, 0b00010100, 0b10010111, 0b11111001, 0b00101011, 0b11101100, 0b00010011, 0b11100011, 0b01011011, 0b01101011, 0b11010100, 0b01100111, 0b10111010, 0b00010011, 0b00101001, 0b11111101, 0b00110011, 0b10111000, 0b01001111, 0b10111100, 0b10001100, 0b10101111, 0b11011111, 0b10011010, 0b11011000, 0b11001010, 0b10000001, 0b11111111, 0b01010100, 0b11010111, 0b11100011, 0b01000100, 0b10111111, 0b01101010, 0b01011011, 0b10000001, 0b10111001, 0b01101110, 0b11011111, 0b10010101, 0b01011011, 0b11100111, 0b11111001, 0b11111100, 0b00011111, 0b10110111, 0b11100101, 0b11110001, 0b11011001, 0b10101010, 0b11000000, 0b01001111, 0b00011111, 0b00000111, 0b10111111, 0b11011011, 0b00101110, 0b01110000, 0b00110001, 0b11111110, 0b00010001, 0b01101000, 0b11001011, 0b11101110, 0b01111111, 0b01110101, 0b11111110, 0b10011011, 0b00011110, 0b10111011, 0b11110100, 0b10011111, 0b10010001, 0b01111111, 0b11011101, 0b00011010, 0b10101111, 0b11100111, 0b11011110, 0b11000101, 0b11111101], # Node 405
-[0b01000100, 0b01111011, 0b11100111, 0b10001010, 0b11110001, 0b00000011, 0b11110001, 0b01110001, 0b11011111, 0b01101010, 0b01111100, 0b10100011, 0b01111000, 0b01110110, 0b00000110, 0b00111101, 0b10011110, 0b10111110, 0b01101011, 0b11000110, 0b11000110, 0b10011111, 0b01010111, 0b00110001, 0b01101101, 0b10010010, 0b11110100, 0b11000101, 0b11001101, 0b11001011, 0b11011111, 0b01010010, 0b00001110, 0b00111101, 0b01111001, 0b10011100, 0b01100001, 0b00101110, 0b00110001, 0b10010000, 0b00000010, 0b11110000, 0b01010111, 0b11011001, 0b10000110, 0b11111011, 0b11111111, 0b11100101, 0b10101011, 0b01111100, 0b11000110, 0b11110010, 0b10000111, 0b00001010, 0b01010000, 0b00001101, 0b11010110, 0b01110110, 0b11100011, 0b10000011, 0b00111001, 0b01001011, 0b10101101, 0b11111011, 0b11111010, 0b01010000, 0b01110110, 0b00101100, 0b00110111, 0b01110000, 0b11100001, 0b01010110, 0b11001010, 0b10111000, 0b01011001, 0b00110101, 0b00111111, 0b11111111, 0b11111001, 0b10010010, 0b01100001, 0b10110100, 0b01100101, 0b10101011, 0b11101010, 0b10011110, 0b11101011, 0b01110111, 0b00101111, 0b11001011, 0b00111001, 0b00001100, 0b11110101, 0b00011111, 0b10110111, 0b11011110, 0b11101001, 0b01111011], # Node 406
-[0b01011011, 0b11011101, 0b10111101, 0b01100001, 0b10011101, 0b11100100, 0b10010000, 0b10010111, 0b01010010, 0b11010111, 0b10111111, 0b10111100, 0b00010000, 0b01001110, 0b00011101, 0b10011011, 0b10101010, 0b10011010, 0b01111101, 0b10010011, 0b01110010, 0b01111111, 0b10010110, 0b11101100, 0b00001111, 0b11111110, 0b10111111, 0b10000010, 0b01010101, 0b11000101, 0b10101010, 0b10111001, 0b00111100, 0b00001011, 0b10110001, 0b00011101, 0b01100100, 0b11000011, 0b10010011, 0b00111111, 0b01111010, 0b01000001, 0b10111010, 0b11110100, 0b00101010, 0b01111100, 0b00011111, 0b01101111, 0b10001110, 0b01111101, 0b10101011, 0b01001101, 0b11111101, 0b10110101, 0b10000000, 0b00111011, 0b11101111, 0b10011110, 0b11110101, 0b01110010, 0b11101000, 0b11011010, 0b00010001, 0b01000111, 0b01110111, 0b10110100, 0b11111110, 0b01111111, 0b01011100, 0b01010111, 0b11001101, 0b01011011, 0b10100100, 0b11000111, 0b01001000, 0b11011110, 0b01010110, 0b01101101, 0b10010111, 0b00000001, 0b01010101, 0b01110111, 0b00110001, 0b00101111, 0b11111100, 0b01010100, 0b01100101, 0b00001001, 0b10110111, 0b11111111, 0b01011111, 0b10011101, 0b11101101, 0b00111110, 0b01000001, 0b11000011, 0b01011001, 0b00100110], # Node 407
-[0b00100001, 0b00101001, 0b10001100, 0b01100001, 0b11011001, 0b01011000, 0b01110000, 0b10010000, 0b10011100, 0b10001101, 0b00011011, 0b11101000, 0b00000010, 0b01000000, 0b00111111, 0b10101010, 0b01110110, 0b11010100, 0b10110101, 0b01110000, 0b10011010, 0b10101111, 0b01011001, 0b11101110, 0b00000100, 0b11011101, 0b01100111, 0b01100010, 0b01101011, 0b11011111, 0b00001111, 0b11000110, 0b01100101, 0b01110000, 0b10000011, 0b11010110, 0b01000011, 0b01100000, 0b11010101, 0b01001000, 0b10010000, 0b01111000, 0b01111010, 0b00101110, 0b10100011, 0b11001001, 0b00110000, 0b10111110, 0b00000111, 0b10100100, 0b00011010, 0b01101000, 0b01000011, 0b00101111, 0b10001100, 0b10101011, 0b11100000, 0b11000111, 0b00110101, 0b01100111, 0b11011001, 0b00101100, 0b00100001, 0b10011111, 0b10101100, 0b01000011, 0b01001010, 0b10100110, 0b00101101, 0b01110110, 0b00100000, 0b01111111, 0b00010111, 0b11000001, 0b10110100, 0b10110001, 0b01010110, 0b01001000, 0b10111000, 0b00100110, 0b11000001, 0b10001000, 0b00010001, 0b01001101, 0b01100101, 0b01100001, 0b11011000, 0b11001000, 0b00101000, 0b00100111, 0b11000101, 0b10001010, 0b11011000, 0b11000000, 0b01010011, 0b00011110, 0b10001000, 0b10000010], # Node 408
-[0b00100000, 0b01110000, 0b01100000, 0b10100110, 0b00100110, 0b00000011, 0b01011000, 0b10101110, 0b10100000, 0b00010100, 0b00011100, 0b10100000, 0b01000011, 0b00010001, 0b01110001, 0b00111110, 0b01110000, 0b00001111, 0b01101100, 0b00011100, 0b01100010, 0b00000101, 0b00011000, 0b00010010, 0b10010000, 0b11111010, 0b00010101, 0b00100111, 0b00010010, 0b01111010, 0b00001110, 0b10100010, 0b11001000, 0b10010111, 0b00000001, 0b01100001, 0b00100110, 0b00111011, 0b01100101, 0b11111101, 0b11011101, 0b01110011, 0b01000011, 0b00111111, 0b10010001, 0b00100000, 0b11110000, 0b10011101, 0b10001101, 0b00001100, 0b01111110, 0b00110000, 0b10000011, 0b01100001, 0b00000000, 0b10011101, 0b00101010, 0b00001010, 0b01000000, 0b10000010, 0b00101000, 0b00000000, 0b00110001, 0b10100001, 0b00011100, 0b00000111, 0b10000010, 0b01000010, 0b11101000, 0b10010110, 0b01110010, 0b10000100, 0b00101111, 0b10100001, 0b00000001, 0b11111100, 0b00011011, 0b00011010, 0b11110001, 0b00100001, 0b01110000, 0b00001111, 0b10011111, 0b10011001, 0b10111001, 0b11111110, 0b00110101, 0b00100011, 0b01101100, 0b10100101, 0b00001011, 0b11010010, 0b01000100, 0b10000011, 0b11011001, 0b10101001, 0b00000101, 0b00010001], # Node 409
-[0b01001110, 0b10110000, 0b01101011, 0b00101000, 0b00101000, 0b10010011, 0b11100010, 0b01111000, 0b00100000, 0b00000110, 0b00000101, 0b11110000, 0b01001001, 0b00101001, 0b00001010, 0b10000010, 0b10111110, 0b00000011, 0b10110001, 0b10001101, 0b01101000, 0b11110101, 0b10101100, 0b00011111, 0b00010110, 0b00000111, 0b01000101, 0b11010101, 0b10011110, 0b10100011, 0b11011100, 0b00001000, 0b00000010, 0b10110111, 0b11001011, 0b00111001, 0b10110000, 0b10110000, 0b00101000, 0b11011110, 0b10111101, 0b10100010, 0b01100001, 0b01010000, 0b00111101, 0b00111001, 0b00010110, 0b00011010, 0b01001110, 0b11110000, 0b10010000, 0b11001010, 0b11001101, 0b01110101, 0b01111100, 0b01001100, 0b01000011, 0b10100000, 0b00110100, 0b01000000, 0b00101010, 0b00011001, 0b00011110, 0b11111001, 0b00101101, 0b00000010, 0b00000000, 0b11010011, 0b01100110, 0b00001000, 0b01001110, 0b11100000, 0b01000101, 0b01011001, 0b00101110, 0b00101011, 0b10001011, 0b10011100, 0b10000100, 0b10011000, 0b10001001, 0b10111001, 0b00100101, 0b00011011, 0b11101101, 0b10000010, 0b10000000, 0b01101101, 0b10110101, 0b00100110, 0b01100000, 0b01001100, 0b01010101, 0b10011010, 0b11011011, 0b10111000, 0b11110010, 0b11000000], # Node 410
-[0b00101101, 0b10011000, 0b01010101, 0b01010010, 0b01110010, 0b00001010, 0b10101010, 0b11001110, 0b01011000, 0b01000000, 0b11100101, 0b10001100, 0b00100111, 0b00000110, 0b01001011, 0b11010010, 0b00000110, 0b01000110, 0b01000010, 0b01000000, 0b11000011, 0b10110100, 0b00101000, 0b11100010, 0b00000000, 0b00000000, 0b00111000, 0b10001001, 0b11000101, 0b00100101, 0b00101111, 0b00101001, 0b10011101, 0b00000011, 0b01100001, 0b00100110, 0b01100001, 0b00111001, 0b01000011, 0b11001001, 0b01100010, 0b11001100, 0b01100010, 0b01011100, 0b01101111, 0b10110110, 0b01011100, 0b11110110, 0b11110001, 0b00100010, 0b11011011, 0b01000101, 0b10101010, 0b00001110, 0b01001010, 0b00010011, 0b10101100, 0b10001101, 0b00010101, 0b00011100, 0b11111101, 0b00011001, 0b01100100, 0b10000110, 0b01111010, 0b00010010, 0b10111011, 0b01001110, 0b10110001, 0b11000101, 0b11110000, 0b11001100, 0b01100110, 0b00000000, 0b10010011, 0b00110101, 0b00000011, 0b00110111, 0b01101111, 0b00110110, 0b11100100, 0b10010100, 0b01100100, 0b00100000, 0b01100101, 0b11001011, 0b10110111, 0b00010101, 0b01101111, 0b01101000, 0b10110101, 0b01100011, 0b00100111, 0b00101111, 0b01110101, 0b10010110, 0b01011101, 0b00001101], # Node 411
-[0b00001100, 0b00000000, 0b10010100, 0b10000100, 0b00100010, 0b00101110, 0b10010011, 0b00101001, 0b10010000, 0b00001000, 0b00010010, 0b01001100, 0b00000010, 0b00101001, 0b11000011, 0b01111000, 0b01010000, 0b00010000, 0b00010101, 0b10010010, 0b00010000, 0b11000010, 0b01110000, 0b01001101, 0b11100000, 0b00000010, 0b00011000, 0b00000000, 0b10100000, 0b10110100, 0b00101010, 0b10000000, 0b01101000, 0b00100010, 0b00000011, 0b10100000, 0b00000000, 0b11001000, 0b00001001, 0b00001110, 0b11100001, 0b01000110, 0b11000011, 0b00100000, 0b10100100, 0b01000001, 0b10001100, 0b11100010, 0b11001011, 0b01110000, 0b00001000, 0b11111010, 0b10000000, 0b00001010, 0b11100000, 0b01111110, 0b01100100, 0b10110000, 0b11100110, 0b00000100, 0b11111101, 0b01100010, 0b00001011, 0b00100001, 0b01100100, 0b00111110, 0b10001000, 0b01110010, 0b11101101, 0b00001100, 0b00000000, 0b11111100, 0b11100000, 0b10010000, 0b00001110, 0b01010100, 0b01100001, 0b10001101, 0b00000011, 0b00000100, 0b00000000, 0b01000000, 0b01010000, 0b00010100, 0b10100001, 0b00001000, 0b01000100, 0b10001100, 0b01000001, 0b00011000, 0b01111000, 0b10000000, 0b10000000, 0b01010100, 0b00100010, 0b00100001, 0b00000000, 0b11010001], # Node 412
-[0b11100100, 0b01111001, 0b10110111, 0b00110000, 0b11110111, 0b10110101, 0b10011110, 0b11011001, 0b11101000, 0b01100101, 0b01100000, 0b11011110, 0b00110010, 0b01110101, 0b01111011, 0b01011111, 0b11101110, 0b01111111, 0b00101111, 0b10100001, 0b11011110, 0b01100111, 0b11011010, 0b11111011, 0b10111100, 0b10000001, 0b11000110, 0b00111111, 0b11110011, 0b01110000, 0b01111001, 0b11111111, 0b01101001, 0b11011100, 0b11010001, 0b01011110, 0b11011110, 0b11111111, 0b00001010, 0b00110111, 0b10101011, 0b00110011, 0b01011111, 0b01110110, 0b10000101, 0b01111001, 0b11101011, 0b01011001, 0b10101110, 0b01100000, 0b00011101, 0b10011000, 0b00001001, 0b01110000, 0b00010010, 0b01010110, 0b01011110, 0b00011110, 0b10011100, 0b01011110, 0b11101000, 0b01101100, 0b01100011, 0b11100101, 0b00110000, 0b00101111, 0b01101100, 0b11000111, 0b01010000, 0b10011100, 0b11110110, 0b11001110, 0b10011011, 0b01100110, 0b01010100, 0b10000100, 0b00001000, 0b11111110, 0b11110001, 0b11110100, 0b01111100, 0b01001011, 0b01111110, 0b01101001, 0b10110111, 0b00001000, 0b10100111, 0b10000111, 0b01011100, 0b10110001, 0b11000010, 0b00111111, 0b11101111, 0b11100110, 0b11111111, 0b01110100, 0b11010100, 0b11000000], # Node 413
-[0b01011100, 0b01100000, 0b10001010, 0b01100010, 0b00001000, 0b10000000, 0b11000100, 0b00000111, 0b00011000, 0b10001101, 0b10000110, 0b00110100, 0b11000101, 0b01100100, 0b10001100, 0b00111100, 0b01101001, 0b00110101, 0b01001110, 0b10000000, 0b10101000, 0b10010110, 0b00110010, 0b10000110, 0b00000100, 0b11001001, 0b00110110, 0b10001000, 0b01000000, 0b11111010, 0b01010111, 0b00001000, 0b01011000, 0b10100110, 0b00111100, 0b11100010, 0b11001111, 0b00110101, 0b00000111, 0b11111011, 0b00110111, 0b00111100, 0b00101100, 0b01110101, 0b10100011, 0b10011001, 0b11100101, 0b00101001, 0b01110100, 0b11000000, 0b11101111, 0b00100001, 0b10101001, 0b00100111, 0b11101100, 0b11000000, 0b10100100, 0b11001101, 0b11101001, 0b10010011, 0b01000100, 0b10100000, 0b01000010, 0b01011101, 0b01111100, 0b10100100, 0b10100100, 0b10000100, 0b10100001, 0b00000111, 0b00011100, 0b00000011, 0b01000101, 0b00011000, 0b01010001, 0b11100000, 0b10110000, 0b10011110, 0b10100101, 0b00010000, 0b01000101, 0b10001110, 0b10111001, 0b01011000, 0b10000011, 0b00111110, 0b10000101, 0b10100101, 0b01111100, 0b11001010, 0b00100011, 0b11001000, 0b00100110, 0b01111100, 0b00000011, 0b01100100, 0b11101001, 0b10011100], # Node 414
-[0b00001011, 0b00000110, 0b00001101, 0b10000011, 0b11010101, 0b11000011, 0b11000100, 0b00111100, 0b01100111, 0b10101100, 0b10001001, 0b11111011, 0b01111111, 0b11101001, 0b11111110, 0b00100110, 0b10011011, 0b10100110, 0b01101011, 0b10001011, 0b01010100, 0b10111111, 0b00111100, 0b11011010, 0b10110101, 0b11101111, 0b11011000, 0b11011111, 0b10111011, 0b00101011, 0b01000010, 0b11011011, 0b01110110, 0b01111111, 0b00010000, 0b11100111, 0b00110111, 0b01101110, 0b01111101, 0b00101101, 0b11111100, 0b11110100, 0b11101110, 0b11110101, 0b01110110, 0b10101111, 0b00010101, 0b11110000, 0b00001011, 0b11010011, 0b00011111, 0b11100011, 0b00110111, 0b10011101, 0b10110100, 0b10110101, 0b10001011, 0b00001001, 0b10111001, 0b00111111, 0b11110101, 0b01001111, 0b11011001, 0b10011110, 0b00100001, 0b10011011, 0b11010001, 0b01110001, 0b01011111, 0b11001011, 0b01001010, 0b00110110, 0b11011110, 0b00001111, 0b01111100, 0b10000011, 0b11111001, 0b11101010, 0b11101101, 0b01100000, 0b00011110, 0b10110011, 0b10010111, 0b01001100, 0b10100000, 0b11100101, 0b11101011, 0b10111110, 0b10111011, 0b10011001, 0b10101101, 0b10001110, 0b01110110, 0b01100001, 0b11011011, 0b11111010, 0b01110101, 0b01111110], # Node 415
-[0b11100010, 0b01011000, 0b01010000, 0b10111110, 0b10111001, 0b01100001, 0b01011111, 0b11111001, 0b11111111, 0b01011010, 0b01111110, 0b11110111, 0b11010001, 0b01011111, 0b01001101, 0b10001110, 0b10101011, 0b01100111, 0b00110100, 0b10110111, 0b11010100, 0b11111110, 0b01111110, 0b10111100, 0b10111001, 0b01011011, 0b10101010, 0b11101111, 0b00111101, 0b00011110, 0b11101100, 0b11110011, 0b00001011, 0b00001011, 0b10111000, 0b11010110, 0b00100111, 0b10101001, 0b00011111, 0b10111000, 0b10010101, 0b10101111, 0b11100010, 0b11100111, 0b10010100, 0b10000101, 0b01010001, 0b01010000, 0b10110111, 0b11110110, 0b11101000, 0b01000000, 0b10111100, 0b01101001, 0b10000011, 0b11111100, 0b11110001, 0b10000010, 0b11110101, 0b01110101, 0b00100110, 0b00101011, 0b10101010, 0b01101111, 0b11000010, 0b11000111, 0b01001000, 0b00100000, 0b11111001, 0b10000111, 0b01110000, 0b01111001, 0b11010110, 0b01011010, 0b00001101, 0b00100111, 0b01100110, 0b10011001, 0b10001001, 0b10111001, 0b11001110, 0b00011011, 0b11111000, 0b00101000, 0b11110000, 0b11010100, 0b11111111, 0b10101111, 0b00110110, 0b10110111, 0b11101111, 0b11101101, 0b10101110, 0b01011101, 0b01100011, 0b00001110, 0b01100110, 0b11110111], # Node 416
-[0b10110010, 0b10001000, 0b00000101, 0b11100001, 0b10001111, 0b00010001, 0b00101100, 0b00010000, 0b10000000, 0b00000100, 0b01010100, 0b00110101, 0b00011101, 0b00000111, 0b00000001, 0b10000100, 0b11100001, 0b01101000, 0b10100000, 0b10101000, 0b11100011, 0b00011001, 0b11000110, 0b01001000, 0b00100000, 0b00010000, 0b00010000, 0b00100100, 0b00100111, 0b10100011, 0b11000000, 0b10000001, 0b01010000, 0b00000000, 0b00110010, 0b00000100, 0b10110110, 0b00111101, 0b01000100, 0b10000111, 0b11000111, 0b00011000, 0b01000100, 0b11100011, 0b11101111, 0b00000000, 0b01110110, 0b01010101, 0b00000000, 0b11000010, 0b11000110, 0b10011110, 0b00001010, 0b00001000, 0b00111100, 0b00100111, 0b10101000, 0b11101000, 0b00000000, 0b10010110, 0b11111000, 0b11001111, 0b01100101, 0b00001100, 0b10111010, 0b10001010, 0b01111001, 0b00010001, 0b11110100, 0b00101001, 0b00001000, 0b11110100, 0b11001011, 0b10000011, 0b10100000, 0b01100100, 0b01001110, 0b00100100, 0b01001001, 0b01100101, 0b01000000, 0b10000010, 0b00000000, 0b01010011, 0b10100010, 0b00001000, 0b00111001, 0b10111110, 0b11111110, 0b00010000, 0b10101010, 0b11101010, 0b10000001, 0b00110101, 0b00001010, 0b01000010, 0b10000011, 0b00110000], # Node 417
-[0b01101000, 0b10000100, 0b11000101, 0b11010001, 0b11100001, 0b11001001, 0b00110001, 0b00010001, 0b10001000, 0b10000101, 0b01100000, 0b00001000, 0b00100000, 0b01001000, 0b01000010, 0b11101100, 0b11101111, 0b00010111, 0b00110100, 0b11101111, 0b01101111, 0b10001110, 0b11010100, 0b01111011, 0b00000101, 0b01000110, 0b01110001, 0b00111111, 0b01100111, 0b01100001, 0b01000101, 0b00110001, 0b01110010, 0b11001010, 0b00100110, 0b10011101, 0b11001111, 0b11000111, 0b10101000, 0b10100011, 0b01100101, 0b10011010, 0b01000101, 0b11111101, 0b10000110, 0b00000100, 0b11100100, 0b10110101, 0b00110101, 0b11011101, 0b01110010, 0b01011000, 0b10010001, 0b00001010, 0b11100000, 0b00111000, 0b10000100, 0b01000110, 0b01111100, 0b01001010, 0b00010011, 0b10000000, 0b01100111, 0b00000001, 0b01100110, 0b01110101, 0b10100010, 0b01111101, 0b11011011, 0b11001010, 0b00111001, 0b11110101, 0b00001111, 0b00100100, 0b11110100, 0b00111101, 0b11100101, 0b01110101, 0b10111110, 0b00011110, 0b11110000, 0b11100100, 0b10010111, 0b00101001, 0b00100010, 0b10000010, 0b00111011, 0b01000000, 0b00010000, 0b11100010, 0b00001000, 0b01101101, 0b01001000, 0b10000100, 0b10011000, 0b00010110, 0b10011010, 0b01000110], # Node 418
-[0b01011010, 0b11101011, 0b11111100, 0b00110011, 0b00101010, 0b11110110, 0b11000010, 0b01111100, 0b00101000, 0b01010111, 0b01111111, 0b01010111, 0b01011010, 0b11010110, 0b11100101, 0b01111111, 0b11001100, 0b10001111, 0b00100011, 0b11100101, 0b11100111, 0b10101111, 0b00011011, 0b01110000, 0b01110100, 0b00111100, 0b00010100, 0b01001010, 0b01100011, 0b10111101, 0b00011001, 0b00011101, 0b10100111, 0b10001000, 0b10110100, 0b01001010, 0b01010110, 0b10001110, 0b11100110, 0b10000110, 0b11001011, 0b00111010, 0b11110011, 0b01110111, 0b01111100, 0b00101110, 0b10100110, 0b10110010, 0b11000010, 0b10101111, 0b01000111, 0b01110110, 0b11101101, 0b11001011, 0b00110100, 0b01111011, 0b10011011, 0b01001000, 0b11101100, 0b01011111, 0b10011101, 0b01001000, 0b10001001, 0b10110101, 0b01011111, 0b01100000, 0b00111011, 0b01110000, 0b01011100, 0b01100000, 0b01111000, 0b11111101, 0b01110000, 0b11110101, 0b10001101, 0b10101111, 0b11000100, 0b10111110, 0b11011110, 0b01001011, 0b00000000, 0b11111101, 0b10001111, 0b10011001, 0b11011101, 0b11001101, 0b11111110, 0b00100100, 0b01011111, 0b11101101, 0b10010010, 0b00100011, 0b01101001, 0b01100000, 0b11101010, 0b00110000, 0b11011011, 0b11011001], # Node 419
-[0b10110111, 0b10101011, 0b00100100, 0b11111011, 0b00001101, 0b01011011, 0b01001010, 0b11010111, 0b11010011, 0b11011001, 0b01001011, 0b00010101, 0b01111001, 0b01011101, 0b11110100, 0b01111000, 0b11001111, 0b11111001, 0b01101111, 0b10111110, 0b00111010, 0b01101011, 0b01000111, 0b01001101, 0b01111111, 0b11001100, 0b11110100, 0b10100101, 0b10101110, 0b11101011, 0b00001001, 0b10111111, 0b11101110, 0b00011100, 0b10101100, 0b01010001, 0b01110100, 0b00101111, 0b00101110, 0b10001111, 0b00001110, 0b11011100, 0b00001000, 0b01100111, 0b11101010, 0b01000110, 0b01010011, 0b01000111, 0b11111111, 0b10111001, 0b01111101, 0b11100111, 0b10100100, 0b11001011, 0b11110100, 0b11110101, 0b10110101, 0b00111100, 0b00101000, 0b11011011, 0b11101010, 0b01011110, 0b00111010, 0b11110011, 0b01100001, 0b00010001, 0b00001101, 0b11001000, 0b10110001, 0b00000110, 0b11011011, 0b11000011, 0b00111000, 0b01000011, 0b11011010, 0b10101001, 0b11000101, 0b01111011, 0b10101001, 0b01011100, 0b00111111, 0b10000011, 0b11011110, 0b10010000, 0b11101010, 0b01111111, 0b11111110, 0b11011100, 0b00100000, 0b10011100, 0b01011001, 0b00011011, 0b11111011, 0b01011111, 0b10001110, 0b11100100, 0b11010111, 0b11010110], # Node 420
-[0b10111111, 0b01101101, 0b10111111, 0b11110110, 0b01000011, 0b11000111, 0b11111110, 0b11101001, 0b01011111, 0b01100111, 0b01011100, 0b10000010, 0b01101110, 0b11110111, 0b01011101, 0b10110110, 0b00101101, 0b11001011, 0b10001111, 0b10111001, 0b00011011, 0b01111011, 0b10111110, 0b11111111, 0b10111011, 0b11110000, 0b01010101, 0b01011110, 0b10001111, 0b01101000, 0b11110111, 0b11110011, 0b00101010, 0b10001001, 0b10101011, 0b11111111, 0b11010010, 0b11101111, 0b10011001, 0b00010000, 0b01010010, 0b00111111, 0b11110011, 0b10100010, 0b00110111, 0b11011111, 0b01100111, 0b11111010, 0b10100011, 0b00111111, 0b11101100, 0b00001110, 0b10100010, 0b10110110, 0b11011101, 0b11011011, 0b11100011, 0b10100101, 0b11110100, 0b01000001, 0b00111111, 0b00110001, 0b11100011, 0b00010111, 0b11111001, 0b11101111, 0b01001001, 0b11001111, 0b01101111, 0b01110111, 0b10111000, 0b11111110, 0b10001000, 0b00110011, 0b11011100, 0b00101001, 0b10110101, 0b10110011, 0b11001101, 0b10010111, 0b11001110, 0b01110111, 0b01100100, 0b01000111, 0b10100100, 0b01010011, 0b11110100, 0b10000100, 0b01100000, 0b11100110, 0b00010110, 0b11000100, 0b01110011, 0b10010011, 0b11111101, 0b11001101, 0b11101000, 0b01100000], # Node 421
-[0b10001110, 0b10000001, 0b00111100, 0b00001110, 0b00000010, 0b10000111, 0b01100011, 0b00101010, 0b10110110, 0b01111100, 0b01011000, 0b00100001, 0b00110001, 0b00010010, 0b11100100, 0b00001011, 0b00011010, 0b10001001, 0b00011000, 0b11101001, 0b01000001, 0b10100111, 0b01000111, 0b11101001, 0b01010111, 0b01110110, 0b01110010, 0b10110101, 0b00110010, 0b00110000, 0b01100111, 0b01000010, 0b10101011, 0b10000001, 0b00111011, 0b11001011, 0b00000101, 0b01011000, 0b10111010, 0b10011111, 0b11100001, 0b01100000, 0b11111111, 0b11110100, 0b00100001, 0b01000110, 0b00001001, 0b01001101, 0b10000010, 0b10010001, 0b00110100, 0b11001101, 0b00110100, 0b00101111, 0b00011101, 0b01100010, 0b00001010, 0b01010000, 0b11100100, 0b00010000, 0b00011000, 0b01110110, 0b00110010, 0b01101000, 0b11001001, 0b11100110, 0b01000010, 0b01101110, 0b11110111, 0b00110001, 0b11101010, 0b10110100, 0b11011010, 0b00000110, 0b11010100, 0b00110111, 0b10001001, 0b00011011, 0b00010101, 0b10011010, 0b11001000, 0b00111001, 0b00101100, 0b10000100, 0b11000000, 0b11000011, 0b01110000, 0b01111101, 0b10101000, 0b11100101, 0b11011000, 0b10101111, 0b01000000, 0b00100000, 0b01000100, 0b11100100, 0b00101001, 0b11110111], # Node 422
-[0b10100100, 0b10101010, 0b10110001, 0b00101000, 0b10101100, 0b10100101, 0b00010100, 0b01110011, 0b00011101, 0b11010001, 0b00100010, 0b11010101, 0b00010011, 0b10001100, 0b10110100, 0b00100010, 0b00011001, 0b11000010, 0b11110011, 0b11010011, 0b01111011, 0b11011011, 0b11110011, 0b00110001, 0b11010101, 0b11100000, 0b00100111, 0b10100101, 0b00110000, 0b10000111, 0b11101110, 0b00000100, 0b10110000, 0b11011110, 0b00000101, 0b10101111, 0b01101001, 0b10101111, 0b00000001, 0b11100101, 0b00111001, 0b00101010, 0b01100110, 0b00001001, 0b10101001, 0b00100101, 0b00010010, 0b10100010, 0b11011001, 0b10110110, 0b00111001, 0b00100111, 0b11010000, 0b01101001, 0b00001110, 0b01000011, 0b00110000, 0b01101010, 0b00110100, 0b11100001, 0b10000010, 0b00110100, 0b01100111, 0b11111110, 0b01000100, 0b01010110, 0b11101111, 0b11010000, 0b11100000, 0b10110000, 0b01100001, 0b11011010, 0b01000000, 0b11001111, 0b00000010, 0b11011101, 0b10001000, 0b01010000, 0b01010001, 0b00101110, 0b00100001, 0b01101101, 0b01010010, 0b00110100, 0b00010001, 0b01111001, 0b11101010, 0b10001101, 0b11001101, 0b10000110, 0b00011011, 0b01011001, 0b00000010, 0b00011010, 0b00010001, 0b00100001, 0b11110101, 0b00100000], # Node 423
-[0b01001100, 0b11101110, 0b10000111, 0b11110111, 0b11101011, 0b10010011, 0b11111000, 0b11001111, 0b10011110, 0b10110100, 0b11110110, 0b11111100, 0b00101111, 0b00011000, 0b00001001, 0b11000001, 0b00000100, 0b00101011, 0b10110111, 0b00011110, 0b01110000, 0b11011000, 0b10111110, 0b00000111, 0b11110110, 0b11011111, 0b01011100, 0b11010001, 0b11011001, 0b00101101, 0b00111111, 0b10011011, 0b00001110, 0b11000000, 0b10001111, 0b01010101, 0b01111000, 0b11111110, 0b11111001, 0b00010111, 0b10110011, 0b00101011, 0b00011101, 0b11100000, 0b11111111, 0b11100011, 0b00011111, 0b11001110, 0b10011100, 0b01010110, 0b01110000, 0b01001111, 0b00101110, 0b11100011, 0b01101111, 0b11111100, 0b00111001, 0b00001101, 0b10010100, 0b11111011, 0b11111111, 0b01011000, 0b00111011, 0b11111111, 0b01000111, 0b00100010, 0b10110110, 0b01111111, 0b01010000, 0b11011110, 0b11101011, 0b10000001, 0b01110000, 0b11011111, 0b00111111, 0b11000000, 0b11011001, 0b11100110, 0b00100110, 0b00001010, 0b11110001, 0b11111110, 0b00000111, 0b11001110, 0b11010011, 0b11001111, 0b01111101, 0b00011000, 0b11101001, 0b10011011, 0b11101101, 0b01010110, 0b11100001, 0b00010111, 0b01011101, 0b11111101, 0b11001111, 0b00011110], # Node 424
-[0b00110101, 0b00011011, 0b11100111, 0b01000010, 0b01001111, 0b11001110, 0b10001111, 0b11000101, 0b01111101, 0b11111101, 0b11100110, 0b10000011, 0b01010110, 0b01010011, 0b11110110, 0b00001100, 0b00010100, 0b10101010, 0b11011111, 0b01101110, 0b10101111, 0b11011011, 0b10000100, 0b01011000, 0b10100101, 0b01111010, 0b11010011, 0b01011011, 0b11010011, 0b01001100, 0b01011101, 0b01111000, 0b01011011, 0b00010001, 0b00101000, 0b00010011, 0b01100001, 0b10110011, 0b11111100, 0b11101101, 0b00110001, 0b11101101, 0b00110111, 0b11011001, 0b11111111, 0b11101111, 0b11100100, 0b01011100, 0b10010001, 0b10101000, 0b01000000, 0b10100001, 0b11110010, 0b11001110, 0b01010100, 0b01101000, 0b10110010, 0b00110111, 0b10001000, 0b11101011, 0b11000011, 0b01010001, 0b11110000, 0b01110101, 0b11110101, 0b10100000, 0b11101100, 0b10000001, 0b11001110, 0b10101010, 0b00111000, 0b01011100, 0b00011110, 0b01110011, 0b00111100, 0b11010001, 0b10101110, 0b11001110, 0b01111001, 0b10000100, 0b11001001, 0b11111101, 0b10001110, 0b11100111, 0b01101101, 0b00111010, 0b11101110, 0b11111010, 0b10111011, 0b11011011, 0b11111110, 0b11111010, 0b11100101, 0b10001011, 0b11001000, 0b10111011, 0b11111110, 0b01111110], # Node 425
-[0b00000000, 0b11110010, 0b00010100, 0b10101111, 0b10010001, 0b01010001, 0b00000000, 0b10000100, 0b10000100, 0b00000001, 0b00111000, 0b00100000, 0b10100001, 0b10000011, 0b10111001, 0b00001101, 0b01101001, 0b00000001, 0b00000000, 0b00111100, 0b01111010, 0b01011100, 0b11110000, 0b10100100, 0b00010000, 0b00000101, 0b00000011, 0b00111111, 0b00111001, 0b00011000, 0b11011110, 0b00010101, 0b00000000, 0b11001011, 0b11111111, 0b00001111, 0b11110000, 0b11011111, 0b11000110, 0b10010000, 0b00111111, 0b01011101, 0b00000000, 0b11111110, 0b00000001, 0b11110001, 0b11110000, 0b00100111, 0b00001010, 0b01010111, 0b00111110, 0b00011010, 0b00000000, 0b11000010, 0b11001000, 0b00110011, 0b01101000, 0b00000000, 0b11111110, 0b00111000, 0b00001011, 0b11110000, 0b00100111, 0b11111111, 0b10000010, 0b11111111, 0b01001100, 0b11111110, 0b11111101, 0b00000000, 0b11100000, 0b11111111, 0b00001011, 0b10000110, 0b11111101, 0b00001111, 0b10000000, 0b10011101, 0b11110010, 0b10000001, 0b00010001, 0b00000000, 0b00011010, 0b00111010, 0b00000010, 0b00000000, 0b01000000, 0b00100010, 0b00001011, 0b10000100, 0b00000011, 0b10100111, 0b00000101, 0b10110001, 0b01000110, 0b01001100, 0b01100001, 0b00001101], # Node 426
-[0b01110101, 0b01100000, 0b00100010, 0b00110110, 0b00001110, 0b01000001, 0b01011010, 0b11100000, 0b00110111, 0b11010110, 0b00000000, 0b10010011, 0b10001001, 0b01011100, 0b10110110, 0b01110000, 0b10110000, 0b10111100, 0b00110010, 0b11110010, 0b11010001, 0b11000011, 0b10110000, 0b01011100, 0b01010001, 0b11000111, 0b10010111, 0b00001010, 0b01000100, 0b01111100, 0b01000100, 0b00010000, 0b00010001, 0b01001111, 0b11000010, 0b01110100, 0b00100011, 0b01011000, 0b00110000, 0b10101111, 0b11010011, 0b00101111, 0b00011100, 0b11010000, 0b11101010, 0b00111001, 0b01011010, 0b01010001, 0b00110100, 0b00100111, 0b11101110, 0b11011101, 0b01110111, 0b10000100, 0b00000111, 0b01010101, 0b11101010, 0b00110110, 0b00011110, 0b10100101, 0b10111101, 0b11111010, 0b00101010, 0b01010001, 0b00110000, 0b00000001, 0b00011100, 0b10110010, 0b10011010, 0b01000001, 0b01110101, 0b10011111, 0b10000101, 0b11110000, 0b00000110, 0b00101111, 0b00000011, 0b10011000, 0b11111111, 0b00100001, 0b00100101, 0b01101010, 0b01000010, 0b00000010, 0b10101001, 0b00110001, 0b00001001, 0b00001101, 0b10010110, 0b11100011, 0b10110101, 0b00011010, 0b01101001, 0b10010100, 0b01100000, 0b10011000, 0b00000000, 0b11101000], # Node 427
-[0b11101101, 0b10111011, 0b10111110, 0b00011110, 0b10110111, 0b10111011, 0b11100001, 0b00110010, 0b00001101, 0b11100010, 0b10101101, 0b01100110, 0b10011110, 0b01010001, 0b10000101, 0b00011111, 0b01001001, 0b00010110, 0b11110100, 0b01101011, 0b00111100, 0b11000011, 0b10011101, 0b11101101, 0b11010011, 0b01001101, 0b10000111, 0b10111001, 0b11001001, 0b00011100, 0b11010110, 0b00111100, 0b01100100, 0b10111101, 0b01110010, 0b11111101, 0b10111011, 0b11011000, 0b11111101, 0b00100011, 0b11000011, 0b01011110, 0b10111100, 0b10110011, 0b11001000, 0b11101011, 0b10011000, 0b10011010, 0b01111100, 0b10101001, 0b11010101, 0b10011111, 0b00001110, 0b00010001, 0b00000111, 0b10101000, 0b11110011, 0b01011110, 0b01110001, 0b01011110, 0b11101100, 0b01011010, 0b01010111, 0b11001010, 0b10100011, 0b11001101, 0b01101001, 0b11010100, 0b01011000, 0b00011100, 0b01101111, 0b10011011, 0b01110010, 0b11011001, 0b11000111, 0b01110001, 0b00110001, 0b01011101, 0b11001110, 0b11111011, 0b00010100, 0b00110110, 0b10110110, 0b11001000, 0b10001011, 0b00101001, 0b11110101, 0b00000011, 0b01010101, 0b01000100, 0b11101010, 0b11111101, 0b10111000, 0b01100011, 0b00110101, 0b10011100, 0b00011001, 0b11110011], # Node 428
-[0b11101111, 0b11110111, 0b01000000, 0b11111000, 0b01011010, 0b11100001, 0b11010110, 0b01100110, 0b11110111, 0b00110010, 0b01101101, 0b11001111, 0b10101010, 0b01110011, 0b11111110, 0b10110111, 0b10010001, 0b11110000, 0b00110011, 0b00110100, 0b00110010, 0b00011111, 0b10000000, 0b11000000, 0b10110111, 0b00101111, 0b11000011, 0b11110111, 0b00100111, 0b10000000, 0b00110001, 0b11100010, 0b11110100, 0b11010010, 0b10010110, 0b00000011, 0b01101100, 0b01001100, 0b01100100, 0b11000011, 0b00000110, 0b01101111, 0b11010110, 0b01000001, 0b01011110, 0b01111110, 0b10011010, 0b00011011, 0b11111111, 0b10001101, 0b10001111, 0b11100011, 0b01111011, 0b11101101, 0b10000101, 0b01010110, 0b01101000, 0b10001001, 0b11011111, 0b00000101, 0b01011001, 0b01111110, 0b11000110, 0b01001110, 0b01101001, 0b11111111, 0b00010001, 0b01011001, 0b00001010, 0b01101001, 0b00011110, 0b10011011, 0b01001010, 0b01110100, 0b00101010, 0b11111100, 0b00101111, 0b11111100, 0b10000011, 0b00011100, 0b10111111, 0b01111000, 0b11010110, 0b10111111, 0b10110010, 0b01011011, 0b10111101, 0b10100101, 0b00111111, 0b00000001, 0b10000101, 0b10101111, 0b11111111, 0b10100111, 0b00010010, 0b11111111, 0b11011011, 0b11001001], # Node 429
-[0b11001101, 0b00001100, 0b11011101, 0b11101011, 0b11001001, 0b11011110, 0b10111100, 0b10011000, 0b01010011, 0b01100100, 0b10000100, 0b11110100, 0b11111011, 0b10010000, 0b10110010, 0b10111100, 0b11111001, 0b10010000, 0b11111111, 0b11001011, 0b10110001, 0b11011111, 0b11011000, 0b01110001, 0b11010111, 0b10011001, 0b10011000, 0b10101010, 0b00100111, 0b01110000, 0b11011101, 0b11111010, 0b01010111, 0b01001111, 0b11110110, 0b11101111, 0b10111110, 0b01011001, 0b11011111, 0b11111101, 0b00101011, 0b11101110, 0b10111111, 0b10100000, 0b00000110, 0b01100011, 0b01110110, 0b10101010, 0b11010100, 0b01100001, 0b01101000, 0b00101110, 0b10001110, 0b11001100, 0b10010100, 0b10111111, 0b01110010, 0b10110101, 0b10111110, 0b01111000, 0b10001101, 0b11010100, 0b01111111, 0b01101011, 0b00111001, 0b10100010, 0b10011100, 0b01101001, 0b10101001, 0b10111101, 0b01110101, 0b00001000, 0b11100111, 0b11110011, 0b01111001, 0b10111101, 0b10101010, 0b01101011, 0b00110000, 0b01110000, 0b01010000, 0b00010111, 0b00100101, 0b11000110, 0b00010101, 0b11110010, 0b11010011, 0b11111101, 0b10010100, 0b11010101, 0b00000101, 0b10011001, 0b11101110, 0b01011101, 0b00111000, 0b01010100, 0b00011011, 0b01111010], # Node 430
-[0b01101101, 0b00101111, 0b01100111, 0b10111010, 0b10101001, 0b01111101, 0b10010010, 0b10101110, 0b11111101, 0b00110100, 0b00000011, 0b01011110, 0b00010011, 0b10101111, 0b00001111, 0b10110101, 0b01001101, 0b11101001, 0b10000001, 0b10111100, 0b01111000, 0b11011111, 0b00001000, 0b01000010, 0b10110111, 0b11111011, 0b00001111, 0b11000100, 0b10011110, 0b00000011, 0b00100010, 0b11001010, 0b00000001, 0b01111111, 0b11101111, 0b11110100, 0b10001001, 0b11100001, 0b11011111, 0b01111011, 0b00110010, 0b11010011, 0b10111111, 0b11000111, 0b10110000, 0b11011000, 0b00111101, 0b11010111, 0b00100010, 0b10110111, 0b00000111, 0b10001111, 0b01110011, 0b10100000, 0b10100101, 0b10101001, 0b01110011, 0b01110000, 0b11001011, 0b11111111, 0b11110011, 0b01010101, 0b11111111, 0b01100110, 0b10100001, 0b01111000, 0b10000100, 0b11100111, 0b00000110, 0b01000111, 0b01000101, 0b11001100, 0b00011010, 0b01000011, 0b01100110, 0b11000110, 0b00100011, 0b11111111, 0b00101011, 0b11111001, 0b11100111, 0b00001001, 0b10001110, 0b11111100, 0b01110001, 0b00101011, 0b10111100, 0b00011011, 0b10101100, 0b11101100, 0b11001100, 0b11101111, 0b01111100, 0b00001011, 0b01000100, 0b10011000, 0b11110110, 0b01111101], # Node 431
-[0b10110011, 0b00100010, 0b01001000, 0b01111010, 0b11001000, 0b11110000, 0b01010001, 0b00010111, 0b01110001, 0b00101111, 0b00001000, 0b10110001, 0b00110000, 0b00111011, 0b10010000, 0b01010001, 0b00001001, 0b00101001, 0b00000100, 0b10000000, 0b00000000, 0b01110110, 0b01100000, 0b00111000, 0b10000101, 0b00001100, 0b01101111, 0b00100111, 0b00001001, 0b11001000, 0b00011110, 0b11010011, 0b11011110, 0b01111101, 0b11101000, 0b10011100, 0b11001000, 0b11001001, 0b01001110, 0b01010100, 0b00110001, 0b00011000, 0b11101100, 0b10111001, 0b00001000, 0b10010000, 0b10001110, 0b00100001, 0b00011011, 0b11010001, 0b00011101, 0b00010011, 0b00100100, 0b10101111, 0b00111000, 0b10111011, 0b00011110, 0b00111000, 0b00110011, 0b10110010, 0b00101100, 0b00000010, 0b10101011, 0b01110000, 0b10000110, 0b01101001, 0b00010000, 0b10110011, 0b00100101, 0b00010001, 0b10001100, 0b10010000, 0b00010001, 0b10001001, 0b00100101, 0b10100001, 0b01000000, 0b00011001, 0b01001010, 0b01000001, 0b01001111, 0b00001111, 0b00000111, 0b10000110, 0b01000011, 0b01110011, 0b10100110, 0b00010000, 0b11000001, 0b00100010, 0b10010100, 0b01000111, 0b10100000, 0b01100011, 0b00001110, 0b01000111, 0b10100001, 0b00000000], # Node 432
-[0b10100110, 0b10001011, 0b00010110, 0b10001000, 0b01011111, 0b10101111, 0b11011011, 0b10110001, 0b01111100, 0b11110100, 0b01111101, 0b11100100, 0b11001000, 0b10001101, 0b00111101, 0b00111111, 0b10000101, 0b10000010, 0b00011011, 0b11110001, 0b00101110, 0b01000100, 0b11101101, 0b00111001, 0b11111111, 0b11100110, 0b00100001, 0b00111101, 0b00111010, 0b01111100, 0b11011001, 0b00010101, 0b01101100, 0b01100011, 0b10011011, 0b01111101, 0b01110011, 0b01011100, 0b10111100, 0b01110010, 0b10110111, 0b01000011, 0b11011001, 0b01100100, 0b01101101, 0b00111101, 0b10111101, 0b01010111, 0b11010110, 0b01111001, 0b11111101, 0b11010010, 0b11001111, 0b01101111, 0b00100101, 0b11111100, 0b11111110, 0b11110111, 0b10111101, 0b01011101, 0b11000001, 0b00011011, 0b11110000, 0b00000011, 0b10010001, 0b11010101, 0b11011100, 0b11011000, 0b00011010, 0b01000001, 0b01011001, 0b00111011, 0b00010111, 0b00110010, 0b10110110, 0b11001011, 0b01111111, 0b11000101, 0b11010110, 0b00110010, 0b00000110, 0b00111110, 0b10001010, 0b11111110, 0b01101110, 0b00111101, 0b11101011, 0b11011110, 0b10000000, 0b11001101, 0b11010010, 0b10001000, 0b10001100, 0b11111110, 0b11101010, 0b10110111, 0b01111011, 0b11001100], # Node 433
-[0b11011010, 0b11111010, 0b11101111, 0b00010100, 0b10111100, 0b10101111, 0b11100101, 0b10010000, 0b10010110, 0b11111101, 0b11010010, 0b01001100, 0b10101110, 0b10100010, 0b01011001, 0b11110001, 0b10000101, 0b11011101, 0b01011000, 0b10011100, 0b10011010, 0b01001011, 0b10001101, 0b01110010, 0b01110110, 0b11000100, 0b10011010, 0b01101000, 0b00011011, 0b00000110, 0b01011011, 0b11011000, 0b10111110, 0b11001011, 0b00110010, 0b01001101, 0b11100101, 0b10011110, 0b01011110, 0b11011011, 0b10001011, 0b01100110, 0b01011100, 0b00011100, 0b11010011, 0b00100110, 0b01000111, 0b11010101, 0b01001110, 0b01001110, 0b01010001, 0b00101011, 0b11011101, 0b01011001, 0b01011111, 0b01100100, 0b00001111, 0b10110011, 0b00101110, 0b01001001, 0b10011010, 0b10101001, 0b00100011, 0b10000100, 0b10100100, 0b01110010, 0b10110000, 0b11110100, 0b11011001, 0b01011100, 0b00000011, 0b10011111, 0b01111100, 0b11000010, 0b10111101, 0b01101111, 0b01010101, 0b01001111, 0b00100011, 0b10010111, 0b11111011, 0b11101110, 0b10000100, 0b00000110, 0b11010110, 0b11010100, 0b11011110, 0b11110010, 0b11101111, 0b01001100, 0b11110100, 0b11111111, 0b11111100, 0b01111011, 0b11011011, 0b01110011, 0b10111101, 0b10011001], # Node 434
-[0b11100011, 0b11000101, 0b11111111, 0b01111101, 0b10010111, 0b10110111, 0b10100001, 0b10001101, 0b11010111, 0b01011111, 0b10100101, 0b01010001, 0b11101000, 0b10100110, 0b10000011, 0b10111100, 0b11111111, 0b01000110, 0b01111111, 0b11111011, 0b11111011, 0b11110101, 0b00101010, 0b10000110, 0b10111011, 0b11101010, 0b00001110, 0b11101111, 0b00000011, 0b11111011, 0b11000101, 0b11011101, 0b10100000, 0b01101111, 0b00101001, 0b01000101, 0b00111110, 0b11001011, 0b01100101, 0b11011010, 0b11101111, 0b10101101, 0b11111100, 0b10010000, 0b11001111, 0b11110110, 0b01100110, 0b00011000, 0b11011000, 0b10101011, 0b10111010, 0b00001111, 0b00111111, 0b01010110, 0b00010110, 0b11010011, 0b11000100, 0b00011101, 0b11000011, 0b10010110, 0b10011011, 0b10100111, 0b00110000, 0b01111100, 0b00101011, 0b11110101, 0b00010010, 0b11001100, 0b10011001, 0b00011000, 0b00000100, 0b01001111, 0b00011100, 0b01111011, 0b11100111, 0b00011100, 0b10010111, 0b11111111, 0b11111011, 0b11101100, 0b10100100, 0b00111110, 0b01110110, 0b11100111, 0b11010000, 0b01100111, 0b11100001, 0b10011010, 0b11011000, 0b10110111, 0b11100011, 0b10111101, 0b11010111, 0b10010010, 0b00010100, 0b10110100, 0b11100010, 0b10000000], # Node 435
-[0b10110101, 0b10111110, 0b10001011, 0b10110001, 0b01010111, 0b11001100, 0b00110110, 0b11100111, 0b11000101, 0b10111011, 0b01001110, 0b01111001, 0b01100001, 0b10100110, 0b01010011, 0b10001101, 0b10010001, 0b10110110, 0b00111111, 0b01011000, 0b11100011, 0b10000111, 0b00110000, 0b00101000, 0b01111111, 0b01011001, 0b01110000, 0b11110011, 0b00110111, 0b11110010, 0b00001110, 0b10101011, 0b11100111, 0b11000011, 0b10111110, 0b01101110, 0b01001011, 0b10001100, 0b01101101, 0b00011001, 0b10010001, 0b11001010, 0b11111011, 0b00101010, 0b10011010, 0b01010111, 0b10101111, 0b11100010, 0b01101011, 0b01101011, 0b11000101, 0b11110000, 0b11111111, 0b10001011, 0b01010101, 0b00011011, 0b10110011, 0b10001100, 0b10011010, 0b11111110, 0b01011011, 0b01010111, 0b11000011, 0b00110100, 0b10110111, 0b10000101, 0b01111011, 0b01111000, 0b10011000, 0b01111101, 0b11010101, 0b01100111, 0b00100101, 0b00110110, 0b00110100, 0b01001111, 0b11111100, 0b10011101, 0b00111010, 0b01001111, 0b10101111, 0b01000110, 0b11110110, 0b11001010, 0b10011011, 0b01100111, 0b01000101, 0b10110100, 0b10100001, 0b01000000, 0b10000001, 0b01111101, 0b11110100, 0b01111111, 0b01000001, 0b01101101, 0b01011111, 0b11001100], # Node 436
-[0b10001101, 0b01000000, 0b01010111, 0b11010100, 0b00000110, 0b10110101, 0b10101011, 0b00101100, 0b10111110, 0b01011011, 0b00000100, 0b10010001, 0b01100111, 0b10010000, 0b10011100, 0b00100010, 0b00010011, 0b00101000, 0b11010100, 0b11010010, 0b11010100, 0b00001101, 0b01011110, 0b00100110, 0b10100000, 0b00001000, 0b10100110, 0b10101110, 0b10100010, 0b01011110, 0b00011001, 0b01011001, 0b11110111, 0b10101011, 0b10110110, 0b11011001, 0b01100100, 0b10110001, 0b00110011, 0b10101010, 0b10000001, 0b01001100, 0b01000001, 0b10111100, 0b01011011, 0b01100000, 0b10001100, 0b01011001, 0b01001100, 0b01110000, 0b01110010, 0b00101110, 0b00100000, 0b10100101, 0b00111101, 0b01011100, 0b11100101, 0b00101101, 0b00010000, 0b10101110, 0b00011101, 0b01010001, 0b10101001, 0b00000001, 0b11010011, 0b01000010, 0b00000000, 0b10000001, 0b10101000, 0b00010111, 0b11000000, 0b00111100, 0b00010111, 0b01100101, 0b00100000, 0b01111110, 0b00100110, 0b10001000, 0b01001011, 0b11001001, 0b10000001, 0b00001000, 0b00000101, 0b11010000, 0b01000110, 0b11101100, 0b11001010, 0b11110111, 0b11010010, 0b01001011, 0b01101100, 0b00110111, 0b10001000, 0b00000101, 0b10001101, 0b11011100, 0b00010110, 0b01000001], # Node 437
-[0b00010010, 0b00100111, 0b11111111, 0b01111111, 0b11011110, 0b10110100, 0b00011010, 0b10011100, 0b01101010, 0b01110011, 0b11110110, 0b01101111, 0b11000111, 0b01101010, 0b10111110, 0b10111110, 0b11110100, 0b00100001, 0b11111101, 0b00000011, 0b01110111, 0b00110010, 0b00010111, 0b10010100, 0b01011100, 0b00001010, 0b10000000, 0b11110011, 0b11000101, 0b00000011, 0b11011000, 0b10111111, 0b00010110, 0b10000100, 0b10011101, 0b00001111, 0b00111100, 0b01001110, 0b11010111, 0b11001110, 0b11100000, 0b00000001, 0b01000001, 0b00010100, 0b10000000, 0b00110111, 0b01111101, 0b10000001, 0b01101110, 0b11110011, 0b00011111, 0b01011010, 0b01011100, 0b11111111, 0b01100111, 0b11100111, 0b11110111, 0b11111111, 0b11111111, 0b11000110, 0b11111110, 0b11111111, 0b10001101, 0b11101111, 0b11110110, 0b11111011, 0b11101110, 0b00101111, 0b00111101, 0b11100011, 0b11011011, 0b00000111, 0b11110101, 0b11001111, 0b10010000, 0b00100011, 0b11101100, 0b10111111, 0b10001100, 0b00011001, 0b11100111, 0b01011011, 0b10110000, 0b01011110, 0b11111111, 0b01001110, 0b11010101, 0b01100001, 0b00101101, 0b01100110, 0b10111011, 0b11000111, 0b10000111, 0b01011100, 0b11001011, 0b01000010, 0b01110111, 0b10010110], # Node 438
-[0b11111100, 0b10110001, 0b11010111, 0b10001111, 0b11111011, 0b10000111, 0b10011111, 0b11101011, 0b11010001, 0b10111101, 0b01000011, 0b11101101, 0b01101000, 0b11011001, 0b00011101, 0b11110001, 0b01100111, 0b11100011, 0b10111010, 0b10110101, 0b10100101, 0b00111101, 0b01011100, 0b11010010, 0b01111101, 0b11111101, 0b01000010, 0b11100000, 0b10101000, 0b00001111, 0b01110100, 0b11111011, 0b10101111, 0b01001111, 0b01100011, 0b00000011, 0b11111011, 0b10111001, 0b10011111, 0b00001000, 0b11101100, 0b10100001, 0b11101111, 0b10110001, 0b00111100, 0b11110110, 0b00010010, 0b11101001, 0b10001111, 0b00111111, 0b01000001, 0b01001001, 0b10110010, 0b11100101, 0b01110100, 0b11101111, 0b10011110, 0b00010010, 0b11011111, 0b11001011, 0b10110101, 0b01011010, 0b10000011, 0b11001111, 0b00111101, 0b10111110, 0b10101101, 0b01100111, 0b10100100, 0b01011010, 0b00111001, 0b10111110, 0b01110110, 0b01010001, 0b01001110, 0b01100001, 0b11001110, 0b01011110, 0b10001011, 0b11011010, 0b11000010, 0b11111110, 0b11011011, 0b00111000, 0b11101010, 0b01011111, 0b11111111, 0b11000111, 0b11001111, 0b01101100, 0b10001001, 0b11010111, 0b11110111, 0b10111101, 0b01111000, 0b10111100, 0b10110010, 0b01111101], # Node 439
-[0b00001010, 0b00100000, 0b10010001, 0b00011100, 0b01101001, 0b01111000, 0b01001001, 0b01011100, 0b11000010, 0b00001000, 0b00001010, 0b01101010, 0b00000111, 0b01001100, 0b01001000, 0b10000100, 0b10001111, 0b10110010, 0b11100100, 0b11000011, 0b00000101, 0b10011010, 0b00000101, 0b11111100, 0b01101011, 0b10011110, 0b11111000, 0b00001111, 0b00101011, 0b10000010, 0b01101110, 0b01001101, 0b11111010, 0b00101000, 0b00110001, 0b00001001, 0b00011111, 0b01000001, 0b00001000, 0b11110111, 0b00000000, 0b01001100, 0b11010101, 0b00001111, 0b10000001, 0b00011110, 0b11111110, 0b00101011, 0b10000100, 0b01100100, 0b11111111, 0b00000001, 0b10001010, 0b10100010, 0b01101111, 0b01010000, 0b01100011, 0b10101110, 0b01100011, 0b11000100, 0b00100010, 0b00111000, 0b00110110, 0b01110000, 0b01100010, 0b00000001, 0b10010000, 0b00101111, 0b11010000, 0b10001010, 0b00001101, 0b00000001, 0b10110101, 0b00101000, 0b00111001, 0b11010000, 0b00001111, 0b10001111, 0b10100000, 0b01111111, 0b00000001, 0b10000101, 0b01100001, 0b00100001, 0b01000000, 0b10100010, 0b11000010, 0b00110110, 0b01101000, 0b01011000, 0b10000110, 0b11010111, 0b00011100, 0b00000000, 0b10100000, 0b10000010, 0b00100101, 0b00000100], # Node 440
-[0b11110010, 0b10000001, 0b00000000, 0b01000000, 0b11000000, 0b00010101, 0b10000010, 0b10011101, 0b10010000, 0b00001011, 0b10111110, 0b10100001, 0b10111000, 0b10110000, 0b00100011, 0b01001010, 0b00111010, 0b11110010, 0b01011001, 0b10111101, 0b01110000, 0b00100101, 0b01000110, 0b00110110, 0b11110010, 0b11100001, 0b00001111, 0b00110011, 0b11100001, 0b10000110, 0b01010010, 0b01111011, 0b10011000, 0b11111010, 0b01101010, 0b01001111, 0b11110110, 0b01100000, 0b11111000, 0b11111000, 0b10101011, 0b11011010, 0b10010010, 0b00100101, 0b00010010, 0b00000001, 0b11011111, 0b10001101, 0b10111111, 0b00100100, 0b01111001, 0b00100101, 0b01101000, 0b01001000, 0b11010101, 0b10111001, 0b01110111, 0b11111010, 0b00110001, 0b01001010, 0b00101100, 0b11110101, 0b11000011, 0b10000010, 0b00111010, 0b10000111, 0b00001101, 0b11001110, 0b00100110, 0b00010000, 0b10011001, 0b01110101, 0b11001010, 0b01001110, 0b01100111, 0b10010110, 0b10000101, 0b11010000, 0b11101110, 0b11010001, 0b10110000, 0b01001110, 0b00100011, 0b10101010, 0b11000000, 0b00000001, 0b10100000, 0b00001001, 0b10101010, 0b10111001, 0b01100100, 0b10010010, 0b11101010, 0b11011001, 0b11110000, 0b00100001, 0b11110100, 0b11111000], # Node 441
-[0b10110110, 0b11000001, 0b00010001, 0b01001010, 0b11010001, 0b01010000, 0b00010010, 0b01011000, 0b00100100, 0b11010000, 0b01000010, 0b11000000, 0b00110000, 0b00001000, 0b10000001, 0b00001000, 0b11100001, 0b01010111, 0b11100111, 0b10000000, 0b01101101, 0b01010000, 0b00001101, 0b11100000, 0b01000010, 0b01110110, 0b10000000, 0b00111001, 0b10000101, 0b00000011, 0b00010100, 0b00101001, 0b00111100, 0b00111100, 0b00100000, 0b10110111, 0b11111101, 0b00000011, 0b11000010, 0b10111101, 0b00001111, 0b10010000, 0b11010011, 0b00111101, 0b00000000, 0b00000100, 0b11111101, 0b00000000, 0b10001010, 0b11010000, 0b00000010, 0b11110000, 0b00010001, 0b00000111, 0b10000000, 0b00000111, 0b01000000, 0b00000001, 0b11111100, 0b00001000, 0b00000000, 0b11000000, 0b10000101, 0b00000010, 0b01110000, 0b00100110, 0b01111011, 0b11000000, 0b00111111, 0b10000000, 0b00001101, 0b11111000, 0b10000011, 0b00111000, 0b10000000, 0b01111111, 0b01000000, 0b00000100, 0b10000000, 0b00000011, 0b00001001, 0b00000000, 0b01111000, 0b11100000, 0b00111000, 0b10000000, 0b00000000, 0b11101100, 0b00011010, 0b00000000, 0b10011000, 0b11110011, 0b00000001, 0b00000000, 0b10110100, 0b01100001, 0b11000110, 0b01100100], # Node 442
-[0b10010100, 0b11000001, 0b10110101, 0b11111011, 0b00100010, 0b00101011, 0b00000001, 0b01010010, 0b01111111, 0b01010000, 0b00101101, 0b00100001, 0b00110001, 0b00000110, 0b11001000, 0b10101111, 0b00010111, 0b00100111, 0b10100010, 0b00100111, 0b00100011, 0b00000010, 0b11000111, 0b00010011, 0b10010000, 0b00000000, 0b10111010, 0b01111110, 0b01100110, 0b01000110, 0b10001001, 0b00101100, 0b00010100, 0b00001100, 0b11011000, 0b00000101, 0b11010001, 0b11000001, 0b00110100, 0b00000101, 0b10001110, 0b11001110, 0b01100001, 0b01111000, 0b11000001, 0b10001000, 0b10000000, 0b10010110, 0b01110111, 0b10000010, 0b00111000, 0b11011011, 0b00011000, 0b00011000, 0b00100101, 0b01010110, 0b11100111, 0b10110000, 0b01111011, 0b11110101, 0b11001000, 0b11111001, 0b01110111, 0b00100000, 0b01000101, 0b01111001, 0b01000100, 0b11011101, 0b11011011, 0b01001011, 0b11010000, 0b01111101, 0b00110111, 0b01111001, 0b11000100, 0b01111111, 0b10000110, 0b11001110, 0b10000001, 0b00010010, 0b00000000, 0b10100011, 0b01000000, 0b10100010, 0b00110010, 0b00000000, 0b01000001, 0b11100110, 0b00001001, 0b01100000, 0b10101100, 0b00000000, 0b00011100, 0b11101011, 0b10100111, 0b11110100, 0b00011000, 0b01001001], # Node 443
-[0b11101111, 0b11110101, 0b10101110, 0b01101111, 0b11001101, 0b10110110, 0b11110100, 0b00101010, 0b11001100, 0b11011011, 0b01110110, 0b11101101, 0b10100111, 0b01100011, 0b10101010, 0b10111110, 0b10011101, 0b00001011, 0b01111100, 0b11010101, 0b01011001, 0b01011011, 0b11100000, 0b11011010, 0b01101011, 0b01010110, 0b01001100, 0b11100001, 0b00011111, 0b10001101, 0b10001000, 0b01110100, 0b00111010, 0b00000000, 0b10110111, 0b01000111, 0b11111111, 0b11110001, 0b11110111, 0b00010010, 0b11110010, 0b10111110, 0b11100110, 0b11111100, 0b11001100, 0b01110101, 0b01011100, 0b11101000, 0b00101101, 0b10110101, 0b00001000, 0b11110011, 0b11100011, 0b10110010, 0b01000100, 0b11011110, 0b10101110, 0b01111010, 0b01000011, 0b11101111, 0b01101000, 0b00010111, 0b01001011, 0b01100101, 0b10011110, 0b11101011, 0b11010011, 0b11100110, 0b00111001, 0b01111000, 0b10110110, 0b01001010, 0b01000001, 0b00111111, 0b01110111, 0b11110011, 0b11111101, 0b11111111, 0b10011111, 0b11110110, 0b00010111, 0b01000111, 0b00100110, 0b01000111, 0b10101011, 0b01010111, 0b10001101, 0b11111110, 0b01000101, 0b11110111, 0b01110100, 0b01100111, 0b01111101, 0b11101110, 0b01010110, 0b11001001, 0b01101010, 0b11111100], # Node 444
-[0b01010100, 0b11101010, 0b00000100, 0b00100010, 0b00110011, 0b00000000, 0b10101001, 0b01011100, 0b10001111, 0b10001100, 0b10101000, 0b01000111, 0b10010001, 0b10001010, 0b10110010, 0b01010010, 0b00100000, 0b11110100, 0b00010000, 0b10000000, 0b00100010, 0b01010111, 0b00010010, 0b00110000, 0b10100010, 0b11011001, 0b00111000, 0b00101000, 0b01101011, 0b01101111, 0b00110110, 0b00000100, 0b11111000, 0b10000110, 0b10001101, 0b10110101, 0b01000111, 0b10000111, 0b01011110, 0b01111100, 0b00101000, 0b10101111, 0b01100010, 0b00000000, 0b01111000, 0b00110000, 0b01010010, 0b11100000, 0b00100100, 0b00111010, 0b01100010, 0b11110110, 0b10001000, 0b11110001, 0b00001111, 0b11100110, 0b11100000, 0b00101111, 0b10010000, 0b00011000, 0b00011000, 0b00111010, 0b00010111, 0b00100010, 0b00011110, 0b11100010, 0b01111001, 0b01101000, 0b00001100, 0b00111101, 0b00110000, 0b10100101, 0b00010000, 0b11100000, 0b00110000, 0b00000000, 0b10100111, 0b01001001, 0b00000000, 0b01101100, 0b10010101, 0b01000010, 0b00001001, 0b01001111, 0b00000000, 0b00100001, 0b10100100, 0b00111000, 0b00000000, 0b00110110, 0b00000000, 0b10111011, 0b01000001, 0b00010110, 0b10110000, 0b00111101, 0b10100101, 0b00000111], # Node 445
-[0b00010011, 0b11101110, 0b00010011, 0b10001010, 0b01101000, 0b00110000, 0b00010001, 0b11111011, 0b11111111, 0b11111111, 0b01010101, 0b11111000, 0b11111010, 0b11011111, 0b11000011, 0b11111111, 0b01111111, 0b00010101, 0b11111101, 0b11111111, 0b01111111, 0b11100000, 0b00011111, 0b11100000, 0b01001111, 0b01111111, 0b00000000, 0b11111100, 0b11110100, 0b00000011, 0b01000000, 0b00010000, 0b01011111, 0b00000000, 0b10000110, 0b01110010, 0b00000000, 0b00001000, 0b00010000, 0b11100010, 0b10100001, 0b10000000, 0b00000000, 0b00011101, 0b10101011, 0b00010111, 0b11100000, 0b11110011, 0b11111001, 0b10001000, 0b11111111, 0b11111111, 0b10010111, 0b11111100, 0b10111111, 0b01111111, 0b10111010, 0b11111100, 0b11111011, 0b01111111, 0b10110000, 0b11111111, 0b11111111, 0b00100010, 0b01111110, 0b11111011, 0b01001111, 0b11100001, 0b00001001, 0b11111111, 0b00011101, 0b00111100, 0b11111101, 0b10011101, 0b11000000, 0b11111111, 0b10011111, 0b00011001, 0b11110001, 0b11111111, 0b01000011, 0b00000000, 0b10111000, 0b11111111, 0b00000100, 0b00000000, 0b00000000, 0b10001010, 0b00000000, 0b00000000, 0b10100000, 0b00000000, 0b00000000, 0b00000000, 0b01110111, 0b00000100, 0b00100000, 0b01011000], # Node 446
-[0b00000001, 0b00010001, 0b01001101, 0b10001000, 0b00001000, 0b00010010, 0b10110001, 0b00001110, 0b01100011, 0b00001110, 0b00000001, 0b10000010, 0b10101000, 0b10100010, 0b10010101, 0b11010111, 0b10110010, 0b11100110, 0b00101110, 0b00001010, 0b00010000, 0b00100100, 0b11010000, 0b01000011, 0b11010000, 0b10001010, 0b10011010, 0b00000001, 0b00011100, 0b11110111, 0b00001101, 0b11110000, 0b01000101, 0b11010110, 0b01100111, 0b10100111, 0b00101111, 0b01011110, 0b00000001, 0b01011110, 0b11111110, 0b00000001, 0b00111001, 0b00011001, 0b10000111, 0b10100011, 0b01010000, 0b10101011, 0b10000000, 0b00000001, 0b01111100, 0b01001001, 0b00100111, 0b01000100, 0b00000100, 0b11010010, 0b00010101, 0b01000100, 0b00011001, 0b00001101, 0b10001010, 0b10101100, 0b00011010, 0b10000000, 0b10111101, 0b01110010, 0b10000010, 0b00101010, 0b01000001, 0b00100000, 0b01101110, 0b00000000, 0b01000111, 0b00000111, 0b00010001, 0b00111111, 0b00010010, 0b01001010, 0b10011110, 0b10101100, 0b10110011, 0b00001101, 0b01010011, 0b01011000, 0b01100001, 0b00101000, 0b01010001, 0b10001000, 0b10010001, 0b01010000, 0b11001010, 0b01111000, 0b01001100, 0b10010100, 0b00101100, 0b10011000, 0b00001001, 0b01001100], # Node 447
-[0b01010010, 0b11001111, 0b11001111, 0b01110011, 0b11100111, 0b11110011, 0b11001010, 0b11111011, 0b10100010, 0b10100100, 0b10110111, 0b10101111, 0b10110001, 0b00111111, 0b10011111, 0b00100101, 0b00001110, 0b11111110, 0b00011111, 0b10000000, 0b11101010, 0b01100100, 0b00011111, 0b10100000, 0b11010100, 0b00101011, 0b10000000, 0b11000010, 0b00010010, 0b01101111, 0b10010111, 0b10001111, 0b01110111, 0b01111101, 0b10110110, 0b01011111, 0b11100111, 0b01100011, 0b10111110, 0b01111001, 0b10011100, 0b11111110, 0b11111100, 0b11100001, 0b11100100, 0b00011101, 0b00001011, 0b01100110, 0b01001110, 0b11001100, 0b11100000, 0b11100100, 0b11110110, 0b00000111, 0b00000111, 0b11111000, 0b10011110, 0b11110000, 0b10000000, 0b11111100, 0b00000000, 0b00001111, 0b11110011, 0b00101111, 0b01111000, 0b10010000, 0b00010110, 0b10000000, 0b00001111, 0b10010110, 0b00011110, 0b11010000, 0b01100000, 0b11010010, 0b01000010, 0b00111111, 0b11101110, 0b11100111, 0b10000001, 0b11111011, 0b10111010, 0b11111101, 0b01011100, 0b01111000, 0b01010001, 0b11000010, 0b01010011, 0b11111011, 0b11111110, 0b10111111, 0b01111111, 0b01001010, 0b10101110, 0b11111111, 0b11110110, 0b11100110, 0b11010011, 0b11011111], # Node 448
-[0b01001110, 0b11101111, 0b11111111, 0b00110101, 0b11001110, 0b11011101, 0b11110011, 0b10111101, 0b11010101, 0b11011110, 0b10000100, 0b10111111, 0b10111111, 0b11100011, 0b00111011, 0b01101101, 0b11100110, 0b11110110, 0b10111101, 0b11011110, 0b11101111, 0b01111101, 0b11011110, 0b01111011, 0b01011001, 0b01110010, 0b01111011, 0b11111101, 0b01101110, 0b01110111, 0b11000110, 0b10111101, 0b11001110, 0b11000001, 0b10001100, 0b10111010, 0b00101011, 0b11100100, 0b11111111, 0b11001111, 0b10101010, 0b10101111, 0b10111011, 0b01001100, 0b11000010, 0b01101001, 0b00001111, 0b01111010, 0b10011111, 0b01100111, 0b10011111, 0b00110100, 0b11001101, 0b11111010, 0b01101000, 0b11101100, 0b11111111, 0b01011111, 0b10110110, 0b11100011, 0b01010011, 0b00000010, 0b10111110, 0b01010111, 0b11011011, 0b11111100, 0b10110011, 0b10001111, 0b11101101, 0b11011110, 0b10110111, 0b00000011, 0b11001100, 0b11110110, 0b01000100, 0b01111100, 0b11010111, 0b10111011, 0b01011101, 0b01100111, 0b01001011, 0b11011010, 0b00111111, 0b00110110, 0b10110111, 0b00111010, 0b00100001, 0b10100011, 0b00111001, 0b11111100, 0b11000111, 0b10010111, 0b11111010, 0b11111010, 0b01111011, 0b10100011, 0b10000001, 0b01101100], # Node 449
-[0b10001100, 0b00010000, 0b00001001, 0b10110001, 0b01010101, 0b01010011, 0b01011100, 0b01100011, 0b00100001, 0b10010001, 0b00010000, 0b10110010, 0b01100110, 0b11001010, 0b00000110, 0b10000001, 0b01000100, 0b10000010, 0b10001000, 0b01010011, 0b00001111, 0b00110010, 0b01000001, 0b00000110, 0b01100000, 0b10100100, 0b00001001, 0b11110001, 0b11101001, 0b00001010, 0b01011101, 0b00001000, 0b10010000, 0b00100111, 0b00001000, 0b00001010, 0b01111000, 0b00111101, 0b01111010, 0b00000101, 0b01000001, 0b10010101, 0b11010011, 0b01011110, 0b11000000, 0b00110001, 0b11010110, 0b10100100, 0b10001001, 0b00001001, 0b10101011, 0b01011100, 0b10010101, 0b00001101, 0b00001000, 0b00010001, 0b10100100, 0b01101111, 0b11010001, 0b01001010, 0b10111010, 0b00010110, 0b10100010, 0b10010110, 0b00101011, 0b00100101, 0b01110110, 0b10100011, 0b00011110, 0b00101010, 0b00100100, 0b10000001, 0b00010000, 0b01000100, 0b11110010, 0b11111011, 0b00000001, 0b00010101, 0b00011101, 0b00110000, 0b00000100, 0b01111000, 0b00010100, 0b10001011, 0b11001100, 0b00001001, 0b11010011, 0b00010000, 0b10101100, 0b10010010, 0b00110110, 0b01000010, 0b00110001, 0b01011000, 0b00011000, 0b11011001, 0b01010111, 0b10101010], # Node 450
-[0b11110101, 0b01111111, 0b00111001, 0b11111110, 0b11010100, 0b11111011, 0b01110110, 0b11111111, 0b11001010, 0b10110010, 0b01100011, 0b00101101, 0b00101111, 0b10010100, 0b10011111, 0b11010001, 0b11111111, 0b10101111, 0b00000111, 0b11010000, 0b10011011, 0b00101001, 0b00000000, 0b11010110, 0b01001111, 0b00110010, 0b11000000, 0b11011101, 0b00100010, 0b00000101, 0b10001111, 0b11110100, 0b01111100, 0b11111101, 0b11111110, 0b11111001, 0b01101100, 0b11110111, 0b00111111, 0b01000111, 0b00000000, 0b10011111, 0b01011011, 0b00000100, 0b11111100, 0b10011001, 0b00000111, 0b10000000, 0b01111111, 0b01111101, 0b00000000, 0b11000000, 0b10111000, 0b00001011, 0b01001110, 0b10011000, 0b11110011, 0b11111001, 0b10000001, 0b11101110, 0b10111111, 0b00111111, 0b01010000, 0b00010111, 0b11111110, 0b10000010, 0b01011111, 0b10001001, 0b00011111, 0b10011100, 0b00000111, 0b00100010, 0b11000000, 0b01101010, 0b00101011, 0b00001000, 0b01111100, 0b11000111, 0b00000000, 0b10000001, 0b11011110, 0b10111110, 0b00000000, 0b11011100, 0b10101001, 0b10110100, 0b11101000, 0b10101000, 0b00011011, 0b01110111, 0b10111011, 0b10111111, 0b10100110, 0b01100110, 0b01110110, 0b11101101, 0b10111011, 0b11111111], # Node 451
-[0b11001001, 0b11101110, 0b01011100, 0b01011110, 0b01101110, 0b11110100, 0b11001001, 0b11110011, 0b00101111, 0b00110000, 0b11010000, 0b11111100, 0b11111111, 0b01101111, 0b11110111, 0b01011111, 0b11111111, 0b01000111, 0b11111110, 0b11111111, 0b00111111, 0b11001000, 0b11111110, 0b11111111, 0b01101111, 0b11100101, 0b11111111, 0b11100100, 0b01010100, 0b01011111, 0b00000000, 0b01001000, 0b00010111, 0b00000000, 0b00100000, 0b00110111, 0b00000000, 0b00000000, 0b00000100, 0b00000000, 0b01111000, 0b00000000, 0b00001100, 0b00000000, 0b00000111, 0b10110000, 0b00000000, 0b11100000, 0b10000000, 0b00001000, 0b00000000, 0b00011100, 0b11001100, 0b00000000, 0b10000000, 0b01000000, 0b00001001, 0b00110000, 0b00000000, 0b10011110, 0b00000001, 0b10000000, 0b11100001, 0b11111001, 0b11110000, 0b00001011, 0b10111111, 0b10111111, 0b11111111, 0b01111111, 0b11111001, 0b11111111, 0b11111111, 0b10010111, 0b11111111, 0b11111111, 0b00111111, 0b11111110, 0b00001111, 0b11111111, 0b11111111, 0b01010111, 0b11100001, 0b01111111, 0b00000110, 0b01110000, 0b11111111, 0b10110011, 0b00000000, 0b11000000, 0b00100000, 0b00111110, 0b00000000, 0b01100000, 0b00010111, 0b00001111, 0b11110011, 0b01000111], # Node 452
-[0b01000110, 0b11011000, 0b10001100, 0b11010001, 0b00000010, 0b00001010, 0b10000100, 0b00000000, 0b00100001, 0b10011000, 0b10011000, 0b01001011, 0b10001001, 0b11100001, 0b10100011, 0b00000000, 0b01100000, 0b01000001, 0b10100000, 0b11001000, 0b01110001, 0b00000011, 0b11010010, 0b00011111, 0b00000001, 0b00010000, 0b01111111, 0b00001111, 0b00001000, 0b00000000, 0b10000000, 0b01011100, 0b00000000, 0b00000000, 0b01000100, 0b10000000, 0b00011001, 0b01000000, 0b00000000, 0b11110001, 0b00100001, 0b00011000, 0b11010010, 0b10111111, 0b00000111, 0b00110001, 0b11100111, 0b00111111, 0b00000011, 0b11100011, 0b11111110, 0b01000011, 0b00000000, 0b11101010, 0b00111111, 0b10000010, 0b00100100, 0b11111110, 0b00010111, 0b00100100, 0b11000101, 0b11010111, 0b11000001, 0b00010101, 0b11111111, 0b00010100, 0b00001000, 0b11000000, 0b11111000, 0b00000001, 0b00000000, 0b11101110, 0b00011111, 0b11000101, 0b11000000, 0b01010100, 0b00000110, 0b00000000, 0b11111000, 0b00101010, 0b00000010, 0b11000001, 0b00110111, 0b00001110, 0b00000011, 0b10101000, 0b01110000, 0b00111110, 0b00100000, 0b00010000, 0b11001111, 0b10100000, 0b00000110, 0b10000000, 0b00000100, 0b01100110, 0b00000010, 0b00001100], # Node 453
-[0b10011000, 0b00101000, 0b11001011, 0b01110101, 0b10101000, 0b11000110, 0b01110010, 0b10001000, 0b00000011, 0b01010001, 0b00000010, 0b11001011, 0b00100010, 0b01001101, 0b10100010, 0b01000000, 0b11101000, 0b00001001, 0b10111010, 0b00001110, 0b01100000, 0b00010110, 0b10101110, 0b01001010, 0b01000010, 0b00100101, 0b11001000, 0b01010010, 0b01111000, 0b00000100, 0b00011100, 0b00110010, 0b11110100, 0b00011000, 0b10101100, 0b11001100, 0b00101101, 0b01010111, 0b00011000, 0b10110011, 0b11010001, 0b10101001, 0b01001101, 0b01110110, 0b10111100, 0b00101000, 0b01110110, 0b01001100, 0b10011100, 0b11000011, 0b00111101, 0b00101010, 0b10010001, 0b10110001, 0b10101100, 0b00010011, 0b10010000, 0b00010011, 0b10011101, 0b01110101, 0b01101110, 0b11100001, 0b01011101, 0b01000011, 0b01001101, 0b00000010, 0b11110000, 0b00001101, 0b10011111, 0b11101100, 0b00101111, 0b00101101, 0b11101010, 0b00110110, 0b10010010, 0b11110111, 0b10101001, 0b01011010, 0b01111000, 0b00101100, 0b00100100, 0b10000110, 0b10011101, 0b11100001, 0b11011000, 0b01111000, 0b01001110, 0b00111010, 0b00001001, 0b10001100, 0b00010000, 0b00001100, 0b01001010, 0b11011110, 0b00100100, 0b00001000, 0b00101101, 0b01011101], # Node 454
-[0b00111010, 0b01001000, 0b10001101, 0b01000000, 0b00000000, 0b11011100, 0b11100101, 0b01110011, 0b11100010, 0b11010111, 0b01111000, 0b10010100, 0b00010110, 0b11101011, 0b00110101, 0b01110101, 0b00001111, 0b11001010, 0b11110100, 0b00001100, 0b00000010, 0b00000100, 0b00100011, 0b01110000, 0b00000010, 0b11001000, 0b10100101, 0b01100000, 0b10100101, 0b00001010, 0b00101001, 0b11010001, 0b00000110, 0b10101001, 0b10110011, 0b01001111, 0b10001110, 0b00011111, 0b00000000, 0b11000001, 0b11111100, 0b11110001, 0b10011000, 0b10100111, 0b01000100, 0b00000011, 0b10001000, 0b01010001, 0b10001000, 0b01111011, 0b10110011, 0b01101111, 0b10001111, 0b11100001, 0b10100001, 0b11000101, 0b00100101, 0b00010001, 0b00101100, 0b10001101, 0b00100000, 0b01101010, 0b10100000, 0b00000100, 0b10011110, 0b00011101, 0b00001100, 0b11001000, 0b10100101, 0b11000000, 0b00011001, 0b01110110, 0b01000010, 0b01010101, 0b11100000, 0b10111101, 0b00001111, 0b11000100, 0b10001110, 0b11011101, 0b10000000, 0b10010111, 0b00100111, 0b00111001, 0b10100110, 0b10001000, 0b10100111, 0b11010000, 0b10000011, 0b00001100, 0b01000010, 0b00111111, 0b01000010, 0b11000000, 0b00001100, 0b10000000, 0b00000000, 0b00100100], # Node 455
-[0b00010001, 0b00000001, 0b01000100, 0b10001110, 0b01001100, 0b00000100, 0b01010010, 0b00100010, 0b00010011, 0b00111010, 0b01011110, 0b00010110, 0b00000001, 0b01000000, 0b10100000, 0b10000010, 0b00001100, 0b00001001, 0b00000000, 0b00100010, 0b11110010, 0b10000101, 0b00110001, 0b11101111, 0b00001000, 0b11011000, 0b11101100, 0b00001000, 0b11111001, 0b11111110, 0b00001111, 0b00110000, 0b11111110, 0b00001110, 0b00000000, 0b00100000, 0b01000100, 0b11100001, 0b01001011, 0b01101111, 0b00000000, 0b01000000, 0b10010000, 0b11011101, 0b10000001, 0b10001100, 0b01110010, 0b10110011, 0b01001101, 0b01010000, 0b10111101, 0b10001001, 0b11100011, 0b10001010, 0b01111110, 0b00011100, 0b00000010, 0b01000000, 0b01100110, 0b00001110, 0b00000011, 0b11000100, 0b01000010, 0b01001001, 0b00000100, 0b00101010, 0b00101110, 0b00010000, 0b00100000, 0b01100011, 0b01010001, 0b00100000, 0b01010010, 0b00100111, 0b01000001, 0b11100001, 0b11011111, 0b00011000, 0b00100000, 0b01110011, 0b00000001, 0b11011110, 0b10111111, 0b00010000, 0b01000100, 0b11011010, 0b01000110, 0b00001010, 0b01100101, 0b00001011, 0b01000010, 0b00001000, 0b01101111, 0b11011110, 0b01000100, 0b00000001, 0b00010001, 0b00110100], # Node 456
-[0b11000011, 0b00000011, 0b00011010, 0b00000000, 0b01000001, 0b00101101, 0b10011000, 0b00010010, 0b01100000, 0b10010101, 0b00000101, 0b01000100, 0b11111000, 0b00001111, 0b10000000, 0b00000010, 0b01011110, 0b01000000, 0b00000000, 0b00000000, 0b10000000, 0b10000001, 0b00101100, 0b00000100, 0b00100000, 0b01100000, 0b11111111, 0b00000000, 0b00000111, 0b10111111, 0b00000111, 0b01110000, 0b00011000, 0b11100111, 0b00000001, 0b11000001, 0b00011111, 0b00011110, 0b00000000, 0b10100010, 0b11100000, 0b10001111, 0b11000000, 0b00000111, 0b11111110, 0b00000111, 0b01111110, 0b11100000, 0b01011111, 0b11101000, 0b00001111, 0b11111111, 0b01000011, 0b11111111, 0b11111000, 0b00111111, 0b11100001, 0b11001111, 0b00001111, 0b00000001, 0b11111110, 0b11111110, 0b00000001, 0b11000001, 0b11101111, 0b00001111, 0b00000001, 0b11110000, 0b10111111, 0b00110000, 0b00000000, 0b01110000, 0b00000000, 0b00001000, 0b00000000, 0b00000000, 0b10000000, 0b00000100, 0b00000001, 0b00000000, 0b00001001, 0b00000000, 0b00000000, 0b11001010, 0b01110000, 0b00000000, 0b10010111, 0b10000100, 0b11111111, 0b11111110, 0b01010001, 0b00000100, 0b11100011, 0b11000000, 0b10010000, 0b10111001, 0b00100100, 0b10011011], # Node 457
-[0b01001110, 0b01101101, 0b11101011, 0b01000011, 0b00110111, 0b01101011, 0b10100111, 0b01100111, 0b10110010, 0b01001111, 0b00001100, 0b11110101, 0b10011110, 0b11011101, 0b00111010, 0b10111110, 0b01110000, 0b00100011, 0b10101111, 0b11111111, 0b10100011, 0b11111111, 0b11111110, 0b10111011, 0b10111010, 0b10111110, 0b01101110, 0b11111111, 0b00111000, 0b11111000, 0b11101010, 0b11011110, 0b10101011, 0b10100111, 0b11011010, 0b10101101, 0b10011111, 0b11110110, 0b11110111, 0b10001011, 0b01100000, 0b01011111, 0b01110000, 0b01000001, 0b11110001, 0b11101111, 0b00001001, 0b01011000, 0b10111100, 0b01000010, 0b10001000, 0b11011000, 0b00110001, 0b01001111, 0b00100100, 0b11111111, 0b10001111, 0b01011011, 0b10000010, 0b01011110, 0b11111011, 0b00001001, 0b11000111, 0b11100101, 0b00000110, 0b01110011, 0b11111111, 0b11111110, 0b01101001, 0b11001111, 0b11111111, 0b01100111, 0b11110111, 0b11000001, 0b00110110, 0b11111100, 0b10100010, 0b10000110, 0b11110111, 0b11100111, 0b10110111, 0b11111010, 0b10100111, 0b11111101, 0b10101101, 0b11111110, 0b11011100, 0b00111001, 0b10000111, 0b01111101, 0b11111011, 0b11101101, 0b01110011, 0b11111100, 0b11111110, 0b01111110, 0b10111110, 0b11111010], # Node 458
-[0b01100100, 0b01011011, 0b00001101, 0b10001010, 0b11111101, 0b01110000, 0b11101101, 0b10110100, 0b01110011, 0b11110111, 0b11001111, 0b10101111, 0b11000111, 0b10110000, 0b11101100, 0b10001000, 0b11111001, 0b01001101, 0b11110011, 0b11110101, 0b01111101, 0b11110001, 0b00000001, 0b00011011, 0b01010111, 0b00001011, 0b01010001, 0b10100110, 0b01100000, 0b01000010, 0b10110000, 0b01000111, 0b10001000, 0b11100111, 0b00111011, 0b11011010, 0b00010001, 0b10001010, 0b01010010, 0b11110001, 0b11110111, 0b11111100, 0b00011111, 0b11100101, 0b01110010, 0b01001111, 0b10010111, 0b00101000, 0b01111011, 0b01001010, 0b11111110, 0b10110010, 0b00101000, 0b01100000, 0b01001001, 0b01110111, 0b11111101, 0b11100111, 0b11111101, 0b10000100, 0b10101101, 0b01100110, 0b11111010, 0b00111001, 0b01110110, 0b11010111, 0b11111101, 0b01110111, 0b01100101, 0b11000110, 0b01111111, 0b11100000, 0b00100010, 0b01111100, 0b00011010, 0b00001010, 0b10101111, 0b11000100, 0b10100010, 0b10010010, 0b01010100, 0b10000101, 0b11111101, 0b01111111, 0b01101100, 0b11100000, 0b11111111, 0b00011010, 0b01011011, 0b10010100, 0b00011110, 0b11110011, 0b11101011, 0b01000110, 0b10101101, 0b00111001, 0b10100111, 0b11011101], # Node 459
-[0b01111111, 0b11101111, 0b10111100, 0b11111111, 0b11101111, 0b01111011, 0b11111111, 0b11101111, 0b00101111, 0b11111111, 0b11111111, 0b11111111, 0b11011111, 0b11101111, 0b01111110, 0b01111000, 0b11100111, 0b10111011, 0b11011111, 0b11110001, 0b01110011, 0b00111111, 0b10100001, 0b11000000, 0b11111111, 0b10000010, 0b10100000, 0b11101001, 0b00101110, 0b11011110, 0b11100100, 0b11111101, 0b11010000, 0b00111011, 0b11111010, 0b11010101, 0b10001111, 0b11100101, 0b01111011, 0b00001011, 0b11010010, 0b11111111, 0b11010001, 0b00110100, 0b10100101, 0b11111111, 0b01010011, 0b01110001, 0b01111111, 0b11101101, 0b10000001, 0b10011111, 0b01011111, 0b01111111, 0b10111100, 0b00110110, 0b11111111, 0b11100010, 0b10001011, 0b10111111, 0b00011111, 0b01111100, 0b11111110, 0b01100011, 0b11111010, 0b10100111, 0b11011111, 0b00100111, 0b11111101, 0b10111000, 0b01110111, 0b11011100, 0b11101111, 0b11110111, 0b10011111, 0b01110011, 0b01111100, 0b11111111, 0b00101010, 0b10101000, 0b11111111, 0b10011011, 0b00101001, 0b11111110, 0b11111111, 0b00001111, 0b11101100, 0b01010100, 0b10111111, 0b11111111, 0b10011111, 0b01111110, 0b11001111, 0b11100101, 0b11101101, 0b11011111, 0b11111111, 0b10110110], # Node 460
-[0b11011001, 0b01011110, 0b00001111, 0b00111010, 0b01100100, 0b00100010, 0b01001010, 0b11000000, 0b11110010, 0b11010110, 0b10100010, 0b10010111, 0b11111010, 0b00011000, 0b10000000, 0b00000100, 0b01110010, 0b00111000, 0b01000000, 0b00110011, 0b00000110, 0b10100001, 0b00010000, 0b01110111, 0b00100010, 0b00110111, 0b10101011, 0b00100110, 0b00011000, 0b00010010, 0b11100011, 0b00111101, 0b10011101, 0b01001000, 0b00100001, 0b00010000, 0b00111110, 0b00001111, 0b11100110, 0b00101001, 0b01111111, 0b00100111, 0b01000100, 0b10110001, 0b00000011, 0b00110000, 0b01010100, 0b10010101, 0b10111011, 0b11100101, 0b00011011, 0b11111101, 0b10110010, 0b01001000, 0b01000000, 0b01010011, 0b11000110, 0b11011110, 0b00111001, 0b01100011, 0b10011000, 0b11110101, 0b00110011, 0b11110001, 0b00001110, 0b00101100, 0b01010111, 0b00010011, 0b10110011, 0b00100110, 0b01000010, 0b00110010, 0b00010001, 0b10110011, 0b01000001, 0b11001110, 0b00111100, 0b00110001, 0b10100100, 0b00000010, 0b00101100, 0b11011111, 0b11000000, 0b10000101, 0b11001010, 0b11111111, 0b00000010, 0b01000010, 0b11100000, 0b00011000, 0b01011110, 0b01001110, 0b00110000, 0b01111011, 0b10011000, 0b01111000, 0b00010101, 0b00100100], # Node 461
-[0b00011111, 0b01111001, 0b11111110, 0b00001111, 0b11101001, 0b10011001, 0b01110111, 0b10111111, 0b10011110, 0b00111111, 0b10111011, 0b10011001, 0b10110101, 0b00001101, 0b10101011, 0b01010100, 0b01110110, 0b11011101, 0b10110101, 0b10111101, 0b10110101, 0b11010011, 0b10101111, 0b00010111, 0b00011100, 0b01001001, 0b01010101, 0b00101110, 0b00000101, 0b11111110, 0b10010010, 0b00111000, 0b01101010, 0b10111011, 0b10110100, 0b01101000, 0b11111111, 0b00001111, 0b01000110, 0b01111100, 0b10111111, 0b11101111, 0b01100011, 0b10000000, 0b11001010, 0b01110110, 0b11011111, 0b00111101, 0b01011111, 0b10101011, 0b00100000, 0b01011110, 0b01011000, 0b01100000, 0b11101101, 0b00111101, 0b10101101, 0b10110100, 0b01101011, 0b11010110, 0b10110110, 0b10111111, 0b10111011, 0b10001111, 0b11111100, 0b11001101, 0b00010001, 0b10001100, 0b11110110, 0b11100111, 0b00100101, 0b11011110, 0b10000101, 0b10111101, 0b11011110, 0b00010011, 0b00001111, 0b01111101, 0b01000101, 0b01100010, 0b10111000, 0b01111100, 0b01001111, 0b10010011, 0b10111111, 0b10100001, 0b11000011, 0b01110111, 0b11111111, 0b01111111, 0b10011011, 0b10111001, 0b11011010, 0b10001111, 0b11100111, 0b01011001, 0b00101001, 0b01110001], # Node 462
-[0b11101101, 0b10001000, 0b01000011, 0b01110011, 0b11100100, 0b11010111, 0b10000011, 0b11000100, 0b01100001, 0b00100000, 0b00110010, 0b01111000, 0b01100010, 0b10010010, 0b01110001, 0b01001011, 0b00011001, 0b10000000, 0b11100101, 0b00110100, 0b01000110, 0b10011100, 0b00000101, 0b01011000, 0b00111110, 0b10011111, 0b11101101, 0b00111011, 0b01011100, 0b11010011, 0b11001110, 0b11010011, 0b10101000, 0b10111111, 0b01100001, 0b00111010, 0b01010001, 0b10001110, 0b10100111, 0b11101011, 0b10101011, 0b00001000, 0b10000010, 0b10101000, 0b01011001, 0b00010100, 0b10100111, 0b10100100, 0b11101110, 0b11100001, 0b01100001, 0b10110001, 0b01100011, 0b01101110, 0b11001111, 0b10010110, 0b10000011, 0b11010101, 0b01001010, 0b00000110, 0b01001011, 0b01110100, 0b01000010, 0b01011000, 0b11010011, 0b01001100, 0b01101010, 0b11101110, 0b11011110, 0b11100010, 0b11110100, 0b00100010, 0b10101011, 0b01000010, 0b10000010, 0b10010111, 0b10010101, 0b01011011, 0b10101101, 0b00010000, 0b01010000, 0b10010001, 0b10010100, 0b00110001, 0b01011101, 0b10001011, 0b00110101, 0b10010001, 0b01001000, 0b01100000, 0b00001010, 0b00001101, 0b10010110, 0b00100000, 0b11000100, 0b11101101, 0b01000011, 0b10000000], # Node 463
-[0b01000101, 0b11100010, 0b11011011, 0b10101101, 0b10101101, 0b00111011, 0b11110101, 0b11010000, 0b01010011, 0b10100101, 0b00010111, 0b00011010, 0b10001110, 0b01110001, 0b10111001, 0b11010010, 0b10000101, 0b10111111, 0b01101100, 0b10111100, 0b11101001, 0b11110011, 0b10110101, 0b11101010, 0b11001111, 0b01111000, 0b11010100, 0b10100111, 0b10111010, 0b01011001, 0b10110110, 0b01001010, 0b00011110, 0b00011001, 0b00100111, 0b00111001, 0b11110011, 0b01001111, 0b01111010, 0b00011000, 0b11000100, 0b11100000, 0b00111100, 0b01100110, 0b01000100, 0b10111100, 0b01101110, 0b00100101, 0b11010100, 0b00001111, 0b01111010, 0b10010100, 0b01011010, 0b10010011, 0b01111000, 0b10101011, 0b01000010, 0b00111111, 0b10000011, 0b00111011, 0b00101010, 0b11101111, 0b11001011, 0b10100111, 0b11010001, 0b00110000, 0b01111101, 0b11110011, 0b00011000, 0b00001110, 0b11100010, 0b01000001, 0b11011100, 0b10100111, 0b10110111, 0b11000110, 0b11010011, 0b01111110, 0b00011101, 0b11100100, 0b10101010, 0b10001101, 0b00100011, 0b11111110, 0b00011110, 0b11011011, 0b11010001, 0b10110011, 0b10000011, 0b10110011, 0b11011010, 0b11000011, 0b11110111, 0b11001010, 0b01100001, 0b10010110, 0b11110101, 0b10110010], # Node 464
-[0b00011110, 0b10000000, 0b00010000, 0b00000000, 0b01101111, 0b10100000, 0b00100000, 0b10000100, 0b11110001, 0b01000000, 0b00100100, 0b01100001, 0b01110011, 0b00100111, 0b00110100, 0b00011000, 0b11111000, 0b11001010, 0b01100011, 0b10000000, 0b10001010, 0b00100000, 0b00000000, 0b00000110, 0b00000001, 0b11100101, 0b01100001, 0b00000000, 0b10110000, 0b10011111, 0b00000000, 0b11100110, 0b11111110, 0b00000000, 0b00000010, 0b11101001, 0b00001111, 0b01000000, 0b11100101, 0b11111111, 0b11100101, 0b10001001, 0b11100001, 0b11100111, 0b11111100, 0b10000001, 0b11110110, 0b11011001, 0b01011111, 0b01110101, 0b11000111, 0b11101111, 0b10001000, 0b01110011, 0b11101000, 0b00001110, 0b00010000, 0b10001111, 0b01111111, 0b11010000, 0b11110001, 0b10001111, 0b10001111, 0b00000100, 0b11101111, 0b00011111, 0b10001000, 0b11000000, 0b11101010, 0b00010011, 0b00000000, 0b11111100, 0b00100000, 0b00110000, 0b10000000, 0b00001111, 0b10001100, 0b00000000, 0b10000000, 0b10000000, 0b10010011, 0b00000000, 0b00000010, 0b10100000, 0b10011110, 0b00010110, 0b00010011, 0b00100011, 0b10101111, 0b10000111, 0b00010111, 0b00100001, 0b01010000, 0b01110111, 0b00100110, 0b10000010, 0b00111000, 0b00110010], # Node 465
-[0b01010000, 0b00010101, 0b01010010, 0b00100011, 0b00100001, 0b01000010, 0b00001010, 0b10000000, 0b00010001, 0b00101001, 0b00100110, 0b11000000, 0b01110000, 0b10001000, 0b10001010, 0b01011110, 0b10000011, 0b00100000, 0b11110010, 0b01111111, 0b11010001, 0b01011110, 0b11111111, 0b00010111, 0b00100000, 0b11110010, 0b10001011, 0b01000010, 0b10000010, 0b01000011, 0b10001011, 0b00101001, 0b00000100, 0b00000001, 0b00000000, 0b10010110, 0b00000001, 0b00000001, 0b11000010, 0b11111010, 0b11001101, 0b00100000, 0b01000010, 0b11000001, 0b00111011, 0b01111001, 0b11111100, 0b11111000, 0b10111101, 0b00010101, 0b11001001, 0b11011111, 0b00001000, 0b11111101, 0b10101110, 0b00010111, 0b10000000, 0b10110111, 0b10010111, 0b00000010, 0b00101111, 0b00110000, 0b00111011, 0b00100001, 0b11111100, 0b10111100, 0b11001100, 0b01011011, 0b11100011, 0b00000111, 0b00100101, 0b01111101, 0b00111111, 0b10111101, 0b00011110, 0b11110110, 0b00001111, 0b01110010, 0b11011111, 0b01001111, 0b01000000, 0b00011000, 0b11001000, 0b00011001, 0b10000010, 0b00100010, 0b00001100, 0b01110000, 0b01001110, 0b01010000, 0b01001000, 0b00110101, 0b10000001, 0b10100100, 0b11001000, 0b00101010, 0b00001010, 0b00100010], # Node 466
-[0b01010010, 0b11001100, 0b10000001, 0b00011101, 0b00001100, 0b00000000, 0b00100000, 0b00000110, 0b00000000, 0b00000000, 0b01011010, 0b00000011, 0b00000000, 0b01000000, 0b00010111, 0b00000000, 0b11100000, 0b10111100, 0b00111110, 0b10010100, 0b11101111, 0b11100110, 0b01101111, 0b11111110, 0b00000010, 0b11111110, 0b11110111, 0b10001001, 0b01111001, 0b00110110, 0b11101101, 0b11110100, 0b11110110, 0b11110111, 0b10001011, 0b11111110, 0b11111111, 0b00111000, 0b11110000, 0b11111111, 0b01011111, 0b01110111, 0b11111110, 0b11000111, 0b11111111, 0b11101110, 0b00111111, 0b01111100, 0b00000011, 0b11011000, 0b11100001, 0b00011010, 0b11101000, 0b00111101, 0b00011111, 0b00000000, 0b10000001, 0b11111111, 0b00000000, 0b01110000, 0b10110000, 0b00001111, 0b00000000, 0b00000000, 0b00100000, 0b00000000, 0b01110000, 0b00000000, 0b00000000, 0b10000000, 0b00000101, 0b00000000, 0b00010000, 0b00101100, 0b00000000, 0b11110000, 0b10001111, 0b10100010, 0b11111001, 0b11111111, 0b00110000, 0b11111100, 0b11111111, 0b10001111, 0b11111100, 0b11111111, 0b11111111, 0b10011111, 0b11111111, 0b11111111, 0b11011011, 0b11111010, 0b11111111, 0b00111111, 0b11101110, 0b01101111, 0b10111111, 0b10011010], # Node 467
-[0b10111111, 0b10100011, 0b01100011, 0b00000111, 0b00101111, 0b10100111, 0b01001000, 0b11100100, 0b10011111, 0b11001111, 0b11101000, 0b10101101, 0b00100100, 0b10010101, 0b10110011, 0b00010111, 0b01100010, 0b11011111, 0b10011010, 0b10010111, 0b00111000, 0b11110010, 0b01001011, 0b10001010, 0b01110010, 0b10101110, 0b11100111, 0b11101110, 0b11111011, 0b10001010, 0b01000110, 0b01011100, 0b01100010, 0b10110101, 0b11011100, 0b00110110, 0b00001000, 0b11110111, 0b10010111, 0b11010110, 0b00110011, 0b11110001, 0b00011111, 0b10111101, 0b11111001, 0b00101011, 0b00100111, 0b00100001, 0b01001100, 0b10101101, 0b00101001, 0b01110010, 0b10111000, 0b11110001, 0b10011101, 0b11010010, 0b01010001, 0b10001000, 0b11100111, 0b01011100, 0b00100100, 0b11001111, 0b11111011, 0b11110000, 0b11101100, 0b00001111, 0b10100101, 0b01100110, 0b01011010, 0b11110101, 0b10111101, 0b00101100, 0b11011101, 0b11011111, 0b00111011, 0b11000110, 0b10100100, 0b11000110, 0b11001001, 0b01010011, 0b01011010, 0b11000101, 0b01010101, 0b11001100, 0b11011000, 0b10100001, 0b01111001, 0b11011110, 0b10111100, 0b01010101, 0b01110110, 0b00000000, 0b10001100, 0b01101100, 0b11110110, 0b01000101, 0b01110000, 0b01001010], # Node 468
-[0b00101010, 0b10000000, 0b01011001, 0b11111010, 0b01000100, 0b10111110, 0b11100101, 0b10011100, 0b11010000, 0b01101100, 0b00000110, 0b11101110, 0b00011100, 0b10000001, 0b00011100, 0b11111000, 0b00000000, 0b10100101, 0b11011010, 0b00101111, 0b01001000, 0b01011001, 0b01100000, 0b11000111, 0b10111001, 0b11110111, 0b11100010, 0b00101110, 0b01010100, 0b10101001, 0b00100000, 0b10010110, 0b11100110, 0b10011000, 0b10111100, 0b11010010, 0b11111100, 0b11111101, 0b10000100, 0b01011001, 0b10110000, 0b01001010, 0b10000000, 0b11000110, 0b10000101, 0b00001001, 0b10100000, 0b01111101, 0b10000010, 0b00010000, 0b10100101, 0b00100000, 0b11011000, 0b00010000, 0b01011011, 0b00000111, 0b11000100, 0b11110110, 0b01001001, 0b11000110, 0b11000111, 0b00000011, 0b10011000, 0b00000000, 0b00000101, 0b10110011, 0b00000111, 0b10001000, 0b01110000, 0b01010101, 0b11001010, 0b10100000, 0b01010100, 0b00110000, 0b10110000, 0b10100101, 0b00000100, 0b11010000, 0b01110110, 0b01111100, 0b10001010, 0b10000111, 0b11011001, 0b00000000, 0b00000100, 0b00000101, 0b10010101, 0b01000010, 0b10000010, 0b00000101, 0b10001000, 0b10010001, 0b00100100, 0b00101010, 0b10111110, 0b01101001, 0b10000001, 0b10111110], # Node 469
-[0b10111001, 0b01000101, 0b11100111, 0b11011101, 0b11110101, 0b10111011, 0b11110111, 0b11111010, 0b11111000, 0b11010110, 0b11111111, 0b11111101, 0b01001101, 0b11100111, 0b10111111, 0b11011111, 0b00101110, 0b11100001, 0b11110110, 0b10111101, 0b11111100, 0b10110101, 0b10000010, 0b00000101, 0b10111000, 0b00000011, 0b01001111, 0b10010000, 0b01011111, 0b01010000, 0b00010000, 0b11101010, 0b10010111, 0b00001000, 0b11100010, 0b11111011, 0b00101110, 0b00010100, 0b11101111, 0b01111110, 0b00111000, 0b00111111, 0b10111001, 0b00001111, 0b11111110, 0b11101111, 0b11111100, 0b10100001, 0b01111111, 0b11100111, 0b00001111, 0b11111110, 0b01011111, 0b01111111, 0b11001001, 0b11101111, 0b11110011, 0b01111111, 0b11111111, 0b11110011, 0b11111110, 0b11101001, 0b01011111, 0b11111011, 0b10101111, 0b00111111, 0b10111101, 0b11111001, 0b11111111, 0b00111111, 0b10011110, 0b11100110, 0b00111111, 0b11001001, 0b00000010, 0b01101100, 0b11011110, 0b00011100, 0b00100000, 0b01101100, 0b11101111, 0b00000011, 0b00100000, 0b10010011, 0b11110111, 0b00000011, 0b11111111, 0b11111100, 0b00110011, 0b01111010, 0b10101010, 0b11110101, 0b10000111, 0b10110111, 0b01111110, 0b11011111, 0b11111111, 0b11110111], # Node 470
-[0b00000000, 0b10000000, 0b00011010, 0b00001100, 0b00001000, 0b10000000, 0b11000100, 0b00010100, 0b00010000, 0b00010100, 0b00000000, 0b00010000, 0b00000000, 0b01000000, 0b10010110, 0b11101000, 0b01001011, 0b00010110, 0b10001110, 0b01111110, 0b00100000, 0b00100010, 0b11110001, 0b00101010, 0b00010011, 0b01001100, 0b11011001, 0b10001100, 0b00001101, 0b10000111, 0b10001110, 0b11100001, 0b00000011, 0b01100100, 0b00010000, 0b00100000, 0b11100000, 0b00000001, 0b10000000, 0b00001000, 0b10111100, 0b00000000, 0b00110100, 0b00000000, 0b00011111, 0b10100100, 0b11100101, 0b11111111, 0b01011100, 0b00000000, 0b11100100, 0b10001011, 0b01100011, 0b01101001, 0b01001111, 0b10001000, 0b00100110, 0b10010111, 0b01000100, 0b00011100, 0b01110000, 0b01010101, 0b01000000, 0b00010010, 0b01111000, 0b11000010, 0b10000010, 0b11110001, 0b10111001, 0b10001100, 0b01000000, 0b11110000, 0b01000011, 0b00110111, 0b00111100, 0b00101111, 0b01101000, 0b10010100, 0b01001101, 0b10100010, 0b10010000, 0b00100110, 0b01000000, 0b01000100, 0b00000000, 0b00000100, 0b01110100, 0b10010000, 0b00001010, 0b10111000, 0b01010100, 0b00010001, 0b00111000, 0b01000000, 0b11010001, 0b01100010, 0b01000000, 0b01100000], # Node 471
-[0b01010011, 0b00100010, 0b10000000, 0b01001100, 0b10000101, 0b11101101, 0b00001001, 0b11010000, 0b11110110, 0b00100000, 0b10000000, 0b00001100, 0b00000100, 0b00001011, 0b11000010, 0b00111001, 0b01000000, 0b10000101, 0b00101000, 0b10010010, 0b00010001, 0b01000000, 0b10100001, 0b10010000, 0b01100001, 0b10011000, 0b11111101, 0b10111001, 0b10000000, 0b00110011, 0b01001011, 0b00110000, 0b00000101, 0b00110101, 0b10000011, 0b01111010, 0b00001100, 0b00001001, 0b11001001, 0b11100010, 0b10011010, 0b01011001, 0b01101010, 0b01000000, 0b01100001, 0b01000100, 0b10010000, 0b01111001, 0b01000001, 0b01001010, 0b00110100, 0b10111100, 0b00001010, 0b00100100, 0b11100011, 0b11000001, 0b01101001, 0b00000000, 0b01110100, 0b00001000, 0b10011111, 0b00000010, 0b11010100, 0b00110011, 0b10010101, 0b00100000, 0b01100000, 0b00011000, 0b00010001, 0b00100110, 0b00010010, 0b00000100, 0b00110001, 0b10001000, 0b10000110, 0b11101000, 0b00000101, 0b01000000, 0b11001110, 0b10101101, 0b00111100, 0b11000101, 0b00111101, 0b11100100, 0b01011101, 0b11011010, 0b00100000, 0b11001101, 0b00000100, 0b01001111, 0b01000100, 0b10111000, 0b11001101, 0b01010011, 0b10000100, 0b11010110, 0b01100001, 0b00010010], # Node 472
-[0b00101000, 0b10001010, 0b00111100, 0b01010100, 0b10101010, 0b10111100, 0b00110000, 0b01000000, 0b00111001, 0b00001000, 0b01011001, 0b01001000, 0b00101110, 0b01100101, 0b00010000, 0b00000000, 0b00111101, 0b00110110, 0b00101010, 0b10000010, 0b10111010, 0b00101001, 0b10000010, 0b00000011, 0b00011000, 0b11011000, 0b00101100, 0b10010001, 0b00001100, 0b11101101, 0b10001000, 0b00100101, 0b11010000, 0b11001101, 0b00000001, 0b11011000, 0b10100110, 0b00011000, 0b01100010, 0b01101101, 0b10110110, 0b00101100, 0b10100100, 0b11010010, 0b11011001, 0b00001110, 0b10100100, 0b01111101, 0b01111111, 0b00101011, 0b00010111, 0b00110011, 0b01111101, 0b10010001, 0b10011000, 0b00110110, 0b01100011, 0b01010000, 0b10101100, 0b01111000, 0b01010010, 0b11010101, 0b00101110, 0b01000000, 0b01101111, 0b11101010, 0b00111001, 0b00011100, 0b10001000, 0b10000010, 0b10000110, 0b11111101, 0b10110011, 0b10101000, 0b00101110, 0b00010111, 0b01011101, 0b00010100, 0b00011101, 0b11100101, 0b00000111, 0b01000011, 0b11010001, 0b01001000, 0b01110110, 0b11010000, 0b00001000, 0b10111001, 0b11111110, 0b00100001, 0b10100101, 0b01010101, 0b00010010, 0b01111010, 0b11110001, 0b11100100, 0b10111011, 0b01001010], # Node 473
-[0b00110100, 0b00010000, 0b00001000, 0b11100010, 0b00000100, 0b10000111, 0b10001001, 0b10101001, 0b01011000, 0b10001110, 0b01000011, 0b01010000, 0b00101011, 0b00101110, 0b01011000, 0b00000101, 0b10000001, 0b00010111, 0b00111100, 0b11000110, 0b10110100, 0b00010001, 0b01011001, 0b01001100, 0b11001000, 0b10010011, 0b00100110, 0b10000011, 0b10000010, 0b10000000, 0b00000111, 0b10000111, 0b10100000, 0b00100101, 0b00001010, 0b00000000, 0b10111011, 0b01000010, 0b00010100, 0b01100110, 0b01101000, 0b10101000, 0b01001000, 0b11001000, 0b10110111, 0b11100100, 0b00010101, 0b10001111, 0b10111111, 0b00001010, 0b11110101, 0b10011000, 0b01001100, 0b00000111, 0b00010010, 0b00001011, 0b11011101, 0b00111010, 0b00100100, 0b01100100, 0b01011000, 0b00011011, 0b00000111, 0b01110001, 0b10110101, 0b11011101, 0b10000000, 0b10001010, 0b11100001, 0b01011000, 0b01110011, 0b11011001, 0b01000110, 0b00100100, 0b00000000, 0b00101011, 0b11011110, 0b00001000, 0b00011111, 0b10100000, 0b00101101, 0b00011000, 0b00010111, 0b00010000, 0b11010101, 0b01011000, 0b11011100, 0b00010000, 0b00101111, 0b01001000, 0b00101100, 0b10001011, 0b10001111, 0b00001101, 0b00000000, 0b01100110, 0b01100111, 0b10010000], # Node 474
-[0b11000101, 0b01101000, 0b00001100, 0b00000000, 0b01001001, 0b00010001, 0b01001000, 0b00111001, 0b00100111, 0b00100000, 0b11000110, 0b10000100, 0b01010000, 0b00001001, 0b00100001, 0b00000100, 0b10000000, 0b01011001, 0b00000100, 0b11000010, 0b10001100, 0b10110000, 0b11100010, 0b01000101, 0b00010110, 0b11000101, 0b00111100, 0b01000100, 0b01001100, 0b11001010, 0b10100011, 0b00111001, 0b01000000, 0b00000111, 0b01000001, 0b01000110, 0b11100001, 0b00010000, 0b00010010, 0b00010010, 0b10001000, 0b01000011, 0b00000101, 0b01011000, 0b00000110, 0b00100000, 0b11110001, 0b00110010, 0b00101001, 0b00010011, 0b11011100, 0b10001100, 0b01011101, 0b00100010, 0b10111111, 0b00000001, 0b00000100, 0b01000100, 0b10100010, 0b01110100, 0b10001001, 0b10000100, 0b01000011, 0b00001011, 0b01110101, 0b00100010, 0b10011001, 0b10000000, 0b10011111, 0b00101110, 0b00010000, 0b01010110, 0b00001111, 0b10100010, 0b11011110, 0b01011001, 0b01110000, 0b00001000, 0b01101001, 0b10100000, 0b00010011, 0b00011010, 0b01000000, 0b11100101, 0b10001001, 0b01001100, 0b01000110, 0b00100001, 0b01100010, 0b01001010, 0b00001001, 0b01110010, 0b11011110, 0b11000000, 0b10000010, 0b10000101, 0b10011001, 0b00100111], # Node 475
-[0b11100001, 0b01000000, 0b11101110, 0b01110000, 0b00000101, 0b00011100, 0b10100001, 0b10111000, 0b00100010, 0b00110000, 0b01111000, 0b00100111, 0b10000101, 0b10000111, 0b00100001, 0b11000110, 0b10101001, 0b00000100, 0b00100000, 0b00000000, 0b01001001, 0b10100010, 0b00000001, 0b01001110, 0b10000101, 0b10001011, 0b01110000, 0b00001001, 0b11000100, 0b00111010, 0b11001000, 0b00010010, 0b00101111, 0b01010000, 0b00100101, 0b11100010, 0b10110000, 0b10001111, 0b00000011, 0b00001100, 0b00000001, 0b11010101, 0b00101000, 0b10000000, 0b10111110, 0b10000000, 0b10000101, 0b11001111, 0b00000011, 0b11011110, 0b11101011, 0b10001010, 0b00010001, 0b11001111, 0b11101101, 0b01100010, 0b10111101, 0b11100011, 0b01101111, 0b01011000, 0b10010000, 0b10100011, 0b11011010, 0b00001111, 0b11001000, 0b00111110, 0b01000100, 0b01001000, 0b11000010, 0b11110000, 0b00100110, 0b00001111, 0b10001110, 0b10010100, 0b00001001, 0b11100100, 0b00010001, 0b00010000, 0b10000100, 0b10010100, 0b01010000, 0b00001111, 0b11100011, 0b00100111, 0b10001110, 0b11001001, 0b10111001, 0b00001010, 0b00111101, 0b11100111, 0b10000000, 0b01101000, 0b01001101, 0b01001000, 0b10111011, 0b00100100, 0b00010000, 0b00111010], # Node 476
-[0b11101111, 0b10000111, 0b01000101, 0b11111110, 0b01111110, 0b11010100, 0b10110111, 0b11111011, 0b11111010, 0b10111111, 0b10101001, 0b00111111, 0b10111011, 0b11111111, 0b10111101, 0b01110101, 0b00101001, 0b01001011, 0b10011011, 0b11001111, 0b01110011, 0b00101101, 0b10111101, 0b10000101, 0b11100110, 0b11111101, 0b11111110, 0b11101101, 0b11101100, 0b10001110, 0b11100110, 0b10011110, 0b00000011, 0b00100100, 0b11010010, 0b01100000, 0b10001111, 0b01001101, 0b11111101, 0b01000001, 0b10011111, 0b10000001, 0b11010010, 0b01010110, 0b00011110, 0b11111011, 0b10011100, 0b01001101, 0b10111000, 0b11101111, 0b01011100, 0b10111000, 0b10001111, 0b11011111, 0b00000000, 0b01111011, 0b11011010, 0b01010111, 0b10111000, 0b10110111, 0b01111101, 0b00111010, 0b11101110, 0b11101011, 0b00000101, 0b01111011, 0b11111111, 0b00001101, 0b10111100, 0b10100100, 0b00110101, 0b01110100, 0b10100011, 0b10111001, 0b00011101, 0b11111101, 0b11100111, 0b01111111, 0b11110110, 0b11101110, 0b00111111, 0b10001111, 0b11010001, 0b01001111, 0b10011001, 0b11010100, 0b11111011, 0b11101111, 0b11101001, 0b01111100, 0b10001111, 0b00011100, 0b11111101, 0b11111001, 0b01110111, 0b01110111, 0b01110101, 0b01001001], # Node 477
-[0b00100100, 0b00001010, 0b01100000, 0b00101001, 0b01001111, 0b01001110, 0b01101000, 0b10001000, 0b00010000, 0b11001001, 0b01000001, 0b00000011, 0b01111111, 0b00010010, 0b10010110, 0b00011101, 0b10000000, 0b11100010, 0b00010000, 0b00010011, 0b01000010, 0b01100000, 0b00000100, 0b10000000, 0b10010100, 0b00000000, 0b01111110, 0b00000100, 0b00000100, 0b01111010, 0b10111001, 0b10100001, 0b00110000, 0b10011011, 0b00010000, 0b10011110, 0b00010010, 0b01001101, 0b00010110, 0b01101000, 0b11010000, 0b11001111, 0b00001000, 0b10001111, 0b10010010, 0b00111010, 0b01110000, 0b11110000, 0b11011001, 0b10100001, 0b10000000, 0b00001100, 0b10011000, 0b11110101, 0b01111010, 0b11110000, 0b10001000, 0b01011011, 0b01000111, 0b11110000, 0b01001100, 0b11000010, 0b11101000, 0b00001001, 0b00000010, 0b11000000, 0b00000011, 0b00000010, 0b01101100, 0b01001000, 0b00110010, 0b00111100, 0b10000101, 0b01110101, 0b01110101, 0b00000101, 0b11000000, 0b00110000, 0b11011100, 0b00100100, 0b00001111, 0b11000011, 0b00000011, 0b10011000, 0b00011010, 0b00010111, 0b11100011, 0b01010010, 0b11010101, 0b10110010, 0b00011100, 0b00011100, 0b01100010, 0b01101000, 0b10110111, 0b01101001, 0b01100001, 0b00010010], # Node 478
-[0b00010000, 0b01000000, 0b01100101, 0b00000000, 0b11000000, 0b00010000, 0b01000000, 0b00000000, 0b10000000, 0b00000000, 0b00000010, 0b00001000, 0b01101010, 0b00000011, 0b00000100, 0b10010001, 0b11000010, 0b01001000, 0b00000010, 0b11000100, 0b00010110, 0b00000000, 0b00000000, 0b11000001, 0b00010011, 0b00000111, 0b10111111, 0b00111110, 0b00100011, 0b11110000, 0b11010010, 0b01000010, 0b10000000, 0b00001111, 0b01001010, 0b00000001, 0b11111100, 0b00000001, 0b00000011, 0b11000000, 0b00001011, 0b00110100, 0b00011100, 0b01111100, 0b10000000, 0b10001101, 0b11100000, 0b00001001, 0b00010000, 0b00000000, 0b00110000, 0b10000000, 0b00000000, 0b00000000, 0b00000000, 0b10100000, 0b00000000, 0b00001001, 0b10000000, 0b01100000, 0b10010000, 0b00111000, 0b01001000, 0b11000000, 0b00000000, 0b11000010, 0b00100000, 0b00101000, 0b00000000, 0b10001110, 0b00000010, 0b10000000, 0b00000010, 0b00000000, 0b11000110, 0b00011011, 0b00000100, 0b11000100, 0b11111111, 0b00000000, 0b01000100, 0b00101100, 0b00101100, 0b00000000, 0b01010000, 0b11111111, 0b00000101, 0b00000100, 0b10010001, 0b00001001, 0b00001000, 0b11000000, 0b01100110, 0b11000000, 0b00000010, 0b00100000, 0b10000001, 0b00001000], # Node 479
-[0b11100001, 0b10001111, 0b01101001, 0b11111010, 0b11011001, 0b01001000, 0b10000001, 0b01000110, 0b10110100, 0b01010001, 0b00010111, 0b01010000, 0b01000100, 0b10000000, 0b00011011, 0b01010000, 0b01000000, 0b11111000, 0b00100100, 0b11111001, 0b01011010, 0b10111010, 0b10111110, 0b00111010, 0b11100010, 0b10010110, 0b00000110, 0b00010110, 0b11111000, 0b01001100, 0b00000001, 0b01110000, 0b11001001, 0b11110100, 0b01101000, 0b01001001, 0b01110100, 0b10001100, 0b00100111, 0b11010001, 0b01000111, 0b01001011, 0b11011001, 0b00001001, 0b11000001, 0b11010000, 0b01010100, 0b01001110, 0b00101110, 0b11000000, 0b01000000, 0b10110101, 0b10101111, 0b11110000, 0b01110111, 0b00110000, 0b10110000, 0b10001111, 0b00010011, 0b01110011, 0b11001100, 0b00111100, 0b01000100, 0b01000010, 0b01000110, 0b11000100, 0b01001001, 0b11111010, 0b10110000, 0b01010010, 0b10001100, 0b01101010, 0b00010110, 0b01101101, 0b11111110, 0b01000011, 0b11010010, 0b10001000, 0b01111110, 0b11100100, 0b01100000, 0b11111111, 0b01100100, 0b00011001, 0b11100010, 0b01100000, 0b01001010, 0b01100001, 0b10110101, 0b00111000, 0b10100100, 0b11101110, 0b11100001, 0b01101110, 0b11011000, 0b00111101, 0b00100000, 0b10010100], # Node 480
-[0b11101000, 0b10110101, 0b01101011, 0b00000001, 0b10011011, 0b00100000, 0b10111110, 0b11110010, 0b11100111, 0b00111111, 0b01111000, 0b01100101, 0b00010001, 0b11000000, 0b00000001, 0b10010010, 0b11001110, 0b01101111, 0b00010001, 0b10000000, 0b10010100, 0b01100011, 0b00111110, 0b11100101, 0b01010000, 0b00101011, 0b00001000, 0b10010111, 0b00001101, 0b11111010, 0b10001100, 0b11000010, 0b11000000, 0b01011100, 0b10001001, 0b10101100, 0b10010111, 0b00000100, 0b00100000, 0b11010001, 0b11110100, 0b11000101, 0b01101010, 0b00110111, 0b00000100, 0b00110110, 0b10100010, 0b01110011, 0b00100000, 0b01000100, 0b00000100, 0b10010110, 0b00011110, 0b00110101, 0b01001011, 0b11000111, 0b01001000, 0b01110101, 0b01100000, 0b00000000, 0b01001010, 0b01100010, 0b00001010, 0b11100010, 0b10010000, 0b01101011, 0b01110100, 0b10110011, 0b10011001, 0b00111010, 0b01010101, 0b01000111, 0b10010011, 0b10000000, 0b00101000, 0b01111010, 0b01011010, 0b11011110, 0b11110000, 0b01001001, 0b00000111, 0b01101000, 0b11000011, 0b00100000, 0b00010100, 0b11100000, 0b00001010, 0b10010110, 0b01011101, 0b00100001, 0b00000000, 0b01000111, 0b00000001, 0b10011010, 0b10001100, 0b11011011, 0b00101100, 0b10001010], # Node 481
-[0b11001101, 0b00110011, 0b10110111, 0b01010000, 0b10000000, 0b01001101, 0b00000000, 0b11111011, 0b11100001, 0b00000000, 0b11000110, 0b10011100, 0b01110000, 0b01011110, 0b10101100, 0b00001001, 0b10010110, 0b00101011, 0b01010100, 0b00011010, 0b01001011, 0b10111010, 0b11110111, 0b01100000, 0b00111010, 0b00010001, 0b01100111, 0b00000011, 0b10001110, 0b01010101, 0b00100011, 0b01000000, 0b10000000, 0b11100110, 0b10000110, 0b10111001, 0b10000000, 0b01110000, 0b00011111, 0b11111001, 0b11111111, 0b10111110, 0b10001100, 0b10001001, 0b00001010, 0b00111000, 0b10011110, 0b10101011, 0b00000011, 0b10111100, 0b01100111, 0b01110111, 0b00101110, 0b10111001, 0b10010111, 0b00100111, 0b10110100, 0b11100110, 0b10111010, 0b11011000, 0b00100010, 0b01101101, 0b10011111, 0b10010000, 0b10001011, 0b11010000, 0b11100010, 0b11000001, 0b00011101, 0b00000011, 0b01100100, 0b00001110, 0b00010010, 0b01001011, 0b00111100, 0b01000000, 0b11101110, 0b11010111, 0b01110001, 0b00001010, 0b11000100, 0b01100000, 0b00011110, 0b00010100, 0b10000110, 0b00111110, 0b00011001, 0b00111101, 0b10000001, 0b00110110, 0b00110010, 0b01000101, 0b00100101, 0b11100100, 0b00010101, 0b00010000, 0b11101111, 0b11100001], # Node 482
-[0b11110101, 0b10101101, 0b01111111, 0b11111110, 0b11110011, 0b11010011, 0b11110101, 0b10111110, 0b11100001, 0b11111110, 0b00111101, 0b11000010, 0b01011110, 0b00111111, 0b01011011, 0b10101111, 0b11011000, 0b10111110, 0b10010111, 0b11110101, 0b01100011, 0b10111011, 0b11110100, 0b11111100, 0b11001011, 0b01101101, 0b11100111, 0b11111110, 0b00010001, 0b10110100, 0b11000111, 0b00001011, 0b10111111, 0b01111111, 0b11001010, 0b00111111, 0b01101110, 0b11101111, 0b00011001, 0b00100100, 0b01011000, 0b11001000, 0b10111100, 0b01000001, 0b00110111, 0b01111111, 0b11101111, 0b10001010, 0b10101101, 0b11001111, 0b01110000, 0b10011000, 0b00111111, 0b01110111, 0b10100110, 0b01100001, 0b01101100, 0b01111000, 0b11001100, 0b01110111, 0b10111111, 0b10011110, 0b10101000, 0b10011101, 0b00111011, 0b01001011, 0b11110010, 0b00011011, 0b00100101, 0b01011010, 0b11011001, 0b00000000, 0b01001111, 0b11011101, 0b00010011, 0b01100101, 0b01110110, 0b11001111, 0b10000111, 0b11111000, 0b11100110, 0b10011011, 0b10101101, 0b11011100, 0b01110111, 0b00001011, 0b00110110, 0b11011111, 0b11001011, 0b11111111, 0b01111011, 0b11001100, 0b11111011, 0b11011011, 0b10111111, 0b10111101, 0b10101111, 0b00110011], # Node 483
-[0b00100101, 0b10100010, 0b01100111, 0b00010000, 0b10000001, 0b00100000, 0b10100101, 0b00001100, 0b01100000, 0b10010010, 0b00001001, 0b00000000, 0b01000001, 0b10011010, 0b11111101, 0b00000010, 0b11010000, 0b00001000, 0b00000100, 0b00000001, 0b01110110, 0b01001110, 0b00010000, 0b00000000, 0b00110100, 0b00000100, 0b01010000, 0b00001000, 0b01011101, 0b11111100, 0b10110111, 0b01010010, 0b11001100, 0b11110111, 0b01100011, 0b01001000, 0b11101100, 0b11111111, 0b00000101, 0b00000010, 0b11111110, 0b01011011, 0b00010000, 0b11010010, 0b00101111, 0b00011100, 0b00000100, 0b11111100, 0b00110101, 0b01001001, 0b11000000, 0b00111011, 0b00010000, 0b00000101, 0b01111111, 0b10001000, 0b00000111, 0b11111100, 0b00000001, 0b00000110, 0b11100001, 0b00111111, 0b00010000, 0b10010100, 0b01111000, 0b10000001, 0b00110101, 0b01010001, 0b00001111, 0b00000000, 0b10000001, 0b00000000, 0b01100000, 0b00000001, 0b00000000, 0b00001100, 0b00110000, 0b00100100, 0b00000000, 0b10100000, 0b00110110, 0b01101001, 0b10001100, 0b00100110, 0b11101100, 0b00011100, 0b00111000, 0b01110000, 0b11010000, 0b00101000, 0b01100000, 0b00010001, 0b00011100, 0b00100000, 0b11010011, 0b00010000, 0b01000001, 0b10000100], # Node 484
-[0b10011111, 0b00111001, 0b10111100, 0b11011111, 0b11101000, 0b11001100, 0b00101000, 0b11001010, 0b01011100, 0b10011111, 0b00000111, 0b11101001, 0b11010111, 0b11001101, 0b11011111, 0b01101001, 0b01010000, 0b11110110, 0b10101011, 0b01100011, 0b11010001, 0b10011110, 0b01101011, 0b00101000, 0b10101101, 0b11101010, 0b11010001, 0b01010010, 0b01111111, 0b10111111, 0b10101011, 0b00010010, 0b00001001, 0b00101101, 0b01001111, 0b00101111, 0b11100001, 0b01000000, 0b11111000, 0b10111100, 0b10111101, 0b11111100, 0b11111010, 0b00011100, 0b11110001, 0b01011010, 0b01000010, 0b00100000, 0b00101101, 0b11011011, 0b11000111, 0b01010000, 0b11100111, 0b00001001, 0b00101011, 0b11011101, 0b11101000, 0b01000111, 0b11001001, 0b11101111, 0b11110001, 0b11101111, 0b00101010, 0b11100111, 0b01101000, 0b00101101, 0b11100110, 0b10011010, 0b00101000, 0b01010101, 0b10101011, 0b10100001, 0b01100110, 0b11111011, 0b10100111, 0b11111111, 0b01111011, 0b10010111, 0b10110011, 0b11100110, 0b11001011, 0b10101110, 0b00011011, 0b11101001, 0b10111110, 0b10100001, 0b01111011, 0b11000011, 0b01101100, 0b11101111, 0b11000111, 0b10100100, 0b10101011, 0b11011001, 0b11011111, 0b01111110, 0b00111001, 0b10101111], # Node 485
-[0b00101000, 0b10000100, 0b00011010, 0b11100010, 0b01110100, 0b01000100, 0b10000000, 0b01000100, 0b10100001, 0b10010000, 0b00001000, 0b01000100, 0b10100011, 0b00000000, 0b00001011, 0b00000011, 0b00000000, 0b00000000, 0b00100010, 0b10111000, 0b00001010, 0b01101000, 0b11001000, 0b01001111, 0b00000000, 0b10000010, 0b00011111, 0b00100011, 0b00010101, 0b11111100, 0b01111111, 0b11001111, 0b11110001, 0b00011111, 0b10001110, 0b00000000, 0b00001111, 0b11111000, 0b01001000, 0b11111110, 0b00000001, 0b00001110, 0b11000101, 0b00000101, 0b11100000, 0b10100001, 0b00011110, 0b00000000, 0b01111110, 0b11101010, 0b00000010, 0b11111111, 0b00001001, 0b00111110, 0b01000000, 0b00111011, 0b11101110, 0b00001001, 0b10111100, 0b00000011, 0b01001110, 0b11100000, 0b01000111, 0b01000000, 0b11010010, 0b11011111, 0b00001001, 0b00000110, 0b01100110, 0b11000100, 0b00010001, 0b00010100, 0b00101010, 0b00100000, 0b10110110, 0b11111111, 0b00110100, 0b10100011, 0b11111001, 0b00100011, 0b10000000, 0b10111110, 0b00000000, 0b10000000, 0b00110010, 0b00100111, 0b01001101, 0b00000011, 0b10110010, 0b00010001, 0b10101000, 0b10001001, 0b01111010, 0b10010101, 0b00100100, 0b00010000, 0b01000111, 0b10010101], # Node 486
-[0b11000000, 0b01111001, 0b01000011, 0b01010011, 0b10011100, 0b00111011, 0b11101001, 0b10011011, 0b01001111, 0b10101111, 0b10010100, 0b10111101, 0b10111111, 0b11000100, 0b01001100, 0b01010111, 0b00110110, 0b10111110, 0b11111010, 0b11011011, 0b01100110, 0b11011101, 0b00110101, 0b01001100, 0b11110101, 0b11101101, 0b11011010, 0b00101110, 0b00001111, 0b01110100, 0b10001111, 0b11010011, 0b00100011, 0b10010011, 0b11001101, 0b10110110, 0b01111110, 0b10001111, 0b11010101, 0b01110001, 0b00111111, 0b00011111, 0b01011001, 0b01101010, 0b10001100, 0b11111111, 0b00001010, 0b11110011, 0b01001010, 0b01110111, 0b11110000, 0b10100101, 0b11011001, 0b01011001, 0b11010111, 0b11011111, 0b10101011, 0b00011101, 0b01011000, 0b01010100, 0b01001100, 0b11101011, 0b11111001, 0b00010111, 0b01101101, 0b10001000, 0b10001100, 0b10110000, 0b00010000, 0b10011101, 0b11011111, 0b10000101, 0b01101110, 0b01100101, 0b01001110, 0b10111001, 0b11001010, 0b01101011, 0b10101110, 0b10111111, 0b11111110, 0b00011100, 0b01100111, 0b01011101, 0b01010011, 0b11001110, 0b01100110, 0b11100111, 0b11011001, 0b01101001, 0b11000110, 0b01001101, 0b11001111, 0b11110001, 0b00111101, 0b11101000, 0b00010001, 0b11110101], # Node 487
-[0b01111111, 0b01001111, 0b01011101, 0b11111111, 0b01110110, 0b11110111, 0b01000011, 0b11000111, 0b11111111, 0b01110100, 0b00110111, 0b00001011, 0b00111111, 0b11000011, 0b01111001, 0b10100011, 0b11101111, 0b01011111, 0b00011101, 0b11010010, 0b11011101, 0b01011100, 0b01010100, 0b11000110, 0b11110101, 0b10111101, 0b00000111, 0b01011011, 0b11110111, 0b10110101, 0b01111001, 0b10110111, 0b10110101, 0b10101010, 0b01110111, 0b01111111, 0b10111100, 0b01010000, 0b00001110, 0b00011110, 0b10011001, 0b01111110, 0b11111111, 0b10000111, 0b11010110, 0b01011111, 0b01101111, 0b11001011, 0b00110011, 0b00101111, 0b01101100, 0b01010000, 0b11010101, 0b11000111, 0b10010101, 0b01011101, 0b10110111, 0b10101101, 0b10100110, 0b10011110, 0b01000101, 0b10000101, 0b11111100, 0b10010100, 0b01101010, 0b11110011, 0b11010101, 0b10111111, 0b10001011, 0b01010100, 0b11100001, 0b10000011, 0b11010011, 0b10110001, 0b11100110, 0b11011001, 0b11100110, 0b11011110, 0b10110111, 0b11011100, 0b10111110, 0b00001111, 0b10011111, 0b01101010, 0b00011100, 0b10001101, 0b10101110, 0b01011101, 0b01001111, 0b11111101, 0b10010011, 0b11100110, 0b11111100, 0b00110010, 0b11101100, 0b10011111, 0b01110100, 0b01111101], # Node 488
-[0b11110001, 0b00111010, 0b11101111, 0b11111001, 0b10111110, 0b11111111, 0b10101011, 0b11110111, 0b11101100, 0b10110110, 0b11011010, 0b01110110, 0b01111111, 0b10101011, 0b11011011, 0b11000011, 0b11111000, 0b11111100, 0b11011111, 0b01101100, 0b11111101, 0b11111111, 0b10110000, 0b11110100, 0b00011110, 0b01111101, 0b00001101, 0b11001101, 0b11101011, 0b01101000, 0b01001001, 0b11111011, 0b00100100, 0b00011100, 0b10011001, 0b10011011, 0b01110000, 0b11101101, 0b10111111, 0b11110001, 0b10011101, 0b11111110, 0b10011111, 0b11111001, 0b00010100, 0b11111011, 0b11001001, 0b10101111, 0b11111010, 0b00101111, 0b10110101, 0b00011111, 0b11111110, 0b00110000, 0b10111111, 0b11010101, 0b00011011, 0b10101010, 0b10001110, 0b10111111, 0b11011000, 0b11111101, 0b00111100, 0b11111111, 0b11111101, 0b11101111, 0b11101111, 0b11011011, 0b01010011, 0b10011000, 0b11011101, 0b10010111, 0b11110101, 0b01011101, 0b11000111, 0b01101111, 0b11100110, 0b01101111, 0b01010000, 0b11010011, 0b11001110, 0b00010111, 0b00010000, 0b10111111, 0b11101101, 0b00010101, 0b00101011, 0b10111100, 0b10011011, 0b00001110, 0b11110110, 0b11111101, 0b11000111, 0b11101011, 0b11010110, 0b11100100, 0b10111111, 0b11011111], # Node 489
-[0b00000011, 0b00000101, 0b11010100, 0b00010000, 0b10000100, 0b10000011, 0b01000111, 0b10001100, 0b01000101, 0b01011100, 0b11000001, 0b10010001, 0b10110010, 0b11000101, 0b00010010, 0b10000000, 0b00111011, 0b00000001, 0b00000010, 0b11000101, 0b10101111, 0b00110011, 0b01111111, 0b10100101, 0b00101001, 0b01101000, 0b00010111, 0b01010100, 0b10000001, 0b00010010, 0b11111100, 0b01000000, 0b11111100, 0b01100010, 0b10000100, 0b10010100, 0b10000101, 0b10110101, 0b00110001, 0b10011101, 0b10001011, 0b11100100, 0b11111011, 0b00010011, 0b01110001, 0b10110000, 0b00011100, 0b00100001, 0b00000100, 0b10000000, 0b10100010, 0b10100100, 0b00101111, 0b10111100, 0b00101000, 0b01001000, 0b01110100, 0b00011101, 0b10000110, 0b00111001, 0b11010100, 0b11011000, 0b11110111, 0b10000010, 0b00010010, 0b00100110, 0b10100000, 0b01011010, 0b11101011, 0b10000110, 0b00001001, 0b00010000, 0b01011100, 0b11111111, 0b10000101, 0b10101101, 0b00111100, 0b10011100, 0b00110000, 0b11101101, 0b11010100, 0b10011001, 0b10111000, 0b10101100, 0b01001101, 0b01100100, 0b01101010, 0b00011110, 0b11100100, 0b10111101, 0b00010001, 0b01010000, 0b11100001, 0b11000011, 0b00100001, 0b11110110, 0b00010011, 0b11001101], # Node 490
-[0b11010111, 0b10110100, 0b00110100, 0b01010100, 0b10001010, 0b10001101, 0b10000111, 0b11011100, 0b00000000, 0b00000000, 0b00101101, 0b00000010, 0b00000000, 0b11000000, 0b00000101, 0b11100000, 0b10100000, 0b11101011, 0b10000000, 0b11111111, 0b01110011, 0b01111111, 0b11111111, 0b11110001, 0b10101111, 0b11111111, 0b11100011, 0b11111111, 0b11111111, 0b11111111, 0b11111111, 0b11111111, 0b11111111, 0b11111110, 0b11111111, 0b11111100, 0b11111011, 0b11111111, 0b11101111, 0b00100111, 0b00011111, 0b01111101, 0b00001111, 0b01100000, 0b00000000, 0b11101110, 0b00000000, 0b10000000, 0b00010000, 0b00000110, 0b00000000, 0b10001000, 0b01010001, 0b00000000, 0b10000000, 0b10011111, 0b00001110, 0b00100000, 0b10101000, 0b00100000, 0b00000011, 0b00000000, 0b10000010, 0b01000110, 0b00011000, 0b00000000, 0b11110000, 0b01111111, 0b00000111, 0b10000000, 0b11000010, 0b01111111, 0b01000010, 0b01000100, 0b11111101, 0b11111111, 0b10000111, 0b11000100, 0b11111111, 0b01111111, 0b01010100, 0b11111111, 0b11111111, 0b00100000, 0b00111001, 0b11111100, 0b00000011, 0b10100100, 0b00000001, 0b00000100, 0b11010000, 0b00001110, 0b10000000, 0b01001011, 0b11001110, 0b01110011, 0b11100111, 0b10111110], # Node 491
-[0b00110000, 0b00110000, 0b11100100, 0b01010011, 0b11010010, 0b00000010, 0b00101100, 0b01010011, 0b10011111, 0b00000000, 0b00001001, 0b11101010, 0b01110111, 0b10010001, 0b00000011, 0b11111000, 0b00000011, 0b00100010, 0b11000000, 0b01111111, 0b00100000, 0b00000110, 0b11111100, 0b10000011, 0b11010000, 0b11000000, 0b00001110, 0b00000000, 0b10000000, 0b10011101, 0b00000000, 0b00101001, 0b01100100, 0b01000010, 0b10110000, 0b00001000, 0b00010110, 0b00010000, 0b01000110, 0b11110010, 0b01000111, 0b01110000, 0b00011100, 0b00011111, 0b00000000, 0b10001100, 0b11111000, 0b10000000, 0b00001000, 0b10000000, 0b10101111, 0b11010000, 0b00000111, 0b11111000, 0b01110110, 0b01011110, 0b10000001, 0b11111111, 0b11110111, 0b10000001, 0b11111010, 0b11011111, 0b00011011, 0b10110000, 0b01111101, 0b11111101, 0b10110001, 0b11111000, 0b11100111, 0b01100111, 0b00010010, 0b01111111, 0b00101111, 0b00000010, 0b10000011, 0b11111011, 0b10100111, 0b00010000, 0b00000000, 0b01011101, 0b11100111, 0b00000100, 0b01001000, 0b00011101, 0b00000100, 0b10000000, 0b10001000, 0b00100001, 0b10110000, 0b01000000, 0b01010000, 0b00100000, 0b00101000, 0b00010101, 0b11000000, 0b00010000, 0b00000000, 0b00111000], # Node 492
-[0b01111100, 0b10111001, 0b11000000, 0b11100101, 0b01011001, 0b11001010, 0b01101101, 0b10101100, 0b11111111, 0b00000000, 0b10000010, 0b11101101, 0b00000010, 0b11010000, 0b11000010, 0b00000011, 0b00000000, 0b01101000, 0b01111100, 0b11111100, 0b00000010, 0b11100101, 0b10000110, 0b00000011, 0b11001000, 0b01111111, 0b01010000, 0b10000000, 0b00001110, 0b10111111, 0b11011111, 0b11101000, 0b11111111, 0b11111111, 0b00001111, 0b01111110, 0b00001011, 0b11111111, 0b11101001, 0b01001111, 0b11000000, 0b00011111, 0b11111110, 0b00000000, 0b11111100, 0b11101111, 0b00001111, 0b01000000, 0b11111111, 0b11111110, 0b00000011, 0b11111110, 0b10000111, 0b00111111, 0b11110000, 0b01111111, 0b11110001, 0b10000111, 0b11111111, 0b00001110, 0b11111110, 0b11111100, 0b11110111, 0b11000000, 0b11111111, 0b01101111, 0b00110111, 0b11111000, 0b11111111, 0b01110011, 0b00000011, 0b00000110, 0b00100000, 0b00011111, 0b00000000, 0b00000000, 0b01111000, 0b11100001, 0b00000111, 0b01101000, 0b00110111, 0b11100000, 0b10001001, 0b00111100, 0b00000001, 0b00000000, 0b01100000, 0b00110110, 0b00000000, 0b00000000, 0b10101000, 0b00110111, 0b11010000, 0b00001011, 0b11000110, 0b00100110, 0b11111111, 0b01000000], # Node 493
-[0b10111101, 0b11111110, 0b11100111, 0b11000101, 0b10110101, 0b11000000, 0b00101001, 0b10111100, 0b01101011, 0b11100111, 0b00011011, 0b10101100, 0b01110001, 0b11110010, 0b01101001, 0b11111110, 0b10101001, 0b10110110, 0b01010111, 0b00111100, 0b10110000, 0b10011111, 0b00111101, 0b10110111, 0b10110101, 0b01110000, 0b11001011, 0b11101101, 0b01111011, 0b10000001, 0b11101111, 0b01111100, 0b01110001, 0b11110111, 0b11110110, 0b00110111, 0b11100000, 0b11110011, 0b11101111, 0b00101111, 0b00011011, 0b11110010, 0b10011101, 0b01000000, 0b11010111, 0b00110011, 0b11011111, 0b00001111, 0b11101101, 0b01111001, 0b10101000, 0b10111010, 0b11111101, 0b01111010, 0b11010010, 0b00010010, 0b01110000, 0b00001101, 0b01010110, 0b00011111, 0b10001110, 0b11001101, 0b00001110, 0b01110101, 0b10001011, 0b10111111, 0b11001110, 0b01101001, 0b01010101, 0b11101010, 0b01110100, 0b11001001, 0b11110110, 0b11111011, 0b01000001, 0b11100111, 0b01101000, 0b00000010, 0b00111100, 0b01011100, 0b00011101, 0b11111101, 0b01101001, 0b00101101, 0b00110011, 0b00000111, 0b10011100, 0b11000001, 0b10000101, 0b01111110, 0b11001110, 0b11101100, 0b01001000, 0b01111001, 0b11001000, 0b10000110, 0b10101101, 0b11001000], # Node 494
-[0b00001011, 0b10001000, 0b00001001, 0b00101100, 0b00000000, 0b01100110, 0b00010001, 0b01001000, 0b11001100, 0b10010000, 0b00000010, 0b11100001, 0b01000011, 0b00011010, 0b00000101, 0b00000101, 0b11101001, 0b10000010, 0b10100000, 0b11100000, 0b10000010, 0b10110010, 0b00010000, 0b00000111, 0b11000001, 0b11010011, 0b10000100, 0b11010100, 0b00100110, 0b00010010, 0b10101011, 0b01000010, 0b01010010, 0b10100011, 0b10000001, 0b01000110, 0b01011000, 0b01011010, 0b00000001, 0b11111100, 0b10010011, 0b10000010, 0b10001111, 0b01110101, 0b00110111, 0b00100111, 0b00000100, 0b11100000, 0b00001010, 0b10000000, 0b11000110, 0b11001001, 0b00011100, 0b10000000, 0b01010011, 0b00011010, 0b01110000, 0b00111000, 0b10110100, 0b10000000, 0b11111011, 0b01001101, 0b00101000, 0b11011000, 0b10010010, 0b00011110, 0b01111000, 0b01001010, 0b10011110, 0b11000111, 0b01000110, 0b01100011, 0b00101100, 0b10000100, 0b01000100, 0b11001110, 0b01011110, 0b00000001, 0b11010101, 0b00010001, 0b11000000, 0b10010011, 0b00000110, 0b00000010, 0b01011000, 0b11000100, 0b00101000, 0b11010011, 0b11100000, 0b10000110, 0b10001010, 0b10001111, 0b10101110, 0b00000010, 0b01001101, 0b01100000, 0b10000000, 0b00010001], # Node 495
-[0b11001111, 0b01110110, 0b11111100, 0b01110101, 0b10001000, 0b11101101, 0b01111100, 0b10011011, 0b00101100, 0b11111101, 0b01010010, 0b01110111, 0b00001010, 0b01010011, 0b11001001, 0b01101110, 0b10000101, 0b01000111, 0b00111101, 0b01001111, 0b11011111, 0b00100111, 0b11000010, 0b11010010, 0b11100101, 0b01101110, 0b11101011, 0b10100111, 0b00111111, 0b01111010, 0b10001011, 0b00110101, 0b01010010, 0b00111100, 0b11010001, 0b10110011, 0b01110010, 0b00011000, 0b10111011, 0b11110101, 0b11110100, 0b11011100, 0b01111110, 0b00101011, 0b01101000, 0b01010101, 0b01111101, 0b11001001, 0b00101101, 0b11111101, 0b10011011, 0b10011001, 0b10011101, 0b10110100, 0b01010010, 0b11110001, 0b01100011, 0b10111111, 0b11110011, 0b01000101, 0b00001101, 0b11100110, 0b11100011, 0b11011000, 0b11101010, 0b01100011, 0b00001101, 0b00100100, 0b10101110, 0b10111100, 0b01100111, 0b00010010, 0b10011100, 0b00010100, 0b01011110, 0b00010110, 0b10110101, 0b00010101, 0b00100101, 0b01111011, 0b11100111, 0b00111111, 0b00110010, 0b11111110, 0b00100111, 0b10111101, 0b11111110, 0b00000001, 0b11101010, 0b01010001, 0b11000110, 0b00110010, 0b10011010, 0b01101000, 0b01110111, 0b10000110, 0b00110110, 0b00000111], # Node 496
-[0b11010111, 0b00010001, 0b00101101, 0b10001011, 0b00111110, 0b10111100, 0b01010101, 0b11011001, 0b11010011, 0b11100011, 0b00110111, 0b11101011, 0b11001011, 0b10011110, 0b11111110, 0b10110101, 0b11001101, 0b01111000, 0b01010100, 0b11100110, 0b01101110, 0b10001100, 0b10100110, 0b01111001, 0b00110011, 0b10110111, 0b00010100, 0b10011001, 0b11101010, 0b11010001, 0b11110010, 0b00100101, 0b10101000, 0b01101110, 0b11011111, 0b00111111, 0b10010100, 0b11010000, 0b01001100, 0b01010100, 0b01101111, 0b11011110, 0b00111011, 0b10100011, 0b01110100, 0b01011001, 0b10011001, 0b01010000, 0b00000010, 0b11000110, 0b10010101, 0b00101111, 0b01000100, 0b11111000, 0b01101101, 0b10101111, 0b10111111, 0b00101000, 0b00111100, 0b11100010, 0b01010011, 0b01000011, 0b01101110, 0b00110101, 0b11001001, 0b00110110, 0b11001000, 0b11110010, 0b01100011, 0b10011111, 0b10100111, 0b01100110, 0b11001000, 0b11010101, 0b10011000, 0b00110001, 0b01100111, 0b11111110, 0b11000110, 0b01101001, 0b11110101, 0b10110111, 0b00110110, 0b11000001, 0b01001001, 0b00010110, 0b11111011, 0b00001010, 0b11100110, 0b00010101, 0b01110100, 0b00111110, 0b00010001, 0b11001011, 0b11011110, 0b11111010, 0b10001011, 0b01111011], # Node 497
-[0b11010100, 0b00000100, 0b00001000, 0b10001000, 0b00011000, 0b11010101, 0b01000111, 0b00000110, 0b00010000, 0b01000000, 0b10100000, 0b01000011, 0b00111001, 0b01011011, 0b00100010, 0b10110001, 0b00100011, 0b11101011, 0b00000100, 0b11010001, 0b00101100, 0b01001101, 0b01000100, 0b10001010, 0b10101100, 0b00010101, 0b00000011, 0b00000010, 0b00001110, 0b00111010, 0b00011100, 0b10001101, 0b00111010, 0b00011001, 0b00011100, 0b01010001, 0b00100100, 0b01010001, 0b00111101, 0b10110101, 0b10110000, 0b11101010, 0b11010100, 0b11111111, 0b11110110, 0b00000100, 0b00010110, 0b10001111, 0b00110100, 0b00010100, 0b11100001, 0b10011001, 0b11000010, 0b10111001, 0b01000001, 0b00011111, 0b11011011, 0b11101011, 0b01100110, 0b10000010, 0b00001110, 0b01100101, 0b01111101, 0b00100100, 0b10110111, 0b11010110, 0b00110110, 0b10110100, 0b00001001, 0b00010000, 0b11010110, 0b11110001, 0b00010011, 0b00001001, 0b00011100, 0b11110000, 0b10000110, 0b11111110, 0b01111010, 0b00110000, 0b00001110, 0b01100000, 0b00101001, 0b00100000, 0b11000001, 0b00100111, 0b00111001, 0b01001010, 0b11110001, 0b00111110, 0b00101011, 0b01000110, 0b11111110, 0b00001011, 0b11000000, 0b00010010, 0b11001100, 0b01010010], # Node 498
-[0b01111110, 0b11010101, 0b11101111, 0b10011011, 0b11001111, 0b10101001, 0b01111011, 0b01111111, 0b10111011, 0b11110010, 0b00110000, 0b10011010, 0b10111111, 0b01111111, 0b01101111, 0b00111111, 0b01111000, 0b11100111, 0b01111110, 0b10010000, 0b10100111, 0b10010011, 0b10100010, 0b11110010, 0b00101011, 0b00111111, 0b11011000, 0b01111111, 0b10110011, 0b10000011, 0b11110101, 0b11110011, 0b10001110, 0b10100110, 0b01111111, 0b10011111, 0b10111111, 0b11111001, 0b11010111, 0b10111001, 0b01001111, 0b11111111, 0b10111101, 0b01111101, 0b11110100, 0b10011110, 0b10000101, 0b10000001, 0b11011111, 0b10110111, 0b10101110, 0b11101100, 0b00111011, 0b10111001, 0b00100101, 0b10111110, 0b11100011, 0b00010011, 0b10011110, 0b01001000, 0b01111111, 0b01010100, 0b11111101, 0b11110001, 0b11001000, 0b10110011, 0b01111000, 0b11111111, 0b00010100, 0b00110111, 0b11100011, 0b11110111, 0b11011000, 0b10101100, 0b11110111, 0b00010011, 0b00101101, 0b11110011, 0b00110111, 0b01111000, 0b11111001, 0b11111111, 0b11101101, 0b11000100, 0b11011001, 0b00010111, 0b11101100, 0b01111011, 0b10111001, 0b11110011, 0b01111111, 0b00100011, 0b10110001, 0b10101011, 0b01101110, 0b00111101, 0b10111101, 0b00111010], # Node 499
-[0b00110000, 0b01111011, 0b00101011, 0b11111100, 0b00111001, 0b11000010, 0b00000011, 0b10011011, 0b01011110, 0b00110111, 0b11011101, 0b10111001, 0b11000101, 0b01110101, 0b11100101, 0b00101110, 0b10000011, 0b11011011, 0b11111100, 0b11100011, 0b00011100, 0b11010111, 0b10010100, 0b01101101, 0b10100011, 0b10101101, 0b11010000, 0b11110001, 0b00110111, 0b01111100, 0b11001010, 0b01000011, 0b01101111, 0b11010001, 0b10001011, 0b11101001, 0b01000101, 0b10000110, 0b00010101, 0b11101110, 0b10011001, 0b11101011, 0b11001011, 0b00001110, 0b01001010, 0b01101001, 0b10001000, 0b00110011, 0b10001101, 0b11110111, 0b10100000, 0b11001101, 0b00100111, 0b01110010, 0b11100011, 0b11101111, 0b01110001, 0b01110011, 0b01000111, 0b11000001, 0b01000011, 0b01111111, 0b10100100, 0b00001101, 0b11000000, 0b01000000, 0b10111011, 0b11110110, 0b10101011, 0b10111110, 0b10101010, 0b00010111, 0b00001100, 0b10011001, 0b00111100, 0b11000000, 0b00011101, 0b10111001, 0b01111110, 0b10110010, 0b01100111, 0b01010110, 0b00111110, 0b00001110, 0b10011011, 0b00100011, 0b11111111, 0b10000110, 0b11010101, 0b01010101, 0b01101111, 0b00111101, 0b00000100, 0b10111100, 0b01011111, 0b10011101, 0b11010110, 0b11100011], # Node 500
-[0b10010110, 0b10000010, 0b01110110, 0b00100000, 0b00100111, 0b10101001, 0b00000100, 0b00110001, 0b11000000, 0b00011100, 0b01101010, 0b01001101, 0b00000110, 0b10001000, 0b00101010, 0b10010000, 0b00111001, 0b00001100, 0b00110100, 0b00111010, 0b01010010, 0b10011010, 0b00011010, 0b10011100, 0b01000001, 0b11100010, 0b10100010, 0b00001001, 0b10111001, 0b01110111, 0b10001001, 0b00000010, 0b00001100, 0b10010001, 0b01101100, 0b01110100, 0b00011110, 0b11001110, 0b00010100, 0b10010010, 0b10000001, 0b11001001, 0b01000001, 0b10010110, 0b00011001, 0b11001110, 0b00101000, 0b10111100, 0b10000010, 0b01011010, 0b11110000, 0b00111110, 0b11010100, 0b10111101, 0b01001111, 0b00101111, 0b10010010, 0b00110001, 0b00011101, 0b11110101, 0b00001011, 0b01011100, 0b00101001, 0b01111100, 0b00111001, 0b10100110, 0b11000010, 0b11001000, 0b11100010, 0b10000010, 0b11010010, 0b01001011, 0b10100111, 0b10101000, 0b01110100, 0b01101110, 0b00001010, 0b00010111, 0b00110100, 0b00010110, 0b01000010, 0b10001100, 0b01011100, 0b00000110, 0b01100100, 0b10010000, 0b10000010, 0b01010100, 0b01000010, 0b11011000, 0b00000000, 0b11110110, 0b01000101, 0b00010010, 0b01010000, 0b10110100, 0b11001000, 0b11000000], # Node 501
-[0b10110001, 0b01111101, 0b00011111, 0b11001111, 0b01101110, 0b10100101, 0b11011011, 0b00110110, 0b00111001, 0b10110111, 0b11011000, 0b11011101, 0b00111010, 0b01111010, 0b11011111, 0b00111110, 0b11110101, 0b01110111, 0b01000001, 0b10001001, 0b01111101, 0b10011100, 0b01000010, 0b00011111, 0b01111110, 0b01111011, 0b11111110, 0b10111001, 0b01001100, 0b01111111, 0b00100110, 0b10001100, 0b11111111, 0b00100001, 0b00111100, 0b01110000, 0b11001101, 0b10011001, 0b01011110, 0b10101110, 0b11111101, 0b11111001, 0b11110100, 0b11101110, 0b10111111, 0b01111111, 0b11101111, 0b10001100, 0b10110111, 0b11111010, 0b11010011, 0b11001000, 0b11101100, 0b11111111, 0b11001000, 0b01111111, 0b10010111, 0b01000101, 0b11100010, 0b00100111, 0b10100101, 0b11000100, 0b01011010, 0b00001111, 0b01011011, 0b11110101, 0b00111111, 0b00010000, 0b11000000, 0b11111001, 0b00100111, 0b11000010, 0b11000100, 0b00100011, 0b11110101, 0b11100000, 0b11001111, 0b01011101, 0b10111011, 0b01111111, 0b10100111, 0b11010101, 0b11111111, 0b11100101, 0b00010011, 0b11010101, 0b00111101, 0b11100001, 0b00111111, 0b10000011, 0b10011111, 0b01110001, 0b00111001, 0b11110010, 0b11101001, 0b10101111, 0b11001011, 0b01000000], # Node 502
-[0b11011111, 0b10001101, 0b01101100, 0b11110111, 0b11101000, 0b01011111, 0b01100001, 0b01101101, 0b01001111, 0b10110100, 0b10111011, 0b10111110, 0b01111100, 0b01100110, 0b01110111, 0b10001000, 0b11011111, 0b11110011, 0b10101011, 0b01101001, 0b10101101, 0b11000011, 0b10000011, 0b01001100, 0b00111000, 0b00110001, 0b10111011, 0b00100110, 0b11001100, 0b11101000, 0b00011000, 0b01010001, 0b01101010, 0b00101001, 0b00011001, 0b01111001, 0b01011111, 0b11111110, 0b00101011, 0b10101101, 0b10111110, 0b11110111, 0b10011110, 0b01110110, 0b01000111, 0b10110101, 0b11100100, 0b00101110, 0b01111101, 0b00000000, 0b11000110, 0b01000010, 0b10101101, 0b11001110, 0b01111110, 0b11110010, 0b10110111, 0b11101010, 0b00100001, 0b01101101, 0b01111110, 0b10110010, 0b10111111, 0b01010110, 0b11010111, 0b10110010, 0b01011011, 0b10111001, 0b00101110, 0b11110011, 0b00101010, 0b00100101, 0b11011011, 0b11111100, 0b11011111, 0b11100100, 0b10110110, 0b00110111, 0b00110110, 0b11100100, 0b01001010, 0b11111010, 0b00110100, 0b11101010, 0b01101100, 0b11110011, 0b10111010, 0b00110011, 0b10111010, 0b11111010, 0b01011000, 0b11111001, 0b00011110, 0b11101101, 0b10110110, 0b01111010, 0b01110011, 0b10011101], # Node 503
-[0b10000011, 0b00101010, 0b10110000, 0b10110100, 0b01000001, 0b01111110, 0b01100000, 0b01110000, 0b01100011, 0b00101010, 0b01011001, 0b00100100, 0b10111010, 0b01111001, 0b10000011, 0b10001010, 0b00010110, 0b00101000, 0b10011010, 0b11111000, 0b00100110, 0b00001001, 0b00111110, 0b10111110, 0b11010101, 0b10001001, 0b00001010, 0b11111100, 0b11100111, 0b01100011, 0b10010010, 0b11110101, 0b01011011, 0b10111111, 0b01110111, 0b11100000, 0b11101001, 0b01111101, 0b01100001, 0b01000011, 0b10011001, 0b10001011, 0b00001101, 0b11101110, 0b11111010, 0b01000010, 0b00110000, 0b10111101, 0b00100110, 0b00000101, 0b10000001, 0b00110011, 0b00000000, 0b11000010, 0b11100111, 0b01110001, 0b01001100, 0b00100001, 0b01101010, 0b11100110, 0b01000000, 0b10101011, 0b01111011, 0b00100001, 0b10001010, 0b00000000, 0b01111000, 0b11100010, 0b00111100, 0b10011010, 0b11000111, 0b01000010, 0b00100110, 0b10110011, 0b00000000, 0b01111101, 0b00101011, 0b00001001, 0b01011011, 0b00001100, 0b00000101, 0b11110010, 0b00001000, 0b00001101, 0b10011011, 0b11001010, 0b11000000, 0b00001010, 0b01111000, 0b10101101, 0b00111100, 0b00000110, 0b10010000, 0b00000001, 0b10011100, 0b00111001, 0b10001000, 0b10111101], # Node 504
-[0b00100110, 0b01011101, 0b00111010, 0b00101010, 0b10010100, 0b01000001, 0b00010010, 0b00100110, 0b00000000, 0b00000000, 0b10110110, 0b00000000, 0b00000000, 0b10000000, 0b10000010, 0b00011001, 0b00000110, 0b11111001, 0b01110100, 0b01010000, 0b10110111, 0b00011000, 0b00101110, 0b11110100, 0b10101101, 0b00000000, 0b00000000, 0b01111100, 0b01101100, 0b01110100, 0b11110010, 0b11110111, 0b11111111, 0b11111111, 0b00111111, 0b11011111, 0b11111111, 0b00000000, 0b11110111, 0b11111111, 0b00000011, 0b11100000, 0b11111111, 0b00011111, 0b00000000, 0b11110100, 0b01111011, 0b10000000, 0b00111100, 0b00111101, 0b00000001, 0b11010000, 0b01101001, 0b00001011, 0b10000000, 0b00011111, 0b00000011, 0b00000000, 0b11111000, 0b01100001, 0b00000110, 0b11100000, 0b00011111, 0b00100010, 0b00000000, 0b01111010, 0b10110100, 0b00010111, 0b11000000, 0b11010111, 0b11110111, 0b01111101, 0b11101110, 0b00011000, 0b11111100, 0b01011101, 0b10000011, 0b00000010, 0b11111111, 0b00111111, 0b00011100, 0b11100000, 0b00011111, 0b00010000, 0b11100100, 0b10111111, 0b10001011, 0b11110001, 0b11111111, 0b11111011, 0b10011110, 0b11000010, 0b11111111, 0b01101111, 0b00110111, 0b11111011, 0b11110111, 0b10000110], # Node 505
-[0b00000110, 0b11111011, 0b00011111, 0b01110000, 0b01110001, 0b00010010, 0b00001011, 0b00011000, 0b01010101, 0b00110010, 0b00100010, 0b00001000, 0b01010011, 0b10001001, 0b00000000, 0b10000000, 0b01101011, 0b01101010, 0b10011000, 0b00100110, 0b01000111, 0b10000110, 0b01001101, 0b11100011, 0b10111010, 0b00001000, 0b10111000, 0b10101100, 0b10100010, 0b01111010, 0b00111101, 0b00011001, 0b11001100, 0b10000010, 0b00110001, 0b11101100, 0b11011000, 0b01001101, 0b00100010, 0b10000001, 0b10111111, 0b11001011, 0b01101001, 0b01000010, 0b01110101, 0b11000100, 0b01000000, 0b01100101, 0b01000000, 0b00110000, 0b10101001, 0b01000100, 0b01010100, 0b00000001, 0b00100100, 0b00010111, 0b01101000, 0b10100010, 0b11101010, 0b11001110, 0b00011000, 0b11101100, 0b10000101, 0b01111010, 0b11000010, 0b11010110, 0b11101110, 0b01111010, 0b00100000, 0b00101011, 0b00100110, 0b11101111, 0b00100111, 0b01000000, 0b11000011, 0b10101011, 0b00001100, 0b00000001, 0b11100010, 0b10101000, 0b00010000, 0b11101000, 0b10111111, 0b00100001, 0b00001010, 0b01100110, 0b00010010, 0b01000000, 0b00000011, 0b11000011, 0b00011011, 0b00110000, 0b01011011, 0b11100010, 0b00110100, 0b10000010, 0b10100000, 0b10100100], # Node 506
-[0b11011000, 0b10101011, 0b10111111, 0b00001111, 0b11100100, 0b00000010, 0b11111101, 0b10000011, 0b01011011, 0b11001101, 0b11101111, 0b00001111, 0b01010000, 0b01111011, 0b10011111, 0b11011100, 0b10111010, 0b11100101, 0b01100011, 0b10000010, 0b11110001, 0b10110110, 0b00010001, 0b11110001, 0b11111100, 0b10100000, 0b00100111, 0b11011101, 0b01000110, 0b11111011, 0b10101000, 0b10101011, 0b10001011, 0b10011000, 0b11111111, 0b10101001, 0b00010110, 0b11110000, 0b11011001, 0b11001110, 0b00010101, 0b01011110, 0b10110100, 0b01011111, 0b11111001, 0b10010011, 0b01111100, 0b10110000, 0b10111111, 0b01011011, 0b01101011, 0b01001010, 0b10101011, 0b11111001, 0b01100111, 0b00101011, 0b10011110, 0b01101010, 0b11111001, 0b10101111, 0b11111100, 0b01110101, 0b11011010, 0b00110111, 0b00011110, 0b11111010, 0b11110111, 0b11001110, 0b11100100, 0b11000000, 0b00110101, 0b01011011, 0b10001101, 0b01011101, 0b11101110, 0b10101110, 0b00101001, 0b00110111, 0b00011011, 0b10010000, 0b10111110, 0b01101000, 0b01000110, 0b00000101, 0b11111000, 0b01101100, 0b10101110, 0b01110101, 0b01000101, 0b10000101, 0b10101000, 0b11101010, 0b11100101, 0b11101110, 0b01011110, 0b00110101, 0b10110011, 0b11010111], # Node 507
-[0b01010110, 0b10101011, 0b01001100, 0b00000001, 0b11000100, 0b10000110, 0b00011010, 0b01000001, 0b11000111, 0b01100000, 0b11001001, 0b11110010, 0b10011010, 0b10011100, 0b11110001, 0b00100001, 0b11100101, 0b10000011, 0b11000010, 0b11111000, 0b10110101, 0b01001010, 0b11110010, 0b00111111, 0b10110010, 0b10110100, 0b00101101, 0b01110000, 0b11111001, 0b11100100, 0b01111001, 0b00001101, 0b11011110, 0b01110101, 0b11000010, 0b10010010, 0b10010000, 0b11101001, 0b00001001, 0b10010011, 0b11000110, 0b00010110, 0b00101010, 0b10100001, 0b00110101, 0b00100001, 0b10100010, 0b00010110, 0b00100000, 0b11010000, 0b01111010, 0b00010010, 0b00010100, 0b00101101, 0b00011110, 0b00111100, 0b10010101, 0b11001000, 0b00111000, 0b00110110, 0b11101101, 0b10000111, 0b10110011, 0b10000000, 0b01011000, 0b10101100, 0b00110010, 0b10110001, 0b10001100, 0b00010000, 0b10001001, 0b10000101, 0b11011011, 0b11101011, 0b00001100, 0b11011010, 0b00010111, 0b00011110, 0b10101111, 0b00101111, 0b00000101, 0b00001001, 0b10010001, 0b00111100, 0b00100100, 0b01001101, 0b10110101, 0b01001000, 0b01010000, 0b11001000, 0b01010000, 0b00000000, 0b00111001, 0b10101110, 0b11101010, 0b00101011, 0b10001101, 0b11110010], # Node 508
-[0b01101001, 0b01011001, 0b11111100, 0b01101010, 0b00101100, 0b11101111, 0b11011110, 0b10011111, 0b10000011, 0b10111100, 0b11101010, 0b11000111, 0b00110000, 0b11011111, 0b10010101, 0b11011100, 0b11110100, 0b10111110, 0b11001100, 0b01010111, 0b11001010, 0b10010011, 0b11101011, 0b00110110, 0b00110011, 0b00011000, 0b01101100, 0b01001110, 0b01111000, 0b10001100, 0b01100001, 0b10110101, 0b01111011, 0b01000001, 0b01001001, 0b00000011, 0b01010000, 0b00101010, 0b00110001, 0b01111110, 0b01001001, 0b10110001, 0b10001101, 0b00100101, 0b01011101, 0b00100101, 0b10000110, 0b00110101, 0b10111111, 0b10011011, 0b00011010, 0b01101000, 0b01110010, 0b00111000, 0b11110100, 0b10010100, 0b11110011, 0b00111001, 0b10111101, 0b10110100, 0b00101010, 0b01001001, 0b11001100, 0b01110000, 0b01011101, 0b10001001, 0b01111010, 0b01100001, 0b01111111, 0b11111011, 0b01011011, 0b00011001, 0b10000110, 0b10111010, 0b10100011, 0b01010001, 0b00011010, 0b11001111, 0b01011010, 0b11101111, 0b11100110, 0b00110110, 0b01101001, 0b11000010, 0b01100110, 0b01111011, 0b11011110, 0b11110110, 0b11111011, 0b11101110, 0b00111111, 0b01100110, 0b11011101, 0b10001101, 0b11101100, 0b11010010, 0b11111000, 0b10101100], # Node 509
-[0b00000100, 0b01100000, 0b11110101, 0b10010010, 0b11100010, 0b10000101, 0b01010010, 0b00010000, 0b10001000, 0b00000001, 0b00100001, 0b11101110, 0b00001110, 0b00001110, 0b00010001, 0b11100100, 0b00110111, 0b01000001, 0b10111011, 0b10001011, 0b10010000, 0b01110010, 0b01111011, 0b00000101, 0b00100010, 0b10011000, 0b10001110, 0b01010001, 0b00101110, 0b10101111, 0b01110110, 0b01110011, 0b11011110, 0b00001100, 0b11000100, 0b01111001, 0b10101010, 0b00011100, 0b01000001, 0b01001100, 0b11010100, 0b00100000, 0b01011000, 0b11011011, 0b11011011, 0b11111011, 0b11101000, 0b00100011, 0b01000001, 0b01010001, 0b01011110, 0b11101101, 0b00110110, 0b00000010, 0b10101100, 0b10001000, 0b10110001, 0b11111101, 0b01011100, 0b00101011, 0b00001001, 0b00110000, 0b01001101, 0b01000000, 0b00101101, 0b01100010, 0b01101000, 0b11101111, 0b01100011, 0b10101010, 0b00011101, 0b00100111, 0b00100101, 0b00101100, 0b01111000, 0b01010011, 0b10001001, 0b01001111, 0b01010100, 0b01000011, 0b01001111, 0b01100001, 0b10000000, 0b01110110, 0b10101000, 0b01101101, 0b11010100, 0b00001111, 0b10100000, 0b01011001, 0b00000110, 0b00000011, 0b00101000, 0b10000000, 0b01000010, 0b01111000, 0b01011101, 0b00010110], # Node 510
-[0b01101100, 0b11011111, 0b00011101, 0b10111011, 0b11111000, 0b01110111, 0b01101011, 0b11111001, 0b10000110, 0b10110011, 0b01111110, 0b10101110, 0b11101111, 0b10010010, 0b11111111, 0b00000011, 0b11011110, 0b01111111, 0b00110101, 0b10110010, 0b01011100, 0b00101110, 0b10000011, 0b01000000, 0b10010111, 0b10001111, 0b00100101, 0b01101110, 0b11111110, 0b11101110, 0b01011000, 0b01011110, 0b01100011, 0b01000111, 0b10111010, 0b11111111, 0b00010111, 0b10110010, 0b00011100, 0b00001111, 0b10011110, 0b10011000, 0b11110110, 0b01101111, 0b11111001, 0b11011111, 0b11111111, 0b10001010, 0b01101110, 0b01111111, 0b00001111, 0b11001001, 0b11111111, 0b10011111, 0b01011001, 0b10101101, 0b11011001, 0b10001010, 0b01101001, 0b10010011, 0b11011001, 0b01001111, 0b01110110, 0b00101111, 0b00011011, 0b10000001, 0b11011101, 0b00101001, 0b01110001, 0b10111011, 0b01101111, 0b01001110, 0b10011000, 0b00111010, 0b01100001, 0b01110101, 0b11110110, 0b00001110, 0b10101001, 0b10100011, 0b10010110, 0b11001100, 0b11001111, 0b11101110, 0b10000111, 0b10101110, 0b00001111, 0b11001011, 0b00111111, 0b11010101, 0b00101011, 0b01110010, 0b11011011, 0b00101111, 0b11101010, 0b00110111, 0b11111101, 0b10110101], # Node 511
-],
-### LAYER
-[
-[0b01011111, 0b11101010, 0b10101100, 0b00001011, 0b00001101, 0b01000111, 0b01011100, 0b11000011, 0b10101000, 0b00100000, 0b00100101, 0b11111000, 0b01110110, 0b00110100, 0b11000000, 0b10110100, 0b11110010, 0b01010010, 0b11110110, 0b11001001, 0b11000011, 0b00011000, 0b01111010, 0b01100011, 0b01100011, 0b01110101, 0b01001001, 0b10001101, 0b00011000, 0b00111100, 0b11000011, 0b01001000, 0b10000100, 0b10111101, 0b00100011, 0b00000111, 0b01001100, 0b00010001, 0b11000111, 0b01101001, 0b01111010, 0b01111000, 0b00011111, 0b01100010, 0b10100100, 0b10010010, 0b11110100, 0b00000001, 0b01100101, 0b10101100, 0b00001001, 0b10101110, 0b00001100, 0b01110100, 0b00110001, 0b00111111, 0b01000100, 0b00100110, 0b01000100, 0b11100111, 0b11101011, 0b00101100, 0b00010101, 0b11011111], # Node 0
-[0b01001110, 0b10000111, 0b10100101, 0b00101110, 0b10011111, 0b01011101, 0b10100101, 0b01010000, 0b10110111, 0b01011111, 0b00110000, 0b10101011, 0b01001000, 0b00011101, 0b00011110, 0b00100001, 0b00100011, 0b11011110, 0b00000000, 0b10001101, 0b10010001, 0b01001001, 0b10011100, 0b11111010, 0b10111111, 0b11011100, 0b11111100, 0b01011000, 0b00100111, 0b11100100, 0b01001100, 0b00110111, 0b00011100, 0b00000011, 0b00100101, 0b01111100, 0b01001101, 0b10101000, 0b10110011, 0b11101001, 0b00110000, 0b01110101, 0b11011000, 0b00000101, 0b01010100, 0b10010000, 0b01101000, 0b11111001, 0b10011011, 0b10011100, 0b10011011, 0b00110101, 0b00000110, 0b10010010, 0b00010110, 0b10101111, 0b01000101, 0b11100001, 0b00101010, 0b10011111, 0b10110011, 0b11001111, 0b00111110, 0b00110110], # Node 1
-[0b00111000, 0b10011100, 0b11100100, 0b01100111, 0b00101110, 0b11011001, 0b11110100, 0b01000100, 0b01110111, 0b01110000, 0b00001100, 0b01011111, 0b11100000, 0b00011010, 0b01111010, 0b10000000, 0b11000010, 0b00010000, 0b10001011, 0b11011101, 0b00100101, 0b00001110, 0b00111001, 0b00100000, 0b11101111, 0b10011110, 0b10100111, 0b11011110, 0b00110001, 0b10000110, 0b00001010, 0b11001000, 0b10100010, 0b01011011, 0b00110011, 0b01100011, 0b11100011, 0b00001001, 0b11100110, 0b11001011, 0b01101001, 0b00101111, 0b10011111, 0b01000001, 0b00110000, 0b00111111, 0b11111110, 0b11001110, 0b11001000, 0b10110001, 0b00011001, 0b10011101, 0b00101011, 0b00000010, 0b00101100, 0b01111001, 0b11011000, 0b10001110, 0b10000110, 0b01100111, 0b11010010, 0b11111111, 0b11100001, 0b01010100], # Node 2
-[0b00001000, 0b11100000, 0b01110100, 0b00001110, 0b00111010, 0b01001010, 0b11101100, 0b11001100, 0b10110100, 0b01010111, 0b10011010, 0b11000000, 0b00010011, 0b01001000, 0b00101011, 0b10011110, 0b10011010, 0b10111000, 0b11111011, 0b10110011, 0b11100010, 0b10000111, 0b01111111, 0b01100100, 0b11100001, 0b00100101, 0b10001110, 0b01101101, 0b01000000, 0b00011110, 0b11001101, 0b00010101, 0b00110111, 0b10000111, 0b00100110, 0b11101100, 0b11001000, 0b00100011, 0b00110110, 0b01011011, 0b01010010, 0b01100000, 0b01111101, 0b00001100, 0b11010100, 0b11110010, 0b10111111, 0b11100101, 0b11011101, 0b01100101, 0b00011101, 0b00110110, 0b10100110, 0b00000111, 0b10100101, 0b00011101, 0b11110000, 0b10010100, 0b00100110, 0b01101111, 0b10001101, 0b11001000, 0b10011110, 0b01000111], # Node 3
-[0b10111111, 0b11001100, 0b11001111, 0b01011111, 0b01101000, 0b10100011, 0b00000101, 0b10101111, 0b00110010, 0b11001100, 0b10001011, 0b11101100, 0b11111101, 0b00010111, 0b00101001, 0b01010001, 0b11000100, 0b10010011, 0b00100111, 0b01001111, 0b01000110, 0b10110101, 0b01010101, 0b11001010, 0b01101001, 0b00001011, 0b11001111, 0b11100000, 0b01010101, 0b00011011, 0b11101111, 0b00110100, 0b10110110, 0b11011100, 0b10010000, 0b10001110, 0b01011101, 0b00011010, 0b01110110, 0b11000111, 0b10101110, 0b11010011, 0b01100001, 0b01001000, 0b11111111, 0b11101001, 0b00111000, 0b11100101, 0b10111101, 0b00100000, 0b01010111, 0b11011111, 0b10000111, 0b00101100, 0b01110011, 0b11100101, 0b01100100, 0b10000010, 0b11111110, 0b00110001, 0b11010001, 0b10110101, 0b00011011, 0b11011001], # Node 4
-[0b00101111, 0b10010101, 0b10111000, 0b01001000, 0b11001011, 0b11001010, 0b00100111, 0b10001111, 0b10000011, 0b11000101, 0b00110010, 0b10000010, 0b00011011, 0b00110111, 0b00110100, 0b11001001, 0b11110110, 0b11111010, 0b11100000, 0b00101011, 0b11110011, 0b10011000, 0b00010000, 0b01001001, 0b11111111, 0b00011011, 0b11011101, 0b10011100, 0b10010001, 0b11101010, 0b10010111, 0b00100100, 0b10000111, 0b10110010, 0b00000110, 0b10110011, 0b01000111, 0b01010111, 0b10101111, 0b10111100, 0b00011100, 0b01011100, 0b00101010, 0b01101001, 0b11011010, 0b00010111, 0b10101111, 0b10010101, 0b11111110, 0b11011100, 0b00000111, 0b11011101, 0b11001111, 0b10101100, 0b10100011, 0b10010111, 0b01110000, 0b00110001, 0b00000110, 0b11011001, 0b00001101, 0b00011010, 0b11110000, 0b11111110], # Node 5
-[0b00000101, 0b11001000, 0b01111000, 0b01011001, 0b00111100, 0b00101010, 0b00110101, 0b10010111, 0b11100011, 0b00011111, 0b11101011, 0b10100110, 0b00110101, 0b00110000, 0b00110110, 0b01000101, 0b01010010, 0b10111110, 0b00100110, 0b10101100, 0b01000110, 0b00101110, 0b10011010, 0b11000000, 0b01100111, 0b11010010, 0b10001101, 0b11110010, 0b10110110, 0b00111110, 0b11111011, 0b00101101, 0b11001110, 0b00111000, 0b01110001, 0b10000101, 0b01101010, 0b10001001, 0b11111111, 0b11001011, 0b10111010, 0b01010100, 0b00000010, 0b10001110, 0b10111001, 0b01100011, 0b10100011, 0b00100100, 0b11010001, 0b11111110, 0b01000011, 0b00011110, 0b11010100, 0b00110110, 0b10110000, 0b01101100, 0b10100010, 0b11100110, 0b11000110, 0b00011010, 0b01010000, 0b11010101, 0b00111110, 0b11111000], # Node 6
-[0b10001101, 0b00100000, 0b11001011, 0b01111110, 0b00111101, 0b01001010, 0b01110111, 0b11110010, 0b01110000, 0b01100101, 0b01010001, 0b00100011, 0b10101110, 0b10100001, 0b00000011, 0b11110000, 0b11001000, 0b01001010, 0b01001101, 0b11111110, 0b11001111, 0b10000101, 0b00000010, 0b11110110, 0b10111100, 0b00000110, 0b01011011, 0b01101001, 0b01010100, 0b10001000, 0b11101101, 0b11111100, 0b11110000, 0b01010111, 0b00100100, 0b11101110, 0b01101011, 0b01011000, 0b10011100, 0b11101010, 0b00111010, 0b01001110, 0b10011010, 0b00101101, 0b01110100, 0b10111011, 0b01001010, 0b11010011, 0b00110011, 0b01110010, 0b01010100, 0b11011111, 0b01001011, 0b11100100, 0b00100101, 0b10000111, 0b11000110, 0b01110010, 0b10001010, 0b11000110, 0b11110111, 0b10101100, 0b10110000, 0b11110110], # Node 7
-[0b10111010, 0b10001010, 0b11110010, 0b01000011, 0b01001110, 0b00001011, 0b10110001, 0b10001001, 0b01010111, 0b00111111, 0b11101000, 0b10011001, 0b01110001, 0b01110001, 0b10010001, 0b10000110, 0b10100111, 0b10111010, 0b01000011, 0b11011000, 0b01000010, 0b01011010, 0b00110101, 0b00000010, 0b00010110, 0b10111100, 0b00001010, 0b11000010, 0b10011111, 0b00001110, 0b10000110, 0b10000011, 0b00101011, 0b10100010, 0b01111101, 0b11010001, 0b01100000, 0b00110101, 0b00111101, 0b10000100, 0b01001111, 0b01001100, 0b10101100, 0b11111010, 0b11110100, 0b10001110, 0b10111111, 0b01110001, 0b10000101, 0b01011001, 0b01001111, 0b01011111, 0b11001110, 0b11011111, 0b00000000, 0b10100001, 0b00100100, 0b10000100, 0b00111111, 0b00110111, 0b01010001, 0b10011111, 0b10100001, 0b11000101], # Node 8
-[0b10101010, 0b01110110, 0b10101101, 0b01010011, 0b01010001, 0b11111010, 0b00010011, 0b11101101, 0b10100110, 0b11111011, 0b10001111, 0b11101101, 0b11000110, 0b00110011, 0b00100010, 0b10011100, 0b11010110, 0b00110000, 0b01001101, 0b10101111, 0b01011110, 0b10111110, 0b01010010, 0b11000100, 0b11100111, 0b00100100, 0b10100111, 0b10000000, 0b00010100, 0b00011000, 0b11101110, 0b10110110, 0b10100101, 0b11110010, 0b11000010, 0b10110000, 0b11001000, 0b00010111, 0b10100110, 0b00101011, 0b11110101, 0b10101100, 0b11101011, 0b00000101, 0b00011101, 0b11100010, 0b00111000, 0b11010111, 0b01111111, 0b01000000, 0b11000111, 0b00011011, 0b11011010, 0b00001010, 0b00110001, 0b00010011, 0b11110010, 0b01111110, 0b11011111, 0b01101111, 0b11110000, 0b10110001, 0b00111001, 0b00110000], # Node 9
-],
-]
-shape = [784, 512, 10]
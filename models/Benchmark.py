@@ -0,0 +1,115 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Benchmarks every generation (D2 -> D5): cold import, per-image latency (p50/p99) and batch throughput, saved as JSON
+
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from ModelRegistry import models_path, d5_path, get_model, get_test_data
+
+# * ENGINES - name in ModelRegistry: module imported cold
+ENGINES = {
+    'd2':         'AndroD2',
+    'd2-binary':  'AndroD2',
+    'd3':         'AndroD3',
+    'd4':         'AndroD4',
+    'd4-packed':  'PackedEngine',
+    'd4-table':   'PackedTable',
+    'd4-sliced':  'PackedSliced',
+    'd4-batch':   'PackedBatch',
+    'd5':         'LogitCalculator',
+    'd5-netlist': 'LogitCalculator',
+}
+# Engines that take seconds per image only time a few (image by image)
+MAX_IMAGES = {'d5-netlist': 2}
+
+# * MEASUREMENTS
+# Seconds to import a module in a fresh interpreter
+def coldImport(module):
+    code = f"import sys, time; sys.path[:0] = [{models_path!r}, {d5_path!r}]; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    result = subprocess.run([sys.executable, '-c', code], cwd=models_path, capture_output=True, text=True)
+    if result.returncode:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+    return float(result.stdout.strip().splitlines()[-1])
+
+# Nearest-rank percentile
+def percentile(values, q):
+    values = sorted(values)
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+def latency(predict, images):
+    times = []
+    for image in images:
+        start = time.perf_counter()
+        predict(image)
+        times.append(time.perf_counter() - start)
+    return {
+        'images': len(times),
+        'p50_ms': percentile(times, 50) * 1000,
+        'p99_ms': percentile(times, 99) * 1000,
+        'mean_ms': sum(times) / len(times) * 1000,
+    }
+
+# Images per second through predict_batch (engines without one go image by image)
+def throughput(engine, images):
+    start = time.perf_counter()
+    engine.predict_batch(images)
+    elapsed = time.perf_counter() - start
+    return {'images': len(images), 'batched': engine.batched, 'img_per_s': len(images) / elapsed}
+
+def benchmark(name, length=20, batch=100):
+    module = ENGINES[name]
+    result = {'module': module}
+    try:
+        result['cold_import_s'] = coldImport(module)
+        start = time.perf_counter()
+        engine = get_model(name)
+        images, _ = get_test_data(name)
+        result['load_s'] = time.perf_counter() - start
+    except Exception as e: # Missing dependencies (the D2/D3 weights modules) are reported, not fatal
+        result['error'] = f"{type(e).__name__}: {e}"
+        return result
+    engine.predict(images[0]) # Warm up
+    length = min(length, MAX_IMAGES.get(name, length))
+    result['latency'] = latency(engine.predict, images[:length])
+    result['throughput'] = throughput(engine, images[:batch if engine.batched else min(batch, length)])
+    return result
+
+def run(names=None, length=20, batch=100):
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'length': length,
+        'batch': batch,
+        'results': {name: benchmark(name, length, batch) for name in (names or ENGINES)},
+    }
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the model generations")
+    parser.add_argument('engines', nargs='*', help=f"engines to run (default: all of {', '.join(ENGINES)})")
+    parser.add_argument('-n', '--length', type=int, default=20, help="images timed one at a time for latency")
+    parser.add_argument('-b', '--batch', type=int, default=100, help="images in the throughput batch")
+    parser.add_argument('-o', '--out', default='benchmark.json', help="JSON file to write")
+    args = parser.parse_args()
+    unknown = [name for name in args.engines if name not in ENGINES]
+    if unknown:
+        parser.error(f"unknown engines {unknown}, choose from {list(ENGINES)}")
+
+    report = run(args.engines, args.length, args.batch)
+    with open(args.out, 'w') as file:
+        json.dump(report, file, indent=2)
+
+    for name, result in report['results'].items():
+        if 'error' in result:
+            print(f"{name:<11} skipped ({result['error']})")
+            continue
+        lat = result['latency']
+        print(f"{name:<11} import {result['cold_import_s']:6.2f}s   p50 {lat['p50_ms']:9.2f}ms   p99 {lat['p99_ms']:9.2f}ms   {result['throughput']['img_per_s']:9.1f} img/s")
+    print(f"Saved to {args.out}")
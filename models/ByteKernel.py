@@ -0,0 +1,74 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Byte-wise XNOR/popcount kernel -> one weight byte and one input byte per step (one EEPROM read), like the hardware
+
+# * An EEPROM byte holds 8 weights: weight w is bit w & 0b111 of byte w >> 3 (EEPROM_addr / bit_index in D4)
+
+POPCOUNT = bytes(bin(i).count('1') for i in range(256))
+# Matching bits of a weight byte and an input byte, XNOR_COUNT[weight << 8 | data]
+XNOR_COUNT = bytes(8 - POPCOUNT[w ^ x] for w in range(256) for x in range(256))
+
+# Number of bits in [start, end) where the weights match the data
+def byteMatches(weight_bytes, data_bytes, start, end):
+    matches = 0
+    for addr in range(start >> 3, (end + 7) >> 3):
+        weight = weight_bytes[addr]
+        data = data_bytes[addr]
+        # Bits of this byte that are inside [start, end)
+        low = max(start - (addr << 3), 0)
+        high = min(end - (addr << 3), 8)
+        if low == 0 and high == 8:
+            matches += XNOR_COUNT[weight << 8 | data]
+        else:
+            matches += POPCOUNT[~(weight ^ data) & ((1 << high) - (1 << low))]
+    return matches
+
+# Accumulator of a node over its first 'size' weights (matches - mismatches)
+def byteAccum(weight_bytes, data_bytes, size):
+    return 2 * byteMatches(weight_bytes, data_bytes, 0, size) - size
+
+# * EEPROM LAYOUT - fill3D linearizes LAYER : NODE : WEIGHT, each padded out to its number of address bits
+def weightAddress(layer, node, addr, addr_bits_per_dim):
+    _, node_bits, weight_bits = addr_bits_per_dim
+    return (((layer << node_bits) | node) << weight_bits) | addr
+
+# Runs the kernel over the bytes an EEPROM holds against the weights they should be
+# Returns every (layer, node) where they differ (empty when the layout matches fill3D's)
+def checkLayout(eeprom_data, weights, shape, addr_bits_per_dim):
+    wrong = []
+    for l_index, layer in enumerate(weights):
+        size = shape[l_index]
+        for node, node_weights in enumerate(layer):
+            base = weightAddress(l_index, node, 0, addr_bits_per_dim)
+            stored = eeprom_data[base:base + len(node_weights)]
+            # Every bit has to match itself
+            if len(stored) != len(node_weights) or byteMatches(stored, node_weights, 0, size) != size:
+                wrong.append((l_index, node))
+    return wrong
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import time
+    from src.packed_io import load_data, load_model
+    from PackedEngine import PackedModel
+
+    x_test, y_test = load_data()
+    weights, shape = load_model()
+    packed = PackedModel(weights, shape)
+    import AndroD4
+
+    length = 5
+    start = time.perf_counter()
+    bit_guesses = [AndroD4.model(image) for image in x_test[:length]]
+    bit_time = (time.perf_counter() - start) / length
+    start = time.perf_counter()
+    byte_guesses = [AndroD4.model(image, byte_wise=True) for image in x_test[:length]]
+    byte_time = (time.perf_counter() - start) / length
+    assert bit_guesses == byte_guesses == [packed.predict(image) for image in x_test[:length]], "[KERNEL]\tbyte-wise D4 does not match the bit loop"
+    print(f"D4 bit loop {bit_time * 1000:.1f}ms / image, byte kernel {byte_time * 1000:.1f}ms / image ({bit_time / byte_time:.1f}x)")
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'AndroD5'))
+    from LogitCalculator import Model, BITS_LAYER, BITS_NODES, BITS_WEIGHTS
+    wrong = checkLayout(Model().WEIGHTS_EEPROM.data, weights, shape, (BITS_LAYER, BITS_NODES, BITS_WEIGHTS))
+    print(f"WEIGHTS EEPROM layout: {'matches fill3D' if not wrong else f'{len(wrong)} nodes differ, first {wrong[0]}'}")
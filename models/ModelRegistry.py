@@ -0,0 +1,155 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : One place to get any generation's model -> get_model("d4") loads it once per process, without running tests or importing TensorFlow
+
+import os
+import sys
+
+models_path = os.path.dirname(os.path.abspath(__file__))
+d5_path = os.path.join(models_path, 'AndroD5')
+if models_path not in sys.path:
+    sys.path.insert(0, models_path)
+
+# * Every model is an Engine: predict(image) -> guess, predict_batch(images) -> guesses
+class Engine():
+    def __init__(self, name, predict, predict_batch=None):
+        self.name = name
+        self.predict = predict
+        self._predict_batch = predict_batch
+
+    # Whether predict_batch runs the whole batch at once (otherwise it loops over predict)
+    @property
+    def batched(self):
+        return self._predict_batch is not None
+
+    def predict_batch(self, images):
+        if self._predict_batch is None:
+            return [self.predict(image) for image in images]
+        return list(self._predict_batch(images))
+
+    # (images, labels) of the test set this engine takes
+    def test_data(self):
+        return get_test_data(self.name)
+
+_loaders = {} # name -> function that builds the Engine
+_data = {}    # name -> which test images it takes: 'mnist' (D2/D3, arrays of pixels) or 'packed' (D4/D5, packed bytes)
+_models = {}  # name -> Engine, built on first use
+
+def register(name, data='packed'):
+    def decorator(loader):
+        _loaders[name] = loader
+        _data[name] = data
+        return loader
+    return decorator
+
+def names():
+    return list(_loaders)
+
+def get_model(name):
+    assert name in _loaders, f"[REGISTRY]\t{name} is not one of {names()}"
+    if name not in _models:
+        _models[name] = _loaders[name]()
+    return _models[name]
+
+# * SHARED DATA - loaded once, whichever model asks first
+_packed = {}
+
+def load_packed_model():
+    # Same copy AndroD4 and LogitCalculator import
+    from src.packed_io import shared_model
+    return shared_model()
+
+# (images, labels) of the test set a model takes, without loading the model
+def get_test_data(name):
+    assert name in _loaders, f"[REGISTRY]\t{name} is not one of {names()}"
+    return load_test_data(_data[name])
+
+def load_test_data(data='packed'):
+    if data == 'mnist':
+        from src.mnist_io import load_mnist
+        return load_mnist()[1]
+    if 'data' not in _packed:
+        from src.packed_io import open_data
+        _packed['data'] = open_data()
+    return _packed['data']
+
+# * GENERATIONS
+@register('d2', data='mnist')
+def _loadD2():
+    import AndroD2
+    model = AndroD2.Model()
+    return Engine('d2', model.predict, model.predict_batch)
+
+# Binarized like D3/D4, the float reference for the binary engines
+@register('d2-binary', data='mnist')
+def _loadD2Binary():
+    import AndroD2
+    model = AndroD2.Model(binary=True)
+    return Engine('d2-binary', model.predict, model.predict_batch)
+
+@register('d3', data='mnist')
+def _loadD3():
+    import numpy as np
+    import AndroD3
+    return Engine('d3', lambda image: AndroD3.model(np.reshape(image, -1).tolist(), quanitizing=True))
+
+@register('d4')
+def _loadD4():
+    import AndroD4
+    weights, shape = load_packed_model()
+    return Engine('d4', lambda image: AndroD4.model(image, weights=weights, shape=shape))
+
+@register('d4-packed')
+def _loadPacked():
+    from PackedEngine import PackedModel
+    return Engine('d4-packed', PackedModel(*load_packed_model()).predict)
+
+@register('d4-table')
+def _loadTable():
+    from PackedTable import TableModel
+    return Engine('d4-table', TableModel(*load_packed_model()).predict)
+
+@register('d4-sliced')
+def _loadSliced():
+    from PackedSliced import SlicedModel
+    model = SlicedModel(*load_packed_model())
+    return Engine('d4-sliced', lambda image: model.predict([image])[0], model.predict)
+
+@register('d4-batch')
+def _loadBatch():
+    from PackedBatch import BatchModel
+    model = BatchModel(*load_packed_model())
+    return Engine('d4-batch', lambda image: int(model.predict([image])[0]), lambda images: model.predict(images).tolist())
+
+# One circuit per engine (per process), reset to the state it was built (and compiled) in before every prediction
+def _loadD5(name, compiled):
+    if d5_path not in sys.path:
+        sys.path.insert(0, d5_path)
+    from LogitCalculator import Model
+    from PackedEngine import argmax
+    from PackedBatch import argmax as argmaxBatch
+    model = Model(*load_packed_model())
+    model.bar = False
+    model.verbose = False
+    if compiled: model.compile()
+    else:        model.fast_forward = True
+    model.save()
+    def predict(image):
+        model.reset()
+        return argmax(model.predict(image))
+    def predict_batch(images):
+        model.reset()
+        return argmaxBatch(model.predict_batch(images)).tolist()
+    # The compiled netlist runs one image at a time
+    return Engine(name, predict, None if compiled else predict_batch)
+
+register('d5')(lambda: _loadD5('d5', compiled=False))
+register('d5-netlist')(lambda: _loadD5('d5-netlist', compiled=True))
+
+if __name__ == "__main__":
+    name = sys.argv[1] if len(sys.argv) > 1 else 'd4-packed'
+    model = get_model(name)
+    x_test, y_test = model.test_data()
+    guesses = model.predict_batch(x_test[:100])
+    correct = sum(1 for guess, answer in zip(guesses, y_test) if guess == answer)
+    print(f"{name}: {correct} / {len(guesses)} correct")
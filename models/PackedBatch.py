@@ -0,0 +1,94 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Numpy version of the packed model that scores a whole batch of images at once (same answers as AndroD4)
+
+import numpy as np
+
+# * STRUCTURE OF WEIGHTS - LAYER : NODE : WEIGHT TO PREVIOUS LAYER
+
+# Number of images pushed through the XNOR at once (keeps the N x nodes x words intermediate small)
+CHUNK_SIZE = 256
+
+# Popcount of every unsigned integer in an array (numpy >= 2.0 has it built in)
+if hasattr(np, 'bitwise_count'):
+    popcount = np.bitwise_count
+else:
+    _BYTE_COUNTS = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+    def popcount(words):
+        counts = _BYTE_COUNTS[words.view(np.uint8)]
+        return counts.reshape(words.shape + (words.itemsize,)).sum(axis=-1, dtype=np.uint8)
+
+# Byte mask that keeps only the first 'size' bits (bit i lives in byte i >> 3, position i & 0b111)
+def byteMask(size):
+    num_bytes = (size + 7) >> 3
+    return np.packbits(np.arange(num_bytes * 8) < size, bitorder='little')
+
+# Stack rows of packed bytes (lists of ints, bytes or buffers) into an N x bytes array
+def toArray(rows):
+    if isinstance(rows, np.ndarray):
+        return rows.astype(np.uint8, copy=False)
+    # Memory-mapped images (packed_io.open_data) are already back to back, so view them without copying
+    if hasattr(rows, 'buffer') and hasattr(rows, 'row_len'):
+        return np.frombuffer(rows.buffer, dtype=np.uint8).reshape(len(rows), rows.row_len)
+    data = b''.join(bytes(row) for row in rows)
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(rows), -1)
+
+# Reinterpret rows of packed bytes as rows of uint64 words, padding with zero bytes
+def toWords(packed):
+    pad = -packed.shape[-1] % 8
+    if pad:
+        packed = np.pad(packed, [(0, 0)] * (packed.ndim - 1) + [(0, pad)])
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+# np.argmax picks the first max, D4 picks the last
+def argmax(logits):
+    return logits.shape[1] - 1 - np.argmax(logits[:, ::-1], axis=1)
+
+class BatchModel():
+    def __init__(self, weights, shape, chunk_size=CHUNK_SIZE):
+        self.shape = shape
+        self.num_layers = len(shape) - 1
+        self.chunk_size = chunk_size
+        self.input_mask = byteMask(shape[0])
+        # Convert every layer to a (nodes x words) array once
+        self.layers = []
+        for l_index, layer in enumerate(weights):
+            layer = toArray(layer) & byteMask(shape[l_index])
+            self.layers.append(toWords(layer))
+
+    def _forward(self, images):
+        words = toWords(images & self.input_mask)
+        for l_index, layer in enumerate(self.layers):
+            prev_size = self.shape[l_index]
+            # N x nodes x words -> N x nodes
+            mismatches = popcount(words[:, None, :] ^ layer[None, :, :]).sum(axis=2, dtype=np.int32)
+            accum = prev_size - 2 * mismatches
+            # Last layer is not quantized
+            if l_index == self.num_layers - 1:
+                return accum
+            # Quantize (NOT of the MSB) and pack the nodes back into bytes
+            words = toWords(np.packbits(accum >= 0, axis=1, bitorder='little'))
+
+    # Returns an N x 10 array of accumulators
+    def logits(self, images):
+        images = toArray(images)
+        out = [self._forward(images[i:i + self.chunk_size]) for i in range(0, len(images), self.chunk_size)]
+        return np.concatenate(out) if out else np.zeros((0, self.shape[-1]), dtype=np.int32)
+
+    def predict(self, images):
+        return argmax(self.logits(images))
+
+def test_model(batch_model, images, answers):
+    guesses = batch_model.predict(images)
+    correct = int(np.count_nonzero(guesses == np.asarray(answers)))
+    return (correct, len(guesses) - correct, len(guesses))
+
+if __name__ == "__main__":
+    from src.packed_io import load_data, load_model
+
+    x_test, y_test = load_data()
+    weights, shape = load_model()
+
+    print(f"Testing model with {len(x_test)} images")
+    correct, incorrect, total = test_model(BatchModel(weights, shape), x_test, y_test)
+    print("Accuracy: ", correct/total * 100, "%")
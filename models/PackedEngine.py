@@ -0,0 +1,134 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Word-level version of AndroD4 -> each node is one XNOR and one popcount instead of a loop over every bit
+
+from tqdm import tqdm
+
+# * STRUCTURE OF WEIGHTS - LAYER : NODE : WEIGHT TO PREVIOUS LAYER
+
+# Turn a list of packed bytes into one integer (byte i holds bits 8i -> 8i+7, same as EEPROM_addr/bit_index in D4)
+def packWord(packed_bytes):
+    return int.from_bytes(bytes(packed_bytes), 'little')
+
+# Same tie-breaking as D4 (last index wins on a tie)
+def argmax(logits):
+    answer = logits[0]
+    index = 0
+    for i, challenger in enumerate(logits):
+        if challenger >= answer:
+            answer = challenger
+            index = i
+    return index
+
+# Output-layer inputs accumulated between early-exit checks
+CHUNK_SIZE = 8
+
+class PackedModel():
+    def __init__(self, weights, shape, early_exit=False, chunk_size=CHUNK_SIZE):
+        self.shape = shape
+        self.num_layers = len(shape) - 1
+        self.masks = [(1 << size) - 1 for size in shape]
+        # Pack every node's weights into a single word once, rather than on every image
+        self.layers = []
+        for l_index, layer in enumerate(weights):
+            mask = self.masks[l_index]
+            self.layers.append([packWord(node) & mask for node in layer])
+        # Early exit stops the output layer once the answer can't change (predict still gives the same guess)
+        self.early_exit = early_exit
+        assert chunk_size > 0, f"[PACKED]\tchunk_size has to be at least 1 input, got {chunk_size}"
+        self.chunk_size = chunk_size
+        self.swings = self.remainingSwings()
+        self.skipped_ops = 0 # Output-layer bit-ops (XNOR + up/down count) skipped, over every prediction so far
+        self.total_ops = 0   # Output-layer bit-ops without early exit, over every prediction so far
+
+    # Returns the quantized input to the output layer as one word
+    def hidden(self, image):
+        word = packWord(image) & self.masks[0]
+        for l_index, layer in enumerate(self.layers[:-1]):
+            prev_size = self.shape[l_index]
+            # Quantize: a node is on when its accumulator is not negative (NOT of the MSB)
+            next_word = 0
+            for node_index, node in enumerate(layer):
+                if 2 * (node ^ word).bit_count() <= prev_size:
+                    next_word |= 1 << node_index
+            word = next_word
+        return word
+
+    # Returns the un-quantized output layer (identical to the accumulators in D4)
+    def logits(self, image):
+        word = self.hidden(image)
+        prev_size = self.shape[-2]
+        # accum = matches - mismatches = prev_size - 2 * popcount(weight ^ data)
+        return [prev_size - 2 * (node ^ word).bit_count() for node in self.layers[-1]]
+
+    # Largest amount node j can still gain on node i after every chunk, swings[chunk][i][j]
+    # An input only changes the gap between two nodes (by 2) where their weights differ, so it only depends on the weights
+    def remainingSwings(self):
+        layer = self.layers[-1]
+        prev_size = self.shape[-2]
+        swings = []
+        for done in range(self.chunk_size, prev_size, self.chunk_size):
+            remaining = self.masks[-2] >> done << done
+            swings.append([[2 * ((node_i ^ node_j) & remaining).bit_count() for node_j in layer] for node_i in layer])
+        return swings
+
+    # Accumulates the output layer chunk_size inputs at a time, stopping once the remaining inputs can't change the answer
+    # Returns (guess, bit-ops skipped)
+    def predictEarly(self, image):
+        word = self.hidden(image)
+        layer = self.layers[-1]
+        prev_size = self.shape[-2]
+        accums = [0] * len(layer)
+        done = 0
+        for swings in self.swings:
+            mask = ((1 << self.chunk_size) - 1) << done
+            accums = [accum + self.chunk_size - 2 * ((node ^ word) & mask).bit_count() for accum, node in zip(accums, layer)]
+            done += self.chunk_size
+            leader = argmax(accums)
+            # Strictly ahead of every other node by more than it can still gain (so ties can't flip it either)
+            if all(accums[leader] - accums[j] > swings[leader][j] for j in range(len(layer)) if j != leader):
+                return leader, (prev_size - done) * len(layer)
+        # Whatever is left after the last check
+        mask = self.masks[-2] >> done << done
+        accums = [accum + (prev_size - done) - 2 * ((node ^ word) & mask).bit_count() for accum, node in zip(accums, layer)]
+        return argmax(accums), 0
+
+    # Functional model that takes in an image and guesses the number (mnist)
+    def predict(self, image):
+        if not self.early_exit:
+            return argmax(self.logits(image))
+        guess, skipped = self.predictEarly(image)
+        self.skipped_ops += skipped
+        self.total_ops += self.shape[-2] * self.shape[-1]
+        return guess
+
+def test_model(packed_model, images, answers, bar=True):
+    correct = 0
+    incorrect = 0
+    # Add progress bar unless specified otherwise
+    if bar:
+        pbar = tqdm(total=len(answers))
+    for image, answer in zip(images, answers):
+        if bar:
+            pbar.update(n=1)
+        guess = packed_model.predict(image)
+        if guess == answer:
+            correct += 1
+        else:
+            incorrect += 1
+    if bar:
+        pbar.close()
+    return (correct, incorrect, len(images))
+
+if __name__ == "__main__":
+    from src.packed_io import load_data, load_model
+
+    x_test, y_test = load_data()
+    weights, shape = load_model()
+
+    length = 100 # max of 100
+    print(f"Testing model with {length} image{'s' if length != 1 else ''}")
+    packed_model = PackedModel(weights, shape, early_exit=True)
+    correct, incorrect, total = test_model(packed_model, x_test[:length], y_test[:length])
+    print("Accuracy: ", correct/total * 100, "%")
+    print(f"Early exit skipped {packed_model.skipped_ops} / {packed_model.total_ops} output-layer bit-ops ({packed_model.skipped_ops / packed_model.total_ops * 100:.1f} %)")
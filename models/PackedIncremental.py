@@ -0,0 +1,98 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Incremental version of AndroD4 -> keeps every accumulator of the last image and only updates them for the pixels that changed
+
+import numpy as np
+from PackedBatch import toArray
+from PackedEngine import argmax
+
+# * STRUCTURE OF WEIGHTS - LAYER : NODE : WEIGHT TO PREVIOUS LAYER
+# * A flipped input moves every node's accumulator by 2: +2 when the node's weight now matches it, -2 when it doesn't
+
+# Unpack rows of packed bytes into one bit per column (bit i lives in byte i >> 3, position i & 0b111)
+def unpackBits(packed, size):
+    return np.unpackbits(toArray(packed), axis=-1, bitorder='little')[..., :size]
+
+class IncrementalModel():
+    def __init__(self, weights, shape):
+        self.shape = shape
+        self.num_layers = len(shape) - 1
+        # Weights as +1 (bit on) / -1 (bit off), (prev_size x nodes) so that every input is one row
+        self.signs = [2 * unpackBits(layer, shape[l_index]).T.astype(np.int32) - 1 for l_index, layer in enumerate(weights)]
+        self.bits = None   # Input bits (0/1) of every layer for the current image
+        self.accums = None # Accumulators of every layer for the current image
+        self.rows = 0      # Weight rows added by the last update (784 x layers for a full pass)
+
+    # Full forward pass that caches every layer, returns the guess
+    def reset(self, image):
+        self.bits, self.accums = [], []
+        layer_bits = unpackBits([image], self.shape[0])[0].astype(np.int32)
+        for signs in self.signs:
+            self.bits.append(layer_bits)
+            # accum = matches - mismatches
+            accum = (2 * layer_bits - 1) @ signs
+            self.accums.append(accum)
+            # Quantize (NOT of the MSB)
+            layer_bits = (accum >= 0).astype(np.int32)
+        self.rows = sum(len(signs) for signs in self.signs)
+        return argmax(self.accums[-1].tolist())
+
+    # Flips the given input bits of the current image, returns the new guess
+    def flip(self, changed):
+        assert self.bits is not None, "[INCREMENTAL]\treset needs a first image before bits can be flipped"
+        changed = np.unique(np.asarray(changed, dtype=np.intp))
+        self.rows = 0
+        for l_index, signs in enumerate(self.signs):
+            if not len(changed):
+                break
+            bits = self.bits[l_index]
+            bits[changed] ^= 1
+            self.accums[l_index] = self.accums[l_index] + 2 * ((2 * bits[changed] - 1) @ signs[changed])
+            self.rows += len(changed)
+            # Only the nodes whose sign changed are flipped inputs of the next layer (the last layer is not quantized)
+            if l_index < self.num_layers - 1:
+                changed = np.flatnonzero((self.accums[l_index] >= 0) != self.bits[l_index + 1])
+        return argmax(self.accums[-1].tolist())
+
+    # Same answer as AndroD4.model, reusing the last image's accumulators when there is one
+    def predict(self, image):
+        if self.bits is None:
+            return self.reset(image)
+        bits = unpackBits([image], self.shape[0])[0]
+        return self.flip(np.flatnonzero(bits != self.bits[0]))
+
+    def logits(self):
+        return self.accums[-1].tolist()
+
+if __name__ == "__main__":
+    import time
+    from src.packed_io import load_data, load_model
+    from PackedEngine import PackedModel
+
+    x_test, y_test = load_data()
+    weights, shape = load_model()
+    reference = PackedModel(weights, shape)
+    model = IncrementalModel(weights, shape)
+
+    # Draw image 1 over image 0 a few pixels (one stroke) at a time
+    stroke = 8
+    start = unpackBits([x_test[0]], shape[0])[0]
+    target = unpackBits([x_test[1]], shape[0])[0]
+    model.reset(x_test[0])
+    full_time = time.perf_counter()
+    reference.predict(x_test[0])
+    full_time = time.perf_counter() - full_time
+
+    differ = np.flatnonzero(start != target)
+    image = start.copy()
+    times, rows = [], []
+    for i in range(0, len(differ), stroke):
+        changed = differ[i:i + stroke]
+        image[changed] ^= 1
+        begin = time.perf_counter()
+        guess = model.flip(changed)
+        times.append(time.perf_counter() - begin)
+        rows.append(model.rows)
+        assert guess == reference.predict(np.packbits(image, bitorder='little')), f"[INCREMENTAL]\tstroke {i // stroke} does not match the full pass"
+    print(f"{len(times)} strokes of {stroke} pixels match the full pass, guess {guess} (label {y_test[1]})")
+    print(f"Full pass {full_time * 1000:.2f}ms, stroke {np.median(times) * 1000:.3f}ms (median), {np.mean(rows):.1f} / {sum(shape[:-1])} weight rows per stroke")
@@ -0,0 +1,111 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Bit-sliced version of AndroD4 -> bit k of every word belongs to image k, so one XNOR covers 64 images
+
+from PackedEngine import packWord, argmax
+
+# * STRUCTURE OF WEIGHTS - LAYER : NODE : WEIGHT TO PREVIOUS LAYER
+# * LANES - word w holds pixel w of every image in the group, image k sits at bit k
+
+LANES = 64
+
+# Transpose packed images so that word w holds pixel w of every image
+def sliceImages(images, size):
+    mask = (1 << size) - 1
+    words = [0] * size
+    for k, image in enumerate(images):
+        packed = packWord(image) & mask
+        # Only visit the pixels that are on
+        while packed:
+            low = packed & -packed
+            words[low.bit_length() - 1] |= 1 << k
+            packed ^= low
+    return words
+
+# Read one image's value back out of a vertical (bit-sliced) counter
+def unsliceCounter(planes, lane):
+    count = 0
+    for j, plane in enumerate(planes):
+        count |= ((plane >> lane) & 1) << j
+    return count
+
+# Lanes where the vertical counter is >= a constant (compared MSB first, like a magnitude comparator)
+def compareCounter(planes, threshold, full):
+    greater = 0
+    equal = full
+    for j in range(len(planes) - 1, -1, -1):
+        if threshold & (1 << j):
+            equal &= planes[j]
+        else:
+            greater |= equal & planes[j]
+            equal &= ~planes[j]
+    return greater | equal
+
+class SlicedModel():
+    def __init__(self, weights, shape, lanes=LANES):
+        self.shape = shape
+        self.num_layers = len(shape) - 1
+        self.lanes = lanes
+        # Unpack every weight into a single bit once (index with weight bit to pick data or NOT data)
+        self.bits = []
+        for l_index, layer in enumerate(weights):
+            prev_size = shape[l_index]
+            self.bits.append([[(packWord(node) >> w) & 1 for w in range(prev_size)] for node in layer])
+
+    # Run a group of at most 'lanes' images through the model together
+    def _forward(self, images):
+        full = (1 << len(images)) - 1
+        words = sliceImages(images, self.shape[0])
+        for l_index, layer in enumerate(self.bits):
+            prev_size = self.shape[l_index]
+            # XNOR with a 0 weight is NOT data, XNOR with a 1 weight is data
+            choices = [(full ^ word, word) for word in words]
+            # Vertical counters count the matches: accum (up/down) = 2 * matches - prev_size
+            width = prev_size.bit_length()
+            counters = []
+            for node_bits in layer:
+                planes = [0] * width
+                for choice, bit in zip(choices, node_bits):
+                    # Half adder ripple, stops as soon as no lane carries
+                    carry = choice[bit]
+                    j = 0
+                    while carry:
+                        plane = planes[j]
+                        planes[j] = plane ^ carry
+                        carry &= plane
+                        j += 1
+                counters.append(planes)
+            # Last layer is not quantized
+            if l_index == self.num_layers - 1:
+                return [
+                    [2 * unsliceCounter(planes, lane) - prev_size for planes in counters]
+                    for lane in range(len(images))
+                ]
+            # Quantize: node is on when accum >= 0, so when 2 * matches >= prev_size
+            threshold = (prev_size + 1) >> 1
+            words = [compareCounter(planes, threshold, full) for planes in counters]
+
+    # Returns the logits for every image (same as the accumulators in D4)
+    def logits(self, images):
+        out = []
+        for i in range(0, len(images), self.lanes):
+            out.extend(self._forward(images[i:i + self.lanes]))
+        return out
+
+    def predict(self, images):
+        return [argmax(logits) for logits in self.logits(images)]
+
+def test_model(sliced_model, images, answers):
+    guesses = sliced_model.predict(images)
+    correct = sum(1 for guess, answer in zip(guesses, answers) if guess == answer)
+    return (correct, len(guesses) - correct, len(guesses))
+
+if __name__ == "__main__":
+    from src.packed_io import load_data, load_model
+
+    x_test, y_test = load_data()
+    weights, shape = load_model()
+
+    print(f"Testing model with {len(x_test)} images")
+    correct, incorrect, total = test_model(SlicedModel(weights, shape), x_test, y_test)
+    print("Accuracy: ", correct/total * 100, "%")
@@ -0,0 +1,92 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Table version of AndroD4 -> every node's contribution for each input byte is looked up, zero bytes (the borders) cost nothing
+
+import time
+import numpy as np
+from PackedBatch import popcount, toArray, byteMask
+from PackedEngine import argmax
+
+# * STRUCTURE OF WEIGHTS - LAYER : NODE : WEIGHT TO PREVIOUS LAYER
+# * TABLES - the accumulator is a sum over input bytes: accum = sum(bits[addr] - 2 * popcount(weight[addr] ^ data[addr]))
+# *          base[node]                = sum of every address's contribution when the input byte is 0b00000000
+# *          delta[addr][byte][node]   = contribution of 'byte' at 'addr' minus the contribution of a zero byte
+
+class TableModel():
+    # full=False only keeps the zero-byte tables (base) and XNORs the bytes that are not zero
+    def __init__(self, weights, shape, full=True):
+        self.shape = shape
+        self.num_layers = len(shape) - 1
+        self.full = full
+        self.masks = [byteMask(size) for size in shape]
+        self.weights = [] # nodes x addrs bytes, only needed without the full table
+        self.bases = []
+        self.deltas = []
+        values = np.arange(256, dtype=np.uint8)
+        for l_index, layer in enumerate(weights):
+            mask = self.masks[l_index]
+            layer = toArray(layer) & mask
+            # Every mismatch against a zero byte is a weight bit that is on
+            self.bases.append(shape[l_index] - 2 * popcount(layer).sum(axis=1, dtype=np.int32))
+            self.weights.append(layer)
+            if full:
+                # Contribution - zero contribution = 2 * (popcount(weight) - popcount(weight ^ byte)), addrs x 256 x nodes
+                data = values[None, :, None] & mask[:, None, None]
+                delta = 2 * (popcount(layer.T[:, None, :]).astype(np.int8) - popcount(layer.T[:, None, :] ^ data).astype(np.int8))
+                self.deltas.append(delta)
+
+    # Accumulators of one layer for packed input bytes, only the bytes that are not zero are visited
+    def _layer(self, l_index, data):
+        addrs = np.flatnonzero(data)
+        if self.full:
+            return self.bases[l_index] + self.deltas[l_index][addrs, data[addrs]].sum(axis=0, dtype=np.int32)
+        layer = self.weights[l_index][:, addrs]
+        # Mismatches gained over a zero byte at the same addresses
+        extra = popcount(layer ^ data[addrs]).sum(axis=1, dtype=np.int32) - popcount(layer).sum(axis=1, dtype=np.int32)
+        return self.bases[l_index] - 2 * extra
+
+    # Returns the un-quantized output layer (identical to the accumulators in D4)
+    def logits(self, image):
+        data = toArray([image])[0] & self.masks[0]
+        for l_index in range(self.num_layers):
+            accum = self._layer(l_index, data)
+            # Last layer is not quantized
+            if l_index == self.num_layers - 1:
+                return accum.tolist()
+            # Quantize (NOT of the MSB) and pack the nodes back into bytes
+            data = np.packbits(accum >= 0, bitorder='little')
+
+    def predict(self, image):
+        return argmax(self.logits(image))
+
+# Seconds per image of predict over 'images'
+def timePredict(predict, images):
+    start = time.perf_counter()
+    for image in images:
+        predict(image)
+    return (time.perf_counter() - start) / len(images)
+
+if __name__ == "__main__":
+    from src.packed_io import load_data, load_model
+    from PackedEngine import PackedModel
+
+    x_test, y_test = load_data()
+    weights, shape = load_model()
+    zero_bytes = sum(1 for image in x_test for byte in image if byte == 0) / sum(len(image) for image in x_test)
+    print(f"{zero_bytes * 100:.1f} % of the input bytes are 0b00000000")
+
+    import AndroD4
+    packed = PackedModel(weights, shape)
+    engines = {
+        'D4 (bit loop)': (AndroD4.model, 5),
+        'XNOR + popcount': (packed.predict, len(x_test)),
+        'zero-byte table': (TableModel(weights, shape, full=False).predict, len(x_test)),
+        'full table': (TableModel(weights, shape).predict, len(x_test)),
+    }
+    expected = [packed.predict(image) for image in x_test]
+    loop_time = None
+    for name, (predict, length) in engines.items():
+        assert [predict(image) for image in x_test[:length]] == expected[:length], f"[TABLE]\t{name} does not match AndroD4"
+        seconds = timePredict(predict, x_test[:length])
+        loop_time = loop_time or seconds
+        print(f"{name:<16} {seconds * 1000:9.3f}ms / image   {loop_time / seconds:8.1f}x")
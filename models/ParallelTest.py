@@ -0,0 +1,62 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Runs a model's test across a pool of processes (any model in ModelRegistry), every worker loads the model once
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from ModelRegistry import models_path, names
+
+BACKENDS = names()
+
+# * WORKERS
+_guess = None # Set once in every worker by _initWorker
+
+def _initWorker(backend):
+    global _guess
+    if models_path not in sys.path:
+        sys.path.insert(0, models_path)
+    from ModelRegistry import get_model
+    _guess = get_model(backend).predict_batch
+
+def _testShard(images, answers):
+    correct = sum(1 for guess, answer in zip(_guess(images), answers) if guess == answer)
+    return (correct, len(answers) - correct, len(answers))
+
+# Same result as the model's own test_model, with the images split into shards across 'workers' processes
+def test_model(backend, images, answers, workers=None, shard_size=None):
+    assert backend in BACKENDS, f"[TEST]\t{backend} is not one of {list(BACKENDS)}"
+    assert len(images) == len(answers), f"[TEST]\t{len(images)} images but {len(answers)} answers"
+    workers = workers or os.cpu_count() or 1
+    # A few shards per worker keeps them all busy until the end
+    shard_size = shard_size or max(1, -(-len(images) // (4 * workers)))
+    shards = [(images[i:i + shard_size], list(answers[i:i + shard_size])) for i in range(0, len(images), shard_size)]
+
+    correct, incorrect, total = 0, 0, 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initWorker, initargs=(backend,)) as pool:
+        for c, i, t in pool.map(_testShard, *zip(*shards)):
+            correct += c
+            incorrect += i
+            total += t
+    return (correct, incorrect, total)
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Test a model generation across a pool of processes")
+    parser.add_argument('backend', choices=list(BACKENDS))
+    parser.add_argument('-n', '--length', type=int, default=None, help="number of test images (default: all)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="number of processes (default: one per core)")
+    args = parser.parse_args()
+
+    from ModelRegistry import get_test_data
+    x_test, y_test = get_test_data(args.backend)
+    length = args.length or len(x_test)
+
+    print(f"Testing {args.backend} with {length} image{'s' if length != 1 else ''}")
+    start = time.perf_counter()
+    correct, incorrect, total = test_model(args.backend, x_test[:length], y_test[:length], workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print("Accuracy: ", correct/total * 100, "%")
+    print(f"{total / elapsed:.1f} img/s")
@@ -0,0 +1,24 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Loads mnist without importing TensorFlow (reads the file keras already downloaded), keras is only used to download it
+
+import os
+import numpy as np
+
+KERAS_PATH = os.path.join(os.path.expanduser('~'), '.keras', 'datasets', 'mnist.npz')
+
+_cache = {} # path -> mnist, so every model in the process shares one copy
+
+# Same as tensorflow.keras.datasets.mnist.load_data(): ((x_train, y_train), (x_test, y_test))
+def load_mnist(path=KERAS_PATH):
+    if path not in _cache:
+        if os.path.exists(path):
+            with np.load(path) as data:
+                _cache[path] = (data['x_train'], data['y_train']), (data['x_test'], data['y_test'])
+        else:
+            # Supress Tensorflow dll warning
+            os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
+            from tensorflow.keras.datasets import mnist
+            os.environ['TF_CPP_MIN_LOG_LEVEL'] = '1'
+            _cache[path] = mnist.load_data()
+    return _cache[path]
@@ -0,0 +1,186 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Binary containers for the packed model and mnist data (replaces importing the huge literal modules)
+
+import mmap
+import os
+import struct
+
+# * MODEL FILE - header: magic, version, number of sizes in shape, shape
+# *              body:   every layer -> every node -> ceil(prev_size / 8) packed bytes (same bytes as model_packed.py)
+# * DATA FILE  - header: magic, version, pixels per image, number of images
+# *              body:   every image -> ceil(pixels / 8) packed bytes, then one byte per label
+
+MODEL_MAGIC = b'ANDM'
+DATA_MAGIC = b'ANDX'
+VERSION = 1
+
+_MODEL_HEADER = struct.Struct('<4sHH')
+_DATA_HEADER = struct.Struct('<4sHII')
+
+src_path = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(src_path, 'model_packed.bin')
+DATA_PATH = os.path.join(src_path, 'data_packed.bin')
+TRAIN_PATH = os.path.join(src_path, 'train_packed.bin')
+
+# Number of bytes needed to pack 'size' bits
+def packedLength(size):
+    return (size + 7) >> 3
+
+def _checkHeader(magic, version, expected, path):
+    if magic != expected:
+        raise ValueError(f"[PACKED]\t{path} is not a packed file (magic {magic!r}, expected {expected!r})")
+    if version != VERSION:
+        raise ValueError(f"[PACKED]\t{path} is version {version}, only version {VERSION} is supported")
+
+def save_model(weights, shape, path=MODEL_PATH):
+    assert len(weights) == len(shape) - 1, f"[PACKED]\t{len(weights)} layers of weights do not match shape {shape}"
+    with open(path, 'wb') as file:
+        file.write(_MODEL_HEADER.pack(MODEL_MAGIC, VERSION, len(shape)))
+        file.write(struct.pack(f'<{len(shape)}I', *shape))
+        for l_index, layer in enumerate(weights):
+            row_len = packedLength(shape[l_index])
+            assert len(layer) == shape[l_index + 1], f"[PACKED]\tLayer {l_index} has {len(layer)} nodes, expected {shape[l_index + 1]}"
+            for node in layer:
+                assert len(node) == row_len, f"[PACKED]\tLayer {l_index} node has {len(node)} bytes, expected {row_len}"
+                file.write(bytes(node))
+
+def save_data(x, y, size=784, path=DATA_PATH):
+    assert len(x) == len(y), f"[PACKED]\t{len(x)} images but {len(y)} labels"
+    row_len = packedLength(size)
+    with open(path, 'wb') as file:
+        file.write(_DATA_HEADER.pack(DATA_MAGIC, VERSION, size, len(x)))
+        for image in x:
+            assert len(image) == row_len, f"[PACKED]\tImage has {len(image)} bytes, expected {row_len}"
+            file.write(bytes(image))
+        file.write(bytes(y))
+
+# Same file as save_data, written one chunk of packed images (a 2D array, one row per image) at a time
+# * Only the chunk being written is in memory, the header is written first from the number of labels
+def save_data_chunks(chunks, y, size=784, path=DATA_PATH):
+    row_len = packedLength(size)
+    count = 0
+    with open(path, 'wb') as file:
+        file.write(_DATA_HEADER.pack(DATA_MAGIC, VERSION, size, len(y)))
+        for chunk in chunks:
+            assert len(chunk) == 0 or len(chunk[0]) == row_len, f"[PACKED]\tImages have {len(chunk[0])} bytes, expected {row_len}"
+            file.write(memoryview(chunk).cast('B'))
+            count += len(chunk)
+        assert count == len(y), f"[PACKED]\t{count} images but {len(y)} labels"
+        file.write(bytes(y))
+
+# Returns (weights, shape) where weights[layer][node] is a bytes object (indexing gives the same ints as model_packed.py)
+def load_model(path=MODEL_PATH):
+    with open(path, 'rb') as file:
+        buf = file.read()
+    magic, version, num_sizes = _MODEL_HEADER.unpack_from(buf)
+    _checkHeader(magic, version, MODEL_MAGIC, path)
+    offset = _MODEL_HEADER.size
+    shape = list(struct.unpack_from(f'<{num_sizes}I', buf, offset))
+    offset += 4 * num_sizes
+
+    weights = []
+    for l_index in range(num_sizes - 1):
+        row_len = packedLength(shape[l_index])
+        layer = []
+        for _ in range(shape[l_index + 1]):
+            layer.append(buf[offset:offset + row_len])
+            offset += row_len
+        weights.append(layer)
+    assert offset == len(buf), f"[PACKED]\t{path} has {len(buf) - offset} unexpected trailing bytes"
+    return weights, shape
+
+_shared = {} # path -> (weights, shape), see shared_model
+
+# Same as load_model, but every caller in the process gets the same copy (read the file once, don't modify it)
+def shared_model(path=MODEL_PATH):
+    if path not in _shared:
+        _shared[path] = load_model(path)
+    return _shared[path]
+
+# Returns (row_len, count) after checking the header and the file length
+def _readDataHeader(buf, path):
+    magic, version, size, count = _DATA_HEADER.unpack_from(buf)
+    _checkHeader(magic, version, DATA_MAGIC, path)
+    row_len = packedLength(size)
+    expected = _DATA_HEADER.size + count * (row_len + 1)
+    assert len(buf) == expected, f"[PACKED]\t{path} is {len(buf)} bytes, expected {expected}"
+    return row_len, count
+
+# Returns (x, y) where x[i] is a bytes object of packed pixels and y[i] is the label
+def load_data(path=DATA_PATH):
+    with open(path, 'rb') as file:
+        buf = file.read()
+    row_len, count = _readDataHeader(buf, path)
+    offset = _DATA_HEADER.size
+
+    x = [buf[i:i + row_len] for i in range(offset, offset + count * row_len, row_len)]
+    y = list(buf[offset + count * row_len:])
+    return x, y
+
+# * Read-only view of the images in a data file, backed by mmap so nothing is read until it is indexed
+# * Every process that maps the same file shares the same pages
+class PackedImages():
+    def __init__(self, path, buf, offset, count, row_len):
+        self.path = path
+        self.row_len = row_len
+        self._buf = buf
+        self._offset = offset
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    # Integers give a zero-copy memoryview of one image, slices give another PackedImages
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            start, stop, step = k.indices(self._count)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return PackedImages(self.path, self._buf, self._offset + start * self.row_len, max(0, stop - start), self.row_len)
+        if k < 0:
+            k += self._count
+        if not 0 <= k < self._count:
+            raise IndexError(f"[PACKED]\t{self.path} image index {k} out of range for {self._count} images")
+        start = self._offset + k * self.row_len
+        return self._buf[start:start + self.row_len]
+
+    def __iter__(self):
+        for k in range(self._count):
+            yield self[k]
+
+    # Every image back to back (np.frombuffer(x.buffer, np.uint8).reshape(len(x), x.row_len) is zero-copy)
+    @property
+    def buffer(self):
+        return self._buf[self._offset:self._offset + self._count * self.row_len]
+
+    # Pickle as the file location so worker processes map the file themselves
+    def __reduce__(self):
+        return (_reopenImages, (self.path, self._offset, self._count, self.row_len))
+
+def _mapFile(path):
+    with open(path, 'rb') as file:
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+def _reopenImages(path, offset, count, row_len):
+    return PackedImages(path, _mapFile(path), offset, count, row_len)
+
+# Same as load_data, but x is a PackedImages view and y is a memoryview of the labels (both backed by mmap)
+def open_data(path=DATA_PATH):
+    buf = _mapFile(path)
+    row_len, count = _readDataHeader(buf, path)
+    offset = _DATA_HEADER.size
+    x = PackedImages(path, buf, offset, count, row_len)
+    y = buf[offset + count * row_len:]
+    return x, y
+
+# Convert the existing literal modules into binary containers
+if __name__ == "__main__":
+    from model_packed import weights, shape
+    from data_packed import x_test, y_test
+
+    print("Saving model")
+    save_model(weights, shape)
+    print("Saving data")
+    save_data(x_test, y_test, shape[0])
+    print("Conversion successful")
@@ -0,0 +1,28 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Reads the float weights AndroD0 writes (weights.py, weights_transpose.py) as data, so loading them never runs TensorFlow
+
+import ast
+import os
+
+src_path = os.path.dirname(os.path.abspath(__file__))
+
+# * Files written by older D0 runs start with "from tensorflow.keras.datasets import mnist" and load mnist at import.
+# * Only the literal 'weights' and 'biases' lists are read here, nothing in the file is run
+
+_cache = {} # name -> (weights, biases), so every model in the process shares one copy
+
+# Same lists as "from src.<name> import weights, biases"
+def load_weights(name='weights', path=None):
+    path = path or os.path.join(src_path, f'{name}.py')
+    if path not in _cache:
+        with open(path) as file:
+            tree = ast.parse(file.read(), path)
+        values = {}
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                if node.targets[0].id in ('weights', 'biases'):
+                    values[node.targets[0].id] = ast.literal_eval(node.value)
+        assert 'weights' in values and 'biases' in values, f"[WEIGHTS]\t{path} does not define both weights and biases"
+        _cache[path] = (values['weights'], values['biases'])
+    return _cache[path]
@@ -0,0 +1,11 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Lets the tests import the models the same way the scripts do (run from models/, models/AndroD5/ and tools/)
+
+import os
+import sys
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+for path in (os.path.join(root, 'models'), os.path.join(root, 'models', 'AndroD5'), os.path.join(root, 'tools')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
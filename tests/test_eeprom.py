@@ -0,0 +1,43 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : EEPROM contents -> image() is what gets burnt, and loading it back gives the same contents
+
+import random
+import numpy as np
+import pytest
+import ChipsAsync as asyncIC
+
+@pytest.mark.parametrize('io_len', [8, 10, 16])
+def test_image_round_trip(io_len):
+    rng = random.Random(io_len)
+    low, high = (0, 255) if io_len == 8 else (-(1 << (io_len - 1)), (1 << io_len) - 1)
+    words = [rng.randint(low, high) for _ in range(16)]
+    eeprom = asyncIC.EEPROM(addr_len=4, io_len=io_len, name='ROM')
+    eeprom.fill(words)
+    assert list(eeprom.data) == words
+
+    image = eeprom.image()
+    assert len(image) == 16 * (1 if io_len <= 8 else 2)
+    burnt = asyncIC.EEPROM(addr_len=4, io_len=io_len, name='BURNT')
+    if io_len <= 8:
+        burnt.load(image)
+    else:
+        burnt.load(np.frombuffer(image, dtype='<u2').tolist())
+    assert burnt.image() == image
+
+def test_load_slice():
+    eeprom = asyncIC.EEPROM(addr_len=4, name='ROM')
+    eeprom.load(bytes([1, 2, 3]), start=5)
+    eeprom.store(0, 9)
+    assert list(eeprom.data[:8]) == [9, 0, 0, 0, 0, 1, 2, 3]
+    with pytest.raises(AssertionError):
+        eeprom.load(bytes(4), start=14)
+
+# The images written for the real chips are what the simulator's EEPROMs hold
+def test_images_match_simulator():
+    import EEPROMImages
+    from src.packed_io import load_data, load_model
+    weights, shape = load_model()
+    x_test, _ = load_data()
+    images = EEPROMImages.buildImages(weights, shape, x_test[0])
+    assert EEPROMImages.verify(images, x_test[0]) == []
@@ -0,0 +1,43 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Round trips of the packed_io binary containers (model and data files)
+
+import random
+import numpy as np
+import pytest
+from src import packed_io
+
+def test_model_round_trip(tmp_path):
+    weights, shape = packed_io.load_model()
+    path = str(tmp_path / 'model.bin')
+    packed_io.save_model(weights, shape, path=path)
+    assert packed_io.load_model(path) == (weights, shape)
+    assert (tmp_path / 'model.bin').read_bytes() == open(packed_io.MODEL_PATH, 'rb').read()
+
+def test_data_round_trip(tmp_path):
+    rng = random.Random(0)
+    x = [bytes(rng.randrange(256) for _ in range(packed_io.packedLength(20))) for _ in range(7)]
+    y = [rng.randrange(10) for _ in range(7)]
+    path = str(tmp_path / 'data.bin')
+    packed_io.save_data(x, y, size=20, path=path)
+    assert packed_io.load_data(path) == (x, y)
+    images, labels = packed_io.open_data(path)
+    assert [bytes(image) for image in images] == x
+    assert list(labels) == y
+    assert [bytes(image) for image in images[2:5]] == x[2:5]
+
+# Written chunk by chunk (like BitPacker), the file is the same as save_data's
+def test_data_chunks(tmp_path):
+    rows = np.random.default_rng(0).integers(0, 256, (10, packed_io.packedLength(784)), dtype=np.uint8)
+    y = list(range(10))
+    packed_io.save_data(rows, y, path=str(tmp_path / 'whole.bin'))
+    packed_io.save_data_chunks([rows[:4], rows[4:8], rows[8:]], y, path=str(tmp_path / 'chunks.bin'))
+    assert (tmp_path / 'whole.bin').read_bytes() == (tmp_path / 'chunks.bin').read_bytes()
+    with pytest.raises(AssertionError):
+        packed_io.save_data_chunks([rows[:4]], y, path=str(tmp_path / 'short.bin'))
+
+def test_bad_header(tmp_path):
+    path = tmp_path / 'model.bin'
+    path.write_bytes(b'NOPE' + bytes(16))
+    with pytest.raises(ValueError):
+        packed_io.load_model(str(path))
@@ -0,0 +1,61 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Every registry engine against D4 (the reference bit loop), plus what the registry relies on
+
+import os
+import pytest
+import ModelRegistry
+from src.mnist_io import KERAS_PATH
+from src.weights_io import load_weights
+
+LENGTH = 4 # Images per engine (the compiled netlist takes a few seconds each)
+# Float weights, so they only have to mostly agree with the fully binary D4
+FLOAT_ENGINES = ('d2', 'd3')
+# Engines that need the float weights D0 writes (and mnist), neither is part of the repo
+WEIGHTS_FILES = {'d2': 'weights', 'd2-binary': 'weights', 'd3': 'weights_transpose'}
+
+@pytest.fixture(scope='module')
+def expected():
+    x_test, _ = ModelRegistry.load_test_data()
+    return [ModelRegistry.get_model('d4').predict(image) for image in x_test[:LENGTH]]
+
+@pytest.mark.parametrize('name', [name for name in ModelRegistry.names() if name != 'd4'])
+def test_engine_matches_d4(name, expected):
+    if name in WEIGHTS_FILES:
+        src_path = os.path.join(ModelRegistry.models_path, 'src')
+        if not os.path.exists(os.path.join(src_path, f'{WEIGHTS_FILES[name]}.py')) or not os.path.exists(KERAS_PATH):
+            pytest.skip(f"{name} needs src/{WEIGHTS_FILES[name]}.py and the keras mnist download")
+    model = ModelRegistry.get_model(name)
+    x_test, _ = model.test_data()
+    guesses = [model.predict(image) for image in x_test[:LENGTH]]
+    if name in FLOAT_ENGINES:
+        assert sum(guess == answer for guess, answer in zip(guesses, expected)) >= LENGTH // 2
+    else:
+        assert guesses == expected
+    if model.batched:
+        assert model.predict_batch(x_test[:LENGTH]) == guesses
+
+# The D5 engines reuse one circuit, reset before every image
+def test_reset_matches_fresh_model():
+    from LogitCalculator import Model, x_test
+    def newModel():
+        model = Model()
+        model.bar = False
+        model.fast_forward = True
+        return model
+    model = newModel()
+    model.save()
+    for image in x_test[:2]:
+        model.reset()
+        assert model.predict(image) == newModel().predict(image)
+
+# * WEIGHTS - older weight files start by loading mnist through TensorFlow, which is never run
+def test_weights_are_read_as_data(tmp_path):
+    path = tmp_path / 'weights.py'
+    path.write_text(
+        "from tensorflow.keras.datasets import mnist\n"
+        "mnist = mnist.load_data()\n\n"
+        "weights = [\n# LAYER 1\n[[0.5, -1.5], [1.0, 2.0]], \n]\n\n"
+        "biases = [\n[0.1, -0.2], \n]\n"
+    )
+    assert load_weights(path=str(path)) == ([[[0.5, -1.5], [1.0, 2.0]]], [[0.1, -0.2]])
@@ -0,0 +1,42 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : The D5 simulator against its compiled netlist -> same pins after every pulse
+
+import ChipsAsync as asyncIC
+from LogitCalculator import Model, x_test
+
+# Every pins object (or chip output) the model holds, in name order
+def _pins(model):
+    found = []
+    for _, value in sorted(model.__dict__.items()):
+        if isinstance(value, asyncIC.CHIP):
+            value = value.output
+        if isinstance(value, asyncIC.pins):
+            found.append(value)
+    return found
+
+def _trace(compiled, pulses=300):
+    model = Model()
+    model.INPUT1_EEPROM.fill(list(x_test[0]))
+    if compiled:
+        model.compile()
+    trace = []
+    for _ in range(pulses):
+        model._pulse()
+        trace.append([model._read(pin) for pin in _pins(model)])
+    return trace
+
+def test_netlist_matches_objects():
+    assert _trace(compiled=True) == _trace(compiled=False)
+
+# The fast-forward gives the same logits with the whole-row popcount and with the byte-wise ByteKernel steps
+def test_fast_forward_byte_kernel():
+    logits = []
+    for byte_kernel in (False, True):
+        model = Model()
+        model.bar = False
+        model.verbose = False
+        model.fast_forward = True
+        model.byte_kernel = byte_kernel
+        logits.append(model.predict(x_test[0]))
+    assert logits[0] == logits[1]
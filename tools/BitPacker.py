@@ -1,91 +1,101 @@
 # AUTHOR: Daniel Raymond
 # DATE  : 2020-04-011
-# ABOUT : Packing bits into bytes to more closely resemble hardware
+# ABOUT : Packing bits into bytes to more closely resemble hardware (vectorized with np.packbits)
 
 import os
 import sys
-src_path = 'c:\\Users\\dan\\Desktop\\Projects\\Andro\\models\\src'
+src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'models', 'src')
 sys.path.append(src_path)
 
-# Supress Tensorflow dll warning
-os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
-from weights_transpose import weights, biases, mnist # ! VSCode Error is incorrect -> Doesn't check sys.path
-os.environ['TF_CPP_MIN_LOG_LEVEL'] = '1'
-from tqdm import tqdm
+# ! VSCode Error is incorrect -> Doesn't check sys.path
+from weights_io import load_weights
+from mnist_io import load_mnist # Only imports TensorFlow (quietly) if keras has not downloaded mnist yet
+from packed_io import save_data_chunks, save_model
+import numpy as np
 
 data_file_name = 'data_packed'
+train_file_name = 'train_packed'
 model_file_name = 'model_packed'
 
-# * 0's are treated as -1
-def scale(num):
-    if num >= 0: return 1
-    else:        return 0 
+weights, biases = load_weights('weights_transpose')
 
-def save_image(m, file):
-    img = m.reshape([1, -1]).tolist()[0]
-    
-    file.write("[")
-    for i1 in range(0, len(img), 8):
-        # Pack bits into byte
-        if i1 != 0:
-            file.write(", ")
-        file.write("0b")
-        # 8, until there isn't enough for 8, then just do the rest
-        max_length = min(len(img[i1:]), 8)
-        # Loop through weights in reverse packs of 8 to flip endianness
-        for i2 in range(max_length - 1, -1, -1):
-            weight = img[i1 + i2]
-            weight = weight / 127.5 - 1 # Scale to be between -1 and 1
-            file.write(f"{scale(weight)}")
-    file.write("],\n")
+# Number of images thresholded at once (keeps the float copy of mnist small)
+CHUNK_SIZE = 10000
+
+# Literal for every byte, written the same way as before ("0b" then the last value first to flip endianness)
+LITERALS = [f"0b{i:08b}" for i in range(256)]
+
+# * 0's are treated as -1 -> threshold every row and pack 8 values per byte, first value in the LSB
+def pack_rows(rows, scale_images=False):
+    rows = np.asarray(rows).reshape(len(rows), -1)
+    if scale_images:
+        rows = rows / 127.5 - 1 # Scale to be between -1 and 1
+    return np.packbits(rows >= 0, axis=1, bitorder='little')
+
+# Pack rows a chunk at a time
+def packed_chunks(rows, scale_images=False):
+    for start in range(0, len(rows), CHUNK_SIZE):
+        yield pack_rows(rows[start:start + CHUNK_SIZE], scale_images)
+
+# Write a packed row as literals, the last byte only has as many digits as there are values left
+def format_row(packed, length):
+    literals = [LITERALS[byte] for byte in packed.tolist()]
+    tail = length % 8
+    if tail:
+        literals[-1] = f"0b{int(packed[-1]):0{tail}b}"
+    return ", ".join(literals)
 
 # Save mnist data easily
 def save_mnist(name, data, file, scale):
     # Create a list of the object
     file.write(f"{name} = [")
-    # Iterate through each variable
-    for index in data:
-        if scale:
-            save_image(index, file)
-        else:
-            file.write(f"{index},")
+    if scale:
+        length = np.asarray(data[0]).size
+        for chunk in packed_chunks(data, scale_images=True):
+            file.write("".join(f"[{format_row(row, length)}],\n" for row in chunk))
+    else:
+        file.write("".join(f"{index}," for index in data))
     file.write("]\n\n")
 
 # Save all useful constants in a single file
 def scale_data(name,  mnist_len=10000):
-    with open(f'{src_path}\\{name}.py', 'w') as file:
+    with open(os.path.join(src_path, f'{name}.py'), 'w') as file:
         # * Mnist data
         print("Saving mnist data")
-        x_test, y_test = mnist[1]
+        x_test, y_test = load_mnist()[1]
         # save_mnist("x_train", x_train[], file, scale=True)
         # save_mnist("y_train", y_train, file, scale=False)
         save_mnist("x_test", x_test[:mnist_len], file, scale=True)
         save_mnist("y_test", y_test[:mnist_len], file, scale=False)
 
+# Same images as scale_data, but written to the binary container read by packed_io.load_data/open_data
+# * split 0 is the training set, 1 is the test set. No cap since the file is only 99 bytes per image
+def binary_data(name, split=1, mnist_len=None):
+    print("Saving binary mnist data")
+    x, y = load_mnist()[split]
+    # Every chunk is written as soon as it is packed
+    chunks = (np.ascontiguousarray(chunk) for chunk in packed_chunks(x[:mnist_len], scale_images=True))
+    save_data_chunks(chunks, np.asarray(y[:mnist_len], dtype=np.uint8), size=np.asarray(x[0]).size, path=os.path.join(src_path, f'{name}.bin'))
+
+# Same weights as scale_model, but written to the binary container read by packed_io.load_model
+def binary_model(name):
+    print("Saving binary weights and shape")
+    packed = [pack_rows(layer) for layer in weights]
+    shape = [784] + [len(layer) for layer in weights] # Input size is 784 pixels
+    save_model(packed, shape, path=os.path.join(src_path, f'{name}.bin'))
+
 def scale_model(name, inc_weights=True, inc_biases=True, inc_shape=True):
-    with open(f'{src_path}\\{name}.py', 'w') as file:
+    with open(os.path.join(src_path, f'{name}.py'), 'w') as file:
      # * Weights & Biases
         if inc_weights:
             print("Saving weights")
             file.write("weights = [\n")
             for layer in weights:
+                length = len(layer[0])
                 file.write("### LAYER\n[\n")
-                for x, node in enumerate(layer):
-                    file.write("[")
-                    for i1 in range(0, len(node), 8):
-                        # Pack bits into byte
-                        if i1 != 0:
-                            file.write(", ")
-                        file.write("0b")
-                        # 8, until there isn't enough for 8, then just do the rest
-                        max_length = min(len(node[i1:]), 8)
-                        # Loop through weights in reverse packs of 8 to flip endianness
-                        for i2 in range(max_length - 1, -1, -1):
-                            weight = node[i1 + i2]
-                            file.write(f"{scale(weight)}")
-
-                    file.write(f"], # Node {x}\n") # Pack all weights for a node into an list
-                file.write("],\n") # Pack all node packages into a matrix (list of lists)
+                # Pack all weights for a node into a list, then all node packages into a matrix
+                file.write("".join(f"[{format_row(row, length)}], # Node {x}\n" for x, row in enumerate(pack_rows(layer))))
+                file.write("],\n")
             file.write("]\n") # Pack all matrices into a list of layers
 
         # * Weights & Biases
@@ -93,19 +103,13 @@ def scale_model(name, inc_weights=True, inc_biases=True, inc_shape=True):
             print("Saving Biases")
             file.write("biases = [\n")
             for layer_biases in biases:
-                file.write("[")
-                for bias in layer_biases:
-                    file.write(f"{bias}, ")
-                file.write("],\n") # Pack all biases into a layer
+                file.write("[" + "".join(f"{bias}, " for bias in layer_biases) + "],\n") # Pack all biases into a layer
             file.write("]\n") # Pack all matrices into a list of layers
         
         if inc_shape:
             print("Saving shape")
             file.write("shape = [784, ") # Input size is 784 pixels
-            for layer in weights:
-                file.write(f"{len(layer)}")
-                if layer != weights[-1]: # If it's the last layer, don't print the comma
-                    file.write(", ")
+            file.write(", ".join(f"{len(layer)}" for layer in weights))
             file.write("]\n")
     
 
@@ -113,4 +117,7 @@ if __name__ == "__main__":
     print("Packing mnist, weights, and biases")
     scale_data(data_file_name, mnist_len=100)
     scale_model(model_file_name, inc_biases=False)
+    binary_data(data_file_name)
+    binary_data(train_file_name, split=0)
+    binary_model(model_file_name)
     print("Packing succcessful")
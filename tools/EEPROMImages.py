@@ -0,0 +1,119 @@
+# AUTHOR: Daniel Raymond
+# DATE  : 2026-10-18
+# ABOUT : Writes the burnable contents of the D5 EEPROMs (.bin and Intel HEX, plus checksums) straight from the packed model
+
+import os
+import sys
+import zlib
+from array import array
+models_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'models')
+sys.path.append(models_path)
+sys.path.append(os.path.join(models_path, 'AndroD5'))
+
+from src.packed_io import load_data, load_model
+from ByteKernel import weightAddress
+from LogitCalculator import EEPROM_SIZES, BITS_LAYER, BITS_NODES, BITS_WEIGHTS
+
+# * Chips that are burnt before running: name -> (address bits, bits per word)
+CHIPS = {name: EEPROM_SIZES[name] for name in ('WEIGHTS', 'SHAPE', 'INPUT1')}
+# Address bits of LAYER : NODE : WEIGHT in the WEIGHTS EEPROM
+WEIGHT_BITS = (BITS_LAYER, BITS_NODES, BITS_WEIGHTS)
+
+# * IMAGES - one byte per address, or two (little endian, two's complement in the word width) for wider words
+def wordsImage(words, addr_len, io_len):
+    length = 1 << addr_len
+    assert len(words) <= length, f"[IMAGE]\t{len(words)} words do not fit in {length} addresses"
+    if io_len <= 8:
+        return bytes(words) + bytes(length - len(words))
+    mask = (1 << io_len) - 1
+    image = array('H', [word & mask for word in words])
+    image.extend([0] * (length - len(words)))
+    if sys.byteorder == 'big':
+        image.byteswap()
+    return image.tobytes()
+
+# Weights at the addresses fill3D gives them, everything else left at 0
+def weightsImage(weights, addr_len=CHIPS['WEIGHTS'][0], addr_bits_per_dim=WEIGHT_BITS):
+    image = bytearray(1 << addr_len)
+    for l_index, layer in enumerate(weights):
+        for node, node_weights in enumerate(layer):
+            base = weightAddress(l_index, node, 0, addr_bits_per_dim)
+            image[base:base + len(node_weights)] = bytes(node_weights)
+    return bytes(image)
+
+# Contents of every chip that is burnt before running (INPUT1 only if an image is given)
+def buildImages(weights, shape, x=None):
+    images = {
+        'WEIGHTS': weightsImage(weights),
+        'SHAPE': wordsImage(list(shape), *CHIPS['SHAPE']),
+    }
+    if x is not None:
+        images['INPUT1'] = wordsImage(list(x), *CHIPS['INPUT1'])
+    return images
+
+# * INTEL HEX - 16 data bytes per record, extended linear address records past 64 kB
+def _record(addr, kind, data):
+    body = bytes([len(data), (addr >> 8) & 0xFF, addr & 0xFF, kind]) + data
+    checksum = -sum(body) & 0xFF
+    return f":{body.hex().upper()}{checksum:02X}\n"
+
+def intelHex(image, record_len=16):
+    lines = []
+    upper = None
+    for addr in range(0, len(image), record_len):
+        if addr >> 16 != upper:
+            upper = addr >> 16
+            lines.append(_record(0, 0x04, upper.to_bytes(2, 'big')))
+        lines.append(_record(addr & 0xFFFF, 0x00, image[addr:addr + record_len]))
+    lines.append(_record(0, 0x01, b''))
+    return ''.join(lines)
+
+# (16-bit sum of every byte like EEPROM programmers show, CRC-32)
+def checksums(image):
+    return (sum(image) & 0xFFFF, zlib.crc32(image))
+
+def write(images, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    lines = []
+    for name, image in images.items():
+        with open(os.path.join(out_dir, f'{name}.bin'), 'wb') as file:
+            file.write(image)
+        with open(os.path.join(out_dir, f'{name}.hex'), 'w') as file:
+            file.write(intelHex(image))
+        total, crc = checksums(image)
+        lines.append(f"{name:<8} {len(image):7d} bytes   sum16 0x{total:04X}   crc32 0x{crc:08X}")
+    with open(os.path.join(out_dir, 'checksums.txt'), 'w') as file:
+        file.write('\n'.join(lines) + '\n')
+    return lines
+
+# Builds the simulator and compares what its EEPROMs hold, returns the names that differ
+def verify(images, x=None):
+    from LogitCalculator import Model
+    model = Model()
+    if x is not None:
+        model.INPUT1_EEPROM.fill(list(x))
+    eeproms = {'WEIGHTS': model.WEIGHTS_EEPROM, 'SHAPE': model.SHAPE_EEPROM, 'INPUT1': model.INPUT1_EEPROM}
+    return [name for name, image in images.items() if eeproms[name].image() != image]
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Write the D5 EEPROM images (.bin, .hex and checksums)")
+    parser.add_argument('-o', '--out', default='eeprom', help="directory to write the images to")
+    parser.add_argument('-i', '--image', type=int, default=None, help="also write INPUT1 holding this test image")
+    parser.add_argument('--no-verify', action='store_true', help="skip comparing against the simulator's EEPROMs")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    weights, shape = load_model()
+    x = load_data()[0][args.image] if args.image is not None else None
+    images = buildImages(weights, shape, x)
+    for line in write(images, args.out):
+        print(line)
+    print(f"Written to {args.out} in {time.perf_counter() - start:.2f}s")
+
+    if not args.no_verify:
+        different = verify(images, x)
+        assert not different, f"[IMAGE]\t{', '.join(different)} differ from the simulator's EEPROMs"
+        print("Byte for byte the same as the simulator's EEPROMs")
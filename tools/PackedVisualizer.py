@@ -1,10 +1,13 @@
+import os
 import sys
-src_path = 'c:\\Users\\dan\\Desktop\\Projects\\Andro\\models\\src'
+src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'models', 'src')
 sys.path.append(src_path)
 
-from data_packed import x_test, y_test
+from packed_io import load_data
 import matplotlib.pyplot as plt
 
+x_test, y_test = load_data()
+
 # Convert bitpacked image into plotable 2D array
 def prepImg(img):
     # Create 28x28 image